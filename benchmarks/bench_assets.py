@@ -0,0 +1,170 @@
+"""
+カウンターコンポーネントの配信の計測 (src/assets.py)
+
+コンポーネントごとに、iframe の読み込みで要求するファイル（index.html と、そこから参照されるもの）を
+2つのサーバーから実際に HTTP で取得し、転送バイト数・Cache-Control・応答時間を比べる。
+
+- Streamlit 標準: Streamlit のコンポーネント配信のルートと GZip ミドルウェア
+  (streamlit.web.server.starlette) をそのまま uvicorn で動かす。Cache-Control に有効期限も
+  検証子 (ETag / Last-Modified) もないため、再訪問でも同じ要求を繰り返す
+- 配信サーバー: src.assets.AssetServer。再訪問は immutable のファイルをキャッシュから読み、
+  それ以外は If-None-Match 付きで確かめる（ブラウザと同じ動き）
+
+計測するのは転送バイト数・ローカルでの応答時間（中央値）・V8 のコンパイル時間（node があれば）。
+遅いホール内のモバイル回線での読み込み時間は、計測した転送バイト数から
+「往復 × 要求の段数 + 転送時間 + コンパイル時間」で見積もる（ブラウザでの実測ではない）。
+
+実行方法:
+    python -m benchmarks.bench_assets [下り Mbps] [往復 ms]
+"""
+import http.client
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from src.assets import COMPONENT_DIRS, AssetServer, referenced_files
+
+BROWSER_ACCEPT_ENCODING = "gzip, deflate, br"
+REPEATS = 20
+
+class _Registry:
+    """Streamlit のコンポーネント登録簿のうち、配信のルートが使う部分"""
+
+    def get_component_path(self, name):
+        return COMPONENT_DIRS.get(name)
+
+def start_streamlit_server():
+    """Streamlit のコンポーネント配信（ルートと GZip ミドルウェア）を別スレッドで起動し、(サーバー, ポート) を返す"""
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from streamlit.web.server.starlette.starlette_gzip_middleware import SelectiveGZipMiddleware
+    from streamlit.web.server.starlette.starlette_routes import create_component_routes
+    from streamlit.web.server.starlette.starlette_server_config import GZIP_COMPRESSLEVEL, GZIP_MINIMUM_SIZE
+
+    app = Starlette(
+        routes=create_component_routes(_Registry(), None),
+        middleware=[Middleware(SelectiveGZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESSLEVEL)],
+    )
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="error", lifespan="off"))
+    threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server, sock.getsockname()[1]
+
+def fetch(conn, path: str, headers):
+    conn.request("GET", path, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    return response.status, {k.lower(): v for k, v in response.getheaders()}, len(body)
+
+def page_load(port: int, prefix: str, files, cache=None):
+    """
+    ファイルを順に取得し、(転送バイト数, 要求数, 応答ヘッダー) を返す
+    cache（前回の応答ヘッダー）を渡すと、ブラウザと同じく immutable は取りに行かず、ETag があれば検証する。
+    """
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    sent = 0
+    requests = 0
+    headers_by_file = {}
+    for filename in files:
+        headers = {"Accept-Encoding": BROWSER_ACCEPT_ENCODING}
+        if cache is not None:
+            previous = cache[filename]
+            if "immutable" in previous.get("cache-control", ""):
+                continue
+            if "etag" in previous:
+                headers["If-None-Match"] = previous["etag"]
+        status, response_headers, size = fetch(conn, f"{prefix}/{filename}", headers)
+        assert status in (200, 304), (filename, status)
+        sent += size
+        requests += 1
+        headers_by_file[filename] = response_headers
+    conn.close()
+    return sent, requests, headers_by_file
+
+def measure(port: int, prefix: str, files):
+    """初回・再訪問の転送バイト数・要求数と、応答時間の中央値 (ms)"""
+    first, first_requests, headers = page_load(port, prefix, files)
+    repeat, repeat_requests, _ = page_load(port, prefix, files, cache=headers)
+    timings = {"first": [], "repeat": []}
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        page_load(port, prefix, files)
+        timings["first"].append(time.perf_counter() - start)
+        start = time.perf_counter()
+        page_load(port, prefix, files, cache=headers)
+        timings["repeat"].append(time.perf_counter() - start)
+    return {
+        "first": first, "repeat": repeat,
+        "first_requests": first_requests, "repeat_requests": repeat_requests,
+        "first_ms": statistics.median(timings["first"]) * 1000,
+        "repeat_ms": statistics.median(timings["repeat"]) * 1000,
+        "headers": headers,
+    }
+
+def compile_ms(paths):
+    """V8 でスクリプトをコンパイルする時間（node がなければ None）"""
+    if shutil.which("node") is None:
+        return None
+    script = (
+        "const fs=require('fs'),vm=require('vm');let total=0;"
+        "for(const p of JSON.parse(process.argv[1])){const src=fs.readFileSync(p,'utf8');"
+        "const t=process.hrtime.bigint();new vm.Script(src,{filename:p});total+=Number(process.hrtime.bigint()-t)/1e6;}"
+        "console.log(total)"
+    )
+    result = subprocess.run(["node", "-e", script, json.dumps(paths)], capture_output=True, text=True)
+    return float(result.stdout.strip()) if result.returncode == 0 else None
+
+def estimated_seconds(result, key: str, mbps: float, rtt: float, parse_ms: float) -> float:
+    """
+    モバイル回線での読み込み時間の見積もり
+    index.html の往復の後にバンドルを並列に要求するので、要求があれば往復は最大2段。
+    """
+    requests = result[f"{key}_requests"]
+    round_trips = min(requests, 2)
+    return rtt * round_trips + result[key] * 8 / (mbps * 1e6) + parse_ms / 1000.0
+
+def main(mbps: float = 1.6, rtt_ms: float = 150.0):
+    rtt = rtt_ms / 1000.0
+    streamlit_server, streamlit_port = start_streamlit_server()
+    asset_server = AssetServer("127.0.0.1", 0).start()
+    print(f"計測: ローカルの HTTP（{REPEATS} 回の中央値）  見積もり: 下り {mbps} Mbps / 往復 {rtt_ms:.0f} ms")
+    try:
+        for name, build_dir in COMPONENT_DIRS.items():
+            files = ["index.html"] + sorted(referenced_files(build_dir))
+            scripts = [os.path.join(build_dir, f) for f in files if f.endswith(".js")]
+            parse_ms = compile_ms(scripts) or 0.0
+
+            results = {
+                "Streamlit 標準": measure(streamlit_port, f"/component/{name}", files),
+                "配信サーバー": measure(asset_server.port, f"/{name}", files),
+            }
+            print(f"{name}: 配信するファイル {len(files)} 個  スクリプトのコンパイル {parse_ms:.1f} ms")
+            for label, result in results.items():
+                bundle = result["headers"][files[-1]]
+                print(
+                    f"  {label:12s} 転送（本文） 初回 {result['first'] / 1024:6.1f} KB / 再訪問 {result['repeat'] / 1024:6.1f} KB"
+                    f"（要求 {result['first_requests']} / {result['repeat_requests']}）  "
+                    f"応答 初回 {result['first_ms']:5.1f} ms / 再訪問 {result['repeat_ms']:5.1f} ms  "
+                    f"見積もり 初回 {estimated_seconds(result, 'first', mbps, rtt, parse_ms):4.2f} 秒 / "
+                    f"再訪問 {estimated_seconds(result, 'repeat', mbps, rtt, parse_ms):4.2f} 秒"
+                )
+                print(
+                    f"  {'':12s} {files[-1]}: Content-Encoding {bundle.get('content-encoding', 'なし')}  "
+                    f"Cache-Control {bundle.get('cache-control', 'なし')}"
+                )
+    finally:
+        asset_server.stop()
+        streamlit_server.should_exit = True
+
+if __name__ == "__main__":
+    main(*(float(v) for v in sys.argv[1:3]))
@@ -0,0 +1,44 @@
+"""
+compute_posteriors_batch と compute_posteriors (ループ) の速度比較
+
+実行方法:
+    python -m benchmarks.bench_batch [行数]
+"""
+import sys
+import time
+import numpy as np
+
+from src.constants import SETTING_KEYS
+from src.logic import compute_posteriors
+from src.batch import compute_posteriors_batch
+
+def make_rows(rows: int, seed: int = 0):
+    """ホール全台を想定したランダムな (n, k) を生成"""
+    rng = np.random.default_rng(seed)
+    n = rng.integers(100, 8000, size=rows)
+    k = rng.binomial(n, 1 / 30.0)
+    return n, k
+
+def main(rows: int = 5000):
+    priors = {key: 1.0 / len(SETTING_KEYS) for key in SETTING_KEYS}
+    n, k = make_rows(rows)
+
+    start = time.perf_counter()
+    scalar = [compute_posteriors(int(a), int(b), priors) for a, b in zip(n, k)]
+    scalar_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = compute_posteriors_batch(n, k, priors)
+    batch_sec = time.perf_counter() - start
+
+    expected = np.array([[row[key] for key in SETTING_KEYS] for row in scalar])
+    max_err = float(np.abs(batch - expected).max())
+
+    print(f"rows        : {rows}")
+    print(f"scalar loop : {scalar_sec * 1000:.2f} ms")
+    print(f"batch       : {batch_sec * 1000:.2f} ms")
+    print(f"speedup     : {scalar_sec / batch_sec:.1f}x")
+    print(f"max abs err : {max_err:.2e}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
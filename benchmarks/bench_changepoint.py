@@ -0,0 +1,69 @@
+"""
+途中の設定変更の検出 (src/changepoint.py) の速さと精度
+
+数日分の操作ログ（1日 8000G、10G ごとに回転数・当たった分の小役回数を入力）を作り、
+2日目の開始時に設定を変えた場合と変えない場合について、
+1操作あたりの処理時間・保持するラン長の数・変化点を正しく見つけた割合を表示する。
+
+実行方法:
+    python -m benchmarks.bench_changepoint [試行回数]
+"""
+import sys
+import time
+
+import numpy as np
+
+from src.constants import SETTINGS, SETTING_KEYS
+from src.changepoint import ChangePointDetector
+
+DAY_SPINS = 8000
+CHUNK = 10
+
+def make_stream(settings, rng):
+    """日ごとの設定の列から操作ログ (Δn, Δk, 時刻) を作る"""
+    events = []
+    for day, setting in enumerate(settings):
+        ts = day * 86400.0 + 10 * 3600.0
+        for _ in range(DAY_SPINS // CHUNK):
+            ts += 40.0
+            events.append((CHUNK, 0, ts))
+            hits = int(rng.binomial(CHUNK, SETTINGS[setting]))
+            if hits:
+                events.append((0, hits, ts + 1.0))
+    return events
+
+def run(events):
+    detector = ChangePointDetector()
+    start = time.perf_counter()
+    max_runs = 0
+    for delta_spins, delta_hits, ts in events:
+        detector.update(delta_spins, delta_hits, ts)
+        max_runs = max(max_runs, len(detector._log_w))
+    elapsed = time.perf_counter() - start
+    return detector.summary(), elapsed, max_runs
+
+def main(trials: int = 20):
+    rng = np.random.default_rng(0)
+    for label, days in (("変更なし a→a→a", lambda a, b: (a, a, a)), ("2日目に変更 a→b→b", lambda a, b: (a, b, b))):
+        correct = 0
+        per_event = []
+        runs = 0
+        for _ in range(trials):
+            low, high = rng.choice(SETTING_KEYS[:2]), rng.choice(SETTING_KEYS[3:])
+            settings = days(low, high)
+            events = make_stream(settings, rng)
+            summary, elapsed, max_runs = run(events)
+            per_event.append(elapsed / len(events))
+            runs = max(runs, max_runs)
+            change_at = summary["change_at"]
+            if settings[0] == settings[1]:
+                correct += change_at is None
+            else:
+                correct += change_at is not None and abs(change_at["spins"] - DAY_SPINS) <= 500
+        print(
+            f"{label:18s}: 正解 {correct}/{trials}  {np.mean(per_event) * 1e6:6.1f} µs/操作  "
+            f"ラン長 最大 {runs}  ({len(events)} 操作 / {len(settings) * DAY_SPINS}G)"
+        )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,52 @@
+"""
+コマンドライン版 (src/cli.py) の起動時間の計測
+
+新しいプロセスを繰り返し起動し、終了までの時間の中央値を比べる。
+    python -c pass        : インタープリタ自体の起動時間（site の読み込みを含む）
+    python -S -c pass     : site を読み込まない場合の起動時間
+    src.cli               : 1件判別してテキスト出力
+    src.cli --json        : 1件判別して JSON 出力
+    src.cli (-S)          : site なしで実行（仮想環境外の素の python と同程度）
+    import main           : Streamlit 版の読み込み（従来は計算だけ使いたくてもこれが必要だった）
+
+実行方法:
+    python -m benchmarks.bench_cli [--repeat 30]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def cold_start_ms(cmd: List[str], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="コマンドライン版の起動時間")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    py = sys.executable
+    cases = [
+        ("python -c pass", [py, "-c", "pass"]),
+        ("python -S -c pass", [py, "-S", "-c", "pass"]),
+        ("src.cli 1000 40", [py, "-m", "src.cli", "1000", "40"]),
+        ("src.cli 1000 40 --json", [py, "-m", "src.cli", "1000", "40", "--json"]),
+        ("src.cli 1000 40 (-S)", [py, "-S", "-m", "src.cli", "1000", "40"]),
+        ("import main (Streamlit)", [py, "-c", "import main"]),
+    ]
+    for name, cmd in cases:
+        repeat = max(3, args.repeat // 6) if "Streamlit" in name else args.repeat
+        print(f"{name:26s} {cold_start_ms(cmd, repeat):8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+カウンターコンポーネントの送信方式ごとの再実行回数のシミュレーション
+
+連打（1〜12回を 80〜160ms 間隔）と休止を繰り返す操作列を、次の2方式で Python 側へ送る。
+    per-tap : 1タップごとに現在値を送る（従来の syncToStreamlit / pushCountsToStreamlit）
+    batch   : batch_ms の間の増減を連番付きの操作にまとめ、ack までの操作を毎回送り直す
+              （src/counters.py の CounterSync で反映）
+
+Streamlit 側は「実行中に届いた値は最後の1つだけ残り、実行終了後に1回だけ再実行する」
+という動きを再現し、再実行回数・最終値の一致・タップが Python に反映されるまでの遅れを比べる。
+
+実行方法:
+    python -m benchmarks.bench_counter_sync [--taps 5000] [--rerun-ms 18]
+"""
+import argparse
+import heapq
+import random
+import statistics
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.counters import CounterSync
+
+def tap_stream(taps: int, seed: int) -> List[Tuple[float, int]]:
+    """(時刻ms, 増減) の列。9割は +1、1割は -1"""
+    rng = random.Random(seed)
+    events: List[Tuple[float, int]] = []
+    t = 0.0
+    while len(events) < taps:
+        for _ in range(rng.randint(1, 12)):
+            events.append((t, 1 if rng.random() < 0.9 else -1))
+            t += rng.uniform(80, 160)
+        t += rng.uniform(1000, 6000)
+    return events[:taps]
+
+class _BatchClient:
+    """コンポーネント側の送信ロジック（main.js / index.tsx と同じ手順）"""
+
+    def __init__(self, batch_ms: float):
+        self.batch_ms = batch_ms
+        self.client = "sim"
+        self.value = 0
+        self.seq = 0
+        self.open_delta = 0
+        self.unacked: List[Dict[str, int]] = []
+        self.flush_at: Optional[float] = None
+
+    def tap(self, delta: int, now: float) -> Optional[Dict[str, Any]]:
+        before = self.value
+        self.value = max(0, self.value + delta)
+        self.open_delta += self.value - before
+        if self.batch_ms <= 0:
+            return self.flush()
+        if self.flush_at is None:
+            self.flush_at = now + self.batch_ms
+        return None
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        self.flush_at = None
+        if self.open_delta == 0:
+            return None
+        self.seq += 1
+        self.unacked.append({"seq": self.seq, "delta": self.open_delta})
+        self.open_delta = 0
+        return {"protocol": 1, "client": self.client, "ops": list(self.unacked), "value": self.value}
+
+    def acknowledge(self, ack: Optional[Dict[str, Any]]) -> None:
+        if ack and ack["client"] == self.client:
+            self.unacked = [op for op in self.unacked if op["seq"] > ack["seq"]]
+
+def simulate(events: List[Tuple[float, int]], mode: str, batch_ms: float, rerun_ms: float) -> Dict[str, float]:
+    client = _BatchClient(batch_ms)
+    sync = CounterSync(1)
+    true_value = 0
+    messages = 0
+    reruns = 0
+    lags: List[float] = []
+    reflected = 0  # Python に反映済みのタップ数
+    tapped = 0     # ここまでに発生したタップ数
+
+    # Streamlit は最後に送られた値だけを保持する。(値, その値に含まれるタップ数)
+    pending: Optional[Tuple[Any, int]] = None
+    running = False
+    rerun_requested = False
+    queue: List[Tuple[float, int, str, Any]] = []  # (時刻, 順序, 種類, データ)
+    counter = 0
+
+    def push(t: float, kind: str, data: Any = None) -> None:
+        nonlocal counter
+        heapq.heappush(queue, (t, counter, kind, data))
+        counter += 1
+
+    def send(message: Any, taps_included: int, now: float) -> None:
+        nonlocal pending, messages, rerun_requested
+        messages += 1
+        pending = (message, taps_included)
+        if running:
+            rerun_requested = True
+        else:
+            push(now, "run")
+
+    for i, (t, delta) in enumerate(events):
+        push(t, "tap", (i, delta))
+
+    while queue:
+        now, _, kind, data = heapq.heappop(queue)
+        if kind == "tap":
+            index, delta = data
+            tapped = index + 1
+            true_value = max(0, true_value + delta)
+            if mode == "per-tap":
+                send({"value": true_value}, index + 1, now)
+            else:
+                scheduled = client.flush_at is not None
+                message = client.tap(delta, now)
+                if message is not None:
+                    send(message, index + 1, now)
+                elif not scheduled and client.flush_at is not None:
+                    push(client.flush_at, "flush")
+        elif kind == "flush":
+            message = client.flush()
+            if message is not None:
+                # まとめ待ちの間のタップもすべて含む
+                send(message, tapped, now)
+        elif kind == "run":
+            reruns += 1
+            running = True
+            message, taps_included = pending
+            if mode == "per-tap":
+                applied_value = message["value"]
+            else:
+                sync.apply(message)
+                applied_value = sync.values[0]
+            push(now + rerun_ms, "done", taps_included)
+        elif kind == "done":
+            running = False
+            while reflected < data:
+                lags.append(now - events[reflected][0])
+                reflected += 1
+            if mode == "batch":
+                client.acknowledge(sync.ack())
+            if rerun_requested:
+                rerun_requested = False
+                push(now, "run")
+
+    lags.sort()
+    return {
+        "taps": len(events),
+        "messages": messages,
+        "reruns": reruns,
+        "final_ok": applied_value == true_value,
+        "lag_p50": statistics.median(lags) if lags else 0.0,
+        "lag_p95": lags[int(len(lags) * 0.95) - 1] if lags else 0.0,
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="カウンター送信方式ごとの再実行回数")
+    parser.add_argument("--taps", type=int, default=5000)
+    parser.add_argument("--rerun-ms", type=float, default=18.0, help="1回の再実行にかかる時間（bench_rerun の p50 程度）")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    events = tap_stream(args.taps, args.seed)
+    print(f"{'方式':14s} {'送信':>7s} {'再実行':>7s} {'再実行/タップ':>12s} {'最終値':>6s} {'遅れp50(ms)':>12s} {'遅れp95(ms)':>12s}")
+    cases = [("per-tap", 0.0)] + [("batch", ms) for ms in (0.0, 100.0, 250.0, 500.0)]
+    for mode, batch_ms in cases:
+        result = simulate(events, mode, batch_ms, args.rerun_ms)
+        label = mode if mode == "per-tap" else f"batch {batch_ms:.0f}ms"
+        print(
+            f"{label:14s} {result['messages']:7d} {result['reruns']:7d} {result['reruns'] / result['taps']:12.3f} "
+            f"{'一致' if result['final_ok'] else '不一致':>6s} {result['lag_p50']:12.0f} {result['lag_p95']:12.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+操作ログ (src/events.py) の書き込み性能と復元時間の計測
+
+多数のセッションが同時にカウンターを操作した状況を、スレッドごとに1セッションとして再現し、
+全件がコミットされるまでの件数/秒を測る。続いて1セッション分の長い履歴を
+スナップショットあり / なしで復元する時間を比べる。
+
+実行方法:
+    python -m benchmarks.bench_events [--sessions 200] [--events 500] [--history 20000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from typing import List, Optional
+
+from src.constants import EVENT_STORE_CONFIG
+from src.events import EventStore
+
+def bench_write(path: str, sessions: int, events: int) -> float:
+    """sessions 本のスレッドから events 件ずつ追記し、全件コミットまでの件数/秒"""
+    store = EventStore(path, EVENT_STORE_CONFIG["batch_size"], EVENT_STORE_CONFIG["flush_interval"], EVENT_STORE_CONFIG["snapshot_interval"])
+    start_gate = threading.Barrier(sessions + 1)
+
+    def worker(index: int) -> None:
+        rng = random.Random(index)
+        start_gate.wait()
+        for _ in range(events):
+            # 回転数ボタン3回に1回くらい小役ボタン、という操作の混ざり方
+            if rng.random() < 0.25:
+                store.append(f"s{index}", "default", 0, 1)
+            else:
+                store.append(f"s{index}", "default", 1, 0)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(sessions)]
+    for t in threads:
+        t.start()
+    start_gate.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    store.flush()
+    elapsed = time.perf_counter() - start
+    stats = store.stats()
+    store.close()
+    print(f"write    : {stats['written']} 件 / {elapsed:.2f} s = {stats['written'] / elapsed:,.0f} 件/s  (バッチ {stats['batches']} 回)")
+    return elapsed
+
+def bench_replay(path: str, history: int, snapshot_interval: int, repeat: int = 20) -> float:
+    """history 件の履歴を持つ1セッションの復元時間（中央値, 秒）"""
+    store = EventStore(path, snapshot_interval=snapshot_interval)
+    for i in range(history):
+        store.append("long", "default", 1, 1 if i % 30 == 0 else 0)
+    store.flush()
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = store.replay("long", "default")
+        times.append(time.perf_counter() - start)
+    store.close()
+    label = "snapshot" if snapshot_interval < history else "no-snap "
+    median = statistics.median(times)
+    print(f"replay {label}: {history} 件 -> {result}  {median * 1000:.2f} ms")
+    return median
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="操作ログの書き込み・復元の計測")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--history", type=int, default=20_000)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bench_write(os.path.join(tmp, "write.sqlite3"), args.sessions, args.events)
+        bench_replay(os.path.join(tmp, "snap.sqlite3"), args.history, EVENT_STORE_CONFIG["snapshot_interval"])
+        bench_replay(os.path.join(tmp, "nosnap.sqlite3"), args.history, args.history + 1)
+
+if __name__ == "__main__":
+    main()
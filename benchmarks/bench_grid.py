@@ -0,0 +1,57 @@
+"""
+期待度の早見表 (src/grid.py) の大きさ・作成時間・誤差
+
+実際の打ち方に近い (n, k)（設定1〜6相当の当選率の二項乱数）で、早見表を引いた 456 / 56 期待度と
+compute_posteriors_batch の値との差を回転数の区間ごとに表示する。
+
+実行方法:
+    python -m benchmarks.bench_grid [サンプル数]
+"""
+import gzip
+import sys
+import time
+
+import numpy as np
+
+from src.constants import SETTING_KEYS, SETTINGS
+from src.batch import compute_posteriors_batch
+from src.grid import GOAL_INDEXES, GridReader, get_posterior_grid
+
+BANDS = ((1, 100), (100, 500), (500, 2000), (2000, 10000))
+
+def main(samples: int = 20000):
+    priors = {key: 1.0 / len(SETTING_KEYS) for key in SETTING_KEYS}
+
+    start = time.perf_counter()
+    _, blob = get_posterior_grid(priors)
+    build_sec = time.perf_counter() - start
+    start = time.perf_counter()
+    get_posterior_grid(priors)
+    cached_sec = time.perf_counter() - start
+    reader = GridReader(blob)
+
+    print(f"rows        : {len(reader.spins)} (n ≤ {reader.max_spins})")
+    print(f"size        : {len(blob) / 1024:.1f} KB (gzip {len(gzip.compress(blob)) / 1024:.1f} KB)")
+    print(f"build       : {build_sec * 1000:.0f} ms (2回目以降 {cached_sec * 1e6:.0f} µs)")
+
+    rng = np.random.default_rng(0)
+    probs = np.array([SETTINGS[key] for key in SETTING_KEYS])
+    print(f"{'n':>12s} {'平均誤差':>8s} {'p99':>8s} {'最大':>8s} {'lookup':>10s}")
+    for lo, hi in BANDS:
+        n = rng.integers(lo, hi, size=samples)
+        k = rng.binomial(n, rng.choice(probs, size=samples))
+        exact = compute_posteriors_batch(n, k, priors)
+        start = time.perf_counter()
+        estimates = [reader.lookup(int(a), int(b)) for a, b in zip(n, k)]
+        lookup_sec = time.perf_counter() - start
+        errors = np.concatenate([
+            np.abs(np.array([e[code] for e in estimates]) - exact[:, indexes].sum(axis=1))
+            for code, indexes in GOAL_INDEXES.items()
+        ]) * 100.0
+        print(
+            f"{lo:>5d}-{hi:<6d} {errors.mean():7.2f}pt {np.quantile(errors, 0.99):7.2f}pt {errors.max():7.2f}pt "
+            f"{lookup_sec / samples * 1e6:7.1f} µs"
+        )
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
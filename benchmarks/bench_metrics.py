@@ -0,0 +1,50 @@
+"""
+計測 (src/metrics.py) そのものの負担
+
+span を1回通る時間を、無効時（使い回しの nullcontext）と有効時（ヒストグラムへの記録）で比べる。
+timed は無効時には関数をそのまま返すため負担はない。あわせて Prometheus 形式の出力時間も表示する。
+
+実行方法:
+    python -m benchmarks.bench_metrics [回数]
+"""
+import sys
+import time
+
+from src import metrics
+from src.constants import METRICS_CONFIG
+
+def per_call(func, loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        func()
+    return (time.perf_counter() - start) / loops
+
+def main(loops: int = 200_000):
+    null = metrics._NULL
+
+    def empty():
+        pass
+
+    def disabled_span():
+        with null:
+            pass
+
+    def enabled_span():
+        with metrics._Span("bench"):
+            pass
+
+    registry = metrics.MetricsRegistry(METRICS_CONFIG["buckets"])
+    for stage in ("css", "inputs", "result_bundle", "spin_plan", "html.result_card"):
+        for i in range(1000):
+            registry.observe("mtv_stage_seconds", i * 1e-5, stage=stage)
+        registry.inc("mtv_reruns_total", scope=stage)
+
+    baseline = per_call(empty, loops)
+    print(f"enabled (env) : {metrics.ENABLED}")
+    print(f"関数呼び出し    : {baseline * 1e9:7.0f} ns")
+    print(f"span 無効       : {(per_call(disabled_span, loops) - baseline) * 1e9:7.0f} ns")
+    print(f"span 有効       : {(per_call(enabled_span, loops) - baseline) * 1e9:7.0f} ns")
+    print(f"Prometheus 出力 : {per_call(registry.render_prometheus, 200) * 1e3:7.3f} ms ({len(registry.render_prometheus())} bytes)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,59 @@
+"""
+ホール・曜日別の事前確率の推定 (src/priors.py) の時間と精度
+
+ホールごと・曜日ごとに設定の配分を変えた1年分の疑似データ（台×日ごとの (n, k)）を作り、
+fit_priors の所要時間と、真の配分との差（設定ごとの割合の平均絶対誤差）を表示する。
+
+実行方法:
+    python -m benchmarks.bench_priors [ホール数] [1日の台数]
+"""
+import sys
+import time
+
+import numpy as np
+
+from src.constants import SETTING_KEYS
+from src.batch import SETTING_PROBS
+from src.priors import DAY_KINDS, HistoryRecords, fit_priors
+
+def make_history(halls: int, machines: int, days: int = 365, seed: int = 0):
+    """ホール×曜日ごとの真の配分と、それに従う疑似データ"""
+    rng = np.random.default_rng(seed)
+    num_kinds = len(DAY_KINDS) - 1  # 特日は使わない
+    # ホールの基本の配分に、曜日ごとの揺らぎ（週末は高設定寄り）を加える
+    base = rng.dirichlet(np.array([6.0, 3.0, 2.0, 1.0, 0.7]), size=halls)
+    weekend = np.array([-0.06, -0.03, 0.03, 0.03, 0.03])
+    truth = np.repeat(base[:, None, :], num_kinds, axis=1)
+    truth[:, 5:7] = np.clip(truth[:, 5:7] + weekend, 0.005, None)
+    truth /= truth.sum(axis=2, keepdims=True)
+
+    hall_index = np.repeat(np.arange(halls), days * machines)
+    kind_index = np.tile(np.repeat(np.arange(days) % num_kinds, machines), halls)
+    cum = truth.cumsum(axis=2)[hall_index, kind_index]
+    settings = (rng.random(len(hall_index))[:, None] > cum).sum(axis=1)
+    spins = rng.integers(500, 9000, size=len(hall_index)).astype(np.float64)
+    hits = rng.binomial(spins.astype(np.int64), SETTING_PROBS[settings]).astype(np.float64)
+    records = HistoryRecords([f"hall{h}" for h in range(halls)], hall_index, kind_index, spins, hits)
+    return records, truth
+
+def main(halls: int = 20, machines: int = 300):
+    start = time.perf_counter()
+    records, truth = make_history(halls, machines)
+    print(f"rows        : {len(records):,} ({halls} ホール × 365 日 × {machines} 台、作成 {time.perf_counter() - start:.1f} 秒)")
+
+    start = time.perf_counter()
+    fitted = fit_priors(records)
+    print(f"fit         : {time.perf_counter() - start:.2f} 秒 (反復 {fitted['iterations']})")
+
+    hall_errors = []
+    day_errors = []
+    for h, hall in enumerate(records.halls):
+        entry = fitted["halls"][hall]
+        hall_errors.append(np.abs(np.array(entry["all"]) - truth[h].mean(axis=0)).mean())
+        for d in range(truth.shape[1]):
+            day_errors.append(np.abs(np.array(entry["days"][DAY_KINDS[d]]) - truth[h, d]).mean())
+    flat = np.abs(1.0 / len(SETTING_KEYS) - truth).mean()
+    print(f"誤差 (平均) : ホール {np.mean(hall_errors) * 100:.2f}pt  ホール×曜日 {np.mean(day_errors) * 100:.2f}pt  （一様分布のまま {flat * 100:.2f}pt）")
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:3]))
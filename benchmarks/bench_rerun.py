@@ -0,0 +1,129 @@
+"""
+入力操作1回あたりの再実行時間と送信量の計測
+
+AppTest で main.py をヘッドレス実行し、回転数・小役回数の入力を繰り返して、
+1操作ごとのサーバー処理時間と、ブラウザへ送られる ForwardMsg の合計バイト数を記録する。
+
+    full      : 入力のたびにスクリプト全体を再実行（フラグメント導入前と同じ挙動）
+    fragment  : 入力欄を含むフラグメントだけを再実行（ブラウザでの実際の挙動）
+
+実行方法:
+    python -m benchmarks.bench_rerun [--script main.py] [--steps 200]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from streamlit.runtime.scriptrunner import ScriptRunnerEvent
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData, ScriptRequests
+from streamlit.testing.v1 import local_script_runner
+from streamlit.testing.v1.app_test import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner, require_widgets_deltas
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class _Recorder:
+    """LocalScriptRunner.run を差し替えて、フラグメント指定と送信量の記録を行う"""
+
+    def __init__(self):
+        self.fragment_id: Optional[str] = None
+        self.last_bytes = 0
+        self.last_messages: List = []
+
+    def install(self):
+        recorder = self
+
+        def run(self, widget_state=None, query_params=None, timeout=3, page_hash=""):
+            rerun_data = RerunData(
+                widget_states=widget_state,
+                page_script_hash=page_hash,
+                fragment_id_queue=[recorder.fragment_id] if recorder.fragment_id else [],
+            )
+            # 生成時に積まれる全体再実行の要求と統合されないよう、要求キューを作り直す
+            self._requests = ScriptRequests()
+            self._requests.request_rerun(rerun_data)
+            try:
+                if not self._script_thread:
+                    self.start()
+                require_widgets_deltas(self, timeout)
+            finally:
+                self.join()
+            # キューには前回から残った（フラグメント外の）要素も含まれるため、
+            # 今回の実行で送られたメッセージだけを数える
+            sent = [
+                data["forward_msg"]
+                for event, data in zip(self.events, self.event_data)
+                if event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG
+            ]
+            recorder.last_messages = sent
+            recorder.last_bytes = sum(msg.ByteSize() for msg in sent)
+            return local_script_runner.parse_tree_from_messages(self.forward_msgs())
+
+        LocalScriptRunner.run = run
+
+def _find_fragment_id(messages, widget_key: str) -> Optional[str]:
+    """指定キーのウィジェットを含むフラグメントの ID"""
+    for msg in messages:
+        if msg.WhichOneof("type") != "delta":
+            continue
+        delta = msg.delta
+        if delta.fragment_id and widget_key in str(delta.new_element):
+            return delta.fragment_id
+    return None
+
+def measure(script: str, mode: str, steps: int) -> Dict[str, float]:
+    recorder = _Recorder()
+    recorder.install()
+    app = AppTest.from_file(script, default_timeout=30).run()
+    first_bytes = recorder.last_bytes
+    if mode == "fragment":
+        recorder.fragment_id = _find_fragment_id(recorder.last_messages, "num_n")
+        if recorder.fragment_id is None:
+            raise SystemExit(f"{script}: num_n を含むフラグメントが見つかりません")
+
+    latencies: List[float] = []
+    sizes: List[int] = []
+    n, k = 0, 0
+    for step in range(steps):
+        # カウンター操作を模して、回転数と小役回数を交互に増やす
+        if step % 3 == 2:
+            k += 1
+            widget = app.number_input(key="num_k").set_value(k)
+        else:
+            n += 10
+            widget = app.number_input(key="num_n").set_value(n)
+        start = time.perf_counter()
+        widget.run()
+        latencies.append(time.perf_counter() - start)
+        sizes.append(recorder.last_bytes)
+
+    latencies.sort()
+    return {
+        "initial_bytes": first_bytes,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p90_ms": latencies[int(len(latencies) * 0.9) - 1] * 1000,
+        "mean_bytes": statistics.mean(sizes),
+    }
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="入力操作ごとの再実行時間と送信量")
+    parser.add_argument("--script", default=os.path.join(ROOT_DIR, "main.py"))
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--mode", action="append", choices=["full", "fragment"])
+    args = parser.parse_args(argv)
+
+    # 本番の操作ログ・事前確率を汚さないよう、使い捨てのディレクトリに書く
+    scratch = tempfile.mkdtemp(prefix="bench_rerun_")
+    os.environ.setdefault("EVENT_STORE_PATH", os.path.join(scratch, "events.sqlite3"))
+    os.environ.setdefault("PRIOR_CACHE_PATH", os.path.join(scratch, "priors.json"))
+
+    print(f"{'mode':10s} {'初回(B)':>10s} {'p50(ms)':>9s} {'p90(ms)':>9s} {'1操作(B)':>10s}")
+    for mode in args.mode or ["full", "fragment"]:
+        result = measure(os.path.abspath(args.script), mode, args.steps)
+        print(f"{mode:10s} {result['initial_bytes']:10.0f} {result['p50_ms']:9.2f} {result['p90_ms']:9.2f} {result['mean_bytes']:10.0f}")
+
+if __name__ == "__main__":
+    main()
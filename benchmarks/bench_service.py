@@ -0,0 +1,130 @@
+"""
+JSON 判別サービス (src/service.py) の負荷試験
+
+localhost にサービスを起動し（--url 指定時は既存のサービスを使う）、
+concurrency 本の keep-alive 接続から合計 requests 件の POST /evaluate を送って、
+応答時間の p50 / p99 と1秒あたりの処理件数を表示する。
+--batch-window を複数指定すると、まとめ処理の待ち時間ごとに比較する（0 は待たずに、積まれている分だけまとめる）。
+
+実行方法:
+    python -m benchmarks.bench_service [--requests 20000] [--concurrency 64] [--batch-window 0 --batch-window 0.002]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+async def _worker(host: str, port: int, count: int, seed: int, latencies: List[float], statuses: Dict[int, int]) -> None:
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            n = rng.randint(100, 8000)
+            body = json.dumps({"n": n, "k": rng.randint(n // 40, n // 20)}).encode()
+            request = (
+                f"POST /evaluate HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode() + body
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            status = int(status_line.split()[1])
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+async def run_load(host: str, port: int, requests: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    per_worker = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*[_worker(host, port, count, i, latencies, statuses) for i, count in enumerate(per_worker)])
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000,
+        "rps": len(latencies) / elapsed,
+        "ok": statuses.get(200, 0),
+        "rejected": statuses.get(503, 0),
+    }
+
+async def fetch_health(host: str, port: int) -> Dict[str, float]:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /health HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _start_server(port: int, batch_window: float) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "src.service", "--port", str(port), "--batch-window", str(batch_window)],
+        cwd=ROOT_DIR,
+        stdout=subprocess.PIPE,
+    )
+    proc.stdout.readline()  # "listening on ..." を待つ
+    return proc
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="JSON 判別サービスの負荷試験")
+    parser.add_argument("--url", help="既に起動しているサービス（例: http://127.0.0.1:8765）")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--batch-window", type=float, action="append", help="起動するサービスのまとめ待ち時間（秒）")
+    args = parser.parse_args(argv)
+
+    targets: List[Tuple[str, Optional[float]]] = []
+    if args.url:
+        targets.append((args.url, None))
+    else:
+        targets.extend((None, window) for window in (args.batch_window or [0.0, 0.002]))
+
+    print(f"{'batch_window':>12s} {'p50(ms)':>9s} {'p99(ms)':>9s} {'req/s':>9s} {'200':>7s} {'503':>6s} {'平均バッチ':>8s}")
+    for url, window in targets:
+        proc = None
+        if url is None:
+            port = _free_port()
+            proc = _start_server(port, window)
+            host = "127.0.0.1"
+        else:
+            parsed = urlparse(url)
+            host, port = parsed.hostname, parsed.port or 80
+        try:
+            result = asyncio.run(run_load(host, port, args.requests, args.concurrency))
+            health = asyncio.run(fetch_health(host, port))
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.wait()
+        label = "external" if window is None else f"{window * 1000:.1f}ms"
+        print(f"{label:>12s} {result['p50_ms']:9.2f} {result['p99_ms']:9.2f} {result['rps']:9.0f} {result['ok']:7d} {result['rejected']:6d} {health['batched_items'] / max(1, health['batches']):8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+機種仕様の登録簿 (src/specs.py) の起動時間と切り替え時間
+
+一時ディレクトリに N 機種分の仕様ファイル（設定6段階・期待度2種類）と索引を作り、
+機種数ごとに「索引の読み込み（起動時に必要な分）」「初めて使う機種の読み込みと前計算」
+「読み込み済みの機種への切り替え」「切り替え後の事後確率の計算」の時間を表示する。
+
+実行方法:
+    python -m benchmarks.bench_specs [最大機種数]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from src import specs
+from src.constants import GOAL_CONFIG
+from src.state import PosteriorState
+
+def write_specs(directory: str, count: int) -> None:
+    machines = {}
+    for i in range(count):
+        machine_id = f"machine_{i:04d}"
+        base = 1 / (40.0 - (i % 7))
+        data = {
+            "id": machine_id,
+            "name": f"テスト機種 {i}",
+            "indicator": "小役",
+            "settings": {str(s): base * (1 + 0.08 * (s - 1)) for s in range(1, 7)},
+            "goal_groups": {
+                "456": {"goal": ["4", "5", "6"], "alt": ["1", "2", "3"]},
+                "56": {"goal": ["5", "6"], "alt": ["1", "2", "3", "4"]},
+            },
+            "goal_config": GOAL_CONFIG,
+        }
+        with open(os.path.join(directory, f"{machine_id}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        machines[machine_id] = {"name": data["name"], "file": f"{machine_id}.json"}
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump({"machines": machines}, f, ensure_ascii=False)
+
+def main(max_count: int = 1000):
+    count = 10
+    while count <= max_count:
+        with tempfile.TemporaryDirectory() as directory:
+            write_specs(directory, count)
+            os.environ["MACHINE_SPEC_DIR"] = directory
+            specs.clear_spec_cache()
+
+            start = time.perf_counter()
+            machines = specs.list_machines()
+            startup = time.perf_counter() - start
+
+            target = machines[-1][0]
+            start = time.perf_counter()
+            spec = specs.get_spec(target)
+            first = time.perf_counter() - start
+
+            repeats = 10000
+            start = time.perf_counter()
+            for _ in range(repeats):
+                spec = specs.get_spec(target)
+            cached = (time.perf_counter() - start) / repeats
+
+            start = time.perf_counter()
+            for _ in range(1000):
+                PosteriorState(spec.flat_priors(), 3000, 100, spec).posteriors()
+            posterior = (time.perf_counter() - start) / 1000
+
+            print(
+                f"{count:5d} 機種: 索引 {startup * 1e3:7.2f} ms  初回読み込み {first * 1e3:6.2f} ms  "
+                f"切り替え {cached * 1e6:5.2f} µs  事後確率 {posterior * 1e6:6.1f} µs"
+            )
+        count *= 10
+    os.environ.pop("MACHINE_SPEC_DIR", None)
+    specs.clear_spec_cache()
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,69 @@
+"""
+必要小役回数の逆引き (src/whatif.py) の速さと正確さ
+
+早見表の作成時間・大きさと、1問い合わせあたりの時間を表示し、
+ランダムな (n, k) で表の星・期待度を evaluate_goal / PosteriorState の結果と突き合わせる。
+比較として、小役回数を1回ずつ増やして evaluate_goal を繰り返す（入力欄を試しに動かすのと同じ）方法の時間も表示する。
+
+実行方法:
+    python -m benchmarks.bench_whatif [突き合わせる点の数]
+"""
+import random
+import sys
+import time
+
+from src.specs import get_spec
+from src.state import PosteriorState
+from src.logic import evaluate_goal, calculate_ci_range_pct, group_probability
+from src.whatif import get_whatif_grid, hits_needed, _cached_grid
+
+def exact_stars(spec, priors, code, n, k):
+    posteriors = PosteriorState(priors, n, k, spec).posteriors()
+    group = spec.goal_groups[code]
+    goal = group_probability(posteriors, group["goal"])
+    alt = group_probability(posteriors, group["alt"])
+    return goal, evaluate_goal(code, goal, alt, n, calculate_ci_range_pct(n, k))["stars"]
+
+def scan_hits_needed(spec, priors, code, n, k, extra, stars):
+    """表を使わずに、追加の小役回数を1回ずつ増やして星を確かめる"""
+    for more in range(extra + 1):
+        if exact_stars(spec, priors, code, n + extra, k + more)[1] >= stars:
+            return more
+    return None
+
+def main(points: int = 2000):
+    spec = get_spec()
+    priors = spec.flat_priors()
+    _cached_grid.cache_clear()
+    start = time.perf_counter()
+    grid = get_whatif_grid(priors, spec)
+    print(f"早見表の作成: {time.perf_counter() - start:.2f} 秒  {grid.nbytes / 1e6:.1f} MB  (0..{grid.max_spins}G)")
+
+    rng = random.Random(0)
+    star_errors = 0
+    prob_error = 0.0
+    for _ in range(points):
+        n = rng.randint(1, grid.max_spins)
+        k = rng.randint(0, int(n * 0.06))
+        for code in spec.goal_codes:
+            goal, stars = exact_stars(spec, priors, code, n, k)
+            star_errors += stars != grid.stars_at(code, n, k)
+            prob_error = max(prob_error, abs(goal - grid.prob_at(code, n, k)))
+    print(f"突き合わせ {points} 点: 星の不一致 {star_errors}  期待度の最大誤差 {prob_error:.2e}")
+
+    queries = [(rng.randint(100, 5000), rng.randint(0, 150), rng.choice((100, 500, 1000, 3000))) for _ in range(1000)]
+    for label, kwargs in (("星の逆引き", {"stars": 4}), ("期待度の逆引き", {"prob": 0.8})):
+        start = time.perf_counter()
+        for _ in range(20):
+            for n, k, extra in queries:
+                hits_needed(grid, n, k, extra, "456", **kwargs)
+        print(f"{label}: {(time.perf_counter() - start) / (20 * len(queries)) * 1e6:.1f} µs/回")
+
+    start = time.perf_counter()
+    for n, k, extra in queries[:20]:
+        answer = hits_needed(grid, n, k, extra, "456", stars=4)
+        assert scan_hits_needed(spec, priors, "456", n, k, extra, 4) == (answer["more"] if answer["reachable"] else None)
+    print(f"1回ずつ試す方法: {(time.perf_counter() - start) / 20 * 1e3:.1f} ms/回（結果は表と一致）")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,178 @@
+"""
+同時セッション数ごとの再実行時間・処理件数・メモリの負荷試験
+
+1つのプロセスの中で main.py のセッションを N 個（AppTest、セッションごとに別スレッド）同時に動かし、
+実際の打ち方に近いカウンター操作（回転数を 10〜100G ずつ、小役回数を当選率どおりに増やす）を
+繰り返し入力する。Streamlit のサーバーも全セッションを1プロセスのスレッドで実行するため、
+GIL・結果キャッシュ・操作ログの書き込みスレッドの奪い合いを含めた値になる。
+
+N ごとに別プロセスで測り（前の N のメモリが残らないように）、次を表示する。
+    p50 / p99   入力1回あたりの再実行時間（AppTest はスクリプト全体を再実行するため、
+                フラグメントだけが再実行されるブラウザより重めの値）
+    rerun/s     全セッション合計の再実行回数/秒
+    RSS         セッション作成前からの常駐メモリの増加（合計・1セッションあたり）
+    state / html 1セッションの session_state（pickle した大きさ）と、描画した Markdown/HTML の大きさ
+
+実行方法:
+    python -m benchmarks.load_sessions [--sessions 1 --sessions 4 ...] [--steps 30] [--think-ms 0]
+"""
+import argparse
+import json
+import logging
+import os
+import pickle
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SESSIONS = (1, 2, 4, 8, 16)
+
+# (ウィジェットのキー, 値)
+Action = Tuple[str, int]
+
+def make_trace(steps: int, seed: int) -> List[Action]:
+    """1人分の入力列。回転数を増やし、当たった分だけ続けて小役回数を増やす"""
+    from src.constants import SETTINGS
+
+    rng = random.Random(seed)
+    hit_prob = rng.choice(list(SETTINGS.values()))
+    n = k = 0
+    trace: List[Action] = []
+    while len(trace) < steps:
+        spins = rng.choice((10, 10, 10, 20, 50, 100))
+        hits = sum(1 for _ in range(spins) if rng.random() < hit_prob)
+        n += spins
+        trace.append(("num_n", n))
+        if hits:
+            k += hits
+            trace.append(("num_k", k))
+    return trace[:steps]
+
+def rss_bytes() -> int:
+    """現在の常駐メモリ（Linux は /proc、それ以外は最大常駐メモリで代用）"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == "darwin" else usage * 1024
+
+def _new_session(script: str, session_id: str):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(script, default_timeout=120)
+    app.query_params["sid"] = session_id
+    return app
+
+def _state_bytes(app) -> int:
+    total = 0
+    for value in app.session_state.values():
+        try:
+            total += len(pickle.dumps(value))
+        except Exception:
+            pass
+    return total
+
+def _html_bytes(app) -> int:
+    return sum(len(element.value.encode("utf-8")) for element in app.markdown)
+
+def run_sessions(script: str, sessions: int, steps: int, think_ms: float, seed: int) -> Dict[str, Any]:
+    """sessions 個のセッションを同時に動かして測る（このプロセスの中で実行）"""
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    # 読み込み・初回のキャッシュ作成はセッション当たりの値に含めない
+    _new_session(script, "warmup").run()
+    rss_before = rss_bytes()
+
+    # 操作ログから前回の値が復元されないよう、実行ごとに別のセッション ID にする
+    run_id = uuid.uuid4().hex[:8]
+    start_barrier = threading.Barrier(sessions)
+    latencies: List[List[float]] = [[] for _ in range(sessions)]
+    apps: List[Any] = [None] * sessions
+    errors: List[str] = []
+
+    def drive(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        app = _new_session(script, f"load-{run_id}-{index}")
+        app.run()
+        apps[index] = app
+        start_barrier.wait()
+        for key, value in make_trace(steps, seed * 1000 + index):
+            if think_ms > 0:
+                time.sleep(rng.expovariate(1.0 / think_ms) / 1000.0)
+            begin = time.perf_counter()
+            app.number_input(key=key).set_value(value).run()
+            latencies[index].append(time.perf_counter() - begin)
+            if app.exception:
+                errors.append(str(app.exception[0].message))
+                return
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        list(executor.map(drive, range(sessions)))
+    elapsed = time.perf_counter() - started
+    rss_after = rss_bytes()
+
+    flat = sorted(x for per_session in latencies for x in per_session)
+    live = [app for app in apps if app is not None]
+    return {
+        "sessions": sessions,
+        "reruns": len(flat),
+        "errors": len(errors),
+        "p50_ms": statistics.median(flat) * 1000 if flat else 0.0,
+        "p99_ms": flat[max(0, int(len(flat) * 0.99) - 1)] * 1000 if flat else 0.0,
+        "throughput": len(flat) / elapsed if elapsed > 0 else 0.0,
+        "rss_growth_mb": (rss_after - rss_before) / 2**20,
+        "rss_per_session_mb": (rss_after - rss_before) / 2**20 / sessions,
+        "state_kb": statistics.mean(_state_bytes(app) for app in live) / 1024 if live else 0.0,
+        "html_kb": statistics.mean(_html_bytes(app) for app in live) / 1024 if live else 0.0,
+    }
+
+def _run_in_subprocess(args: argparse.Namespace, sessions: int) -> Dict[str, Any]:
+    command = [
+        sys.executable, "-m", "benchmarks.load_sessions", "--worker",
+        "--script", args.script, "--sessions", str(sessions),
+        "--steps", str(args.steps), "--think-ms", str(args.think_ms), "--seed", str(args.seed),
+    ]
+    output = subprocess.run(command, cwd=ROOT_DIR, env=os.environ.copy(), check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="同時セッション数ごとの負荷試験")
+    parser.add_argument("--script", default=os.path.join(ROOT_DIR, "main.py"))
+    parser.add_argument("--sessions", type=int, action="append", help=f"同時セッション数（複数指定可、既定 {DEFAULT_SESSIONS}）")
+    parser.add_argument("--steps", type=int, default=30, help="1セッションの入力回数")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="入力の間隔の平均（ミリ秒、指数分布。0 は待たずに次を入力）")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    args.script = os.path.abspath(args.script)
+
+    if "EVENT_STORE_PATH" not in os.environ:
+        # 本番の操作ログを汚さないよう、使い捨てのファイルに書く
+        os.environ["EVENT_STORE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="load_sessions_"), "events.sqlite3")
+
+    if args.worker:
+        print(json.dumps(run_sessions(args.script, args.sessions[0], args.steps, args.think_ms, args.seed)))
+        return
+
+    print(f"{'sessions':>8s} {'reruns':>7s} {'p50(ms)':>9s} {'p99(ms)':>9s} {'rerun/s':>8s} {'RSS+(MB)':>9s} {'MB/session':>10s} {'state(KB)':>9s} {'html(KB)':>9s} {'errors':>6s}")
+    for sessions in args.sessions or DEFAULT_SESSIONS:
+        r = _run_in_subprocess(args, sessions)
+        print(
+            f"{r['sessions']:8d} {r['reruns']:7d} {r['p50_ms']:9.1f} {r['p99_ms']:9.1f} {r['throughput']:8.1f} "
+            f"{r['rss_growth_mb']:9.1f} {r['rss_per_session_mb']:10.2f} {r['state_kb']:9.1f} {r['html_kb']:9.1f} {r['errors']:6d}",
+            flush=True,
+        )
+
+if __name__ == "__main__":
+    main()
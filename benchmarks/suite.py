@@ -0,0 +1,197 @@
+"""
+ホットパスの性能計測と回帰チェック
+
+実行方法:
+    python -m benchmarks.suite run --output benchmarks/baseline.json
+    python -m benchmarks.suite compare --baseline benchmarks/baseline.json --tolerance 0.3
+
+各ケースは timeit で数回計測した中央値（1回あたりの秒数）を記録する。
+compare は基準値より tolerance (割合) を超えて遅くなったケースがあれば終了コード 1 を返す。
+ただし遅くなった時間が noise floor（既定 0.5 マイクロ秒）未満のものは計測誤差とみなす
+（1 マイクロ秒前後のケースは、割合だけで判定すると実行のたびに結果が変わるため）。
+基準値は実行環境に依存するため、本番と同じマシンで作り直して使うこと。
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.constants import SETTING_KEYS
+from src.logic import calculate_likelihood, compute_posteriors, evaluate_goal, get_log_table
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PRIORS = {key: 1.0 / len(SETTING_KEYS) for key in SETTING_KEYS}
+SPIN_COUNTS = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+Case = Tuple[str, Callable[[], object]]
+
+def logic_cases() -> List[Case]:
+    """src/logic.py の尤度・事後確率・評価"""
+    # 対数テーブルの初回拡張は計測に含めない
+    get_log_table().ensure(max(SPIN_COUNTS))
+    cases: List[Case] = []
+    for n in SPIN_COUNTS:
+        k = n // 30
+        cases.append((f"calculate_likelihood[n={n}]", lambda n=n, k=k: calculate_likelihood(n, k, 1 / 30.27)))
+        cases.append((f"compute_posteriors[n={n}]", lambda n=n, k=k: compute_posteriors(n, k, PRIORS)))
+    cases.append(("evaluate_goal[456]", lambda: evaluate_goal("456", 0.72, 0.28, 1500, 2.0)))
+    cases.append(("evaluate_goal[56]", lambda: evaluate_goal("56", 0.45, 0.55, 400, 4.0)))
+    return cases
+
+def component_cases() -> List[Case]:
+    """src/components.py の HTML 生成（Streamlit への出力は含まない）"""
+    from src.components import build_result_card_html, build_probability_bars_html, render_star_rating
+
+    posteriors = compute_posteriors(3000, 110, PRIORS)
+    return [
+        ("render_star_rating", lambda: render_star_rating(4)),
+        ("build_result_card_html", lambda: build_result_card_html("456期待度", "72.0%", "信頼度: 4/5", 4, "コメント", True)),
+        ("build_probability_bars_html", lambda: build_probability_bars_html(posteriors)),
+    ]
+
+def batch_cases() -> List[Case]:
+    """NumPy による一括計算"""
+    import numpy as np
+    from src.batch import compute_posteriors_batch
+
+    rng = np.random.default_rng(0)
+    n = rng.integers(100, 8000, size=10_000)
+    k = rng.binomial(n, 1 / 30.0)
+    return [("compute_posteriors_batch[rows=10000]", lambda: compute_posteriors_batch(n, k, PRIORS))]
+
+def app_cases() -> List[Case]:
+    """main.py の再実行（AppTest でヘッドレス実行）"""
+    from streamlit.testing.v1 import AppTest
+
+    # 本番の操作ログ・事前確率を汚さないよう、使い捨てのディレクトリに書く
+    scratch = tempfile.mkdtemp(prefix="bench_suite_")
+    os.environ.setdefault("EVENT_STORE_PATH", os.path.join(scratch, "events.sqlite3"))
+    os.environ.setdefault("PRIOR_CACHE_PATH", os.path.join(scratch, "priors.json"))
+
+    def rerun_case(spin_plan: bool) -> Callable[[], object]:
+        app = AppTest.from_file(os.path.join(ROOT_DIR, "main.py"), default_timeout=30).run()
+        if spin_plan:
+            # 入力があるときだけ表示される
+            app.number_input(key="num_n").set_value(100)
+            app.number_input(key="num_k").set_value(3).run()
+            app.toggle(key="show_spin_plan").set_value(True).run()
+        values = iter(range(100, 10_000_000, 10))
+
+        def rerun():
+            n = next(values)
+            app.number_input(key="num_n").set_value(n)
+            app.number_input(key="num_k").set_value(n // 30).run()
+
+        return rerun
+
+    # 判別までの必要回転数は表示を開いたときだけ計算するので、開いた状態も別に計測する
+    return [("main_rerun", rerun_case(False)), ("main_rerun[spin_plan]", rerun_case(True))]
+
+SUITES: Dict[str, Callable[[], List[Case]]] = {
+    "logic": logic_cases,
+    "components": component_cases,
+    "batch": batch_cases,
+    "app": app_cases,
+}
+
+# compare で計測誤差とみなす遅化の大きさの既定値（秒）
+NOISE_FLOOR = 0.5e-6
+
+def measure(func: Callable[[], object], min_time: float = 0.5, repeat: int = 7) -> float:
+    """1回あたりの実行時間（秒）。min_time 秒程度かかる回数を repeat 回計測した中央値"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return statistics.median(timer.repeat(repeat=repeat, number=number)) / number
+
+def run(suites: List[str], min_time: float, repeat: int) -> Dict[str, object]:
+    results: Dict[str, float] = {}
+    for suite in suites:
+        for name, func in SUITES[suite]():
+            results[name] = measure(func, min_time, repeat)
+            print(f"{name:45s} {results[name] * 1e6:12.2f} us", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "statistic": "median",
+            "min_time": min_time,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def compare(
+    baseline: Dict[str, object], current: Dict[str, object], tolerance: float, noise_floor: float = NOISE_FLOOR,
+) -> List[str]:
+    """基準値より (1 + tolerance) 倍を超え、かつ noise_floor 秒以上遅くなったケースの一覧"""
+    regressions = []
+    base_results = baseline["results"]
+    for name, seconds in current["results"].items():
+        base = base_results.get(name)
+        if base is None:
+            print(f"{name:45s} {seconds * 1e6:12.2f} us  (新規)")
+            continue
+        ratio = seconds / base if base > 0 else float("inf")
+        if ratio <= 1.0 + tolerance:
+            flag = "ok"
+        elif seconds - base < noise_floor:
+            flag = "ok (誤差)"
+        else:
+            flag = "NG"
+        print(f"{name:45s} {base * 1e6:12.2f} -> {seconds * 1e6:12.2f} us  x{ratio:5.2f}  {flag}")
+        if flag == "NG":
+            regressions.append(name)
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="性能計測と回帰チェック")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for command in ("run", "compare"):
+        p = sub.add_parser(command)
+        p.add_argument("--suite", action="append", choices=list(SUITES), help="計測するスイート（省略時はすべて）")
+        p.add_argument("--min-time", type=float, default=0.5, help="1回の計測にかける目安の秒数")
+        p.add_argument("--repeat", type=int, default=7, help="計測の回数（中央値を使う）")
+        if command == "run":
+            p.add_argument("--output", help="結果の保存先 JSON")
+        else:
+            p.add_argument("--baseline", required=True, help="基準値の JSON")
+            p.add_argument("--tolerance", type=float, default=0.3, help="許容する遅化の割合 (0.3 = 30%%)")
+            p.add_argument(
+                "--noise-floor", type=float, default=NOISE_FLOOR * 1e6,
+                help="これ未満の遅化は計測誤差とみなす（マイクロ秒）",
+            )
+    args = parser.parse_args(argv)
+
+    suites = args.suite or list(SUITES)
+    current = run(suites, args.min_time, args.repeat)
+
+    if args.command == "run":
+        text = json.dumps(current, ensure_ascii=False, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, current, args.tolerance, args.noise_floor * 1e-6)
+    if regressions:
+        print(f"\n性能劣化: {len(regressions)} 件 ({', '.join(regressions)})")
+        return 1
+    print("\n性能劣化なし")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +0,0 @@
-/*! For license information please see index.7033ef174dc1fd7d6770.js.LICENSE.txt */
-!function(e,t){"object"==typeof exports&&"object"==typeof module?module.exports=t():"function"==typeof define&&define.amd?define([],t):"object"==typeof exports?exports.koyaku_counter=t():e.koyaku_counter=t()}(self,function(){return function(){"use strict";var e={74:function(e,t,n){e.exports=n(568)},188:function(e,t,n){!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(193)},193:function(e,t,n){var r=n(912),i=n(602),o=n(203);function s(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function a(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function l(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{!!(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function u(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function c(e){if(31===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function d(e){if(l(e)!==e)throw Error(s(188))}function f(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e;for(e=e.child;null!==e;){if(null!==(t=f(e)))return t;e=e.sibling}return null}var h=Object.assign,p=Symbol.for("react.element"),y=Symbol.for("react.transitional.element"),b=Symbol.for("react.portal"),m=Symbol.for("react.fragment"),g=Symbol.for("react.strict_mode"),v=Symbol.for("react.profiler"),w=Symbol.for("react.consumer"),_=Symbol.for("react.context"),S=Symbol.for("react.forward_ref"),k=Symbol.for("react.suspense"),I=Symbol.for("react.suspense_list"),T=Symbol.for("react.memo"),x=Symbol.for("react.lazy");Symbol.for("react.scope");var E=Symbol.for("react.activity");Symbol.for("react.legacy_hidden"),Symbol.for("react.tracing_marker");var O=Symbol.for("react.memo_cache_sentinel");Symbol.for("react.view_transition");var A=Symbol.iterator;function C(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=A&&e[A]||e["@@iterator"])?e:null}var N=Symbol.for("react.client.reference");function D(e){if(null==e)return null;if("function"==typeof e)return e.$$typeof===N?null:e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case m:return"Fragment";case v:return"Profiler";case g:return"StrictMode";case k:return"Suspense";case I:return"SuspenseList";case E:return"Activity"}if("object"==typeof e)switch(e.$$typeof){case b:return"Portal";case _:return e.displayName||"Context";case w:return(e._context.displayName||"Context")+".Consumer";case S:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case T:return null!==(t=e.displayName||null)?t:D(e.type)||"Memo";case x:t=e._payload,e=e._init;try{return D(e(t))}catch(e){}}return null}var B=Array.isArray,F=i.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,L=o.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,M={pending:!1,data:null,method:null,action:null},P=[],z=-1;function U(e){return{current:e}}function R(e){0>z||(e.current=P[z],P[z]=null,z--)}function j(e,t){z++,P[z]=e.current,e.current=t}var V,$,H=U(null),W=U(null),Y=U(null),q=U(null);function Q(e,t){switch(j(Y,t),j(W,e),j(H,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?md(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)e=gd(t=md(t),e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}R(H),j(H,e)}function K(){R(H),R(W),R(Y)}function G(e){null!==e.memoizedState&&j(q,e);var t=H.current,n=gd(t,e.type);t!==n&&(j(W,e),j(H,n))}function X(e){W.current===e&&(R(H),R(W)),q.current===e&&(R(q),df._currentValue=M)}function J(e){if(void 0===V)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);V=t&&t[1]||"",$=-1<e.stack.indexOf("\n    at")?" (<anonymous>)":-1<e.stack.indexOf("@")?"@unknown:0:0":""}return"\n"+V+e+$}var Z=!1;function ee(e,t){if(!e||Z)return"";Z=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var r={DetermineComponentFrameRoot:function(){try{if(t){var n=function(){throw Error()};if(Object.defineProperty(n.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(n,[])}catch(e){var r=e}Reflect.construct(e,[],n)}else{try{n.call()}catch(e){r=e}e.call(n.prototype)}}else{try{throw Error()}catch(e){r=e}(n=e())&&"function"==typeof n.catch&&n.catch(function(){})}}catch(e){if(e&&r&&"string"==typeof e.stack)return[e.stack,r.stack]}return[null,null]}};r.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var i=Object.getOwnPropertyDescriptor(r.DetermineComponentFrameRoot,"name");i&&i.configurable&&Object.defineProperty(r.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var o=r.DetermineComponentFrameRoot(),s=o[0],a=o[1];if(s&&a){var l=s.split("\n"),u=a.split("\n");for(i=r=0;r<l.length&&!l[r].includes("DetermineComponentFrameRoot");)r++;for(;i<u.length&&!u[i].includes("DetermineComponentFrameRoot");)i++;if(r===l.length||i===u.length)for(r=l.length-1,i=u.length-1;1<=r&&0<=i&&l[r]!==u[i];)i--;for(;1<=r&&0<=i;r--,i--)if(l[r]!==u[i]){if(1!==r||1!==i)do{if(r--,0>--i||l[r]!==u[i]){var c="\n"+l[r].replace(" at new "," at ");return e.displayName&&c.includes("<anonymous>")&&(c=c.replace("<anonymous>",e.displayName)),c}}while(1<=r&&0<=i);break}}}finally{Z=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?J(n):""}function te(e,t){switch(e.tag){case 26:case 27:case 5:return J(e.type);case 16:return J("Lazy");case 13:return e.child!==t&&null!==t?J("Suspense Fallback"):J("Suspense");case 19:return J("SuspenseList");case 0:case 15:return ee(e.type,!1);case 11:return ee(e.type.render,!1);case 1:return ee(e.type,!0);case 31:return J("Activity");default:return""}}function ne(e){try{var t="",n=null;do{t+=te(e,n),n=e,e=e.return}while(e);return t}catch(e){return"\nError generating stack: "+e.message+"\n"+e.stack}}var re=Object.prototype.hasOwnProperty,ie=r.unstable_scheduleCallback,oe=r.unstable_cancelCallback,se=r.unstable_shouldYield,ae=r.unstable_requestPaint,le=r.unstable_now,ue=r.unstable_getCurrentPriorityLevel,ce=r.unstable_ImmediatePriority,de=r.unstable_UserBlockingPriority,fe=r.unstable_NormalPriority,he=r.unstable_LowPriority,pe=r.unstable_IdlePriority,ye=r.log,be=r.unstable_setDisableYieldValue,me=null,ge=null;function ve(e){if("function"==typeof ye&&be(e),ge&&"function"==typeof ge.setStrictMode)try{ge.setStrictMode(me,e)}catch(e){}}var we=Math.clz32?Math.clz32:function(e){return 0==(e>>>=0)?32:31-(_e(e)/Se|0)|0},_e=Math.log,Se=Math.LN2,ke=256,Ie=262144,Te=4194304;function xe(e){var t=42&e;if(0!==t)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return 261888&e;case 262144:case 524288:case 1048576:case 2097152:return 3932160&e;case 4194304:case 8388608:case 16777216:case 33554432:return 62914560&e;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function Ee(e,t,n){var r=e.pendingLanes;if(0===r)return 0;var i=0,o=e.suspendedLanes,s=e.pingedLanes;e=e.warmLanes;var a=134217727&r;return 0!==a?0!==(r=a&~o)?i=xe(r):0!==(s&=a)?i=xe(s):n||0!==(n=a&~e)&&(i=xe(n)):0!==(a=r&~o)?i=xe(a):0!==s?i=xe(s):n||0!==(n=r&~e)&&(i=xe(n)),0===i?0:0!==t&&t!==i&&0===(t&o)&&((o=i&-i)>=(n=t&-t)||32===o&&4194048&n)?t:i}function Oe(e,t){return 0===(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)}function Ae(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function Ce(){var e=Te;return!(62914560&(Te<<=1))&&(Te=4194304),e}function Ne(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function De(e,t){e.pendingLanes|=t,268435456!==t&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function Be(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var r=31-we(t);e.entangledLanes|=t,e.entanglements[r]=1073741824|e.entanglements[r]|261930&n}function Fe(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-we(n),i=1<<r;i&t|e[r]&t&&(e[r]|=t),n&=~i}}function Le(e,t){var n=t&-t;return 0!==((n=42&n?1:Me(n))&(e.suspendedLanes|t))?0:n}function Me(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Pe(e){return 2<(e&=-e)?8<e?134217727&e?32:268435456:8:2}function ze(){var e=L.p;return 0!==e?e:void 0===(e=window.event)?32:Ef(e.type)}function Ue(e,t){var n=L.p;try{return L.p=e,t()}finally{L.p=n}}var Re=Math.random().toString(36).slice(2),je="__reactFiber$"+Re,Ve="__reactProps$"+Re,$e="__reactContainer$"+Re,He="__reactEvents$"+Re,We="__reactListeners$"+Re,Ye="__reactHandles$"+Re,qe="__reactResources$"+Re,Qe="__reactMarker$"+Re;function Ke(e){delete e[je],delete e[Ve],delete e[He],delete e[We],delete e[Ye]}function Ge(e){var t=e[je];if(t)return t;for(var n=e.parentNode;n;){if(t=n[$e]||n[je]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=Md(e);null!==e;){if(n=e[je])return n;e=Md(e)}return t}n=(e=n).parentNode}return null}function Xe(e){if(e=e[je]||e[$e]){var t=e.tag;if(5===t||6===t||13===t||31===t||26===t||27===t||3===t)return e}return null}function Je(e){var t=e.tag;if(5===t||26===t||27===t||6===t)return e.stateNode;throw Error(s(33))}function Ze(e){var t=e[qe];return t||(t=e[qe]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function et(e){e[Qe]=!0}var tt=new Set,nt={};function rt(e,t){it(e,t),it(e+"Capture",t)}function it(e,t){for(nt[e]=t,e=0;e<t.length;e++)tt.add(t[e])}var ot=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),st={},at={};function lt(e,t,n){if(i=t,re.call(at,i)||!re.call(st,i)&&(ot.test(i)?at[i]=!0:(st[i]=!0,0)))if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":return void e.removeAttribute(t);case"boolean":var r=t.toLowerCase().slice(0,5);if("data-"!==r&&"aria-"!==r)return void e.removeAttribute(t)}e.setAttribute(t,""+n)}var i}function ut(e,t,n){if(null===n)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(t)}e.setAttribute(t,""+n)}}function ct(e,t,n,r){if(null===r)e.removeAttribute(n);else{switch(typeof r){case"undefined":case"function":case"symbol":case"boolean":return void e.removeAttribute(n)}e.setAttributeNS(t,n,""+r)}}function dt(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function ft(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function ht(e){if(!e._valueTracker){var t=ft(e)?"checked":"value";e._valueTracker=function(e,t,n){var r=Object.getOwnPropertyDescriptor(e.constructor.prototype,t);if(!e.hasOwnProperty(t)&&void 0!==r&&"function"==typeof r.get&&"function"==typeof r.set){var i=r.get,o=r.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){n=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:r.enumerable}),{getValue:function(){return n},setValue:function(e){n=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e,t,""+e[t])}}function pt(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ft(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function yt(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}var bt=/[\n"\\]/g;function mt(e){return e.replace(bt,function(e){return"\\"+e.charCodeAt(0).toString(16)+" "})}function gt(e,t,n,r,i,o,s,a){e.name="",null!=s&&"function"!=typeof s&&"symbol"!=typeof s&&"boolean"!=typeof s?e.type=s:e.removeAttribute("type"),null!=t?"number"===s?(0===t&&""===e.value||e.value!=t)&&(e.value=""+dt(t)):e.value!==""+dt(t)&&(e.value=""+dt(t)):"submit"!==s&&"reset"!==s||e.removeAttribute("value"),null!=t?wt(e,s,dt(t)):null!=n?wt(e,s,dt(n)):null!=r&&e.removeAttribute("value"),null==i&&null!=o&&(e.defaultChecked=!!o),null!=i&&(e.checked=i&&"function"!=typeof i&&"symbol"!=typeof i),null!=a&&"function"!=typeof a&&"symbol"!=typeof a&&"boolean"!=typeof a?e.name=""+dt(a):e.removeAttribute("name")}function vt(e,t,n,r,i,o,s,a){if(null!=o&&"function"!=typeof o&&"symbol"!=typeof o&&"boolean"!=typeof o&&(e.type=o),null!=t||null!=n){if(("submit"===o||"reset"===o)&&null==t)return void ht(e);n=null!=n?""+dt(n):"",t=null!=t?""+dt(t):n,a||t===e.value||(e.value=t),e.defaultValue=t}r="function"!=typeof(r=null!=r?r:i)&&"symbol"!=typeof r&&!!r,e.checked=a?e.checked:!!r,e.defaultChecked=!!r,null!=s&&"function"!=typeof s&&"symbol"!=typeof s&&"boolean"!=typeof s&&(e.name=s),ht(e)}function wt(e,t,n){"number"===t&&yt(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function _t(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+dt(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function St(e,t,n){null==t||((t=""+dt(t))!==e.value&&(e.value=t),null!=n)?e.defaultValue=null!=n?""+dt(n):"":e.defaultValue!==t&&(e.defaultValue=t)}function kt(e,t,n,r){if(null==t){if(null!=r){if(null!=n)throw Error(s(92));if(B(r)){if(1<r.length)throw Error(s(93));r=r[0]}n=r}null==n&&(n=""),t=n}n=dt(t),e.defaultValue=n,(r=e.textContent)===n&&""!==r&&null!==r&&(e.value=r),ht(e)}function It(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var Tt=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function xt(e,t,n){var r=0===t.indexOf("--");null==n||"boolean"==typeof n||""===n?r?e.setProperty(t,""):"float"===t?e.cssFloat="":e[t]="":r?e.setProperty(t,n):"number"!=typeof n||0===n||Tt.has(t)?"float"===t?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function Et(e,t,n){if(null!=t&&"object"!=typeof t)throw Error(s(62));if(e=e.style,null!=n){for(var r in n)!n.hasOwnProperty(r)||null!=t&&t.hasOwnProperty(r)||(0===r.indexOf("--")?e.setProperty(r,""):"float"===r?e.cssFloat="":e[r]="");for(var i in t)r=t[i],t.hasOwnProperty(i)&&n[i]!==r&&xt(e,i,r)}else for(var o in t)t.hasOwnProperty(o)&&xt(e,o,t[o])}function Ot(e){if(-1===e.indexOf("-"))return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var At=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Ct=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Nt(e){return Ct.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}function Dt(){}var Bt=null;function Ft(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Lt=null,Mt=null;function Pt(e){var t=Xe(e);if(t&&(e=t.stateNode)){var n=e[Ve]||null;e:switch(e=t.stateNode,t.type){case"input":if(gt(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+mt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=r[Ve]||null;if(!i)throw Error(s(90));gt(r,i.value,i.defaultValue,i.defaultValue,i.checked,i.defaultChecked,i.type,i.name)}}for(t=0;t<n.length;t++)(r=n[t]).form===e.form&&pt(r)}break e;case"textarea":St(e,n.value,n.defaultValue);break e;case"select":null!=(t=n.value)&&_t(e,!!n.multiple,t,!1)}}}var zt=!1;function Ut(e,t,n){if(zt)return e(t,n);zt=!0;try{return e(t)}finally{if(zt=!1,(null!==Lt||null!==Mt)&&(Zu(),Lt&&(t=Lt,e=Mt,Mt=Lt=null,Pt(t),e)))for(t=0;t<e.length;t++)Pt(e[t])}}function Rt(e,t){var n=e.stateNode;if(null===n)return null;var r=n[Ve]||null;if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(s(231,t,typeof n));return n}var jt=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),Vt=!1;if(jt)try{var $t={};Object.defineProperty($t,"passive",{get:function(){Vt=!0}}),window.addEventListener("test",$t,$t),window.removeEventListener("test",$t,$t)}catch(e){Vt=!1}var Ht=null,Wt=null,Yt=null;function qt(){if(Yt)return Yt;var e,t,n=Wt,r=n.length,i="value"in Ht?Ht.value:Ht.textContent,o=i.length;for(e=0;e<r&&n[e]===i[e];e++);var s=r-e;for(t=1;t<=s&&n[r-t]===i[o-t];t++);return Yt=i.slice(e,1<t?1-t:void 0)}function Qt(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function Kt(){return!0}function Gt(){return!1}function Xt(e){function t(t,n,r,i,o){for(var s in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(s)&&(t=e[s],this[s]=t?t(i):i[s]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?Kt:Gt,this.isPropagationStopped=Gt,this}return h(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=Kt)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=Kt)},persist:function(){},isPersistent:Kt}),t}var Jt,Zt,en,tn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},nn=Xt(tn),rn=h({},tn,{view:0,detail:0}),on=Xt(rn),sn=h({},rn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:mn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==en&&(en&&"mousemove"===e.type?(Jt=e.screenX-en.screenX,Zt=e.screenY-en.screenY):Zt=Jt=0,en=e),Jt)},movementY:function(e){return"movementY"in e?e.movementY:Zt}}),an=Xt(sn),ln=Xt(h({},sn,{dataTransfer:0})),un=Xt(h({},rn,{relatedTarget:0})),cn=Xt(h({},tn,{animationName:0,elapsedTime:0,pseudoElement:0})),dn=Xt(h({},tn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}})),fn=Xt(h({},tn,{data:0})),hn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},pn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},yn={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function bn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=yn[e])&&!!t[e]}function mn(){return bn}var gn=Xt(h({},rn,{key:function(e){if(e.key){var t=hn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=Qt(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?pn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:mn,charCode:function(e){return"keypress"===e.type?Qt(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?Qt(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}})),vn=Xt(h({},sn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),wn=Xt(h({},rn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:mn})),_n=Xt(h({},tn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Sn=Xt(h({},sn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0})),kn=Xt(h({},tn,{newState:0,oldState:0})),In=[9,13,27,32],Tn=jt&&"CompositionEvent"in window,xn=null;jt&&"documentMode"in document&&(xn=document.documentMode);var En=jt&&"TextEvent"in window&&!xn,On=jt&&(!Tn||xn&&8<xn&&11>=xn),An=String.fromCharCode(32),Cn=!1;function Nn(e,t){switch(e){case"keyup":return-1!==In.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Dn(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Bn=!1,Fn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Ln(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Fn[e.type]:"textarea"===t}function Mn(e,t,n,r){Lt?Mt?Mt.push(r):Mt=[r]:Lt=r,0<(t=rd(t,"onChange")).length&&(n=new nn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Pn=null,zn=null;function Un(e){Kc(e,0)}function Rn(e){if(pt(Je(e)))return e}function jn(e,t){if("change"===e)return t}var Vn=!1;if(jt){var $n;if(jt){var Hn="oninput"in document;if(!Hn){var Wn=document.createElement("div");Wn.setAttribute("oninput","return;"),Hn="function"==typeof Wn.oninput}$n=Hn}else $n=!1;Vn=$n&&(!document.documentMode||9<document.documentMode)}function Yn(){Pn&&(Pn.detachEvent("onpropertychange",qn),zn=Pn=null)}function qn(e){if("value"===e.propertyName&&Rn(zn)){var t=[];Mn(t,zn,e,Ft(e)),Ut(Un,t)}}function Qn(e,t,n){"focusin"===e?(Yn(),zn=n,(Pn=t).attachEvent("onpropertychange",qn)):"focusout"===e&&Yn()}function Kn(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Rn(zn)}function Gn(e,t){if("click"===e)return Rn(t)}function Xn(e,t){if("input"===e||"change"===e)return Rn(t)}var Jn="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t};function Zn(e,t){if(Jn(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!re.call(t,i)||!Jn(e[i],t[i]))return!1}return!0}function er(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function tr(e,t){var n,r=er(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=er(r)}}function nr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?nr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function rr(e){for(var t=yt((e=null!=e&&null!=e.ownerDocument&&null!=e.ownerDocument.defaultView?e.ownerDocument.defaultView:window).document);t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=yt((e=t.contentWindow).document)}return t}function ir(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var or=jt&&"documentMode"in document&&11>=document.documentMode,sr=null,ar=null,lr=null,ur=!1;function cr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;ur||null==sr||sr!==yt(r)||(r="selectionStart"in(r=sr)&&ir(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},lr&&Zn(lr,r)||(lr=r,0<(r=rd(ar,"onSelect")).length&&(t=new nn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=sr)))}function dr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var fr={animationend:dr("Animation","AnimationEnd"),animationiteration:dr("Animation","AnimationIteration"),animationstart:dr("Animation","AnimationStart"),transitionrun:dr("Transition","TransitionRun"),transitionstart:dr("Transition","TransitionStart"),transitioncancel:dr("Transition","TransitionCancel"),transitionend:dr("Transition","TransitionEnd")},hr={},pr={};function yr(e){if(hr[e])return hr[e];if(!fr[e])return e;var t,n=fr[e];for(t in n)if(n.hasOwnProperty(t)&&t in pr)return hr[e]=n[t];return e}jt&&(pr=document.createElement("div").style,"AnimationEvent"in window||(delete fr.animationend.animation,delete fr.animationiteration.animation,delete fr.animationstart.animation),"TransitionEvent"in window||delete fr.transitionend.transition);var br=yr("animationend"),mr=yr("animationiteration"),gr=yr("animationstart"),vr=yr("transitionrun"),wr=yr("transitionstart"),_r=yr("transitioncancel"),Sr=yr("transitionend"),kr=new Map,Ir="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Tr(e,t){kr.set(e,t),rt(t,[e])}Ir.push("scrollEnd");var xr="function"==typeof reportError?reportError:function(e){if("object"==typeof window&&"function"==typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"==typeof e&&null!==e&&"string"==typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"==typeof process&&"function"==typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)},Er=[],Or=0,Ar=0;function Cr(){for(var e=Or,t=Ar=Or=0;t<e;){var n=Er[t];Er[t++]=null;var r=Er[t];Er[t++]=null;var i=Er[t];Er[t++]=null;var o=Er[t];if(Er[t++]=null,null!==r&&null!==i){var s=r.pending;null===s?i.next=i:(i.next=s.next,s.next=i),r.pending=i}0!==o&&Fr(n,i,o)}}function Nr(e,t,n,r){Er[Or++]=e,Er[Or++]=t,Er[Or++]=n,Er[Or++]=r,Ar|=r,e.lanes|=r,null!==(e=e.alternate)&&(e.lanes|=r)}function Dr(e,t,n,r){return Nr(e,t,n,r),Lr(e)}function Br(e,t){return Nr(e,null,null,t),Lr(e)}function Fr(e,t,n){e.lanes|=n;var r=e.alternate;null!==r&&(r.lanes|=n);for(var i=!1,o=e.return;null!==o;)o.childLanes|=n,null!==(r=o.alternate)&&(r.childLanes|=n),22===o.tag&&(null===(e=o.stateNode)||1&e._visibility||(i=!0)),e=o,o=o.return;return 3===e.tag?(o=e.stateNode,i&&null!==t&&(i=31-we(n),null===(r=(e=o.hiddenUpdates)[i])?e[i]=[t]:r.push(t),t.lane=536870912|n),o):null}function Lr(e){if(50<Hu)throw Hu=0,Wu=null,Error(s(185));for(var t=e.return;null!==t;)t=(e=t).return;return 3===e.tag?e.stateNode:null}var Mr={};function Pr(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function zr(e,t,n,r){return new Pr(e,t,n,r)}function Ur(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Rr(e,t){var n=e.alternate;return null===n?((n=zr(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=65011712&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function jr(e,t){e.flags&=65011714;var n=e.alternate;return null===n?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Vr(e,t,n,r,i,o){var a=0;if(r=e,"function"==typeof e)Ur(e)&&(a=1);else if("string"==typeof e)a=function(e,t,n){if(1===n||null!=t.itemProp)return!1;switch(e){case"meta":case"title":return!0;case"style":if("string"!=typeof t.precedence||"string"!=typeof t.href||""===t.href)break;return!0;case"link":if("string"!=typeof t.rel||"string"!=typeof t.href||""===t.href||t.onLoad||t.onError)break;return"stylesheet"!==t.rel||(e=t.disabled,"string"==typeof t.precedence&&null==e);case"script":if(t.async&&"function"!=typeof t.async&&"symbol"!=typeof t.async&&!t.onLoad&&!t.onError&&t.src&&"string"==typeof t.src)return!0}return!1}(e,n,H.current)?26:"html"===e||"head"===e||"body"===e?27:5;else e:switch(e){case E:return(e=zr(31,n,t,i)).elementType=E,e.lanes=o,e;case m:return $r(n.children,i,o,t);case g:a=8,i|=24;break;case v:return(e=zr(12,n,t,2|i)).elementType=v,e.lanes=o,e;case k:return(e=zr(13,n,t,i)).elementType=k,e.lanes=o,e;case I:return(e=zr(19,n,t,i)).elementType=I,e.lanes=o,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case _:a=10;break e;case w:a=9;break e;case S:a=11;break e;case T:a=14;break e;case x:a=16,r=null;break e}a=29,n=Error(s(130,null===e?"null":typeof e,"")),r=null}return(t=zr(a,n,t,i)).elementType=e,t.type=r,t.lanes=o,t}function $r(e,t,n,r){return(e=zr(7,e,r,t)).lanes=n,e}function Hr(e,t,n){return(e=zr(6,e,null,t)).lanes=n,e}function Wr(e){var t=zr(18,null,null,0);return t.stateNode=e,t}function Yr(e,t,n){return(t=zr(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var qr=new WeakMap;function Qr(e,t){if("object"==typeof e&&null!==e){var n=qr.get(e);return void 0!==n?n:(t={value:e,source:t,stack:ne(t)},qr.set(e,t),t)}return{value:e,source:t,stack:ne(t)}}var Kr=[],Gr=0,Xr=null,Jr=0,Zr=[],ei=0,ti=null,ni=1,ri="";function ii(e,t){Kr[Gr++]=Jr,Kr[Gr++]=Xr,Xr=e,Jr=t}function oi(e,t,n){Zr[ei++]=ni,Zr[ei++]=ri,Zr[ei++]=ti,ti=e;var r=ni;e=ri;var i=32-we(r)-1;r&=~(1<<i),n+=1;var o=32-we(t)+i;if(30<o){var s=i-i%5;o=(r&(1<<s)-1).toString(32),r>>=s,i-=s,ni=1<<32-we(t)+i|n<<i|r,ri=o+e}else ni=1<<o|n<<i|r,ri=e}function si(e){null!==e.return&&(ii(e,1),oi(e,1,0))}function ai(e){for(;e===Xr;)Xr=Kr[--Gr],Kr[Gr]=null,Jr=Kr[--Gr],Kr[Gr]=null;for(;e===ti;)ti=Zr[--ei],Zr[ei]=null,ri=Zr[--ei],Zr[ei]=null,ni=Zr[--ei],Zr[ei]=null}function li(e,t){Zr[ei++]=ni,Zr[ei++]=ri,Zr[ei++]=ti,ni=t.id,ri=t.overflow,ti=e}var ui=null,ci=null,di=!1,fi=null,hi=!1,pi=Error(s(519));function yi(e){throw _i(Qr(Error(s(418,1<arguments.length&&void 0!==arguments[1]&&arguments[1]?"text":"HTML","")),e)),pi}function bi(e){var t=e.stateNode,n=e.type,r=e.memoizedProps;switch(t[je]=e,t[Ve]=r,n){case"dialog":Gc("cancel",t),Gc("close",t);break;case"iframe":case"object":case"embed":Gc("load",t);break;case"video":case"audio":for(n=0;n<qc.length;n++)Gc(qc[n],t);break;case"source":Gc("error",t);break;case"img":case"image":case"link":Gc("error",t),Gc("load",t);break;case"details":Gc("toggle",t);break;case"input":Gc("invalid",t),vt(t,r.value,r.defaultValue,r.checked,r.defaultChecked,r.type,r.name,!0);break;case"select":Gc("invalid",t);break;case"textarea":Gc("invalid",t),kt(t,r.value,r.defaultValue,r.children)}"string"!=typeof(n=r.children)&&"number"!=typeof n&&"bigint"!=typeof n||t.textContent===""+n||!0===r.suppressHydrationWarning||ud(t.textContent,n)?(null!=r.popover&&(Gc("beforetoggle",t),Gc("toggle",t)),null!=r.onScroll&&Gc("scroll",t),null!=r.onScrollEnd&&Gc("scrollend",t),null!=r.onClick&&(t.onclick=Dt),t=!0):t=!1,t||yi(e,!0)}function mi(e){for(ui=e.return;ui;)switch(ui.tag){case 5:case 31:case 13:return void(hi=!1);case 27:case 3:return void(hi=!0);default:ui=ui.return}}function gi(e){if(e!==ui)return!1;if(!di)return mi(e),di=!0,!1;var t,n=e.tag;if((t=3!==n&&27!==n)&&((t=5===n)&&(t=!("form"!==(t=e.type)&&"button"!==t)||vd(e.type,e.memoizedProps)),t=!t),t&&ci&&yi(e),mi(e),13===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(s(317));ci=Ld(e)}else if(31===n){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(s(317));ci=Ld(e)}else 27===n?(n=ci,xd(e.type)?(e=Fd,Fd=null,ci=e):ci=n):ci=ui?Bd(e.stateNode.nextSibling):null;return!0}function vi(){ci=ui=null,di=!1}function wi(){var e=fi;return null!==e&&(null===Cu?Cu=e:Cu.push.apply(Cu,e),fi=null),e}function _i(e){null===fi?fi=[e]:fi.push(e)}var Si=U(null),ki=null,Ii=null;function Ti(e,t,n){j(Si,t._currentValue),t._currentValue=n}function xi(e){e._currentValue=Si.current,R(Si)}function Ei(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function Oi(e,t,n,r){var i=e.child;for(null!==i&&(i.return=e);null!==i;){var o=i.dependencies;if(null!==o){var a=i.child;o=o.firstContext;e:for(;null!==o;){var l=o;o=i;for(var u=0;u<t.length;u++)if(l.context===t[u]){o.lanes|=n,null!==(l=o.alternate)&&(l.lanes|=n),Ei(o.return,n,e),r||(a=null);break e}o=l.next}}else if(18===i.tag){if(null===(a=i.return))throw Error(s(341));a.lanes|=n,null!==(o=a.alternate)&&(o.lanes|=n),Ei(a,n,e),a=null}else a=i.child;if(null!==a)a.return=i;else for(a=i;null!==a;){if(a===e){a=null;break}if(null!==(i=a.sibling)){i.return=a.return,a=i;break}a=a.return}i=a}}function Ai(e,t,n,r){e=null;for(var i=t,o=!1;null!==i;){if(!o)if(524288&i.flags)o=!0;else if(262144&i.flags)break;if(10===i.tag){var a=i.alternate;if(null===a)throw Error(s(387));if(null!==(a=a.memoizedProps)){var l=i.type;Jn(i.pendingProps.value,a.value)||(null!==e?e.push(l):e=[l])}}else if(i===q.current){if(null===(a=i.alternate))throw Error(s(387));a.memoizedState.memoizedState!==i.memoizedState.memoizedState&&(null!==e?e.push(df):e=[df])}i=i.return}null!==e&&Oi(t,e,n,r),t.flags|=262144}function Ci(e){for(e=e.firstContext;null!==e;){if(!Jn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Ni(e){ki=e,Ii=null,null!==(e=e.dependencies)&&(e.firstContext=null)}function Di(e){return Fi(ki,e)}function Bi(e,t){return null===ki&&Ni(e),Fi(e,t)}function Fi(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},null===Ii){if(null===e)throw Error(s(308));Ii=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else Ii=Ii.next=t;return n}var Li="undefined"!=typeof AbortController?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(t,n){e.push(n)}};this.abort=function(){t.aborted=!0,e.forEach(function(e){return e()})}},Mi=r.unstable_scheduleCallback,Pi=r.unstable_NormalPriority,zi={$$typeof:_,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Ui(){return{controller:new Li,data:new Map,refCount:0}}function Ri(e){e.refCount--,0===e.refCount&&Mi(Pi,function(){e.controller.abort()})}var ji=null,Vi=0,$i=0,Hi=null;function Wi(){if(0===--Vi&&null!==ji){null!==Hi&&(Hi.status="fulfilled");var e=ji;ji=null,$i=0,Hi=null;for(var t=0;t<e.length;t++)(0,e[t])()}}var Yi=F.S;F.S=function(e,t){Bu=le(),"object"==typeof t&&null!==t&&"function"==typeof t.then&&function(e,t){if(null===ji){var n=ji=[];Vi=0,$i=Vc(),Hi={status:"pending",value:void 0,then:function(e){n.push(e)}}}Vi++,t.then(Wi,Wi)}(0,t),null!==Yi&&Yi(e,t)};var qi=U(null);function Qi(){var e=qi.current;return null!==e?e:pu.pooledCache}function Ki(e,t){j(qi,null===t?qi.current:t.pool)}function Gi(){var e=Qi();return null===e?null:{parent:zi._currentValue,pool:e}}var Xi=Error(s(460)),Ji=Error(s(474)),Zi=Error(s(542)),eo={then:function(){}};function to(e){return"fulfilled"===(e=e.status)||"rejected"===e}function no(e,t,n){switch(void 0===(n=e[n])?e.push(t):n!==t&&(t.then(Dt,Dt),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw so(e=t.reason),e;default:if("string"==typeof t.status)t.then(Dt,Dt);else{if(null!==(e=pu)&&100<e.shellSuspendCounter)throw Error(s(482));(e=t).status="pending",e.then(function(e){if("pending"===t.status){var n=t;n.status="fulfilled",n.value=e}},function(e){if("pending"===t.status){var n=t;n.status="rejected",n.reason=e}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw so(e=t.reason),e}throw io=t,Xi}}function ro(e){try{return(0,e._init)(e._payload)}catch(e){if(null!==e&&"object"==typeof e&&"function"==typeof e.then)throw io=e,Xi;throw e}}var io=null;function oo(){if(null===io)throw Error(s(459));var e=io;return io=null,e}function so(e){if(e===Xi||e===Zi)throw Error(s(483))}var ao=null,lo=0;function uo(e){var t=lo;return lo+=1,null===ao&&(ao=[]),no(ao,e,t)}function co(e,t){t=t.props.ref,e.ref=void 0!==t?t:null}function fo(e,t){if(t.$$typeof===p)throw Error(s(525));throw e=Object.prototype.toString.call(t),Error(s(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function ho(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e){for(var t=new Map;null!==e;)null!==e.key?t.set(e.key,e):t.set(e.index,e),e=e.sibling;return t}function i(e,t){return(e=Rr(e,t)).index=0,e.sibling=null,e}function o(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=67108866,n):r:(t.flags|=67108866,n):(t.flags|=1048576,n)}function a(t){return e&&null===t.alternate&&(t.flags|=67108866),t}function l(e,t,n,r){return null===t||6!==t.tag?((t=Hr(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function u(e,t,n,r){var o=n.type;return o===m?d(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===o||"object"==typeof o&&null!==o&&o.$$typeof===x&&ro(o)===t.type)?(co(t=i(t,n.props),n),t.return=e,t):(co(t=Vr(n.type,n.key,n.props,null,e.mode,r),n),t.return=e,t)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Yr(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function d(e,t,n,r,o){return null===t||7!==t.tag?((t=$r(n,e.mode,r,o)).return=e,t):((t=i(t,n)).return=e,t)}function f(e,t,n){if("string"==typeof t&&""!==t||"number"==typeof t||"bigint"==typeof t)return(t=Hr(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case y:return co(n=Vr(t.type,t.key,t.props,null,e.mode,n),t),n.return=e,n;case b:return(t=Yr(t,e.mode,n)).return=e,t;case x:return f(e,t=ro(t),n)}if(B(t)||C(t))return(t=$r(t,e.mode,n,null)).return=e,t;if("function"==typeof t.then)return f(e,uo(t),n);if(t.$$typeof===_)return f(e,Bi(e,t),n);fo(e,t)}return null}function h(e,t,n,r){var i=null!==t?t.key:null;if("string"==typeof n&&""!==n||"number"==typeof n||"bigint"==typeof n)return null!==i?null:l(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case y:return n.key===i?u(e,t,n,r):null;case b:return n.key===i?c(e,t,n,r):null;case x:return h(e,t,n=ro(n),r)}if(B(n)||C(n))return null!==i?null:d(e,t,n,r,null);if("function"==typeof n.then)return h(e,t,uo(n),r);if(n.$$typeof===_)return h(e,t,Bi(e,n),r);fo(e,n)}return null}function p(e,t,n,r,i){if("string"==typeof r&&""!==r||"number"==typeof r||"bigint"==typeof r)return l(t,e=e.get(n)||null,""+r,i);if("object"==typeof r&&null!==r){switch(r.$$typeof){case y:return u(t,e=e.get(null===r.key?n:r.key)||null,r,i);case b:return c(t,e=e.get(null===r.key?n:r.key)||null,r,i);case x:return p(e,t,n,r=ro(r),i)}if(B(r)||C(r))return d(t,e=e.get(n)||null,r,i,null);if("function"==typeof r.then)return p(e,t,n,uo(r),i);if(r.$$typeof===_)return p(e,t,n,Bi(t,r),i);fo(t,r)}return null}function g(l,u,c,d){if("object"==typeof c&&null!==c&&c.type===m&&null===c.key&&(c=c.props.children),"object"==typeof c&&null!==c){switch(c.$$typeof){case y:e:{for(var v=c.key;null!==u;){if(u.key===v){if((v=c.type)===m){if(7===u.tag){n(l,u.sibling),(d=i(u,c.props.children)).return=l,l=d;break e}}else if(u.elementType===v||"object"==typeof v&&null!==v&&v.$$typeof===x&&ro(v)===u.type){n(l,u.sibling),co(d=i(u,c.props),c),d.return=l,l=d;break e}n(l,u);break}t(l,u),u=u.sibling}c.type===m?((d=$r(c.props.children,l.mode,d,c.key)).return=l,l=d):(co(d=Vr(c.type,c.key,c.props,null,l.mode,d),c),d.return=l,l=d)}return a(l);case b:e:{for(v=c.key;null!==u;){if(u.key===v){if(4===u.tag&&u.stateNode.containerInfo===c.containerInfo&&u.stateNode.implementation===c.implementation){n(l,u.sibling),(d=i(u,c.children||[])).return=l,l=d;break e}n(l,u);break}t(l,u),u=u.sibling}(d=Yr(c,l.mode,d)).return=l,l=d}return a(l);case x:return g(l,u,c=ro(c),d)}if(B(c))return function(i,s,a,l){for(var u=null,c=null,d=s,y=s=0,b=null;null!==d&&y<a.length;y++){d.index>y?(b=d,d=null):b=d.sibling;var m=h(i,d,a[y],l);if(null===m){null===d&&(d=b);break}e&&d&&null===m.alternate&&t(i,d),s=o(m,s,y),null===c?u=m:c.sibling=m,c=m,d=b}if(y===a.length)return n(i,d),di&&ii(i,y),u;if(null===d){for(;y<a.length;y++)null!==(d=f(i,a[y],l))&&(s=o(d,s,y),null===c?u=d:c.sibling=d,c=d);return di&&ii(i,y),u}for(d=r(d);y<a.length;y++)null!==(b=p(d,i,y,a[y],l))&&(e&&null!==b.alternate&&d.delete(null===b.key?y:b.key),s=o(b,s,y),null===c?u=b:c.sibling=b,c=b);return e&&d.forEach(function(e){return t(i,e)}),di&&ii(i,y),u}(l,u,c,d);if(C(c)){if("function"!=typeof(v=C(c)))throw Error(s(150));return function(i,a,l,u){if(null==l)throw Error(s(151));for(var c=null,d=null,y=a,b=a=0,m=null,g=l.next();null!==y&&!g.done;b++,g=l.next()){y.index>b?(m=y,y=null):m=y.sibling;var v=h(i,y,g.value,u);if(null===v){null===y&&(y=m);break}e&&y&&null===v.alternate&&t(i,y),a=o(v,a,b),null===d?c=v:d.sibling=v,d=v,y=m}if(g.done)return n(i,y),di&&ii(i,b),c;if(null===y){for(;!g.done;b++,g=l.next())null!==(g=f(i,g.value,u))&&(a=o(g,a,b),null===d?c=g:d.sibling=g,d=g);return di&&ii(i,b),c}for(y=r(y);!g.done;b++,g=l.next())null!==(g=p(y,i,b,g.value,u))&&(e&&null!==g.alternate&&y.delete(null===g.key?b:g.key),a=o(g,a,b),null===d?c=g:d.sibling=g,d=g);return e&&y.forEach(function(e){return t(i,e)}),di&&ii(i,b),c}(l,u,c=v.call(c),d)}if("function"==typeof c.then)return g(l,u,uo(c),d);if(c.$$typeof===_)return g(l,u,Bi(l,c),d);fo(l,c)}return"string"==typeof c&&""!==c||"number"==typeof c||"bigint"==typeof c?(c=""+c,null!==u&&6===u.tag?(n(l,u.sibling),(d=i(u,c)).return=l,l=d):(n(l,u),(d=Hr(c,l.mode,d)).return=l,l=d),a(l)):n(l,u)}return function(e,t,n,r){try{lo=0;var i=g(e,t,n,r);return ao=null,i}catch(t){if(t===Xi||t===Zi)throw t;var o=zr(29,t,null,e.mode);return o.lanes=r,o.return=e,o}}}var po=ho(!0),yo=ho(!1),bo=!1;function mo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function go(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function vo(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function wo(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,2&hu){var i=r.pending;return null===i?t.next=t:(t.next=i.next,i.next=t),r.pending=t,t=Lr(e),Fr(e,null,n),t}return Nr(e,r,t,n),Lr(e)}function _o(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,4194048&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Fe(e,n)}}function So(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var s={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};null===o?i=o=s:o=o.next=s,n=n.next}while(null!==n);null===o?i=o=t:o=o.next=t}else i=o=t;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,callbacks:r.callbacks},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var ko=!1;function Io(){if(ko&&null!==Hi)throw Hi}function To(e,t,n,r){ko=!1;var i=e.updateQueue;bo=!1;var o=i.firstBaseUpdate,s=i.lastBaseUpdate,a=i.shared.pending;if(null!==a){i.shared.pending=null;var l=a,u=l.next;l.next=null,null===s?o=u:s.next=u,s=l;var c=e.alternate;null!==c&&(a=(c=c.updateQueue).lastBaseUpdate)!==s&&(null===a?c.firstBaseUpdate=u:a.next=u,c.lastBaseUpdate=l)}if(null!==o){var d=i.baseState;for(s=0,c=u=l=null,a=o;;){var f=-536870913&a.lane,p=f!==a.lane;if(p?(bu&f)===f:(r&f)===f){0!==f&&f===$i&&(ko=!0),null!==c&&(c=c.next={lane:0,tag:a.tag,payload:a.payload,callback:null,next:null});e:{var y=e,b=a;f=t;var m=n;switch(b.tag){case 1:if("function"==typeof(y=b.payload)){d=y.call(m,d,f);break e}d=y;break e;case 3:y.flags=-65537&y.flags|128;case 0:if(null==(f="function"==typeof(y=b.payload)?y.call(m,d,f):y))break e;d=h({},d,f);break e;case 2:bo=!0}}null!==(f=a.callback)&&(e.flags|=64,p&&(e.flags|=8192),null===(p=i.callbacks)?i.callbacks=[f]:p.push(f))}else p={lane:f,tag:a.tag,payload:a.payload,callback:a.callback,next:null},null===c?(u=c=p,l=d):c=c.next=p,s|=f;if(null===(a=a.next)){if(null===(a=i.shared.pending))break;a=(p=a).next,p.next=null,i.lastBaseUpdate=p,i.shared.pending=null}}null===c&&(l=d),i.baseState=l,i.firstBaseUpdate=u,i.lastBaseUpdate=c,null===o&&(i.shared.lanes=0),Iu|=s,e.lanes=s,e.memoizedState=d}}function xo(e,t){if("function"!=typeof e)throw Error(s(191,e));e.call(t)}function Eo(e,t){var n=e.callbacks;if(null!==n)for(e.callbacks=null,e=0;e<n.length;e++)xo(n[e],t)}var Oo=U(null),Ao=U(0);function Co(e,t){j(Ao,e=Su),j(Oo,t),Su=e|t.baseLanes}function No(){j(Ao,Su),j(Oo,Oo.current)}function Do(){Su=Ao.current,R(Oo),R(Ao)}var Bo=U(null),Fo=null;function Lo(e){var t=e.alternate;j(Ro,1&Ro.current),j(Bo,e),null===Fo&&(null===t||null!==Oo.current||null!==t.memoizedState)&&(Fo=e)}function Mo(e){j(Ro,Ro.current),j(Bo,e),null===Fo&&(Fo=e)}function Po(e){22===e.tag?(j(Ro,Ro.current),j(Bo,e),null===Fo&&(Fo=e)):zo()}function zo(){j(Ro,Ro.current),j(Bo,Bo.current)}function Uo(e){R(Bo),Fo===e&&(Fo=null),R(Ro)}var Ro=U(0);function jo(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||Nd(n)||Dd(n)))return t}else if(19!==t.tag||"forwards"!==t.memoizedProps.revealOrder&&"backwards"!==t.memoizedProps.revealOrder&&"unstable_legacy-backwards"!==t.memoizedProps.revealOrder&&"together"!==t.memoizedProps.revealOrder){if(null!==t.child){t.child.return=t,t=t.child;continue}}else if(128&t.flags)return t;if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var Vo=0,$o=null,Ho=null,Wo=null,Yo=!1,qo=!1,Qo=!1,Ko=0,Go=0,Xo=null,Jo=0;function Zo(){throw Error(s(321))}function es(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Jn(e[n],t[n]))return!1;return!0}function ts(e,t,n,r,i,o){return Vo=o,$o=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,F.H=null===e||null===e.memoizedState?ba:ma,Qo=!1,o=n(r,i),Qo=!1,qo&&(o=rs(t,n,r,i)),ns(e),o}function ns(e){F.H=ya;var t=null!==Ho&&null!==Ho.next;if(Vo=0,Wo=Ho=$o=null,Yo=!1,Go=0,Xo=null,t)throw Error(s(300));null===e||Ba||null!==(e=e.dependencies)&&Ci(e)&&(Ba=!0)}function rs(e,t,n,r){$o=e;var i=0;do{if(qo&&(Xo=null),Go=0,qo=!1,25<=i)throw Error(s(301));if(i+=1,Wo=Ho=null,null!=e.updateQueue){var o=e.updateQueue;o.lastEffect=null,o.events=null,o.stores=null,null!=o.memoCache&&(o.memoCache.index=0)}F.H=ga,o=t(n,r)}while(qo);return o}function is(){var e=F.H,t=e.useState()[0];return t="function"==typeof t.then?cs(t):t,e=e.useState()[0],(null!==Ho?Ho.memoizedState:null)!==e&&($o.flags|=1024),t}function os(){var e=0!==Ko;return Ko=0,e}function ss(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function as(e){if(Yo){for(e=e.memoizedState;null!==e;){var t=e.queue;null!==t&&(t.pending=null),e=e.next}Yo=!1}Vo=0,Wo=Ho=$o=null,qo=!1,Go=Ko=0,Xo=null}function ls(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Wo?$o.memoizedState=Wo=e:Wo=Wo.next=e,Wo}function us(){if(null===Ho){var e=$o.alternate;e=null!==e?e.memoizedState:null}else e=Ho.next;var t=null===Wo?$o.memoizedState:Wo.next;if(null!==t)Wo=t,Ho=e;else{if(null===e){if(null===$o.alternate)throw Error(s(467));throw Error(s(310))}e={memoizedState:(Ho=e).memoizedState,baseState:Ho.baseState,baseQueue:Ho.baseQueue,queue:Ho.queue,next:null},null===Wo?$o.memoizedState=Wo=e:Wo=Wo.next=e}return Wo}function cs(e){var t=Go;return Go+=1,null===Xo&&(Xo=[]),e=no(Xo,e,t),t=$o,null===(null===Wo?t.memoizedState:Wo.next)&&(t=t.alternate,F.H=null===t||null===t.memoizedState?ba:ma),e}function ds(e){if(null!==e&&"object"==typeof e){if("function"==typeof e.then)return cs(e);if(e.$$typeof===_)return Di(e)}throw Error(s(438,String(e)))}function fs(e){var t=null,n=$o.updateQueue;if(null!==n&&(t=n.memoCache),null==t){var r=$o.alternate;null!==r&&null!==(r=r.updateQueue)&&null!=(r=r.memoCache)&&(t={data:r.data.map(function(e){return e.slice()}),index:0})}if(null==t&&(t={data:[],index:0}),null===n&&(n={lastEffect:null,events:null,stores:null,memoCache:null},$o.updateQueue=n),n.memoCache=t,void 0===(n=t.data[t.index]))for(n=t.data[t.index]=Array(e),r=0;r<e;r++)n[r]=O;return t.index++,n}function hs(e,t){return"function"==typeof t?t(e):t}function ps(e){return ys(us(),Ho,e)}function ys(e,t,n){var r=e.queue;if(null===r)throw Error(s(311));r.lastRenderedReducer=n;var i=e.baseQueue,o=r.pending;if(null!==o){if(null!==i){var a=i.next;i.next=o.next,o.next=a}t.baseQueue=i=o,r.pending=null}if(o=e.baseState,null===i)e.memoizedState=o;else{var l=a=null,u=null,c=t=i.next,d=!1;do{var f=-536870913&c.lane;if(f!==c.lane?(bu&f)===f:(Vo&f)===f){var h=c.revertLane;if(0===h)null!==u&&(u=u.next={lane:0,revertLane:0,gesture:null,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),f===$i&&(d=!0);else{if((Vo&h)===h){c=c.next,h===$i&&(d=!0);continue}f={lane:0,revertLane:c.revertLane,gesture:null,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(l=u=f,a=o):u=u.next=f,$o.lanes|=h,Iu|=h}f=c.action,Qo&&n(o,f),o=c.hasEagerState?c.eagerState:n(o,f)}else h={lane:f,revertLane:c.revertLane,gesture:c.gesture,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null},null===u?(l=u=h,a=o):u=u.next=h,$o.lanes|=f,Iu|=f;c=c.next}while(null!==c&&c!==t);if(null===u?a=o:u.next=l,!Jn(o,e.memoizedState)&&(Ba=!0,d&&null!==(n=Hi)))throw n;e.memoizedState=o,e.baseState=a,e.baseQueue=u,r.lastRenderedState=o}return null===i&&(r.lanes=0),[e.memoizedState,r.dispatch]}function bs(e){var t=us(),n=t.queue;if(null===n)throw Error(s(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,o=t.memoizedState;if(null!==i){n.pending=null;var a=i=i.next;do{o=e(o,a.action),a=a.next}while(a!==i);Jn(o,t.memoizedState)||(Ba=!0),t.memoizedState=o,null===t.baseQueue&&(t.baseState=o),n.lastRenderedState=o}return[o,r]}function ms(e,t,n){var r=$o,i=us(),o=di;if(o){if(void 0===n)throw Error(s(407));n=n()}else n=t();var a=!Jn((Ho||i).memoizedState,n);if(a&&(i.memoizedState=n,Ba=!0),i=i.queue,Vs(ws.bind(null,r,i,e),[e]),i.getSnapshot!==t||a||null!==Wo&&1&Wo.memoizedState.tag){if(r.flags|=2048,Ps(9,{destroy:void 0},vs.bind(null,r,i,n,t),null),null===pu)throw Error(s(349));o||127&Vo||gs(r,t,n)}return n}function gs(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=$o.updateQueue)?(t={lastEffect:null,events:null,stores:null,memoCache:null},$o.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function vs(e,t,n,r){t.value=n,t.getSnapshot=r,_s(t)&&Ss(e)}function ws(e,t,n){return n(function(){_s(t)&&Ss(e)})}function _s(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!Jn(e,n)}catch(e){return!0}}function Ss(e){var t=Br(e,2);null!==t&&Qu(t,0,2)}function ks(e){var t=ls();if("function"==typeof e){var n=e;if(e=n(),Qo){ve(!0);try{n()}finally{ve(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:hs,lastRenderedState:e},t}function Is(e,t,n,r){return e.baseState=n,ys(e,Ho,"function"==typeof r?r:hs)}function Ts(e,t,n,r,i){if(fa(e))throw Error(s(485));if(null!==(e=t.action)){var o={payload:i,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(e){o.listeners.push(e)}};null!==F.T?n(!0):o.isTransition=!1,r(o),null===(n=t.pending)?(o.next=t.pending=o,xs(t,o)):(o.next=n.next,t.pending=n.next=o)}}function xs(e,t){var n=t.action,r=t.payload,i=e.state;if(t.isTransition){var o=F.T,s={};F.T=s;try{var a=n(i,r),l=F.S;null!==l&&l(s,a),Es(e,t,a)}catch(n){As(e,t,n)}finally{null!==o&&null!==s.types&&(o.types=s.types),F.T=o}}else try{Es(e,t,o=n(i,r))}catch(n){As(e,t,n)}}function Es(e,t,n){null!==n&&"object"==typeof n&&"function"==typeof n.then?n.then(function(n){Os(e,t,n)},function(n){return As(e,t,n)}):Os(e,t,n)}function Os(e,t,n){t.status="fulfilled",t.value=n,Cs(t),e.state=n,null!==(t=e.pending)&&((n=t.next)===t?e.pending=null:(n=n.next,t.next=n,xs(e,n)))}function As(e,t,n){var r=e.pending;if(e.pending=null,null!==r){r=r.next;do{t.status="rejected",t.reason=n,Cs(t),t=t.next}while(t!==r)}e.action=null}function Cs(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function Ns(e,t){return t}function Ds(e,t){if(di){var n=pu.formState;if(null!==n){e:{var r=$o;if(di){if(ci){t:{for(var i=ci,o=hi;8!==i.nodeType;){if(!o){i=null;break t}if(null===(i=Bd(i.nextSibling))){i=null;break t}}i="F!"===(o=i.data)||"F"===o?i:null}if(i){ci=Bd(i.nextSibling),r="F!"===i.data;break e}}yi(r)}r=!1}r&&(t=n[0])}}return(n=ls()).memoizedState=n.baseState=t,r={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Ns,lastRenderedState:t},n.queue=r,n=ua.bind(null,$o,r),r.dispatch=n,r=ks(!1),o=da.bind(null,$o,!1,r.queue),i={state:t,dispatch:null,action:e,pending:null},(r=ls()).queue=i,n=Ts.bind(null,$o,i,o,n),i.dispatch=n,r.memoizedState=e,[t,n,!1]}function Bs(e){return Fs(us(),Ho,e)}function Fs(e,t,n){if(t=ys(e,t,Ns)[0],e=ps(hs)[0],"object"==typeof t&&null!==t&&"function"==typeof t.then)try{var r=cs(t)}catch(e){if(e===Xi)throw Zi;throw e}else r=t;var i=(t=us()).queue,o=i.dispatch;return n!==t.memoizedState&&($o.flags|=2048,Ps(9,{destroy:void 0},Ls.bind(null,i,n),null)),[r,o,e]}function Ls(e,t){e.action=t}function Ms(e){var t=us(),n=Ho;if(null!==n)return Fs(t,n,e);us(),t=t.memoizedState;var r=(n=us()).queue.dispatch;return n.memoizedState=e,[t,r,!1]}function Ps(e,t,n,r){return e={tag:e,create:n,deps:r,inst:t,next:null},null===(t=$o.updateQueue)&&(t={lastEffect:null,events:null,stores:null,memoCache:null},$o.updateQueue=t),null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function zs(){return us().memoizedState}function Us(e,t,n,r){var i=ls();$o.flags|=e,i.memoizedState=Ps(1|t,{destroy:void 0},n,void 0===r?null:r)}function Rs(e,t,n,r){var i=us();r=void 0===r?null:r;var o=i.memoizedState.inst;null!==Ho&&null!==r&&es(r,Ho.memoizedState.deps)?i.memoizedState=Ps(t,o,n,r):($o.flags|=e,i.memoizedState=Ps(1|t,o,n,r))}function js(e,t){Us(8390656,8,e,t)}function Vs(e,t){Rs(2048,8,e,t)}function $s(e){var t=us().memoizedState;return function(e){$o.flags|=4;var t=$o.updateQueue;if(null===t)t={lastEffect:null,events:null,stores:null,memoCache:null},$o.updateQueue=t,t.events=[e];else{var n=t.events;null===n?t.events=[e]:n.push(e)}}({ref:t,nextImpl:e}),function(){if(2&hu)throw Error(s(440));return t.impl.apply(void 0,arguments)}}function Hs(e,t){return Rs(4,2,e,t)}function Ws(e,t){return Rs(4,4,e,t)}function Ys(e,t){if("function"==typeof t){e=e();var n=t(e);return function(){"function"==typeof n?n():t(null)}}if(null!=t)return e=e(),t.current=e,function(){t.current=null}}function qs(e,t,n){n=null!=n?n.concat([e]):null,Rs(4,4,Ys.bind(null,t,e),n)}function Qs(){}function Ks(e,t){var n=us();t=void 0===t?null:t;var r=n.memoizedState;return null!==t&&es(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Gs(e,t){var n=us();t=void 0===t?null:t;var r=n.memoizedState;if(null!==t&&es(t,r[1]))return r[0];if(r=e(),Qo){ve(!0);try{e()}finally{ve(!1)}}return n.memoizedState=[r,t],r}function Xs(e,t,n){return void 0===n||1073741824&Vo&&!(261930&bu)?e.memoizedState=t:(e.memoizedState=n,e=qu(),$o.lanes|=e,Iu|=e,n)}function Js(e,t,n,r){return Jn(n,t)?n:null!==Oo.current?(e=Xs(e,n,r),Jn(e,t)||(Ba=!0),e):42&Vo&&(!(1073741824&Vo)||261930&bu)?(e=qu(),$o.lanes|=e,Iu|=e,t):(Ba=!0,e.memoizedState=n)}function Zs(e,t,n,r,i){var o=L.p;L.p=0!==o&&8>o?o:8;var s,a,l,u=F.T,c={};F.T=c,da(e,!1,t,n);try{var d=i(),f=F.S;null!==f&&f(c,d),null!==d&&"object"==typeof d&&"function"==typeof d.then?ca(e,t,(s=r,a=[],l={status:"pending",value:null,reason:null,then:function(e){a.push(e)}},d.then(function(){l.status="fulfilled",l.value=s;for(var e=0;e<a.length;e++)(0,a[e])(s)},function(e){for(l.status="rejected",l.reason=e,e=0;e<a.length;e++)(0,a[e])(void 0)}),l),Yu()):ca(e,t,r,Yu())}catch(n){ca(e,t,{then:function(){},status:"rejected",reason:n},Yu())}finally{L.p=o,null!==u&&null!==c.types&&(u.types=c.types),F.T=u}}function ea(){}function ta(e,t,n,r){if(5!==e.tag)throw Error(s(476));var i=na(e).queue;Zs(e,i,t,M,null===n?ea:function(){return ra(e),n(r)})}function na(e){var t=e.memoizedState;if(null!==t)return t;var n={};return(t={memoizedState:M,baseState:M,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:hs,lastRenderedState:M},next:null}).next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:hs,lastRenderedState:n},next:null},e.memoizedState=t,null!==(e=e.alternate)&&(e.memoizedState=t),t}function ra(e){var t=na(e);null===t.next&&(t=e.alternate.memoizedState),ca(e,t.next.queue,{},Yu())}function ia(){return Di(df)}function oa(){return us().memoizedState}function sa(){return us().memoizedState}function aa(e){for(var t=e.return;null!==t;){switch(t.tag){case 24:case 3:var n=Yu(),r=wo(t,e=vo(n),n);return null!==r&&(Qu(r,0,n),_o(r,t,n)),t={cache:Ui()},void(e.payload=t)}t=t.return}}function la(e,t,n){var r=Yu();n={lane:r,revertLane:0,gesture:null,action:n,hasEagerState:!1,eagerState:null,next:null},fa(e)?ha(t,n):null!==(n=Dr(e,t,n,r))&&(Qu(n,0,r),pa(n,t,r))}function ua(e,t,n){ca(e,t,n,Yu())}function ca(e,t,n,r){var i={lane:r,revertLane:0,gesture:null,action:n,hasEagerState:!1,eagerState:null,next:null};if(fa(e))ha(t,i);else{var o=e.alternate;if(0===e.lanes&&(null===o||0===o.lanes)&&null!==(o=t.lastRenderedReducer))try{var s=t.lastRenderedState,a=o(s,n);if(i.hasEagerState=!0,i.eagerState=a,Jn(a,s))return Nr(e,t,i,0),null===pu&&Cr(),!1}catch(e){}if(null!==(n=Dr(e,t,i,r)))return Qu(n,0,r),pa(n,t,r),!0}return!1}function da(e,t,n,r){if(r={lane:2,revertLane:Vc(),gesture:null,action:r,hasEagerState:!1,eagerState:null,next:null},fa(e)){if(t)throw Error(s(479))}else null!==(t=Dr(e,n,r,2))&&Qu(t,0,2)}function fa(e){var t=e.alternate;return e===$o||null!==t&&t===$o}function ha(e,t){qo=Yo=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function pa(e,t,n){if(4194048&n){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,Fe(e,n)}}var ya={readContext:Di,use:ds,useCallback:Zo,useContext:Zo,useEffect:Zo,useImperativeHandle:Zo,useLayoutEffect:Zo,useInsertionEffect:Zo,useMemo:Zo,useReducer:Zo,useRef:Zo,useState:Zo,useDebugValue:Zo,useDeferredValue:Zo,useTransition:Zo,useSyncExternalStore:Zo,useId:Zo,useHostTransitionStatus:Zo,useFormState:Zo,useActionState:Zo,useOptimistic:Zo,useMemoCache:Zo,useCacheRefresh:Zo};ya.useEffectEvent=Zo;var ba={readContext:Di,use:ds,useCallback:function(e,t){return ls().memoizedState=[e,void 0===t?null:t],e},useContext:Di,useEffect:js,useImperativeHandle:function(e,t,n){n=null!=n?n.concat([e]):null,Us(4194308,4,Ys.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Us(4194308,4,e,t)},useInsertionEffect:function(e,t){Us(4,2,e,t)},useMemo:function(e,t){var n=ls();t=void 0===t?null:t;var r=e();if(Qo){ve(!0);try{e()}finally{ve(!1)}}return n.memoizedState=[r,t],r},useReducer:function(e,t,n){var r=ls();if(void 0!==n){var i=n(t);if(Qo){ve(!0);try{n(t)}finally{ve(!1)}}}else i=t;return r.memoizedState=r.baseState=i,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:i},r.queue=e,e=e.dispatch=la.bind(null,$o,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},ls().memoizedState=e},useState:function(e){var t=(e=ks(e)).queue,n=ua.bind(null,$o,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:Qs,useDeferredValue:function(e,t){return Xs(ls(),e,t)},useTransition:function(){var e=ks(!1);return e=Zs.bind(null,$o,e.queue,!0,!1),ls().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var r=$o,i=ls();if(di){if(void 0===n)throw Error(s(407));n=n()}else{if(n=t(),null===pu)throw Error(s(349));127&bu||gs(r,t,n)}i.memoizedState=n;var o={value:n,getSnapshot:t};return i.queue=o,js(ws.bind(null,r,o,e),[e]),r.flags|=2048,Ps(9,{destroy:void 0},vs.bind(null,r,o,n,t),null),n},useId:function(){var e=ls(),t=pu.identifierPrefix;if(di){var n=ri;t="_"+t+"R_"+(n=(ni&~(1<<32-we(ni)-1)).toString(32)+n),0<(n=Ko++)&&(t+="H"+n.toString(32)),t+="_"}else t="_"+t+"r_"+(n=Jo++).toString(32)+"_";return e.memoizedState=t},useHostTransitionStatus:ia,useFormState:Ds,useActionState:Ds,useOptimistic:function(e){var t=ls();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=da.bind(null,$o,!0,n),n.dispatch=t,[e,t]},useMemoCache:fs,useCacheRefresh:function(){return ls().memoizedState=aa.bind(null,$o)},useEffectEvent:function(e){var t=ls(),n={impl:e};return t.memoizedState=n,function(){if(2&hu)throw Error(s(440));return n.impl.apply(void 0,arguments)}}},ma={readContext:Di,use:ds,useCallback:Ks,useContext:Di,useEffect:Vs,useImperativeHandle:qs,useInsertionEffect:Hs,useLayoutEffect:Ws,useMemo:Gs,useReducer:ps,useRef:zs,useState:function(){return ps(hs)},useDebugValue:Qs,useDeferredValue:function(e,t){return Js(us(),Ho.memoizedState,e,t)},useTransition:function(){var e=ps(hs)[0],t=us().memoizedState;return["boolean"==typeof e?e:cs(e),t]},useSyncExternalStore:ms,useId:oa,useHostTransitionStatus:ia,useFormState:Bs,useActionState:Bs,useOptimistic:function(e,t){return Is(us(),0,e,t)},useMemoCache:fs,useCacheRefresh:sa};ma.useEffectEvent=$s;var ga={readContext:Di,use:ds,useCallback:Ks,useContext:Di,useEffect:Vs,useImperativeHandle:qs,useInsertionEffect:Hs,useLayoutEffect:Ws,useMemo:Gs,useReducer:bs,useRef:zs,useState:function(){return bs(hs)},useDebugValue:Qs,useDeferredValue:function(e,t){var n=us();return null===Ho?Xs(n,e,t):Js(n,Ho.memoizedState,e,t)},useTransition:function(){var e=bs(hs)[0],t=us().memoizedState;return["boolean"==typeof e?e:cs(e),t]},useSyncExternalStore:ms,useId:oa,useHostTransitionStatus:ia,useFormState:Ms,useActionState:Ms,useOptimistic:function(e,t){var n=us();return null!==Ho?Is(n,0,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:fs,useCacheRefresh:sa};function va(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:h({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}ga.useEffectEvent=$s;var wa={enqueueSetState:function(e,t,n){e=e._reactInternals;var r=Yu(),i=vo(r);i.payload=t,null!=n&&(i.callback=n),null!==(t=wo(e,i,r))&&(Qu(t,0,r),_o(t,e,r))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=Yu(),i=vo(r);i.tag=1,i.payload=t,null!=n&&(i.callback=n),null!==(t=wo(e,i,r))&&(Qu(t,0,r),_o(t,e,r))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Yu(),r=vo(n);r.tag=2,null!=t&&(r.callback=t),null!==(t=wo(e,r,n))&&(Qu(t,0,n),_o(t,e,n))}};function _a(e,t,n,r,i,o,s){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,s):!(t.prototype&&t.prototype.isPureReactComponent&&Zn(n,r)&&Zn(i,o))}function Sa(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&wa.enqueueReplaceState(t,t.state,null)}function ka(e,t){var n=t;if("ref"in t)for(var r in n={},t)"ref"!==r&&(n[r]=t[r]);if(e=e.defaultProps)for(var i in n===t&&(n=h({},n)),e)void 0===n[i]&&(n[i]=e[i]);return n}function Ia(e){xr(e)}function Ta(e){console.error(e)}function xa(e){xr(e)}function Ea(e,t){try{(0,e.onUncaughtError)(t.value,{componentStack:t.stack})}catch(e){setTimeout(function(){throw e})}}function Oa(e,t,n){try{(0,e.onCaughtError)(n.value,{componentStack:n.stack,errorBoundary:1===t.tag?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function Aa(e,t,n){return(n=vo(n)).tag=3,n.payload={element:null},n.callback=function(){Ea(e,t)},n}function Ca(e){return(e=vo(e)).tag=3,e}function Na(e,t,n,r){var i=n.type.getDerivedStateFromError;if("function"==typeof i){var o=r.value;e.payload=function(){return i(o)},e.callback=function(){Oa(t,n,r)}}var s=n.stateNode;null!==s&&"function"==typeof s.componentDidCatch&&(e.callback=function(){Oa(t,n,r),"function"!=typeof i&&(null===Mu?Mu=new Set([this]):Mu.add(this));var e=r.stack;this.componentDidCatch(r.value,{componentStack:null!==e?e:""})})}var Da=Error(s(461)),Ba=!1;function Fa(e,t,n,r){t.child=null===e?yo(t,null,n,r):po(t,e.child,n,r)}function La(e,t,n,r,i){n=n.render;var o=t.ref;if("ref"in r){var s={};for(var a in r)"ref"!==a&&(s[a]=r[a])}else s=r;return Ni(t),r=ts(e,t,n,s,o,i),a=os(),null===e||Ba?(di&&a&&si(t),t.flags|=1,Fa(e,t,r,i),t.child):(ss(e,t,i),il(e,t,i))}function Ma(e,t,n,r,i){if(null===e){var o=n.type;return"function"!=typeof o||Ur(o)||void 0!==o.defaultProps||null!==n.compare?((e=Vr(n.type,null,r,t,t.mode,i)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,Pa(e,t,o,r,i))}if(o=e.child,!ol(e,i)){var s=o.memoizedProps;if((n=null!==(n=n.compare)?n:Zn)(s,r)&&e.ref===t.ref)return il(e,t,i)}return t.flags|=1,(e=Rr(o,r)).ref=t.ref,e.return=t,t.child=e}function Pa(e,t,n,r,i){if(null!==e){var o=e.memoizedProps;if(Zn(o,r)&&e.ref===t.ref){if(Ba=!1,t.pendingProps=r=o,!ol(e,i))return t.lanes=e.lanes,il(e,t,i);131072&e.flags&&(Ba=!0)}}return Ha(e,t,n,r,i)}function za(e,t,n,r){var i=r.children,o=null!==e?e.memoizedState:null;if(null===e&&null===t.stateNode&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),"hidden"===r.mode){if(128&t.flags){if(o=null!==o?o.baseLanes|n:n,null!==e){for(r=t.child=e.child,i=0;null!==r;)i=i|r.lanes|r.childLanes,r=r.sibling;r=i&~o}else r=0,t.child=null;return Ra(e,t,o,n,r)}if(!(536870912&n))return r=t.lanes=536870912,Ra(e,t,null!==o?o.baseLanes|n:n,n,r);t.memoizedState={baseLanes:0,cachePool:null},null!==e&&Ki(0,null!==o?o.cachePool:null),null!==o?Co(t,o):No(),Po(t)}else null!==o?(Ki(0,o.cachePool),Co(t,o),zo(),t.memoizedState=null):(null!==e&&Ki(0,null),No(),zo());return Fa(e,t,i,n),t.child}function Ua(e,t){return null!==e&&22===e.tag||null!==t.stateNode||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function Ra(e,t,n,r,i){var o=Qi();return o=null===o?null:{parent:zi._currentValue,pool:o},t.memoizedState={baseLanes:n,cachePool:o},null!==e&&Ki(0,null),No(),Po(t),null!==e&&Ai(e,t,r,!0),t.childLanes=i,null}function ja(e,t){return(t=Za({mode:t.mode,children:t.children},e.mode)).ref=e.ref,e.child=t,t.return=e,t}function Va(e,t,n){return po(t,e.child,null,n),(e=ja(t,t.pendingProps)).flags|=2,Uo(t),t.memoizedState=null,e}function $a(e,t){var n=t.ref;if(null===n)null!==e&&null!==e.ref&&(t.flags|=4194816);else{if("function"!=typeof n&&"object"!=typeof n)throw Error(s(284));null!==e&&e.ref===n||(t.flags|=4194816)}}function Ha(e,t,n,r,i){return Ni(t),n=ts(e,t,n,r,void 0,i),r=os(),null===e||Ba?(di&&r&&si(t),t.flags|=1,Fa(e,t,n,i),t.child):(ss(e,t,i),il(e,t,i))}function Wa(e,t,n,r,i,o){return Ni(t),t.updateQueue=null,n=rs(t,r,n,i),ns(e),r=os(),null===e||Ba?(di&&r&&si(t),t.flags|=1,Fa(e,t,n,o),t.child):(ss(e,t,o),il(e,t,o))}function Ya(e,t,n,r,i){if(Ni(t),null===t.stateNode){var o=Mr,s=n.contextType;"object"==typeof s&&null!==s&&(o=Di(s)),o=new n(r,o),t.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,o.updater=wa,t.stateNode=o,o._reactInternals=t,(o=t.stateNode).props=r,o.state=t.memoizedState,o.refs={},mo(t),s=n.contextType,o.context="object"==typeof s&&null!==s?Di(s):Mr,o.state=t.memoizedState,"function"==typeof(s=n.getDerivedStateFromProps)&&(va(t,n,s,r),o.state=t.memoizedState),"function"==typeof n.getDerivedStateFromProps||"function"==typeof o.getSnapshotBeforeUpdate||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||(s=o.state,"function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),s!==o.state&&wa.enqueueReplaceState(o,o.state,null),To(t,r,o,i),Io(),o.state=t.memoizedState),"function"==typeof o.componentDidMount&&(t.flags|=4194308),r=!0}else if(null===e){o=t.stateNode;var a=t.memoizedProps,l=ka(n,a);o.props=l;var u=o.context,c=n.contextType;s=Mr,"object"==typeof c&&null!==c&&(s=Di(c));var d=n.getDerivedStateFromProps;c="function"==typeof d||"function"==typeof o.getSnapshotBeforeUpdate,a=t.pendingProps!==a,c||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(a||u!==s)&&Sa(t,o,r,s),bo=!1;var f=t.memoizedState;o.state=f,To(t,r,o,i),Io(),u=t.memoizedState,a||f!==u||bo?("function"==typeof d&&(va(t,n,d,r),u=t.memoizedState),(l=bo||_a(t,n,l,r,f,u,s))?(c||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||("function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"==typeof o.componentDidMount&&(t.flags|=4194308)):("function"==typeof o.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=u),o.props=r,o.state=u,o.context=s,r=l):("function"==typeof o.componentDidMount&&(t.flags|=4194308),r=!1)}else{o=t.stateNode,go(e,t),c=ka(n,s=t.memoizedProps),o.props=c,d=t.pendingProps,f=o.context,u=n.contextType,l=Mr,"object"==typeof u&&null!==u&&(l=Di(u)),(u="function"==typeof(a=n.getDerivedStateFromProps)||"function"==typeof o.getSnapshotBeforeUpdate)||"function"!=typeof o.UNSAFE_componentWillReceiveProps&&"function"!=typeof o.componentWillReceiveProps||(s!==d||f!==l)&&Sa(t,o,r,l),bo=!1,f=t.memoizedState,o.state=f,To(t,r,o,i),Io();var h=t.memoizedState;s!==d||f!==h||bo||null!==e&&null!==e.dependencies&&Ci(e.dependencies)?("function"==typeof a&&(va(t,n,a,r),h=t.memoizedState),(c=bo||_a(t,n,c,r,f,h,l)||null!==e&&null!==e.dependencies&&Ci(e.dependencies))?(u||"function"!=typeof o.UNSAFE_componentWillUpdate&&"function"!=typeof o.componentWillUpdate||("function"==typeof o.componentWillUpdate&&o.componentWillUpdate(r,h,l),"function"==typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,h,l)),"function"==typeof o.componentDidUpdate&&(t.flags|=4),"function"==typeof o.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!=typeof o.componentDidUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=h),o.props=r,o.state=h,o.context=l,r=c):("function"!=typeof o.componentDidUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof o.getSnapshotBeforeUpdate||s===e.memoizedProps&&f===e.memoizedState||(t.flags|=1024),r=!1)}return o=r,$a(e,t),r=!!(128&t.flags),o||r?(o=t.stateNode,n=r&&"function"!=typeof n.getDerivedStateFromError?null:o.render(),t.flags|=1,null!==e&&r?(t.child=po(t,e.child,null,i),t.child=po(t,null,n,i)):Fa(e,t,n,i),t.memoizedState=o.state,e=t.child):e=il(e,t,i),e}function qa(e,t,n,r){return vi(),t.flags|=256,Fa(e,t,n,r),t.child}var Qa={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Ka(e){return{baseLanes:e,cachePool:Gi()}}function Ga(e,t,n){return e=null!==e?e.childLanes&~n:0,t&&(e|=Eu),e}function Xa(e,t,n){var r,i=t.pendingProps,o=!1,a=!!(128&t.flags);if((r=a)||(r=(null===e||null!==e.memoizedState)&&!!(2&Ro.current)),r&&(o=!0,t.flags&=-129),r=!!(32&t.flags),t.flags&=-33,null===e){if(di){if(o?Lo(t):zo(),(e=ci)?null!==(e=null!==(e=Cd(e,hi))&&"&"!==e.data?e:null)&&(t.memoizedState={dehydrated:e,treeContext:null!==ti?{id:ni,overflow:ri}:null,retryLane:536870912,hydrationErrors:null},(n=Wr(e)).return=t,t.child=n,ui=t,ci=null):e=null,null===e)throw yi(t);return Dd(e)?t.lanes=32:t.lanes=536870912,null}var l=i.children;return i=i.fallback,o?(zo(),l=Za({mode:"hidden",children:l},o=t.mode),i=$r(i,o,n,null),l.return=t,i.return=t,l.sibling=i,t.child=l,(i=t.child).memoizedState=Ka(n),i.childLanes=Ga(e,r,n),t.memoizedState=Qa,Ua(null,i)):(Lo(t),Ja(t,l))}var u=e.memoizedState;if(null!==u&&null!==(l=u.dehydrated)){if(a)256&t.flags?(Lo(t),t.flags&=-257,t=el(e,t,n)):null!==t.memoizedState?(zo(),t.child=e.child,t.flags|=128,t=null):(zo(),l=i.fallback,o=t.mode,i=Za({mode:"visible",children:i.children},o),(l=$r(l,o,n,null)).flags|=2,i.return=t,l.return=t,i.sibling=l,t.child=i,po(t,e.child,null,n),(i=t.child).memoizedState=Ka(n),i.childLanes=Ga(e,r,n),t.memoizedState=Qa,t=Ua(null,i));else if(Lo(t),Dd(l)){if(r=l.nextSibling&&l.nextSibling.dataset)var c=r.dgst;r=c,(i=Error(s(419))).stack="",i.digest=r,_i({value:i,source:null,stack:null}),t=el(e,t,n)}else if(Ba||Ai(e,t,n,!1),r=0!==(n&e.childLanes),Ba||r){if(null!==(r=pu)&&0!==(i=Le(r,n))&&i!==u.retryLane)throw u.retryLane=i,Br(e,i),Qu(r,0,i),Da;Nd(l)||sc(),t=el(e,t,n)}else Nd(l)?(t.flags|=192,t.child=e.child,t=null):(e=u.treeContext,ci=Bd(l.nextSibling),ui=t,di=!0,fi=null,hi=!1,null!==e&&li(t,e),(t=Ja(t,i.children)).flags|=4096);return t}return o?(zo(),l=i.fallback,o=t.mode,c=(u=e.child).sibling,(i=Rr(u,{mode:"hidden",children:i.children})).subtreeFlags=65011712&u.subtreeFlags,null!==c?l=Rr(c,l):(l=$r(l,o,n,null)).flags|=2,l.return=t,i.return=t,i.sibling=l,t.child=i,Ua(null,i),i=t.child,null===(l=e.child.memoizedState)?l=Ka(n):(null!==(o=l.cachePool)?(u=zi._currentValue,o=o.parent!==u?{parent:u,pool:u}:o):o=Gi(),l={baseLanes:l.baseLanes|n,cachePool:o}),i.memoizedState=l,i.childLanes=Ga(e,r,n),t.memoizedState=Qa,Ua(e.child,i)):(Lo(t),e=(n=e.child).sibling,(n=Rr(n,{mode:"visible",children:i.children})).return=t,n.sibling=null,null!==e&&(null===(r=t.deletions)?(t.deletions=[e],t.flags|=16):r.push(e)),t.child=n,t.memoizedState=null,n)}function Ja(e,t){return(t=Za({mode:"visible",children:t},e.mode)).return=e,e.child=t}function Za(e,t){return(e=zr(22,e,null,t)).lanes=0,e}function el(e,t,n){return po(t,e.child,null,n),(e=Ja(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function tl(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),Ei(e.return,t,n)}function nl(e,t,n,r,i,o){var s=e.memoizedState;null===s?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i,treeForkCount:o}:(s.isBackwards=t,s.rendering=null,s.renderingStartTime=0,s.last=r,s.tail=n,s.tailMode=i,s.treeForkCount=o)}function rl(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;r=r.children;var s=Ro.current,a=!!(2&s);if(a?(s=1&s|2,t.flags|=128):s&=1,j(Ro,s),Fa(e,t,r,n),r=di?Jr:0,!a&&null!==e&&128&e.flags)e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&tl(e,n,t);else if(19===e.tag)tl(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}switch(i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===jo(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),nl(t,!1,i,n,o,r);break;case"backwards":case"unstable_legacy-backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===jo(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}nl(t,!0,n,null,o,r);break;case"together":nl(t,!1,null,null,void 0,r);break;default:t.memoizedState=null}return t.child}function il(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Iu|=t.lanes,0===(n&t.childLanes)){if(null===e)return null;if(Ai(e,t,n,!1),0===(n&t.childLanes))return null}if(null!==e&&t.child!==e.child)throw Error(s(153));if(null!==t.child){for(n=Rr(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Rr(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function ol(e,t){return 0!==(e.lanes&t)||!(null===(e=e.dependencies)||!Ci(e))}function sl(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps)Ba=!0;else{if(!(ol(e,n)||128&t.flags))return Ba=!1,function(e,t,n){switch(t.tag){case 3:Q(t,t.stateNode.containerInfo),Ti(0,zi,e.memoizedState.cache),vi();break;case 27:case 5:G(t);break;case 4:Q(t,t.stateNode.containerInfo);break;case 10:Ti(0,t.type,t.memoizedProps.value);break;case 31:if(null!==t.memoizedState)return t.flags|=128,Mo(t),null;break;case 13:var r=t.memoizedState;if(null!==r)return null!==r.dehydrated?(Lo(t),t.flags|=128,null):0!==(n&t.child.childLanes)?Xa(e,t,n):(Lo(t),null!==(e=il(e,t,n))?e.sibling:null);Lo(t);break;case 19:var i=!!(128&e.flags);if((r=0!==(n&t.childLanes))||(Ai(e,t,n,!1),r=0!==(n&t.childLanes)),i){if(r)return rl(e,t,n);t.flags|=128}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),j(Ro,Ro.current),r)break;return null;case 22:return t.lanes=0,za(e,t,n,t.pendingProps);case 24:Ti(0,zi,e.memoizedState.cache)}return il(e,t,n)}(e,t,n);Ba=!!(131072&e.flags)}else Ba=!1,di&&1048576&t.flags&&oi(t,Jr,t.index);switch(t.lanes=0,t.tag){case 16:e:{var r=t.pendingProps;if(e=ro(t.elementType),t.type=e,"function"!=typeof e){if(null!=e){var i=e.$$typeof;if(i===S){t.tag=11,t=La(null,t,e,r,n);break e}if(i===T){t.tag=14,t=Ma(null,t,e,r,n);break e}}throw t=D(e)||e,Error(s(306,t,""))}Ur(e)?(r=ka(e,r),t.tag=1,t=Ya(null,t,e,r,n)):(t.tag=0,t=Ha(null,t,e,r,n))}return t;case 0:return Ha(e,t,t.type,t.pendingProps,n);case 1:return Ya(e,t,r=t.type,i=ka(r,t.pendingProps),n);case 3:e:{if(Q(t,t.stateNode.containerInfo),null===e)throw Error(s(387));r=t.pendingProps;var o=t.memoizedState;i=o.element,go(e,t),To(t,r,null,n);var a=t.memoizedState;if(r=a.cache,Ti(0,zi,r),r!==o.cache&&Oi(t,[zi],n,!0),Io(),r=a.element,o.isDehydrated){if(o={element:r,isDehydrated:!1,cache:a.cache},t.updateQueue.baseState=o,t.memoizedState=o,256&t.flags){t=qa(e,t,r,n);break e}if(r!==i){_i(i=Qr(Error(s(424)),t)),t=qa(e,t,r,n);break e}for(e=9===(e=t.stateNode.containerInfo).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,ci=Bd(e.firstChild),ui=t,di=!0,fi=null,hi=!0,n=yo(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(vi(),r===i){t=il(e,t,n);break e}Fa(e,t,r,n)}t=t.child}return t;case 26:return $a(e,t),null===e?(n=Wd(t.type,null,t.pendingProps,null))?t.memoizedState=n:di||(n=t.type,e=t.pendingProps,(r=bd(Y.current).createElement(n))[je]=t,r[Ve]=e,fd(r,n,e),et(r),t.stateNode=r):t.memoizedState=Wd(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return G(t),null===e&&di&&(r=t.stateNode=Pd(t.type,t.pendingProps,Y.current),ui=t,hi=!0,i=ci,xd(t.type)?(Fd=i,ci=Bd(r.firstChild)):ci=i),Fa(e,t,t.pendingProps.children,n),$a(e,t),null===e&&(t.flags|=4194304),t.child;case 5:return null===e&&di&&((i=r=ci)&&(r=function(e,t,n,r){for(;1===e.nodeType;){var i=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!r&&("INPUT"!==e.nodeName||"hidden"!==e.type))break}else if(r){if(!e[Qe])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if("stylesheet"===(o=e.getAttribute("rel"))&&e.hasAttribute("data-precedence"))break;if(o!==i.rel||e.getAttribute("href")!==(null==i.href||""===i.href?null:i.href)||e.getAttribute("crossorigin")!==(null==i.crossOrigin?null:i.crossOrigin)||e.getAttribute("title")!==(null==i.title?null:i.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(((o=e.getAttribute("src"))!==(null==i.src?null:i.src)||e.getAttribute("type")!==(null==i.type?null:i.type)||e.getAttribute("crossorigin")!==(null==i.crossOrigin?null:i.crossOrigin))&&o&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else{if("input"!==t||"hidden"!==e.type)return e;var o=null==i.name?null:""+i.name;if("hidden"===i.type&&e.getAttribute("name")===o)return e}if(null===(e=Bd(e.nextSibling)))break}return null}(r,t.type,t.pendingProps,hi),null!==r?(t.stateNode=r,ui=t,ci=Bd(r.firstChild),hi=!1,i=!0):i=!1),i||yi(t)),G(t),i=t.type,o=t.pendingProps,a=null!==e?e.memoizedProps:null,r=o.children,vd(i,o)?r=null:null!==a&&vd(i,a)&&(t.flags|=32),null!==t.memoizedState&&(i=ts(e,t,is,null,null,n),df._currentValue=i),$a(e,t),Fa(e,t,r,n),t.child;case 6:return null===e&&di&&((e=n=ci)&&(n=function(e,t,n){if(""===t)return null;for(;3!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!n)return null;if(null===(e=Bd(e.nextSibling)))return null}return e}(n,t.pendingProps,hi),null!==n?(t.stateNode=n,ui=t,ci=null,e=!0):e=!1),e||yi(t)),null;case 13:return Xa(e,t,n);case 4:return Q(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=po(t,null,r,n):Fa(e,t,r,n),t.child;case 11:return La(e,t,t.type,t.pendingProps,n);case 7:return Fa(e,t,t.pendingProps,n),t.child;case 8:case 12:return Fa(e,t,t.pendingProps.children,n),t.child;case 10:return r=t.pendingProps,Ti(0,t.type,r.value),Fa(e,t,r.children,n),t.child;case 9:return i=t.type._context,r=t.pendingProps.children,Ni(t),r=r(i=Di(i)),t.flags|=1,Fa(e,t,r,n),t.child;case 14:return Ma(e,t,t.type,t.pendingProps,n);case 15:return Pa(e,t,t.type,t.pendingProps,n);case 19:return rl(e,t,n);case 31:return function(e,t,n){var r=t.pendingProps,i=!!(128&t.flags);if(t.flags&=-129,null===e){if(di){if("hidden"===r.mode)return e=ja(t,r),t.lanes=536870912,Ua(null,e);if(Mo(t),(e=ci)?null!==(e=null!==(e=Cd(e,hi))&&"&"===e.data?e:null)&&(t.memoizedState={dehydrated:e,treeContext:null!==ti?{id:ni,overflow:ri}:null,retryLane:536870912,hydrationErrors:null},(n=Wr(e)).return=t,t.child=n,ui=t,ci=null):e=null,null===e)throw yi(t);return t.lanes=536870912,null}return ja(t,r)}var o=e.memoizedState;if(null!==o){var a=o.dehydrated;if(Mo(t),i)if(256&t.flags)t.flags&=-257,t=Va(e,t,n);else{if(null===t.memoizedState)throw Error(s(558));t.child=e.child,t.flags|=128,t=null}else if(Ba||Ai(e,t,n,!1),i=0!==(n&e.childLanes),Ba||i){if(null!==(r=pu)&&0!==(a=Le(r,n))&&a!==o.retryLane)throw o.retryLane=a,Br(e,a),Qu(r,0,a),Da;sc(),t=Va(e,t,n)}else e=o.treeContext,ci=Bd(a.nextSibling),ui=t,di=!0,fi=null,hi=!1,null!==e&&li(t,e),(t=ja(t,r)).flags|=4096;return t}return(e=Rr(e.child,{mode:r.mode,children:r.children})).ref=t.ref,t.child=e,e.return=t,e}(e,t,n);case 22:return za(e,t,n,t.pendingProps);case 24:return Ni(t),r=Di(zi),null===e?(null===(i=Qi())&&(i=pu,o=Ui(),i.pooledCache=o,o.refCount++,null!==o&&(i.pooledCacheLanes|=n),i=o),t.memoizedState={parent:r,cache:i},mo(t),Ti(0,zi,i)):(0!==(e.lanes&n)&&(go(e,t),To(t,null,null,n),Io()),i=e.memoizedState,o=t.memoizedState,i.parent!==r?(i={parent:r,cache:r},t.memoizedState=i,0===t.lanes&&(t.memoizedState=t.updateQueue.baseState=i),Ti(0,zi,r)):(r=o.cache,Ti(0,zi,r),r!==i.cache&&Oi(t,[zi],n,!0))),Fa(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(s(156,t.tag))}function al(e){e.flags|=4}function ll(e,t,n,r,i){if((t=!!(32&e.mode))&&(t=!1),t){if(e.flags|=16777216,(335544128&i)===i)if(e.stateNode.complete)e.flags|=8192;else{if(!rc())throw io=eo,Ji;e.flags|=8192}}else e.flags&=-16777217}function ul(e,t){if("stylesheet"!==t.type||4&t.state.loading)e.flags&=-16777217;else if(e.flags|=16777216,!of(t)){if(!rc())throw io=eo,Ji;e.flags|=8192}}function cl(e,t){null!==t&&(e.flags|=4),16384&e.flags&&(t=22!==e.tag?Ce():536870912,e.lanes|=t,Ou|=t)}function dl(e,t){if(!di)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function fl(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=65011712&i.subtreeFlags,r|=65011712&i.flags,i.return=e,i=i.sibling;else for(i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function hl(e,t,n){var r=t.pendingProps;switch(ai(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:case 1:return fl(t),null;case 3:return n=t.stateNode,r=null,null!==e&&(r=e.memoizedState.cache),t.memoizedState.cache!==r&&(t.flags|=2048),xi(zi),K(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||(gi(t)?al(t):null===e||e.memoizedState.isDehydrated&&!(256&t.flags)||(t.flags|=1024,wi())),fl(t),null;case 26:var i=t.type,o=t.memoizedState;return null===e?(al(t),null!==o?(fl(t),ul(t,o)):(fl(t),ll(t,i,0,0,n))):o?o!==e.memoizedState?(al(t),fl(t),ul(t,o)):(fl(t),t.flags&=-16777217):((e=e.memoizedProps)!==r&&al(t),fl(t),ll(t,i,0,0,n)),null;case 27:if(X(t),n=Y.current,i=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&al(t);else{if(!r){if(null===t.stateNode)throw Error(s(166));return fl(t),null}e=H.current,gi(t)?bi(t):(e=Pd(i,r,n),t.stateNode=e,al(t))}return fl(t),null;case 5:if(X(t),i=t.type,null!==e&&null!=t.stateNode)e.memoizedProps!==r&&al(t);else{if(!r){if(null===t.stateNode)throw Error(s(166));return fl(t),null}if(o=H.current,gi(t))bi(t);else{var a=bd(Y.current);switch(o){case 1:o=a.createElementNS("http://www.w3.org/2000/svg",i);break;case 2:o=a.createElementNS("http://www.w3.org/1998/Math/MathML",i);break;default:switch(i){case"svg":o=a.createElementNS("http://www.w3.org/2000/svg",i);break;case"math":o=a.createElementNS("http://www.w3.org/1998/Math/MathML",i);break;case"script":(o=a.createElement("div")).innerHTML="<script><\/script>",o=o.removeChild(o.firstChild);break;case"select":o="string"==typeof r.is?a.createElement("select",{is:r.is}):a.createElement("select"),r.multiple?o.multiple=!0:r.size&&(o.size=r.size);break;default:o="string"==typeof r.is?a.createElement(i,{is:r.is}):a.createElement(i)}}o[je]=t,o[Ve]=r;e:for(a=t.child;null!==a;){if(5===a.tag||6===a.tag)o.appendChild(a.stateNode);else if(4!==a.tag&&27!==a.tag&&null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break e;for(;null===a.sibling;){if(null===a.return||a.return===t)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}t.stateNode=o;e:switch(fd(o,i,r),i){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}r&&al(t)}}return fl(t),ll(t,t.type,null===e||e.memoizedProps,t.pendingProps,n),null;case 6:if(e&&null!=t.stateNode)e.memoizedProps!==r&&al(t);else{if("string"!=typeof r&&null===t.stateNode)throw Error(s(166));if(e=Y.current,gi(t)){if(e=t.stateNode,n=t.memoizedProps,r=null,null!==(i=ui))switch(i.tag){case 27:case 5:r=i.memoizedProps}e[je]=t,(e=!!(e.nodeValue===n||null!==r&&!0===r.suppressHydrationWarning||ud(e.nodeValue,n)))||yi(t,!0)}else(e=bd(e).createTextNode(r))[je]=t,t.stateNode=e}return fl(t),null;case 31:if(n=t.memoizedState,null===e||null!==e.memoizedState){if(r=gi(t),null!==n){if(null===e){if(!r)throw Error(s(318));if(!(e=null!==(e=t.memoizedState)?e.dehydrated:null))throw Error(s(557));e[je]=t}else vi(),!(128&t.flags)&&(t.memoizedState=null),t.flags|=4;fl(t),e=!1}else n=wi(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=n),e=!0;if(!e)return 256&t.flags?(Uo(t),t):(Uo(t),null);if(128&t.flags)throw Error(s(558))}return fl(t),null;case 13:if(r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(i=gi(t),null!==r&&null!==r.dehydrated){if(null===e){if(!i)throw Error(s(318));if(!(i=null!==(i=t.memoizedState)?i.dehydrated:null))throw Error(s(317));i[je]=t}else vi(),!(128&t.flags)&&(t.memoizedState=null),t.flags|=4;fl(t),i=!1}else i=wi(),null!==e&&null!==e.memoizedState&&(e.memoizedState.hydrationErrors=i),i=!0;if(!i)return 256&t.flags?(Uo(t),t):(Uo(t),null)}return Uo(t),128&t.flags?(t.lanes=n,t):(n=null!==r,e=null!==e&&null!==e.memoizedState,n&&(i=null,null!==(r=t.child).alternate&&null!==r.alternate.memoizedState&&null!==r.alternate.memoizedState.cachePool&&(i=r.alternate.memoizedState.cachePool.pool),o=null,null!==r.memoizedState&&null!==r.memoizedState.cachePool&&(o=r.memoizedState.cachePool.pool),o!==i&&(r.flags|=2048)),n!==e&&n&&(t.child.flags|=8192),cl(t,t.updateQueue),fl(t),null);case 4:return K(),null===e&&Zc(t.stateNode.containerInfo),fl(t),null;case 10:return xi(t.type),fl(t),null;case 19:if(R(Ro),null===(r=t.memoizedState))return fl(t),null;if(i=!!(128&t.flags),null===(o=r.rendering))if(i)dl(r,!1);else{if(0!==ku||null!==e&&128&e.flags)for(e=t.child;null!==e;){if(null!==(o=jo(e))){for(t.flags|=128,dl(r,!1),e=o.updateQueue,t.updateQueue=e,cl(t,e),t.subtreeFlags=0,e=n,n=t.child;null!==n;)jr(n,e),n=n.sibling;return j(Ro,1&Ro.current|2),di&&ii(t,r.treeForkCount),t.child}e=e.sibling}null!==r.tail&&le()>Fu&&(t.flags|=128,i=!0,dl(r,!1),t.lanes=4194304)}else{if(!i)if(null!==(e=jo(o))){if(t.flags|=128,i=!0,e=e.updateQueue,t.updateQueue=e,cl(t,e),dl(r,!0),null===r.tail&&"hidden"===r.tailMode&&!o.alternate&&!di)return fl(t),null}else 2*le()-r.renderingStartTime>Fu&&536870912!==n&&(t.flags|=128,i=!0,dl(r,!1),t.lanes=4194304);r.isBackwards?(o.sibling=t.child,t.child=o):(null!==(e=r.last)?e.sibling=o:t.child=o,r.last=o)}return null!==r.tail?(e=r.tail,r.rendering=e,r.tail=e.sibling,r.renderingStartTime=le(),e.sibling=null,n=Ro.current,j(Ro,i?1&n|2:1&n),di&&ii(t,r.treeForkCount),e):(fl(t),null);case 22:case 23:return Uo(t),Do(),r=null!==t.memoizedState,null!==e?null!==e.memoizedState!==r&&(t.flags|=8192):r&&(t.flags|=8192),r?!!(536870912&n)&&!(128&t.flags)&&(fl(t),6&t.subtreeFlags&&(t.flags|=8192)):fl(t),null!==(n=t.updateQueue)&&cl(t,n.retryQueue),n=null,null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),r=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(r=t.memoizedState.cachePool.pool),r!==n&&(t.flags|=2048),null!==e&&R(qi),null;case 24:return n=null,null!==e&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),xi(zi),fl(t),null;case 25:case 30:return null}throw Error(s(156,t.tag))}function pl(e,t){switch(ai(t),t.tag){case 1:return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return xi(zi),K(),65536&(e=t.flags)&&!(128&e)?(t.flags=-65537&e|128,t):null;case 26:case 27:case 5:return X(t),null;case 31:if(null!==t.memoizedState){if(Uo(t),null===t.alternate)throw Error(s(340));vi()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 13:if(Uo(t),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(s(340));vi()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return R(Ro),null;case 4:return K(),null;case 10:return xi(t.type),null;case 22:case 23:return Uo(t),Do(),null!==e&&R(qi),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 24:return xi(zi),null;default:return null}}function yl(e,t){switch(ai(t),t.tag){case 3:xi(zi),K();break;case 26:case 27:case 5:X(t);break;case 4:K();break;case 31:null!==t.memoizedState&&Uo(t);break;case 13:Uo(t);break;case 19:R(Ro);break;case 10:xi(t.type);break;case 22:case 23:Uo(t),Do(),null!==e&&R(qi);break;case 24:xi(zi)}}function bl(e,t){try{var n=t.updateQueue,r=null!==n?n.lastEffect:null;if(null!==r){var i=r.next;n=i;do{if((n.tag&e)===e){r=void 0;var o=n.create,s=n.inst;r=o(),s.destroy=r}n=n.next}while(n!==i)}}catch(e){kc(t,t.return,e)}}function ml(e,t,n){try{var r=t.updateQueue,i=null!==r?r.lastEffect:null;if(null!==i){var o=i.next;r=o;do{if((r.tag&e)===e){var s=r.inst,a=s.destroy;if(void 0!==a){s.destroy=void 0,i=t;var l=n,u=a;try{u()}catch(e){kc(i,l,e)}}}r=r.next}while(r!==o)}}catch(e){kc(t,t.return,e)}}function gl(e){var t=e.updateQueue;if(null!==t){var n=e.stateNode;try{Eo(t,n)}catch(t){kc(e,e.return,t)}}}function vl(e,t,n){n.props=ka(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(n){kc(e,t,n)}}function wl(e,t){try{var n=e.ref;if(null!==n){switch(e.tag){case 26:case 27:case 5:var r=e.stateNode;break;default:r=e.stateNode}"function"==typeof n?e.refCleanup=n(r):n.current=r}}catch(n){kc(e,t,n)}}function _l(e,t){var n=e.ref,r=e.refCleanup;if(null!==n)if("function"==typeof r)try{r()}catch(n){kc(e,t,n)}finally{e.refCleanup=null,null!=(e=e.alternate)&&(e.refCleanup=null)}else if("function"==typeof n)try{n(null)}catch(n){kc(e,t,n)}else n.current=null}function Sl(e){var t=e.type,n=e.memoizedProps,r=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&r.focus();break e;case"img":n.src?r.src=n.src:n.srcSet&&(r.srcset=n.srcSet)}}catch(t){kc(e,e.return,t)}}function kl(e,t,n){try{var r=e.stateNode;!function(e,t,n,r){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var i=null,o=null,a=null,l=null,u=null,c=null,d=null;for(p in n){var f=n[p];if(n.hasOwnProperty(p)&&null!=f)switch(p){case"checked":case"value":break;case"defaultValue":u=f;default:r.hasOwnProperty(p)||cd(e,t,p,null,r,f)}}for(var h in r){var p=r[h];if(f=n[h],r.hasOwnProperty(h)&&(null!=p||null!=f))switch(h){case"type":o=p;break;case"name":i=p;break;case"checked":c=p;break;case"defaultChecked":d=p;break;case"value":a=p;break;case"defaultValue":l=p;break;case"children":case"dangerouslySetInnerHTML":if(null!=p)throw Error(s(137,t));break;default:p!==f&&cd(e,t,h,p,r,f)}}return void gt(e,a,l,u,c,d,o,i);case"select":for(o in p=a=l=h=null,n)if(u=n[o],n.hasOwnProperty(o)&&null!=u)switch(o){case"value":break;case"multiple":p=u;default:r.hasOwnProperty(o)||cd(e,t,o,null,r,u)}for(i in r)if(o=r[i],u=n[i],r.hasOwnProperty(i)&&(null!=o||null!=u))switch(i){case"value":h=o;break;case"defaultValue":l=o;break;case"multiple":a=o;default:o!==u&&cd(e,t,i,o,r,u)}return t=l,n=a,r=p,void(null!=h?_t(e,!!n,h,!1):!!r!=!!n&&(null!=t?_t(e,!!n,t,!0):_t(e,!!n,n?[]:"",!1)));case"textarea":for(l in p=h=null,n)if(i=n[l],n.hasOwnProperty(l)&&null!=i&&!r.hasOwnProperty(l))switch(l){case"value":case"children":break;default:cd(e,t,l,null,r,i)}for(a in r)if(i=r[a],o=n[a],r.hasOwnProperty(a)&&(null!=i||null!=o))switch(a){case"value":h=i;break;case"defaultValue":p=i;break;case"children":break;case"dangerouslySetInnerHTML":if(null!=i)throw Error(s(91));break;default:i!==o&&cd(e,t,a,i,r,o)}return void St(e,h,p);case"option":for(var y in n)h=n[y],n.hasOwnProperty(y)&&null!=h&&!r.hasOwnProperty(y)&&("selected"===y?e.selected=!1:cd(e,t,y,null,r,h));for(u in r)h=r[u],p=n[u],!r.hasOwnProperty(u)||h===p||null==h&&null==p||("selected"===u?e.selected=h&&"function"!=typeof h&&"symbol"!=typeof h:cd(e,t,u,h,r,p));return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var b in n)h=n[b],n.hasOwnProperty(b)&&null!=h&&!r.hasOwnProperty(b)&&cd(e,t,b,null,r,h);for(c in r)if(h=r[c],p=n[c],r.hasOwnProperty(c)&&h!==p&&(null!=h||null!=p))switch(c){case"children":case"dangerouslySetInnerHTML":if(null!=h)throw Error(s(137,t));break;default:cd(e,t,c,h,r,p)}return;default:if(Ot(t)){for(var m in n)h=n[m],n.hasOwnProperty(m)&&void 0!==h&&!r.hasOwnProperty(m)&&dd(e,t,m,void 0,r,h);for(d in r)h=r[d],p=n[d],!r.hasOwnProperty(d)||h===p||void 0===h&&void 0===p||dd(e,t,d,h,r,p);return}}for(var g in n)h=n[g],n.hasOwnProperty(g)&&null!=h&&!r.hasOwnProperty(g)&&cd(e,t,g,null,r,h);for(f in r)h=r[f],p=n[f],!r.hasOwnProperty(f)||h===p||null==h&&null==p||cd(e,t,f,h,r,p)}(r,e.type,n,t),r[Ve]=t}catch(t){kc(e,e.return,t)}}function Il(e){return 5===e.tag||3===e.tag||26===e.tag||27===e.tag&&xd(e.type)||4===e.tag}function Tl(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||Il(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(27===e.tag&&xd(e.type))continue e;if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function xl(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?(9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).insertBefore(e,t):((t=9===n.nodeType?n.body:"HTML"===n.nodeName?n.ownerDocument.body:n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=Dt));else if(4!==r&&(27===r&&xd(e.type)&&(n=e.stateNode,t=null),null!==(e=e.child)))for(xl(e,t,n),e=e.sibling;null!==e;)xl(e,t,n),e=e.sibling}function El(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&(27===r&&xd(e.type)&&(n=e.stateNode),null!==(e=e.child)))for(El(e,t,n),e=e.sibling;null!==e;)El(e,t,n),e=e.sibling}function Ol(e){var t=e.stateNode,n=e.memoizedProps;try{for(var r=e.type,i=t.attributes;i.length;)t.removeAttributeNode(i[0]);fd(t,r,n),t[je]=e,t[Ve]=n}catch(t){kc(e,e.return,t)}}var Al=!1,Cl=!1,Nl=!1,Dl="function"==typeof WeakSet?WeakSet:Set,Bl=null;function Fl(e,t,n){var r=n.flags;switch(n.tag){case 0:case 11:case 15:Ql(e,n),4&r&&bl(5,n);break;case 1:if(Ql(e,n),4&r)if(e=n.stateNode,null===t)try{e.componentDidMount()}catch(e){kc(n,n.return,e)}else{var i=ka(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(i,t,e.__reactInternalSnapshotBeforeUpdate)}catch(e){kc(n,n.return,e)}}64&r&&gl(n),512&r&&wl(n,n.return);break;case 3:if(Ql(e,n),64&r&&null!==(e=n.updateQueue)){if(t=null,null!==n.child)switch(n.child.tag){case 27:case 5:case 1:t=n.child.stateNode}try{Eo(e,t)}catch(e){kc(n,n.return,e)}}break;case 27:null===t&&4&r&&Ol(n);case 26:case 5:Ql(e,n),null===t&&4&r&&Sl(n),512&r&&wl(n,n.return);break;case 12:Ql(e,n);break;case 31:Ql(e,n),4&r&&Rl(e,n);break;case 13:Ql(e,n),4&r&&jl(e,n),64&r&&null!==(e=n.memoizedState)&&null!==(e=e.dehydrated)&&function(e,t){var n=e.ownerDocument;if("$~"===e.data)e._reactRetry=t;else if("$?"!==e.data||"loading"!==n.readyState)t();else{var r=function(){t(),n.removeEventListener("DOMContentLoaded",r)};n.addEventListener("DOMContentLoaded",r),e._reactRetry=r}}(e,n=Ec.bind(null,n));break;case 22:if(!(r=null!==n.memoizedState||Al)){t=null!==t&&null!==t.memoizedState||Cl,i=Al;var o=Cl;Al=r,(Cl=t)&&!o?Gl(e,n,!!(8772&n.subtreeFlags)):Ql(e,n),Al=i,Cl=o}break;case 30:break;default:Ql(e,n)}}function Ll(e){var t=e.alternate;null!==t&&(e.alternate=null,Ll(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&null!==(t=e.stateNode)&&Ke(t),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Ml=null,Pl=!1;function zl(e,t,n){for(n=n.child;null!==n;)Ul(e,t,n),n=n.sibling}function Ul(e,t,n){if(ge&&"function"==typeof ge.onCommitFiberUnmount)try{ge.onCommitFiberUnmount(me,n)}catch(e){}switch(n.tag){case 26:Cl||_l(n,t),zl(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode).parentNode.removeChild(n);break;case 27:Cl||_l(n,t);var r=Ml,i=Pl;xd(n.type)&&(Ml=n.stateNode,Pl=!1),zl(e,t,n),zd(n.stateNode),Ml=r,Pl=i;break;case 5:Cl||_l(n,t);case 6:if(r=Ml,i=Pl,Ml=null,zl(e,t,n),Pl=i,null!==(Ml=r))if(Pl)try{(9===Ml.nodeType?Ml.body:"HTML"===Ml.nodeName?Ml.ownerDocument.body:Ml).removeChild(n.stateNode)}catch(e){kc(n,t,e)}else try{Ml.removeChild(n.stateNode)}catch(e){kc(n,t,e)}break;case 18:null!==Ml&&(Pl?(Ed(9===(e=Ml).nodeType?e.body:"HTML"===e.nodeName?e.ownerDocument.body:e,n.stateNode),Wf(e)):Ed(Ml,n.stateNode));break;case 4:r=Ml,i=Pl,Ml=n.stateNode.containerInfo,Pl=!0,zl(e,t,n),Ml=r,Pl=i;break;case 0:case 11:case 14:case 15:ml(2,n,t),Cl||ml(4,n,t),zl(e,t,n);break;case 1:Cl||(_l(n,t),"function"==typeof(r=n.stateNode).componentWillUnmount&&vl(n,t,r)),zl(e,t,n);break;case 21:zl(e,t,n);break;case 22:Cl=(r=Cl)||null!==n.memoizedState,zl(e,t,n),Cl=r;break;default:zl(e,t,n)}}function Rl(e,t){if(null===t.memoizedState&&null!==(e=t.alternate)&&null!==(e=e.memoizedState)){e=e.dehydrated;try{Wf(e)}catch(e){kc(t,t.return,e)}}}function jl(e,t){if(null===t.memoizedState&&null!==(e=t.alternate)&&null!==(e=e.memoizedState)&&null!==(e=e.dehydrated))try{Wf(e)}catch(e){kc(t,t.return,e)}}function Vl(e,t){var n=function(e){switch(e.tag){case 31:case 13:case 19:var t=e.stateNode;return null===t&&(t=e.stateNode=new Dl),t;case 22:return null===(t=(e=e.stateNode)._retryCache)&&(t=e._retryCache=new Dl),t;default:throw Error(s(435,e.tag))}}(e);t.forEach(function(t){if(!n.has(t)){n.add(t);var r=Oc.bind(null,e,t);t.then(r,r)}})}function $l(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r],o=e,a=t,l=a;e:for(;null!==l;){switch(l.tag){case 27:if(xd(l.type)){Ml=l.stateNode,Pl=!1;break e}break;case 5:Ml=l.stateNode,Pl=!1;break e;case 3:case 4:Ml=l.stateNode.containerInfo,Pl=!0;break e}l=l.return}if(null===Ml)throw Error(s(160));Ul(o,a,i),Ml=null,Pl=!1,null!==(o=i.alternate)&&(o.return=null),i.return=null}if(13886&t.subtreeFlags)for(t=t.child;null!==t;)Wl(t,e),t=t.sibling}var Hl=null;function Wl(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:$l(t,e),Yl(e),4&r&&(ml(3,e,e.return),bl(3,e),ml(5,e,e.return));break;case 1:$l(t,e),Yl(e),512&r&&(Cl||null===n||_l(n,n.return)),64&r&&Al&&null!==(e=e.updateQueue)&&null!==(r=e.callbacks)&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=null===n?r:n.concat(r));break;case 26:var i=Hl;if($l(t,e),Yl(e),512&r&&(Cl||null===n||_l(n,n.return)),4&r){var o=null!==n?n.memoizedState:null;if(r=e.memoizedState,null===n)if(null===r)if(null===e.stateNode){e:{r=e.type,n=e.memoizedProps,i=i.ownerDocument||i;t:switch(r){case"title":(!(o=i.getElementsByTagName("title")[0])||o[Qe]||o[je]||"http://www.w3.org/2000/svg"===o.namespaceURI||o.hasAttribute("itemprop"))&&(o=i.createElement(r),i.head.insertBefore(o,i.querySelector("head > title"))),fd(o,r,n),o[je]=e,et(o),r=o;break e;case"link":var a=nf("link","href",i).get(r+(n.href||""));if(a)for(var l=0;l<a.length;l++)if((o=a[l]).getAttribute("href")===(null==n.href||""===n.href?null:n.href)&&o.getAttribute("rel")===(null==n.rel?null:n.rel)&&o.getAttribute("title")===(null==n.title?null:n.title)&&o.getAttribute("crossorigin")===(null==n.crossOrigin?null:n.crossOrigin)){a.splice(l,1);break t}fd(o=i.createElement(r),r,n),i.head.appendChild(o);break;case"meta":if(a=nf("meta","content",i).get(r+(n.content||"")))for(l=0;l<a.length;l++)if((o=a[l]).getAttribute("content")===(null==n.content?null:""+n.content)&&o.getAttribute("name")===(null==n.name?null:n.name)&&o.getAttribute("property")===(null==n.property?null:n.property)&&o.getAttribute("http-equiv")===(null==n.httpEquiv?null:n.httpEquiv)&&o.getAttribute("charset")===(null==n.charSet?null:n.charSet)){a.splice(l,1);break t}fd(o=i.createElement(r),r,n),i.head.appendChild(o);break;default:throw Error(s(468,r))}o[je]=e,et(o),r=o}e.stateNode=r}else rf(i,e.type,e.stateNode);else e.stateNode=Xd(i,r,e.memoizedProps);else o!==r?(null===o?null!==n.stateNode&&(n=n.stateNode).parentNode.removeChild(n):o.count--,null===r?rf(i,e.type,e.stateNode):Xd(i,r,e.memoizedProps)):null===r&&null!==e.stateNode&&kl(e,e.memoizedProps,n.memoizedProps)}break;case 27:$l(t,e),Yl(e),512&r&&(Cl||null===n||_l(n,n.return)),null!==n&&4&r&&kl(e,e.memoizedProps,n.memoizedProps);break;case 5:if($l(t,e),Yl(e),512&r&&(Cl||null===n||_l(n,n.return)),32&e.flags){i=e.stateNode;try{It(i,"")}catch(t){kc(e,e.return,t)}}4&r&&null!=e.stateNode&&kl(e,i=e.memoizedProps,null!==n?n.memoizedProps:i),1024&r&&(Nl=!0);break;case 6:if($l(t,e),Yl(e),4&r){if(null===e.stateNode)throw Error(s(162));r=e.memoizedProps,n=e.stateNode;try{n.nodeValue=r}catch(t){kc(e,e.return,t)}}break;case 3:if(tf=null,i=Hl,Hl=jd(t.containerInfo),$l(t,e),Hl=i,Yl(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{Wf(t.containerInfo)}catch(t){kc(e,e.return,t)}Nl&&(Nl=!1,ql(e));break;case 4:r=Hl,Hl=jd(e.stateNode.containerInfo),$l(t,e),Yl(e),Hl=r;break;case 12:default:$l(t,e),Yl(e);break;case 31:case 19:$l(t,e),Yl(e),4&r&&null!==(r=e.updateQueue)&&(e.updateQueue=null,Vl(e,r));break;case 13:$l(t,e),Yl(e),8192&e.child.flags&&null!==e.memoizedState!=(null!==n&&null!==n.memoizedState)&&(Du=le()),4&r&&null!==(r=e.updateQueue)&&(e.updateQueue=null,Vl(e,r));break;case 22:i=null!==e.memoizedState;var u=null!==n&&null!==n.memoizedState,c=Al,d=Cl;if(Al=c||i,Cl=d||u,$l(t,e),Cl=d,Al=c,Yl(e),8192&r)e:for(t=e.stateNode,t._visibility=i?-2&t._visibility:1|t._visibility,i&&(null===n||u||Al||Cl||Kl(e)),n=null,t=e;;){if(5===t.tag||26===t.tag){if(null===n){u=n=t;try{if(o=u.stateNode,i)"function"==typeof(a=o.style).setProperty?a.setProperty("display","none","important"):a.display="none";else{l=u.stateNode;var f=u.memoizedProps.style,h=null!=f&&f.hasOwnProperty("display")?f.display:null;l.style.display=null==h||"boolean"==typeof h?"":(""+h).trim()}}catch(e){kc(u,u.return,e)}}}else if(6===t.tag){if(null===n){u=t;try{u.stateNode.nodeValue=i?"":u.memoizedProps}catch(e){kc(u,u.return,e)}}}else if(18===t.tag){if(null===n){u=t;try{var p=u.stateNode;i?Od(p,!0):Od(u.stateNode,!1)}catch(e){kc(u,u.return,e)}}}else if((22!==t.tag&&23!==t.tag||null===t.memoizedState||t===e)&&null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;null===t.sibling;){if(null===t.return||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}4&r&&null!==(r=e.updateQueue)&&null!==(n=r.retryQueue)&&(r.retryQueue=null,Vl(e,n));case 30:case 21:}}function Yl(e){var t=e.flags;if(2&t){try{for(var n,r=e.return;null!==r;){if(Il(r)){n=r;break}r=r.return}if(null==n)throw Error(s(160));switch(n.tag){case 27:var i=n.stateNode;El(e,Tl(e),i);break;case 5:var o=n.stateNode;32&n.flags&&(It(o,""),n.flags&=-33),El(e,Tl(e),o);break;case 3:case 4:var a=n.stateNode.containerInfo;xl(e,Tl(e),a);break;default:throw Error(s(161))}}catch(t){kc(e,e.return,t)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function ql(e){if(1024&e.subtreeFlags)for(e=e.child;null!==e;){var t=e;ql(t),5===t.tag&&1024&t.flags&&t.stateNode.reset(),e=e.sibling}}function Ql(e,t){if(8772&t.subtreeFlags)for(t=t.child;null!==t;)Fl(e,t.alternate,t),t=t.sibling}function Kl(e){for(e=e.child;null!==e;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:ml(4,t,t.return),Kl(t);break;case 1:_l(t,t.return);var n=t.stateNode;"function"==typeof n.componentWillUnmount&&vl(t,t.return,n),Kl(t);break;case 27:zd(t.stateNode);case 26:case 5:_l(t,t.return),Kl(t);break;case 22:null===t.memoizedState&&Kl(t);break;default:Kl(t)}e=e.sibling}}function Gl(e,t,n){for(n=n&&!!(8772&t.subtreeFlags),t=t.child;null!==t;){var r=t.alternate,i=e,o=t,s=o.flags;switch(o.tag){case 0:case 11:case 15:Gl(i,o,n),bl(4,o);break;case 1:if(Gl(i,o,n),"function"==typeof(i=(r=o).stateNode).componentDidMount)try{i.componentDidMount()}catch(e){kc(r,r.return,e)}if(null!==(i=(r=o).updateQueue)){var a=r.stateNode;try{var l=i.shared.hiddenCallbacks;if(null!==l)for(i.shared.hiddenCallbacks=null,i=0;i<l.length;i++)xo(l[i],a)}catch(e){kc(r,r.return,e)}}n&&64&s&&gl(o),wl(o,o.return);break;case 27:Ol(o);case 26:case 5:Gl(i,o,n),n&&null===r&&4&s&&Sl(o),wl(o,o.return);break;case 12:Gl(i,o,n);break;case 31:Gl(i,o,n),n&&4&s&&Rl(i,o);break;case 13:Gl(i,o,n),n&&4&s&&jl(i,o);break;case 22:null===o.memoizedState&&Gl(i,o,n),wl(o,o.return);break;case 30:break;default:Gl(i,o,n)}t=t.sibling}}function Xl(e,t){var n=null;null!==e&&null!==e.memoizedState&&null!==e.memoizedState.cachePool&&(n=e.memoizedState.cachePool.pool),e=null,null!==t.memoizedState&&null!==t.memoizedState.cachePool&&(e=t.memoizedState.cachePool.pool),e!==n&&(null!=e&&e.refCount++,null!=n&&Ri(n))}function Jl(e,t){e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Ri(e))}function Zl(e,t,n,r){if(10256&t.subtreeFlags)for(t=t.child;null!==t;)eu(e,t,n,r),t=t.sibling}function eu(e,t,n,r){var i=t.flags;switch(t.tag){case 0:case 11:case 15:Zl(e,t,n,r),2048&i&&bl(9,t);break;case 1:case 31:case 13:default:Zl(e,t,n,r);break;case 3:Zl(e,t,n,r),2048&i&&(e=null,null!==t.alternate&&(e=t.alternate.memoizedState.cache),(t=t.memoizedState.cache)!==e&&(t.refCount++,null!=e&&Ri(e)));break;case 12:if(2048&i){Zl(e,t,n,r),e=t.stateNode;try{var o=t.memoizedProps,s=o.id,a=o.onPostCommit;"function"==typeof a&&a(s,null===t.alternate?"mount":"update",e.passiveEffectDuration,-0)}catch(e){kc(t,t.return,e)}}else Zl(e,t,n,r);break;case 23:break;case 22:o=t.stateNode,s=t.alternate,null!==t.memoizedState?2&o._visibility?Zl(e,t,n,r):nu(e,t):2&o._visibility?Zl(e,t,n,r):(o._visibility|=2,tu(e,t,n,r,!!(10256&t.subtreeFlags)||!1)),2048&i&&Xl(s,t);break;case 24:Zl(e,t,n,r),2048&i&&Jl(t.alternate,t)}}function tu(e,t,n,r,i){for(i=i&&(!!(10256&t.subtreeFlags)||!1),t=t.child;null!==t;){var o=e,s=t,a=n,l=r,u=s.flags;switch(s.tag){case 0:case 11:case 15:tu(o,s,a,l,i),bl(8,s);break;case 23:break;case 22:var c=s.stateNode;null!==s.memoizedState?2&c._visibility?tu(o,s,a,l,i):nu(o,s):(c._visibility|=2,tu(o,s,a,l,i)),i&&2048&u&&Xl(s.alternate,s);break;case 24:tu(o,s,a,l,i),i&&2048&u&&Jl(s.alternate,s);break;default:tu(o,s,a,l,i)}t=t.sibling}}function nu(e,t){if(10256&t.subtreeFlags)for(t=t.child;null!==t;){var n=e,r=t,i=r.flags;switch(r.tag){case 22:nu(n,r),2048&i&&Xl(r.alternate,r);break;case 24:nu(n,r),2048&i&&Jl(r.alternate,r);break;default:nu(n,r)}t=t.sibling}}var ru=8192;function iu(e,t,n){if(e.subtreeFlags&ru)for(e=e.child;null!==e;)ou(e,t,n),e=e.sibling}function ou(e,t,n){switch(e.tag){case 26:iu(e,t,n),e.flags&ru&&null!==e.memoizedState&&function(e,t,n,r){if(!("stylesheet"!==n.type||"string"==typeof r.media&&!1===matchMedia(r.media).matches||4&n.state.loading)){if(null===n.instance){var i=Yd(r.href),o=t.querySelector(qd(i));if(o)return null!==(t=o._p)&&"object"==typeof t&&"function"==typeof t.then&&(e.count++,e=af.bind(e),t.then(e,e)),n.state.loading|=4,n.instance=o,void et(o);o=t.ownerDocument||t,r=Qd(r),(i=Ud.get(i))&&Zd(r,i),et(o=o.createElement("link"));var s=o;s._p=new Promise(function(e,t){s.onload=e,s.onerror=t}),fd(o,"link",r),n.instance=o}null===e.stylesheets&&(e.stylesheets=new Map),e.stylesheets.set(n,t),(t=n.state.preload)&&!(3&n.state.loading)&&(e.count++,n=af.bind(e),t.addEventListener("load",n),t.addEventListener("error",n))}}(n,Hl,e.memoizedState,e.memoizedProps);break;case 5:default:iu(e,t,n);break;case 3:case 4:var r=Hl;Hl=jd(e.stateNode.containerInfo),iu(e,t,n),Hl=r;break;case 22:null===e.memoizedState&&(null!==(r=e.alternate)&&null!==r.memoizedState?(r=ru,ru=16777216,iu(e,t,n),ru=r):iu(e,t,n))}}function su(e){var t=e.alternate;if(null!==t&&null!==(e=t.child)){t.child=null;do{t=e.sibling,e.sibling=null,e=t}while(null!==e)}}function au(e){var t=e.deletions;if(16&e.flags){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];Bl=r,cu(r,e)}su(e)}if(10256&e.subtreeFlags)for(e=e.child;null!==e;)lu(e),e=e.sibling}function lu(e){switch(e.tag){case 0:case 11:case 15:au(e),2048&e.flags&&ml(9,e,e.return);break;case 3:case 12:default:au(e);break;case 22:var t=e.stateNode;null!==e.memoizedState&&2&t._visibility&&(null===e.return||13!==e.return.tag)?(t._visibility&=-3,uu(e)):au(e)}}function uu(e){var t=e.deletions;if(16&e.flags){if(null!==t)for(var n=0;n<t.length;n++){var r=t[n];Bl=r,cu(r,e)}su(e)}for(e=e.child;null!==e;){switch((t=e).tag){case 0:case 11:case 15:ml(8,t,t.return),uu(t);break;case 22:2&(n=t.stateNode)._visibility&&(n._visibility&=-3,uu(t));break;default:uu(t)}e=e.sibling}}function cu(e,t){for(;null!==Bl;){var n=Bl;switch(n.tag){case 0:case 11:case 15:ml(8,n,t);break;case 23:case 22:if(null!==n.memoizedState&&null!==n.memoizedState.cachePool){var r=n.memoizedState.cachePool.pool;null!=r&&r.refCount++}break;case 24:Ri(n.memoizedState.cache)}if(null!==(r=n.child))r.return=n,Bl=r;else e:for(n=e;null!==Bl;){var i=(r=Bl).sibling,o=r.return;if(Ll(r),r===n){Bl=null;break e}if(null!==i){i.return=o,Bl=i;break e}Bl=o}}}var du={getCacheForType:function(e){var t=Di(zi),n=t.data.get(e);return void 0===n&&(n=e(),t.data.set(e,n)),n},cacheSignal:function(){return Di(zi).controller.signal}},fu="function"==typeof WeakMap?WeakMap:Map,hu=0,pu=null,yu=null,bu=0,mu=0,gu=null,vu=!1,wu=!1,_u=!1,Su=0,ku=0,Iu=0,Tu=0,xu=0,Eu=0,Ou=0,Au=null,Cu=null,Nu=!1,Du=0,Bu=0,Fu=1/0,Lu=null,Mu=null,Pu=0,zu=null,Uu=null,Ru=0,ju=0,Vu=null,$u=null,Hu=0,Wu=null;function Yu(){return 2&hu&&0!==bu?bu&-bu:null!==F.T?Vc():ze()}function qu(){if(0===Eu)if(536870912&bu&&!di)Eu=536870912;else{var e=Ie;!(3932160&(Ie<<=1))&&(Ie=262144),Eu=e}return null!==(e=Bo.current)&&(e.flags|=32),Eu}function Qu(e,t,n){(e!==pu||2!==mu&&9!==mu)&&null===e.cancelPendingCommit||(tc(e,0),Ju(e,bu,Eu,!1)),De(e,n),2&hu&&e===pu||(e===pu&&(!(2&hu)&&(Tu|=n),4===ku&&Ju(e,bu,Eu,!1)),Lc(e))}function Ku(e,t,n){if(6&hu)throw Error(s(327));for(var r=!n&&!(127&t)&&0===(t&e.expiredLanes)||Oe(e,t),i=r?function(e,t){var n=hu;hu|=2;var r=ic(),i=oc();pu!==e||bu!==t?(Lu=null,Fu=le()+500,tc(e,t)):wu=Oe(e,t);e:for(;;)try{if(0!==mu&&null!==yu){t=yu;var o=gu;t:switch(mu){case 1:mu=0,gu=null,fc(e,t,o,1);break;case 2:case 9:if(to(o)){mu=0,gu=null,dc(t);break}t=function(){2!==mu&&9!==mu||pu!==e||(mu=7),Lc(e)},o.then(t,t);break e;case 3:mu=7;break e;case 4:mu=5;break e;case 7:to(o)?(mu=0,gu=null,dc(t)):(mu=0,gu=null,fc(e,t,o,7));break;case 5:var a=null;switch(yu.tag){case 26:a=yu.memoizedState;case 5:case 27:var l=yu;if(a?of(a):l.stateNode.complete){mu=0,gu=null;var u=l.sibling;if(null!==u)yu=u;else{var c=l.return;null!==c?(yu=c,hc(c)):yu=null}break t}}mu=0,gu=null,fc(e,t,o,5);break;case 6:mu=0,gu=null,fc(e,t,o,6);break;case 8:ec(),ku=6;break e;default:throw Error(s(462))}}uc();break}catch(t){nc(e,t)}return Ii=ki=null,F.H=r,F.A=i,hu=n,null!==yu?0:(pu=null,bu=0,Cr(),ku)}(e,t):ac(e,t,!0),o=r;;){if(0===i){wu&&!r&&Ju(e,t,0,!1);break}if(n=e.current.alternate,!o||Xu(n)){if(2===i){if(o=t,e.errorRecoveryDisabledLanes&o)var a=0;else a=0!=(a=-536870913&e.pendingLanes)?a:536870912&a?536870912:0;if(0!==a){t=a;e:{var l=e;i=Au;var u=l.current.memoizedState.isDehydrated;if(u&&(tc(l,a).flags|=256),2!==(a=ac(l,a,!1))){if(_u&&!u){l.errorRecoveryDisabledLanes|=o,Tu|=o,i=4;break e}o=Cu,Cu=i,null!==o&&(null===Cu?Cu=o:Cu.push.apply(Cu,o))}i=a}if(o=!1,2!==i)continue}}if(1===i){tc(e,0),Ju(e,t,0,!0);break}e:{switch(r=e,o=i){case 0:case 1:throw Error(s(345));case 4:if((4194048&t)!==t)break;case 6:Ju(r,t,Eu,!vu);break e;case 2:Cu=null;break;case 3:case 5:break;default:throw Error(s(329))}if((62914560&t)===t&&10<(i=Du+300-le())){if(Ju(r,t,Eu,!vu),0!==Ee(r,0,!0))break e;Ru=t,r.timeoutHandle=_d(Gu.bind(null,r,n,Cu,Lu,Nu,t,Eu,Tu,Ou,vu,o,"Throttled",-0,0),i)}else Gu(r,n,Cu,Lu,Nu,t,Eu,Tu,Ou,vu,o,null,-0,0)}break}i=ac(e,t,!1),o=!1}Lc(e)}function Gu(e,t,n,r,i,o,s,a,l,u,c,d,f,h){if(e.timeoutHandle=-1,8192&(d=t.subtreeFlags)||!(16785408&~d)){ou(t,o,d={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Dt});var p=(62914560&o)===o?Du-le():(4194048&o)===o?Bu-le():0;if(null!==(p=function(e,t){return e.stylesheets&&0===e.count&&uf(e,e.stylesheets),0<e.count||0<e.imgCount?function(n){var r=setTimeout(function(){if(e.stylesheets&&uf(e,e.stylesheets),e.unsuspend){var t=e.unsuspend;e.unsuspend=null,t()}},6e4+t);0<e.imgBytes&&0===sf&&(sf=62500*function(){if("function"==typeof performance.getEntriesByType){for(var e=0,t=0,n=performance.getEntriesByType("resource"),r=0;r<n.length;r++){var i=n[r],o=i.transferSize,s=i.initiatorType,a=i.duration;if(o&&a&&hd(s)){for(s=0,a=i.responseEnd,r+=1;r<n.length;r++){var l=n[r],u=l.startTime;if(u>a)break;var c=l.transferSize,d=l.initiatorType;c&&hd(d)&&(s+=c*((l=l.responseEnd)<a?1:(a-u)/(l-u)))}if(--r,t+=8*(o+s)/(i.duration/1e3),10<++e)break}}if(0<e)return t/e/1e6}return navigator.connection&&"number"==typeof(e=navigator.connection.downlink)?e:5}());var i=setTimeout(function(){if(e.waitingForImages=!1,0===e.count&&(e.stylesheets&&uf(e,e.stylesheets),e.unsuspend)){var t=e.unsuspend;e.unsuspend=null,t()}},(e.imgBytes>sf?50:800)+t);return e.unsuspend=n,function(){e.unsuspend=null,clearTimeout(r),clearTimeout(i)}}:null}(d,p)))return Ru=o,e.cancelPendingCommit=p(yc.bind(null,e,t,o,n,r,i,s,a,l,c,d,null,f,h)),void Ju(e,o,s,!u)}yc(e,t,o,n,r,i,s,a,l)}function Xu(e){for(var t=e;;){var n=t.tag;if((0===n||11===n||15===n)&&16384&t.flags&&null!==(n=t.updateQueue)&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!Jn(o(),i))return!1}catch(e){return!1}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ju(e,t,n,r){t&=~xu,t&=~Tu,e.suspendedLanes|=t,e.pingedLanes&=~t,r&&(e.warmLanes|=t),r=e.expirationTimes;for(var i=t;0<i;){var o=31-we(i),s=1<<o;r[o]=-1,i&=~s}0!==n&&Be(e,n,t)}function Zu(){return!!(6&hu)||(Mc(0,!1),!1)}function ec(){if(null!==yu){if(0===mu)var e=yu.return;else Ii=ki=null,as(e=yu),ao=null,lo=0,e=yu;for(;null!==e;)yl(e.alternate,e),e=e.return;yu=null}}function tc(e,t){var n=e.timeoutHandle;-1!==n&&(e.timeoutHandle=-1,Sd(n)),null!==(n=e.cancelPendingCommit)&&(e.cancelPendingCommit=null,n()),Ru=0,ec(),pu=e,yu=n=Rr(e.current,null),bu=t,mu=0,gu=null,vu=!1,wu=Oe(e,t),_u=!1,Ou=Eu=xu=Tu=Iu=ku=0,Cu=Au=null,Nu=!1,8&t&&(t|=32&t);var r=e.entangledLanes;if(0!==r)for(e=e.entanglements,r&=t;0<r;){var i=31-we(r),o=1<<i;t|=e[i],r&=~o}return Su=t,Cr(),n}function nc(e,t){$o=null,F.H=ya,t===Xi||t===Zi?(t=oo(),mu=3):t===Ji?(t=oo(),mu=4):mu=t===Da?8:null!==t&&"object"==typeof t&&"function"==typeof t.then?6:1,gu=t,null===yu&&(ku=1,Ea(e,Qr(t,e.current)))}function rc(){var e=Bo.current;return null===e||((4194048&bu)===bu?null===Fo:!!((62914560&bu)===bu||536870912&bu)&&e===Fo)}function ic(){var e=F.H;return F.H=ya,null===e?ya:e}function oc(){var e=F.A;return F.A=du,e}function sc(){ku=4,vu||(4194048&bu)!==bu&&null!==Bo.current||(wu=!0),!(134217727&Iu)&&!(134217727&Tu)||null===pu||Ju(pu,bu,Eu,!1)}function ac(e,t,n){var r=hu;hu|=2;var i=ic(),o=oc();pu===e&&bu===t||(Lu=null,tc(e,t)),t=!1;var s=ku;e:for(;;)try{if(0!==mu&&null!==yu){var a=yu,l=gu;switch(mu){case 8:ec(),s=6;break e;case 3:case 2:case 9:case 6:null===Bo.current&&(t=!0);var u=mu;if(mu=0,gu=null,fc(e,a,l,u),n&&wu){s=0;break e}break;default:u=mu,mu=0,gu=null,fc(e,a,l,u)}}lc(),s=ku;break}catch(t){nc(e,t)}return t&&e.shellSuspendCounter++,Ii=ki=null,hu=r,F.H=i,F.A=o,null===yu&&(pu=null,bu=0,Cr()),s}function lc(){for(;null!==yu;)cc(yu)}function uc(){for(;null!==yu&&!se();)cc(yu)}function cc(e){var t=sl(e.alternate,e,Su);e.memoizedProps=e.pendingProps,null===t?hc(e):yu=t}function dc(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=Wa(n,t,t.pendingProps,t.type,void 0,bu);break;case 11:t=Wa(n,t,t.pendingProps,t.type.render,t.ref,bu);break;case 5:as(t);default:yl(n,t),t=sl(n,t=yu=jr(t,Su),Su)}e.memoizedProps=e.pendingProps,null===t?hc(e):yu=t}function fc(e,t,n,r){Ii=ki=null,as(t),ao=null,lo=0;var i=t.return;try{if(function(e,t,n,r,i){if(n.flags|=32768,null!==r&&"object"==typeof r&&"function"==typeof r.then){if(null!==(t=n.alternate)&&Ai(t,n,i,!0),null!==(n=Bo.current)){switch(n.tag){case 31:case 13:return null===Fo?sc():null===n.alternate&&0===ku&&(ku=3),n.flags&=-257,n.flags|=65536,n.lanes=i,r===eo?n.flags|=16384:(null===(t=n.updateQueue)?n.updateQueue=new Set([r]):t.add(r),Ic(e,r,i)),!1;case 22:return n.flags|=65536,r===eo?n.flags|=16384:(null===(t=n.updateQueue)?(t={transitions:null,markerInstances:null,retryQueue:new Set([r])},n.updateQueue=t):null===(n=t.retryQueue)?t.retryQueue=new Set([r]):n.add(r),Ic(e,r,i)),!1}throw Error(s(435,n.tag))}return Ic(e,r,i),sc(),!1}if(di)return null!==(t=Bo.current)?(!(65536&t.flags)&&(t.flags|=256),t.flags|=65536,t.lanes=i,r!==pi&&_i(Qr(e=Error(s(422),{cause:r}),n))):(r!==pi&&_i(Qr(t=Error(s(423),{cause:r}),n)),(e=e.current.alternate).flags|=65536,i&=-i,e.lanes|=i,r=Qr(r,n),So(e,i=Aa(e.stateNode,r,i)),4!==ku&&(ku=2)),!1;var o=Error(s(520),{cause:r});if(o=Qr(o,n),null===Au?Au=[o]:Au.push(o),4!==ku&&(ku=2),null===t)return!0;r=Qr(r,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=i&-i,n.lanes|=e,So(n,e=Aa(n.stateNode,r,e)),!1;case 1:if(t=n.type,o=n.stateNode,!(128&n.flags||"function"!=typeof t.getDerivedStateFromError&&(null===o||"function"!=typeof o.componentDidCatch||null!==Mu&&Mu.has(o))))return n.flags|=65536,i&=-i,n.lanes|=i,Na(i=Ca(i),e,n,r),So(n,i),!1}n=n.return}while(null!==n);return!1}(e,i,t,n,bu))return ku=1,Ea(e,Qr(n,e.current)),void(yu=null)}catch(t){if(null!==i)throw yu=i,t;return ku=1,Ea(e,Qr(n,e.current)),void(yu=null)}32768&t.flags?(di||1===r?e=!0:wu||536870912&bu?e=!1:(vu=e=!0,(2===r||9===r||3===r||6===r)&&null!==(r=Bo.current)&&13===r.tag&&(r.flags|=16384)),pc(t,e)):hc(t)}function hc(e){var t=e;do{if(32768&t.flags)return void pc(t,vu);e=t.return;var n=hl(t.alternate,t,Su);if(null!==n)return void(yu=n);if(null!==(t=t.sibling))return void(yu=t);yu=t=e}while(null!==t);0===ku&&(ku=5)}function pc(e,t){do{var n=pl(e.alternate,e);if(null!==n)return n.flags&=32767,void(yu=n);if(null!==(n=e.return)&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&null!==(e=e.sibling))return void(yu=e);yu=e=n}while(null!==e);ku=6,yu=null}function yc(e,t,n,r,i,o,a,l,u){e.cancelPendingCommit=null;do{wc()}while(0!==Pu);if(6&hu)throw Error(s(327));if(null!==t){if(t===e.current)throw Error(s(177));if(o=t.lanes|t.childLanes,function(e,t,n,r,i,o){var s=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var a=e.entanglements,l=e.expirationTimes,u=e.hiddenUpdates;for(n=s&~n;0<n;){var c=31-we(n),d=1<<c;a[c]=0,l[c]=-1;var f=u[c];if(null!==f)for(u[c]=null,c=0;c<f.length;c++){var h=f[c];null!==h&&(h.lane&=-536870913)}n&=~d}0!==r&&Be(e,r,0),0!==o&&0===i&&0!==e.tag&&(e.suspendedLanes|=o&~(s&~t))}(e,n,o|=Ar,a,l,u),e===pu&&(yu=pu=null,bu=0),Uu=t,zu=e,Ru=n,ju=o,Vu=i,$u=r,10256&t.subtreeFlags||10256&t.flags?(e.callbackNode=null,e.callbackPriority=0,ie(fe,function(){return _c(),null})):(e.callbackNode=null,e.callbackPriority=0),r=!!(13878&t.flags),13878&t.subtreeFlags||r){r=F.T,F.T=null,i=L.p,L.p=2,a=hu,hu|=4;try{!function(e,t){if(e=e.containerInfo,pd=wf,ir(e=rr(e))){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var i=r.anchorOffset,o=r.focusNode;r=r.focusOffset;try{n.nodeType,o.nodeType}catch(e){n=null;break e}var a=0,l=-1,u=-1,c=0,d=0,f=e,h=null;t:for(;;){for(var p;f!==n||0!==i&&3!==f.nodeType||(l=a+i),f!==o||0!==r&&3!==f.nodeType||(u=a+r),3===f.nodeType&&(a+=f.nodeValue.length),null!==(p=f.firstChild);)h=f,f=p;for(;;){if(f===e)break t;if(h===n&&++c===i&&(l=a),h===o&&++d===r&&(u=a),null!==(p=f.nextSibling))break;h=(f=h).parentNode}f=p}n=-1===l||-1===u?null:{start:l,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(yd={focusedElem:e,selectionRange:n},wf=!1,Bl=t;null!==Bl;)if(e=(t=Bl).child,1028&t.subtreeFlags&&null!==e)e.return=t,Bl=e;else for(;null!==Bl;){switch(o=(t=Bl).alternate,e=t.flags,t.tag){case 0:if(4&e&&null!==(e=null!==(e=t.updateQueue)?e.events:null))for(n=0;n<e.length;n++)(i=e[n]).ref.impl=i.nextImpl;break;case 11:case 15:case 5:case 26:case 27:case 6:case 4:case 17:break;case 1:if(1024&e&&null!==o){e=void 0,n=t,i=o.memoizedProps,o=o.memoizedState,r=n.stateNode;try{var y=ka(n.type,i);e=r.getSnapshotBeforeUpdate(y,o),r.__reactInternalSnapshotBeforeUpdate=e}catch(e){kc(n,n.return,e)}}break;case 3:if(1024&e)if(9===(n=(e=t.stateNode.containerInfo).nodeType))Ad(e);else if(1===n)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":Ad(e);break;default:e.textContent=""}break;default:if(1024&e)throw Error(s(163))}if(null!==(e=t.sibling)){e.return=t.return,Bl=e;break}Bl=t.return}}(e,t)}finally{hu=a,L.p=i,F.T=r}}Pu=1,bc(),mc(),gc()}}function bc(){if(1===Pu){Pu=0;var e=zu,t=Uu,n=!!(13878&t.flags);if(13878&t.subtreeFlags||n){n=F.T,F.T=null;var r=L.p;L.p=2;var i=hu;hu|=4;try{Wl(t,e);var o=yd,s=rr(e.containerInfo),a=o.focusedElem,l=o.selectionRange;if(s!==a&&a&&a.ownerDocument&&nr(a.ownerDocument.documentElement,a)){if(null!==l&&ir(a)){var u=l.start,c=l.end;if(void 0===c&&(c=u),"selectionStart"in a)a.selectionStart=u,a.selectionEnd=Math.min(c,a.value.length);else{var d=a.ownerDocument||document,f=d&&d.defaultView||window;if(f.getSelection){var h=f.getSelection(),p=a.textContent.length,y=Math.min(l.start,p),b=void 0===l.end?y:Math.min(l.end,p);!h.extend&&y>b&&(s=b,b=y,y=s);var m=tr(a,y),g=tr(a,b);if(m&&g&&(1!==h.rangeCount||h.anchorNode!==m.node||h.anchorOffset!==m.offset||h.focusNode!==g.node||h.focusOffset!==g.offset)){var v=d.createRange();v.setStart(m.node,m.offset),h.removeAllRanges(),y>b?(h.addRange(v),h.extend(g.node,g.offset)):(v.setEnd(g.node,g.offset),h.addRange(v))}}}}for(d=[],h=a;h=h.parentNode;)1===h.nodeType&&d.push({element:h,left:h.scrollLeft,top:h.scrollTop});for("function"==typeof a.focus&&a.focus(),a=0;a<d.length;a++){var w=d[a];w.element.scrollLeft=w.left,w.element.scrollTop=w.top}}wf=!!pd,yd=pd=null}finally{hu=i,L.p=r,F.T=n}}e.current=t,Pu=2}}function mc(){if(2===Pu){Pu=0;var e=zu,t=Uu,n=!!(8772&t.flags);if(8772&t.subtreeFlags||n){n=F.T,F.T=null;var r=L.p;L.p=2;var i=hu;hu|=4;try{Fl(e,t.alternate,t)}finally{hu=i,L.p=r,F.T=n}}Pu=3}}function gc(){if(4===Pu||3===Pu){Pu=0,ae();var e=zu,t=Uu,n=Ru,r=$u;10256&t.subtreeFlags||10256&t.flags?Pu=5:(Pu=0,Uu=zu=null,vc(e,e.pendingLanes));var i=e.pendingLanes;if(0===i&&(Mu=null),Pe(n),t=t.stateNode,ge&&"function"==typeof ge.onCommitFiberRoot)try{ge.onCommitFiberRoot(me,t,void 0,!(128&~t.current.flags))}catch(e){}if(null!==r){t=F.T,i=L.p,L.p=2,F.T=null;try{for(var o=e.onRecoverableError,s=0;s<r.length;s++){var a=r[s];o(a.value,{componentStack:a.stack})}}finally{F.T=t,L.p=i}}3&Ru&&wc(),Lc(e),i=e.pendingLanes,261930&n&&42&i?e===Wu?Hu++:(Hu=0,Wu=e):Hu=0,Mc(0,!1)}}function vc(e,t){0===(e.pooledCacheLanes&=t)&&null!=(t=e.pooledCache)&&(e.pooledCache=null,Ri(t))}function wc(){return bc(),mc(),gc(),_c()}function _c(){if(5!==Pu)return!1;var e=zu,t=ju;ju=0;var n=Pe(Ru),r=F.T,i=L.p;try{L.p=32>n?32:n,F.T=null,n=Vu,Vu=null;var o=zu,a=Ru;if(Pu=0,Uu=zu=null,Ru=0,6&hu)throw Error(s(331));var l=hu;if(hu|=4,lu(o.current),eu(o,o.current,a,n),hu=l,Mc(0,!1),ge&&"function"==typeof ge.onPostCommitFiberRoot)try{ge.onPostCommitFiberRoot(me,o)}catch(e){}return!0}finally{L.p=i,F.T=r,vc(e,t)}}function Sc(e,t,n){t=Qr(n,t),null!==(e=wo(e,t=Aa(e.stateNode,t,2),2))&&(De(e,2),Lc(e))}function kc(e,t,n){if(3===e.tag)Sc(e,e,n);else for(;null!==t;){if(3===t.tag){Sc(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"==typeof t.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Mu||!Mu.has(r))){e=Qr(n,e),null!==(r=wo(t,n=Ca(2),2))&&(Na(n,r,t,e),De(r,2),Lc(r));break}}t=t.return}}function Ic(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new fu;var i=new Set;r.set(t,i)}else void 0===(i=r.get(t))&&(i=new Set,r.set(t,i));i.has(n)||(_u=!0,i.add(n),e=Tc.bind(null,e,t,n),t.then(e,e))}function Tc(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,pu===e&&(bu&n)===n&&(4===ku||3===ku&&(62914560&bu)===bu&&300>le()-Du?!(2&hu)&&tc(e,0):xu|=n,Ou===bu&&(Ou=0)),Lc(e)}function xc(e,t){0===t&&(t=Ce()),null!==(e=Br(e,t))&&(De(e,t),Lc(e))}function Ec(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),xc(e,n)}function Oc(e,t){var n=0;switch(e.tag){case 31:case 13:var r=e.stateNode,i=e.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=e.stateNode;break;case 22:r=e.stateNode._retryCache;break;default:throw Error(s(314))}null!==r&&r.delete(t),xc(e,n)}var Ac=null,Cc=null,Nc=!1,Dc=!1,Bc=!1,Fc=0;function Lc(e){e!==Cc&&null===e.next&&(null===Cc?Ac=Cc=e:Cc=Cc.next=e),Dc=!0,Nc||(Nc=!0,Id(function(){6&hu?ie(ce,Pc):zc()}))}function Mc(e,t){if(!Bc&&Dc){Bc=!0;do{for(var n=!1,r=Ac;null!==r;){if(!t)if(0!==e){var i=r.pendingLanes;if(0===i)var o=0;else{var s=r.suspendedLanes,a=r.pingedLanes;o=(1<<31-we(42|e)+1)-1,o=201326741&(o&=i&~(s&~a))?201326741&o|1:o?2|o:0}0!==o&&(n=!0,jc(r,o))}else o=bu,!(3&(o=Ee(r,r===pu?o:0,null!==r.cancelPendingCommit||-1!==r.timeoutHandle)))||Oe(r,o)||(n=!0,jc(r,o));r=r.next}}while(n);Bc=!1}}function Pc(){zc()}function zc(){Dc=Nc=!1;var e,t=0;0!==Fc&&((e=window.event)&&"popstate"===e.type?e!==wd&&(wd=e,1):(wd=null,0))&&(t=Fc);for(var n=le(),r=null,i=Ac;null!==i;){var o=i.next,s=Uc(i,n);0===s?(i.next=null,null===r?Ac=o:r.next=o,null===o&&(Cc=r)):(r=i,(0!==t||3&s)&&(Dc=!0)),i=o}0!==Pu&&5!==Pu||Mc(t,!1),0!==Fc&&(Fc=0)}function Uc(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,i=e.expirationTimes,o=-62914561&e.pendingLanes;0<o;){var s=31-we(o),a=1<<s,l=i[s];-1===l?0!==(a&n)&&0===(a&r)||(i[s]=Ae(a,t)):l<=t&&(e.expiredLanes|=a),o&=~a}if(n=bu,n=Ee(e,e===(t=pu)?n:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle),r=e.callbackNode,0===n||e===t&&(2===mu||9===mu)||null!==e.cancelPendingCommit)return null!==r&&null!==r&&oe(r),e.callbackNode=null,e.callbackPriority=0;if(!(3&n)||Oe(e,n)){if((t=n&-n)===e.callbackPriority)return t;switch(null!==r&&oe(r),Pe(n)){case 2:case 8:n=de;break;case 32:default:n=fe;break;case 268435456:n=pe}return r=Rc.bind(null,e),n=ie(n,r),e.callbackPriority=t,e.callbackNode=n,t}return null!==r&&null!==r&&oe(r),e.callbackPriority=2,e.callbackNode=null,2}function Rc(e,t){if(0!==Pu&&5!==Pu)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(wc()&&e.callbackNode!==n)return null;var r=bu;return 0===(r=Ee(e,e===pu?r:0,null!==e.cancelPendingCommit||-1!==e.timeoutHandle))?null:(Ku(e,r,t),Uc(e,le()),null!=e.callbackNode&&e.callbackNode===n?Rc.bind(null,e):null)}function jc(e,t){if(wc())return null;Ku(e,t,!0)}function Vc(){if(0===Fc){var e=$i;0===e&&(e=ke,!(261888&(ke<<=1))&&(ke=256)),Fc=e}return Fc}function $c(e){return null==e||"symbol"==typeof e||"boolean"==typeof e?null:"function"==typeof e?e:Nt(""+e)}function Hc(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}for(var Wc=0;Wc<Ir.length;Wc++){var Yc=Ir[Wc];Tr(Yc.toLowerCase(),"on"+(Yc[0].toUpperCase()+Yc.slice(1)))}Tr(br,"onAnimationEnd"),Tr(mr,"onAnimationIteration"),Tr(gr,"onAnimationStart"),Tr("dblclick","onDoubleClick"),Tr("focusin","onFocus"),Tr("focusout","onBlur"),Tr(vr,"onTransitionRun"),Tr(wr,"onTransitionStart"),Tr(_r,"onTransitionCancel"),Tr(Sr,"onTransitionEnd"),it("onMouseEnter",["mouseout","mouseover"]),it("onMouseLeave",["mouseout","mouseover"]),it("onPointerEnter",["pointerout","pointerover"]),it("onPointerLeave",["pointerout","pointerover"]),rt("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),rt("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),rt("onBeforeInput",["compositionend","keypress","textInput","paste"]),rt("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),rt("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),rt("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var qc="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Qc=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(qc));function Kc(e,t){t=!!(4&t);for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var s=r.length-1;0<=s;s--){var a=r[s],l=a.instance,u=a.currentTarget;if(a=a.listener,l!==o&&i.isPropagationStopped())break e;o=a,i.currentTarget=u;try{o(i)}catch(e){xr(e)}i.currentTarget=null,o=l}else for(s=0;s<r.length;s++){if(l=(a=r[s]).instance,u=a.currentTarget,a=a.listener,l!==o&&i.isPropagationStopped())break e;o=a,i.currentTarget=u;try{o(i)}catch(e){xr(e)}i.currentTarget=null,o=l}}}}function Gc(e,t){var n=t[He];void 0===n&&(n=t[He]=new Set);var r=e+"__bubble";n.has(r)||(ed(t,e,2,!1),n.add(r))}function Xc(e,t,n){var r=0;t&&(r|=4),ed(n,e,r,t)}var Jc="_reactListening"+Math.random().toString(36).slice(2);function Zc(e){if(!e[Jc]){e[Jc]=!0,tt.forEach(function(t){"selectionchange"!==t&&(Qc.has(t)||Xc(t,!1,e),Xc(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Jc]||(t[Jc]=!0,Xc("selectionchange",!1,t))}}function ed(e,t,n,r){switch(Ef(t)){case 2:var i=_f;break;case 8:i=Sf;break;default:i=kf}n=i.bind(null,t,n,e),i=void 0,!Vt||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(i=!0),r?void 0!==i?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):void 0!==i?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function td(e,t,n,r,i){var o=r;if(!(1&t||2&t||null===r))e:for(;;){if(null===r)return;var s=r.tag;if(3===s||4===s){var a=r.stateNode.containerInfo;if(a===i)break;if(4===s)for(s=r.return;null!==s;){var u=s.tag;if((3===u||4===u)&&s.stateNode.containerInfo===i)return;s=s.return}for(;null!==a;){if(null===(s=Ge(a)))return;if(5===(u=s.tag)||6===u||26===u||27===u){r=o=s;continue e}a=a.parentNode}}r=r.return}Ut(function(){var r=o,i=Ft(n),s=[];e:{var a=kr.get(e);if(void 0!==a){var u=nn,c=e;switch(e){case"keypress":if(0===Qt(n))break e;case"keydown":case"keyup":u=gn;break;case"focusin":c="focus",u=un;break;case"focusout":c="blur",u=un;break;case"beforeblur":case"afterblur":u=un;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":u=an;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":u=ln;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":u=wn;break;case br:case mr:case gr:u=cn;break;case Sr:u=_n;break;case"scroll":case"scrollend":u=on;break;case"wheel":u=Sn;break;case"copy":case"cut":case"paste":u=dn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":u=vn;break;case"toggle":case"beforetoggle":u=kn}var d=!!(4&t),f=!d&&("scroll"===e||"scrollend"===e),h=d?null!==a?a+"Capture":null:a;d=[];for(var p,y=r;null!==y;){var b=y;if(p=b.stateNode,5!==(b=b.tag)&&26!==b&&27!==b||null===p||null===h||null!=(b=Rt(y,h))&&d.push(nd(y,b,p)),f)break;y=y.return}0<d.length&&(a=new u(a,c,null,n,i),s.push({event:a,listeners:d}))}}if(!(7&t)){if(u="mouseout"===e||"pointerout"===e,(!(a="mouseover"===e||"pointerover"===e)||n===Bt||!(c=n.relatedTarget||n.fromElement)||!Ge(c)&&!c[$e])&&(u||a)&&(a=i.window===i?i:(a=i.ownerDocument)?a.defaultView||a.parentWindow:window,u?(u=r,null!==(c=(c=n.relatedTarget||n.toElement)?Ge(c):null)&&(f=l(c),d=c.tag,c!==f||5!==d&&27!==d&&6!==d)&&(c=null)):(u=null,c=r),u!==c)){if(d=an,b="onMouseLeave",h="onMouseEnter",y="mouse","pointerout"!==e&&"pointerover"!==e||(d=vn,b="onPointerLeave",h="onPointerEnter",y="pointer"),f=null==u?a:Je(u),p=null==c?a:Je(c),(a=new d(b,y+"leave",u,n,i)).target=f,a.relatedTarget=p,b=null,Ge(i)===r&&((d=new d(h,y+"enter",c,n,i)).target=p,d.relatedTarget=f,b=d),f=b,u&&c)e:{for(d=id,y=c,p=0,b=h=u;b;b=d(b))p++;b=0;for(var m=y;m;m=d(m))b++;for(;0<p-b;)h=d(h),p--;for(;0<b-p;)y=d(y),b--;for(;p--;){if(h===y||null!==y&&h===y.alternate){d=h;break e}h=d(h),y=d(y)}d=null}else d=null;null!==u&&od(s,a,u,d,!1),null!==c&&null!==f&&od(s,f,c,d,!0)}if("select"===(u=(a=r?Je(r):window).nodeName&&a.nodeName.toLowerCase())||"input"===u&&"file"===a.type)var g=jn;else if(Ln(a))if(Vn)g=Xn;else{g=Kn;var v=Qn}else!(u=a.nodeName)||"input"!==u.toLowerCase()||"checkbox"!==a.type&&"radio"!==a.type?r&&Ot(r.elementType)&&(g=jn):g=Gn;switch(g&&(g=g(e,r))?Mn(s,g,n,i):(v&&v(e,a,r),"focusout"===e&&r&&"number"===a.type&&null!=r.memoizedProps.value&&wt(a,"number",a.value)),v=r?Je(r):window,e){case"focusin":(Ln(v)||"true"===v.contentEditable)&&(sr=v,ar=r,lr=null);break;case"focusout":lr=ar=sr=null;break;case"mousedown":ur=!0;break;case"contextmenu":case"mouseup":case"dragend":ur=!1,cr(s,n,i);break;case"selectionchange":if(or)break;case"keydown":case"keyup":cr(s,n,i)}var w;if(Tn)e:{switch(e){case"compositionstart":var _="onCompositionStart";break e;case"compositionend":_="onCompositionEnd";break e;case"compositionupdate":_="onCompositionUpdate";break e}_=void 0}else Bn?Nn(e,n)&&(_="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(_="onCompositionStart");_&&(On&&"ko"!==n.locale&&(Bn||"onCompositionStart"!==_?"onCompositionEnd"===_&&Bn&&(w=qt()):(Wt="value"in(Ht=i)?Ht.value:Ht.textContent,Bn=!0)),0<(v=rd(r,_)).length&&(_=new fn(_,e,null,n,i),s.push({event:_,listeners:v}),(w||null!==(w=Dn(n)))&&(_.data=w))),(w=En?function(e,t){switch(e){case"compositionend":return Dn(t);case"keypress":return 32!==t.which?null:(Cn=!0,An);case"textInput":return(e=t.data)===An&&Cn?null:e;default:return null}}(e,n):function(e,t){if(Bn)return"compositionend"===e||!Tn&&Nn(e,t)?(e=qt(),Yt=Wt=Ht=null,Bn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return On&&"ko"!==t.locale?null:t.data}}(e,n))&&0<(_=rd(r,"onBeforeInput")).length&&(v=new fn("onBeforeInput","beforeinput",null,n,i),s.push({event:v,listeners:_}),v.data=w),function(e,t,n,r,i){if("submit"===t&&n&&n.stateNode===i){var o=$c((i[Ve]||null).action),s=r.submitter;s&&null!==(t=(t=s[Ve]||null)?$c(t.formAction):s.getAttribute("formAction"))&&(o=t,s=null);var a=new nn("action","action",null,r,i);e.push({event:a,listeners:[{instance:null,listener:function(){if(r.defaultPrevented){if(0!==Fc){var e=s?Hc(i,s):new FormData(i);ta(n,{pending:!0,data:e,method:i.method,action:o},null,e)}}else"function"==typeof o&&(a.preventDefault(),e=s?Hc(i,s):new FormData(i),ta(n,{pending:!0,data:e,method:i.method,action:o},o,e))},currentTarget:i}]})}}(s,e,r,n,i)}Kc(s,t)})}function nd(e,t,n){return{instance:e,listener:t,currentTarget:n}}function rd(e,t){for(var n=t+"Capture",r=[];null!==e;){var i=e,o=i.stateNode;if(5!==(i=i.tag)&&26!==i&&27!==i||null===o||(null!=(i=Rt(e,n))&&r.unshift(nd(e,i,o)),null!=(i=Rt(e,t))&&r.push(nd(e,i,o))),3===e.tag)return r;e=e.return}return[]}function id(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag&&27!==e.tag);return e||null}function od(e,t,n,r,i){for(var o=t._reactName,s=[];null!==n&&n!==r;){var a=n,l=a.alternate,u=a.stateNode;if(a=a.tag,null!==l&&l===r)break;5!==a&&26!==a&&27!==a||null===u||(l=u,i?null!=(u=Rt(n,o))&&s.unshift(nd(n,u,l)):i||null!=(u=Rt(n,o))&&s.push(nd(n,u,l))),n=n.return}0!==s.length&&e.push({event:t,listeners:s})}var sd=/\r\n?/g,ad=/\u0000|\uFFFD/g;function ld(e){return("string"==typeof e?e:""+e).replace(sd,"\n").replace(ad,"")}function ud(e,t){return t=ld(t),ld(e)===t}function cd(e,t,n,r,i,o){switch(n){case"children":"string"==typeof r?"body"===t||"textarea"===t&&""===r||It(e,r):("number"==typeof r||"bigint"==typeof r)&&"body"!==t&&It(e,""+r);break;case"className":ut(e,"class",r);break;case"tabIndex":ut(e,"tabindex",r);break;case"dir":case"role":case"viewBox":case"width":case"height":ut(e,n,r);break;case"style":Et(e,r,o);break;case"data":if("object"!==t){ut(e,"data",r);break}case"src":case"href":if(""===r&&("a"!==t||"href"!==n)){e.removeAttribute(n);break}if(null==r||"function"==typeof r||"symbol"==typeof r||"boolean"==typeof r){e.removeAttribute(n);break}r=Nt(""+r),e.setAttribute(n,r);break;case"action":case"formAction":if("function"==typeof r){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}if("function"==typeof o&&("formAction"===n?("input"!==t&&cd(e,t,"name",i.name,i,null),cd(e,t,"formEncType",i.formEncType,i,null),cd(e,t,"formMethod",i.formMethod,i,null),cd(e,t,"formTarget",i.formTarget,i,null)):(cd(e,t,"encType",i.encType,i,null),cd(e,t,"method",i.method,i,null),cd(e,t,"target",i.target,i,null))),null==r||"symbol"==typeof r||"boolean"==typeof r){e.removeAttribute(n);break}r=Nt(""+r),e.setAttribute(n,r);break;case"onClick":null!=r&&(e.onclick=Dt);break;case"onScroll":null!=r&&Gc("scroll",e);break;case"onScrollEnd":null!=r&&Gc("scrollend",e);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!=typeof r||!("__html"in r))throw Error(s(61));if(null!=(n=r.__html)){if(null!=i.children)throw Error(s(60));e.innerHTML=n}}break;case"multiple":e.multiple=r&&"function"!=typeof r&&"symbol"!=typeof r;break;case"muted":e.muted=r&&"function"!=typeof r&&"symbol"!=typeof r;break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":case"autoFocus":break;case"xlinkHref":if(null==r||"function"==typeof r||"boolean"==typeof r||"symbol"==typeof r){e.removeAttribute("xlink:href");break}n=Nt(""+r),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":null!=r&&"function"!=typeof r&&"symbol"!=typeof r?e.setAttribute(n,""+r):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":r&&"function"!=typeof r&&"symbol"!=typeof r?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":!0===r?e.setAttribute(n,""):!1!==r&&null!=r&&"function"!=typeof r&&"symbol"!=typeof r?e.setAttribute(n,r):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":null!=r&&"function"!=typeof r&&"symbol"!=typeof r&&!isNaN(r)&&1<=r?e.setAttribute(n,r):e.removeAttribute(n);break;case"rowSpan":case"start":null==r||"function"==typeof r||"symbol"==typeof r||isNaN(r)?e.removeAttribute(n):e.setAttribute(n,r);break;case"popover":Gc("beforetoggle",e),Gc("toggle",e),lt(e,"popover",r);break;case"xlinkActuate":ct(e,"http://www.w3.org/1999/xlink","xlink:actuate",r);break;case"xlinkArcrole":ct(e,"http://www.w3.org/1999/xlink","xlink:arcrole",r);break;case"xlinkRole":ct(e,"http://www.w3.org/1999/xlink","xlink:role",r);break;case"xlinkShow":ct(e,"http://www.w3.org/1999/xlink","xlink:show",r);break;case"xlinkTitle":ct(e,"http://www.w3.org/1999/xlink","xlink:title",r);break;case"xlinkType":ct(e,"http://www.w3.org/1999/xlink","xlink:type",r);break;case"xmlBase":ct(e,"http://www.w3.org/XML/1998/namespace","xml:base",r);break;case"xmlLang":ct(e,"http://www.w3.org/XML/1998/namespace","xml:lang",r);break;case"xmlSpace":ct(e,"http://www.w3.org/XML/1998/namespace","xml:space",r);break;case"is":lt(e,"is",r);break;case"innerText":case"textContent":break;default:(!(2<n.length)||"o"!==n[0]&&"O"!==n[0]||"n"!==n[1]&&"N"!==n[1])&&lt(e,n=At.get(n)||n,r)}}function dd(e,t,n,r,i,o){switch(n){case"style":Et(e,r,o);break;case"dangerouslySetInnerHTML":if(null!=r){if("object"!=typeof r||!("__html"in r))throw Error(s(61));if(null!=(n=r.__html)){if(null!=i.children)throw Error(s(60));e.innerHTML=n}}break;case"children":"string"==typeof r?It(e,r):("number"==typeof r||"bigint"==typeof r)&&It(e,""+r);break;case"onScroll":null!=r&&Gc("scroll",e);break;case"onScrollEnd":null!=r&&Gc("scrollend",e);break;case"onClick":null!=r&&(e.onclick=Dt);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":case"innerText":case"textContent":break;default:nt.hasOwnProperty(n)||("o"!==n[0]||"n"!==n[1]||(i=n.endsWith("Capture"),t=n.slice(2,i?n.length-7:void 0),"function"==typeof(o=null!=(o=e[Ve]||null)?o[n]:null)&&e.removeEventListener(t,o,i),"function"!=typeof r)?n in e?e[n]=r:!0===r?e.setAttribute(n,""):lt(e,n,r):("function"!=typeof o&&null!==o&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,r,i)))}}function fd(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Gc("error",e),Gc("load",e);var r,i=!1,o=!1;for(r in n)if(n.hasOwnProperty(r)){var a=n[r];if(null!=a)switch(r){case"src":i=!0;break;case"srcSet":o=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:cd(e,t,r,a,n,null)}}return o&&cd(e,t,"srcSet",n.srcSet,n,null),void(i&&cd(e,t,"src",n.src,n,null));case"input":Gc("invalid",e);var l=r=a=o=null,u=null,c=null;for(i in n)if(n.hasOwnProperty(i)){var d=n[i];if(null!=d)switch(i){case"name":o=d;break;case"type":a=d;break;case"checked":u=d;break;case"defaultChecked":c=d;break;case"value":r=d;break;case"defaultValue":l=d;break;case"children":case"dangerouslySetInnerHTML":if(null!=d)throw Error(s(137,t));break;default:cd(e,t,i,d,n,null)}}return void vt(e,r,l,u,c,a,o,!1);case"select":for(o in Gc("invalid",e),i=a=r=null,n)if(n.hasOwnProperty(o)&&null!=(l=n[o]))switch(o){case"value":r=l;break;case"defaultValue":a=l;break;case"multiple":i=l;default:cd(e,t,o,l,n,null)}return t=r,n=a,e.multiple=!!i,void(null!=t?_t(e,!!i,t,!1):null!=n&&_t(e,!!i,n,!0));case"textarea":for(a in Gc("invalid",e),r=o=i=null,n)if(n.hasOwnProperty(a)&&null!=(l=n[a]))switch(a){case"value":i=l;break;case"defaultValue":o=l;break;case"children":r=l;break;case"dangerouslySetInnerHTML":if(null!=l)throw Error(s(91));break;default:cd(e,t,a,l,n,null)}return void kt(e,i,o,r);case"option":for(u in n)n.hasOwnProperty(u)&&null!=(i=n[u])&&("selected"===u?e.selected=i&&"function"!=typeof i&&"symbol"!=typeof i:cd(e,t,u,i,n,null));return;case"dialog":Gc("beforetoggle",e),Gc("toggle",e),Gc("cancel",e),Gc("close",e);break;case"iframe":case"object":Gc("load",e);break;case"video":case"audio":for(i=0;i<qc.length;i++)Gc(qc[i],e);break;case"image":Gc("error",e),Gc("load",e);break;case"details":Gc("toggle",e);break;case"embed":case"source":case"link":Gc("error",e),Gc("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(c in n)if(n.hasOwnProperty(c)&&null!=(i=n[c]))switch(c){case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:cd(e,t,c,i,n,null)}return;default:if(Ot(t)){for(d in n)n.hasOwnProperty(d)&&void 0!==(i=n[d])&&dd(e,t,d,i,n,void 0);return}}for(l in n)n.hasOwnProperty(l)&&null!=(i=n[l])&&cd(e,t,l,i,n,null)}function hd(e){switch(e){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}var pd=null,yd=null;function bd(e){return 9===e.nodeType?e:e.ownerDocument}function md(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function gd(e,t){if(0===e)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return 1===e&&"foreignObject"===t?0:e}function vd(e,t){return"textarea"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"bigint"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var wd=null,_d="function"==typeof setTimeout?setTimeout:void 0,Sd="function"==typeof clearTimeout?clearTimeout:void 0,kd="function"==typeof Promise?Promise:void 0,Id="function"==typeof queueMicrotask?queueMicrotask:void 0!==kd?function(e){return kd.resolve(null).then(e).catch(Td)}:_d;function Td(e){setTimeout(function(){throw e})}function xd(e){return"head"===e}function Ed(e,t){var n=t,r=0;do{var i=n.nextSibling;if(e.removeChild(n),i&&8===i.nodeType)if("/$"===(n=i.data)||"/&"===n){if(0===r)return e.removeChild(i),void Wf(t);r--}else if("$"===n||"$?"===n||"$~"===n||"$!"===n||"&"===n)r++;else if("html"===n)zd(e.ownerDocument.documentElement);else if("head"===n){zd(n=e.ownerDocument.head);for(var o=n.firstChild;o;){var s=o.nextSibling,a=o.nodeName;o[Qe]||"SCRIPT"===a||"STYLE"===a||"LINK"===a&&"stylesheet"===o.rel.toLowerCase()||n.removeChild(o),o=s}}else"body"===n&&zd(e.ownerDocument.body);n=i}while(n);Wf(t)}function Od(e,t){var n=e;e=0;do{var r=n.nextSibling;if(1===n.nodeType?t?(n._stashedDisplay=n.style.display,n.style.display="none"):(n.style.display=n._stashedDisplay||"",""===n.getAttribute("style")&&n.removeAttribute("style")):3===n.nodeType&&(t?(n._stashedText=n.nodeValue,n.nodeValue=""):n.nodeValue=n._stashedText||""),r&&8===r.nodeType)if("/$"===(n=r.data)){if(0===e)break;e--}else"$"!==n&&"$?"!==n&&"$~"!==n&&"$!"!==n||e++;n=r}while(n)}function Ad(e){var t=e.firstChild;for(t&&10===t.nodeType&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":Ad(n),Ke(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if("stylesheet"===n.rel.toLowerCase())continue}e.removeChild(n)}}function Cd(e,t){for(;8!==e.nodeType;){if((1!==e.nodeType||"INPUT"!==e.nodeName||"hidden"!==e.type)&&!t)return null;if(null===(e=Bd(e.nextSibling)))return null}return e}function Nd(e){return"$?"===e.data||"$~"===e.data}function Dd(e){return"$!"===e.data||"$?"===e.data&&"loading"!==e.ownerDocument.readyState}function Bd(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t||"$~"===t||"&"===t||"F!"===t||"F"===t)break;if("/$"===t||"/&"===t)return null}}return e}var Fd=null;function Ld(e){e=e.nextSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n||"/&"===n){if(0===t)return Bd(e.nextSibling);t--}else"$"!==n&&"$!"!==n&&"$?"!==n&&"$~"!==n&&"&"!==n||t++}e=e.nextSibling}return null}function Md(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n||"$~"===n||"&"===n){if(0===t)return e;t--}else"/$"!==n&&"/&"!==n||t++}e=e.previousSibling}return null}function Pd(e,t,n){switch(t=bd(n),e){case"html":if(!(e=t.documentElement))throw Error(s(452));return e;case"head":if(!(e=t.head))throw Error(s(453));return e;case"body":if(!(e=t.body))throw Error(s(454));return e;default:throw Error(s(451))}}function zd(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Ke(e)}var Ud=new Map,Rd=new Set;function jd(e){return"function"==typeof e.getRootNode?e.getRootNode():9===e.nodeType?e:e.ownerDocument}var Vd=L.d;L.d={f:function(){var e=Vd.f(),t=Zu();return e||t},r:function(e){var t=Xe(e);null!==t&&5===t.tag&&"form"===t.type?ra(t):Vd.r(e)},D:function(e){Vd.D(e),Hd("dns-prefetch",e,null)},C:function(e,t){Vd.C(e,t),Hd("preconnect",e,t)},L:function(e,t,n){Vd.L(e,t,n);var r=$d;if(r&&e&&t){var i='link[rel="preload"][as="'+mt(t)+'"]';"image"===t&&n&&n.imageSrcSet?(i+='[imagesrcset="'+mt(n.imageSrcSet)+'"]',"string"==typeof n.imageSizes&&(i+='[imagesizes="'+mt(n.imageSizes)+'"]')):i+='[href="'+mt(e)+'"]';var o=i;switch(t){case"style":o=Yd(e);break;case"script":o=Kd(e)}Ud.has(o)||(e=h({rel:"preload",href:"image"===t&&n&&n.imageSrcSet?void 0:e,as:t},n),Ud.set(o,e),null!==r.querySelector(i)||"style"===t&&r.querySelector(qd(o))||"script"===t&&r.querySelector(Gd(o))||(fd(t=r.createElement("link"),"link",e),et(t),r.head.appendChild(t)))}},m:function(e,t){Vd.m(e,t);var n=$d;if(n&&e){var r=t&&"string"==typeof t.as?t.as:"script",i='link[rel="modulepreload"][as="'+mt(r)+'"][href="'+mt(e)+'"]',o=i;switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":o=Kd(e)}if(!Ud.has(o)&&(e=h({rel:"modulepreload",href:e},t),Ud.set(o,e),null===n.querySelector(i))){switch(r){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(Gd(o)))return}fd(r=n.createElement("link"),"link",e),et(r),n.head.appendChild(r)}}},X:function(e,t){Vd.X(e,t);var n=$d;if(n&&e){var r=Ze(n).hoistableScripts,i=Kd(e),o=r.get(i);o||((o=n.querySelector(Gd(i)))||(e=h({src:e,async:!0},t),(t=Ud.get(i))&&ef(e,t),et(o=n.createElement("script")),fd(o,"link",e),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},r.set(i,o))}},S:function(e,t,n){Vd.S(e,t,n);var r=$d;if(r&&e){var i=Ze(r).hoistableStyles,o=Yd(e);t=t||"default";var s=i.get(o);if(!s){var a={loading:0,preload:null};if(s=r.querySelector(qd(o)))a.loading=5;else{e=h({rel:"stylesheet",href:e,"data-precedence":t},n),(n=Ud.get(o))&&Zd(e,n);var l=s=r.createElement("link");et(l),fd(l,"link",e),l._p=new Promise(function(e,t){l.onload=e,l.onerror=t}),l.addEventListener("load",function(){a.loading|=1}),l.addEventListener("error",function(){a.loading|=2}),a.loading|=4,Jd(s,t,r)}s={type:"stylesheet",instance:s,count:1,state:a},i.set(o,s)}}},M:function(e,t){Vd.M(e,t);var n=$d;if(n&&e){var r=Ze(n).hoistableScripts,i=Kd(e),o=r.get(i);o||((o=n.querySelector(Gd(i)))||(e=h({src:e,async:!0,type:"module"},t),(t=Ud.get(i))&&ef(e,t),et(o=n.createElement("script")),fd(o,"link",e),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},r.set(i,o))}}};var $d="undefined"==typeof document?null:document;function Hd(e,t,n){var r=$d;if(r&&"string"==typeof t&&t){var i=mt(t);i='link[rel="'+e+'"][href="'+i+'"]',"string"==typeof n&&(i+='[crossorigin="'+n+'"]'),Rd.has(i)||(Rd.add(i),e={rel:e,crossOrigin:n,href:t},null===r.querySelector(i)&&(fd(t=r.createElement("link"),"link",e),et(t),r.head.appendChild(t)))}}function Wd(e,t,n,r){var i,o,a,l,u=(u=Y.current)?jd(u):null;if(!u)throw Error(s(446));switch(e){case"meta":case"title":return null;case"style":return"string"==typeof n.precedence&&"string"==typeof n.href?(t=Yd(n.href),(r=(n=Ze(u).hoistableStyles).get(t))||(r={type:"style",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};case"link":if("stylesheet"===n.rel&&"string"==typeof n.href&&"string"==typeof n.precedence){e=Yd(n.href);var c=Ze(u).hoistableStyles,d=c.get(e);if(d||(u=u.ownerDocument||u,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},c.set(e,d),(c=u.querySelector(qd(e)))&&!c._p&&(d.instance=c,d.state.loading=5),Ud.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},Ud.set(e,n),c||(i=u,o=e,a=n,l=d.state,i.querySelector('link[rel="preload"][as="style"]['+o+"]")?l.loading=1:(o=i.createElement("link"),l.preload=o,o.addEventListener("load",function(){return l.loading|=1}),o.addEventListener("error",function(){return l.loading|=2}),fd(o,"link",a),et(o),i.head.appendChild(o))))),t&&null===r)throw Error(s(528,""));return d}if(t&&null!==r)throw Error(s(529,""));return null;case"script":return t=n.async,"string"==typeof(n=n.src)&&t&&"function"!=typeof t&&"symbol"!=typeof t?(t=Kd(n),(r=(n=Ze(u).hoistableScripts).get(t))||(r={type:"script",instance:null,count:0,state:null},n.set(t,r)),r):{type:"void",instance:null,count:0,state:null};default:throw Error(s(444,e))}}function Yd(e){return'href="'+mt(e)+'"'}function qd(e){return'link[rel="stylesheet"]['+e+"]"}function Qd(e){return h({},e,{"data-precedence":e.precedence,precedence:null})}function Kd(e){return'[src="'+mt(e)+'"]'}function Gd(e){return"script[async]"+e}function Xd(e,t,n){if(t.count++,null===t.instance)switch(t.type){case"style":var r=e.querySelector('style[data-href~="'+mt(n.href)+'"]');if(r)return t.instance=r,et(r),r;var i=h({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return et(r=(e.ownerDocument||e).createElement("style")),fd(r,"style",i),Jd(r,n.precedence,e),t.instance=r;case"stylesheet":i=Yd(n.href);var o=e.querySelector(qd(i));if(o)return t.state.loading|=4,t.instance=o,et(o),o;r=Qd(n),(i=Ud.get(i))&&Zd(r,i),et(o=(e.ownerDocument||e).createElement("link"));var a=o;return a._p=new Promise(function(e,t){a.onload=e,a.onerror=t}),fd(o,"link",r),t.state.loading|=4,Jd(o,n.precedence,e),t.instance=o;case"script":return o=Kd(n.src),(i=e.querySelector(Gd(o)))?(t.instance=i,et(i),i):(r=n,(i=Ud.get(o))&&ef(r=h({},n),i),et(i=(e=e.ownerDocument||e).createElement("script")),fd(i,"link",r),e.head.appendChild(i),t.instance=i);case"void":return null;default:throw Error(s(443,t.type))}else"stylesheet"===t.type&&!(4&t.state.loading)&&(r=t.instance,t.state.loading|=4,Jd(r,n.precedence,e));return t.instance}function Jd(e,t,n){for(var r=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),i=r.length?r[r.length-1]:null,o=i,s=0;s<r.length;s++){var a=r[s];if(a.dataset.precedence===t)o=a;else if(o!==i)break}o?o.parentNode.insertBefore(e,o.nextSibling):(t=9===n.nodeType?n.head:n).insertBefore(e,t.firstChild)}function Zd(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.title&&(e.title=t.title)}function ef(e,t){null==e.crossOrigin&&(e.crossOrigin=t.crossOrigin),null==e.referrerPolicy&&(e.referrerPolicy=t.referrerPolicy),null==e.integrity&&(e.integrity=t.integrity)}var tf=null;function nf(e,t,n){if(null===tf){var r=new Map,i=tf=new Map;i.set(n,r)}else(r=(i=tf).get(n))||(r=new Map,i.set(n,r));if(r.has(e))return r;for(r.set(e,null),n=n.getElementsByTagName(e),i=0;i<n.length;i++){var o=n[i];if(!(o[Qe]||o[je]||"link"===e&&"stylesheet"===o.getAttribute("rel"))&&"http://www.w3.org/2000/svg"!==o.namespaceURI){var s=o.getAttribute(t)||"";s=e+s;var a=r.get(s);a?a.push(o):r.set(s,[o])}}return r}function rf(e,t,n){(e=e.ownerDocument||e).head.insertBefore(n,"title"===t?e.querySelector("head > title"):null)}function of(e){return!!("stylesheet"!==e.type||3&e.state.loading)}var sf=0;function af(){if(this.count--,0===this.count&&(0===this.imgCount||!this.waitingForImages))if(this.stylesheets)uf(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}var lf=null;function uf(e,t){e.stylesheets=null,null!==e.unsuspend&&(e.count++,lf=new Map,t.forEach(cf,e),lf=null,af.call(e))}function cf(e,t){if(!(4&t.state.loading)){var n=lf.get(e);if(n)var r=n.get(null);else{n=new Map,lf.set(e,n);for(var i=e.querySelectorAll("link[data-precedence],style[data-precedence]"),o=0;o<i.length;o++){var s=i[o];"LINK"!==s.nodeName&&"not all"===s.getAttribute("media")||(n.set(s.dataset.precedence,s),r=s)}r&&n.set(null,r)}s=(i=t.instance).getAttribute("data-precedence"),(o=n.get(s)||r)===r&&n.set(null,i),n.set(s,i),this.count++,r=af.bind(this),i.addEventListener("load",r),i.addEventListener("error",r),o?o.parentNode.insertBefore(i,o.nextSibling):(e=9===e.nodeType?e.head:e).insertBefore(i,e.firstChild),t.state.loading|=4}}var df={$$typeof:_,Provider:null,Consumer:null,_currentValue:M,_currentValue2:M,_threadCount:0};function ff(e,t,n,r,i,o,s,a,l){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Ne(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Ne(0),this.hiddenUpdates=Ne(null),this.identifierPrefix=r,this.onUncaughtError=i,this.onCaughtError=o,this.onRecoverableError=s,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=l,this.incompleteTransitions=new Map}function hf(e,t,n,r,i,o,s,a,l,u,c,d){return e=new ff(e,t,n,s,l,u,c,d,a),t=1,!0===o&&(t|=24),o=zr(3,null,null,t),e.current=o,o.stateNode=e,(t=Ui()).refCount++,e.pooledCache=t,t.refCount++,o.memoizedState={element:r,isDehydrated:n,cache:t},mo(o),e}function pf(e){return e?e=Mr:Mr}function yf(e,t,n,r,i,o){i=pf(i),null===r.context?r.context=i:r.pendingContext=i,(r=vo(t)).payload={element:n},null!==(o=void 0===o?null:o)&&(r.callback=o),null!==(n=wo(e,r,t))&&(Qu(n,0,t),_o(n,e,t))}function bf(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function mf(e,t){bf(e,t),(e=e.alternate)&&bf(e,t)}function gf(e){if(13===e.tag||31===e.tag){var t=Br(e,67108864);null!==t&&Qu(t,0,67108864),mf(e,67108864)}}function vf(e){if(13===e.tag||31===e.tag){var t=Yu(),n=Br(e,t=Me(t));null!==n&&Qu(n,0,t),mf(e,t)}}var wf=!0;function _f(e,t,n,r){var i=F.T;F.T=null;var o=L.p;try{L.p=2,kf(e,t,n,r)}finally{L.p=o,F.T=i}}function Sf(e,t,n,r){var i=F.T;F.T=null;var o=L.p;try{L.p=8,kf(e,t,n,r)}finally{L.p=o,F.T=i}}function kf(e,t,n,r){if(wf){var i=If(r);if(null===i)td(e,t,r,Tf,n),Mf(e,r);else if(function(e,t,n,r,i){switch(t){case"focusin":return Af=Pf(Af,e,t,n,r,i),!0;case"dragenter":return Cf=Pf(Cf,e,t,n,r,i),!0;case"mouseover":return Nf=Pf(Nf,e,t,n,r,i),!0;case"pointerover":var o=i.pointerId;return Df.set(o,Pf(Df.get(o)||null,e,t,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,Bf.set(o,Pf(Bf.get(o)||null,e,t,n,r,i)),!0}return!1}(i,e,t,n,r))r.stopPropagation();else if(Mf(e,r),4&t&&-1<Lf.indexOf(e)){for(;null!==i;){var o=Xe(i);if(null!==o)switch(o.tag){case 3:if((o=o.stateNode).current.memoizedState.isDehydrated){var s=xe(o.pendingLanes);if(0!==s){var a=o;for(a.pendingLanes|=2,a.entangledLanes|=2;s;){var l=1<<31-we(s);a.entanglements[1]|=l,s&=~l}Lc(o),!(6&hu)&&(Fu=le()+500,Mc(0,!1))}}break;case 31:case 13:null!==(a=Br(o,2))&&Qu(a,0,2),Zu(),mf(o,2)}if(null===(o=If(r))&&td(e,t,r,Tf,n),o===i)break;i=o}null!==i&&r.stopPropagation()}else td(e,t,r,null,n)}}function If(e){return xf(e=Ft(e))}var Tf=null;function xf(e){if(Tf=null,null!==(e=Ge(e))){var t=l(e);if(null===t)e=null;else{var n=t.tag;if(13===n){if(null!==(e=u(t)))return e;e=null}else if(31===n){if(null!==(e=c(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return Tf=e,null}function Ef(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ue()){case ce:return 2;case de:return 8;case fe:case he:return 32;case pe:return 268435456;default:return 32}default:return 32}}var Of=!1,Af=null,Cf=null,Nf=null,Df=new Map,Bf=new Map,Ff=[],Lf="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Mf(e,t){switch(e){case"focusin":case"focusout":Af=null;break;case"dragenter":case"dragleave":Cf=null;break;case"mouseover":case"mouseout":Nf=null;break;case"pointerover":case"pointerout":Df.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Bf.delete(t.pointerId)}}function Pf(e,t,n,r,i,o){return null===e||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[i]},null!==t&&null!==(t=Xe(t))&&gf(t),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==i&&-1===t.indexOf(i)&&t.push(i),e)}function zf(e){var t=Ge(e.target);if(null!==t){var n=l(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=u(n)))return e.blockedOn=t,void Ue(e.priority,function(){vf(n)})}else if(31===t){if(null!==(t=c(n)))return e.blockedOn=t,void Ue(e.priority,function(){vf(n)})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Uf(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=If(e.nativeEvent);if(null!==n)return null!==(t=Xe(n))&&gf(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);Bt=r,n.target.dispatchEvent(r),Bt=null,t.shift()}return!0}function Rf(e,t,n){Uf(e)&&n.delete(t)}function jf(){Of=!1,null!==Af&&Uf(Af)&&(Af=null),null!==Cf&&Uf(Cf)&&(Cf=null),null!==Nf&&Uf(Nf)&&(Nf=null),Df.forEach(Rf),Bf.forEach(Rf)}function Vf(e,t){e.blockedOn===t&&(e.blockedOn=null,Of||(Of=!0,r.unstable_scheduleCallback(r.unstable_NormalPriority,jf)))}var $f=null;function Hf(e){$f!==e&&($f=e,r.unstable_scheduleCallback(r.unstable_NormalPriority,function(){$f===e&&($f=null);for(var t=0;t<e.length;t+=3){var n=e[t],r=e[t+1],i=e[t+2];if("function"!=typeof r){if(null===xf(r||n))continue;break}var o=Xe(n);null!==o&&(e.splice(t,3),t-=3,ta(o,{pending:!0,data:i,method:n.method,action:r},r,i))}}))}function Wf(e){function t(t){return Vf(t,e)}null!==Af&&Vf(Af,e),null!==Cf&&Vf(Cf,e),null!==Nf&&Vf(Nf,e),Df.forEach(t),Bf.forEach(t);for(var n=0;n<Ff.length;n++){var r=Ff[n];r.blockedOn===e&&(r.blockedOn=null)}for(;0<Ff.length&&null===(n=Ff[0]).blockedOn;)zf(n),null===n.blockedOn&&Ff.shift();if(null!=(n=(e.ownerDocument||e).$$reactFormReplay))for(r=0;r<n.length;r+=3){var i=n[r],o=n[r+1],s=i[Ve]||null;if("function"==typeof o)s||Hf(n);else if(s){var a=null;if(o&&o.hasAttribute("formAction")){if(i=o,s=o[Ve]||null)a=s.formAction;else if(null!==xf(i))continue}else a=s.action;"function"==typeof a?n[r+1]=a:(n.splice(r,3),r-=3),Hf(n)}}}function Yf(){function e(e){e.canIntercept&&"react-transition"===e.info&&e.intercept({handler:function(){return new Promise(function(e){return i=e})},focusReset:"manual",scroll:"manual"})}function t(){null!==i&&(i(),i=null),r||setTimeout(n,20)}function n(){if(!r&&!navigation.transition){var e=navigation.currentEntry;e&&null!=e.url&&navigation.navigate(e.url,{state:e.getState(),info:"react-transition",history:"replace"})}}if("object"==typeof navigation){var r=!1,i=null;return navigation.addEventListener("navigate",e),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(n,100),function(){r=!0,navigation.removeEventListener("navigate",e),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),null!==i&&(i(),i=null)}}}function qf(e){this._internalRoot=e}function Qf(e){this._internalRoot=e}Qf.prototype.render=qf.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(s(409));yf(t.current,Yu(),e,t,null,null)},Qf.prototype.unmount=qf.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;yf(e.current,2,null,e,null,null),Zu(),t[$e]=null}},Qf.prototype.unstable_scheduleHydration=function(e){if(e){var t=ze();e={blockedOn:null,target:e,priority:t};for(var n=0;n<Ff.length&&0!==t&&t<Ff[n].priority;n++);Ff.splice(n,0,e),0===n&&zf(e)}};var Kf=i.version;if("19.2.0"!==Kf)throw Error(s(527,Kf,"19.2.0"));L.findDOMNode=function(e){var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(s(188));throw e=Object.keys(e).join(","),Error(s(268,e))}return e=function(e){var t=e.alternate;if(!t){if(null===(t=l(e)))throw Error(s(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var o=i.alternate;if(null===o){if(null!==(r=i.return)){n=r;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return d(i),e;if(o===r)return d(i),t;o=o.sibling}throw Error(s(188))}if(n.return!==r.return)n=i,r=o;else{for(var a=!1,u=i.child;u;){if(u===n){a=!0,n=i,r=o;break}if(u===r){a=!0,r=i,n=o;break}u=u.sibling}if(!a){for(u=o.child;u;){if(u===n){a=!0,n=o,r=i;break}if(u===r){a=!0,r=o,n=i;break}u=u.sibling}if(!a)throw Error(s(189))}}if(n.alternate!==r)throw Error(s(190))}if(3!==n.tag)throw Error(s(188));return n.stateNode.current===n?e:t}(t),null===(e=null!==e?f(e):null)?null:e.stateNode};var Gf={bundleType:0,version:"19.2.0",rendererPackageName:"react-dom",currentDispatcherRef:F,reconcilerVersion:"19.2.0"};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var Xf=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xf.isDisabled&&Xf.supportsFiber)try{me=Xf.inject(Gf),ge=Xf}catch(e){}}t.createRoot=function(e,t){if(!a(e))throw Error(s(299));var n=!1,r="",i=Ia,o=Ta,l=xa;return null!=t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onUncaughtError&&(i=t.onUncaughtError),void 0!==t.onCaughtError&&(o=t.onCaughtError),void 0!==t.onRecoverableError&&(l=t.onRecoverableError)),t=hf(e,1,!1,null,0,n,r,null,i,o,l,Yf),e[$e]=t.current,Zc(e),new qf(t)},t.hydrateRoot=function(e,t,n){if(!a(e))throw Error(s(299));var r=!1,i="",o=Ia,l=Ta,u=xa,c=null;return null!=n&&(!0===n.unstable_strictMode&&(r=!0),void 0!==n.identifierPrefix&&(i=n.identifierPrefix),void 0!==n.onUncaughtError&&(o=n.onUncaughtError),void 0!==n.onCaughtError&&(l=n.onCaughtError),void 0!==n.onRecoverableError&&(u=n.onRecoverableError),void 0!==n.formState&&(c=n.formState)),(t=hf(e,1,!0,t,0,r,i,c,o,l,u,Yf)).context=pf(null),n=t.current,(i=vo(r=Me(r=Yu()))).callback=null,wo(n,i,r),n=r,t.current.lanes=n,De(t,n),Lc(t),e[$e]=t.current,Zc(e),new Qf(t)},t.version="19.2.0"},203:function(e,t,n){!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(715)},379:function(e,t){function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,i=e[r];if(!(0<o(i,t)))break e;e[r]=t,e[n]=i,n=r}}function r(e){return 0===e.length?null:e[0]}function i(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,i=e.length,s=i>>>1;r<s;){var a=2*(r+1)-1,l=e[a],u=a+1,c=e[u];if(0>o(l,n))u<i&&0>o(c,l)?(e[r]=c,e[u]=n,r=u):(e[r]=l,e[a]=n,r=a);else{if(!(u<i&&0>o(c,n)))break e;e[r]=c,e[u]=n,r=u}}}return t}function o(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if(t.unstable_now=void 0,"object"==typeof performance&&"function"==typeof performance.now){var s=performance;t.unstable_now=function(){return s.now()}}else{var a=Date,l=a.now();t.unstable_now=function(){return a.now()-l}}var u=[],c=[],d=1,f=null,h=3,p=!1,y=!1,b=!1,m=!1,g="function"==typeof setTimeout?setTimeout:null,v="function"==typeof clearTimeout?clearTimeout:null,w="undefined"!=typeof setImmediate?setImmediate:null;function _(e){for(var t=r(c);null!==t;){if(null===t.callback)i(c);else{if(!(t.startTime<=e))break;i(c),t.sortIndex=t.expirationTime,n(u,t)}t=r(c)}}function S(e){if(b=!1,_(e),!y)if(null!==r(u))y=!0,I||(I=!0,k());else{var t=r(c);null!==t&&D(S,t.startTime-e)}}var k,I=!1,T=-1,x=5,E=-1;function O(){return!(!m&&t.unstable_now()-E<x)}function A(){if(m=!1,I){var e=t.unstable_now();E=e;var n=!0;try{e:{y=!1,b&&(b=!1,v(T),T=-1),p=!0;var o=h;try{t:{for(_(e),f=r(u);null!==f&&!(f.expirationTime>e&&O());){var s=f.callback;if("function"==typeof s){f.callback=null,h=f.priorityLevel;var a=s(f.expirationTime<=e);if(e=t.unstable_now(),"function"==typeof a){f.callback=a,_(e),n=!0;break t}f===r(u)&&i(u),_(e)}else i(u);f=r(u)}if(null!==f)n=!0;else{var l=r(c);null!==l&&D(S,l.startTime-e),n=!1}}break e}finally{f=null,h=o,p=!1}n=void 0}}finally{n?k():I=!1}}}if("function"==typeof w)k=function(){w(A)};else if("undefined"!=typeof MessageChannel){var C=new MessageChannel,N=C.port2;C.port1.onmessage=A,k=function(){N.postMessage(null)}}else k=function(){g(A,0)};function D(e,n){T=g(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):x=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return h},t.unstable_next=function(e){switch(h){case 1:case 2:case 3:var t=3;break;default:t=h}var n=h;h=t;try{return e()}finally{h=n}},t.unstable_requestPaint=function(){m=!0},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=h;h=e;try{return t()}finally{h=n}},t.unstable_scheduleCallback=function(e,i,o){var s=t.unstable_now();switch(o="object"==typeof o&&null!==o&&"number"==typeof(o=o.delay)&&0<o?s+o:s,e){case 1:var a=-1;break;case 2:a=250;break;case 5:a=1073741823;break;case 4:a=1e4;break;default:a=5e3}return e={id:d++,callback:i,priorityLevel:e,startTime:o,expirationTime:a=o+a,sortIndex:-1},o>s?(e.sortIndex=o,n(c,e),null===r(u)&&e===r(c)&&(b?(v(T),T=-1):b=!0,D(S,o-s))):(e.sortIndex=a,n(u,e),y||p||(y=!0,I||(I=!0,k()))),e},t.unstable_shouldYield=O,t.unstable_wrapCallback=function(e){var t=h;return function(){var n=h;h=t;try{return e.apply(this,arguments)}finally{h=n}}}},409:function(e,t,n){e.exports=n(493)},416:function(e,t,n){var r=n(409),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},s={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},a={};function l(e){return r.isMemo(e)?s:a[e.$$typeof]||i}a[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},a[r.Memo]=s;var u=Object.defineProperty,c=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,h=Object.getPrototypeOf,p=Object.prototype;e.exports=function e(t,n,r){if("string"!=typeof n){if(p){var i=h(n);i&&i!==p&&e(t,i,r)}var s=c(n);d&&(s=s.concat(d(n)));for(var a=l(t),y=l(n),b=0;b<s.length;++b){var m=s[b];if(!(o[m]||r&&r[m]||y&&y[m]||a&&a[m])){var g=f(n,m);try{u(t,m,g)}catch(e){}}}}return t}},493:function(e,t){var n="function"==typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,s=n?Symbol.for("react.strict_mode"):60108,a=n?Symbol.for("react.profiler"):60114,l=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,f=n?Symbol.for("react.forward_ref"):60112,h=n?Symbol.for("react.suspense"):60113,p=n?Symbol.for("react.suspense_list"):60120,y=n?Symbol.for("react.memo"):60115,b=n?Symbol.for("react.lazy"):60116,m=n?Symbol.for("react.block"):60121,g=n?Symbol.for("react.fundamental"):60117,v=n?Symbol.for("react.responder"):60118,w=n?Symbol.for("react.scope"):60119;function _(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case d:case o:case a:case s:case h:return e;default:switch(e=e&&e.$$typeof){case u:case f:case b:case y:case l:return e;default:return t}}case i:return t}}}function S(e){return _(e)===d}t.AsyncMode=c,t.ConcurrentMode=d,t.ContextConsumer=u,t.ContextProvider=l,t.Element=r,t.ForwardRef=f,t.Fragment=o,t.Lazy=b,t.Memo=y,t.Portal=i,t.Profiler=a,t.StrictMode=s,t.Suspense=h,t.isAsyncMode=function(e){return S(e)||_(e)===c},t.isConcurrentMode=S,t.isContextConsumer=function(e){return _(e)===u},t.isContextProvider=function(e){return _(e)===l},t.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return _(e)===f},t.isFragment=function(e){return _(e)===o},t.isLazy=function(e){return _(e)===b},t.isMemo=function(e){return _(e)===y},t.isPortal=function(e){return _(e)===i},t.isProfiler=function(e){return _(e)===a},t.isStrictMode=function(e){return _(e)===s},t.isSuspense=function(e){return _(e)===h},t.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===o||e===d||e===a||e===s||e===h||e===p||"object"==typeof e&&null!==e&&(e.$$typeof===b||e.$$typeof===y||e.$$typeof===l||e.$$typeof===u||e.$$typeof===f||e.$$typeof===g||e.$$typeof===v||e.$$typeof===w||e.$$typeof===m)},t.typeOf=_},538:function(e){var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map(function(e){return t[e]}).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach(function(e){r[e]=e}),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,i){for(var o,s,a=function(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}(e),l=1;l<arguments.length;l++){for(var u in o=Object(arguments[l]))n.call(o,u)&&(a[u]=o[u]);if(t){s=t(o);for(var c=0;c<s.length;c++)r.call(o,s[c])&&(a[s[c]]=o[s[c]])}}return a}},568:function(e,t){var n=Symbol.for("react.transitional.element");function r(e,t,r){var i=null;if(void 0!==r&&(i=""+r),void 0!==t.key&&(i=""+t.key),"key"in t)for(var o in r={},t)"key"!==o&&(r[o]=t[o]);else r=t;return t=r.ref,{$$typeof:n,type:e,key:i,ref:void 0!==t?t:null,props:r}}Symbol.for("react.fragment"),t.jsx=r,t.jsxs=r},602:function(e,t,n){e.exports=n(923)},715:function(e,t,n){var r=n(602);function i(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function o(){}var s={d:{f:o,r:function(){throw Error(i(522))},D:o,C:o,L:o,m:o,X:o,S:o,M:o},p:0,findDOMNode:null},a=Symbol.for("react.portal"),l=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function u(e,t){return"font"===e?"":"string"==typeof t?"use-credentials"===t?t:"":void 0}t.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=s,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!t||1!==t.nodeType&&9!==t.nodeType&&11!==t.nodeType)throw Error(i(299));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:a,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.flushSync=function(e){var t=l.T,n=s.p;try{if(l.T=null,s.p=2,e)return e()}finally{l.T=t,s.p=n,s.d.f()}},t.preconnect=function(e,t){"string"==typeof e&&(t=t?"string"==typeof(t=t.crossOrigin)?"use-credentials"===t?t:"":void 0:null,s.d.C(e,t))},t.prefetchDNS=function(e){"string"==typeof e&&s.d.D(e)},t.preinit=function(e,t){if("string"==typeof e&&t&&"string"==typeof t.as){var n=t.as,r=u(n,t.crossOrigin),i="string"==typeof t.integrity?t.integrity:void 0,o="string"==typeof t.fetchPriority?t.fetchPriority:void 0;"style"===n?s.d.S(e,"string"==typeof t.precedence?t.precedence:void 0,{crossOrigin:r,integrity:i,fetchPriority:o}):"script"===n&&s.d.X(e,{crossOrigin:r,integrity:i,fetchPriority:o,nonce:"string"==typeof t.nonce?t.nonce:void 0})}},t.preinitModule=function(e,t){if("string"==typeof e)if("object"==typeof t&&null!==t){if(null==t.as||"script"===t.as){var n=u(t.as,t.crossOrigin);s.d.M(e,{crossOrigin:n,integrity:"string"==typeof t.integrity?t.integrity:void 0,nonce:"string"==typeof t.nonce?t.nonce:void 0})}}else null==t&&s.d.M(e)},t.preload=function(e,t){if("string"==typeof e&&"object"==typeof t&&null!==t&&"string"==typeof t.as){var n=t.as,r=u(n,t.crossOrigin);s.d.L(e,n,{crossOrigin:r,integrity:"string"==typeof t.integrity?t.integrity:void 0,nonce:"string"==typeof t.nonce?t.nonce:void 0,type:"string"==typeof t.type?t.type:void 0,fetchPriority:"string"==typeof t.fetchPriority?t.fetchPriority:void 0,referrerPolicy:"string"==typeof t.referrerPolicy?t.referrerPolicy:void 0,imageSrcSet:"string"==typeof t.imageSrcSet?t.imageSrcSet:void 0,imageSizes:"string"==typeof t.imageSizes?t.imageSizes:void 0,media:"string"==typeof t.media?t.media:void 0})}},t.preloadModule=function(e,t){if("string"==typeof e)if(t){var n=u(t.as,t.crossOrigin);s.d.m(e,{as:"string"==typeof t.as&&"script"!==t.as?t.as:void 0,crossOrigin:n,integrity:"string"==typeof t.integrity?t.integrity:void 0})}else s.d.m(e)},t.requestFormReset=function(e){s.d.r(e)},t.unstable_batchedUpdates=function(e,t){return e(t)},t.useFormState=function(e,t,n){return l.H.useFormState(e,t,n)},t.useFormStatus=function(){return l.H.useHostTransitionStatus()},t.version="19.2.0"},912:function(e,t,n){e.exports=n(379)},923:function(e,t){var n=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),i=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),s=Symbol.for("react.profiler"),a=Symbol.for("react.consumer"),l=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),f=Symbol.for("react.lazy"),h=Symbol.for("react.activity"),p=Symbol.iterator,y={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},b=Object.assign,m={};function g(e,t,n){this.props=e,this.context=t,this.refs=m,this.updater=n||y}function v(){}function w(e,t,n){this.props=e,this.context=t,this.refs=m,this.updater=n||y}g.prototype.isReactComponent={},g.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},g.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=g.prototype;var _=w.prototype=new v;_.constructor=w,b(_,g.prototype),_.isPureReactComponent=!0;var S=Array.isArray;function k(){}var I={H:null,A:null,T:null,S:null},T=Object.prototype.hasOwnProperty;function x(e,t,r){var i=r.ref;return{$$typeof:n,type:e,key:t,ref:void 0!==i?i:null,props:r}}function E(e){return"object"==typeof e&&null!==e&&e.$$typeof===n}var O=/\/+/g;function A(e,t){return"object"==typeof e&&null!==e&&null!=e.key?(n=""+e.key,r={"=":"=0",":":"=2"},"$"+n.replace(/[=:]/g,function(e){return r[e]})):t.toString(36);var n,r}function C(e,t,i,o,s){var a=typeof e;"undefined"!==a&&"boolean"!==a||(e=null);var l,u,c=!1;if(null===e)c=!0;else switch(a){case"bigint":case"string":case"number":c=!0;break;case"object":switch(e.$$typeof){case n:case r:c=!0;break;case f:return C((c=e._init)(e._payload),t,i,o,s)}}if(c)return s=s(e),c=""===o?"."+A(e,0):o,S(s)?(i="",null!=c&&(i=c.replace(O,"$&/")+"/"),C(s,t,i,"",function(e){return e})):null!=s&&(E(s)&&(l=s,u=i+(null==s.key||e&&e.key===s.key?"":(""+s.key).replace(O,"$&/")+"/")+c,s=x(l.type,u,l.props)),t.push(s)),1;c=0;var d,h=""===o?".":o+":";if(S(e))for(var y=0;y<e.length;y++)c+=C(o=e[y],t,i,a=h+A(o,y),s);else if("function"==typeof(y=null===(d=e)||"object"!=typeof d?null:"function"==typeof(d=p&&d[p]||d["@@iterator"])?d:null))for(e=y.call(e),y=0;!(o=e.next()).done;)c+=C(o=o.value,t,i,a=h+A(o,y++),s);else if("object"===a){if("function"==typeof e.then)return C(function(e){switch(e.status){case"fulfilled":return e.value;case"rejected":throw e.reason;default:switch("string"==typeof e.status?e.then(k,k):(e.status="pending",e.then(function(t){"pending"===e.status&&(e.status="fulfilled",e.value=t)},function(t){"pending"===e.status&&(e.status="rejected",e.reason=t)})),e.status){case"fulfilled":return e.value;case"rejected":throw e.reason}}throw e}(e),t,i,o,s);throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.")}return c}function N(e,t,n){if(null==e)return e;var r=[],i=0;return C(e,r,"","",function(e){return t.call(n,e,i++)}),r}function D(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var B="function"==typeof reportError?reportError:function(e){if("object"==typeof window&&"function"==typeof window.ErrorEvent){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:"object"==typeof e&&null!==e&&"string"==typeof e.message?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if("object"==typeof process&&"function"==typeof process.emit)return void process.emit("uncaughtException",e);console.error(e)},F={map:N,forEach:function(e,t,n){N(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return N(e,function(){t++}),t},toArray:function(e){return N(e,function(e){return e})||[]},only:function(e){if(!E(e))throw Error("React.Children.only expected to receive a single React element child.");return e}};t.Activity=h,t.Children=F,t.Component=g,t.Fragment=i,t.Profiler=s,t.PureComponent=w,t.StrictMode=o,t.Suspense=c,t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=I,t.__COMPILER_RUNTIME={__proto__:null,c:function(e){return I.H.useMemoCache(e)}},t.cache=function(e){return function(){return e.apply(null,arguments)}},t.cacheSignal=function(){return null},t.cloneElement=function(e,t,n){if(null==e)throw Error("The argument must be a React element, but you passed "+e+".");var r=b({},e.props),i=e.key;if(null!=t)for(o in void 0!==t.key&&(i=""+t.key),t)!T.call(t,o)||"key"===o||"__self"===o||"__source"===o||"ref"===o&&void 0===t.ref||(r[o]=t[o]);var o=arguments.length-2;if(1===o)r.children=n;else if(1<o){for(var s=Array(o),a=0;a<o;a++)s[a]=arguments[a+2];r.children=s}return x(e.type,i,r)},t.createContext=function(e){return(e={$$typeof:l,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider=e,e.Consumer={$$typeof:a,_context:e},e},t.createElement=function(e,t,n){var r,i={},o=null;if(null!=t)for(r in void 0!==t.key&&(o=""+t.key),t)T.call(t,r)&&"key"!==r&&"__self"!==r&&"__source"!==r&&(i[r]=t[r]);var s=arguments.length-2;if(1===s)i.children=n;else if(1<s){for(var a=Array(s),l=0;l<s;l++)a[l]=arguments[l+2];i.children=a}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===i[r]&&(i[r]=s[r]);return x(e,o,i)},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:u,render:e}},t.isValidElement=E,t.lazy=function(e){return{$$typeof:f,_payload:{_status:-1,_result:e},_init:D}},t.memo=function(e,t){return{$$typeof:d,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=I.T,n={};I.T=n;try{var r=e(),i=I.S;null!==i&&i(n,r),"object"==typeof r&&null!==r&&"function"==typeof r.then&&r.then(k,B)}catch(e){B(e)}finally{null!==t&&null!==n.types&&(t.types=n.types),I.T=t}},t.unstable_useCacheRefresh=function(){return I.H.useCacheRefresh()},t.use=function(e){return I.H.use(e)},t.useActionState=function(e,t,n){return I.H.useActionState(e,t,n)},t.useCallback=function(e,t){return I.H.useCallback(e,t)},t.useContext=function(e){return I.H.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e,t){return I.H.useDeferredValue(e,t)},t.useEffect=function(e,t){return I.H.useEffect(e,t)},t.useEffectEvent=function(e){return I.H.useEffectEvent(e)},t.useId=function(){return I.H.useId()},t.useImperativeHandle=function(e,t,n){return I.H.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return I.H.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return I.H.useLayoutEffect(e,t)},t.useMemo=function(e,t){return I.H.useMemo(e,t)},t.useOptimistic=function(e,t){return I.H.useOptimistic(e,t)},t.useReducer=function(e,t,n){return I.H.useReducer(e,t,n)},t.useRef=function(e){return I.H.useRef(e)},t.useState=function(e){return I.H.useState(e)},t.useSyncExternalStore=function(e,t,n){return I.H.useSyncExternalStore(e,t,n)},t.useTransition=function(){return I.H.useTransition()},t.version="19.2.0"},938:function(e,t,n){var r=n(538),i="function"==typeof Symbol&&Symbol.for;i&&Symbol.for("react.element"),i&&Symbol.for("react.portal"),i&&Symbol.for("react.fragment"),i&&Symbol.for("react.strict_mode"),i&&Symbol.for("react.profiler"),i&&Symbol.for("react.provider"),i&&Symbol.for("react.context"),i&&Symbol.for("react.forward_ref"),i&&Symbol.for("react.suspense"),i&&Symbol.for("react.memo"),i&&Symbol.for("react.lazy"),"function"==typeof Symbol&&Symbol.iterator;function o(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var s={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},a={};function l(e,t,n){this.props=e,this.context=t,this.refs=a,this.updater=n||s}function u(){}function c(e,t,n){this.props=e,this.context=t,this.refs=a,this.updater=n||s}l.prototype.isReactComponent={},l.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(o(85));this.updater.enqueueSetState(this,e,t,"setState")},l.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},u.prototype=l.prototype;var d=c.prototype=new u;d.constructor=c,r(d,l.prototype),d.isPureReactComponent=!0;Object.prototype.hasOwnProperty;t.PureComponent=c},939:function(e,t,n){e.exports=n(938)}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={exports:{}};return e[r](o,o.exports,n),o.exports}var r,i,o,s,a,l,u,c,d,f=n(74),h=n(602),p=n(188),y=(n(416),n(939));!function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4",e[e.V5=4]="V5"}(r||(r={})),function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(i||(i={})),function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(o||(o={})),function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(s||(s={})),function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(a||(a={})),function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME",e[e.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(l||(l={})),function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(u||(u={})),function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.Float=3]="Float",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct=13]="Struct",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Dictionary=-1]="Dictionary",e[e.Int8=-2]="Int8",e[e.Int16=-3]="Int16",e[e.Int32=-4]="Int32",e[e.Int64=-5]="Int64",e[e.Uint8=-6]="Uint8",e[e.Uint16=-7]="Uint16",e[e.Uint32=-8]="Uint32",e[e.Uint64=-9]="Uint64",e[e.Float16=-10]="Float16",e[e.Float32=-11]="Float32",e[e.Float64=-12]="Float64",e[e.DateDay=-13]="DateDay",e[e.DateMillisecond=-14]="DateMillisecond",e[e.TimestampSecond=-15]="TimestampSecond",e[e.TimestampMillisecond=-16]="TimestampMillisecond",e[e.TimestampMicrosecond=-17]="TimestampMicrosecond",e[e.TimestampNanosecond=-18]="TimestampNanosecond",e[e.TimeSecond=-19]="TimeSecond",e[e.TimeMillisecond=-20]="TimeMillisecond",e[e.TimeMicrosecond=-21]="TimeMicrosecond",e[e.TimeNanosecond=-22]="TimeNanosecond",e[e.DenseUnion=-23]="DenseUnion",e[e.SparseUnion=-24]="SparseUnion",e[e.IntervalDayTime=-25]="IntervalDayTime",e[e.IntervalYearMonth=-26]="IntervalYearMonth"}(c||(c={})),function(e){e[e.OFFSET=0]="OFFSET",e[e.DATA=1]="DATA",e[e.VALIDITY=2]="VALIDITY",e[e.TYPE=3]="TYPE"}(d||(d={}));const[b,m]=(()=>{const e=()=>{throw new Error("BigInt is not available in this environment")};function t(){throw e()}return t.asIntN=()=>{throw e()},t.asUintN=()=>{throw e()},"undefined"!=typeof BigInt?[BigInt,!0]:[t,!1]})(),[g,v]=(()=>{const e=()=>{throw new Error("BigInt64Array is not available in this environment")};return"undefined"!=typeof BigInt64Array?[BigInt64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),[w,_]=(()=>{const e=()=>{throw new Error("BigUint64Array is not available in this environment")};return"undefined"!=typeof BigUint64Array?[BigUint64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),S=e=>"boolean"==typeof e,k=e=>"function"==typeof e,I=e=>null!=e&&Object(e)===e,T=e=>I(e)&&k(e.then),x=e=>I(e)&&k(e[Symbol.iterator]),E=e=>I(e)&&k(e[Symbol.asyncIterator]),O=e=>I(e)&&I(e.schema),A=e=>I(e)&&"done"in e&&"value"in e,C=e=>I(e)&&k(e.stat)&&(e=>"number"==typeof e)(e.fd),N=e=>I(e)&&B(e.body),D=e=>"_getDOMStream"in e&&"_getNodeStream"in e,B=e=>I(e)&&k(e.cancel)&&k(e.getReader)&&!D(e),F=e=>I(e)&&k(e.read)&&k(e.pipe)&&S(e.readable)&&!D(e);function L(e){if(null===e)return"null";if(void 0===e)return"undefined";switch(typeof e){case"number":case"bigint":return`${e}`;case"string":return`"${e}"`}return"function"==typeof e[Symbol.toPrimitive]?e[Symbol.toPrimitive]("string"):ArrayBuffer.isView(e)?e instanceof g||e instanceof w?`[${[...e].map(e=>L(e))}]`:`[${e}]`:ArrayBuffer.isView(e)?`[${e}]`:JSON.stringify(e,(e,t)=>"bigint"==typeof t?`${t}`:t)}function M(e,t,n,r){return new(n||(n=Promise))(function(i,o){function s(e){try{l(r.next(e))}catch(e){o(e)}}function a(e){try{l(r.throw(e))}catch(e){o(e)}}function l(e){var t;e.done?i(e.value):(t=e.value,t instanceof n?t:new n(function(e){e(t)})).then(s,a)}l((r=r.apply(e,t||[])).next())})}function P(e){return this instanceof P?(this.v=e,this):new P(e)}function z(e,t,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var r,i=n.apply(e,t||[]),o=[];return r=Object.create(("function"==typeof AsyncIterator?AsyncIterator:Object).prototype),s("next"),s("throw"),s("return",function(e){return function(t){return Promise.resolve(t).then(e,u)}}),r[Symbol.asyncIterator]=function(){return this},r;function s(e,t){i[e]&&(r[e]=function(t){return new Promise(function(n,r){o.push([e,t,n,r])>1||a(e,t)})},t&&(r[e]=t(r[e])))}function a(e,t){try{(n=i[e](t)).value instanceof P?Promise.resolve(n.value.v).then(l,u):c(o[0][2],n)}catch(e){c(o[0][3],e)}var n}function l(e){a("next",e)}function u(e){a("throw",e)}function c(e,t){e(t),o.shift(),o.length&&a(o[0][0],o[0][1])}}function U(e){var t,n;return t={},r("next"),r("throw",function(e){throw e}),r("return"),t[Symbol.iterator]=function(){return this},t;function r(r,i){t[r]=e[r]?function(t){return(n=!n)?{value:P(e[r](t)),done:!1}:i?i(t):t}:i}}function R(e){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var t,n=e[Symbol.asyncIterator];return n?n.call(e):(e=function(e){var t="function"==typeof Symbol&&Symbol.iterator,n=t&&e[t],r=0;if(n)return n.call(e);if(e&&"number"==typeof e.length)return{next:function(){return e&&r>=e.length&&(e=void 0),{value:e&&e[r++],done:!e}}};throw new TypeError(t?"Object is not iterable.":"Symbol.iterator is not defined.")}(e),t={},r("next"),r("throw"),r("return"),t[Symbol.asyncIterator]=function(){return this},t);function r(n){t[n]=e[n]&&function(t){return new Promise(function(r,i){!function(e,t,n,r){Promise.resolve(r).then(function(t){e({value:t,done:n})},t)}(r,i,(t=e[n](t)).done,t.value)})}}}Object.create,Object.create,"function"==typeof SuppressedError&&SuppressedError;const j=new TextDecoder("utf-8"),V=e=>j.decode(e),$=new TextEncoder,H=e=>$.encode(e),W="undefined"!=typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function Y(e,t,n=0,r=t.byteLength){const i=e.byteLength,o=new Uint8Array(e.buffer,e.byteOffset,i),s=new Uint8Array(t.buffer,t.byteOffset,Math.min(r,i));return o.set(s,n),e}function q(e,t){const n=function(e){const t=e[0]?[e[0]]:[];let n,r,i,o;for(let s,a,l=0,u=0,c=e.length;++l<c;)s=t[u],a=e[l],!s||!a||s.buffer!==a.buffer||a.byteOffset<s.byteOffset?a&&(t[++u]=a):(({byteOffset:n,byteLength:i}=s),({byteOffset:r,byteLength:o}=a),n+i<r||r+o<n?a&&(t[++u]=a):t[u]=new Uint8Array(s.buffer,n,r-n+o));return t}(e),r=n.reduce((e,t)=>e+t.byteLength,0);let i,o,s,a=0,l=-1;const u=Math.min(t||Number.POSITIVE_INFINITY,r);for(const e=n.length;++l<e;){if(i=n[l],o=i.subarray(0,Math.min(i.length,u-a)),u<=a+o.length){o.length<i.length?n[l]=i.subarray(o.length):o.length===i.length&&l++,s?Y(s,o,a):s=o;break}Y(s||(s=new Uint8Array(u)),o,a),a+=o.length}return[s||new Uint8Array(0),n.slice(l),r-(s?s.byteLength:0)]}function Q(e,t){let n=A(t)?t.value:t;return n instanceof e?e===Uint8Array?new e(n.buffer,n.byteOffset,n.byteLength):n:n?("string"==typeof n&&(n=H(n)),n instanceof ArrayBuffer||n instanceof W?new e(n):I(r=n)&&k(r.clear)&&k(r.bytes)&&k(r.position)&&k(r.setPosition)&&k(r.capacity)&&k(r.getBufferIdentifier)&&k(r.createLong)?Q(e,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new e(0):new e(n.buffer,n.byteOffset,n.byteLength/e.BYTES_PER_ELEMENT):e.from(n)):new e(0);var r}const K=e=>Q(Int32Array,e),G=e=>Q(Uint8Array,e),X=e=>(e.next(),e);function J(e,t){return z(this,arguments,function*(){if(T(t))return yield P(yield P(yield*U(R(J(e,yield P(t))))));const n=function(e){return z(this,arguments,function*(){yield yield P(yield P(e))})},r="string"==typeof t||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof W?n(t):x(t)?function(e){return z(this,arguments,function*(){yield P(yield*U(R(X(function*(e){let t=null;do{t=e.next(yield null==t?void 0:t.value)}while(!t.done)}(e[Symbol.iterator]())))))})}(t):E(t)?t:n(t);return yield P(yield*U(R(X(function(t){return z(this,arguments,function*(){let n=null;do{n=yield P(t.next(yield yield P(Q(e,n))))}while(!n.done)})}(r[Symbol.asyncIterator]()))))),yield P(new e)})}function Z(e,t,n){if(0!==e){n=n.slice(0,t+1);for(let r=-1;++r<=t;)n[r]+=e}return n}const ee=Symbol.for("isArrowBigNum");function te(e,...t){return 0===t.length?Object.setPrototypeOf(Q(this.TypedArray,e),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(e,...t),this.constructor.prototype)}function ne(...e){return te.apply(this,e)}function re(...e){return te.apply(this,e)}function ie(...e){return te.apply(this,e)}function oe(e){const{buffer:t,byteOffset:n,length:r,signed:i}=e,o=new w(t,n,r),s=i&&o[o.length-1]&BigInt(1)<<BigInt(63);let a=s?BigInt(1):BigInt(0),l=BigInt(0);if(s){for(const e of o)a+=~e*(BigInt(1)<<BigInt(32)*l++);a*=BigInt(-1)}else for(const e of o)a+=e*(BigInt(1)<<BigInt(32)*l++);return a}let se,ae;function le(e){let t="";const n=new Uint32Array(2);let r=new Uint16Array(e.buffer,e.byteOffset,e.byteLength/2);const i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer);let o=-1;const s=r.length-1;do{for(n[0]=r[o=0];o<s;)r[o++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[o];r[o]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],t=`${n[0]}${t}`}while(i[0]||i[1]||i[2]||i[3]);return null!=t?t:"0"}te.prototype[ee]=!0,te.prototype.toJSON=function(){return`"${se(this)}"`},te.prototype.valueOf=function(){return oe(this)},te.prototype.toString=function(){return se(this)},te.prototype[Symbol.toPrimitive]=function(e="default"){switch(e){case"number":return oe(this);case"string":return se(this);case"default":return ae(this)}return se(this)},Object.setPrototypeOf(ne.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(re.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(ie.prototype,Object.create(Uint32Array.prototype)),Object.assign(ne.prototype,te.prototype,{constructor:ne,signed:!0,TypedArray:Int32Array,BigIntArray:g}),Object.assign(re.prototype,te.prototype,{constructor:re,signed:!1,TypedArray:Uint32Array,BigIntArray:w}),Object.assign(ie.prototype,te.prototype,{constructor:ie,signed:!0,TypedArray:Uint32Array,BigIntArray:w}),m?(ae=e=>8===e.byteLength?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:le(e),se=e=>8===e.byteLength?`${new e.BigIntArray(e.buffer,e.byteOffset,1)[0]}`:le(e)):(se=le,ae=se);class ue{static new(e,t){switch(t){case!0:return new ne(e);case!1:return new re(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case g:return new ne(e)}return 16===e.byteLength?new ie(e):new re(e)}static signed(e){return new ne(e)}static unsigned(e){return new re(e)}static decimal(e){return new ie(e)}constructor(e,t){return ue.new(e,t)}}var ce,de,fe,he,pe,ye,be,me,ge,ve,we,_e,Se,ke,Ie,Te,xe,Ee,Oe,Ae;class Ce{static isNull(e){return(null==e?void 0:e.typeId)===c.Null}static isInt(e){return(null==e?void 0:e.typeId)===c.Int}static isFloat(e){return(null==e?void 0:e.typeId)===c.Float}static isBinary(e){return(null==e?void 0:e.typeId)===c.Binary}static isUtf8(e){return(null==e?void 0:e.typeId)===c.Utf8}static isBool(e){return(null==e?void 0:e.typeId)===c.Bool}static isDecimal(e){return(null==e?void 0:e.typeId)===c.Decimal}static isDate(e){return(null==e?void 0:e.typeId)===c.Date}static isTime(e){return(null==e?void 0:e.typeId)===c.Time}static isTimestamp(e){return(null==e?void 0:e.typeId)===c.Timestamp}static isInterval(e){return(null==e?void 0:e.typeId)===c.Interval}static isList(e){return(null==e?void 0:e.typeId)===c.List}static isStruct(e){return(null==e?void 0:e.typeId)===c.Struct}static isUnion(e){return(null==e?void 0:e.typeId)===c.Union}static isFixedSizeBinary(e){return(null==e?void 0:e.typeId)===c.FixedSizeBinary}static isFixedSizeList(e){return(null==e?void 0:e.typeId)===c.FixedSizeList}static isMap(e){return(null==e?void 0:e.typeId)===c.Map}static isDictionary(e){return(null==e?void 0:e.typeId)===c.Dictionary}static isDenseUnion(e){return Ce.isUnion(e)&&e.mode===i.Dense}static isSparseUnion(e){return Ce.isUnion(e)&&e.mode===i.Sparse}get typeId(){return c.NONE}}ce=Symbol.toStringTag,Ce[ce]=((Ae=Ce.prototype).children=null,Ae.ArrayType=Array,Ae[Symbol.toStringTag]="DataType");class Ne extends Ce{toString(){return"Null"}get typeId(){return c.Null}}de=Symbol.toStringTag,Ne[de]=(e=>e[Symbol.toStringTag]="Null")(Ne.prototype);class De extends Ce{constructor(e,t){super(),this.isSigned=e,this.bitWidth=t}get typeId(){return c.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?g:w}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}fe=Symbol.toStringTag,De[fe]=(e=>(e.isSigned=null,e.bitWidth=null,e[Symbol.toStringTag]="Int"))(De.prototype);class Be extends De{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}Object.defineProperty(class extends De{constructor(){super(!0,8)}get ArrayType(){return Int8Array}}.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(class extends De{constructor(){super(!0,16)}get ArrayType(){return Int16Array}}.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(Be.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(class extends De{constructor(){super(!0,64)}get ArrayType(){return g}}.prototype,"ArrayType",{value:g}),Object.defineProperty(class extends De{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}}.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(class extends De{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends De{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}}.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(class extends De{constructor(){super(!1,64)}get ArrayType(){return w}}.prototype,"ArrayType",{value:w});class Fe extends Ce{constructor(e){super(),this.precision=e}get typeId(){return c.Float}get ArrayType(){switch(this.precision){case o.HALF:return Uint16Array;case o.SINGLE:return Float32Array;case o.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}he=Symbol.toStringTag,Fe[he]=(e=>(e.precision=null,e[Symbol.toStringTag]="Float"))(Fe.prototype),Object.defineProperty(class extends Fe{constructor(){super(o.HALF)}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends Fe{constructor(){super(o.SINGLE)}}.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(class extends Fe{constructor(){super(o.DOUBLE)}}.prototype,"ArrayType",{value:Float64Array});class Le extends Ce{constructor(){super()}get typeId(){return c.Binary}toString(){return"Binary"}}pe=Symbol.toStringTag,Le[pe]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Binary"))(Le.prototype);class Me extends Ce{constructor(){super()}get typeId(){return c.Utf8}toString(){return"Utf8"}}ye=Symbol.toStringTag,Me[ye]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Utf8"))(Me.prototype);class Pe extends Ce{constructor(){super()}get typeId(){return c.Bool}toString(){return"Bool"}}be=Symbol.toStringTag,Pe[be]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Bool"))(Pe.prototype);class ze extends Ce{constructor(e,t,n=128){super(),this.scale=e,this.precision=t,this.bitWidth=n}get typeId(){return c.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}}me=Symbol.toStringTag,ze[me]=(e=>(e.scale=null,e.precision=null,e.ArrayType=Uint32Array,e[Symbol.toStringTag]="Decimal"))(ze.prototype);class Ue extends Ce{constructor(e){super(),this.unit=e}get typeId(){return c.Date}toString(){return`Date${32*(this.unit+1)}<${s[this.unit]}>`}}ge=Symbol.toStringTag,Ue[ge]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Date"))(Ue.prototype);class Re extends Ce{constructor(e,t){super(),this.unit=e,this.bitWidth=t}get typeId(){return c.Time}toString(){return`Time${this.bitWidth}<${a[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return g}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}ve=Symbol.toStringTag,Re[ve]=(e=>(e.unit=null,e.bitWidth=null,e[Symbol.toStringTag]="Time"))(Re.prototype);class je extends Ce{constructor(e,t){super(),this.unit=e,this.timezone=t}get typeId(){return c.Timestamp}toString(){return`Timestamp<${a[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}we=Symbol.toStringTag,je[we]=(e=>(e.unit=null,e.timezone=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Timestamp"))(je.prototype);class Ve extends Ce{constructor(e){super(),this.unit=e}get typeId(){return c.Interval}toString(){return`Interval<${l[this.unit]}>`}}_e=Symbol.toStringTag,Ve[_e]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Interval"))(Ve.prototype);class $e extends Ce{constructor(e){super(),this.children=[e]}get typeId(){return c.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}Se=Symbol.toStringTag,$e[Se]=(e=>(e.children=null,e[Symbol.toStringTag]="List"))($e.prototype);class He extends Ce{constructor(e){super(),this.children=e}get typeId(){return c.Struct}toString(){return`Struct<{${this.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}}ke=Symbol.toStringTag,He[ke]=(e=>(e.children=null,e[Symbol.toStringTag]="Struct"))(He.prototype);class We extends Ce{constructor(e,t,n){super(),this.mode=e,this.children=n,this.typeIds=t=Int32Array.from(t),this.typeIdToChildIndex=t.reduce((e,t,n)=>(e[t]=n)&&e||e,Object.create(null))}get typeId(){return c.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map(e=>`${e.type}`).join(" | ")}>`}}Ie=Symbol.toStringTag,We[Ie]=(e=>(e.mode=null,e.typeIds=null,e.children=null,e.typeIdToChildIndex=null,e.ArrayType=Int8Array,e[Symbol.toStringTag]="Union"))(We.prototype);class Ye extends Ce{constructor(e){super(),this.byteWidth=e}get typeId(){return c.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}}Te=Symbol.toStringTag,Ye[Te]=(e=>(e.byteWidth=null,e.ArrayType=Uint8Array,e[Symbol.toStringTag]="FixedSizeBinary"))(Ye.prototype);class qe extends Ce{constructor(e,t){super(),this.listSize=e,this.children=[t]}get typeId(){return c.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}}xe=Symbol.toStringTag,qe[xe]=(e=>(e.children=null,e.listSize=null,e[Symbol.toStringTag]="FixedSizeList"))(qe.prototype);class Qe extends Ce{constructor(e,t=!1){super(),this.children=[e],this.keysSorted=t}get typeId(){return c.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}}Ee=Symbol.toStringTag,Qe[Ee]=(e=>(e.children=null,e.keysSorted=null,e[Symbol.toStringTag]="Map_"))(Qe.prototype);const Ke=(Ge=-1,()=>++Ge);var Ge;class Xe extends Ce{constructor(e,t,n,r){super(),this.indices=t,this.dictionary=e,this.isOrdered=r||!1,this.id=null==n?Ke():"number"==typeof n?n:n.low}get typeId(){return c.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}function Je(e){const t=e;switch(e.typeId){case c.Decimal:return e.bitWidth/32;case c.Timestamp:return 2;case c.Date:case c.Interval:return 1+t.unit;case c.FixedSizeList:return t.listSize;case c.FixedSizeBinary:return t.byteWidth;default:return 1}}Oe=Symbol.toStringTag,Xe[Oe]=(e=>(e.id=null,e.indices=null,e.isOrdered=null,e.dictionary=null,e[Symbol.toStringTag]="Dictionary"))(Xe.prototype);class Ze{visitMany(e,...t){return e.map((e,n)=>this.visit(e,...t.map(e=>e[n])))}visit(...e){return this.getVisitFn(e[0],!1).apply(this,e)}getVisitFn(e,t=!0){return function(e,t,n=!0){return"number"==typeof t?et(e,t,n):"string"==typeof t&&t in c?et(e,c[t],n):t&&t instanceof Ce?et(e,tt(t),n):(null==t?void 0:t.type)&&t.type instanceof Ce?et(e,tt(t.type),n):et(e,c.NONE,n)}(this,e,t)}getVisitFnByTypeId(e,t=!0){return et(this,e,t)}visitNull(e,...t){return null}visitBool(e,...t){return null}visitInt(e,...t){return null}visitFloat(e,...t){return null}visitUtf8(e,...t){return null}visitBinary(e,...t){return null}visitFixedSizeBinary(e,...t){return null}visitDate(e,...t){return null}visitTimestamp(e,...t){return null}visitTime(e,...t){return null}visitDecimal(e,...t){return null}visitList(e,...t){return null}visitStruct(e,...t){return null}visitUnion(e,...t){return null}visitDictionary(e,...t){return null}visitInterval(e,...t){return null}visitFixedSizeList(e,...t){return null}visitMap(e,...t){return null}}function et(e,t,n=!0){let r=null;switch(t){case c.Null:r=e.visitNull;break;case c.Bool:r=e.visitBool;break;case c.Int:r=e.visitInt;break;case c.Int8:r=e.visitInt8||e.visitInt;break;case c.Int16:r=e.visitInt16||e.visitInt;break;case c.Int32:r=e.visitInt32||e.visitInt;break;case c.Int64:r=e.visitInt64||e.visitInt;break;case c.Uint8:r=e.visitUint8||e.visitInt;break;case c.Uint16:r=e.visitUint16||e.visitInt;break;case c.Uint32:r=e.visitUint32||e.visitInt;break;case c.Uint64:r=e.visitUint64||e.visitInt;break;case c.Float:r=e.visitFloat;break;case c.Float16:r=e.visitFloat16||e.visitFloat;break;case c.Float32:r=e.visitFloat32||e.visitFloat;break;case c.Float64:r=e.visitFloat64||e.visitFloat;break;case c.Utf8:r=e.visitUtf8;break;case c.Binary:r=e.visitBinary;break;case c.FixedSizeBinary:r=e.visitFixedSizeBinary;break;case c.Date:r=e.visitDate;break;case c.DateDay:r=e.visitDateDay||e.visitDate;break;case c.DateMillisecond:r=e.visitDateMillisecond||e.visitDate;break;case c.Timestamp:r=e.visitTimestamp;break;case c.TimestampSecond:r=e.visitTimestampSecond||e.visitTimestamp;break;case c.TimestampMillisecond:r=e.visitTimestampMillisecond||e.visitTimestamp;break;case c.TimestampMicrosecond:r=e.visitTimestampMicrosecond||e.visitTimestamp;break;case c.TimestampNanosecond:r=e.visitTimestampNanosecond||e.visitTimestamp;break;case c.Time:r=e.visitTime;break;case c.TimeSecond:r=e.visitTimeSecond||e.visitTime;break;case c.TimeMillisecond:r=e.visitTimeMillisecond||e.visitTime;break;case c.TimeMicrosecond:r=e.visitTimeMicrosecond||e.visitTime;break;case c.TimeNanosecond:r=e.visitTimeNanosecond||e.visitTime;break;case c.Decimal:r=e.visitDecimal;break;case c.List:r=e.visitList;break;case c.Struct:r=e.visitStruct;break;case c.Union:r=e.visitUnion;break;case c.DenseUnion:r=e.visitDenseUnion||e.visitUnion;break;case c.SparseUnion:r=e.visitSparseUnion||e.visitUnion;break;case c.Dictionary:r=e.visitDictionary;break;case c.Interval:r=e.visitInterval;break;case c.IntervalDayTime:r=e.visitIntervalDayTime||e.visitInterval;break;case c.IntervalYearMonth:r=e.visitIntervalYearMonth||e.visitInterval;break;case c.FixedSizeList:r=e.visitFixedSizeList;break;case c.Map:r=e.visitMap}if("function"==typeof r)return r;if(!n)return()=>null;throw new Error(`Unrecognized type '${c[t]}'`)}function tt(e){switch(e.typeId){case c.Null:return c.Null;case c.Int:{const{bitWidth:t,isSigned:n}=e;switch(t){case 8:return n?c.Int8:c.Uint8;case 16:return n?c.Int16:c.Uint16;case 32:return n?c.Int32:c.Uint32;case 64:return n?c.Int64:c.Uint64}return c.Int}case c.Float:switch(e.precision){case o.HALF:return c.Float16;case o.SINGLE:return c.Float32;case o.DOUBLE:return c.Float64}return c.Float;case c.Binary:return c.Binary;case c.Utf8:return c.Utf8;case c.Bool:return c.Bool;case c.Decimal:return c.Decimal;case c.Time:switch(e.unit){case a.SECOND:return c.TimeSecond;case a.MILLISECOND:return c.TimeMillisecond;case a.MICROSECOND:return c.TimeMicrosecond;case a.NANOSECOND:return c.TimeNanosecond}return c.Time;case c.Timestamp:switch(e.unit){case a.SECOND:return c.TimestampSecond;case a.MILLISECOND:return c.TimestampMillisecond;case a.MICROSECOND:return c.TimestampMicrosecond;case a.NANOSECOND:return c.TimestampNanosecond}return c.Timestamp;case c.Date:switch(e.unit){case s.DAY:return c.DateDay;case s.MILLISECOND:return c.DateMillisecond}return c.Date;case c.Interval:switch(e.unit){case l.DAY_TIME:return c.IntervalDayTime;case l.YEAR_MONTH:return c.IntervalYearMonth}return c.Interval;case c.Map:return c.Map;case c.List:return c.List;case c.Struct:return c.Struct;case c.Union:switch(e.mode){case i.Dense:return c.DenseUnion;case i.Sparse:return c.SparseUnion}return c.Union;case c.FixedSizeBinary:return c.FixedSizeBinary;case c.FixedSizeList:return c.FixedSizeList;case c.Dictionary:return c.Dictionary}throw new Error(`Unrecognized type '${c[e.typeId]}'`)}Ze.prototype.visitInt8=null,Ze.prototype.visitInt16=null,Ze.prototype.visitInt32=null,Ze.prototype.visitInt64=null,Ze.prototype.visitUint8=null,Ze.prototype.visitUint16=null,Ze.prototype.visitUint32=null,Ze.prototype.visitUint64=null,Ze.prototype.visitFloat16=null,Ze.prototype.visitFloat32=null,Ze.prototype.visitFloat64=null,Ze.prototype.visitDateDay=null,Ze.prototype.visitDateMillisecond=null,Ze.prototype.visitTimestampSecond=null,Ze.prototype.visitTimestampMillisecond=null,Ze.prototype.visitTimestampMicrosecond=null,Ze.prototype.visitTimestampNanosecond=null,Ze.prototype.visitTimeSecond=null,Ze.prototype.visitTimeMillisecond=null,Ze.prototype.visitTimeMicrosecond=null,Ze.prototype.visitTimeNanosecond=null,Ze.prototype.visitDenseUnion=null,Ze.prototype.visitSparseUnion=null,Ze.prototype.visitIntervalDayTime=null,Ze.prototype.visitIntervalYearMonth=null;const nt=new Float64Array(1),rt=new Uint32Array(nt.buffer);function it(e){const t=(31744&e)>>10,n=(1023&e)/1024,r=Math.pow(-1,(32768&e)>>15);switch(t){case 31:return r*(n?Number.NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,t-15)*(1+n)}class ot extends Ze{}function st(e){return(t,n,r)=>{if(t.setValid(n,null!=r))return e(t,n,r)}}const at=(e,t,n)=>{e[t]=Math.trunc(n%4294967296),e[t+1]=Math.trunc(n/4294967296)},lt=(e,t,n,r)=>{if(n+1<t.length){const{[n]:i,[n+1]:o}=t;e.set(r.subarray(0,o-i),i)}},ut=({values:e},t,n)=>{e[t]=n},ct=({values:e},t,n)=>{e[t]=n},dt=({values:e},t,n)=>{e[t]=function(e){if(e!=e)return 32256;nt[0]=e;const t=(2147483648&rt[1])>>16&65535;let n=2146435072&rt[1],r=0;return n>=1089470464?rt[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&rt[1])>>10):n<=1056964608?(r=1048576+(1048575&rt[1]),r=1048576+(r<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&rt[1])>>10),t|n|65535&r}(n)},ft=({values:e},t,n)=>{((e,t,n)=>{e[t]=Math.trunc(n/864e5)})(e,t,n.valueOf())},ht=({values:e},t,n)=>{at(e,2*t,n.valueOf())},pt=({values:e},t,n)=>at(e,2*t,n/1e3),yt=({values:e},t,n)=>at(e,2*t,n),bt=({values:e},t,n)=>((e,t,n)=>{e[t]=Math.trunc(1e3*n%4294967296),e[t+1]=Math.trunc(1e3*n/4294967296)})(e,2*t,n),mt=({values:e},t,n)=>((e,t,n)=>{e[t]=Math.trunc(1e6*n%4294967296),e[t+1]=Math.trunc(1e6*n/4294967296)})(e,2*t,n),gt=({values:e},t,n)=>{e[t]=n},vt=({values:e},t,n)=>{e[t]=n},wt=({values:e},t,n)=>{e[t]=n},_t=({values:e},t,n)=>{e[t]=n},St=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];xt.visit(i,e.valueOffsets[t],n)},kt=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];xt.visit(i,t,n)},It=({values:e},t,n)=>{e.set(n.subarray(0,2),2*t)},Tt=({values:e},t,n)=>{e[t]=12*n[0]+n[1]%12};ot.prototype.visitBool=st(({offset:e,values:t},n,r)=>{const i=e+n;r?t[i>>3]|=1<<i%8:t[i>>3]&=~(1<<i%8)}),ot.prototype.visitInt=st(ut),ot.prototype.visitInt8=st(ut),ot.prototype.visitInt16=st(ut),ot.prototype.visitInt32=st(ut),ot.prototype.visitInt64=st(ut),ot.prototype.visitUint8=st(ut),ot.prototype.visitUint16=st(ut),ot.prototype.visitUint32=st(ut),ot.prototype.visitUint64=st(ut),ot.prototype.visitFloat=st((e,t,n)=>{switch(e.type.precision){case o.HALF:return dt(e,t,n);case o.SINGLE:case o.DOUBLE:return ct(e,t,n)}}),ot.prototype.visitFloat16=st(dt),ot.prototype.visitFloat32=st(ct),ot.prototype.visitFloat64=st(ct),ot.prototype.visitUtf8=st(({values:e,valueOffsets:t},n,r)=>{lt(e,t,n,H(r))}),ot.prototype.visitBinary=st(({values:e,valueOffsets:t},n,r)=>lt(e,t,n,r)),ot.prototype.visitFixedSizeBinary=st(({stride:e,values:t},n,r)=>{t.set(r.subarray(0,e),e*n)}),ot.prototype.visitDate=st((e,t,n)=>{e.type.unit===s.DAY?ft(e,t,n):ht(e,t,n)}),ot.prototype.visitDateDay=st(ft),ot.prototype.visitDateMillisecond=st(ht),ot.prototype.visitTimestamp=st((e,t,n)=>{switch(e.type.unit){case a.SECOND:return pt(e,t,n);case a.MILLISECOND:return yt(e,t,n);case a.MICROSECOND:return bt(e,t,n);case a.NANOSECOND:return mt(e,t,n)}}),ot.prototype.visitTimestampSecond=st(pt),ot.prototype.visitTimestampMillisecond=st(yt),ot.prototype.visitTimestampMicrosecond=st(bt),ot.prototype.visitTimestampNanosecond=st(mt),ot.prototype.visitTime=st((e,t,n)=>{switch(e.type.unit){case a.SECOND:return gt(e,t,n);case a.MILLISECOND:return vt(e,t,n);case a.MICROSECOND:return wt(e,t,n);case a.NANOSECOND:return _t(e,t,n)}}),ot.prototype.visitTimeSecond=st(gt),ot.prototype.visitTimeMillisecond=st(vt),ot.prototype.visitTimeMicrosecond=st(wt),ot.prototype.visitTimeNanosecond=st(_t),ot.prototype.visitDecimal=st(({values:e,stride:t},n,r)=>{e.set(r.subarray(0,t),t*n)}),ot.prototype.visitList=st((e,t,n)=>{const r=e.children[0],i=e.valueOffsets,o=xt.getVisitFn(r);if(Array.isArray(n))for(let e=-1,s=i[t],a=i[t+1];s<a;)o(r,s++,n[++e]);else for(let e=-1,s=i[t],a=i[t+1];s<a;)o(r,s++,n.get(++e))}),ot.prototype.visitStruct=st((e,t,n)=>{const r=e.type.children.map(e=>xt.getVisitFn(e.type)),i=n instanceof Map?(o=t,s=n,(e,t,n,r)=>t&&e(t,o,s.get(n.name))):n instanceof Hn?((e,t)=>(n,r,i,o)=>r&&n(r,e,t.get(o)))(t,n):Array.isArray(n)?((e,t)=>(n,r,i,o)=>r&&n(r,e,t[o]))(t,n):((e,t)=>(n,r,i,o)=>r&&n(r,e,t[i.name]))(t,n);var o,s;e.type.children.forEach((t,n)=>i(r[n],e.children[n],t,n))}),ot.prototype.visitUnion=st((e,t,n)=>{e.type.mode===i.Dense?St(e,t,n):kt(e,t,n)}),ot.prototype.visitDenseUnion=st(St),ot.prototype.visitSparseUnion=st(kt),ot.prototype.visitDictionary=st((e,t,n)=>{var r;null===(r=e.dictionary)||void 0===r||r.set(e.values[t],n)}),ot.prototype.visitInterval=st((e,t,n)=>{e.type.unit===l.DAY_TIME?It(e,t,n):Tt(e,t,n)}),ot.prototype.visitIntervalDayTime=st(It),ot.prototype.visitIntervalYearMonth=st(Tt),ot.prototype.visitFixedSizeList=st((e,t,n)=>{const{stride:r}=e,i=e.children[0],o=xt.getVisitFn(i);if(Array.isArray(n))for(let e=-1,s=t*r;++e<r;)o(i,s+e,n[e]);else for(let e=-1,s=t*r;++e<r;)o(i,s+e,n.get(e))}),ot.prototype.visitMap=st((e,t,n)=>{const r=e.children[0],{valueOffsets:i}=e,o=xt.getVisitFn(r);let{[t]:s,[t+1]:a}=i;const l=n instanceof Map?n.entries():Object.entries(n);for(const e of l)if(o(r,s,e),++s>=a)break});const xt=new ot,Et=Symbol.for("parent"),Ot=Symbol.for("rowIndex");class At{constructor(e,t){return this[Et]=e,this[Ot]=t,new Proxy(this,new Nt)}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[Ot],t=this[Et],n=t.type.children,r={};for(let i=-1,o=n.length;++i<o;)r[n[i].name]=Zt.visit(t.children[i],e);return r}toString(){return`{${[...this].map(([e,t])=>`${L(e)}: ${L(t)}`).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Ct(this[Et],this[Ot])}}class Ct{constructor(e,t){this.childIndex=0,this.children=e.children,this.rowIndex=t,this.childFields=e.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const e=this.childIndex;return e<this.numChildren?(this.childIndex=e+1,{done:!1,value:[this.childFields[e].name,Zt.visit(this.children[e],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(At.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Et]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Ot]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class Nt{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[Et].type.children.map(e=>e.name)}has(e,t){return-1!==e[Et].type.children.findIndex(e=>e.name===t)}getOwnPropertyDescriptor(e,t){if(-1!==e[Et].type.children.findIndex(e=>e.name===t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[Et].type.children.findIndex(e=>e.name===t);if(-1!==n){const r=Zt.visit(e[Et].children[n],e[Ot]);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[Et].type.children.findIndex(e=>e.name===t);return-1!==r?(xt.visit(e[Et].children[r],e[Ot],n),Reflect.set(e,t,n)):!(!Reflect.has(e,t)&&"symbol"!=typeof t)&&Reflect.set(e,t,n)}}class Dt extends Ze{}function Bt(e){return(t,n)=>t.getValid(n)?e(t,n):null}const Ft=(e,t)=>4294967296*e[t+1]+(e[t]>>>0),Lt=e=>new Date(e),Mt=(e,t,n)=>{if(n+1>=t.length)return null;const r=t[n],i=t[n+1];return e.subarray(r,i)},Pt=({values:e},t)=>((e,t)=>Lt(((e,t)=>864e5*e[t])(e,t)))(e,t),zt=({values:e},t)=>((e,t)=>Lt(Ft(e,t)))(e,2*t),Ut=({stride:e,values:t},n)=>t[e*n],Rt=({values:e},t)=>e[t],jt=({values:e},t)=>1e3*Ft(e,2*t),Vt=({values:e},t)=>Ft(e,2*t),$t=({values:e},t)=>((e,t)=>e[t+1]/1e3*4294967296+(e[t]>>>0)/1e3)(e,2*t),Ht=({values:e},t)=>((e,t)=>e[t+1]/1e6*4294967296+(e[t]>>>0)/1e6)(e,2*t),Wt=({values:e},t)=>e[t],Yt=({values:e},t)=>e[t],qt=({values:e},t)=>e[t],Qt=({values:e},t)=>e[t],Kt=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return Zt.visit(r,e.valueOffsets[t])},Gt=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return Zt.visit(r,t)},Xt=({values:e},t)=>e.subarray(2*t,2*(t+1)),Jt=({values:e},t)=>{const n=e[t],r=new Int32Array(2);return r[0]=Math.trunc(n/12),r[1]=Math.trunc(n%12),r};Dt.prototype.visitNull=Bt((e,t)=>null),Dt.prototype.visitBool=Bt(({offset:e,values:t},n)=>{const r=e+n;return!!(t[r>>3]&1<<r%8)}),Dt.prototype.visitInt=Bt(({values:e},t)=>e[t]),Dt.prototype.visitInt8=Bt(Ut),Dt.prototype.visitInt16=Bt(Ut),Dt.prototype.visitInt32=Bt(Ut),Dt.prototype.visitInt64=Bt(Rt),Dt.prototype.visitUint8=Bt(Ut),Dt.prototype.visitUint16=Bt(Ut),Dt.prototype.visitUint32=Bt(Ut),Dt.prototype.visitUint64=Bt(Rt),Dt.prototype.visitFloat=Bt(({type:e,values:t},n)=>e.precision!==o.HALF?t[n]:it(t[n])),Dt.prototype.visitFloat16=Bt(({stride:e,values:t},n)=>it(t[e*n])),Dt.prototype.visitFloat32=Bt(Ut),Dt.prototype.visitFloat64=Bt(Ut),Dt.prototype.visitUtf8=Bt(({values:e,valueOffsets:t},n)=>{const r=Mt(e,t,n);return null!==r?V(r):null}),Dt.prototype.visitBinary=Bt(({values:e,valueOffsets:t},n)=>Mt(e,t,n)),Dt.prototype.visitFixedSizeBinary=Bt(({stride:e,values:t},n)=>t.subarray(e*n,e*(n+1))),Dt.prototype.visitDate=Bt((e,t)=>e.type.unit===s.DAY?Pt(e,t):zt(e,t)),Dt.prototype.visitDateDay=Bt(Pt),Dt.prototype.visitDateMillisecond=Bt(zt),Dt.prototype.visitTimestamp=Bt((e,t)=>{switch(e.type.unit){case a.SECOND:return jt(e,t);case a.MILLISECOND:return Vt(e,t);case a.MICROSECOND:return $t(e,t);case a.NANOSECOND:return Ht(e,t)}}),Dt.prototype.visitTimestampSecond=Bt(jt),Dt.prototype.visitTimestampMillisecond=Bt(Vt),Dt.prototype.visitTimestampMicrosecond=Bt($t),Dt.prototype.visitTimestampNanosecond=Bt(Ht),Dt.prototype.visitTime=Bt((e,t)=>{switch(e.type.unit){case a.SECOND:return Wt(e,t);case a.MILLISECOND:return Yt(e,t);case a.MICROSECOND:return qt(e,t);case a.NANOSECOND:return Qt(e,t)}}),Dt.prototype.visitTimeSecond=Bt(Wt),Dt.prototype.visitTimeMillisecond=Bt(Yt),Dt.prototype.visitTimeMicrosecond=Bt(qt),Dt.prototype.visitTimeNanosecond=Bt(Qt),Dt.prototype.visitDecimal=Bt(({values:e,stride:t},n)=>ue.decimal(e.subarray(t*n,t*(n+1)))),Dt.prototype.visitList=Bt((e,t)=>{const{valueOffsets:n,stride:r,children:i}=e,{[t*r]:o,[t*r+1]:s}=n,a=i[0].slice(o,s-o);return new Hn([a])}),Dt.prototype.visitStruct=Bt((e,t)=>new At(e,t)),Dt.prototype.visitUnion=Bt((e,t)=>e.type.mode===i.Dense?Kt(e,t):Gt(e,t)),Dt.prototype.visitDenseUnion=Bt(Kt),Dt.prototype.visitSparseUnion=Bt(Gt),Dt.prototype.visitDictionary=Bt((e,t)=>{var n;return null===(n=e.dictionary)||void 0===n?void 0:n.get(e.values[t])}),Dt.prototype.visitInterval=Bt((e,t)=>e.type.unit===l.DAY_TIME?Xt(e,t):Jt(e,t)),Dt.prototype.visitIntervalDayTime=Bt(Xt),Dt.prototype.visitIntervalYearMonth=Bt(Jt),Dt.prototype.visitFixedSizeList=Bt((e,t)=>{const{stride:n,children:r}=e,i=r[0].slice(t*n,n);return new Hn([i])}),Dt.prototype.visitMap=Bt((e,t)=>{const{valueOffsets:n,children:r}=e,{[t]:i,[t+1]:o}=n,s=r[0];return new nn(s.slice(i,o-i))});const Zt=new Dt,en=Symbol.for("keys"),tn=Symbol.for("vals");class nn{constructor(e){return this[en]=new Hn([e.children[0]]).memoize(),this[tn]=e.children[1],new Proxy(this,new on)}[Symbol.iterator](){return new rn(this[en],this[tn])}get size(){return this[en].length}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[en],t=this[tn],n={};for(let r=-1,i=e.length;++r<i;)n[e.get(r)]=Zt.visit(t,r);return n}toString(){return`{${[...this].map(([e,t])=>`${L(e)}: ${L(t)}`).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class rn{constructor(e,t){this.keys=e,this.vals=t,this.keyIndex=0,this.numKeys=e.length}[Symbol.iterator](){return this}next(){const e=this.keyIndex;return e===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(e),Zt.visit(this.vals,e)]})}}class on{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[en].toArray().map(String)}has(e,t){return e[en].includes(t)}getOwnPropertyDescriptor(e,t){if(-1!==e[en].indexOf(t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[en].indexOf(t);if(-1!==n){const r=Zt.visit(Reflect.get(e,tn),n);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[en].indexOf(t);return-1!==r?(xt.visit(Reflect.get(e,tn),r,n),Reflect.set(e,t,n)):!!Reflect.has(e,t)&&Reflect.set(e,t,n)}}let sn;function an(e,t,n,r){const{length:i=0}=e;let o="number"!=typeof t?0:t,s="number"!=typeof n?i:n;return o<0&&(o=(o%i+i)%i),s<0&&(s=(s%i+i)%i),s<o&&(sn=o,o=s,s=sn),s>i&&(s=i),r?r(e,o,s):[o,s]}Object.defineProperties(nn.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[en]:{writable:!0,enumerable:!1,configurable:!1,value:null},[tn]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const ln=e=>e!=e;function un(e){if("object"!=typeof e||null===e)return ln(e)?ln:t=>t===e;if(e instanceof Date){const t=e.valueOf();return e=>e instanceof Date&&e.valueOf()===t}return ArrayBuffer.isView(e)?t=>!!t&&function(e,t){let n=0;const r=e.length;if(r!==t.length)return!1;if(r>0)do{if(e[n]!==t[n])return!1}while(++n<r);return!0}(e,t):e instanceof Map?function(e){let t=-1;const n=[];for(const r of e.values())n[++t]=un(r);return cn(n)}(e):Array.isArray(e)?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=un(e[n]);return cn(t)}(e):e instanceof Hn?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=un(e.get(n));return cn(t)}(e):function(e,t=!1){const n=Object.keys(e);if(!t&&0===n.length)return()=>!1;const r=[];for(let t=-1,i=n.length;++t<i;)r[t]=un(e[n[t]]);return cn(r,n)}(e,!0)}function cn(e,t){return n=>{if(!n||"object"!=typeof n)return!1;switch(n.constructor){case Array:return function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t[r]))return!1;return!0}(e,n);case Map:return dn(e,n,n.keys());case nn:case At:case Object:case void 0:return dn(e,n,t||Object.keys(n))}return n instanceof Hn&&function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t.get(r)))return!1;return!0}(e,n)}}function dn(e,t,n){const r=n[Symbol.iterator](),i=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),o=t instanceof Map?t.values():Object.values(t)[Symbol.iterator]();let s=0;const a=e.length;let l=o.next(),u=r.next(),c=i.next();for(;s<a&&!u.done&&!c.done&&!l.done&&u.value===c.value&&e[s](l.value);++s,u=r.next(),c=i.next(),l=o.next());return!!(s===a&&u.done&&c.done&&l.done)||(r.return&&r.return(),i.return&&i.return(),o.return&&o.return(),!1)}class fn{constructor(e=0,t){this.numChunks=e,this.getChunkIterator=t,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const e=this.chunkIterator.next();if(!e.done)return e;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function hn(e){return e.reduce((e,t)=>e+t.nullCount,0)}function pn(e){return e.reduce((e,t,n)=>(e[n+1]=e[n]+t.length,e),new Uint32Array(e.length+1))}function yn(e,t,n,r){const i=[];for(let o=-1,s=e.length;++o<s;){const s=e[o],a=t[o],{length:l}=s;if(a>=r)break;if(n>=a+l)continue;if(a>=n&&a+l<=r){i.push(s);continue}const u=Math.max(0,n-a),c=Math.min(r-a,l);i.push(s.slice(u,c-u))}return 0===i.length&&i.push(e[0].slice(0,0)),i}function bn(e,t,n,r){let i=0,o=0,s=t.length-1;do{if(i>=s-1)return n<t[s]?r(e,i,n-t[i]):null;o=i+Math.trunc(.5*(s-i)),n<t[o]?s=o:i=o}while(i<s)}function mn(e,t){return e.getValid(t)}function gn(e){function t(t,n,r){return e(t[n],r)}return function(e){return bn(this.data,this._offsets,e,t)}}function vn(e){let t;function n(n,r,i){return e(n[r],i,t)}return function(e,r){const i=this.data;t=r;const o=bn(i,this._offsets,e,n);return t=void 0,o}}function wn(e){let t;function n(n,r,i){let o=i,s=0,a=0;for(let i=r-1,l=n.length;++i<l;){const r=n[i];if(~(s=e(r,t,o)))return a+s;o=0,a+=r.length}return-1}return function(e,r){t=e;const i=this.data,o="number"!=typeof r?n(i,0,0):bn(i,this._offsets,r,n);return t=void 0,o}}function _n(e,t,n,r){return!!(n&1<<r)}function Sn(e,t,n,r){return(n&1<<r)>>r}function kn(e,t,n){const r=n.byteLength+7&-8;if(e>0||n.byteLength<r){const i=new Uint8Array(r);return i.set(e%8==0?n.subarray(e>>3):In(new Tn(n,e,t,null,_n)).subarray(0,r)),i}return n}function In(e){const t=[];let n=0,r=0,i=0;for(const o of e)o&&(i|=1<<r),8===++r&&(t[n++]=i,i=r=0);(0===n||r>0)&&(t[n++]=i);const o=new Uint8Array(t.length+7&-8);return o.set(t),o}class Tn{constructor(e,t,n,r,i){this.bytes=e,this.length=n,this.context=r,this.get=i,this.bit=t%8,this.byteIndex=t>>3,this.byte=e[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function xn(e,t,n){if(n-t<=0)return 0;if(n-t<8){let r=0;for(const i of new Tn(e,t,n-t,e,Sn))r+=i;return r}const r=n>>3<<3,i=t+(t%8==0?0:8-t%8);return xn(e,t,i)+xn(e,r,n)+function(e,t,n){let r=0,i=Math.trunc(t);const o=new DataView(e.buffer,e.byteOffset,e.byteLength),s=void 0===n?e.byteLength:i+n;for(;s-i>=4;)r+=En(o.getUint32(i)),i+=4;for(;s-i>=2;)r+=En(o.getUint16(i)),i+=2;for(;s-i>=1;)r+=En(o.getUint8(i)),i+=1;return r}(e,i>>3,r-i>>3)}function En(e){let t=Math.trunc(e);return t-=t>>>1&1431655765,t=(858993459&t)+(t>>>2&858993459),16843009*(t+(t>>>4)&252645135)>>>24}class On extends Ze{}function An(e,t,n){if(void 0===t)return-1;if(null===t)return function(e,t){const{nullBitmap:n}=e;if(!n||e.nullCount<=0)return-1;let r=0;for(const i of new Tn(n,e.offset+(t||0),e.length,n,_n)){if(!i)return r;++r}return-1}(e,n);const r=Zt.getVisitFn(e),i=un(t);for(let t=(n||0)-1,o=e.length;++t<o;)if(i(r(e,t)))return t;return-1}function Cn(e,t,n){const r=Zt.getVisitFn(e),i=un(t);for(let t=(n||0)-1,o=e.length;++t<o;)if(i(r(e,t)))return t;return-1}On.prototype.visitNull=function(e,t){return null===t&&e.length>0?0:-1},On.prototype.visitBool=An,On.prototype.visitInt=An,On.prototype.visitInt8=An,On.prototype.visitInt16=An,On.prototype.visitInt32=An,On.prototype.visitInt64=An,On.prototype.visitUint8=An,On.prototype.visitUint16=An,On.prototype.visitUint32=An,On.prototype.visitUint64=An,On.prototype.visitFloat=An,On.prototype.visitFloat16=An,On.prototype.visitFloat32=An,On.prototype.visitFloat64=An,On.prototype.visitUtf8=An,On.prototype.visitBinary=An,On.prototype.visitFixedSizeBinary=An,On.prototype.visitDate=An,On.prototype.visitDateDay=An,On.prototype.visitDateMillisecond=An,On.prototype.visitTimestamp=An,On.prototype.visitTimestampSecond=An,On.prototype.visitTimestampMillisecond=An,On.prototype.visitTimestampMicrosecond=An,On.prototype.visitTimestampNanosecond=An,On.prototype.visitTime=An,On.prototype.visitTimeSecond=An,On.prototype.visitTimeMillisecond=An,On.prototype.visitTimeMicrosecond=An,On.prototype.visitTimeNanosecond=An,On.prototype.visitDecimal=An,On.prototype.visitList=An,On.prototype.visitStruct=An,On.prototype.visitUnion=An,On.prototype.visitDenseUnion=Cn,On.prototype.visitSparseUnion=Cn,On.prototype.visitDictionary=An,On.prototype.visitInterval=An,On.prototype.visitIntervalDayTime=An,On.prototype.visitIntervalYearMonth=An,On.prototype.visitFixedSizeList=An,On.prototype.visitMap=An;const Nn=new On;class Dn extends Ze{}function Bn(e){const{type:t}=e;if(0===e.nullCount&&1===e.stride&&(t.typeId===c.Timestamp||t instanceof De&&64!==t.bitWidth||t instanceof Re&&64!==t.bitWidth||t instanceof Fe&&t.precision!==o.HALF))return new fn(e.data.length,t=>{const n=e.data[t];return n.values.subarray(0,n.length)[Symbol.iterator]()});let n=0;return new fn(e.data.length,t=>{const r=e.data[t].length,i=e.slice(n,n+r);return n+=r,new Fn(i)})}class Fn{constructor(e){this.vector=e,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}Dn.prototype.visitNull=Bn,Dn.prototype.visitBool=Bn,Dn.prototype.visitInt=Bn,Dn.prototype.visitInt8=Bn,Dn.prototype.visitInt16=Bn,Dn.prototype.visitInt32=Bn,Dn.prototype.visitInt64=Bn,Dn.prototype.visitUint8=Bn,Dn.prototype.visitUint16=Bn,Dn.prototype.visitUint32=Bn,Dn.prototype.visitUint64=Bn,Dn.prototype.visitFloat=Bn,Dn.prototype.visitFloat16=Bn,Dn.prototype.visitFloat32=Bn,Dn.prototype.visitFloat64=Bn,Dn.prototype.visitUtf8=Bn,Dn.prototype.visitBinary=Bn,Dn.prototype.visitFixedSizeBinary=Bn,Dn.prototype.visitDate=Bn,Dn.prototype.visitDateDay=Bn,Dn.prototype.visitDateMillisecond=Bn,Dn.prototype.visitTimestamp=Bn,Dn.prototype.visitTimestampSecond=Bn,Dn.prototype.visitTimestampMillisecond=Bn,Dn.prototype.visitTimestampMicrosecond=Bn,Dn.prototype.visitTimestampNanosecond=Bn,Dn.prototype.visitTime=Bn,Dn.prototype.visitTimeSecond=Bn,Dn.prototype.visitTimeMillisecond=Bn,Dn.prototype.visitTimeMicrosecond=Bn,Dn.prototype.visitTimeNanosecond=Bn,Dn.prototype.visitDecimal=Bn,Dn.prototype.visitList=Bn,Dn.prototype.visitStruct=Bn,Dn.prototype.visitUnion=Bn,Dn.prototype.visitDenseUnion=Bn,Dn.prototype.visitSparseUnion=Bn,Dn.prototype.visitDictionary=Bn,Dn.prototype.visitInterval=Bn,Dn.prototype.visitIntervalDayTime=Bn,Dn.prototype.visitIntervalYearMonth=Bn,Dn.prototype.visitFixedSizeList=Bn,Dn.prototype.visitMap=Bn;const Ln=new Dn,Mn=(e,t)=>e+t;class Pn extends Ze{visitNull(e,t){return 0}visitInt(e,t){return e.type.bitWidth/8}visitFloat(e,t){return e.type.ArrayType.BYTES_PER_ELEMENT}visitBool(e,t){return 1/8}visitDecimal(e,t){return e.type.bitWidth/8}visitDate(e,t){return 4*(e.type.unit+1)}visitTime(e,t){return e.type.bitWidth/8}visitTimestamp(e,t){return e.type.unit===a.SECOND?4:8}visitInterval(e,t){return 4*(e.type.unit+1)}visitStruct(e,t){return e.children.reduce((e,n)=>e+Rn.visit(n,t),0)}visitFixedSizeBinary(e,t){return e.type.byteWidth}visitMap(e,t){return 8+e.children.reduce((e,n)=>e+Rn.visit(n,t),0)}visitDictionary(e,t){var n;return e.type.indices.bitWidth/8+((null===(n=e.dictionary)||void 0===n?void 0:n.getByteLength(e.values[t]))||0)}}const zn=({type:e,children:t,typeIds:n,valueOffsets:r},i)=>{const o=e.typeIdToChildIndex[n[i]];return 8+Rn.visit(t[o],r[i])},Un=({children:e},t)=>4+Rn.visitMany(e,e.map(()=>t)).reduce(Mn,0);Pn.prototype.visitUtf8=({valueOffsets:e},t)=>e[t+1]-e[t]+8,Pn.prototype.visitBinary=({valueOffsets:e},t)=>e[t+1]-e[t]+8,Pn.prototype.visitList=({valueOffsets:e,stride:t,children:n},r)=>{const i=n[0],{[r*t]:o}=e,{[r*t+1]:s}=e,a=Rn.getVisitFn(i.type),l=i.slice(o,s-o);let u=8;for(let e=-1,t=s-o;++e<t;)u+=a(l,e);return u},Pn.prototype.visitFixedSizeList=({stride:e,children:t},n)=>{const r=t[0],i=r.slice(n*e,e),o=Rn.getVisitFn(r.type);let s=0;for(let e=-1,t=i.length;++e<t;)s+=o(i,e);return s},Pn.prototype.visitUnion=(e,t)=>e.type.mode===i.Dense?zn(e,t):Un(e,t),Pn.prototype.visitDenseUnion=zn,Pn.prototype.visitSparseUnion=Un;const Rn=new Pn;var jn;const Vn={},$n={};class Hn{constructor(e){var t,n,r;const i=e[0]instanceof Hn?e.flatMap(e=>e.data):e;if(0===i.length||i.some(e=>!(e instanceof Yn)))throw new TypeError("Vector constructor expects an Array of Data instances.");const o=null===(t=i[0])||void 0===t?void 0:t.type;switch(i.length){case 0:this._offsets=[0];break;case 1:{const{get:e,set:t,indexOf:n,byteLength:r}=Vn[o.typeId],s=i[0];this.isValid=e=>mn(s,e),this.get=t=>e(s,t),this.set=(e,n)=>t(s,e,n),this.indexOf=e=>n(s,e),this.getByteLength=e=>r(s,e),this._offsets=[0,s.length];break}default:Object.setPrototypeOf(this,$n[o.typeId]),this._offsets=pn(i)}this.data=i,this.type=o,this.stride=Je(o),this.numChildren=null!==(r=null===(n=o.children)||void 0===n?void 0:n.length)&&void 0!==r?r:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return-1===this._byteLength&&(this._byteLength=this.data.reduce((e,t)=>e+t.byteLength,0)),this._byteLength}get nullCount(){return-1===this._nullCount&&(this._nullCount=hn(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${c[this.type.typeId]}Vector`}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}includes(e,t){return this.indexOf(e,t)>0}getByteLength(e){return 0}[Symbol.iterator](){return Ln.visit(this)}concat(...e){return new Hn(this.data.concat(e.flatMap(e=>e.data).flat(Number.POSITIVE_INFINITY)))}slice(e,t){return new Hn(an(this,e,t,({data:e,_offsets:t},n,r)=>yn(e,t,n,r)))}toJSON(){return[...this]}toArray(){const{type:e,data:t,length:n,stride:r,ArrayType:i}=this;switch(e.typeId){case c.Int:case c.Float:case c.Decimal:case c.Time:case c.Timestamp:switch(t.length){case 0:return new i;case 1:return t[0].values.subarray(0,n*r);default:return t.reduce((e,{values:t,length:n})=>(e.array.set(t.subarray(0,n*r),e.offset),e.offset+=n*r,e),{array:new i(n*r),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(e){var t;return this.getChildAt(null===(t=this.type.children)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.numChildren?new Hn(this.data.map(({children:t})=>t[e])):null}get isMemoized(){return!!Ce.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(Ce.isDictionary(this.type)){const e=new Wn(this.data[0].dictionary),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new Hn(t)}return new Wn(this)}unmemoize(){if(Ce.isDictionary(this.type)&&this.isMemoized){const e=this.data[0].dictionary.unmemoize(),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new Hn(t)}return this}}jn=Symbol.toStringTag,Hn[jn]=(e=>{e.type=Ce.prototype,e.data=[],e.length=0,e.stride=1,e.numChildren=0,e._nullCount=-1,e._byteLength=-1,e._offsets=new Uint32Array([0]),e[Symbol.isConcatSpreadable]=!0;const t=Object.keys(c).map(e=>c[e]).filter(e=>"number"==typeof e&&e!==c.NONE);for(const n of t){const t=Zt.getVisitFnByTypeId(n),r=xt.getVisitFnByTypeId(n),i=Nn.getVisitFnByTypeId(n),o=Rn.getVisitFnByTypeId(n);Vn[n]={get:t,set:r,indexOf:i,byteLength:o},$n[n]=Object.create(e,{isValid:{value:gn(mn)},get:{value:gn(Zt.getVisitFnByTypeId(n))},set:{value:vn(xt.getVisitFnByTypeId(n))},indexOf:{value:wn(Nn.getVisitFnByTypeId(n))},getByteLength:{value:gn(Rn.getVisitFnByTypeId(n))}})}return"Vector"})(Hn.prototype);class Wn extends Hn{constructor(e){super(e.data);const t=this.get,n=this.set,r=this.slice,i=new Array(this.length);Object.defineProperty(this,"get",{value(e){const n=i[e];if(void 0!==n)return n;const r=t.call(this,e);return i[e]=r,r}}),Object.defineProperty(this,"set",{value(e,t){n.call(this,e,t),i[e]=t}}),Object.defineProperty(this,"slice",{value:(e,t)=>new Wn(r.call(this,e,t))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new Hn(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class Yn{constructor(e,t,n,r,i,o=[],s){let a;this.type=e,this.children=o,this.dictionary=s,this.offset=Math.floor(Math.max(t||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1)),i instanceof Yn?(this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets):(this.stride=Je(e),i&&((a=i[0])&&(this.valueOffsets=a),(a=i[1])&&(this.values=a),(a=i[2])&&(this.nullBitmap=a),(a=i[3])&&(this.typeIds=a))),this.nullable=0!==this._nullCount&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let e=0;const{valueOffsets:t,values:n,nullBitmap:r,typeIds:i}=this;return t&&(e+=t.byteLength),n&&(e+=n.byteLength),r&&(e+=r.byteLength),i&&(e+=i.byteLength),this.children.reduce((e,t)=>e+t.byteLength,e)}get nullCount(){let e,t=this._nullCount;return t<=-1&&(e=this.nullBitmap)&&(this._nullCount=t=this.length-xn(e,this.offset,this.offset+this.length)),t}getValid(e){if(this.nullable&&this.nullCount>0){const t=this.offset+e;return!!(this.nullBitmap[t>>3]&1<<t%8)}return!0}setValid(e,t){if(!this.nullable)return t;if(!this.nullBitmap||this.nullBitmap.byteLength<=e>>3){const{nullBitmap:e}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:e,_nullCount:0})}const{nullBitmap:n,offset:r}=this,i=r+e>>3,o=(r+e)%8,s=n[i]>>o&1;return t?0===s&&(n[i]|=1<<o,this._nullCount=this.nullCount+1):1===s&&(n[i]&=~(1<<o),this._nullCount=this.nullCount-1),t}clone(e=this.type,t=this.offset,n=this.length,r=this._nullCount,i=this,o=this.children){return new Yn(e,t,n,r,i,o,this.dictionary)}slice(e,t){const{stride:n,typeId:r,children:i}=this,o=+(0===this._nullCount)-1,s=16===r?n:1,a=this._sliceBuffers(e,t,n,r);return this.clone(this.type,this.offset+e,t,o,a,0===i.length||this.valueOffsets?i:this._sliceChildren(i,s*e,s*t))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===c.Null)return this.clone(this.type,0,e,0);const{length:t,nullCount:n}=this,r=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);r[t>>3]=(1<<t-(-8&t))-1,n>0&&r.set(kn(this.offset,t,this.nullBitmap),0);const i=this.buffers;return i[d.VALIDITY]=r,this.clone(this.type,0,e,n+(e-t),i)}_sliceBuffers(e,t,n,r){let i;const{buffers:o}=this;return(i=o[d.TYPE])&&(o[d.TYPE]=i.subarray(e,e+t)),(i=o[d.OFFSET])&&(o[d.OFFSET]=i.subarray(e,e+t+1))||(i=o[d.DATA])&&(o[d.DATA]=6===r?i:i.subarray(n*e,n*(e+t))),o}_sliceChildren(e,t,n){return e.map(e=>e.slice(t,n))}}Yn.prototype.children=Object.freeze([]);class qn extends Ze{visit(e){return this.getVisitFn(e.type).call(this,e)}visitNull(e){const{type:t,offset:n=0,length:r=0}=e;return new Yn(t,n,r,0)}visitBool(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length>>3,nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitInt(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length,nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitFloat(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length,nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitUtf8(e){const{type:t,offset:n=0}=e,r=G(e.data),i=G(e.nullBitmap),o=K(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,s,a,[o,r,i])}visitBinary(e){const{type:t,offset:n=0}=e,r=G(e.data),i=G(e.nullBitmap),o=K(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,s,a,[o,r,i])}visitFixedSizeBinary(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length/Je(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitDate(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length/Je(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitTimestamp(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length/Je(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitTime(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length/Je(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitDecimal(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length/Je(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitList(e){const{type:t,offset:n=0,child:r}=e,i=G(e.nullBitmap),o=K(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,s,a,[o,void 0,i],[r])}visitStruct(e){const{type:t,offset:n=0,children:r=[]}=e,i=G(e.nullBitmap),{length:o=r.reduce((e,{length:t})=>Math.max(e,t),0),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,void 0,i],r)}visitUnion(e){const{type:t,offset:n=0,children:r=[]}=e,i=G(e.nullBitmap),o=Q(t.ArrayType,e.typeIds),{length:s=o.length,nullCount:a=(e.nullBitmap?-1:0)}=e;if(Ce.isSparseUnion(t))return new Yn(t,n,s,a,[void 0,void 0,i,o],r);const l=K(e.valueOffsets);return new Yn(t,n,s,a,[l,void 0,i,o],r)}visitDictionary(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.indices.ArrayType,e.data),{dictionary:o=new Hn([(new qn).visit({type:t.dictionary})])}=e,{length:s=i.length,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,s,a,[void 0,i,r],[],o)}visitInterval(e){const{type:t,offset:n=0}=e,r=G(e.nullBitmap),i=Q(t.ArrayType,e.data),{length:o=i.length/Je(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,i,r])}visitFixedSizeList(e){const{type:t,offset:n=0,child:r=(new qn).visit({type:t.valueType})}=e,i=G(e.nullBitmap),{length:o=r.length/Je(t),nullCount:s=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,o,s,[void 0,void 0,i],[r])}visitMap(e){const{type:t,offset:n=0,child:r=(new qn).visit({type:t.childType})}=e,i=G(e.nullBitmap),o=K(e.valueOffsets),{length:s=o.length-1,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Yn(t,n,s,a,[o,void 0,i],[r])}}function Qn(e){return(new qn).visit(e)}class Kn{constructor(e=[],t,n){this.fields=e||[],this.metadata=t||new Map,n||(n=Jn(e)),this.dictionaries=n}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map(e=>e.name)}toString(){return`Schema<{ ${this.fields.map((e,t)=>`${t}: ${e}`).join(", ")} }>`}select(e){const t=new Set(e),n=this.fields.filter(e=>t.has(e.name));return new Kn(n,this.metadata)}selectAt(e){const t=e.map(e=>this.fields[e]).filter(Boolean);return new Kn(t,this.metadata)}assign(...e){const t=e[0]instanceof Kn?e[0]:Array.isArray(e[0])?new Kn(e[0]):new Kn(e),n=[...this.fields],r=Xn(Xn(new Map,this.metadata),t.metadata),i=t.fields.filter(e=>{const t=n.findIndex(t=>t.name===e.name);return!~t||(n[t]=e.clone({metadata:Xn(Xn(new Map,n[t].metadata),e.metadata)}))&&!1}),o=Jn(i,new Map);return new Kn([...n,...i],r,new Map([...this.dictionaries,...o]))}}Kn.prototype.fields=null,Kn.prototype.metadata=null,Kn.prototype.dictionaries=null;class Gn{constructor(e,t,n=!1,r){this.name=e,this.type=t,this.nullable=n,this.metadata=r||new Map}static new(...e){let[t,n,r,i]=e;return e[0]&&"object"==typeof e[0]&&(({name:t}=e[0]),void 0===n&&(n=e[0].type),void 0===r&&(r=e[0].nullable),void 0===i&&(i=e[0].metadata)),new Gn(`${t}`,n,r,i)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(...e){let[t,n,r,i]=e;return e[0]&&"object"==typeof e[0]?({name:t=this.name,type:n=this.type,nullable:r=this.nullable,metadata:i=this.metadata}=e[0]):[t=this.name,n=this.type,r=this.nullable,i=this.metadata]=e,Gn.new(t,n,r,i)}}function Xn(e,t){return new Map([...e||new Map,...t||new Map])}function Jn(e,t=new Map){for(let n=-1,r=e.length;++n<r;){const r=e[n].type;if(Ce.isDictionary(r))if(t.has(r.id)){if(t.get(r.id)!==r.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else t.set(r.id,r.dictionary);r.children&&r.children.length>0&&Jn(r.children,t)}return t}Gn.prototype.type=null,Gn.prototype.name=null,Gn.prototype.nullable=null,Gn.prototype.metadata=null;class Zn extends Ze{compareSchemas(e,t){return e===t||t instanceof e.constructor&&this.compareManyFields(e.fields,t.fields)}compareManyFields(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((e,n)=>this.compareFields(e,t[n]))}compareFields(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&this.visit(e.type,t.type)}}function er(e,t){return t instanceof e.constructor}function tr(e,t){return e===t||er(e,t)}function nr(e,t){return e===t||er(e,t)&&e.bitWidth===t.bitWidth&&e.isSigned===t.isSigned}function rr(e,t){return e===t||er(e,t)&&e.precision===t.precision}function ir(e,t){return e===t||er(e,t)&&e.unit===t.unit}function or(e,t){return e===t||er(e,t)&&e.unit===t.unit&&e.timezone===t.timezone}function sr(e,t){return e===t||er(e,t)&&e.unit===t.unit&&e.bitWidth===t.bitWidth}function ar(e,t){return e===t||er(e,t)&&e.mode===t.mode&&e.typeIds.every((e,n)=>e===t.typeIds[n])&&ur.compareManyFields(e.children,t.children)}function lr(e,t){return e===t||er(e,t)&&e.unit===t.unit}Zn.prototype.visitNull=tr,Zn.prototype.visitBool=tr,Zn.prototype.visitInt=nr,Zn.prototype.visitInt8=nr,Zn.prototype.visitInt16=nr,Zn.prototype.visitInt32=nr,Zn.prototype.visitInt64=nr,Zn.prototype.visitUint8=nr,Zn.prototype.visitUint16=nr,Zn.prototype.visitUint32=nr,Zn.prototype.visitUint64=nr,Zn.prototype.visitFloat=rr,Zn.prototype.visitFloat16=rr,Zn.prototype.visitFloat32=rr,Zn.prototype.visitFloat64=rr,Zn.prototype.visitUtf8=tr,Zn.prototype.visitBinary=tr,Zn.prototype.visitFixedSizeBinary=function(e,t){return e===t||er(e,t)&&e.byteWidth===t.byteWidth},Zn.prototype.visitDate=ir,Zn.prototype.visitDateDay=ir,Zn.prototype.visitDateMillisecond=ir,Zn.prototype.visitTimestamp=or,Zn.prototype.visitTimestampSecond=or,Zn.prototype.visitTimestampMillisecond=or,Zn.prototype.visitTimestampMicrosecond=or,Zn.prototype.visitTimestampNanosecond=or,Zn.prototype.visitTime=sr,Zn.prototype.visitTimeSecond=sr,Zn.prototype.visitTimeMillisecond=sr,Zn.prototype.visitTimeMicrosecond=sr,Zn.prototype.visitTimeNanosecond=sr,Zn.prototype.visitDecimal=tr,Zn.prototype.visitList=function(e,t){return e===t||er(e,t)&&e.children.length===t.children.length&&ur.compareManyFields(e.children,t.children)},Zn.prototype.visitStruct=function(e,t){return e===t||er(e,t)&&e.children.length===t.children.length&&ur.compareManyFields(e.children,t.children)},Zn.prototype.visitUnion=ar,Zn.prototype.visitDenseUnion=ar,Zn.prototype.visitSparseUnion=ar,Zn.prototype.visitDictionary=function(e,t){return e===t||er(e,t)&&e.id===t.id&&e.isOrdered===t.isOrdered&&ur.visit(e.indices,t.indices)&&ur.visit(e.dictionary,t.dictionary)},Zn.prototype.visitInterval=lr,Zn.prototype.visitIntervalDayTime=lr,Zn.prototype.visitIntervalYearMonth=lr,Zn.prototype.visitFixedSizeList=function(e,t){return e===t||er(e,t)&&e.listSize===t.listSize&&e.children.length===t.children.length&&ur.compareManyFields(e.children,t.children)},Zn.prototype.visitMap=function(e,t){return e===t||er(e,t)&&e.keysSorted===t.keysSorted&&e.children.length===t.children.length&&ur.compareManyFields(e.children,t.children)};const ur=new Zn;function cr(e,t){return ur.compareSchemas(e,t)}var dr,fr;class hr{constructor(...e){switch(e.length){case 2:if([this.schema]=e,!(this.schema instanceof Kn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=Qn({nullCount:0,type:new He(this.schema.fields),children:this.schema.fields.map(e=>Qn({type:e.type,nullCount:0}))})]=e,!(this.data instanceof Yn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=pr(this.schema,this.data.children);break;case 1:{const[t]=e,{fields:n,children:r,length:i}=Object.keys(t).reduce((e,n,r)=>(e.children[r]=t[n],e.length=Math.max(e.length,t[n].length),e.fields[r]=Gn.new({name:n,type:t[n].type,nullable:!0}),e),{length:0,fields:new Array,children:new Array}),o=new Kn(n),s=Qn({type:new He(n),length:i,children:r,nullCount:0});[this.schema,this.data]=pr(o,s.children,i);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=yr(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(e){return this.data.getValid(e)}get(e){return Zt.visit(this.data,e)}set(e,t){return xt.visit(this.data,e,t)}indexOf(e,t){return Nn.visit(this.data,e,t)}getByteLength(e){return Rn.visit(this.data,e)}[Symbol.iterator](){return Ln.visit(new Hn([this.data]))}toArray(){return[...this]}concat(...e){return new vr(this.schema,[this,...e])}slice(e,t){const[n]=new Hn([this.data]).slice(e,t).data;return new hr(this.schema,n)}getChild(e){var t;return this.getChildAt(null===(t=this.schema.fields)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.schema.fields.length?new Hn([this.data.children[e]]):null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=this.data;if(e>-1&&e<this.numCols){t||(t=new Hn([Qn({type:new Ne,length:this.numRows})]));const i=n.fields.slice(),o=r.children.slice(),s=i[e].clone({type:t.type});[i[e],o[e]]=[s,t.data[0]],n=new Kn(i,new Map(this.schema.metadata)),r=Qn({type:new He(i),children:o})}return new hr(n,r)}select(e){const t=this.schema.select(e),n=new He(t.fields),r=[];for(const t of e){const e=this.schema.fields.findIndex(e=>e.name===t);~e&&(r[e]=this.data.children[e])}return new hr(t,Qn({type:n,length:this.numRows,children:r}))}selectAt(e){const t=this.schema.selectAt(e),n=e.map(e=>this.data.children[e]).filter(Boolean),r=Qn({type:new He(t.fields),length:this.numRows,children:n});return new hr(t,r)}}function pr(e,t,n=t.reduce((e,t)=>Math.max(e,t.length),0)){var r;const i=[...e.fields],o=[...t],s=(n+63&-64)>>3;for(const[a,l]of e.fields.entries()){const e=t[a];e&&e.length===n||(i[a]=l.clone({nullable:!0}),o[a]=null!==(r=null==e?void 0:e._changeLengthAndBackfillNullBitmap(n))&&void 0!==r?r:Qn({type:l.type,length:n,nullCount:n,nullBitmap:new Uint8Array(s)}))}return[e.assign(i),Qn({type:new He(i),length:n,children:o})]}function yr(e,t,n=new Map){for(let r=-1,i=e.length;++r<i;){const i=e[r].type,o=t[r];if(Ce.isDictionary(i))if(n.has(i.id)){if(n.get(i.id)!==o.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else o.dictionary&&n.set(i.id,o.dictionary);i.children&&i.children.length>0&&yr(i.children,o.children,n)}return n}dr=Symbol.toStringTag,hr[dr]=(e=>(e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(hr.prototype);class br extends hr{constructor(e){const t=e.fields.map(e=>Qn({type:e.type}));super(e,Qn({type:new He(e.fields),nullCount:0,children:t}))}}function mr(e,t){return function(e,t){const n=[...e.fields],r=[],i={numBatches:t.reduce((e,t)=>Math.max(e,t.length),0)};let o=0,s=0,a=-1;const l=t.length;let u,c=[];for(;i.numBatches-- >0;){for(s=Number.POSITIVE_INFINITY,a=-1;++a<l;)c[a]=u=t[a].shift(),s=Math.min(s,u?u.length:s);Number.isFinite(s)&&(c=gr(n,s,c,t,i),s>0&&(r[o++]=Qn({type:new He(n),length:s,nullCount:0,children:c.slice()})))}return[e=e.assign(n),r.map(t=>new hr(e,t))]}(e,t.map(e=>e.data.concat()))}function gr(e,t,n,r,i){var o;const s=(t+63&-64)>>3;for(let a=-1,l=r.length;++a<l;){const l=n[a],u=null==l?void 0:l.length;if(u>=t)u===t?n[a]=l:(n[a]=l.slice(0,t),i.numBatches=Math.max(i.numBatches,r[a].unshift(l.slice(t,u-t))));else{const r=e[a];e[a]=r.clone({nullable:!0}),n[a]=null!==(o=null==l?void 0:l._changeLengthAndBackfillNullBitmap(t))&&void 0!==o?o:Qn({type:r.type,length:t,nullCount:t,nullBitmap:new Uint8Array(s)})}}return n}class vr{constructor(...e){var t,n;if(0===e.length)return this.batches=[],this.schema=new Kn([]),this._offsets=[0],this;let r,i;e[0]instanceof Kn&&(r=e.shift()),e[e.length-1]instanceof Uint32Array&&(i=e.pop());const o=e=>{if(e){if(e instanceof hr)return[e];if(e instanceof vr)return e.batches;if(e instanceof Yn){if(e.type instanceof He)return[new hr(new Kn(e.type.children),e)]}else{if(Array.isArray(e))return e.flatMap(e=>o(e));if("function"==typeof e[Symbol.iterator])return[...e].flatMap(e=>o(e));if("object"==typeof e){const t=Object.keys(e),n=t.map(t=>new Hn([e[t]])),r=new Kn(t.map((e,t)=>new Gn(String(e),n[t].type))),[,i]=mr(r,n);return 0===i.length?[new hr(e)]:i}}}return[]},s=e.flatMap(e=>o(e));if(r=null!==(n=null!=r?r:null===(t=s[0])||void 0===t?void 0:t.schema)&&void 0!==n?n:new Kn([]),!(r instanceof Kn))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const e of s){if(!(e instanceof hr))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!cr(r,e.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=r,this.batches=s,this._offsets=null!=i?i:pn(this.data)}get data(){return this.batches.map(({data:e})=>e)}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce((e,t)=>e+t.length,0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=hn(this.data)),this._nullCount}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}getByteLength(e){return 0}[Symbol.iterator](){return this.batches.length>0?Ln.visit(new Hn(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[\n  ${this.toArray().join(",\n  ")}\n]`}concat(...e){const t=this.schema,n=this.data.concat(e.flatMap(({data:e})=>e));return new vr(t,n.map(e=>new hr(t,e)))}slice(e,t){const n=this.schema;[e,t]=an({length:this.numRows},e,t);const r=yn(this.data,this._offsets,e,t);return new vr(n,r.map(e=>new hr(n,e)))}getChild(e){return this.getChildAt(this.schema.fields.findIndex(t=>t.name===e))}getChildAt(e){if(e>-1&&e<this.schema.fields.length){const t=this.data.map(t=>t.children[e]);if(0===t.length){const{type:n}=this.schema.fields[e],r=Qn({type:n,length:0,nullCount:0});t.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new Hn(t)}return null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=[...this.batches];if(e>-1&&e<this.numCols){t||(t=new Hn([Qn({type:new Ne,length:this.numRows})]));const i=n.fields.slice(),o=i[e].clone({type:t.type}),s=this.schema.fields.map((e,t)=>this.getChildAt(t));[i[e],s[e]]=[o,t],[n,r]=mr(n,s)}return new vr(n,r)}select(e){const t=this.schema.fields.reduce((e,t,n)=>e.set(t.name,n),new Map);return this.selectAt(e.map(e=>t.get(e)).filter(e=>e>-1))}selectAt(e){const t=this.schema.selectAt(e),n=this.batches.map(t=>t.selectAt(e));return new vr(t,n)}assign(e){const t=this.schema.fields,[n,r]=e.schema.fields.reduce((e,n,r)=>{const[i,o]=e,s=t.findIndex(e=>e.name===n.name);return~s?o[s]=r:i.push(r),e},[[],[]]),i=this.schema.assign(e.schema),o=[...t.map((e,t)=>[t,r[t]]).map(([t,n])=>void 0===n?this.getChildAt(t):e.getChildAt(n)),...n.map(t=>e.getChildAt(t))].filter(Boolean);return new vr(...mr(i,o))}}fr=Symbol.toStringTag,vr[fr]=(e=>(e.schema=null,e.batches=[],e._offsets=new Uint32Array([0]),e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,e.isValid=gn(mn),e.get=gn(Zt.getVisitFn(c.Struct)),e.set=vn(xt.getVisitFn(c.Struct)),e.indexOf=wn(Nn.getVisitFn(c.Struct)),e.getByteLength=gn(Rn.getVisitFn(c.Struct)),"Table"))(vr.prototype);class wr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(e,t,n,r){return e.prep(8,24),e.writeInt64(r),e.pad(4),e.writeInt32(n),e.writeInt64(t),e.offset()}}const _r=new Int32Array(2),Sr=new Float32Array(_r.buffer),kr=new Float64Array(_r.buffer),Ir=1===new Uint16Array(new Uint8Array([1,0]).buffer)[0];class Tr{constructor(e,t){this.low=0|e,this.high=0|t}static create(e,t){return 0==e&&0==t?Tr.ZERO:new Tr(e,t)}toFloat64(){return(this.low>>>0)+4294967296*this.high}equals(e){return this.low==e.low&&this.high==e.high}}var xr,Er,Or,Ar,Cr;Tr.ZERO=new Tr(0,0),function(e){e[e.UTF8_BYTES=1]="UTF8_BYTES",e[e.UTF16_STRING=2]="UTF16_STRING"}(xr||(xr={}));class Nr{constructor(e){this.bytes_=e,this.position_=0}static allocate(e){return new Nr(new Uint8Array(e))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(e){this.position_=e}capacity(){return this.bytes_.length}readInt8(e){return this.readUint8(e)<<24>>24}readUint8(e){return this.bytes_[e]}readInt16(e){return this.readUint16(e)<<16>>16}readUint16(e){return this.bytes_[e]|this.bytes_[e+1]<<8}readInt32(e){return this.bytes_[e]|this.bytes_[e+1]<<8|this.bytes_[e+2]<<16|this.bytes_[e+3]<<24}readUint32(e){return this.readInt32(e)>>>0}readInt64(e){return new Tr(this.readInt32(e),this.readInt32(e+4))}readUint64(e){return new Tr(this.readUint32(e),this.readUint32(e+4))}readFloat32(e){return _r[0]=this.readInt32(e),Sr[0]}readFloat64(e){return _r[Ir?0:1]=this.readInt32(e),_r[Ir?1:0]=this.readInt32(e+4),kr[0]}writeInt8(e,t){this.bytes_[e]=t}writeUint8(e,t){this.bytes_[e]=t}writeInt16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeUint16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeInt32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeUint32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeInt64(e,t){this.writeInt32(e,t.low),this.writeInt32(e+4,t.high)}writeUint64(e,t){this.writeUint32(e,t.low),this.writeUint32(e+4,t.high)}writeFloat32(e,t){Sr[0]=t,this.writeInt32(e,_r[0])}writeFloat64(e,t){kr[0]=t,this.writeInt32(e,_r[Ir?0:1]),this.writeInt32(e+4,_r[Ir?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+4+4)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let e="";for(let t=0;t<4;t++)e+=String.fromCharCode(this.readInt8(this.position_+4+t));return e}__offset(e,t){const n=e-this.readInt32(e);return t<this.readInt16(n)?this.readInt16(n+t):0}__union(e,t){return e.bb_pos=t+this.readInt32(t),e.bb=this,e}__string(e,t){e+=this.readInt32(e);const n=this.readInt32(e);let r="",i=0;if(e+=4,t===xr.UTF8_BYTES)return this.bytes_.subarray(e,e+n);for(;i<n;){let t;const n=this.readUint8(e+i++);if(n<192)t=n;else{const r=this.readUint8(e+i++);if(n<224)t=(31&n)<<6|63&r;else{const o=this.readUint8(e+i++);t=n<240?(15&n)<<12|(63&r)<<6|63&o:(7&n)<<18|(63&r)<<12|(63&o)<<6|63&this.readUint8(e+i++)}}t<65536?r+=String.fromCharCode(t):(t-=65536,r+=String.fromCharCode(55296+(t>>10),56320+(1023&t)))}return r}__union_with_string(e,t){return"string"==typeof e?this.__string(t):this.__union(e,t)}__indirect(e){return e+this.readInt32(e)}__vector(e){return e+this.readInt32(e)+4}__vector_len(e){return this.readInt32(e+this.readInt32(e))}__has_identifier(e){if(4!=e.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let t=0;t<4;t++)if(e.charCodeAt(t)!=this.readInt8(this.position()+4+t))return!1;return!0}createLong(e,t){return Tr.create(e,t)}createScalarList(e,t){const n=[];for(let r=0;r<t;++r)null!==e(r)&&n.push(e(r));return n}createObjList(e,t){const n=[];for(let r=0;r<t;++r){const t=e(r);null!==t&&n.push(t.unpack())}return n}}class Dr{constructor(e){let t;this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null,t=e||1024,this.bb=Nr.allocate(t),this.space=t}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(e){this.force_defaults=e}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(e,t){e>this.minalign&&(this.minalign=e);const n=1+~(this.bb.capacity()-this.space+t)&e-1;for(;this.space<n+e+t;){const e=this.bb.capacity();this.bb=Dr.growByteBuffer(this.bb),this.space+=this.bb.capacity()-e}this.pad(n)}pad(e){for(let t=0;t<e;t++)this.bb.writeInt8(--this.space,0)}writeInt8(e){this.bb.writeInt8(this.space-=1,e)}writeInt16(e){this.bb.writeInt16(this.space-=2,e)}writeInt32(e){this.bb.writeInt32(this.space-=4,e)}writeInt64(e){this.bb.writeInt64(this.space-=8,e)}writeFloat32(e){this.bb.writeFloat32(this.space-=4,e)}writeFloat64(e){this.bb.writeFloat64(this.space-=8,e)}addInt8(e){this.prep(1,0),this.writeInt8(e)}addInt16(e){this.prep(2,0),this.writeInt16(e)}addInt32(e){this.prep(4,0),this.writeInt32(e)}addInt64(e){this.prep(8,0),this.writeInt64(e)}addFloat32(e){this.prep(4,0),this.writeFloat32(e)}addFloat64(e){this.prep(8,0),this.writeFloat64(e)}addFieldInt8(e,t,n){(this.force_defaults||t!=n)&&(this.addInt8(t),this.slot(e))}addFieldInt16(e,t,n){(this.force_defaults||t!=n)&&(this.addInt16(t),this.slot(e))}addFieldInt32(e,t,n){(this.force_defaults||t!=n)&&(this.addInt32(t),this.slot(e))}addFieldInt64(e,t,n){!this.force_defaults&&t.equals(n)||(this.addInt64(t),this.slot(e))}addFieldFloat32(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat32(t),this.slot(e))}addFieldFloat64(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat64(t),this.slot(e))}addFieldOffset(e,t,n){(this.force_defaults||t!=n)&&(this.addOffset(t),this.slot(e))}addFieldStruct(e,t,n){t!=n&&(this.nested(t),this.slot(e))}nested(e){if(e!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")}slot(e){null!==this.vtable&&(this.vtable[e]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(e){const t=e.capacity();if(3221225472&t)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");const n=t<<1,r=Nr.allocate(n);return r.setPosition(n-t),r.bytes().set(e.bytes(),n-t),r}addOffset(e){this.prep(4,0),this.writeInt32(this.offset()-e+4)}startObject(e){this.notNested(),null==this.vtable&&(this.vtable=[]),this.vtable_in_use=e;for(let t=0;t<e;t++)this.vtable[t]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(null==this.vtable||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);const e=this.offset();let t=this.vtable_in_use-1;for(;t>=0&&0==this.vtable[t];t--);const n=t+1;for(;t>=0;t--)this.addInt16(0!=this.vtable[t]?e-this.vtable[t]:0);this.addInt16(e-this.object_start);const r=2*(n+2);this.addInt16(r);let i=0;const o=this.space;e:for(t=0;t<this.vtables.length;t++){const e=this.bb.capacity()-this.vtables[t];if(r==this.bb.readInt16(e)){for(let t=2;t<r;t+=2)if(this.bb.readInt16(o+t)!=this.bb.readInt16(e+t))continue e;i=this.vtables[t];break}}return i?(this.space=this.bb.capacity()-e,this.bb.writeInt32(this.space,i-e)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-e,this.offset()-e)),this.isNested=!1,e}finish(e,t,n){const r=n?4:0;if(t){const e=t;if(this.prep(this.minalign,8+r),4!=e.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let t=3;t>=0;t--)this.writeInt8(e.charCodeAt(t))}this.prep(this.minalign,4+r),this.addOffset(e),r&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(e,t){this.finish(e,t,!0)}requiredField(e,t){const n=this.bb.capacity()-e,r=n-this.bb.readInt32(n);if(0==this.bb.readInt16(r+t))throw new Error("FlatBuffers: field "+t+" must be set")}startVector(e,t,n){this.notNested(),this.vector_num_elems=t,this.prep(4,e*t),this.prep(n,e*t)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(e){if(!e)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(e))return this.string_maps.get(e);const t=this.createString(e);return this.string_maps.set(e,t),t}createString(e){if(!e)return 0;let t;if(e instanceof Uint8Array)t=e;else{t=[];let n=0;for(;n<e.length;){let r;const i=e.charCodeAt(n++);r=i<55296||i>=56320?i:(i<<10)+e.charCodeAt(n++)+-56613888,r<128?t.push(r):(r<2048?t.push(r>>6&31|192):(r<65536?t.push(r>>12&15|224):t.push(r>>18&7|240,r>>12&63|128),t.push(r>>6&63|128)),t.push(63&r|128))}}this.addInt8(0),this.startVector(1,t.length,1),this.bb.setPosition(this.space-=t.length);for(let e=0,n=this.space,r=this.bb.bytes();e<t.length;e++)r[n++]=t[e];return this.endVector()}createLong(e,t){return Tr.create(e,t)}createObjectOffset(e){return null===e?0:"string"==typeof e?this.createString(e):e.pack(this)}createObjectOffsetList(e){const t=[];for(let n=0;n<e.length;++n){const r=e[n];if(null===r)throw new Error("FlatBuffers: Argument for createObjectOffsetList cannot contain null.");t.push(this.createObjectOffset(r))}return t}createStructOffsetList(e,t){return t(this,e.length),this.createObjectOffsetList(e),this.endVector()}}class Br{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsKeyValue(e,t){return(t||new Br).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsKeyValue(e,t){return e.setPosition(e.position()+4),(t||new Br).__init(e.readInt32(e.position())+e.position(),e)}key(e){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}value(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startKeyValue(e){e.startObject(2)}static addKey(e,t){e.addFieldOffset(0,t,0)}static addValue(e,t){e.addFieldOffset(1,t,0)}static endKeyValue(e){return e.endObject()}static createKeyValue(e,t,n){return Br.startKeyValue(e),Br.addKey(e,t),Br.addValue(e,n),Br.endKeyValue(e)}}!function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4",e[e.V5=4]="V5"}(Er||(Er={})),function(e){e[e.Little=0]="Little",e[e.Big=1]="Big"}(Or||(Or={})),function(e){e[e.DenseArray=0]="DenseArray"}(Ar||(Ar={}));class Fr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInt(e,t){return(t||new Fr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInt(e,t){return e.setPosition(e.position()+4),(t||new Fr).__init(e.readInt32(e.position())+e.position(),e)}bitWidth(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}isSigned(){const e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startInt(e){e.startObject(2)}static addBitWidth(e,t){e.addFieldInt32(0,t,0)}static addIsSigned(e,t){e.addFieldInt8(1,+t,0)}static endInt(e){return e.endObject()}static createInt(e,t,n){return Fr.startInt(e),Fr.addBitWidth(e,t),Fr.addIsSigned(e,n),Fr.endInt(e)}}class Lr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryEncoding(e,t){return(t||new Lr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDictionaryEncoding(e,t){return e.setPosition(e.position()+4),(t||new Lr).__init(e.readInt32(e.position())+e.position(),e)}id(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}indexType(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new Fr).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isOrdered(){const e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}dictionaryKind(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt16(this.bb_pos+e):Ar.DenseArray}static startDictionaryEncoding(e){e.startObject(4)}static addId(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addIndexType(e,t){e.addFieldOffset(1,t,0)}static addIsOrdered(e,t){e.addFieldInt8(2,+t,0)}static addDictionaryKind(e,t){e.addFieldInt16(3,t,Ar.DenseArray)}static endDictionaryEncoding(e){return e.endObject()}}!function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.FloatingPoint=3]="FloatingPoint",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct_=13]="Struct_",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Duration=18]="Duration",e[e.LargeBinary=19]="LargeBinary",e[e.LargeUtf8=20]="LargeUtf8",e[e.LargeList=21]="LargeList"}(Cr||(Cr={}));class Mr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsField(e,t){return(t||new Mr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsField(e,t){return e.setPosition(e.position()+4),(t||new Mr).__init(e.readInt32(e.position())+e.position(),e)}name(e){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}nullable(){const e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}typeType(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readUint8(this.bb_pos+e):Cr.NONE}type(e){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__union(e,this.bb_pos+t):null}dictionary(e){const t=this.bb.__offset(this.bb_pos,12);return t?(e||new Lr).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}children(e,t){const n=this.bb.__offset(this.bb_pos,14);return n?(t||new Mr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}childrenLength(){const e=this.bb.__offset(this.bb_pos,14);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,16);return n?(t||new Br).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,16);return e?this.bb.__vector_len(this.bb_pos+e):0}static startField(e){e.startObject(7)}static addName(e,t){e.addFieldOffset(0,t,0)}static addNullable(e,t){e.addFieldInt8(1,+t,0)}static addTypeType(e,t){e.addFieldInt8(2,t,Cr.NONE)}static addType(e,t){e.addFieldOffset(3,t,0)}static addDictionary(e,t){e.addFieldOffset(4,t,0)}static addChildren(e,t){e.addFieldOffset(5,t,0)}static createChildrenVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startChildrenVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(6,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endField(e){return e.endObject()}}class Pr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsSchema(e,t){return(t||new Pr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsSchema(e,t){return e.setPosition(e.position()+4),(t||new Pr).__init(e.readInt32(e.position())+e.position(),e)}endianness(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Or.Little}fields(e,t){const n=this.bb.__offset(this.bb_pos,6);return n?(t||new Mr).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}fieldsLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new Br).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}features(e){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb.__vector(this.bb_pos+t)+8*e):this.bb.createLong(0,0)}featuresLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}static startSchema(e){e.startObject(4)}static addEndianness(e,t){e.addFieldInt16(0,t,Or.Little)}static addFields(e,t){e.addFieldOffset(1,t,0)}static createFieldsVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startFieldsVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(2,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static addFeatures(e,t){e.addFieldOffset(3,t,0)}static createFeaturesVector(e,t){e.startVector(8,t.length,8);for(let n=t.length-1;n>=0;n--)e.addInt64(t[n]);return e.endVector()}static startFeaturesVector(e,t){e.startVector(8,t,8)}static endSchema(e){return e.endObject()}static finishSchemaBuffer(e,t){e.finish(t)}static finishSizePrefixedSchemaBuffer(e,t){e.finish(t,void 0,!0)}static createSchema(e,t,n,r,i){return Pr.startSchema(e),Pr.addEndianness(e,t),Pr.addFields(e,n),Pr.addCustomMetadata(e,r),Pr.addFeatures(e,i),Pr.endSchema(e)}}class zr{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFooter(e,t){return(t||new zr).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFooter(e,t){return e.setPosition(e.position()+4),(t||new zr).__init(e.readInt32(e.position())+e.position(),e)}version(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Er.V1}schema(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new Pr).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}dictionaries(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new wr).__init(this.bb.__vector(this.bb_pos+n)+24*e,this.bb):null}dictionariesLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}recordBatches(e,t){const n=this.bb.__offset(this.bb_pos,10);return n?(t||new wr).__init(this.bb.__vector(this.bb_pos+n)+24*e,this.bb):null}recordBatchesLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,12);return n?(t||new Br).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startFooter(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,Er.V1)}static addSchema(e,t){e.addFieldOffset(1,t,0)}static addDictionaries(e,t){e.addFieldOffset(2,t,0)}static startDictionariesVector(e,t){e.startVector(24,t,8)}static addRecordBatches(e,t){e.addFieldOffset(3,t,0)}static startRecordBatchesVector(e,t){e.startVector(24,t,8)}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endFooter(e){return e.endObject()}static finishFooterBuffer(e,t){e.finish(t)}static finishSizePrefixedFooterBuffer(e,t){e.finish(t,void 0,!0)}}var Ur=Tr,Rr=Dr,jr=Nr;class Vr{constructor(e,t=r.V4,n,i){this.schema=e,this.version=t,n&&(this._recordBatches=n),i&&(this._dictionaryBatches=i)}static decode(e){e=new jr(G(e));const t=zr.getRootAsFooter(e),n=Kn.decode(t.schema());return new $r(n,t)}static encode(e){const t=new Rr,n=Kn.encode(t,e.schema);zr.startRecordBatchesVector(t,e.numRecordBatches);for(const n of[...e.recordBatches()].slice().reverse())Hr.encode(t,n);const i=t.endVector();zr.startDictionariesVector(t,e.numDictionaries);for(const n of[...e.dictionaryBatches()].slice().reverse())Hr.encode(t,n);const o=t.endVector();return zr.startFooter(t),zr.addSchema(t,n),zr.addVersion(t,r.V4),zr.addRecordBatches(t,i),zr.addDictionaries(t,o),zr.finishFooterBuffer(t,zr.endFooter(t)),t.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let e,t=-1,n=this.numRecordBatches;++t<n;)(e=this.getRecordBatch(t))&&(yield e)}*dictionaryBatches(){for(let e,t=-1,n=this.numDictionaries;++t<n;)(e=this.getDictionaryBatch(t))&&(yield e)}getRecordBatch(e){return e>=0&&e<this.numRecordBatches&&this._recordBatches[e]||null}getDictionaryBatch(e){return e>=0&&e<this.numDictionaries&&this._dictionaryBatches[e]||null}}class $r extends Vr{constructor(e,t){super(e,t.version()),this._footer=t}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(e){if(e>=0&&e<this.numRecordBatches){const t=this._footer.recordBatches(e);if(t)return Hr.decode(t)}return null}getDictionaryBatch(e){if(e>=0&&e<this.numDictionaries){const t=this._footer.dictionaries(e);if(t)return Hr.decode(t)}return null}}class Hr{constructor(e,t,n){this.metaDataLength=e,this.offset="number"==typeof n?n:n.low,this.bodyLength="number"==typeof t?t:t.low}static decode(e){return new Hr(e.metaDataLength(),e.bodyLength(),e.offset())}static encode(e,t){const{metaDataLength:n}=t,r=new Ur(t.offset,0),i=new Ur(t.bodyLength,0);return wr.createBlock(e,r,n,i)}}var Wr={fromIterable(e){return Yr(function*(e){let t,n,r,i,o=!1,s=[],a=0;function l(){return"peek"===r?q(s,i)[0]:([n,s,a]=q(s,i),n)}({cmd:r,size:i}=yield null);const u=(c=e,function*(e,t){const n=function*(e){yield e},r="string"==typeof t||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof W?n(t):x(t)?t:n(t);return yield*X(function*(t){let n=null;do{n=t.next(yield Q(e,n))}while(!n.done)}(r[Symbol.iterator]())),new e}(Uint8Array,c))[Symbol.iterator]();var c;try{do{if(({done:t,value:n}=Number.isNaN(i-a)?u.next():u.next(i-a)),!t&&n.byteLength>0&&(s.push(n),a+=n.byteLength),t||i<=a)do{({cmd:r,size:i}=yield l())}while(i<a)}while(!t)}catch(e){(o=!0)&&"function"==typeof u.throw&&u.throw(e)}finally{!1===o&&"function"==typeof u.return&&u.return(null)}return null}(e))},fromAsyncIterable(e){return Yr(function(e){return z(this,arguments,function*(){let t,n,r,i,o=!1,s=[],a=0;function l(){return"peek"===r?q(s,i)[0]:([n,s,a]=q(s,i),n)}({cmd:r,size:i}=yield yield P(null));const u=(c=e,J(Uint8Array,c))[Symbol.asyncIterator]();var c;try{do{if(({done:t,value:n}=Number.isNaN(i-a)?yield P(u.next()):yield P(u.next(i-a))),!t&&n.byteLength>0&&(s.push(n),a+=n.byteLength),t||i<=a)do{({cmd:r,size:i}=yield yield P(l()))}while(i<a)}while(!t)}catch(e){(o=!0)&&"function"==typeof u.throw&&(yield P(u.throw(e)))}finally{!1===o&&"function"==typeof u.return&&(yield P(u.return(new Uint8Array(0))))}return yield P(null)})}(e))},fromDOMStream(e){return Yr(function(e){return z(this,arguments,function*(){let t,n,r,i=!1,o=!1,s=[],a=0;function l(){return"peek"===n?q(s,r)[0]:([t,s,a]=q(s,r),t)}({cmd:n,size:r}=yield yield P(null));const u=new qr(e);try{do{if(({done:i,value:t}=Number.isNaN(r-a)?yield P(u.read()):yield P(u.read(r-a))),!i&&t.byteLength>0&&(s.push(G(t)),a+=t.byteLength),i||r<=a)do{({cmd:n,size:r}=yield yield P(l()))}while(r<a)}while(!i)}catch(e){(o=!0)&&(yield P(u.cancel(e)))}finally{!1===o?yield P(u.cancel()):e.locked&&u.releaseLock()}return yield P(null)})}(e))},fromNodeStream(e){return Yr(function(e){return z(this,arguments,function*(){const t=[];let n,r,i,o="error",s=!1,a=null,l=0,u=[];function c(){return"peek"===n?q(u,r)[0]:([i,u,l]=q(u,r),i)}if(({cmd:n,size:r}=yield yield P(null)),e.isTTY)return yield yield P(new Uint8Array(0)),yield P(null);try{t[0]=Qr(e,"end"),t[1]=Qr(e,"error");do{if(t[2]=Qr(e,"readable"),[o,a]=yield P(Promise.race(t.map(e=>e[2]))),"error"===o)break;if((s="end"===o)||(Number.isFinite(r-l)?(i=G(e.read(r-l)),i.byteLength<r-l&&(i=G(e.read()))):i=G(e.read()),i.byteLength>0&&(u.push(i),l+=i.byteLength)),s||r<=l)do{({cmd:n,size:r}=yield yield P(c()))}while(r<l)}while(!s)}finally{yield P(function(t,n){return i=u=null,new Promise((r,i)=>{for(const[n,r]of t)e.off(n,r);try{const t=e.destroy;t&&t.call(e,n),n=void 0}catch(e){n=e||n}finally{null!=n?i(n):r()}})}(t,"error"===o?a:null))}return yield P(null)})}(e))},toDOMStream(e,t){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(e,t){throw new Error('"toNodeStream" not available in this environment')}};const Yr=e=>(e.next(),e);class qr{constructor(e){this.source=e,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch(()=>{})}get closed(){return this.reader?this.reader.closed.catch(()=>{}):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(e){return M(this,void 0,void 0,function*(){const{reader:t,source:n}=this;t&&(yield t.cancel(e).catch(()=>{})),n&&n.locked&&this.releaseLock()})}read(e){return M(this,void 0,void 0,function*(){if(0===e)return{done:null==this.reader,value:new Uint8Array(0)};const t=yield this.reader.read();return!t.done&&(t.value=G(t)),t})}}const Qr=(e,t)=>{const n=e=>r([t,e]);let r;return[t,n,new Promise(i=>(r=i)&&e.once(t,n))]},Kr=Object.freeze({done:!0,value:void 0});class Gr{constructor(e){this._json=e}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class Xr{tee(){return this._getDOMStream().tee()}pipe(e,t){return this._getNodeStream().pipe(e,t)}pipeTo(e,t){return this._getDOMStream().pipeTo(e,t)}pipeThrough(e,t){return this._getDOMStream().pipeThrough(e,t)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class Jr extends Xr{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise(e=>this._closedPromiseResolve=e)}get closed(){return this._closedPromise}cancel(e){return M(this,void 0,void 0,function*(){yield this.return(e)})}write(e){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(e):this.resolvers.shift().resolve({done:!1,value:e}))}abort(e){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:e}:this.resolvers.shift().reject({done:!0,value:e}))}close(){if(this._closedPromiseResolve){const{resolvers:e}=this;for(;e.length>0;)e.shift().resolve(Kr);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(e){return Wr.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,e)}toNodeStream(e){return Wr.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,e)}throw(e){return M(this,void 0,void 0,function*(){return yield this.abort(e),Kr})}return(e){return M(this,void 0,void 0,function*(){return yield this.close(),Kr})}read(e){return M(this,void 0,void 0,function*(){return(yield this.next(e,"read")).value})}peek(e){return M(this,void 0,void 0,function*(){return(yield this.next(e,"peek")).value})}next(...e){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise((e,t)=>{this.resolvers.push({resolve:e,reject:t})}):Promise.resolve(Kr)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}}class Zr extends Jr{write(e){if((e=G(e)).byteLength>0)return super.write(e)}toString(e=!1){return e?V(this.toUint8Array(!0)):this.toUint8Array(!1).then(V)}toUint8Array(e=!1){return e?q(this._values)[0]:(()=>M(this,void 0,void 0,function*(){var e,t;const n=[];let r=0;try{for(var i,o=R(this);!(i=yield o.next()).done;){const e=i.value;n.push(e),r+=e.byteLength}}catch(t){e={error:t}}finally{try{i&&!i.done&&(t=o.return)&&(yield t.call(o))}finally{if(e)throw e.error}}return q(n,r)[0]}))()}}class ei{constructor(e){e&&(this.source=new ni(Wr.fromIterable(e)))}[Symbol.iterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class ti{constructor(e){e instanceof ti?this.source=e.source:e instanceof Zr?this.source=new ri(Wr.fromAsyncIterable(e)):F(e)?this.source=new ri(Wr.fromNodeStream(e)):B(e)?this.source=new ri(Wr.fromDOMStream(e)):N(e)?this.source=new ri(Wr.fromDOMStream(e.body)):x(e)?this.source=new ri(Wr.fromIterable(e)):(T(e)||E(e))&&(this.source=new ri(Wr.fromAsyncIterable(e)))}[Symbol.asyncIterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}get closed(){return this.source.closed}cancel(e){return this.source.cancel(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}}class ni{constructor(e){this.source=e}cancel(e){this.return(e)}peek(e){return this.next(e,"peek").value}read(e){return this.next(e,"read").value}next(e,t="read"){return this.source.next({cmd:t,size:e})}throw(e){return Object.create(this.source.throw&&this.source.throw(e)||Kr)}return(e){return Object.create(this.source.return&&this.source.return(e)||Kr)}}class ri{constructor(e){this.source=e,this._closedPromise=new Promise(e=>this._closedPromiseResolve=e)}cancel(e){return M(this,void 0,void 0,function*(){yield this.return(e)})}get closed(){return this._closedPromise}read(e){return M(this,void 0,void 0,function*(){return(yield this.next(e,"read")).value})}peek(e){return M(this,void 0,void 0,function*(){return(yield this.next(e,"peek")).value})}next(e,t="read"){return M(this,void 0,void 0,function*(){return yield this.source.next({cmd:t,size:e})})}throw(e){return M(this,void 0,void 0,function*(){const t=this.source.throw&&(yield this.source.throw(e))||Kr;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)})}return(e){return M(this,void 0,void 0,function*(){const t=this.source.return&&(yield this.source.return(e))||Kr;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)})}}class ii extends ei{constructor(e,t){super(),this.position=0,this.buffer=G(e),this.size=void 0===t?this.buffer.byteLength:t}readInt32(e){const{buffer:t,byteOffset:n}=this.readAt(e,4);return new DataView(t,n).getInt32(0,!0)}seek(e){return this.position=Math.min(e,this.size),e<this.size}read(e){const{buffer:t,size:n,position:r}=this;return t&&r<n?("number"!=typeof e&&(e=Number.POSITIVE_INFINITY),this.position=Math.min(n,r+Math.min(n-r,e)),t.subarray(r,this.position)):null}readAt(e,t){const n=this.buffer,r=Math.min(this.size,e+t);return n?n.subarray(e,r):new Uint8Array(t)}close(){this.buffer&&(this.buffer=null)}throw(e){return this.close(),{done:!0,value:e}}return(e){return this.close(),{done:!0,value:e}}}class oi extends ti{constructor(e,t){super(),this.position=0,this._handle=e,"number"==typeof t?this.size=t:this._pending=(()=>M(this,void 0,void 0,function*(){this.size=(yield e.stat()).size,delete this._pending}))()}readInt32(e){return M(this,void 0,void 0,function*(){const{buffer:t,byteOffset:n}=yield this.readAt(e,4);return new DataView(t,n).getInt32(0,!0)})}seek(e){return M(this,void 0,void 0,function*(){return this._pending&&(yield this._pending),this.position=Math.min(e,this.size),e<this.size})}read(e){return M(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:t,size:n,position:r}=this;if(t&&r<n){"number"!=typeof e&&(e=Number.POSITIVE_INFINITY);let i=r,o=0,s=0;const a=Math.min(n,i+Math.min(n-i,e)),l=new Uint8Array(Math.max(0,(this.position=a)-i));for(;(i+=s)<a&&(o+=s)<l.byteLength;)({bytesRead:s}=yield t.read(l,o,l.byteLength-o,i));return l}return null})}readAt(e,t){return M(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:n,size:r}=this;if(n&&e+t<r){const i=Math.min(r,e+t),o=new Uint8Array(i-e);return(yield n.read(o,0,t,e)).buffer}return new Uint8Array(t)})}close(){return M(this,void 0,void 0,function*(){const e=this._handle;this._handle=null,e&&(yield e.close())})}throw(e){return M(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:e}})}return(e){return M(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:e}})}}function si(e){return e<0&&(e=4294967295+e+1),`0x${e.toString(16)}`}const ai=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8];class li{constructor(e){this.buffer=e}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(e){const t=new Uint32Array([this.buffer[1]>>>16,65535&this.buffer[1],this.buffer[0]>>>16,65535&this.buffer[0]]),n=new Uint32Array([e.buffer[1]>>>16,65535&e.buffer[1],e.buffer[0]>>>16,65535&e.buffer[0]]);let r=t[3]*n[3];this.buffer[0]=65535&r;let i=r>>>16;return r=t[2]*n[3],i+=r,r=t[3]*n[2]>>>0,i+=r,this.buffer[0]+=i<<16,this.buffer[1]=i>>>0<r?65536:0,this.buffer[1]+=i>>>16,this.buffer[1]+=t[1]*n[3]+t[2]*n[2]+t[3]*n[1],this.buffer[1]+=t[0]*n[3]+t[1]*n[2]+t[2]*n[1]+t[3]*n[0]<<16,this}_plus(e){const t=this.buffer[0]+e.buffer[0]>>>0;this.buffer[1]+=e.buffer[1],t<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=t}lessThan(e){return this.buffer[1]<e.buffer[1]||this.buffer[1]===e.buffer[1]&&this.buffer[0]<e.buffer[0]}equals(e){return this.buffer[1]===e.buffer[1]&&this.buffer[0]==e.buffer[0]}greaterThan(e){return e.lessThan(this)}hex(){return`${si(this.buffer[1])} ${si(this.buffer[0])}`}}class ui extends li{times(e){return this._times(e),this}plus(e){return this._plus(e),this}static from(e,t=new Uint32Array(2)){return ui.fromString("string"==typeof e?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return ui.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){const n=e.length,r=new ui(t);for(let t=0;t<n;){const i=8<n-t?8:n-t,o=new ui(new Uint32Array([Number.parseInt(e.slice(t,t+i),10),0])),s=new ui(new Uint32Array([ai[i],0]));r.times(s),r.plus(o),t+=i}return r}static convertArray(e){const t=new Uint32Array(2*e.length);for(let n=-1,r=e.length;++n<r;)ui.from(e[n],new Uint32Array(t.buffer,t.byteOffset+2*n*4,2));return t}static multiply(e,t){return new ui(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new ui(new Uint32Array(e.buffer)).plus(t)}}class ci extends li{negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],0==this.buffer[0]&&++this.buffer[1],this}times(e){return this._times(e),this}plus(e){return this._plus(e),this}lessThan(e){const t=0|this.buffer[1],n=0|e.buffer[1];return t<n||t===n&&this.buffer[0]<e.buffer[0]}static from(e,t=new Uint32Array(2)){return ci.fromString("string"==typeof e?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return ci.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){const n=e.startsWith("-"),r=e.length,i=new ci(t);for(let t=n?1:0;t<r;){const n=8<r-t?8:r-t,o=new ci(new Uint32Array([Number.parseInt(e.slice(t,t+n),10),0])),s=new ci(new Uint32Array([ai[n],0]));i.times(s),i.plus(o),t+=n}return n?i.negate():i}static convertArray(e){const t=new Uint32Array(2*e.length);for(let n=-1,r=e.length;++n<r;)ci.from(e[n],new Uint32Array(t.buffer,t.byteOffset+2*n*4,2));return t}static multiply(e,t){return new ci(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new ci(new Uint32Array(e.buffer)).plus(t)}}class di{constructor(e){this.buffer=e}high(){return new ci(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new ci(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],0==this.buffer[0]&&++this.buffer[1],0==this.buffer[1]&&++this.buffer[2],0==this.buffer[2]&&++this.buffer[3],this}times(e){const t=new ui(new Uint32Array([this.buffer[3],0])),n=new ui(new Uint32Array([this.buffer[2],0])),r=new ui(new Uint32Array([this.buffer[1],0])),i=new ui(new Uint32Array([this.buffer[0],0])),o=new ui(new Uint32Array([e.buffer[3],0])),s=new ui(new Uint32Array([e.buffer[2],0])),a=new ui(new Uint32Array([e.buffer[1],0])),l=new ui(new Uint32Array([e.buffer[0],0]));let u=ui.multiply(i,l);this.buffer[0]=u.low();const c=new ui(new Uint32Array([u.high(),0]));return u=ui.multiply(r,l),c.plus(u),u=ui.multiply(i,a),c.plus(u),this.buffer[1]=c.low(),this.buffer[3]=c.lessThan(u)?1:0,this.buffer[2]=c.high(),new ui(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(ui.multiply(n,l)).plus(ui.multiply(r,a)).plus(ui.multiply(i,s)),this.buffer[3]+=ui.multiply(t,l).plus(ui.multiply(n,a)).plus(ui.multiply(r,s)).plus(ui.multiply(i,o)).low(),this}plus(e){const t=new Uint32Array(4);return t[3]=this.buffer[3]+e.buffer[3]>>>0,t[2]=this.buffer[2]+e.buffer[2]>>>0,t[1]=this.buffer[1]+e.buffer[1]>>>0,t[0]=this.buffer[0]+e.buffer[0]>>>0,t[0]<this.buffer[0]>>>0&&++t[1],t[1]<this.buffer[1]>>>0&&++t[2],t[2]<this.buffer[2]>>>0&&++t[3],this.buffer[3]=t[3],this.buffer[2]=t[2],this.buffer[1]=t[1],this.buffer[0]=t[0],this}hex(){return`${si(this.buffer[3])} ${si(this.buffer[2])} ${si(this.buffer[1])} ${si(this.buffer[0])}`}static multiply(e,t){return new di(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new di(new Uint32Array(e.buffer)).plus(t)}static from(e,t=new Uint32Array(4)){return di.fromString("string"==typeof e?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(4)){return di.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(4)){const n=e.startsWith("-"),r=e.length,i=new di(t);for(let t=n?1:0;t<r;){const n=8<r-t?8:r-t,o=new di(new Uint32Array([Number.parseInt(e.slice(t,t+n),10),0,0,0])),s=new di(new Uint32Array([ai[n],0,0,0]));i.times(s),i.plus(o),t+=n}return n?i.negate():i}static convertArray(e){const t=new Uint32Array(4*e.length);for(let n=-1,r=e.length;++n<r;)di.from(e[n],new Uint32Array(t.buffer,t.byteOffset+16*n,4));return t}}class fi extends Ze{constructor(e,t,n,r){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=e,this.nodes=t,this.buffers=n,this.dictionaries=r}visit(e){return super.visit(e instanceof Gn?e.type:e)}visitNull(e,{length:t}=this.nextFieldNode()){return Qn({type:e,length:t})}visitBool(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitInt(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitFloat(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitUtf8(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitBinary(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitFixedSizeBinary(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitDate(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitTimestamp(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitTime(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitDecimal(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitList(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}visitStruct(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),children:this.visitMany(e.children)})}visitUnion(e){return e.mode===i.Sparse?this.visitSparseUnion(e):this.visitDenseUnion(e)}visitDenseUnion(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),typeIds:this.readTypeIds(e),valueOffsets:this.readOffsets(e),children:this.visitMany(e.children)})}visitSparseUnion(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),typeIds:this.readTypeIds(e),children:this.visitMany(e.children)})}visitDictionary(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e.indices),dictionary:this.readDictionary(e)})}visitInterval(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),data:this.readData(e)})}visitFixedSizeList(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),child:this.visit(e.children[0])})}visitMap(e,{length:t,nullCount:n}=this.nextFieldNode()){return Qn({type:e,length:t,nullCount:n,nullBitmap:this.readNullBitmap(e,n),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(e,t,n=this.nextBufferRange()){return t>0&&this.readData(e,n)||new Uint8Array(0)}readOffsets(e,t){return this.readData(e,t)}readTypeIds(e,t){return this.readData(e,t)}readData(e,{length:t,offset:n}=this.nextBufferRange()){return this.bytes.subarray(n,n+t)}readDictionary(e){return this.dictionaries.get(e.id)}}class hi extends fi{constructor(e,t,n,r){super(new Uint8Array(0),t,n,r),this.sources=e}readNullBitmap(e,t,{offset:n}=this.nextBufferRange()){return t<=0?new Uint8Array(0):In(this.sources[n])}readOffsets(e,{offset:t}=this.nextBufferRange()){return Q(Uint8Array,Q(Int32Array,this.sources[t]))}readTypeIds(e,{offset:t}=this.nextBufferRange()){return Q(Uint8Array,Q(e.ArrayType,this.sources[t]))}readData(e,{offset:t}=this.nextBufferRange()){const{sources:n}=this;return Ce.isTimestamp(e)||(Ce.isInt(e)||Ce.isTime(e))&&64===e.bitWidth||Ce.isDate(e)&&e.unit===s.MILLISECOND?Q(Uint8Array,ci.convertArray(n[t])):Ce.isDecimal(e)?Q(Uint8Array,di.convertArray(n[t])):Ce.isBinary(e)||Ce.isFixedSizeBinary(e)?function(e){const t=e.join(""),n=new Uint8Array(t.length/2);for(let e=0;e<t.length;e+=2)n[e>>1]=Number.parseInt(t.slice(e,e+2),16);return n}(n[t]):Ce.isBool(e)?In(n[t]):Ce.isUtf8(e)?H(n[t].join("")):Q(Uint8Array,Q(e.ArrayType,n[t].map(e=>+e)))}}var pi,yi,bi,mi,gi,vi,wi,_i;!function(e){e[e.BUFFER=0]="BUFFER"}(pi||(pi={})),function(e){e[e.LZ4_FRAME=0]="LZ4_FRAME",e[e.ZSTD=1]="ZSTD"}(yi||(yi={}));class Si{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBodyCompression(e,t){return(t||new Si).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBodyCompression(e,t){return e.setPosition(e.position()+4),(t||new Si).__init(e.readInt32(e.position())+e.position(),e)}codec(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt8(this.bb_pos+e):yi.LZ4_FRAME}method(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt8(this.bb_pos+e):pi.BUFFER}static startBodyCompression(e){e.startObject(2)}static addCodec(e,t){e.addFieldInt8(0,t,yi.LZ4_FRAME)}static addMethod(e,t){e.addFieldInt8(1,t,pi.BUFFER)}static endBodyCompression(e){return e.endObject()}static createBodyCompression(e,t,n){return Si.startBodyCompression(e),Si.addCodec(e,t),Si.addMethod(e,n),Si.endBodyCompression(e)}}class ki{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}}class Ii{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}}class Ti{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsRecordBatch(e,t){return(t||new Ti).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsRecordBatch(e,t){return e.setPosition(e.position()+4),(t||new Ti).__init(e.readInt32(e.position())+e.position(),e)}length(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}nodes(e,t){const n=this.bb.__offset(this.bb_pos,6);return n?(t||new Ii).__init(this.bb.__vector(this.bb_pos+n)+16*e,this.bb):null}nodesLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}buffers(e,t){const n=this.bb.__offset(this.bb_pos,8);return n?(t||new ki).__init(this.bb.__vector(this.bb_pos+n)+16*e,this.bb):null}buffersLength(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}compression(e){const t=this.bb.__offset(this.bb_pos,10);return t?(e||new Si).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}static startRecordBatch(e){e.startObject(4)}static addLength(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addNodes(e,t){e.addFieldOffset(1,t,0)}static startNodesVector(e,t){e.startVector(16,t,8)}static addBuffers(e,t){e.addFieldOffset(2,t,0)}static startBuffersVector(e,t){e.startVector(16,t,8)}static addCompression(e,t){e.addFieldOffset(3,t,0)}static endRecordBatch(e){return e.endObject()}}class xi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryBatch(e,t){return(t||new xi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDictionaryBatch(e,t){return e.setPosition(e.position()+4),(t||new xi).__init(e.readInt32(e.position())+e.position(),e)}id(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}data(e){const t=this.bb.__offset(this.bb_pos,6);return t?(e||new Ti).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isDelta(){const e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startDictionaryBatch(e){e.startObject(3)}static addId(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}static addData(e,t){e.addFieldOffset(1,t,0)}static addIsDelta(e,t){e.addFieldInt8(2,+t,0)}static endDictionaryBatch(e){return e.endObject()}}!function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(bi||(bi={}));class Ei{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFloatingPoint(e,t){return(t||new Ei).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFloatingPoint(e,t){return e.setPosition(e.position()+4),(t||new Ei).__init(e.readInt32(e.position())+e.position(),e)}precision(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):bi.HALF}static startFloatingPoint(e){e.startObject(1)}static addPrecision(e,t){e.addFieldInt16(0,t,bi.HALF)}static endFloatingPoint(e){return e.endObject()}static createFloatingPoint(e,t){return Ei.startFloatingPoint(e),Ei.addPrecision(e,t),Ei.endFloatingPoint(e)}}class Oi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDecimal(e,t){return(t||new Oi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDecimal(e,t){return e.setPosition(e.position()+4),(t||new Oi).__init(e.readInt32(e.position())+e.position(),e)}precision(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}scale(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):0}bitWidth(){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readInt32(this.bb_pos+e):128}static startDecimal(e){e.startObject(3)}static addPrecision(e,t){e.addFieldInt32(0,t,0)}static addScale(e,t){e.addFieldInt32(1,t,0)}static addBitWidth(e,t){e.addFieldInt32(2,t,128)}static endDecimal(e){return e.endObject()}static createDecimal(e,t,n,r){return Oi.startDecimal(e),Oi.addPrecision(e,t),Oi.addScale(e,n),Oi.addBitWidth(e,r),Oi.endDecimal(e)}}!function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(mi||(mi={}));class Ai{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDate(e,t){return(t||new Ai).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDate(e,t){return e.setPosition(e.position()+4),(t||new Ai).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):mi.MILLISECOND}static startDate(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,mi.MILLISECOND)}static endDate(e){return e.endObject()}static createDate(e,t){return Ai.startDate(e),Ai.addUnit(e,t),Ai.endDate(e)}}!function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(gi||(gi={}));class Ci{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTime(e,t){return(t||new Ci).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTime(e,t){return e.setPosition(e.position()+4),(t||new Ci).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):gi.MILLISECOND}bitWidth(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):32}static startTime(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,gi.MILLISECOND)}static addBitWidth(e,t){e.addFieldInt32(1,t,32)}static endTime(e){return e.endObject()}static createTime(e,t,n){return Ci.startTime(e),Ci.addUnit(e,t),Ci.addBitWidth(e,n),Ci.endTime(e)}}class Ni{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTimestamp(e,t){return(t||new Ni).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTimestamp(e,t){return e.setPosition(e.position()+4),(t||new Ni).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):gi.SECOND}timezone(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startTimestamp(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,gi.SECOND)}static addTimezone(e,t){e.addFieldOffset(1,t,0)}static endTimestamp(e){return e.endObject()}static createTimestamp(e,t,n){return Ni.startTimestamp(e),Ni.addUnit(e,t),Ni.addTimezone(e,n),Ni.endTimestamp(e)}}!function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME",e[e.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(vi||(vi={}));class Di{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInterval(e,t){return(t||new Di).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInterval(e,t){return e.setPosition(e.position()+4),(t||new Di).__init(e.readInt32(e.position())+e.position(),e)}unit(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):vi.YEAR_MONTH}static startInterval(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,vi.YEAR_MONTH)}static endInterval(e){return e.endObject()}static createInterval(e,t){return Di.startInterval(e),Di.addUnit(e,t),Di.endInterval(e)}}!function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(wi||(wi={}));class Bi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUnion(e,t){return(t||new Bi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUnion(e,t){return e.setPosition(e.position()+4),(t||new Bi).__init(e.readInt32(e.position())+e.position(),e)}mode(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):wi.Sparse}typeIds(e){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb.__vector(this.bb_pos+t)+4*e):0}typeIdsLength(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}typeIdsArray(){const e=this.bb.__offset(this.bb_pos,6);return e?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+e),this.bb.__vector_len(this.bb_pos+e)):null}static startUnion(e){e.startObject(2)}static addMode(e,t){e.addFieldInt16(0,t,wi.Sparse)}static addTypeIds(e,t){e.addFieldOffset(1,t,0)}static createTypeIdsVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addInt32(t[n]);return e.endVector()}static startTypeIdsVector(e,t){e.startVector(4,t,4)}static endUnion(e){return e.endObject()}static createUnion(e,t,n){return Bi.startUnion(e),Bi.addMode(e,t),Bi.addTypeIds(e,n),Bi.endUnion(e)}}class Fi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeBinary(e,t){return(t||new Fi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeBinary(e,t){return e.setPosition(e.position()+4),(t||new Fi).__init(e.readInt32(e.position())+e.position(),e)}byteWidth(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeBinary(e){e.startObject(1)}static addByteWidth(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeBinary(e){return e.endObject()}static createFixedSizeBinary(e,t){return Fi.startFixedSizeBinary(e),Fi.addByteWidth(e,t),Fi.endFixedSizeBinary(e)}}class Li{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeList(e,t){return(t||new Li).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeList(e,t){return e.setPosition(e.position()+4),(t||new Li).__init(e.readInt32(e.position())+e.position(),e)}listSize(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeList(e){e.startObject(1)}static addListSize(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeList(e){return e.endObject()}static createFixedSizeList(e,t){return Li.startFixedSizeList(e),Li.addListSize(e,t),Li.endFixedSizeList(e)}}class Mi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMap(e,t){return(t||new Mi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsMap(e,t){return e.setPosition(e.position()+4),(t||new Mi).__init(e.readInt32(e.position())+e.position(),e)}keysSorted(){const e=this.bb.__offset(this.bb_pos,4);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}static startMap(e){e.startObject(1)}static addKeysSorted(e,t){e.addFieldInt8(0,+t,0)}static endMap(e){return e.endObject()}static createMap(e,t){return Mi.startMap(e),Mi.addKeysSorted(e,t),Mi.endMap(e)}}!function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(_i||(_i={}));class Pi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMessage(e,t){return(t||new Pi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsMessage(e,t){return e.setPosition(e.position()+4),(t||new Pi).__init(e.readInt32(e.position())+e.position(),e)}version(){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Er.V1}headerType(){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readUint8(this.bb_pos+e):_i.NONE}header(e){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__union(e,this.bb_pos+t):null}bodyLength(){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}customMetadata(e,t){const n=this.bb.__offset(this.bb_pos,12);return n?(t||new Br).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}customMetadataLength(){const e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startMessage(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,Er.V1)}static addHeaderType(e,t){e.addFieldInt8(1,t,_i.NONE)}static addHeader(e,t){e.addFieldOffset(2,t,0)}static addBodyLength(e,t){e.addFieldInt64(3,t,e.createLong(0,0))}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endMessage(e){return e.endObject()}static finishMessageBuffer(e,t){e.finish(t)}static finishSizePrefixedMessageBuffer(e,t){e.finish(t,void 0,!0)}static createMessage(e,t,n,r,i,o){return Pi.startMessage(e),Pi.addVersion(e,t),Pi.addHeaderType(e,n),Pi.addHeader(e,r),Pi.addBodyLength(e,i),Pi.addCustomMetadata(e,o),Pi.endMessage(e)}}class zi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsNull(e,t){return(t||new zi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsNull(e,t){return e.setPosition(e.position()+4),(t||new zi).__init(e.readInt32(e.position())+e.position(),e)}static startNull(e){e.startObject(0)}static endNull(e){return e.endObject()}static createNull(e){return zi.startNull(e),zi.endNull(e)}}class Ui{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBinary(e,t){return(t||new Ui).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBinary(e,t){return e.setPosition(e.position()+4),(t||new Ui).__init(e.readInt32(e.position())+e.position(),e)}static startBinary(e){e.startObject(0)}static endBinary(e){return e.endObject()}static createBinary(e){return Ui.startBinary(e),Ui.endBinary(e)}}class Ri{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBool(e,t){return(t||new Ri).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBool(e,t){return e.setPosition(e.position()+4),(t||new Ri).__init(e.readInt32(e.position())+e.position(),e)}static startBool(e){e.startObject(0)}static endBool(e){return e.endObject()}static createBool(e){return Ri.startBool(e),Ri.endBool(e)}}class ji{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUtf8(e,t){return(t||new ji).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUtf8(e,t){return e.setPosition(e.position()+4),(t||new ji).__init(e.readInt32(e.position())+e.position(),e)}static startUtf8(e){e.startObject(0)}static endUtf8(e){return e.endObject()}static createUtf8(e){return ji.startUtf8(e),ji.endUtf8(e)}}class Vi{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsList(e,t){return(t||new Vi).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsList(e,t){return e.setPosition(e.position()+4),(t||new Vi).__init(e.readInt32(e.position())+e.position(),e)}static startList(e){e.startObject(0)}static endList(e){return e.endObject()}static createList(e){return Vi.startList(e),Vi.endList(e)}}class $i{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsStruct_(e,t){return(t||new $i).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsStruct_(e,t){return e.setPosition(e.position()+4),(t||new $i).__init(e.readInt32(e.position())+e.position(),e)}static startStruct_(e){e.startObject(0)}static endStruct_(e){return e.endObject()}static createStruct_(e){return $i.startStruct_(e),$i.endStruct_(e)}}var Hi=Tr;const Wi=new class extends Ze{visit(e,t){return null==e||null==t?void 0:super.visit(e,t)}visitNull(e,t){return zi.startNull(t),zi.endNull(t)}visitInt(e,t){return Fr.startInt(t),Fr.addBitWidth(t,e.bitWidth),Fr.addIsSigned(t,e.isSigned),Fr.endInt(t)}visitFloat(e,t){return Ei.startFloatingPoint(t),Ei.addPrecision(t,e.precision),Ei.endFloatingPoint(t)}visitBinary(e,t){return Ui.startBinary(t),Ui.endBinary(t)}visitBool(e,t){return Ri.startBool(t),Ri.endBool(t)}visitUtf8(e,t){return ji.startUtf8(t),ji.endUtf8(t)}visitDecimal(e,t){return Oi.startDecimal(t),Oi.addScale(t,e.scale),Oi.addPrecision(t,e.precision),Oi.addBitWidth(t,e.bitWidth),Oi.endDecimal(t)}visitDate(e,t){return Ai.startDate(t),Ai.addUnit(t,e.unit),Ai.endDate(t)}visitTime(e,t){return Ci.startTime(t),Ci.addUnit(t,e.unit),Ci.addBitWidth(t,e.bitWidth),Ci.endTime(t)}visitTimestamp(e,t){const n=e.timezone&&t.createString(e.timezone)||void 0;return Ni.startTimestamp(t),Ni.addUnit(t,e.unit),void 0!==n&&Ni.addTimezone(t,n),Ni.endTimestamp(t)}visitInterval(e,t){return Di.startInterval(t),Di.addUnit(t,e.unit),Di.endInterval(t)}visitList(e,t){return Vi.startList(t),Vi.endList(t)}visitStruct(e,t){return $i.startStruct_(t),$i.endStruct_(t)}visitUnion(e,t){Bi.startTypeIdsVector(t,e.typeIds.length);const n=Bi.createTypeIdsVector(t,e.typeIds);return Bi.startUnion(t),Bi.addMode(t,e.mode),Bi.addTypeIds(t,n),Bi.endUnion(t)}visitDictionary(e,t){const n=this.visit(e.indices,t);return Lr.startDictionaryEncoding(t),Lr.addId(t,new Hi(e.id,0)),Lr.addIsOrdered(t,e.isOrdered),void 0!==n&&Lr.addIndexType(t,n),Lr.endDictionaryEncoding(t)}visitFixedSizeBinary(e,t){return Fi.startFixedSizeBinary(t),Fi.addByteWidth(t,e.byteWidth),Fi.endFixedSizeBinary(t)}visitFixedSizeList(e,t){return Li.startFixedSizeList(t),Li.addListSize(t,e.listSize),Li.endFixedSizeList(t)}visitMap(e,t){return Mi.startMap(t),Mi.addKeysSorted(t,e.keysSorted),Mi.endMap(t)}};function Yi(e){return new ro(e.count,Qi(e.columns),Ki(e.columns))}function qi(e,t){return(e.children||[]).filter(Boolean).map(e=>Gn.fromJSON(e,t))}function Qi(e){return(e||[]).reduce((e,t)=>{return[...e,new so(t.count,(n=t.VALIDITY,(n||[]).reduce((e,t)=>e+ +(0===t),0))),...Qi(t.children)];var n},[])}function Ki(e,t=[]){for(let n=-1,r=(e||[]).length;++n<r;){const r=e[n];r.VALIDITY&&t.push(new oo(t.length,r.VALIDITY.length)),r.TYPE&&t.push(new oo(t.length,r.TYPE.length)),r.OFFSET&&t.push(new oo(t.length,r.OFFSET.length)),r.DATA&&t.push(new oo(t.length,r.DATA.length)),t=Ki(r.children,t)}return t}function Gi(e){return new Map(Object.entries(e||{}))}function Xi(e){return new De(e.isSigned,e.bitWidth)}function Ji(e,t){const n=e.type.name;switch(n){case"NONE":case"null":return new Ne;case"binary":return new Le;case"utf8":return new Me;case"bool":return new Pe;case"list":return new $e((t||[])[0]);case"struct":case"struct_":return new He(t||[])}switch(n){case"int":{const t=e.type;return new De(t.isSigned,t.bitWidth)}case"floatingpoint":{const t=e.type;return new Fe(o[t.precision])}case"decimal":{const t=e.type;return new ze(t.scale,t.precision,t.bitWidth)}case"date":{const t=e.type;return new Ue(s[t.unit])}case"time":{const t=e.type;return new Re(a[t.unit],t.bitWidth)}case"timestamp":{const t=e.type;return new je(a[t.unit],t.timezone)}case"interval":{const t=e.type;return new Ve(l[t.unit])}case"union":{const n=e.type;return new We(i[n.mode],n.typeIds||[],t||[])}case"fixedsizebinary":{const t=e.type;return new Ye(t.byteWidth)}case"fixedsizelist":{const n=e.type;return new qe(n.listSize,(t||[])[0])}case"map":{const n=e.type;return new Qe((t||[])[0],n.keysSorted)}}throw new Error(`Unrecognized type: "${n}"`)}var Zi=Tr,eo=Dr,to=Nr;class no{constructor(e,t,n,r){this._version=t,this._headerType=n,this.body=new Uint8Array(0),r&&(this._createHeader=()=>r),this._bodyLength="number"==typeof e?e:e.low}static fromJSON(e,t){const n=new no(0,r.V4,t);return n._createHeader=function(e,t){return()=>{switch(t){case u.Schema:return Kn.fromJSON(e);case u.RecordBatch:return ro.fromJSON(e);case u.DictionaryBatch:return io.fromJSON(e)}throw new Error(`Unrecognized Message type: { name: ${u[t]}, type: ${t} }`)}}(e,t),n}static decode(e){e=new to(G(e));const t=Pi.getRootAsMessage(e),n=t.bodyLength(),r=t.version(),i=t.headerType(),o=new no(n,r,i);return o._createHeader=function(e,t){return()=>{switch(t){case u.Schema:return Kn.decode(e.header(new Pr));case u.RecordBatch:return ro.decode(e.header(new Ti),e.version());case u.DictionaryBatch:return io.decode(e.header(new xi),e.version())}throw new Error(`Unrecognized Message type: { name: ${u[t]}, type: ${t} }`)}}(t,i),o}static encode(e){const t=new eo;let n=-1;return e.isSchema()?n=Kn.encode(t,e.header()):e.isRecordBatch()?n=ro.encode(t,e.header()):e.isDictionaryBatch()&&(n=io.encode(t,e.header())),Pi.startMessage(t),Pi.addVersion(t,r.V4),Pi.addHeader(t,n),Pi.addHeaderType(t,e.headerType),Pi.addBodyLength(t,new Zi(e.bodyLength,0)),Pi.finishMessageBuffer(t,Pi.endMessage(t)),t.asUint8Array()}static from(e,t=0){if(e instanceof Kn)return new no(0,r.V4,u.Schema,e);if(e instanceof ro)return new no(t,r.V4,u.RecordBatch,e);if(e instanceof io)return new no(t,r.V4,u.DictionaryBatch,e);throw new Error(`Unrecognized Message header: ${e}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===u.Schema}isRecordBatch(){return this.headerType===u.RecordBatch}isDictionaryBatch(){return this.headerType===u.DictionaryBatch}}class ro{constructor(e,t,n){this._nodes=t,this._buffers=n,this._length="number"==typeof e?e:e.low}get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}}class io{constructor(e,t,n=!1){this._data=e,this._isDelta=n,this._id="number"==typeof t?t:t.low}get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}}class oo{constructor(e,t){this.offset="number"==typeof e?e:e.low,this.length="number"==typeof t?t:t.low}}class so{constructor(e,t){this.length="number"==typeof e?e:e.low,this.nullCount="number"==typeof t?t:t.low}}function ao(e,t){const n=[];for(let r,i=-1,o=-1,s=e.childrenLength();++i<s;)(r=e.children(i))&&(n[++o]=Gn.decode(r,t));return n}function lo(e){const t=new Map;if(e)for(let n,r,i=-1,o=Math.trunc(e.customMetadataLength());++i<o;)(n=e.customMetadata(i))&&null!=(r=n.key())&&t.set(r,n.value());return t}function uo(e){return new De(e.isSigned(),e.bitWidth())}function co(e,t){const n=e.typeType();switch(n){case Cr.NONE:case Cr.Null:return new Ne;case Cr.Binary:return new Le;case Cr.Utf8:return new Me;case Cr.Bool:return new Pe;case Cr.List:return new $e((t||[])[0]);case Cr.Struct_:return new He(t||[])}switch(n){case Cr.Int:{const t=e.type(new Fr);return new De(t.isSigned(),t.bitWidth())}case Cr.FloatingPoint:{const t=e.type(new Ei);return new Fe(t.precision())}case Cr.Decimal:{const t=e.type(new Oi);return new ze(t.scale(),t.precision(),t.bitWidth())}case Cr.Date:{const t=e.type(new Ai);return new Ue(t.unit())}case Cr.Time:{const t=e.type(new Ci);return new Re(t.unit(),t.bitWidth())}case Cr.Timestamp:{const t=e.type(new Ni);return new je(t.unit(),t.timezone())}case Cr.Interval:{const t=e.type(new Di);return new Ve(t.unit())}case Cr.Union:{const n=e.type(new Bi);return new We(n.mode(),n.typeIdsArray()||[],t||[])}case Cr.FixedSizeBinary:{const t=e.type(new Fi);return new Ye(t.byteWidth())}case Cr.FixedSizeList:{const n=e.type(new Li);return new qe(n.listSize(),(t||[])[0])}case Cr.Map:{const n=e.type(new Mi);return new Qe((t||[])[0],n.keysSorted())}}throw new Error(`Unrecognized type: "${Cr[n]}" (${n})`)}Gn.encode=function(e,t){let n=-1,r=-1,i=-1;const o=t.type;let s=t.typeId;Ce.isDictionary(o)?(s=o.dictionary.typeId,i=Wi.visit(o,e),r=Wi.visit(o.dictionary,e)):r=Wi.visit(o,e);const a=(o.children||[]).map(t=>Gn.encode(e,t)),l=Mr.createChildrenVector(e,a),u=t.metadata&&t.metadata.size>0?Mr.createCustomMetadataVector(e,[...t.metadata].map(([t,n])=>{const r=e.createString(`${t}`),i=e.createString(`${n}`);return Br.startKeyValue(e),Br.addKey(e,r),Br.addValue(e,i),Br.endKeyValue(e)})):-1;return t.name&&(n=e.createString(t.name)),Mr.startField(e),Mr.addType(e,r),Mr.addTypeType(e,s),Mr.addChildren(e,l),Mr.addNullable(e,!!t.nullable),-1!==n&&Mr.addName(e,n),-1!==i&&Mr.addDictionary(e,i),-1!==u&&Mr.addCustomMetadata(e,u),Mr.endField(e)},Gn.decode=function(e,t){let n,r,i,o,s,a;return t&&(a=e.dictionary())?t.has(n=a.id().low)?(o=(o=a.indexType())?uo(o):new Be,s=new Xe(t.get(n),o,n,a.isOrdered()),r=new Gn(e.name(),s,e.nullable(),lo(e))):(o=(o=a.indexType())?uo(o):new Be,t.set(n,i=co(e,ao(e,t))),s=new Xe(i,o,n,a.isOrdered()),r=new Gn(e.name(),s,e.nullable(),lo(e))):(i=co(e,ao(e,t)),r=new Gn(e.name(),i,e.nullable(),lo(e))),r||null},Gn.fromJSON=function(e,t){let n,r,i,o,s,a;return t&&(o=e.dictionary)?t.has(n=o.id)?(r=(r=o.indexType)?Xi(r):new Be,a=new Xe(t.get(n),r,n,o.isOrdered),i=new Gn(e.name,a,e.nullable,Gi(e.customMetadata))):(r=(r=o.indexType)?Xi(r):new Be,t.set(n,s=Ji(e,qi(e,t))),a=new Xe(s,r,n,o.isOrdered),i=new Gn(e.name,a,e.nullable,Gi(e.customMetadata))):(s=Ji(e,qi(e,t)),i=new Gn(e.name,s,e.nullable,Gi(e.customMetadata))),i||null},Kn.encode=function(e,t){const n=t.fields.map(t=>Gn.encode(e,t));Pr.startFieldsVector(e,n.length);const r=Pr.createFieldsVector(e,n),i=t.metadata&&t.metadata.size>0?Pr.createCustomMetadataVector(e,[...t.metadata].map(([t,n])=>{const r=e.createString(`${t}`),i=e.createString(`${n}`);return Br.startKeyValue(e),Br.addKey(e,r),Br.addValue(e,i),Br.endKeyValue(e)})):-1;return Pr.startSchema(e),Pr.addFields(e,r),Pr.addEndianness(e,fo?Or.Little:Or.Big),-1!==i&&Pr.addCustomMetadata(e,i),Pr.endSchema(e)},Kn.decode=function(e,t=new Map){const n=function(e,t){const n=[];for(let r,i=-1,o=-1,s=e.fieldsLength();++i<s;)(r=e.fields(i))&&(n[++o]=Gn.decode(r,t));return n}(e,t);return new Kn(n,lo(e),t)},Kn.fromJSON=function(e,t=new Map){return new Kn(function(e,t){return(e.fields||[]).filter(Boolean).map(e=>Gn.fromJSON(e,t))}(e,t),Gi(e.customMetadata),t)},ro.encode=function(e,t){const n=t.nodes||[],r=t.buffers||[];Ti.startNodesVector(e,n.length);for(const t of n.slice().reverse())so.encode(e,t);const i=e.endVector();Ti.startBuffersVector(e,r.length);for(const t of r.slice().reverse())oo.encode(e,t);const o=e.endVector();return Ti.startRecordBatch(e),Ti.addLength(e,new Zi(t.length,0)),Ti.addNodes(e,i),Ti.addBuffers(e,o),Ti.endRecordBatch(e)},ro.decode=function(e,t=r.V4){if(null!==e.compression())throw new Error("Record batch compression not implemented");return new ro(e.length(),function(e){const t=[];for(let n,r=-1,i=-1,o=e.nodesLength();++r<o;)(n=e.nodes(r))&&(t[++i]=so.decode(n));return t}(e),function(e,t){const n=[];for(let i,o=-1,s=-1,a=e.buffersLength();++o<a;)(i=e.buffers(o))&&(t<r.V4&&(i.bb_pos+=8*(o+1)),n[++s]=oo.decode(i));return n}(e,t))},ro.fromJSON=Yi,io.encode=function(e,t){const n=ro.encode(e,t.data);return xi.startDictionaryBatch(e),xi.addId(e,new Zi(t.id,0)),xi.addIsDelta(e,t.isDelta),xi.addData(e,n),xi.endDictionaryBatch(e)},io.decode=function(e,t=r.V4){return new io(ro.decode(e.data(),t),e.id(),e.isDelta())},io.fromJSON=function(e){return new io(Yi(e.data),e.id,e.isDelta)},so.encode=function(e,t){return Ii.createFieldNode(e,new Zi(t.length,0),new Zi(t.nullCount,0))},so.decode=function(e){return new so(e.length(),e.nullCount())},oo.encode=function(e,t){return ki.createBuffer(e,new Zi(t.offset,0),new Zi(t.length,0))},oo.decode=function(e){return new oo(e.offset(),e.length())};const fo=(()=>{const e=new ArrayBuffer(2);return new DataView(e).setInt16(0,256,!0),256===new Int16Array(e)[0]})(),ho=e=>`Expected ${u[e]} Message in stream, but was null or length 0.`,po=e=>`Header pointer of flatbuffer-encoded ${u[e]} Message is null or length 0.`,yo=(e,t)=>`Expected to read ${e} metadata bytes, but only read ${t}.`,bo=(e,t)=>`Expected to read ${e} bytes for message body, but only read ${t}.`;class mo{constructor(e){this.source=e instanceof ei?e:new ei(e)}[Symbol.iterator](){return this}next(){let e;return(e=this.readMetadataLength()).done||-1===e.value&&(e=this.readMetadataLength()).done||(e=this.readMetadata(e.value)).done?Kr:e}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}readMessage(e){let t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(ho(e));return t.value}readMessageBody(e){if(e<=0)return new Uint8Array(0);const t=G(this.source.read(e));if(t.byteLength<e)throw new Error(bo(e,t.byteLength));return t.byteOffset%8==0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}readSchema(e=!1){const t=u.Schema,n=this.readMessage(t),r=null==n?void 0:n.header();if(e&&!r)throw new Error(po(t));return r}readMetadataLength(){const e=this.source.read(wo),t=e&&new Nr(e),n=(null==t?void 0:t.readInt32(0))||0;return{done:0===n,value:n}}readMetadata(e){const t=this.source.read(e);if(!t)return Kr;if(t.byteLength<e)throw new Error(yo(e,t.byteLength));return{done:!1,value:no.decode(t)}}}class go{constructor(e,t){this.source=e instanceof ti?e:C(e)?new oi(e,t):new ti(e)}[Symbol.asyncIterator](){return this}next(){return M(this,void 0,void 0,function*(){let e;return(e=yield this.readMetadataLength()).done||-1===e.value&&(e=yield this.readMetadataLength()).done||(e=yield this.readMetadata(e.value)).done?Kr:e})}throw(e){return M(this,void 0,void 0,function*(){return yield this.source.throw(e)})}return(e){return M(this,void 0,void 0,function*(){return yield this.source.return(e)})}readMessage(e){return M(this,void 0,void 0,function*(){let t;if((t=yield this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(ho(e));return t.value})}readMessageBody(e){return M(this,void 0,void 0,function*(){if(e<=0)return new Uint8Array(0);const t=G(yield this.source.read(e));if(t.byteLength<e)throw new Error(bo(e,t.byteLength));return t.byteOffset%8==0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()})}readSchema(e=!1){return M(this,void 0,void 0,function*(){const t=u.Schema,n=yield this.readMessage(t),r=null==n?void 0:n.header();if(e&&!r)throw new Error(po(t));return r})}readMetadataLength(){return M(this,void 0,void 0,function*(){const e=yield this.source.read(wo),t=e&&new Nr(e),n=(null==t?void 0:t.readInt32(0))||0;return{done:0===n,value:n}})}readMetadata(e){return M(this,void 0,void 0,function*(){const t=yield this.source.read(e);if(!t)return Kr;if(t.byteLength<e)throw new Error(yo(e,t.byteLength));return{done:!1,value:no.decode(t)}})}}class vo extends mo{constructor(e){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=e instanceof Gr?e:new Gr(e)}next(){const{_json:e}=this;if(!this._schema)return this._schema=!0,{done:!1,value:no.fromJSON(e.schema,u.Schema)};if(this._dictionaryIndex<e.dictionaries.length){const t=e.dictionaries[this._dictionaryIndex++];return this._body=t.data.columns,{done:!1,value:no.fromJSON(t,u.DictionaryBatch)}}if(this._batchIndex<e.batches.length){const t=e.batches[this._batchIndex++];return this._body=t.columns,{done:!1,value:no.fromJSON(t,u.RecordBatch)}}return this._body=[],Kr}readMessageBody(e){return function e(t){return(t||[]).reduce((t,n)=>[...t,...n.VALIDITY&&[n.VALIDITY]||[],...n.TYPE&&[n.TYPE]||[],...n.OFFSET&&[n.OFFSET]||[],...n.DATA&&[n.DATA]||[],...e(n.children)],[])}(this._body)}readMessage(e){let t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(ho(e));return t.value}readSchema(){const e=u.Schema,t=this.readMessage(e),n=null==t?void 0:t.header();if(!t||!n)throw new Error(po(e));return n}}const wo=4,_o=new Uint8Array(6);for(let e=0;e<6;e+=1)_o[e]="ARROW1".codePointAt(e);function So(e,t=0){for(let n=-1,r=_o.length;++n<r;)if(_o[n]!==e[t+n])return!1;return!0}const ko=_o.length,Io=ko+wo,To=2*ko+wo;class xo extends Xr{constructor(e){super(),this._impl=e}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(e){return this._impl.throw(e)}return(e){return this._impl.return(e)}cancel(){return this._impl.cancel()}reset(e){return this._impl.reset(e),this._DOMStream=void 0,this._nodeStream=void 0,this}open(e){const t=this._impl.open(e);return T(t)?t.then(()=>this):this}readRecordBatch(e){return this._impl.isFile()?this._impl.readRecordBatch(e):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return Wr.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return Wr.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}static from(e){return e instanceof xo?e:O(e)?function(e){return new Eo(new Mo(e))}(e):C(e)?function(e){return M(this,void 0,void 0,function*(){const{size:t}=yield e.stat(),n=new oi(e,t);return t>=To&&So(yield n.readAt(0,ko+7&-8))?new Co(new Lo(n)):new Oo(new Bo(n))})}(e):T(e)?(()=>M(this,void 0,void 0,function*(){return yield xo.from(yield e)}))():N(e)||B(e)||F(e)||E(e)?function(e){return M(this,void 0,void 0,function*(){const t=yield e.peek(ko+7&-8);return t&&t.byteLength>=4?So(t)?new Ao(new Fo(yield e.read())):new Oo(new Bo(e)):new Oo(new Bo(function(){return z(this,arguments,function*(){})}()))})}(new ti(e)):function(e){const t=e.peek(ko+7&-8);return t&&t.byteLength>=4?So(t)?new Ao(new Fo(e.read())):new Eo(new Do(e)):new Eo(new Do(function*(){}()))}(new ei(e))}static readAll(e){return e instanceof xo?e.isSync()?zo(e):Uo(e):O(e)||ArrayBuffer.isView(e)||x(e)||A(e)?zo(e):Uo(e)}}class Eo extends xo{constructor(e){super(e),this._impl=e}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return z(this,arguments,function*(){yield P(yield*U(R(this[Symbol.iterator]())))})}}class Oo extends xo{constructor(e){super(e),this._impl=e}readAll(){var e,t;return M(this,void 0,void 0,function*(){const n=new Array;try{for(var r,i=R(this);!(r=yield i.next()).done;){const e=r.value;n.push(e)}}catch(t){e={error:t}}finally{try{r&&!r.done&&(t=i.return)&&(yield t.call(i))}finally{if(e)throw e.error}}return n})}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class Ao extends Eo{constructor(e){super(e),this._impl=e}}class Co extends Oo{constructor(e){super(e),this._impl=e}}class No{constructor(e=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=e}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(e){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=e,this.dictionaries=new Map,this}_loadRecordBatch(e,t){const n=this._loadVectors(e,t,this.schema.fields),r=Qn({type:new He(this.schema.fields),length:e.length,children:n});return new hr(this.schema,r)}_loadDictionaryBatch(e,t){const{id:n,isDelta:r}=e,{dictionaries:i,schema:o}=this,s=i.get(n);if(r||!s){const i=o.dictionaries.get(n),a=this._loadVectors(e.data,t,[i]);return(s&&r?s.concat(new Hn(a)):new Hn(a)).memoize()}return s.memoize()}_loadVectors(e,t,n){return new fi(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}class Do extends No{constructor(e,t){super(t),this._reader=O(e)?new vo(this._handle=e):new mo(this._handle=e)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(e){return this.closed||(this.autoDestroy=Po(this,e),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(e):Kr}return(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(e):Kr}next(){if(this.closed)return Kr;let e;const{_reader:t}=this;for(;e=this._readNextMessageAndValidate();)if(e.isSchema())this.reset(e.header());else{if(e.isRecordBatch()){this._recordBatchIndex++;const n=e.header(),r=t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(e.isDictionaryBatch()){this._dictionaryIndex++;const n=e.header(),r=t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new br(this.schema)}):this.return()}_readNextMessageAndValidate(e){return this._reader.readMessage(e)}}class Bo extends No{constructor(e,t){super(t),this._reader=new go(this._handle=e)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return M(this,void 0,void 0,function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)})}open(e){return M(this,void 0,void 0,function*(){return this.closed||(this.autoDestroy=Po(this,e),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this})}throw(e){return M(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(e):Kr})}return(e){return M(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(e):Kr})}next(){return M(this,void 0,void 0,function*(){if(this.closed)return Kr;let e;const{_reader:t}=this;for(;e=yield this._readNextMessageAndValidate();)if(e.isSchema())yield this.reset(e.header());else{if(e.isRecordBatch()){this._recordBatchIndex++;const n=e.header(),r=yield t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(e.isDictionaryBatch()){this._dictionaryIndex++;const n=e.header(),r=yield t.readMessageBody(e.bodyLength),i=this._loadDictionaryBatch(n,r);this.dictionaries.set(n.id,i)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new br(this.schema)}):yield this.return()})}_readNextMessageAndValidate(e){return M(this,void 0,void 0,function*(){return yield this._reader.readMessage(e)})}}class Fo extends Do{constructor(e,t){super(e instanceof ii?e:new ii(e),t)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(const e of this._footer.dictionaryBatches())e&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(e)}readRecordBatch(e){var t;if(this.closed)return null;this._footer||this.open();const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(e);if(n&&this._handle.seek(n.offset)){const e=this._reader.readMessage(u.RecordBatch);if(null==e?void 0:e.isRecordBatch()){const t=e.header(),n=this._reader.readMessageBody(e.bodyLength);return this._loadRecordBatch(t,n)}}return null}_readDictionaryBatch(e){var t;const n=null===(t=this._footer)||void 0===t?void 0:t.getDictionaryBatch(e);if(n&&this._handle.seek(n.offset)){const e=this._reader.readMessage(u.DictionaryBatch);if(null==e?void 0:e.isDictionaryBatch()){const t=e.header(),n=this._reader.readMessageBody(e.bodyLength),r=this._loadDictionaryBatch(t,n);this.dictionaries.set(t.id,r)}}}_readFooter(){const{_handle:e}=this,t=e.size-Io,n=e.readInt32(t),r=e.readAt(t-n,n);return Vr.decode(r)}_readNextMessageAndValidate(e){var t;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(this._recordBatchIndex);if(n&&this._handle.seek(n.offset))return this._reader.readMessage(e)}return null}}class Lo extends Bo{constructor(e,...t){const n="number"!=typeof t[0]?t.shift():void 0,r=t[0]instanceof Map?t.shift():void 0;super(e instanceof oi?e:new oi(e,n),r)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}open(e){const t=Object.create(null,{open:{get:()=>super.open}});return M(this,void 0,void 0,function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(const e of this._footer.dictionaryBatches())e&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield t.open.call(this,e)})}readRecordBatch(e){var t;return M(this,void 0,void 0,function*(){if(this.closed)return null;this._footer||(yield this.open());const n=null===(t=this._footer)||void 0===t?void 0:t.getRecordBatch(e);if(n&&(yield this._handle.seek(n.offset))){const e=yield this._reader.readMessage(u.RecordBatch);if(null==e?void 0:e.isRecordBatch()){const t=e.header(),n=yield this._reader.readMessageBody(e.bodyLength);return this._loadRecordBatch(t,n)}}return null})}_readDictionaryBatch(e){var t;return M(this,void 0,void 0,function*(){const n=null===(t=this._footer)||void 0===t?void 0:t.getDictionaryBatch(e);if(n&&(yield this._handle.seek(n.offset))){const e=yield this._reader.readMessage(u.DictionaryBatch);if(null==e?void 0:e.isDictionaryBatch()){const t=e.header(),n=yield this._reader.readMessageBody(e.bodyLength),r=this._loadDictionaryBatch(t,n);this.dictionaries.set(t.id,r)}}})}_readFooter(){return M(this,void 0,void 0,function*(){const{_handle:e}=this;e._pending&&(yield e._pending);const t=e.size-Io,n=yield e.readInt32(t),r=yield e.readAt(t-n,n);return Vr.decode(r)})}_readNextMessageAndValidate(e){return M(this,void 0,void 0,function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){const t=this._footer.getRecordBatch(this._recordBatchIndex);if(t&&(yield this._handle.seek(t.offset)))return yield this._reader.readMessage(e)}return null})}}class Mo extends Do{constructor(e,t){super(e,t)}_loadVectors(e,t,n){return new hi(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}function Po(e,t){return t&&"boolean"==typeof t.autoDestroy?t.autoDestroy:e.autoDestroy}function*zo(e){const t=xo.from(e);try{if(!t.open({autoDestroy:!1}).closed)do{yield t}while(!t.reset().open().closed)}finally{t.cancel()}}function Uo(e){return z(this,arguments,function*(){const t=yield P(xo.from(e));try{if(!(yield P(t.open({autoDestroy:!1}))).closed)do{yield yield P(t)}while(!(yield P(t.reset().open())).closed)}finally{yield P(t.cancel())}})}class Ro extends Ze{constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(...e){const t=e=>e.flatMap(e=>Array.isArray(e)?t(e):e instanceof hr?e.data.children:e.data),n=new Ro;return n.visitMany(t(e)),n}visit(e){if(e instanceof Hn)return this.visitMany(e.data),this;const{type:t}=e;if(!Ce.isDictionary(t)){const{length:n,nullCount:r}=e;if(n>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");Ce.isNull(t)||jo.call(this,r<=0?new Uint8Array(0):kn(e.offset,n,e.nullBitmap)),this.nodes.push(new so(n,r))}return super.visit(e)}visitNull(e){return this}visitDictionary(e){return this.visit(e.clone(e.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function jo(e){const t=e.byteLength+7&-8;return this.buffers.push(e),this.bufferRegions.push(new oo(this._byteLength,t)),this._byteLength+=t,this}function Vo(e){return jo.call(this,e.values.subarray(0,e.length*e.stride))}function $o(e){const{length:t,values:n,valueOffsets:r}=e,i=r[0],o=r[t],s=Math.min(o-i,n.byteLength-i);return jo.call(this,Z(-r[0],t,r)),jo.call(this,n.subarray(i,i+s)),this}function Ho(e){const{length:t,valueOffsets:n}=e;return n&&jo.call(this,Z(n[0],t,n)),this.visit(e.children[0])}function Wo(e){return this.visitMany(e.type.children.map((t,n)=>e.children[n]).filter(Boolean))[0]}Ro.prototype.visitBool=function(e){let t;return e.nullCount>=e.length?jo.call(this,new Uint8Array(0)):(t=e.values)instanceof Uint8Array?jo.call(this,kn(e.offset,e.length,t)):jo.call(this,In(e.values))},Ro.prototype.visitInt=Vo,Ro.prototype.visitFloat=Vo,Ro.prototype.visitUtf8=$o,Ro.prototype.visitBinary=$o,Ro.prototype.visitFixedSizeBinary=Vo,Ro.prototype.visitDate=Vo,Ro.prototype.visitTimestamp=Vo,Ro.prototype.visitTime=Vo,Ro.prototype.visitDecimal=Vo,Ro.prototype.visitList=Ho,Ro.prototype.visitStruct=Wo,Ro.prototype.visitUnion=function(e){const{type:t,length:n,typeIds:r,valueOffsets:o}=e;if(jo.call(this,r),t.mode===i.Sparse)return Wo.call(this,e);if(t.mode===i.Dense){if(e.offset<=0)return jo.call(this,o),Wo.call(this,e);{const i=r.reduce((e,t)=>Math.max(e,t),r[0]),s=new Int32Array(i+1),a=new Int32Array(i+1).fill(-1),l=new Int32Array(n),u=Z(-o[0],n,o);for(let e,t,i=-1;++i<n;)-1===(t=a[e=r[i]])&&(t=a[e]=u[e]),l[i]=u[i]-t,++s[e];jo.call(this,l);for(let r,i=-1,o=t.children.length;++i<o;)if(r=e.children[i]){const e=t.typeIds[i],o=Math.min(n,s[e]);this.visit(r.slice(a[e],o))}}}return this},Ro.prototype.visitInterval=Vo,Ro.prototype.visitFixedSizeList=Ho,Ro.prototype.visitMap=Ho;class Yo extends Xr{constructor(e){super(),this._position=0,this._started=!1,this._sink=new Zr,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,I(e)||(e={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy="boolean"!=typeof e.autoDestroy||e.autoDestroy,this._writeLegacyIpcFormat="boolean"==typeof e.writeLegacyIpcFormat&&e.writeLegacyIpcFormat}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}toString(e=!1){return this._sink.toString(e)}toUint8Array(e=!1){return this._sink.toUint8Array(e)}writeAll(e){return T(e)?e.then(e=>this.writeAll(e)):E(e)?Go(this,e):Ko(this,e)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(e){return this._sink.toDOMStream(e)}toNodeStream(e){return this._sink.toNodeStream(e)}close(){return this.reset()._sink.close()}abort(e){return this.reset()._sink.abort(e)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(e=this._sink,t=null){var n;return e===this._sink||e instanceof Zr?this._sink=e:(this._sink=new Zr,e&&I(n=e)&&k(n.abort)&&k(n.getWriter)&&!D(n)?this.toDOMStream({type:"bytes"}).pipeTo(e):e&&(e=>I(e)&&k(e.end)&&k(e.write)&&S(e.writable)&&!D(e))(e)&&this.toNodeStream({objectMode:!1}).pipe(e)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,t&&cr(t,this._schema)||(null==t?(this._position=0,this._schema=null):(this._started=!0,this._schema=t,this._writeSchema(t))),this}write(e){let t=null;if(!this._sink)throw new Error("RecordBatchWriter is closed");if(null==e)return this.finish()&&void 0;if(e instanceof vr&&!(t=e.schema))return this.finish()&&void 0;if(e instanceof hr&&!(t=e.schema))return this.finish()&&void 0;if(t&&!cr(t,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,t)}e instanceof hr?e instanceof br||this._writeRecordBatch(e):e instanceof vr?this.writeAll(e.batches):x(e)&&this.writeAll(e)}_writeMessage(e,t=8){const n=t-1,r=no.encode(e),i=r.byteLength,o=this._writeLegacyIpcFormat?4:8,s=i+o+n&~n,a=s-i-o;return e.headerType===u.RecordBatch?this._recordBatchBlocks.push(new Hr(s,e.bodyLength,this._position)):e.headerType===u.DictionaryBatch&&this._dictionaryBlocks.push(new Hr(s,e.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(s-o)),i>0&&this._write(r),this._writePadding(a)}_write(e){if(this._started){const t=G(e);t&&t.byteLength>0&&(this._sink.write(t),this._position+=t.byteLength)}return this}_writeSchema(e){return this._writeMessage(no.from(e))}_writeFooter(e){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(_o)}_writePadding(e){return e>0?this._write(new Uint8Array(e)):this}_writeRecordBatch(e){const{byteLength:t,nodes:n,bufferRegions:r,buffers:i}=Ro.assemble(e),o=new ro(e.numRows,n,r),s=no.from(o,t);return this._writeDictionaries(e)._writeMessage(s)._writeBodyBuffers(i)}_writeDictionaryBatch(e,t,n=!1){this._dictionaryDeltaOffsets.set(t,e.length+(this._dictionaryDeltaOffsets.get(t)||0));const{byteLength:r,nodes:i,bufferRegions:o,buffers:s}=Ro.assemble(new Hn([e])),a=new ro(e.length,i,o),l=new io(a,t,n),u=no.from(l,r);return this._writeMessage(u)._writeBodyBuffers(s)}_writeBodyBuffers(e){let t,n,r;for(let i=-1,o=e.length;++i<o;)(t=e[i])&&(n=t.byteLength)>0&&(this._write(t),(r=(n+7&-8)-n)>0&&this._writePadding(r));return this}_writeDictionaries(e){for(let[t,n]of e.dictionaries){let e=this._dictionaryDeltaOffsets.get(t)||0;if(0===e||(n=null==n?void 0:n.slice(e)).length>0)for(const r of n.data)this._writeDictionaryBatch(r,t,e>0),e+=r.length}return this}}class qo extends Yo{static writeAll(e,t){const n=new qo(t);return T(e)?e.then(e=>n.writeAll(e)):E(e)?Go(n,e):Ko(n,e)}}class Qo extends Yo{static writeAll(e){const t=new Qo;return T(e)?e.then(e=>t.writeAll(e)):E(e)?Go(t,e):Ko(t,e)}constructor(){super(),this._autoDestroy=!0}_writeSchema(e){return this._writeMagic()._writePadding(2)}_writeFooter(e){const t=Vr.encode(new Vr(e,r.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(e)._write(t)._write(Int32Array.of(t.byteLength))._writeMagic()}}function Ko(e,t){let n=t;t instanceof vr&&(n=t.batches,e.reset(void 0,t.schema));for(const t of n)e.write(t);return e.finish()}function Go(e,t){var n,r,i,o;return M(this,void 0,void 0,function*(){try{for(n=R(t);!(r=yield n.next()).done;){const t=r.value;e.write(t)}}catch(e){i={error:e}}finally{try{r&&!r.done&&(o=n.return)&&(yield o.call(n))}finally{if(i)throw i.error}}return e.finish()})}function Xo(e){const t=xo.from(e);return T(t)?t.then(e=>Xo(e)):t.isAsync()?t.readAll().then(e=>new vr(e)):new vr(t.readAll())}function Jo(e,t="stream"){return("stream"===t?qo:Qo).writeAll(e).toUint8Array(!0)}var Zo,es=function(){function e(e,t,n,r){var i=this;this.getCell=function(e,t){var n=e<i.headerRows&&t<i.headerColumns,r=e>=i.headerRows&&t<i.headerColumns,o=e<i.headerRows&&t>=i.headerColumns;if(n){var s=["blank"];return t>0&&s.push("level"+e),{type:"blank",classNames:s.join(" "),content:""}}if(o)return{type:"columns",classNames:(s=["col_heading","level"+e,"col"+(l=t-i.headerColumns)]).join(" "),content:i.getContent(i.columnsTable,l,e)};if(r)return s=["row_heading","level"+t,"row"+(a=e-i.headerRows)],{type:"index",id:"T_".concat(i.uuid,"level").concat(t,"_row").concat(a),classNames:s.join(" "),content:i.getContent(i.indexTable,a,t)};s=["data","row"+(a=e-i.headerRows),"col"+(l=t-i.headerColumns)];var a,l,u=i.styler?i.getContent(i.styler.displayValuesTable,a,l):i.getContent(i.dataTable,a,l);return{type:"data",id:"T_".concat(i.uuid,"row").concat(a,"_col").concat(l),classNames:s.join(" "),content:u}},this.getContent=function(e,t,n){var r=e.getChildAt(n);return null===r?"":i.getColumnTypeId(e,n)===c.Timestamp?i.nanosToDate(r.get(t)):r.get(t)},this.dataTable=Xo(e),this.indexTable=Xo(t),this.columnsTable=Xo(n),this.styler=r?{caption:r.caption,displayValuesTable:Xo(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(e.prototype,"rows",{get:function(){return this.indexTable.numRows+this.columnsTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"dataRows",{get:function(){return this.dataTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"table",{get:function(){return this.dataTable},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"index",{get:function(){return this.indexTable},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!1,configurable:!0}),e.prototype.serialize=function(){return{data:Jo(this.dataTable),index:Jo(this.indexTable),columns:Jo(this.columnsTable)}},e.prototype.getColumnTypeId=function(e,t){return e.schema.fields[t].type.typeId},e.prototype.nanosToDate=function(e){return new Date(e/1e6)},e}(),ts=function(){return ts=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var i in t=arguments[n])Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i]);return e},ts.apply(this,arguments)};!function(e){e.COMPONENT_READY="streamlit:componentReady",e.SET_COMPONENT_VALUE="streamlit:setComponentValue",e.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(Zo||(Zo={}));var ns,rs=function(){function e(){}return e.API_VERSION=1,e.RENDER_EVENT="streamlit:render",e.events=new EventTarget,e.registeredMessageListener=!1,e.setComponentReady=function(){e.registeredMessageListener||(window.addEventListener("message",e.onMessageEvent),e.registeredMessageListener=!0),e.sendBackMsg(Zo.COMPONENT_READY,{apiVersion:e.API_VERSION})},e.setFrameHeight=function(t){void 0===t&&(t=document.body.scrollHeight),t!==e.lastFrameHeight&&(e.lastFrameHeight=t,e.sendBackMsg(Zo.SET_FRAME_HEIGHT,{height:t}))},e.setComponentValue=function(t){var n;t instanceof es?(n="dataframe",t=t.serialize()):function(e){var t=!1;try{t=e instanceof BigInt64Array||e instanceof BigUint64Array}catch(e){}return e instanceof Int8Array||e instanceof Uint8Array||e instanceof Uint8ClampedArray||e instanceof Int16Array||e instanceof Uint16Array||e instanceof Int32Array||e instanceof Uint32Array||e instanceof Float32Array||e instanceof Float64Array||t}(t)?(n="bytes",t=new Uint8Array(t.buffer)):t instanceof ArrayBuffer?(n="bytes",t=new Uint8Array(t)):n="json",e.sendBackMsg(Zo.SET_COMPONENT_VALUE,{value:t,dataType:n})},e.onMessageEvent=function(t){t.data.type===e.RENDER_EVENT&&e.onRenderMessage(t.data)},e.onRenderMessage=function(t){var n=t.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=t.dfs&&t.dfs.length>0?e.argsDataframeToObject(t.dfs):{};n=ts(ts({},n),r);var i=Boolean(t.disabled),o=t.theme;o&&is(o);var s={disabled:i,args:n,theme:o},a=new CustomEvent(e.RENDER_EVENT,{detail:s});e.events.dispatchEvent(a)},e.argsDataframeToObject=function(t){var n=t.map(function(t){var n=t.key,r=t.value;return[n,e.toArrowTable(r)]});return Object.fromEntries(n)},e.toArrowTable=function(e){var t,n=(t=e.data).data,r=t.index,i=t.columns,o=t.styler;return new es(n,r,i,o)},e.sendBackMsg=function(e,t){window.parent.postMessage(ts({isStreamlitMessage:!0,type:e},t),"*")},e}(),is=function(e){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML="\n    :root {\n      --primary-color: ".concat(e.primaryColor,";\n      --background-color: ").concat(e.backgroundColor,";\n      --secondary-background-color: ").concat(e.secondaryBackgroundColor,";\n      --text-color: ").concat(e.textColor,";\n      --font: ").concat(e.font,";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  ")},os=(ns=function(e,t){return ns=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)Object.prototype.hasOwnProperty.call(t,n)&&(e[n]=t[n])},ns(e,t)},function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Class extends value "+String(t)+" is not a constructor or null");function n(){this.constructor=e}ns(e,t),e.prototype=null===t?Object.create(t):(n.prototype=t.prototype,new n)});!function(e){function t(){return null!==e&&e.apply(this,arguments)||this}os(t,e),t.prototype.componentDidMount=function(){rs.setFrameHeight()},t.prototype.componentDidUpdate=function(){rs.setFrameHeight()}}(y.PureComponent),console.log("KoyakuCounter build:","2025-10-13T12:48:16.279Z",navigator.userAgent);const ss=[{key:"bell",label:"ベル",color:"#f7d94c",textColor:"#1f1f1f"},{key:"weak_cherry",label:"弱チェリー",color:"#ef5a5a",textColor:"#ffffff"},{key:"strong_cherry",label:"強チェリー",color:"#d45d79",textColor:"#ffffff"},{key:"watermelon",label:"スイカ",color:"#4caf50",textColor:"#ffffff"},{key:"chance",label:"チャンス目",color:"#b085f5",textColor:"#1f1f1f"},{key:"replay",label:"リプレイ",color:"#4ac0ff",textColor:"#0e2d3c"},{key:"boat",label:"ボート",color:"#ffca28",textColor:"#1f1f1f"},{key:"mb",label:"MB",color:"#8d6e63",textColor:"#ffffff"},{key:"common_bell",label:"共通ベル",color:"#ffab91",textColor:"#1f1f1f"},{key:"others",label:"その他",color:"#90a4ae",textColor:"#1f1f1f"}],as=ss.slice(0,6),ls=ss.slice(6),us="koyakuCounter_counts",cs={light:{rootBg:"#fdfdf6",text:"#1f1f1f",secondaryText:"#4f4f4f",cardShadow:"0 2px 6px rgba(0, 0, 0, 0.12)",buttonBg:"rgba(255, 255, 255, 0.92)",buttonText:"#1f1f1f",resetBg:"#424242",resetText:"#ffffff",cardBorder:"1px solid rgba(0, 0, 0, 0.05)"},dark:{rootBg:"#121212",text:"#f4f4f4",secondaryText:"#bdbdbd",cardShadow:"0 2px 8px rgba(0, 0, 0, 0.45)",buttonBg:"rgba(0, 0, 0, 0.35)",buttonText:"#f4f4f4",resetBg:"#616161",resetText:"#ffffff",cardBorder:"1px solid rgba(255, 255, 255, 0.12)"}},ds=()=>{if("undefined"==typeof window)return ss.map(()=>0);const e=window.localStorage.getItem(us);if(!e)return ss.map(()=>0);try{const t=JSON.parse(e);if(Array.isArray(t))return ss.map((e,n)=>{const r=Number(t[n]);return!Number.isFinite(r)||r<0?0:Math.floor(r)})}catch(e){}return ss.map(()=>0)},fs=(e,t)=>{const n="increment"===t?3.2:2.6,r="increment"===t?"1.8rem":"1.35rem";return{width:`${n}rem`,height:`${n}rem`,borderRadius:"50%",border:"none",background:e.buttonBg,color:e.buttonText,fontSize:r,fontWeight:700,cursor:"pointer",touchAction:"manipulation",display:"flex",alignItems:"center",justifyContent:"center",boxShadow:e.cardShadow}},hs=({isReady:e})=>{const[t,n]=(0,h.useState)(ds),r=(0,h.useMemo)(()=>(()=>{if("undefined"==typeof window)return"light";const e=window.localStorage.getItem("koyakuCounter_theme");return"light"===e||"dark"===e?e:window.matchMedia("(prefers-color-scheme: dark)").matches?"dark":"light"})(),[]),[i,o]=(0,h.useState)(null),[s,a]=(0,h.useState)(!1),l=(0,h.useRef)(null),u=(0,h.useCallback)(t=>{var n;e&&rs.setComponentValue({primaryCount:null!==(n=t[0])&&void 0!==n?n:0,counts:[...t]})},[e]);(0,h.useEffect)(()=>{var n;n=t,"undefined"!=typeof window&&window.localStorage.setItem(us,JSON.stringify(n)),e&&rs.setFrameHeight()},[t,e]),(0,h.useEffect)(()=>{e&&u(t)},[e,t,u]),(0,h.useEffect)(()=>(e&&rs.setFrameHeight(),()=>{l.current&&window.clearTimeout(l.current)}),[e]);const c=()=>{l.current&&(window.clearTimeout(l.current),l.current=null),o(null)},d=cs[r],p=ls.reduce((e,n,r)=>{const i=t[6+r];return e+("number"==typeof i&&Number.isFinite(i)?i:0)},0),y=(e,n)=>{var r;const i=`${null!==(r=e.label)&&void 0!==r?r:"小役"}${n+1}`,o="number"==typeof t[n]&&Number.isFinite(t[n])?t[n]:0;return(0,f.jsxs)("div",{style:{display:"flex",alignItems:"center",justifyContent:"center",gap:"0.5rem",padding:"0.65rem 0.7rem",borderRadius:"0.75rem",background:e.color,color:e.textColor,boxShadow:d.cardShadow,border:d.cardBorder,transition:"transform 0.1s ease",touchAction:"manipulation"},children:[(0,f.jsx)("button",{onClick:()=>b(n,-1),style:fs(d,"decrement"),"aria-label":`${i} を1減算`,children:"-"}),(0,f.jsx)("input",{type:"number",min:0,inputMode:"numeric",pattern:"[0-9]*",value:0===o?"":String(o),onChange:e=>m(n,e.target.value),style:{width:"2.8rem",height:"2.2rem",borderRadius:"0.55rem",border:"none",textAlign:"center",fontSize:"1.1rem",fontWeight:700,color:e.textColor,background:"rgba(255, 255, 255, 0.6)",outline:"none"},"aria-label":`${i} のカウント入力`}),(0,f.jsx)("button",{onClick:()=>b(n,1),style:fs(d,"increment"),"aria-label":`${i} を1加算`,children:"+"})]},e.key)},b=(e,t)=>{n(n=>n.map((n,r)=>{if(r!==e)return n;const i=n+t;return i<0?0:i})),i&&c()},m=(e,t)=>{const r=Number(t),o=Number.isFinite(r)&&r>=0?Math.floor(r):0;n(t=>t.map((t,n)=>n===e?o:t)),i&&c()};return(0,f.jsxs)("div",{style:{fontFamily:"'Noto Sans JP', 'Hiragino Sans', 'Yu Gothic', sans-serif",padding:"1.2rem 1rem 1.35rem",background:d.rootBg,color:d.text,minWidth:"0",maxWidth:"420px",width:"100%",boxSizing:"border-box",margin:"0 auto",transition:"background 0.2s ease, color 0.2s ease"},children:[(0,f.jsx)("div",{style:{display:"grid",gap:"0.7rem",gridTemplateColumns:"repeat(auto-fit, minmax(150px, 1fr))"},children:as.map((e,t)=>y(e,t))}),ls.length>0&&(0,f.jsxs)("div",{style:{marginTop:"0.9rem"},children:[(0,f.jsxs)("button",{onClick:()=>a(e=>!e),style:{width:"100%",border:"1px solid rgba(0, 0, 0, 0.08)",borderRadius:"0.75rem",padding:"0.6rem 0.85rem",background:"light"===r?"rgba(255, 255, 255, 0.92)":"rgba(0, 0, 0, 0.35)",color:d.text,fontSize:"0.95rem",fontWeight:600,display:"flex",alignItems:"center",justifyContent:"space-between",gap:"0.75rem",cursor:"pointer",touchAction:"manipulation"},"aria-expanded":s,"aria-controls":"extra-counter-grid",children:[(0,f.jsx)("span",{children:s?"追加カウンターを閉じる":"追加カウンターを表示"}),(0,f.jsxs)("span",{style:{fontVariantNumeric:"tabular-nums"},children:["計 ",p]})]}),s&&(0,f.jsx)("div",{id:"extra-counter-grid",style:{marginTop:"0.6rem",display:"grid",gap:"0.7rem",gridTemplateColumns:"repeat(auto-fit, minmax(150px, 1fr))"},children:ls.map((e,t)=>y(e,6+t))})]}),(0,f.jsxs)("div",{style:{marginTop:"1.25rem",display:"flex",justifyContent:i?"space-between":"flex-end",alignItems:"center",gap:"0.75rem"},children:[i&&(0,f.jsx)("button",{onClick:()=>{if(!i)return;const e=[...i];n(e),c()},style:{border:"none",borderRadius:"0.75rem",padding:"0.65rem 1rem",background:"light"===r?"#1976d2":"#90caf9",color:"light"===r?"#ffffff":"#0d1b2a",fontSize:"0.95rem",fontWeight:600,cursor:"pointer",touchAction:"manipulation"},"aria-label":"リセットを取り消す",children:"元に戻す"}),(0,f.jsx)("button",{onClick:()=>{o([...t]);const e=ss.map(()=>0);n(e),l.current&&window.clearTimeout(l.current),l.current=window.setTimeout(()=>{o(null),l.current=null},1e4)},style:{border:"none",borderRadius:"0.75rem",padding:"0.7rem 1.4rem",background:d.resetBg,color:d.resetText,fontSize:"1.1rem",fontWeight:600,cursor:"pointer",touchAction:"manipulation"},"aria-label":"すべての小役カウントをリセット",children:"すべてリセット"})]})]})},ps=document.getElementById("root");if(!ps)throw new Error("Failed to find the root element");const ys=p.createRoot(ps);let bs=!1;const ms=()=>{ys.render((0,f.jsx)(hs,{isReady:bs}))};return rs.events.addEventListener(rs.RENDER_EVENT,()=>{bs||(bs=!0,rs.setComponentReady()),ms(),rs.setFrameHeight()}),ms(),rs.setComponentReady(),rs.setFrameHeight(),{}}()});
-//# sourceMappingURL=index.7033ef174dc1fd7d6770.js.map
\ No newline at end of file
@@ -26,8 +26,44 @@ type KoyakuItem = {
   color: string;
   textColor: string;
 };
+type CounterOp = {
+  seq: number;
+  delta?: number[];
+  set?: number[];
+};
+
+type Ack = {
+  client: string;
+  seq: number;
+};
+
+// 期待度の早見表（src/grid.py の形式）
+type GridTable = {
+  bytes: Uint8Array;
+  levels: number;
+  rows: number;
+  rowSpins: Uint16Array;
+  kLo: Uint16Array;
+  widths: Uint16Array;
+  offsets: Uint32Array;
+};
+
+type Estimate = {
+  n: number;
+  k: number;
+  "456": number;
+  "56": number;
+};
+
 type KoyakuCounterProps = {
   isReady: boolean;
+  ack: Ack | null;
+  batchMs: number;
+  grid: GridTable | null;
+  gridId: string | null;
+  needGrid: boolean;
+  spins: number | null;
+  estimate: Estimate | null;
 };
 
 
@@ -54,6 +90,77 @@ const STORAGE_KEY_SHOW_EXTRAS = "koyakuCounter_showExtras";
 const STORAGE_KEY_THEME = "koyakuCounter_theme";
 const UNDO_TIMEOUT = 10000; // 10 秒以内なら復元可能
 
+// 連打を Python 側の再実行1回にまとめる待ち時間（ミリ秒）
+const DEFAULT_BATCH_MS = 250;
+const PROTOCOL_VERSION = 1;
+const CLIENT_ID = (() => {
+  try {
+    return window.crypto.randomUUID();
+  } catch (_error) {
+    return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+  }
+})();
+
+const GRID_MAGIC = "MTPG";
+const GRID_VERSION = 1;
+
+const parseGrid = (bytes: Uint8Array): GridTable | null => {
+  if (bytes.byteLength < 8) {
+    return null;
+  }
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const magic = String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]);
+  if (magic !== GRID_MAGIC || view.getUint8(4) !== GRID_VERSION) {
+    return null;
+  }
+  const levels = view.getUint8(5);
+  const rows = view.getUint16(6, true);
+  const rowSpins = new Uint16Array(rows);
+  const kLo = new Uint16Array(rows);
+  const widths = new Uint16Array(rows);
+  const offsets = new Uint32Array(rows);
+  let offset = 8 + rows * 6;
+  for (let i = 0; i < rows; i += 1) {
+    rowSpins[i] = view.getUint16(8 + i * 6, true);
+    kLo[i] = view.getUint16(10 + i * 6, true);
+    widths[i] = view.getUint16(12 + i * 6, true);
+    offsets[i] = offset;
+    offset += widths[i] * 2;
+  }
+  return { bytes, levels, rows, rowSpins, kLo, widths, offsets };
+};
+
+const gridValue = (grid: GridTable, row: number, goal: number, k: number): number => {
+  const width = grid.widths[row];
+  const index = Math.min(Math.max(k - grid.kLo[row], 0), width - 1);
+  return grid.bytes[grid.offsets[row] + goal * width + index];
+};
+
+// (n, k) の 456 / 56 期待度。期待度は k について単調なので範囲外は端の値、行の間は線形補間
+const lookupGrid = (grid: GridTable | null, n: number, k: number): Estimate | null => {
+  if (!grid || n <= 0 || k < 0 || k > n || n > grid.rowSpins[grid.rows - 1]) {
+    return null;
+  }
+  let lo = 0;
+  let hi = grid.rows - 1;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (grid.rowSpins[mid] < n) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  const upper = lo;
+  const lower = grid.rowSpins[upper] === n ? upper : upper - 1;
+  const t = lower === upper ? 0 : (n - grid.rowSpins[lower]) / (grid.rowSpins[upper] - grid.rowSpins[lower]);
+  const value = (goal: number) => {
+    const base = gridValue(grid, lower, goal, k);
+    return (t > 0 ? base * (1 - t) + gridValue(grid, upper, goal, k) * t : base) / grid.levels;
+  };
+  return { n, k, "456": value(0), "56": value(1) };
+};
+
 const themeConfig: Record<Theme, ThemeStyle> = {
   light: {
     rootBg: "#fdfdf6",
@@ -151,23 +258,93 @@ const buildTapButtonStyle = (
   };
 };
 
-const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
+const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady, ack, batchMs, grid, gridId, needGrid, spins, estimate }) => {
   const [counts, setCounts] = useState<number[]>(getInitialCounts);
   const theme = useMemo(() => getInitialTheme(), []);
   const [undoCounts, setUndoCounts] = useState<number[] | null>(null);
   const [showExtras, setShowExtras] = useState<boolean>(() => getInitialShowExtras());
   const undoTimerRef = useRef<number | null>(null);
 
-
-  const pushCountsToStreamlit = useCallback((nextCounts: number[]) => {
+  // --- Streamlit への送信（差分のまとめ送り） ---
+  // batchMs の間の増減を1つの操作 { seq, delta } にまとめ、絶対値の変更は { seq, set } として送る。
+  // Streamlit は最後に送った値しか保持しないため、ack が返るまでの操作は毎回すべて送り直す。
+  const countsRef = useRef<number[]>(counts);
+  const seqRef = useRef(0);
+  const openDeltaRef = useRef<number[] | null>(null);
+  const unackedOpsRef = useRef<CounterOp[]>([]);
+  const flushTimerRef = useRef<number | null>(null);
+  const initialSyncDoneRef = useRef(false);
+  // 操作を初めて送った時刻。ack が届いたら往復時間を求め、次の送信で rtt_ms として知らせる
+  const sentAtRef = useRef<Map<number, number>>(new Map());
+  const pendingRttRef = useRef<number | null>(null);
+
+  const sendOps = useCallback((origin: string) => {
     if (!isReady) {
       return;
     }
+    const latest = countsRef.current;
+    const now = performance.now();
+    unackedOpsRef.current.forEach((op) => {
+      if (!sentAtRef.current.has(op.seq)) {
+        sentAtRef.current.set(op.seq, now);
+      }
+    });
     Streamlit.setComponentValue({
-      primaryCount: nextCounts[0] ?? 0,
-      counts: [...nextCounts]
+      protocol: PROTOCOL_VERSION,
+      client: CLIENT_ID,
+      ops: unackedOpsRef.current,
+      primaryCount: latest[0] ?? 0,
+      counts: [...latest],
+      grid: gridId,
+      rtt_ms: pendingRttRef.current,
+      origin
     });
-  }, [isReady]);
+    pendingRttRef.current = null;
+  }, [isReady, gridId]);
+
+  const closeOpenDelta = useCallback((): boolean => {
+    if (flushTimerRef.current !== null) {
+      window.clearTimeout(flushTimerRef.current);
+      flushTimerRef.current = null;
+    }
+    const delta = openDeltaRef.current;
+    openDeltaRef.current = null;
+    if (!delta || delta.every((value) => value === 0)) {
+      return false;
+    }
+    seqRef.current += 1;
+    unackedOpsRef.current = [...unackedOpsRef.current, { seq: seqRef.current, delta }];
+    return true;
+  }, []);
+
+  const flushDelta = useCallback(() => {
+    if (closeOpenDelta()) {
+      sendOps("adjust");
+    }
+  }, [closeOpenDelta, sendOps]);
+
+  const queueDelta = (index: number, delta: number) => {
+    const open = openDeltaRef.current ?? ITEMS.map(() => 0);
+    open[index] += delta;
+    openDeltaRef.current = open;
+    if (batchMs <= 0) {
+      flushDelta();
+    } else if (flushTimerRef.current === null) {
+      flushTimerRef.current = window.setTimeout(() => {
+        flushTimerRef.current = null;
+        flushDelta();
+      }, batchMs);
+    }
+  };
+
+  const pushSetToStreamlit = (nextCounts: number[], origin: string) => {
+    // それまでの差分を先に確定させ、絶対値はまとめずにすぐ送る
+    closeOpenDelta();
+    seqRef.current += 1;
+    unackedOpsRef.current = [...unackedOpsRef.current, { seq: seqRef.current, set: [...nextCounts] }];
+    countsRef.current = nextCounts;
+    sendOps(origin);
+  };
 
   const persistCounts = (nextCounts: number[]) => {
     if (typeof window !== "undefined") {
@@ -183,11 +360,57 @@ const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
   }, [counts, isReady]);
 
   useEffect(() => {
-    if (!isReady) {
+    countsRef.current = counts;
+  }, [counts]);
+
+  useEffect(() => {
+    // 接続直後に現在の値（localStorage から復元した値を含む）を1度だけ送る
+    if (!isReady || initialSyncDoneRef.current) {
       return;
     }
-    pushCountsToStreamlit(counts);
-  }, [isReady, counts, pushCountsToStreamlit]);
+    initialSyncDoneRef.current = true;
+    pushSetToStreamlit(countsRef.current, "init");
+  }, [isReady]);
+
+  useEffect(() => {
+    // 早見表は受け取り済みと判断されたが手元にない（読み込み直した）ときは送り直してもらう
+    if (isReady && needGrid) {
+      sendOps("grid");
+    }
+  }, [isReady, needGrid, sendOps]);
+
+  useEffect(() => {
+    if (!ack || ack.client !== CLIENT_ID) {
+      return;
+    }
+    unackedOpsRef.current = unackedOpsRef.current.filter((op) => op.seq > ack.seq);
+    const sentAt = sentAtRef.current.get(ack.seq);
+    if (sentAt !== undefined) {
+      pendingRttRef.current = Math.round(performance.now() - sentAt);
+    }
+    sentAtRef.current.forEach((_time, seq) => {
+      if (seq <= ack.seq) {
+        sentAtRef.current.delete(seq);
+      }
+    });
+  }, [ack]);
+
+  useEffect(() => {
+    // まとめ待ちの差分はタブを閉じる・切り替える前に送っておく
+    const onHide = () => flushDelta();
+    const onVisibility = () => {
+      if (document.visibilityState === "hidden") {
+        flushDelta();
+      }
+    };
+    window.addEventListener("pagehide", onHide);
+    document.addEventListener("visibilitychange", onVisibility);
+    return () => {
+      window.removeEventListener("pagehide", onHide);
+      document.removeEventListener("visibilitychange", onVisibility);
+      flushDelta();
+    };
+  }, [flushDelta]);
 
   useEffect(() => {
     if (isReady) {
@@ -228,6 +451,12 @@ const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
 
   const overallTotal = mainTotal + extraTotal;
 
+  // 先頭の項目の回数で期待度を表示（同期済みなら Python の値、それまでは早見表の速報値）
+  const primaryHits = counts[0] ?? 0;
+  const exactEstimate = spins !== null && estimate !== null && estimate.n === spins && estimate.k === primaryHits;
+  const shownEstimate = spins === null ? null : exactEstimate ? estimate : lookupGrid(grid, spins, primaryHits);
+  const formatEstimate = (prob: number) => `${(prob * 100).toFixed(exactEstimate ? 1 : 0)}%`;
+
 
   const renderCard = (item: KoyakuItem, index: number) => {
     const labelForA11y = `${item.label ?? "小役"}${index + 1}`;
@@ -293,15 +522,16 @@ const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
 
 
   const handleUpdate = (index: number, delta: number) => {
-    setCounts((prev) =>
-      prev.map((value, i) => {
-        if (i !== index) {
-          return value;
-        }
-        const next = value + delta;
-        return next < 0 ? 0 : next;
-      })
-    );
+    // 0 で止まった分は送らない（Python 側と値が食い違わないように実際の増減を積む）
+    const current = countsRef.current[index] ?? 0;
+    const applied = Math.max(0, current + delta) - current;
+    if (applied === 0) {
+      return;
+    }
+    const nextCounts = countsRef.current.map((value, i) => (i === index ? value + applied : value));
+    countsRef.current = nextCounts;
+    setCounts(nextCounts);
+    queueDelta(index, applied);
     if (undoCounts) {
       clearUndo();
     }
@@ -310,9 +540,9 @@ const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
   const handleDirectInput = (index: number, rawValue: string) => {
     const numeric = Number(rawValue);
     const nextValue = Number.isFinite(numeric) && numeric >= 0 ? Math.floor(numeric) : 0;
-    setCounts((prev) =>
-      prev.map((value, i) => (i === index ? nextValue : value))
-    );
+    const nextCounts = countsRef.current.map((value, i) => (i === index ? nextValue : value));
+    setCounts(nextCounts);
+    pushSetToStreamlit(nextCounts, "input");
     if (undoCounts) {
       clearUndo();
     }
@@ -322,6 +552,7 @@ const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
     setUndoCounts([...counts]);
     const resetCounts = ITEMS.map(() => 0);
     setCounts(resetCounts);
+    pushSetToStreamlit(resetCounts, "reset");
     if (undoTimerRef.current) {
       window.clearTimeout(undoTimerRef.current);
     }
@@ -337,6 +568,7 @@ const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
     }
     const restored = [...undoCounts];
     setCounts(restored);
+    pushSetToStreamlit(restored, "undo");
     clearUndo();
   };
 
@@ -371,6 +603,24 @@ const KoyakuCounter: React.FC<KoyakuCounterProps> = ({ isReady }) => {
         <span>総計 {overallTotal}</span>
       </div>
 
+      {shownEstimate && (
+        <div
+          style={{
+            display: "flex",
+            justifyContent: "space-between",
+            marginBottom: "0.45rem",
+            fontSize: "0.85rem",
+            fontWeight: 700,
+            fontVariantNumeric: "tabular-nums",
+            opacity: exactEstimate ? 1 : 0.7
+          }}
+          title={exactEstimate ? undefined : "速報値（次の同期で確定）"}
+        >
+          <span>456期待度 {formatEstimate(shownEstimate["456"])}</span>
+          <span>56期待度 {formatEstimate(shownEstimate["56"])}</span>
+        </div>
+      )}
+
       <div style={{ display: "grid", gap: "0.55rem", gridTemplateColumns: "repeat(auto-fit, minmax(140px, 1fr))" }}>
         {MAIN_ITEMS.map((item, index) => renderCard(item, index))}
       </div>
@@ -477,9 +727,27 @@ const root = ReactDOM.createRoot(rootElement);
 
 let streamlitReady = false;
 let initialRenderDone = false;
+let latestAck: Ack | null = null;
+let latestBatchMs = DEFAULT_BATCH_MS;
+let latestGrid: GridTable | null = null;
+let latestGridId: string | null = null;
+let needGrid = false;
+let latestSpins: number | null = null;
+let latestEstimate: Estimate | null = null;
 
 const render = () => {
-  root.render(<KoyakuCounter isReady={streamlitReady} />);
+  root.render(
+    <KoyakuCounter
+      isReady={streamlitReady}
+      ack={latestAck}
+      batchMs={latestBatchMs}
+      grid={latestGrid}
+      gridId={latestGridId}
+      needGrid={needGrid}
+      spins={latestSpins}
+      estimate={latestEstimate}
+    />
+  );
 };
 
 const markReadyAndRender = () => {
@@ -491,7 +759,37 @@ const markReadyAndRender = () => {
   Streamlit.setFrameHeight();
 };
 
-Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, () => {
+Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, (event: Event) => {
+  const args = ((event as CustomEvent).detail?.args ?? {}) as {
+    ack?: Ack;
+    batch_ms?: number;
+    grid?: Uint8Array | null;
+    grid_id?: string;
+    spins?: number | null;
+    estimate?: Estimate | null;
+  };
+  if (args.ack && typeof args.ack.client === "string" && Number.isFinite(Number(args.ack.seq))) {
+    // 同じ内容でも参照が変わると effect が走るため、seq が変わったときだけ差し替える
+    if (!latestAck || latestAck.client !== args.ack.client || latestAck.seq !== Number(args.ack.seq)) {
+      latestAck = { client: args.ack.client, seq: Number(args.ack.seq) };
+    }
+  }
+  const batchMs = Number(args.batch_ms);
+  latestBatchMs = Number.isFinite(batchMs) && batchMs >= 0 ? batchMs : DEFAULT_BATCH_MS;
+  needGrid = false;
+  if (args.grid instanceof Uint8Array && args.grid_id !== latestGridId) {
+    latestGrid = parseGrid(args.grid);
+    latestGridId = latestGrid ? args.grid_id ?? null : null;
+  } else if (typeof args.grid_id === "string" && args.grid_id !== latestGridId) {
+    latestGrid = null;
+    latestGridId = null;
+    needGrid = true;
+  } else if (typeof args.grid_id !== "string") {
+    latestGrid = null;
+    latestGridId = null;
+  }
+  latestSpins = typeof args.spins === "number" ? args.spins : null;
+  latestEstimate = args.estimate && typeof args.estimate === "object" ? args.estimate : null;
   markReadyAndRender();
 });
 
@@ -2,9 +2,10 @@
 const HtmlWebpackPlugin = require("html-webpack-plugin");
 const webpack = require("webpack");
 
-const buildId = new Date().toISOString();
+// ビルドごとに変わる値を埋め込むと、内容が同じでもハッシュが変わって長期キャッシュが効かなくなる
+const buildId = process.env.BUILD_ID || require("./package.json").version;
 
-module.exports = {
+module.exports = (env, argv) => ({
   entry: "./src/index.tsx",
   resolve: {
     extensions: [".ts", ".tsx", ".js"]
@@ -12,6 +13,8 @@ module.exports = {
   output: {
     filename: "index.[contenthash].js",
     path: path.resolve(__dirname, "build"),
+    // 古いハッシュ付きバンドルを残さない
+    clean: true,
     library: {
       type: "umd",
       name: "koyaku_counter"
@@ -57,7 +60,13 @@ module.exports = {
       __BUILD_ID__: JSON.stringify(buildId)
     })
   ],
-  devtool: "source-map",
+  // React を含めて1つのバンドルにまとめる（iframe ごとの要求を1本にする）
+  optimization: {
+    splitChunks: false,
+    runtimeChunk: false
+  },
+  // ソースマップは開発時だけ（配信ディレクトリに置かない）
+  devtool: argv.mode === "production" ? false : "source-map",
   devServer: {
     static: {
       directory: path.join(__dirname, "public")
@@ -65,4 +74,4 @@ module.exports = {
     port: 3001,
     hot: true
   }
-};
\ No newline at end of file
+});
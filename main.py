@@ -1,130 +1,329 @@
+import time
+import uuid
+
 import streamlit as st
-import math
 
-from src.constants import SETTING_KEYS, SETTINGS
-from src.logic import compute_posteriors, normalize, evaluate_goal, format_percent, format_denominator
+from src.cache import get_result_cache, prior_signature
+from src.events import get_event_store
+from src.priors import DAY_LABELS, get_prior_table, today_kind
+from src.specs import DEFAULT_MACHINE, get_spec, list_machines, resolve_machine
+from src.results import build_result_bundle
+from src.ingest import rank_hall_data
+from src.planner import plan_spins
+from src.changepoint import detect_changepoints
+from src.whatif import get_whatif_grid, hits_needed, whatif_chart_records
+from src.trajectory import compute_trajectory, downsample, trajectory_records
+from src.counters import swipe_counter, koyaku_counter
 from src.styles import get_css
+from src import metrics
 from src.components import (
     render_mobile_header,
     render_mobile_result_card,
     render_probability_bars_mobile,
-    render_copy_button
+    render_copy_button,
+    render_ranking_table,
+    render_spin_plan,
+    render_posterior_trajectory,
+    render_changepoint,
+    render_whatif,
+    render_metrics_panel
 )
 
-# --- メインアプリ ---
-def main():
-    st.set_page_config(
-        page_title="モンキーターンV 判別",
-        page_icon="🚤",
-        layout="centered",
-        initial_sidebar_state="collapsed",
-    )
-    
-    st.markdown(get_css(), unsafe_allow_html=True)
-    
-    # セッション初期化
-    if "n" not in st.session_state: st.session_state.n = 0
-    if "k" not in st.session_state: st.session_state.k = 0
+if metrics.ENABLED:
+    def _collect_cache_stats():
+        stats = get_result_cache().stats()
+        return [
+            ("mtv_result_cache_hits_total", "counter", {}, stats["hits"]),
+            ("mtv_result_cache_misses_total", "counter", {}, stats["misses"]),
+            ("mtv_result_cache_evictions_total", "counter", {}, stats["evictions"]),
+            ("mtv_result_cache_entries", "gauge", {}, stats["entries"]),
+            ("mtv_result_cache_bytes", "gauge", {}, stats["bytes"]),
+        ]
+    metrics.REGISTRY.register_collector("result_cache", _collect_cache_stats)
+
+# 小役回数の入力方法（カウンターは値を端末に保存し、選んでいる間はカウンターの値を小役回数にする）
+COUNTER_MODES = {"input": "数値入力", "swipe": "スワイプ", "koyaku": "小役カウンター"}
+
+def _reset_count_input():
+    """数値入力に戻したとき、入力欄をカウンターで数えた値から始め直す"""
+    st.session_state.pop("num_k", None)
+
+def render_indicator_inputs(spec):
+    """機種の仕様にある主要素以外の判別要素 (indicators) の入力欄。{要素名: 観測} を返す"""
+    observations = {}
+    with st.expander("➕ その他の判別要素", expanded=False):
+        for indicator in spec.model().indicators[1:]:
+            st.caption(indicator.label)
+            observation = {}
+            for col, (field, label) in zip(st.columns(len(indicator.fields)), indicator.fields):
+                with col:
+                    observation[field] = st.number_input(
+                        label, min_value=0, value=0, step=1, key=f"obs_{spec.id}_{indicator.name}_{field}"
+                    )
+            observations[indicator.name] = observation
+    return observations
 
-    render_mobile_header()
+# --- 目標までの必要回数（入れ子のフラグメント） ---
+@st.fragment
+@metrics.rerun("whatif")
+def render_whatif_solver(spec, priors, n: int, k: int):
+    """
+    あと何G・どの期待度・星いくつを選ぶと、必要な小役回数を早見表から引く
+    ここの入力操作ではこの関数だけが再実行され、判別結果は計算し直さない。
+    """
+    col_spins, col_goal, col_stars = st.columns(3)
+    with col_spins:
+        extra = st.number_input("あと (G)", min_value=1, value=500, step=100, key="whatif_spins")
+    with col_goal:
+        goal_code = st.selectbox("期待度", spec.goal_codes, key="whatif_goal")
+    with col_stars:
+        stars = st.selectbox("目標", [3, 4, 5], index=1, format_func=lambda s: f"★{s}以上", key="whatif_stars")
+    with metrics.span("whatif_grid"):
+        grid = get_whatif_grid(priors, spec)
+    answer = hits_needed(grid, n, k, extra, goal_code, stars=stars)
+    cells, lines = whatif_chart_records(grid, n, k, extra, goal_code)
+    render_whatif(answer, cells, lines, spec.indicator)
 
+# --- 入力と結果（フラグメント） ---
+@st.fragment
+@metrics.rerun("calculator")
+def render_calculator():
+    """
+    入力欄と判別結果
+    フラグメント内の入力操作ではこの関数だけが再実行され、
+    CSS・ヘッダー・ホールデータ欄は再送されない。
+    """
+    spec = get_spec(st.session_state.machine)
     # --- 入力エリア ---
-    with st.container():
+    with metrics.span("inputs"), st.container():
+        # 小役カウンターの項目はモンキーターンVの小役（先頭の項目を小役回数として使う）
+        modes = ["input", "swipe"] + (["koyaku"] if spec.id == DEFAULT_MACHINE else [])
+        mode = st.radio(
+            f"{spec.indicator}の入力", modes, format_func=COUNTER_MODES.get, horizontal=True,
+            key="counter_mode", on_change=_reset_count_input,
+        )
         col_n, col_k = st.columns(2)
         
         with col_n:
             st.session_state.n = st.number_input("総回転数 (G)", value=st.session_state.n, step=10, key="num_n")
 
         with col_k:
-            st.session_state.k = st.number_input("5枚役回数", value=st.session_state.k, step=1, key="num_k")
+            if mode == "input":
+                st.session_state.k = st.number_input(f"{spec.indicator}回数", value=st.session_state.k, step=1, key="num_k")
+            else:
+                count_slot = st.empty()
+
+        # タップ直後の期待度はコンポーネントが早見表 (src/grid.py) から引く。表はモンキーターンVの設定で作る
+        grid_args = {"spins": st.session_state.n, "priors": st.session_state.posterior_state.priors} if spec.id == DEFAULT_MACHINE else {}
+        if mode == "swipe":
+            st.session_state.k = swipe_counter(
+                f"swipe_k_{spec.id}", label=f"{spec.indicator}回数", value=st.session_state.k, **grid_args
+            )
+        elif mode == "koyaku":
+            st.session_state.k = koyaku_counter(f"koyaku_k_{spec.id}", values=[st.session_state.k], **grid_args)[0]
+        if mode != "input":
+            count_slot.metric(f"{spec.indicator}回数", st.session_state.k)
+
+        observations = render_indicator_inputs(spec) if spec.indicators else {}
+
+    # 前回からの差分だけを反映（全設定の二項計算をやり直さない）
+    # 差分は操作ログにも追記し、再読み込み・再起動後に復元できるようにする
+    state = st.session_state.posterior_state
+    delta_spins = st.session_state.n - state.num_spins
+    delta_hits = st.session_state.k - state.num_hits
+    with metrics.span("event_log"):
+        get_event_store().append(st.session_state.session_id, st.session_state.machine, delta_spins, delta_hits)
+    state.set_counts(st.session_state.n, st.session_state.k)
+    for name, observation in observations.items():
+        state.set_observation(name, observation)
+
+    # 設定変更の検出も差分だけ進める（反映できない取り消しのときは、表示時に履歴から作り直す）
+    detector = st.session_state.get("changepoint")
+    if detector is not None and not detector.update(delta_spins, delta_hits, time.time()):
+        st.session_state.changepoint = None
 
     # --- 計算と表示 ---
     if st.session_state.n > 0:
         n = st.session_state.n
         k = st.session_state.k
-        
-        priors = {key: 1.0/len(SETTING_KEYS) for key in SETTING_KEYS}
-        posteriors = compute_posteriors(n, k, priors)
-        hit_prob = k / n
-        
-        prob_456 = sum(posteriors[x] for x in ["4", "5", "6"])
-        prob_12 = sum(posteriors[x] for x in ["1", "2"])
-        prob_56 = sum(posteriors[x] for x in ["5", "6"])
-        prob_124 = sum(posteriors[x] for x in ["1", "2", "4"])
 
-        se = math.sqrt(hit_prob * (1.0 - hit_prob) / n) if hit_prob < 1.0 else 0.0
-        ci_range_pct = (1.96 * se * 2) * 100.0
-        
-        eval_456 = evaluate_goal("456", prob_456, prob_12, n, ci_range_pct)
-        eval_56 = evaluate_goal("56", prob_56, prob_124, n, ci_range_pct)
+        # 同じ (機種, n, k, 事前確率, 他の要素の観測) の結果は全セッションで共有
+        cache_key = (spec.id, n, k, prior_signature(state.priors, spec.keys), state.observation_signature())
+        with metrics.span("result_bundle"):
+            result = get_result_cache().get_or_compute(cache_key, lambda: build_result_bundle(state))
 
         st.markdown("---")
         
-        # 結果カード (456期待度)
-        render_mobile_result_card(
-            title="456期待度",
-            value_text=format_percent(prob_456),
-            sub_text=f"信頼度: {eval_456['stars']}/5",
-            stars=eval_456['stars'],
-            comment=eval_456['comment'],
-            is_highlight=(eval_456['stars'] >= 4)
-        )
-
-        # 結果カード (56期待度)
-        render_mobile_result_card(
-            title="56期待度",
-            value_text=format_percent(prob_56),
-            sub_text=f"信頼度: {eval_56['stars']}/5",
-            stars=eval_56['stars'],
-            comment=eval_56['comment'],
-            is_highlight=(eval_56['stars'] >= 4)
-        )
+        # 結果カード (機種の期待度ごと。モンキーターンVなら 456 / 56)
+        for goal in result["goals"]:
+            goal_eval = goal["eval"]
+            render_mobile_result_card(
+                title=f"{goal['code']}期待度",
+                value_text=goal["prob_text"],
+                sub_text=f"信頼度: {goal_eval['stars']}/5",
+                stars=goal_eval['stars'],
+                comment=goal_eval['comment'],
+                is_highlight=(goal_eval['stars'] >= 4)
+            )
 
         # 実測値
-        top_setting = max(posteriors, key=posteriors.get)
-        expected_prob = SETTINGS[top_setting]
-        
-        # 確率分母での比較
-        current_denom = 1.0 / hit_prob if hit_prob > 0 else 0.0
-        expected_denom = 1.0 / expected_prob
-        diff_denom = current_denom - expected_denom
-        
-        sign_str = "+" if diff_denom > 0 else ""
-        
         render_mobile_result_card(
             title="現在の確率",
-            value_text=format_denominator(hit_prob),
-            sub_text=f"{k}回 / {n}G (設定{top_setting}の理論値 1/{expected_denom:.1f})",
-            comment=f"理論値とのズレ: {sign_str}{diff_denom:.1f} (分母)"
+            value_text=result["hit_prob_text"],
+            sub_text=f"{k}回 / {n}G (設定{result['top_setting']}の理論値 1/{result['expected_denom']:.1f})",
+            comment=f"理論値とのズレ: {result['diff_denom_text']} (分母)"
         )
 
         # 詳細データ
         with st.expander("📊 設定別詳細データ", expanded=False):
-            render_probability_bars_mobile(posteriors)
+            render_probability_bars_mobile(result["posteriors"])
 
-        # シェア用テキスト生成
-        stars_456 = "★" * eval_456['stars'] + "☆" * (5 - eval_456['stars'])
-        stars_56 = "★" * eval_56['stars'] + "☆" * (5 - eval_56['stars'])
-        
-        share_text = f"""【モンキーターンV 設定判別】
-総回転数: {n}G
-5枚役: {format_denominator(hit_prob)} ({k}回)
+        # 判別までの必要回転数（表示中の時だけ計算する）
+        if st.toggle("⏱ あと何G回せば判別できる？", key="show_spin_plan"):
+            with metrics.span("spin_plan"):
+                render_spin_plan(plan_spins(n, k, state.priors, goal_code=spec.goal_codes[0], spec=spec))
 
-[456期待度] {format_percent(prob_456)}
-{stars_456}
-{eval_456['comment']}
+        # 目標に届くまでの必要な小役回数（早見表は機種・事前確率ごとに初回だけ作る）
+        if st.toggle("🎯 あと何回引けば目標に届く？", key="show_whatif"):
+            render_whatif_solver(spec, state.priors, n, k)
 
-[56期待度] {format_percent(prob_56)}
-{stars_56}
-{eval_56['comment']}
+        # 途中の設定変更（セッションの最初と取り消しの後だけ操作ログから作り直す）
+        with st.expander("🔀 途中で設定が変わった？", expanded=False), metrics.span("changepoint"):
+            if st.session_state.get("changepoint") is None:
+                store = get_event_store()
+                store.flush(timeout=1.0)
+                history = store.history(st.session_state.session_id, st.session_state.machine)
+                st.session_state.changepoint = detect_changepoints(history, state.priors, spec=spec)
+            render_changepoint(st.session_state.changepoint.summary(), spec.goal_groups)
 
-現在の確率: 設定{top_setting}近似
-(理論値ズレ {sign_str}{diff_denom:.1f})
-"""
-        render_copy_button(share_text)
+        # 期待度の推移（操作ログから一括計算。表示中の時だけ読み出す）
+        if st.toggle("📈 期待度の推移を表示", key="show_trajectory"):
+            store = get_event_store()
+            store.flush(timeout=1.0)
+            history = store.history(st.session_state.session_id, st.session_state.machine)
+            trajectory = compute_trajectory(
+                [event["delta_spins"] for event in history],
+                [event["delta_hits"] for event in history],
+                state.priors,
+                spec=spec,
+            )
+            render_posterior_trajectory(trajectory_records(downsample(trajectory), spec.keys))
+
+        # シェア用テキスト
+        render_copy_button(result["share_text"])
 
     else:
         st.info("👆 回転数と小役回数を入力してください")
 
+# --- ホールデータ一括判別（フラグメント） ---
+@st.fragment
+@metrics.rerun("hall_ranking")
+def render_hall_ranking():
+    spec = get_spec(st.session_state.machine)
+    with st.expander("🏢 ホールデータ一括判別 (CSV/TSV)", expanded=False):
+        uploaded = st.file_uploader(f"台番号・総回転数・{spec.indicator}回数の列を含むファイル", type=["csv", "tsv", "txt"], key="hall_file")
+        if uploaded is not None:
+            sort_by = st.radio("並び順", spec.goal_codes, horizontal=True, key="hall_sort")
+            priors = st.session_state.posterior_state.priors
+            # 同じファイル・機種・並び順・事前分布なら、フラグメントの再実行で読み直さない
+            cache_key = (uploaded.file_id, spec.id, sort_by, prior_signature(priors, spec.keys))
+            cached = st.session_state.get("hall_ranking")
+            if cached is None or cached[0] != cache_key:
+                uploaded.seek(0)
+                try:
+                    cached = (cache_key, rank_hall_data(uploaded, priors=priors, top=100, sort_by=sort_by, spec=spec))
+                except (ValueError, UnicodeDecodeError) as e:
+                    st.error(f"読み込みに失敗しました: {e}")
+                    return
+                st.session_state.hall_ranking = cached
+            render_ranking_table(cached[1], spec.goal_codes, spec.indicator)
+
+# --- 機種の切り替え ---
+def _switch_machine():
+    """選んだ機種の操作ログから入力値を復元し直す（入力欄・検出器・事後確率を作り直させる）"""
+    machine = st.session_state.machine_select
+    st.session_state.machine = "default" if machine == DEFAULT_MACHINE else machine
+    st.query_params["machine"] = st.session_state.machine
+    for key in ("posterior_state", "n", "k", "num_n", "num_k", "changepoint", "prior_label", "counter_mode"):
+        st.session_state.pop(key, None)
+
+def render_machine_select():
+    """機種の選択欄（登録されている機種が2つ以上のときだけ）"""
+    machines = dict(list_machines())
+    if len(machines) < 2:
+        return
+    current = resolve_machine(st.session_state.machine)
+    st.selectbox(
+        "機種",
+        list(machines),
+        index=list(machines).index(current),
+        format_func=machines.get,
+        key="machine_select",
+        on_change=_switch_machine,
+    )
+
+# --- 計測結果（METRICS_ENABLED=1 のときだけ） ---
+@st.fragment
+def render_debug_panel():
+    profile_text = metrics.profile_report()
+    collapsed = metrics.PROFILER.collapsed() if metrics.PROFILE_MODE == "sample" else None
+    render_metrics_panel(metrics.REGISTRY.snapshot(), metrics.REGISTRY.render_prometheus(), profile_text, collapsed)
+
+# --- メインアプリ ---
+@metrics.rerun("script")
+def main():
+    machine = st.session_state.get("machine") or st.query_params.get("machine", "default")
+    spec = get_spec(machine)
+    st.set_page_config(
+        page_title=f"{spec.title} 判別",
+        page_icon="🚤",
+        layout="centered",
+        initial_sidebar_state="collapsed",
+    )
+    
+    # フルリラン（初回表示・再読み込み）の時だけ出力される
+    with metrics.span("css"):
+        st.markdown(get_css(), unsafe_allow_html=True)
+    
+    # セッション初期化
+    # セッションIDは URL (?sid=...) に載せ、再読み込み時は操作ログから入力値を復元する
+    if "session_id" not in st.session_state:
+        if "sid" not in st.query_params:
+            st.query_params["sid"] = uuid.uuid4().hex
+        st.session_state.session_id = st.query_params["sid"]
+        st.session_state.machine = machine
+    if "posterior_state" not in st.session_state:
+        if spec.id == DEFAULT_MACHINE:
+            # 事前確率はホール (?hall=...) と今日の曜日（?event=1 なら特日）の推定値。保存済みの値がなければ一様分布
+            kind = today_kind(st.query_params.get("event") == "1")
+            priors, level = get_prior_table().lookup(st.query_params.get("hall"), kind)
+            st.session_state.prior_label = {
+                "hall_day": f"{st.query_params.get('hall')}・{DAY_LABELS[kind]}の実績",
+                "hall": f"{st.query_params.get('hall')}の実績",
+                "global": "全ホールの実績",
+            }.get(level)
+        else:
+            # ホールの実績はモンキーターンVの分だけなので、他の機種は一様分布
+            priors = spec.flat_priors()
+        st.session_state.posterior_state = get_event_store().restore_state(
+            st.session_state.session_id, st.session_state.machine, priors, spec
+        )
+    if "n" not in st.session_state: st.session_state.n = st.session_state.posterior_state.num_spins
+    if "k" not in st.session_state: st.session_state.k = st.session_state.posterior_state.num_hits
+
+    render_mobile_header(spec.title)
+    render_machine_select()
+    if st.session_state.get("prior_label"):
+        st.caption(f"事前確率: {st.session_state.prior_label}")
+
+    render_calculator()
+
+    # ホールデータの列（5枚役回数）はモンキーターンVの形式
+    if spec.id == DEFAULT_MACHINE:
+        render_hall_ranking()
+
+    if metrics.ENABLED:
+        render_debug_panel()
+
 if __name__ == "__main__":
     main()
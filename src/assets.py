@@ -0,0 +1,331 @@
+"""
+カウンターコンポーネントのビルド成果物の整理・事前圧縮と配信
+
+    python -m src.assets build koyaku_counter_component/build swipe_counter_component/build
+    python -m src.assets serve [--host 0.0.0.0] [--port 8766]
+
+build は index.html から参照されていないファイル（古いハッシュ付きバンドル・ソースマップ）を消し、
+ファイル名にハッシュの付いたファイルとその内容のダイジェストを asset-manifest.json に書き、
+残ったテキストのファイルに .gz（と brotli モジュールがあれば .br）を並べて置く。
+各コンポーネントの npm run build の後に自動で実行される（postbuild）。
+
+Streamlit 標準のコンポーネント配信は要求のたびに gzip し、Cache-Control に有効期限がないため、
+再訪問のたびにバンドル全体を取り直す。環境変数 COMPONENT_ASSET_SERVER=1 のときは
+この配信サーバーを起動してコンポーネントをここから読み込ませる（src/counters.py）:
+
+- 事前圧縮したファイルを Accept-Encoding に合わせて返す（br → gzip → 無圧縮）
+- asset-manifest.json に載っていて、内容が build の時から変わっていないファイルだけを
+  Cache-Control: immutable（1年）で返す。再訪問では取りに来ない
+- それ以外（index.html、名前を変えずに置き換えられたファイルなど）は no-cache + ETag で、
+  変わっていなければ 304 を返す
+
+ブラウザから見たサーバーの URL は環境変数 COMPONENT_ASSET_URL で指定する
+（リバースプロキシの配下に置く場合など。省略時は http://localhost:<port>）。
+COMPONENT_ASSET_SERVER を設定しない既定の構成では、コンポーネントは Streamlit 標準の配信のままで、
+ここでの事前圧縮・長期キャッシュは使われない。
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .constants import COMPONENT_ASSET_CONFIG
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMPONENT_DIRS = {
+    "swipe_counter": os.path.join(ROOT_DIR, "swipe_counter_component", "build"),
+    "koyaku_counter": os.path.join(ROOT_DIR, "koyaku_counter_component", "build"),
+}
+
+# ファイル名にハッシュが付いている（内容が変われば名前も変わる）ファイル
+HASHED_NAME = re.compile(r"[.-][0-9A-Za-z_-]{8,}\.(?:js|css)$")
+COMPRESSIBLE = (".js", ".css", ".html", ".svg", ".json")
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+MANIFEST = "asset-manifest.json"
+_REFERENCE = re.compile(r"""(?:src|href)=["']([^"'#?]+)""")
+
+def enabled() -> bool:
+    return os.environ.get("COMPONENT_ASSET_SERVER", "") not in ("", "0")
+
+# --- ビルド成果物の整理 ---
+def referenced_files(build_dir: str) -> Set[str]:
+    """index.html から参照されているファイル（build_dir からの相対パス）"""
+    with open(os.path.join(build_dir, "index.html"), "r", encoding="utf-8-sig") as f:
+        html = f.read()
+    names = set()
+    for ref in _REFERENCE.findall(html):
+        if "://" in ref or ref.startswith("//"):
+            continue
+        names.add(os.path.normpath(re.sub(r"^(?:\./|/)+", "", ref)))
+    return names
+
+def prune_build(build_dir: str, dry_run: bool = False) -> List[Tuple[str, int]]:
+    """
+    index.html と、そこから参照されているファイル（と同名の .LICENSE.txt）以外を消す
+    事前圧縮した .gz / .br は元のファイルが残る場合だけ残す。消した (ファイル名, バイト数) を返す。
+    """
+    keep = referenced_files(build_dir) | {"index.html", MANIFEST}
+    keep |= {f"{name}.LICENSE.txt" for name in keep}
+    removed = []
+    for name in sorted(os.listdir(build_dir)):
+        path = os.path.join(build_dir, name)
+        if not os.path.isfile(path):
+            continue
+        source = name
+        for _, suffix in ENCODINGS:
+            if name.endswith(suffix):
+                source = name[:-len(suffix)]
+        if source in keep:
+            continue
+        removed.append((name, os.path.getsize(path)))
+        if not dry_run:
+            os.remove(path)
+    return removed
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def write_manifest(build_dir: str) -> Dict[str, str]:
+    """
+    index.html から参照されている、ファイル名にハッシュの付いたファイルと内容のダイジェストを書き出す
+    配信サーバーはここに載っていて内容が一致するファイルだけを immutable で返す。
+    """
+    immutable = {}
+    for name in sorted(referenced_files(build_dir)):
+        path = os.path.join(build_dir, name)
+        if HASHED_NAME.search(os.path.basename(name)) and os.path.isfile(path):
+            with open(path, "rb") as f:
+                immutable[name] = _digest(f.read())
+    tmp_path = os.path.join(build_dir, f"{MANIFEST}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"immutable": immutable}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, os.path.join(build_dir, MANIFEST))
+    return immutable
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=COMPONENT_ASSET_CONFIG["brotli_quality"])
+    # mtime を固定して、同じ内容なら同じバイト列にする
+    return gzip.compress(data, compresslevel=COMPONENT_ASSET_CONFIG["gzip_level"], mtime=0)
+
+def precompress(build_dir: str) -> List[Dict[str, int]]:
+    """テキストのファイルごとに .gz / .br を書き出し、(ファイル名, 元・圧縮後のバイト数) を返す"""
+    encodings = [(encoding, suffix) for encoding, suffix in ENCODINGS if encoding != "br" or brotli is not None]
+    report = []
+    for name in sorted(os.listdir(build_dir)):
+        path = os.path.join(build_dir, name)
+        if not os.path.isfile(path) or not name.endswith(COMPRESSIBLE) or name == MANIFEST:
+            continue
+        with open(path, "rb") as f:
+            data = f.read()
+        row = {"name": name, "identity": len(data)}
+        for encoding, suffix in encodings:
+            target = path + suffix
+            if len(data) < COMPONENT_ASSET_CONFIG["min_size"]:
+                if os.path.exists(target):
+                    os.remove(target)
+                continue
+            compressed = _compress(data, encoding)
+            tmp_path = f"{target}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, target)
+            row[encoding] = len(compressed)
+        report.append(row)
+    return report
+
+# --- 配信 ---
+@lru_cache(maxsize=256)
+def _load(path: str, mtime_ns: int) -> Tuple[bytes, str]:
+    """ファイルの内容と ETag（更新時刻ごとにキャッシュ）"""
+    with open(path, "rb") as f:
+        data = f.read()
+    return data, f'"{_digest(data)}"'
+
+@lru_cache(maxsize=16)
+def _load_manifest(path: str, mtime_ns: int) -> Dict[str, str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("immutable", {})
+
+def is_immutable(build_dir: str, name: str) -> bool:
+    """build の時に manifest に載せたファイルで、内容がその時のままなら True"""
+    manifest_path = os.path.join(build_dir, MANIFEST)
+    path = os.path.join(build_dir, name)
+    try:
+        manifest = _load_manifest(manifest_path, os.stat(manifest_path).st_mtime_ns)
+        _, etag = _load(path, os.stat(path).st_mtime_ns)
+    except (OSError, ValueError):
+        return False
+    return manifest.get(name) == etag.strip('"')
+
+def _accepted(header: Optional[str]) -> Set[str]:
+    accepted = set()
+    for item in (header or "").split(","):
+        token, _, params = item.strip().partition(";")
+        if token and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(token.lower())
+    return accepted
+
+def resolve(name: str, filename: str, accept_encoding: Optional[str]) -> Optional[Tuple[str, Optional[str]]]:
+    """要求されたファイルの実際のパスと Content-Encoding（なければ None）"""
+    root = COMPONENT_DIRS.get(name)
+    if root is None:
+        return None
+    filename = filename or "index.html"
+    path = os.path.realpath(os.path.join(root, filename))
+    if not path.startswith(os.path.realpath(root) + os.sep) or not os.path.isfile(path):
+        return None
+    accepted = _accepted(accept_encoding)
+    for encoding, suffix in ENCODINGS:
+        if encoding in accepted and os.path.isfile(path + suffix):
+            return path + suffix, encoding
+    return path, None
+
+class AssetRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "mtv-assets"
+    # ヘッダーと本文を別々に書くため、Nagle と遅延 ACK が重なって keep-alive の2件目以降が 40 ms 待たされないようにする
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._serve(head=False)
+
+    def do_HEAD(self) -> None:
+        self._serve(head=True)
+
+    def _serve(self, head: bool) -> None:
+        parts = self.path.split("?", 1)[0].lstrip("/").split("/", 1)
+        filename = parts[1] if len(parts) == 2 else ""
+        resolved = resolve(parts[0], filename, self.headers.get("Accept-Encoding"))
+        if resolved is None:
+            self.send_error(404)
+            return
+        path, encoding = resolved
+        data, etag = _load(path, os.stat(path).st_mtime_ns)
+        source = path[:-len(dict(ENCODINGS)[encoding])] if encoding else path
+        root = os.path.realpath(COMPONENT_DIRS[parts[0]])
+        immutable = is_immutable(root, os.path.relpath(source, root))
+
+        status = 304 if self.headers.get("If-None-Match") == etag else 200
+        self.send_response(status)
+        self.send_header("Content-Type", mimetypes.guess_type(source)[0] or "application/octet-stream")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", etag)
+        if immutable:
+            self.send_header("Cache-Control", f"public, max-age={COMPONENT_ASSET_CONFIG['max_age']}, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        # コンポーネントの iframe は Streamlit と別のオリジンから読み込まれる
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if status == 200:
+            self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if status == 200 and not head:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+class AssetServer:
+    """配信サーバー（別スレッドで動かす）"""
+
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None):
+        host = COMPONENT_ASSET_CONFIG["host"] if host is None else host
+        port = COMPONENT_ASSET_CONFIG["port"] if port is None else port
+        self.httpd = ThreadingHTTPServer((host, port), AssetRequestHandler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return os.environ.get("COMPONENT_ASSET_URL") or f"http://localhost:{self.port}"
+
+    def start(self) -> "AssetServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="component-assets", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+_SERVER: Optional[AssetServer] = None
+_SERVER_LOCK = threading.Lock()
+
+def get_asset_server() -> AssetServer:
+    """プロセス共通の配信サーバー（初回だけ起動）"""
+    global _SERVER
+    with _SERVER_LOCK:
+        if _SERVER is None:
+            _SERVER = AssetServer().start()
+        return _SERVER
+
+def component_url(name: str) -> Optional[str]:
+    """コンポーネントの読み込み元 URL（配信サーバーを使わない設定なら None）"""
+    if not enabled():
+        return None
+    return f"{get_asset_server().url.rstrip('/')}/{name}/"
+
+# --- コマンドライン ---
+def _print_report(
+    build_dir: str, removed: List[Tuple[str, int]], immutable: Dict[str, str], report: List[Dict[str, int]]
+) -> None:
+    print(build_dir)
+    if removed:
+        print(f"  削除 {len(removed)} ファイル / {sum(size for _, size in removed) / 1024:.1f} KB")
+    print(f"  長期キャッシュ: {', '.join(immutable) or 'なし'}")
+    for row in report:
+        sizes = "  ".join(f"{encoding} {row[encoding] / 1024:7.1f} KB" for encoding, _ in ENCODINGS if encoding in row)
+        print(f"  {row['name']:44s} {row['identity'] / 1024:7.1f} KB  {sizes}")
+    if brotli is None:
+        print("  (brotli モジュールがないため .br は作っていません)")
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="カウンターコンポーネントの成果物の整理・事前圧縮と配信")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="参照されていないファイルを消して事前圧縮する")
+    build.add_argument("dirs", nargs="*", help="ビルド出力のディレクトリ（省略時は両方のコンポーネント）")
+    build.add_argument("--dry-run", action="store_true", help="消すファイルを表示するだけ")
+    serve = sub.add_parser("serve", help="配信サーバーを起動する")
+    serve.add_argument("--host", default=COMPONENT_ASSET_CONFIG["host"])
+    serve.add_argument("--port", type=int, default=COMPONENT_ASSET_CONFIG["port"])
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        for build_dir in args.dirs or list(COMPONENT_DIRS.values()):
+            removed = prune_build(build_dir, dry_run=args.dry_run)
+            immutable = {} if args.dry_run else write_manifest(build_dir)
+            report = [] if args.dry_run else precompress(build_dir)
+            _print_report(build_dir, removed, immutable, report)
+    else:
+        server = AssetServer(args.host, args.port)
+        print(f"配信中: http://{args.host}:{server.port}/<コンポーネント名>/")
+        try:
+            server.httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.httpd.server_close()
+
+if __name__ == "__main__":
+    main()
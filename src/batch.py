@@ -0,0 +1,73 @@
+import numpy as np
+from typing import Any, Dict, List, Optional
+from .constants import SETTINGS, SETTING_KEYS, GOAL_CONFIG, SAMPLE_BANDS, EARLY_BOOST_PCT
+from .logic import normalize
+from .model import MAIN_INDICATOR, default_model
+
+# SETTING_KEYS 順の当選確率と、その対数
+SETTING_PROBS: np.ndarray = np.array([SETTINGS[key] for key in SETTING_KEYS], dtype=np.float64)
+LOG_P: np.ndarray = np.log(SETTING_PROBS)
+LOG_Q: np.ndarray = np.log1p(-SETTING_PROBS)
+
+def prior_vector(priors: Dict[str, float], keys: Optional[List[str]] = None) -> np.ndarray:
+    """事前確率の辞書を SETTING_KEYS（または keys）順のベクトルに変換（正規化済み）"""
+    keys = SETTING_KEYS if keys is None else keys
+    priors = normalize(priors, keys)
+    return np.array([priors[key] for key in keys], dtype=np.float64)
+
+def compute_posteriors_batch(num_spins, num_hits, priors: Dict[str, float], spec=None) -> np.ndarray:
+    """
+    複数の (n, k) に対する事後確率を一括計算する
+    戻り値は (行数 × 設定数) の行列で、列は SETTING_KEYS 順（spec を渡した場合はその機種の設定順）。
+    (n, k) を判別モデル（spec.model()、省略時は 5枚役だけの default_model）の主要素の回数
+    (当選 k, 非当選 n − k) にして、行列積1回で評価する。二項係数は設定間で共通のため lgamma は不要。
+    """
+    n = np.asarray(num_spins, dtype=np.float64).reshape(-1)
+    k = np.asarray(num_hits, dtype=np.float64).reshape(-1)
+    if n.shape != k.shape:
+        raise ValueError("num_spins と num_hits の長さが一致しません")
+
+    model = default_model() if spec is None else spec.model()
+    counts = np.zeros((len(n), model.num_columns))
+    main = model.columns(MAIN_INDICATOR)
+    counts[:, main.start] = k
+    counts[:, main.start + 1] = n - k
+    # スカラー版と同様、不正な入力は観測なし（事前確率をそのまま返す）とする
+    invalid = (n <= 0) | (k < 0) | (k > n)
+    if invalid.any():
+        counts[invalid] = 0.0
+    return model.posteriors_matrix(counts, priors)
+
+def posteriors_to_dicts(matrix: np.ndarray, keys: Optional[List[str]] = None) -> list:
+    """事後確率行列を compute_posteriors と同じ辞書形式のリストに変換（keys は列の設定の並び）"""
+    keys = SETTING_KEYS if keys is None else keys
+    return [dict(zip(keys, row.tolist())) for row in matrix]
+
+def evaluate_stars_batch(
+    goal_code: str,
+    goal_prob,
+    alt_prob,
+    sample_n,
+    config: Optional[Dict[str, Any]] = None,
+    early_spins: Optional[int] = None,
+    early_boost_pct: Optional[float] = None,
+) -> np.ndarray:
+    """
+    evaluate_goal の星の数だけを配列で一括計算する
+    config / early_spins / early_boost_pct を差し替えると、閾値を変えた場合（他の機種）の星を求められる。
+    """
+    config = config or GOAL_CONFIG[goal_code]
+    early_spins = SAMPLE_BANDS["early"] if early_spins is None else early_spins
+    early_boost_pct = EARLY_BOOST_PCT if early_boost_pct is None else early_boost_pct
+    goal_prob = np.asarray(goal_prob, dtype=np.float64)
+    goal_pct = goal_prob * 100.0
+    diff_pct = (goal_prob - np.asarray(alt_prob, dtype=np.float64)) * 100.0
+
+    tg = config["goal_thresholds"]
+    td = config["diff_thresholds"]
+    score = np.where(goal_pct >= tg["high"], 2, np.where(goal_pct >= tg["mid"], 1, np.where(goal_pct <= tg["low"], -1, 0)))
+    score = score + np.where(diff_pct >= td["high"], 2, np.where(diff_pct >= td["mid"], 1, 0))
+
+    stars = np.select([score >= 4, score >= 3, score >= 1, score >= -1], [5, 4, 3, 2], default=1)
+    early_boost = (np.asarray(sample_n) < early_spins) & (goal_pct > early_boost_pct)
+    return np.where(early_boost, 5, stars)
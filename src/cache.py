@@ -0,0 +1,101 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from .constants import SETTING_KEYS, RESULT_CACHE_CONFIG
+from .logic import normalize
+
+def prior_signature(priors: Dict[str, float], keys: Optional[List[str]] = None) -> Tuple[float, ...]:
+    """事前確率をキャッシュキー用のタプルに変換（正規化・丸め済み。keys は設定の並び）"""
+    keys = SETTING_KEYS if keys is None else keys
+    priors = normalize(priors, keys)
+    return tuple(round(priors[key], 12) for key in keys)
+
+def estimate_size(obj: Any) -> int:
+    """辞書・リスト・文字列からなる結果のおおよそのメモリ使用量（バイト）"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(estimate_size(v) for v in obj)
+    return size
+
+class ResultCache:
+    """
+    プロセス全体で共有する LRU キャッシュ
+    件数とおおよそのバイト数の両方に上限を設け、超えたら古いものから破棄する。
+    Streamlit は各セッションを別スレッドで実行するためロックで保護する。
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """キャッシュにあれば返し、なければ compute() の結果を登録して返す"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """登録済みの結果と、ヒット率などの統計をすべて破棄"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """ヒット率などの統計情報"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+_RESULT_CACHE = ResultCache(**RESULT_CACHE_CONFIG)
+
+def get_result_cache() -> ResultCache:
+    """全セッション共通の結果キャッシュを取得"""
+    return _RESULT_CACHE
@@ -0,0 +1,292 @@
+"""
+GOAL_CONFIG の閾値を検証するモンテカルロ・シミュレーション
+
+真の設定ごとに回転数 n のセッションを大量に生成し、事後確率と星の判定が
+どの程度「当たっている」か（星ごとの的中率）を n 別に集計する。
+★3〜5 は真の設定が goal グループ、★1〜2 は alt グループに含まれるときを的中とする。
+事後確率は (n, k) だけで決まるため、生成した k を回数に集約してから判定し、
+数百万セッションでも計算量は n の種類 × k の種類で済む。
+
+実行方法:
+    python -m src.calibration --sessions 200000 --seed 0
+    python -m src.calibration --search --target 5=0.9 --target 4=0.8 --json
+"""
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .constants import SETTING_KEYS, GOAL_CONFIG, GOAL_GROUPS, SAMPLE_BANDS, EARLY_BOOST_PCT
+from .batch import SETTING_PROBS, compute_posteriors_batch, evaluate_stars_batch
+
+DEFAULT_N_GRID: List[int] = list(range(100, 1000, 100)) + list(range(1000, 8001, 500))
+
+STAR_LEVELS = [1, 2, 3, 4, 5]
+
+# 低設定側の判定とみなし、alt グループに含まれるときを的中とする星
+ALT_STARS = [1, 2]
+
+# 序盤の星5の底上げ（SAMPLE_BANDS["early"] 未満で期待度が EARLY_BOOST_PCT を超えたら星5）の探索範囲
+# early_spins = 0 は底上げをしない
+DEFAULT_EARLY_GRID: Dict[str, List[float]] = {
+    "early_spins": [0, 250, 500, 750, 1000, 1500, 2000],
+    "early_boost_pct": [80.0, 85.0, 90.0, 95.0, 99.0],
+}
+
+def _simulate_setting(p: float, n_grid: List[int], sessions: int, seed: np.random.SeedSequence) -> List[np.ndarray]:
+    """1つの設定について、各 n の小役回数 k の出現回数を返す"""
+    rng = np.random.default_rng(seed)
+    return [np.bincount(rng.binomial(n, p, size=sessions), minlength=n + 1) for n in n_grid]
+
+def simulate(
+    n_grid: Optional[List[int]] = None,
+    sessions: int = 100_000,
+    seed: int = 0,
+    workers: int = 0,
+) -> Dict[str, Any]:
+    """
+    真の設定 × n ごとに sessions 回のセッションを生成する
+    戻り値の counts[i][s] は n_grid[i] における設定 s の k 別出現回数。
+    乱数は設定ごとに SeedSequence から分岐させるため、workers の数によらず同じ結果になる。
+    """
+    n_grid = list(n_grid or DEFAULT_N_GRID)
+    seeds = np.random.SeedSequence(seed).spawn(len(SETTING_KEYS))
+    tasks = [(float(p), n_grid, sessions, s) for p, s in zip(SETTING_PROBS, seeds)]
+
+    if workers > 0:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            per_setting = list(pool.map(_simulate_setting, *zip(*tasks)))
+    else:
+        per_setting = [_simulate_setting(*task) for task in tasks]
+
+    counts = [np.stack([per_setting[s][i] for s in range(len(SETTING_KEYS))]) for i in range(len(n_grid))]
+    return {"n_grid": n_grid, "sessions": sessions, "seed": seed, "counts": counts}
+
+def _goal_probabilities(n: int, k: np.ndarray, goal_code: str, priors: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """回転数 n・小役回数 k について goal / alt グループの事後確率を求める"""
+    posteriors = compute_posteriors_batch(np.full(len(k), n), k, priors)
+    group = GOAL_GROUPS[goal_code]
+    goal_idx = [SETTING_KEYS.index(key) for key in group["goal"]]
+    alt_idx = [SETTING_KEYS.index(key) for key in group["alt"]]
+    return posteriors[:, goal_idx].sum(axis=1), posteriors[:, alt_idx].sum(axis=1)
+
+def prepare(sim: Dict[str, Any], goal_code: str, priors: Optional[Dict[str, float]] = None, true_prior: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    閾値に依存しない部分（事後確率と、正解かどうかの重み）を前計算する
+    一度も出現しなかった (n, k) は除き、全 n を1本の配列に連結して星の判定を1回で済ませる。
+    true_prior はシミュレーション上の真の設定の分布（省略時は一様）。
+    """
+    if priors is None:
+        priors = {key: 1.0 / len(SETTING_KEYS) for key in SETTING_KEYS}
+    if true_prior is None:
+        true_prior = priors
+    total_prior = sum(true_prior.get(key, 0.0) for key in SETTING_KEYS)
+    setting_weight = np.array([true_prior.get(key, 0.0) / total_prior for key in SETTING_KEYS])
+    is_goal = np.array([key in GOAL_GROUPS[goal_code]["goal"] for key in SETTING_KEYS])
+
+    parts: Dict[str, List[np.ndarray]] = {name: [] for name in ("n_index", "n", "goal_prob", "alt_prob", "weight_all", "weight_goal")}
+    for i, (n, counts) in enumerate(zip(sim["n_grid"], sim["counts"])):
+        weights = counts * setting_weight[:, None] / sim["sessions"]
+        weight_all = weights.sum(axis=0)
+        observed = np.nonzero(weight_all)[0]
+        goal_prob, alt_prob = _goal_probabilities(n, observed, goal_code, priors)
+        parts["n_index"].append(np.full(len(observed), i))
+        parts["n"].append(np.full(len(observed), n))
+        parts["goal_prob"].append(goal_prob)
+        parts["alt_prob"].append(alt_prob)
+        parts["weight_all"].append(weight_all[observed])
+        parts["weight_goal"].append(weights[is_goal].sum(axis=0)[observed])
+
+    prepared: Dict[str, Any] = {name: np.concatenate(values) for name, values in parts.items()}
+    prepared["n_grid"] = list(sim["n_grid"])
+    return prepared
+
+def subset(prepared: Dict[str, Any], min_n: int) -> Dict[str, Any]:
+    """min_n 以上の回転数だけを取り出す"""
+    n_grid = [n for n in prepared["n_grid"] if n >= min_n]
+    keep_index = [i for i, n in enumerate(prepared["n_grid"]) if n >= min_n]
+    mask = np.isin(prepared["n_index"], keep_index)
+    remap = np.zeros(len(prepared["n_grid"]), dtype=np.int64)
+    remap[keep_index] = np.arange(len(keep_index))
+    result = {name: value[mask] for name, value in prepared.items() if name != "n_grid"}
+    result["n_index"] = remap[result["n_index"]]
+    result["n_grid"] = n_grid
+    return result
+
+def _star_tables(
+    prepared: Dict[str, Any],
+    goal_code: str,
+    config: Optional[Dict[str, Any]] = None,
+    early_spins: Optional[int] = None,
+    early_boost_pct: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(n × 星) の出現割合と、そのうち的中した割合（★1〜2 は alt、それ以外は goal グループが正解）"""
+    stars = evaluate_stars_batch(goal_code, prepared["goal_prob"], prepared["alt_prob"], prepared["n"], config, early_spins, early_boost_pct)
+    index = prepared["n_index"] * 6 + stars
+    size = len(prepared["n_grid"]) * 6
+    share = np.bincount(index, weights=prepared["weight_all"], minlength=size).reshape(-1, 6)
+    hit = np.bincount(index, weights=prepared["weight_goal"], minlength=size).reshape(-1, 6)
+    # goal と alt は全設定を分けるので、alt が正解だった割合は残り
+    hit[:, ALT_STARS] = np.maximum(share[:, ALT_STARS] - hit[:, ALT_STARS], 0.0)
+    return share, hit
+
+def _meets_targets(share: np.ndarray, hit: np.ndarray, target_stars: List[int], target_values: np.ndarray) -> np.ndarray:
+    """n ごとに、出現した目標対象の星がすべて目標的中率を満たしているか"""
+    share_t = share[:, target_stars]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        precision = hit[:, target_stars] / share_t
+    return ~np.any((share_t > 0) & (precision < target_values), axis=1)
+
+def star_accuracy(
+    prepared: Dict[str, Any],
+    goal_code: str,
+    config: Optional[Dict[str, Any]] = None,
+    early_spins: Optional[int] = None,
+    early_boost_pct: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    n ごと・星ごとに、その星が出る割合 (share) と、その星のときに判定が当たっている割合 (precision) を求める
+    precision は ★3〜5 なら真の設定が goal グループ、★1〜2 なら alt グループに含まれる割合。
+    """
+    share, hit = _star_tables(prepared, goal_code, config, early_spins, early_boost_pct)
+    report = []
+    for i, n in enumerate(prepared["n_grid"]):
+        levels = {}
+        for star in STAR_LEVELS:
+            levels[star] = {
+                "share": float(share[i, star]),
+                "precision": float(hit[i, star] / share[i, star]) if share[i, star] > 0 else None,
+            }
+        report.append({"n": n, "stars": levels})
+    return report
+
+def _candidate_configs(goal_code: str, grid: Optional[Dict[str, List[float]]] = None):
+    """探索する閾値の組み合わせ（high > mid を満たすもの）"""
+    base = GOAL_CONFIG[goal_code]
+    grid = grid or {
+        "goal_high": list(np.arange(60.0, 95.1, 2.5)),
+        "goal_mid": list(np.arange(40.0, 80.1, 2.5)),
+        "diff_high": list(np.arange(4.0, 40.1, 2.0)),
+        "diff_mid": list(np.arange(2.0, 20.1, 2.0)),
+    }
+    for gh, gm, dh, dm in itertools.product(grid["goal_high"], grid["goal_mid"], grid["diff_high"], grid["diff_mid"]):
+        if gm >= gh or dm >= dh:
+            continue
+        yield {
+            **base,
+            "goal_thresholds": {**base["goal_thresholds"], "high": float(gh), "mid": float(gm)},
+            "diff_thresholds": {"high": float(dh), "mid": float(dm)},
+        }
+
+def search_thresholds(
+    prepared: Dict[str, Any],
+    goal_code: str,
+    targets: Dict[int, float],
+    grid: Optional[Dict[str, List[float]]] = None,
+    min_n: int = 0,
+    early_grid: Optional[Dict[str, List[float]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    星ごとの目標的中率 targets（例: {5: 0.9, 4: 0.8}）を min_n 以上のすべての n で満たし、
+    その中で目標対象の星が出る割合（カバー率）が最大になる閾値を探す
+
+    探索は2段階で、まず現在の序盤の底上げのまま goal / diff の閾値を選び、その閾値のもとで
+    序盤の底上げ（early_spins = SAMPLE_BANDS["early"] と early_boost_pct）を early_grid から選ぶ。
+    最後に、選んだ設定で全 n のうち「その回転数以降はすべて目標を満たす」最小の回転数を
+    min_sample_warn（これ未満はサンプル不足と表示）の推奨値として返す（満たさなければ None）。
+    min_sample_good は判定・表示のどこにも使われていないため探索しない。
+    """
+    if any(star not in STAR_LEVELS for star in targets):
+        raise ValueError(f"targets の星は {STAR_LEVELS} のいずれかを指定してください")
+    items = subset(prepared, min_n) if min_n > 0 else prepared
+    target_stars = sorted(targets)
+    target_values = np.array([targets[star] for star in target_stars])
+
+    def evaluate(config, early_spins, early_boost_pct) -> Optional[float]:
+        share, hit = _star_tables(items, goal_code, config, early_spins, early_boost_pct)
+        if not _meets_targets(share, hit, target_stars, target_values).all():
+            return None
+        return float(share[:, target_stars].sum() / max(len(items["n_grid"]), 1))
+
+    best = None
+    for config in _candidate_configs(goal_code, grid):
+        coverage = evaluate(config, None, None)
+        if coverage is not None and (best is None or coverage > best["coverage"]):
+            best = {"config": config, "coverage": coverage, "early_spins": SAMPLE_BANDS["early"], "early_boost_pct": EARLY_BOOST_PCT}
+    if best is None:
+        return None
+
+    early_grid = early_grid or DEFAULT_EARLY_GRID
+    for early_spins, early_boost_pct in itertools.product(early_grid["early_spins"], early_grid["early_boost_pct"]):
+        coverage = evaluate(best["config"], int(early_spins), float(early_boost_pct))
+        if coverage is not None and coverage > best["coverage"]:
+            best.update(coverage=coverage, early_spins=int(early_spins), early_boost_pct=float(early_boost_pct))
+
+    share, hit = _star_tables(prepared, goal_code, best["config"], best["early_spins"], best["early_boost_pct"])
+    ok = _meets_targets(share, hit, target_stars, target_values)
+    # 末尾から見て、連続して目標を満たしている区間の先頭
+    tail = len(ok) - int(np.argmin(ok[::-1])) if not ok.all() else 0
+    best["min_sample_warn"] = prepared["n_grid"][tail] if tail < len(ok) else None
+    return best
+
+def _format_report(report: List[Dict[str, Any]]) -> str:
+    lines = ["n\t" + "\t".join(f"★{s} share/prec" for s in STAR_LEVELS)]
+    for row in report:
+        cells = []
+        for star in STAR_LEVELS:
+            level = row["stars"][star]
+            prec = "-" if level["precision"] is None else f"{level['precision'] * 100:.1f}%"
+            cells.append(f"{level['share'] * 100:.1f}%/{prec}")
+        lines.append(f"{row['n']}\t" + "\t".join(cells))
+    return "\n".join(lines)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="GOAL_CONFIG の閾値をモンテカルロ・シミュレーションで検証")
+    parser.add_argument("--goal", choices=list(GOAL_GROUPS), default="456")
+    parser.add_argument("--sessions", type=int, default=100_000, help="真の設定 × n ごとのセッション数")
+    parser.add_argument("--n-grid", type=str, default=None, help="カンマ区切りの回転数 (例: 500,1000,3000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0, help="プロセス数 (0: 並列化しない, -1: CPU数)")
+    parser.add_argument("--search", action="store_true", help="目標的中率を満たす閾値を探索")
+    parser.add_argument("--target", action="append", default=[], help="星=目標的中率 (例: 5=0.9, 1=0.8)。★1〜2 は低設定側の的中率。複数指定可")
+    parser.add_argument("--min-n", type=int, default=0, help="探索で目標を課す最小の回転数")
+    parser.add_argument("--json", action="store_true", help="JSON で出力")
+    args = parser.parse_args(argv)
+
+    n_grid = [int(x) for x in args.n_grid.split(",")] if args.n_grid else None
+    workers = (os.cpu_count() or 1) if args.workers < 0 else args.workers
+    sim = simulate(n_grid, args.sessions, args.seed, workers)
+    prepared = prepare(sim, args.goal)
+    output: Dict[str, Any] = {
+        "goal": args.goal,
+        "sessions": args.sessions,
+        "seed": args.seed,
+        "report": star_accuracy(prepared, args.goal),
+    }
+
+    if args.search:
+        targets = {int(k): float(v) for k, v in (t.split("=") for t in args.target)} or {5: 0.9, 4: 0.8}
+        output["search"] = search_thresholds(prepared, args.goal, targets, min_n=args.min_n)
+
+    if args.json:
+        print(json.dumps(output, ensure_ascii=False, indent=2))
+        return
+    print(f"[{args.goal}] 真の設定 × n ごとに {args.sessions} セッション (seed={args.seed})")
+    print(_format_report(output["report"]))
+    if args.search:
+        found = output["search"]
+        if found is None:
+            print("目標を満たす閾値は見つかりませんでした")
+        else:
+            print(f"推奨閾値 (カバー率 {found['coverage'] * 100:.1f}%):")
+            print(f"  goal_thresholds = {found['config']['goal_thresholds']}")
+            print(f"  diff_thresholds = {found['config']['diff_thresholds']}")
+            print(f"  SAMPLE_BANDS['early'] = {found['early_spins']}, EARLY_BOOST_PCT = {found['early_boost_pct']}")
+            print(f"  min_sample_warn = {found['min_sample_warn']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+途中の設定変更の検出（ベイズ型オンライン変化点検出）
+
+二項モデルはセッション全体で設定が1つだと仮定しているが、日をまたいだデータや
+打ち直しのあった台では途中で設定が変わる。操作ログの (Δn, Δk) を順に読み、
+「直近の変化点から何回目の操作か」（ラン長）の事後分布を1操作ごとに更新する（Adams & MacKay の BOCPD）。
+
+- 各ランの設定は事前確率から選び直されるとし、ランの (N, K) から設定を周辺化した尤度で予測確率を求める
+- 変化の起こりやすさは回転数に比例し、操作の間隔が gap_seconds 以上空いた（日をまたいだ）ときは gap_hazard とする
+- 確率が prune_threshold 未満のラン長は捨て、多くても max_runs 個だけ残すため、
+  1操作あたりの計算量は履歴の長さによらず (max_runs × 設定数) で頭打ちになる
+
+小役回数だけの操作（回転数を入れてから小役回数を入れる）は直前の回転数の操作と1つの観測にまとめる。
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .constants import SETTING_KEYS, CHANGEPOINT_CONFIG
+from .batch import LOG_P, LOG_Q, prior_vector
+
+def _log_marginal(log_prior: np.ndarray, log_p: np.ndarray, log_q: np.ndarray, n: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """各ランの (N, K) の、設定を周辺化した対数尤度（二項係数を除く）"""
+    log_joint = log_prior + np.outer(k, log_p) + np.outer(n - k, log_q)
+    peak = log_joint.max(axis=1)
+    return peak + np.log(np.exp(log_joint - peak[:, None]).sum(axis=1))
+
+def _ready(pending: List[Any]) -> bool:
+    """保留中の操作が観測として確定できるか（回転数があり、小役回数が範囲内）"""
+    return pending[0] > 0 and 0 <= pending[1] <= pending[0]
+
+class ChangePointDetector:
+    """
+    ラン長の事後分布を保持する変化点検出器
+    ランごとに (N, K)・周辺尤度・開始時点（観測番号・累計回転数・時刻）を配列で持つ。
+    """
+
+    def __init__(self, priors: Optional[Dict[str, float]] = None, config: Optional[Dict[str, Any]] = None, spec=None):
+        self.keys: List[str] = SETTING_KEYS if spec is None else spec.keys
+        if priors is None:
+            priors = {key: 1.0 / len(self.keys) for key in self.keys}
+        self.config = {**CHANGEPOINT_CONFIG, **(config or {})}
+        if spec is None:
+            self._log_p, self._log_q = LOG_P, LOG_Q
+        else:
+            self._log_p, self._log_q = spec.arrays["log_p"], spec.arrays["log_q"]
+        with np.errstate(divide="ignore"):
+            self._log_prior = np.log(prior_vector(priors, self.keys))
+        self._log_spin_stay = math.log1p(-1.0 / self.config["spins_per_change"])
+        self._log_threshold = math.log(self.config["prune_threshold"])
+        self.observations = 0
+        self.total_spins = 0
+        self.total_hits = 0
+        self._last_ts: Optional[float] = None
+        # 観測にまとめる前の操作（回転数の操作と、それに続く小役回数の操作）
+        self._pending: Optional[List[float]] = None
+        # ラン長ごとの状態（最初は「先頭から変化なし」のランだけ）
+        self._log_w = np.zeros(1)
+        self._n = np.zeros(1)
+        self._k = np.zeros(1)
+        self._log_m = np.zeros(1)
+        self._start = np.zeros(1, dtype=np.int64)
+        self._start_spins = np.zeros(1, dtype=np.int64)
+        self._start_ts = np.full(1, np.nan)
+
+    # --- 更新 ---
+    def update(self, delta_spins: int, delta_hits: int, ts: Optional[float] = None) -> bool:
+        """
+        操作1件を反映する。戻り値 False は反映できない取り消し（観測済みの分の減算）で、
+        呼び出し元は履歴から作り直す（detect_changepoints）
+        """
+        if delta_spins == 0 and delta_hits == 0:
+            return True
+        pending = self._pending
+        if pending is not None and (delta_spins <= 0 or delta_hits < 0 or not _ready(pending)):
+            # 直前の操作の続き（小役回数の入力・入力直後の訂正・小役回数が回転数を上回ったままの入力）
+            pending[0] += delta_spins
+            pending[1] += delta_hits
+            return pending[0] >= 0 and pending[1] >= 0
+        if delta_spins < 0 or delta_hits < 0:
+            return False
+        self._commit()
+        self._pending = [delta_spins, delta_hits, ts]
+        return True
+
+    def _commit(self) -> None:
+        """保留中の操作を観測として確定する"""
+        pending = self._pending
+        if pending is None:
+            return
+        if _ready(pending):
+            self._step(pending[0], pending[1], pending[2])
+            self._pending = None
+        elif pending[0] <= 0 and pending[1] <= 0:
+            self._pending = None
+
+    def _hazard(self, n: int, ts: Optional[float]) -> float:
+        hazard = -math.expm1(n * self._log_spin_stay)
+        if ts is not None and self._last_ts is not None and ts - self._last_ts >= self.config["gap_seconds"]:
+            hazard = max(hazard, self.config["gap_hazard"])
+        return hazard
+
+    def _step(self, n: int, k: int, ts: Optional[float]) -> None:
+        """観測 (n, k) でラン長の事後分布を更新（ラン数 × 設定数の計算）"""
+        new_n = self._n + n
+        new_k = self._k + k
+        new_log_m = _log_marginal(self._log_prior, self._log_p, self._log_q, new_n, new_k)
+        grow = self._log_w + (new_log_m - self._log_m)
+        if self.observations == 0:
+            log_w, runs_n, runs_k, log_m = grow, new_n, new_k, new_log_m
+            start, start_spins, start_ts = self._start, self._start_spins, np.full(1, np.nan if ts is None else ts)
+        else:
+            hazard = self._hazard(n, ts)
+            fresh = _log_marginal(self._log_prior, self._log_p, self._log_q, np.array([float(n)]), np.array([float(k)]))
+            # 変化あり: これまでのどのラン長からでも（重みの合計は 1）、新しいランが今回の観測から始まる
+            changed = math.log(hazard) + fresh
+            log_w = np.concatenate((changed, grow + math.log1p(-hazard)))
+            runs_n = np.concatenate(([float(n)], new_n))
+            runs_k = np.concatenate(([float(k)], new_k))
+            log_m = np.concatenate((fresh, new_log_m))
+            start = np.concatenate(([self.observations], self._start))
+            start_spins = np.concatenate(([self.total_spins], self._start_spins))
+            start_ts = np.concatenate(([np.nan if ts is None else ts], self._start_ts))
+
+        log_w = log_w - log_w.max()
+        log_w -= math.log(np.exp(log_w).sum())
+        keep = log_w >= self._log_threshold
+        if keep.sum() > self.config["max_runs"]:
+            keep = np.zeros(len(log_w), dtype=bool)
+            keep[np.argpartition(-log_w, self.config["max_runs"] - 1)[:self.config["max_runs"]]] = True
+        if not keep.all():
+            log_w = log_w[keep]
+            log_w -= math.log(np.exp(log_w).sum())
+
+        self._log_w = log_w
+        self._n, self._k, self._log_m = runs_n[keep], runs_k[keep], log_m[keep]
+        self._start, self._start_spins, self._start_ts = start[keep], start_spins[keep], start_ts[keep]
+        self.observations += 1
+        self.total_spins += n
+        self.total_hits += k
+        if ts is not None:
+            self._last_ts = ts
+
+    # --- 結果 ---
+    def summary(self) -> Dict[str, Any]:
+        """
+        最も確からしい変化点と、その後の区間の事後確率
+        保留中の操作は確定させずに、その分を加えたコピーで求める。
+        """
+        detector = self
+        if self._pending is not None and _ready(self._pending):
+            detector = self._copy()
+            detector._commit()
+
+        weights = np.exp(detector._log_w)
+        from_start = detector._start == 0
+        change_prob = float(1.0 - weights[from_start].sum())
+        log_post = detector._log_prior + np.outer(detector._k, detector._log_p) + np.outer(detector._n - detector._k, detector._log_q)
+        log_post -= log_post.max(axis=1, keepdims=True)
+        post = np.exp(log_post)
+        post /= post.sum(axis=1, keepdims=True)
+
+        # 変化ありの確率が半分を超えたら、変化ありのラン長のうち最も確からしいものを変化点とする
+        change_at = None
+        if change_prob >= 0.5:
+            best = int(np.argmax(np.where(from_start, -1.0, weights)))
+            change_at = {
+                "observation": int(detector._start[best]),
+                "spins": int(detector._start_spins[best]),
+                "ts": None if np.isnan(detector._start_ts[best]) else float(detector._start_ts[best]),
+                "prob": float(weights[best]),
+            }
+        else:
+            best = int(np.argmax(np.where(from_start, weights, -1.0)))
+        return {
+            "observations": detector.observations,
+            "total_spins": detector.total_spins,
+            "total_hits": detector.total_hits,
+            "runs": len(weights),
+            # 先頭から設定が変わっていない確率の残り（先頭からのランが捨てられていれば 1）
+            "change_prob": change_prob,
+            "change_at": change_at,
+            # 変化点以降（変化なしなら全体）の区間
+            "segment": {
+                "n": int(detector._n[best]),
+                "k": int(detector._k[best]),
+                "posteriors": dict(zip(detector.keys, post[best].tolist())),
+            },
+            # ラン長で平均した、今の設定の事後確率
+            "current": dict(zip(detector.keys, (weights @ post).tolist())),
+        }
+
+    def _copy(self) -> "ChangePointDetector":
+        clone = object.__new__(ChangePointDetector)
+        clone.__dict__.update(self.__dict__)
+        clone._pending = None if self._pending is None else list(self._pending)
+        return clone
+
+def net_events(history: Sequence[Dict[str, Any]]) -> List[Tuple[int, int, Optional[float]]]:
+    """
+    操作履歴から取り消し（負の増減）を打ち消した操作の列を作る
+    負の増減は新しい操作から順に差し引く（入力欄で値を戻した場合に相当）。
+    """
+    events: List[List[Any]] = []
+    for event in history:
+        delta_spins, delta_hits = event["delta_spins"], event["delta_hits"]
+        if delta_spins >= 0 and delta_hits >= 0:
+            events.append([delta_spins, delta_hits, event.get("ts")])
+            continue
+        events.append([max(delta_spins, 0), max(delta_hits, 0), event.get("ts")])
+        for index, remove in ((0, -min(delta_spins, 0)), (1, -min(delta_hits, 0))):
+            for past in reversed(events):
+                if remove <= 0:
+                    break
+                taken = min(past[index], remove)
+                past[index] -= taken
+                remove -= taken
+    return [(n, k, ts) for n, k, ts in events if n or k]
+
+def detect_changepoints(
+    history: Sequence[Dict[str, Any]],
+    priors: Optional[Dict[str, float]] = None,
+    config: Optional[Dict[str, Any]] = None,
+    spec=None,
+) -> ChangePointDetector:
+    """操作履歴（EventStore.history の形式）をまとめて読み込んだ検出器"""
+    detector = ChangePointDetector(priors, config, spec)
+    for delta_spins, delta_hits, ts in net_events(history):
+        detector.update(delta_spins, delta_hits, ts)
+    return detector
@@ -0,0 +1,176 @@
+"""
+コマンドラインでの判別（Streamlit 不要）
+
+constants / logic / state（--machine を指定したときは specs も）だけを読み込むため起動が速く、
+シェルスクリプトや bot から何度も呼び出せる。NumPy は行数の多いファイルを渡したときだけ読み込み、
+入っていなければ純 Python の計算で同じ結果を返す。
+
+実行方法:
+    python -m src.cli 1000 40
+    python -m src.cli 1000 40 --json
+    python -m src.cli 1000 40 --machine monkey_turn_v   # specs/ に登録した機種
+    python -m src.cli --file data.csv --json     # 1行に「n k」「n,k」「台番号,n,k」
+    cat data.txt | python -m src.cli --file -
+"""
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .constants import SETTINGS, SETTING_KEYS, GOAL_GROUPS
+from .logic import evaluate_goal, calculate_ci_range_pct, group_probability, format_percent, format_denominator
+from .state import PosteriorState
+
+# この行数以上なら NumPy の一括計算を使う（NumPy の読み込み時間を取り返せる目安）
+NUMPY_MIN_ROWS = 2000
+
+Row = Tuple[Optional[str], int, int]
+
+def summarize(n: int, k: int, posteriors: Dict[str, float], spec=None) -> Dict[str, Any]:
+    """
+    事後確率から、456/56 の期待度・星・コメントをまとめた JSON 化できる辞書を作る
+    spec（src.specs.MachineSpec）を渡すとその機種の期待度・閾値で評価する（省略時は constants の機種）。
+    """
+    result: Dict[str, Any] = {
+        "n": n,
+        "k": k,
+        "hit_prob": k / n,
+        "posteriors": posteriors,
+        "top_setting": max(posteriors, key=posteriors.get),
+    }
+    ci_range_pct = calculate_ci_range_pct(n, k)
+    for code, group in (GOAL_GROUPS if spec is None else spec.goal_groups).items():
+        goal_prob = group_probability(posteriors, group["goal"])
+        alt_prob = group_probability(posteriors, group["alt"])
+        if spec is None:
+            evaluation = evaluate_goal(code, goal_prob, alt_prob, n, ci_range_pct)
+        else:
+            evaluation = evaluate_goal(
+                code, goal_prob, alt_prob, n, ci_range_pct,
+                config=spec.goal_config[code], sample_bands=spec.sample_bands, early_boost_pct=spec.early_boost_pct,
+            )
+        result[code] = {
+            "prob": goal_prob,
+            "stars": evaluation["stars"],
+            "comment": evaluation["comment"],
+            "insufficient": evaluation["insufficient"],
+        }
+    return result
+
+def evaluate(n: int, k: int, priors: Optional[Dict[str, float]] = None, spec=None) -> Dict[str, Any]:
+    """1件の (n, k) を判別"""
+    if n <= 0 or k < 0 or k > n:
+        raise ValueError(f"回転数・小役回数が不正です (n={n}, k={k})")
+    return summarize(n, k, PosteriorState(priors, n, k, spec=spec).posteriors(), spec)
+
+def _posteriors_numpy(rows: List[Row], priors: Dict[str, float], spec=None) -> Optional[List[Dict[str, float]]]:
+    try:
+        from .batch import compute_posteriors_batch, posteriors_to_dicts
+    except ImportError:
+        return None
+    matrix = compute_posteriors_batch([row[1] for row in rows], [row[2] for row in rows], priors, spec)
+    return posteriors_to_dicts(matrix, None if spec is None else spec.keys)
+
+def evaluate_rows(rows: List[Row], priors: Optional[Dict[str, float]] = None, spec=None) -> Iterator[Dict[str, Any]]:
+    """複数行を判別（不正な行は error を返す）。行数が多く NumPy があれば一括計算する"""
+    keys = SETTING_KEYS if spec is None else spec.keys
+    if priors is None:
+        priors = {key: 1.0 / len(keys) for key in keys}
+    batch = _posteriors_numpy(rows, priors, spec) if len(rows) >= NUMPY_MIN_ROWS else None
+    for i, (label, n, k) in enumerate(rows):
+        if n <= 0 or k < 0 or k > n:
+            result: Dict[str, Any] = {"n": n, "k": k, "error": "回転数・小役回数が不正です"}
+        elif batch is not None:
+            result = summarize(n, k, batch[i], spec)
+        else:
+            result = summarize(n, k, PosteriorState(priors, n, k, spec=spec).posteriors(), spec)
+        if label is not None:
+            result = {"label": label, **result}
+        yield result
+
+def parse_rows(lines: Iterable[str]) -> List[Row]:
+    """「n k」「n,k」「ラベル,n,k」形式の行を読む（数値でない行は見出しとして読み飛ばす）"""
+    rows: List[Row] = []
+    for line in lines:
+        fields = line.replace("\t", ",").replace(" ", ",").strip().split(",")
+        fields = [f for f in fields if f]
+        if len(fields) < 2:
+            continue
+        label = fields[0] if len(fields) >= 3 else None
+        try:
+            n, k = int(fields[-2]), int(fields[-1])
+        except ValueError:
+            continue
+        rows.append((label, n, k))
+    return rows
+
+def format_text(result: Dict[str, Any], spec=None) -> str:
+    """人が読む用の表示"""
+    goal_codes = list(GOAL_GROUPS) if spec is None else spec.goal_codes
+    keys = SETTING_KEYS if spec is None else spec.keys
+    probs = SETTINGS if spec is None else spec.probs
+    head = f"{result['label']}: " if "label" in result else ""
+    if "error" in result:
+        return f"{head}{result['n']}G / {result['k']}回: {result['error']}"
+    lines = [f"{head}{result['n']}G / {result['k']}回 ({format_denominator(result['hit_prob'])})"]
+    for code in goal_codes:
+        goal = result[code]
+        stars = "★" * goal["stars"] + "☆" * (5 - goal["stars"])
+        lines.append(f"  {code}期待度 {format_percent(goal['prob']):>6s} {stars} {goal['comment']}")
+    lines.append("  " + " ".join(f"設定{key}:{format_percent(result['posteriors'][key])}" for key in keys))
+    lines.append(f"  最も近い設定: 設定{result['top_setting']} (1/{1.0 / probs[result['top_setting']]:.2f})")
+    return "\n".join(lines)
+
+def _parse_priors(text: str, keys: List[str] = SETTING_KEYS) -> Dict[str, float]:
+    values = [float(v) for v in text.split(",")]
+    if len(values) != len(keys) or any(v < 0 for v in values) or sum(values) <= 0:
+        raise ValueError(f"事前確率は {len(keys)} 個の非負の数をカンマ区切りで指定してください")
+    return dict(zip(keys, values))
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="モンキーターンV 設定判別（コマンドライン版）")
+    parser.add_argument("n", nargs="?", type=int, help="総回転数")
+    parser.add_argument("k", nargs="?", type=int, help="5枚役回数")
+    parser.add_argument("--file", help="(n, k) を1行ずつ書いたファイル（- で標準入力）")
+    parser.add_argument("--priors", help="設定ごとの事前確率（設定の順にカンマ区切り、合計は自動で1に正規化）")
+    parser.add_argument("--machine", help="機種 ID（specs/index.json に登録した機種。省略時はモンキーターンV）")
+    parser.add_argument("--json", action="store_true", help="JSON で出力（--file の場合は1行1件）")
+    args = parser.parse_args(argv)
+
+    spec = None
+    if args.machine:
+        from .specs import MACHINE_ALIASES, get_spec, list_machines
+        machines = dict(list_machines())
+        if args.machine not in machines and args.machine not in MACHINE_ALIASES:
+            parser.error(f"機種 {args.machine} は登録されていません（{', '.join(machines)}）")
+        spec = get_spec(args.machine)
+    try:
+        priors = _parse_priors(args.priors, SETTING_KEYS if spec is None else spec.keys) if args.priors else None
+    except ValueError as e:
+        parser.error(str(e))
+    if args.json:
+        import json
+
+    if args.file:
+        if args.file == "-":
+            rows = parse_rows(sys.stdin)
+        else:
+            with open(args.file, encoding="utf-8-sig") as f:
+                rows = parse_rows(f)
+        write = sys.stdout.write
+        for result in evaluate_rows(rows, priors, spec):
+            write((json.dumps(result, ensure_ascii=False) if args.json else format_text(result, spec)) + "\n")
+        return 0
+
+    if args.n is None or args.k is None:
+        parser.error("n と k、または --file を指定してください")
+    try:
+        result = evaluate(args.n, args.k, priors, spec)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(json.dumps(result, ensure_ascii=False, indent=2) if args.json else format_text(result, spec))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
+import datetime
+
 import streamlit as st
-from typing import Dict, Any
-from .constants import SETTING_KEYS, SETTINGS
-from .logic import format_percent, format_denominator
+from typing import Dict, Any, List, Optional, Sequence
+from .constants import GOAL_GROUPS
+from .logic import format_percent, format_denominator, group_probability
+from .metrics import timed
 
 def render_copy_button(text: str, label: str = "結果をコピーしてシェア"):
     """コピー用テキストを表示（Streamlitネイティブ機能）"""
@@ -9,9 +12,9 @@ def render_copy_button(text: str, label: str = "結果をコピーしてシェ
         st.code(text, language=None)
         st.caption("👆 上のテキストをタップ/長押しして選択し、コピーしてください")
 
-def render_mobile_header():
+def render_mobile_header(title: str = "モンキーターンV"):
     """スマホ向けのコンパクトなヘッダー"""
-    st.markdown("<h1>🚤 モンキーターンV 判別</h1>", unsafe_allow_html=True)
+    st.markdown(f"<h1>🚤 {title} 判別</h1>", unsafe_allow_html=True)
 
 def render_star_rating(stars: int) -> str:
     """星のHTML生成"""
@@ -24,31 +27,40 @@ def render_star_rating(stars: int) -> str:
     html += '</span>'
     return html
 
-def render_mobile_result_card(
+@timed("html.result_card")
+def build_result_card_html(
     title: str, 
     value_text: str, 
     sub_text: str, 
     stars: int = 0, 
     comment: str = None,
     is_highlight: bool = False
-):
-    """スマホで見やすい結果カード"""
+) -> str:
+    """結果カードのHTML生成"""
     star_html = render_star_rating(stars) if stars > 0 else ""
     highlight_class = "high" if is_highlight else "low"
     
     # HTMLを1行にまとめてMarkdown解釈を回避
     advice_html = f'<div class="advice-box {highlight_class}">{comment}</div>' if comment else ''
-    html = f'<div class="info-card"><div class="result-card-header"><span>{title}</span>{star_html}</div><div class="result-card-value">{value_text}</div><div class="result-card-sub">{sub_text}</div>{advice_html}</div>'
-    
+    return f'<div class="info-card"><div class="result-card-header"><span>{title}</span>{star_html}</div><div class="result-card-value">{value_text}</div><div class="result-card-sub">{sub_text}</div>{advice_html}</div>'
+
+def render_mobile_result_card(
+    title: str, 
+    value_text: str, 
+    sub_text: str, 
+    stars: int = 0, 
+    comment: str = None,
+    is_highlight: bool = False
+):
+    """スマホで見やすい結果カード"""
+    html = build_result_card_html(title, value_text, sub_text, stars, comment, is_highlight)
     st.markdown(html, unsafe_allow_html=True)
 
-def render_probability_bars_mobile(posteriors: Dict[str, float]):
-    """スマホ向けの確率バー表示"""
-    st.markdown("#### 設定期待度")
-    
+@timed("html.probability_bars")
+def build_probability_bars_html(posteriors: Dict[str, float]) -> str:
+    """確率バーのHTML生成（posteriors の設定の順に並べる）"""
     html_content = ""
-    for key in SETTING_KEYS:
-        prob = posteriors[key]
+    for key, prob in posteriors.items():
         pct = prob * 100
         bar_class = f"bg-{key}"
         
@@ -62,8 +74,155 @@ def render_probability_bars_mobile(posteriors: Dict[str, float]):
             <div class="bar-value">{pct:.1f}%</div>
         </div>
         """
-    
-    st.markdown(html_content, unsafe_allow_html=True)
+    return html_content
+
+def render_probability_bars_mobile(posteriors: Dict[str, float]):
+    """スマホ向けの確率バー表示"""
+    st.markdown("#### 設定期待度")
+    st.markdown(build_probability_bars_html(posteriors), unsafe_allow_html=True)
+
+def render_ranking_table(ranking: List[Dict[str, Any]], goal_codes: Sequence[str] = ("456", "56"), indicator: str = "5枚役"):
+    """ホールデータ一括判別の順位表（期待度の列は goal_codes の順）"""
+    if not ranking:
+        st.caption("判別できる行がありませんでした")
+        return
+    rows = [
+        {
+            "順位": rank,
+            "台番号": row["machine"],
+            "回転数": row["n"],
+            indicator: row["k"],
+            "確率": format_denominator(row["k"] / row["n"]) if row["n"] > 0 else "-",
+            **{f"{code}期待度": format_percent(row[f"prob_{code}"]) for code in goal_codes},
+        }
+        for rank, row in enumerate(ranking, start=1)
+    ]
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+
+def render_spin_plan(plan: Dict[str, Any]):
+    """判別が付くまでの必要回転数の見積もり"""
+    goal = plan["goal_code"]
+    if plan["already_decided"]:
+        side = "到達" if plan["current_prob"] >= plan["upper"] else "撤退ライン"
+        st.caption(f"{goal}期待度 {format_percent(plan['current_prob'])} — すでに{side}です")
+        return
+    mixture = plan["mixture"]
+    median = mixture["median_spins"]
+    p90 = mixture["p90_spins"]
+    st.markdown(
+        f"{goal}期待度が **{format_percent(plan['upper'])}以上** か **{format_percent(plan['lower'])}以下** になるまで:\n\n"
+        f"- 50%の確率で あと **{median if median is not None else '-'}G** 以内\n"
+        f"- 90%の確率で あと **{p90 if p90 is not None else '-'}G** 以内\n"
+        f"- 上振れで決着 {format_percent(mixture['p_high'])} / 下振れで決着 {format_percent(mixture['p_low'])}"
+    )
+
+@timed("html.trajectory_chart")
+def build_trajectory_chart(records: List[Dict[str, Any]]):
+    """期待度・設定別の事後確率の推移グラフ（Altair）"""
+    import altair as alt
+    import pandas as pd
+
+    df = pd.DataFrame.from_records(records)
+    return (
+        alt.Chart(df)
+        .mark_line(interpolate="linear")
+        .encode(
+            x=alt.X("n:Q", title="総回転数 (G)"),
+            y=alt.Y("prob:Q", title="確率", axis=alt.Axis(format="%"), scale=alt.Scale(domain=[0, 1])),
+            color=alt.Color("series:N", title=None, sort=None),
+            strokeDash=alt.StrokeDash("kind:N", title=None, sort=["期待度", "設定別"]),
+            tooltip=[
+                alt.Tooltip("series:N", title="系列"),
+                alt.Tooltip("n:Q", title="回転数"),
+                alt.Tooltip("prob:Q", title="確率", format=".1%"),
+            ],
+        )
+        .properties(height=260)
+    )
+
+def render_posterior_trajectory(records: List[Dict[str, Any]]):
+    """事後確率の推移"""
+    if not records:
+        st.caption("まだ推移を描ける記録がありません")
+        return
+    st.altair_chart(build_trajectory_chart(records))
+
+@timed("html.whatif_chart")
+def build_whatif_chart(cells: List[Dict[str, Any]], lines: List[Dict[str, Any]]):
+    """(追加回転数, 追加小役回数) ごとの星のヒートマップと星3〜5の境界線（Altair）"""
+    import altair as alt
+    import pandas as pd
+
+    heatmap = (
+        alt.Chart(pd.DataFrame.from_records(cells))
+        .mark_rect()
+        .encode(
+            x=alt.X("spins_start:Q", title="追加回転数 (G)"),
+            x2="spins:Q",
+            y=alt.Y("hits:Q", title="追加の小役回数"),
+            y2="hits_end:Q",
+            color=alt.Color("stars:O", title="星", scale=alt.Scale(scheme="yelloworangered")),
+            tooltip=[
+                alt.Tooltip("spins:Q", title="追加回転数"),
+                alt.Tooltip("hits:Q", title="追加の小役回数"),
+                alt.Tooltip("stars:O", title="星"),
+                alt.Tooltip("prob:Q", title="期待度", format=".1%"),
+            ],
+        )
+    )
+    if not lines:
+        return heatmap.properties(height=260)
+    curve = (
+        alt.Chart(pd.DataFrame.from_records(lines))
+        .mark_line(color="#333")
+        .encode(
+            x="spins:Q",
+            y="hits:Q",
+            strokeDash=alt.StrokeDash("series:N", title=None),
+        )
+    )
+    return (heatmap + curve).properties(height=260)
+
+def render_whatif(answer: Optional[Dict[str, Any]], cells: List[Dict[str, Any]], lines: List[Dict[str, Any]], indicator: str = "5枚役"):
+    """目標に届くまでの必要な小役回数とヒートマップ"""
+    if answer is None:
+        st.caption("早見表の範囲外です")
+        return
+    target = f"★{answer['stars']}以上" if answer["stars"] is not None else f"{format_percent(answer['prob'])}以上"
+    if answer["more"] == 0:
+        st.markdown(f"{answer['goal_code']} {target}: 追加の{indicator}がなくても **{answer['spins']}G** 時点で届きます")
+    elif answer["reachable"]:
+        st.markdown(
+            f"{answer['goal_code']} {target}: **{answer['spins']}G** 時点で{indicator} **{answer['hits']}回**"
+            f"（あと **{answer['more']}回**、追加分の確率 {format_denominator(1.0 / answer['denominator'])}）"
+        )
+    else:
+        st.markdown(f"{answer['goal_code']} {target}: **{answer['spins']}G** までには届きません")
+    if cells:
+        st.altair_chart(build_whatif_chart(cells, lines))
+
+def render_changepoint(summary: Dict[str, Any], goal_groups: Optional[Dict[str, Dict[str, List[str]]]] = None):
+    """途中の設定変更の検出結果（goal_groups は機種の期待度のグループ。省略時は constants の値）"""
+    if summary["observations"] < 2:
+        st.caption("まだ判定できるほどの記録がありません")
+        return
+    segment = summary["segment"]
+    probs = " / ".join(
+        f"{code}期待度 {format_percent(group_probability(segment['posteriors'], group['goal']))}"
+        for code, group in (GOAL_GROUPS if goal_groups is None else goal_groups).items()
+    )
+    change_at = summary["change_at"]
+    if change_at is None:
+        st.caption(f"設定変更の可能性 {format_percent(summary['change_prob'])} — 全体を同じ設定として判別しています")
+        return
+    when = ""
+    if change_at["ts"] is not None:
+        when = f"（{datetime.datetime.fromtimestamp(change_at['ts']).strftime('%m/%d %H:%M')}ごろ）"
+    st.markdown(
+        f"**{change_at['spins']}G 目付近**{when}で設定が変わった可能性 **{format_percent(summary['change_prob'])}**\n\n"
+        f"- 変更後: {segment['k']}回 / {segment['n']}G\n"
+        f"- 変更後だけで見た {probs}"
+    )
 
 def render_input_buttons(current_val: int, step_vals: list, key_prefix: str) -> int:
     """クイック加算ボタン"""
@@ -76,3 +235,41 @@ def render_input_buttons(current_val: int, step_vals: list, key_prefix: str) ->
                 new_val += step
                 
     return new_val
+
+def render_metrics_panel(snapshot: Dict[str, List[Dict[str, Any]]], prometheus_text: str, profile_text: str = None, collapsed_stacks: str = None):
+    """計測結果のデバッグ欄（METRICS_ENABLED=1 のときだけ表示）"""
+    with st.expander("🛠 計測（デバッグ）", expanded=False):
+        histograms = [
+            {
+                "名前": row["name"],
+                "ラベル": ", ".join(f"{k}={v}" for k, v in row["labels"].items()),
+                "回数": row["count"],
+                "平均(ms)": round(row["mean_ms"], 3),
+                "p50(ms)": row["p50_ms"],
+                "p99(ms)": row["p99_ms"],
+                "最大(ms)": round(row["max_ms"], 3),
+                "合計(ms)": round(row["total_ms"], 1),
+            }
+            for row in snapshot["histograms"]
+        ]
+        if histograms:
+            st.caption("処理時間（p50 / p99 はヒストグラムの区切りの上端）")
+            st.dataframe(histograms, hide_index=True)
+        counters = [
+            {
+                "名前": row["name"],
+                "ラベル": ", ".join(f"{k}={v}" for k, v in row["labels"].items()),
+                "値": row["value"],
+            }
+            for row in snapshot["counters"]
+        ]
+        if counters:
+            st.dataframe(counters, hide_index=True)
+        if profile_text:
+            st.code(profile_text, language=None)
+        col_prom, col_stacks = st.columns(2)
+        with col_prom:
+            st.download_button("Prometheus 形式", prometheus_text, file_name="metrics.prom", mime="text/plain")
+        if collapsed_stacks:
+            with col_stacks:
+                st.download_button("スタック (collapsed)", collapsed_stacks, file_name="stacks.txt", mime="text/plain")
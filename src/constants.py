@@ -12,6 +12,12 @@ SETTINGS: Dict[str, float] = {
 
 SETTING_KEYS: List[str] = list(SETTINGS.keys())
 
+# 判別対象 (goal) と比較対象 (alt) の設定グループ
+GOAL_GROUPS: Dict[str, Dict[str, List[str]]] = {
+    "456": {"goal": ["4", "5", "6"], "alt": ["1", "2"]},
+    "56": {"goal": ["5", "6"], "alt": ["1", "2", "4"]},
+}
+
 # 信頼度判定のための閾値設定
 # 456: 設定4以上である確率
 # 56: 設定5以上である確率
@@ -45,3 +51,101 @@ GOAL_CONFIG = {
         },
     },
 }
+
+# evaluate_goal のサンプル数区分（序盤: early 未満 / 中盤 / 終盤: late 以上）
+SAMPLE_BANDS = {"early": 1000, "late": 3000}
+
+# 序盤でもこの期待度 (%) を超えたら星5とする
+EARLY_BOOST_PCT = 90.0
+
+# 計算結果キャッシュ（全セッション共有）の上限
+RESULT_CACHE_CONFIG = {
+    "max_entries": 4096,
+    "max_bytes": 32 * 1024 * 1024,
+}
+
+# 操作ログ（SQLite）の保存先と書き込み設定
+# path は環境変数 EVENT_STORE_PATH で上書きできる
+EVENT_STORE_CONFIG = {
+    "path": "data/events.sqlite3",
+    "batch_size": 512,          # 1トランザクションでまとめて書き込む最大件数
+    "flush_interval": 0.05,     # 書き込みを待ち合わせる最大秒数
+    "snapshot_interval": 500,   # この件数ごとに累計値のスナップショットを保存
+}
+
+# JSON 判別サービス (src/service.py) の設定
+SERVICE_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 8765,
+    "batch_window": 0.0,        # 混雑時に後続の要求を待ってまとめる秒数（0 は計算中に届いた分だけまとめる）
+    "max_batch": 256,           # 1回の一括計算に含める最大件数
+    "max_queue": 1024,          # 計算待ちの上限（超えたら 503 を返す）
+    "keep_alive_timeout": 15.0, # 接続を保持する無通信時間（秒）
+    "max_body": 64 * 1024,      # リクエスト本文の上限（バイト）
+    "max_headers": 100,         # ヘッダーの行数の上限（超えたら 431 を返す）
+    "header_timeout": 10.0,     # 要求行のあと、ヘッダーをすべて受け取るまでの待ち時間（秒。超えたら 408 を返す）
+    "body_timeout": 10.0,       # ヘッダーのあと、本文をすべて受け取るまでの待ち時間（秒。超えたら 408 を返す）
+    "max_spins": 10_000_000,    # 受け付ける回転数 n の上限（超えたら 400 を返す）
+}
+
+# カウンターコンポーネントに渡す 456/56 期待度の早見表 (src/grid.py)
+POSTERIOR_GRID_CONFIG = {
+    # 収録する回転数の刻み (この回転数まで, 刻み)。行の間は線形補間する。
+    # 序盤は1回転ごとに期待度が大きく動くため細かく刻む。最後の行を超えたら Python の計算結果だけを表示
+    "spin_steps": ((100, 1), (500, 10), (10000, 50)),
+    "levels": 255,              # 期待度の量子化段階（1バイト）
+}
+
+# ホール・曜日別の事前確率 (src/priors.py)
+# path は環境変数 PRIOR_CACHE_PATH で上書きできる
+PRIOR_FIT_CONFIG = {
+    "path": "data/priors.json",
+    "strength": 30.0,           # 上位（全体→ホール→曜日）の分布に寄せる強さ（擬似的な台数）
+    "max_iter": 500,            # EM の最大反復回数
+    "tol": 1e-6,                # 事前確率の変化がこれ未満になったら終了
+    "event_digits": (),         # 日付の末尾がこの数字の日を「特日」とする（例: (7,)。特日列があればそちらを優先）
+}
+
+# 設定変更の検出 (src/changepoint.py)
+CHANGEPOINT_CONFIG = {
+    "spins_per_change": 100000, # 設定変更の平均間隔（回転数）。1回転あたりの変更確率はこの逆数
+    "gap_seconds": 4 * 3600,    # 操作の間隔がこれ以上空いたら日をまたいだ（設定が打ち直された可能性がある）とみなす
+    "gap_hazard": 0.2,          # 日をまたいだときの変更確率
+    "prune_threshold": 1e-6,    # 確率がこれ未満のラン長（変更時点の候補）は捨てる
+    "max_runs": 128,            # 保持するラン長の上限（1操作あたりの計算量の上限）
+}
+
+# 機種ごとの判別仕様の登録簿 (src/specs.py)
+# dir は環境変数 MACHINE_SPEC_DIR で上書きできる
+MACHINE_SPEC_CONFIG = {
+    "dir": "specs",             # index.json と機種ごとの JSON の置き場所
+    "cache_size": 32,           # 前計算した仕様をプロセス内に保持する機種数
+}
+
+# 「あと何回引けば目標に届くか」の早見表 (src/whatif.py)
+WHATIF_CONFIG = {
+    "max_spins": 10000,         # 表に収める総回転数（0 からこの回転数まで1回転刻み）
+    "levels": 65535,            # 期待度の量子化段階（2バイト）
+    "cache_size": 8,            # プロセス内に保持する表の数（機種 × 事前確率）
+    "chart_columns": 40,        # ヒートマップの追加回転数方向のマス数
+    "chart_rows": 30,           # ヒートマップの追加小役回数方向のマス数
+}
+
+# カウンターコンポーネントの配信 (src/assets.py)。環境変数 COMPONENT_ASSET_SERVER=1 で有効
+COMPONENT_ASSET_CONFIG = {
+    "host": "0.0.0.0",
+    "port": 8766,
+    "max_age": 365 * 24 * 3600, # ハッシュ付きのファイルをブラウザに保持させる秒数
+    "gzip_level": 9,
+    "brotli_quality": 11,
+    "min_size": 512,            # これより小さいファイルは事前圧縮しない（バイト）
+}
+
+# 計測 (src/metrics.py)。環境変数 METRICS_ENABLED=1 で有効、PROFILE_MODE=cprofile / sample でプロファイルも取る
+METRICS_CONFIG = {
+    # 処理時間のヒストグラムの区切り（秒）
+    "buckets": (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    "file_interval": 5.0,       # METRICS_FILE に Prometheus 形式で書き出す最短間隔（秒）
+    "sample_interval": 0.005,   # PROFILE_MODE=sample のスタック採取間隔（秒）
+    "profile_top": 25,          # デバッグ欄に表示する関数の数
+}
@@ -0,0 +1,201 @@
+"""
+カウンターコンポーネント (swipe_counter_component / koyaku_counter_component) との同期
+
+コンポーネントは連打を短い間隔でまとめ、連番付きの操作列を送ってくる:
+
+    {"protocol": 1, "client": "<iframe ごとの ID>",
+     "ops": [{"seq": 3, "delta": 2}, {"seq": 4, "set": 0}, ...], ...}
+
+- delta は増減、set は絶対値（リセット・直接入力・localStorage からの復元）
+- Streamlit は最後に送られた値しか保持しないため、コンポーネントは Python から ack が
+  返るまでの操作を毎回すべて送り直す。途中の送信が上書きされてもカウントは失われない
+- Python 側は client ごとに適用済みの seq を覚え、それ以下の操作は読み飛ばす。
+  同じ値で再実行されても二重に数えない（冪等）
+
+spins（総回転数）を渡すと、期待度の早見表 (src/grid.py) もコンポーネントに渡す。
+コンポーネントはタップのたびに表を引いて 456/56 期待度をその場で表示し、
+同期後は Python が計算した値 (estimate) に置き換える。表は数十 KB あるため、
+コンポーネントが受け取り済みの識別子を送ってきたら (grid) 以降は識別子だけを渡す。
+
+コンポーネントは送信から ack を受け取るまでの時間を測り、次の送信に rtt_ms として載せる
+（METRICS_ENABLED=1 のとき mtv_component_rtt_seconds に記録）。
+
+COMPONENT_ASSET_SERVER=1 のときは、事前圧縮・長期キャッシュ付きの配信サーバー (src/assets.py) から
+コンポーネントを読み込ませる。
+"""
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from . import metrics
+from .assets import COMPONENT_DIRS, component_url
+
+# 連打をまとめる待ち時間（ミリ秒）。コンポーネントの既定値と同じ
+DEFAULT_BATCH_MS = 250
+
+# 適用済み seq を覚えておく client 数（再読み込みのたびに増えるため上限を設ける）
+MAX_CLIENTS = 8
+
+class CounterSync:
+    """
+    カウンターの値と client ごとの適用済み seq
+    st.session_state に置いて使う。size は数える項目の数（スワイプカウンターは1）。
+    """
+
+    def __init__(self, size: int = 1, values: Optional[List[int]] = None):
+        self.size = size
+        self.values = list(values) if values is not None else [0] * size
+        self._applied: "OrderedDict[str, int]" = OrderedDict()
+        self.last_client: Optional[str] = None
+        self.client_grid: Optional[str] = None
+        self.applied_ops = 0
+        self.stale_ops = 0
+
+    def _as_vector(self, raw: Any) -> List[int]:
+        items = raw if isinstance(raw, list) else [raw]
+        vector = [int(v) if isinstance(v, (int, float)) else 0 for v in items[:self.size]]
+        return vector + [0] * (self.size - len(vector))
+
+    def apply(self, message: Optional[Dict[str, Any]]) -> bool:
+        """
+        コンポーネントからの値を反映し、値が変わったら True を返す
+        適用済み（seq が古い）操作は読み飛ばすため、同じ値を何度渡してもよい。
+        """
+        if not isinstance(message, dict) or not isinstance(message.get("ops"), list):
+            return False
+        client = str(message.get("client", ""))
+        last_seq = self._applied.get(client, 0)
+        changed = False
+        for op in sorted((op for op in message["ops"] if isinstance(op, dict)), key=lambda op: op.get("seq", 0)):
+            try:
+                seq = int(op["seq"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if seq <= last_seq:
+                self.stale_ops += 1
+                continue
+            if "set" in op:
+                new_values = [max(0, v) for v in self._as_vector(op["set"])]
+            else:
+                delta = self._as_vector(op.get("delta", 0))
+                new_values = [max(0, v + d) for v, d in zip(self.values, delta)]
+            changed = changed or new_values != self.values
+            self.values = new_values
+            last_seq = seq
+            self.applied_ops += 1
+        self._applied[client] = last_seq
+        self._applied.move_to_end(client)
+        while len(self._applied) > MAX_CLIENTS:
+            self._applied.popitem(last=False)
+        self.last_client = client
+        self.client_grid = message.get("grid")
+        return changed
+
+    def ack(self) -> Optional[Dict[str, Any]]:
+        """コンポーネントに返す確認済みの位置（これ以下の操作は送り直さなくてよい）"""
+        if self.last_client is None:
+            return None
+        return {"client": self.last_client, "seq": self._applied.get(self.last_client, 0)}
+
+@lru_cache(maxsize=None)
+def _declare(name: str):
+    import streamlit.components.v1 as components
+    url = component_url(name)
+    if url is not None:
+        return components.declare_component(name, url=url)
+    return components.declare_component(name, path=COMPONENT_DIRS[name])
+
+def _apply(sync: CounterSync, message: Any, component: str) -> None:
+    """反映し、新しい操作があれば往復時間と件数を記録する"""
+    applied = sync.applied_ops
+    sync.apply(message)
+    if metrics.ENABLED and sync.applied_ops > applied:
+        metrics.inc("mtv_component_ops_total", sync.applied_ops - applied, component=component)
+        rtt_ms = message.get("rtt_ms")
+        if isinstance(rtt_ms, (int, float)) and rtt_ms >= 0:
+            metrics.observe("mtv_component_rtt_seconds", rtt_ms / 1000.0, component=component)
+
+def _sync_state(key: str, size: int, component: str, initial: Optional[List[int]] = None) -> CounterSync:
+    import streamlit as st
+    state_key = f"{key}__sync"
+    if state_key not in st.session_state:
+        st.session_state[state_key] = CounterSync(size, initial)
+    sync = st.session_state[state_key]
+    # コンポーネントの値は再実行前に session_state へ入っているので、先に反映してから
+    # 描画することで、ack と value を同じ再実行で最新にできる
+    _apply(sync, st.session_state.get(key), component)
+    return sync
+
+def _estimate_args(sync: CounterSync, spins: Optional[int], hits: int, priors: Optional[Dict[str, float]]) -> Dict[str, Any]:
+    """早見表と、現在の (spins, hits) に対する Python 側の期待度"""
+    if spins is None:
+        return {}
+    from .constants import GOAL_GROUPS
+    from .grid import GOAL_CODES, get_posterior_grid
+    from .logic import group_probability
+    from .state import PosteriorState
+
+    grid_id, blob = get_posterior_grid(priors)
+    estimate = None
+    state = PosteriorState(priors, spins, hits)
+    if state.is_valid:
+        posteriors = state.posteriors()
+        estimate = {"n": spins, "k": hits}
+        estimate.update({code: group_probability(posteriors, GOAL_GROUPS[code]["goal"]) for code in GOAL_CODES})
+    return {
+        "spins": spins,
+        "grid_id": grid_id,
+        "grid": None if sync.client_grid == grid_id else blob,
+        "estimate": estimate,
+    }
+
+def swipe_counter(
+    key: str,
+    label: str = "小役回数",
+    description: Optional[str] = None,
+    batch_ms: int = DEFAULT_BATCH_MS,
+    spins: Optional[int] = None,
+    priors: Optional[Dict[str, float]] = None,
+    value: int = 0,
+) -> int:
+    """
+    スワイプカウンターを表示し、反映済みの値を返す（spins を渡すと期待度も表示）
+    value は初めて表示するときの値。以降はカウンターの値（端末に保存した値を含む）が優先される。
+    """
+    sync = _sync_state(key, 1, "swipe_counter", [value])
+    message = _declare("swipe_counter")(
+        label=label,
+        description=description,
+        value=sync.values[0],
+        ack=sync.ack(),
+        batch_ms=batch_ms,
+        storage_key=f"swipe_counter_{key}",
+        key=key,
+        default=None,
+        **_estimate_args(sync, spins, sync.values[0], priors),
+    )
+    _apply(sync, message, "swipe_counter")
+    return sync.values[0]
+
+def koyaku_counter(
+    key: str,
+    size: int = 10,
+    batch_ms: int = DEFAULT_BATCH_MS,
+    spins: Optional[int] = None,
+    priors: Optional[Dict[str, float]] = None,
+    values: Optional[List[int]] = None,
+) -> List[int]:
+    """
+    小役カウンターを表示し、反映済みの項目別の値を返す（spins を渡すと先頭の項目で期待度も表示）
+    values は初めて表示するときの値。コンポーネントは接続直後に端末に保存した値を送ってくるので、それで置き換わる。
+    """
+    sync = _sync_state(key, size, "koyaku_counter", (list(values or []) + [0] * size)[:size])
+    message = _declare("koyaku_counter")(
+        ack=sync.ack(),
+        batch_ms=batch_ms,
+        key=key,
+        default=None,
+        **_estimate_args(sync, spins, sync.values[0], priors),
+    )
+    _apply(sync, message, "koyaku_counter")
+    return list(sync.values)
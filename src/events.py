@@ -0,0 +1,255 @@
+"""
+カウンター操作の永続ログ（SQLite）
+
+回転数・小役回数の増減を (セッション, 台) ごとに時刻付きで追記だけするテーブルに記録し、
+サーバー再起動やタブの再読み込みのあとでも累計値を復元できるようにする。
+
+- WAL モードで開くため、書き込み中でも読み出し（復元）は待たされない
+- 追記はキューに積むだけで戻り、専用の書き込みスレッドが複数セッション分をまとめて
+  1トランザクションで書き込む（SQLite の書き込みは1本に直列化されるため）
+- snapshot_interval 件ごとに累計値のスナップショットを保存し、復元は
+  「最新のスナップショット + それ以降の差分の合計」で済ませる
+"""
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import EVENT_STORE_CONFIG
+from .state import PosteriorState
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    ts REAL NOT NULL,
+    delta_spins INTEGER NOT NULL,
+    delta_hits INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_stream ON events (session_id, machine, id);
+CREATE TABLE IF NOT EXISTS snapshots (
+    session_id TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    last_event_id INTEGER NOT NULL,
+    num_spins INTEGER NOT NULL,
+    num_hits INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (session_id, machine)
+);
+"""
+
+_STOP = object()
+
+StreamKey = Tuple[str, str]
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # WAL では NORMAL でも電源断以外でコミット済みのデータは失われない
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+class EventStore:
+    """
+    (セッション, 台) ごとの操作ログ
+    append は書き込みスレッドへ渡すだけなので、Streamlit の各セッションから呼んでもブロックしない。
+    replay はコミット済みの分だけを読むため、直前の追記を確実に反映したい場合は先に flush を呼ぶ。
+    """
+
+    def __init__(self, path: str, batch_size: int = 512, flush_interval: float = 0.05, snapshot_interval: int = 500):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.snapshot_interval = snapshot_interval
+        self._writer = _connect(path)
+        self._writer.executescript(_SCHEMA)
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        # 前回のスナップショット以降に書き込んだ件数（書き込みスレッドだけが触る）
+        self._since_snapshot: Dict[StreamKey, int] = {}
+        self.written = 0
+        self.batches = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="event-store-writer", daemon=True)
+        self._thread.start()
+
+    # --- 書き込み ---
+    def append(self, session_id: str, machine: str, delta_spins: int = 0, delta_hits: int = 0, ts: Optional[float] = None) -> None:
+        """増減を1件追記（0件の変化は記録しない）"""
+        if delta_spins == 0 and delta_hits == 0:
+            return
+        self._queue.put((session_id, machine, time.time() if ts is None else ts, int(delta_spins), int(delta_hits)))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """ここまでに追記した分の書き込み完了を待つ"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._writer.close()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            batch: List[Tuple] = []
+            waiters: List[threading.Event] = []
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    # flush 要求はそれまでに積まれた分を書いた時点で応答する
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self._write(batch)
+            except sqlite3.Error:
+                # 書き込めなかったバッチは破棄し、以降の追記は受け付け続ける
+                self.dropped += len(batch)
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+
+    def _write(self, batch: List[Tuple]) -> None:
+        conn = self._writer
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO events (session_id, machine, ts, delta_spins, delta_hits) VALUES (?, ?, ?, ?, ?)",
+                batch,
+            )
+            counts: Dict[StreamKey, int] = {}
+            for session_id, machine, *_ in batch:
+                counts[(session_id, machine)] = counts.get((session_id, machine), 0) + 1
+            for key, count in counts.items():
+                if key not in self._since_snapshot:
+                    # 再起動後に初めて書く系列は、未集約の件数を数え直す
+                    self._since_snapshot[key] = self._count_after_snapshot(conn, key)
+                else:
+                    self._since_snapshot[key] += count
+                if self._since_snapshot[key] >= self.snapshot_interval:
+                    self._snapshot(conn, key)
+                    self._since_snapshot[key] = 0
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        self.written += len(batch)
+        self.batches += 1
+
+    # --- スナップショット ---
+    @staticmethod
+    def _read_snapshot(conn: sqlite3.Connection, key: StreamKey) -> Tuple[int, int, int]:
+        row = conn.execute(
+            "SELECT last_event_id, num_spins, num_hits FROM snapshots WHERE session_id = ? AND machine = ?",
+            key,
+        ).fetchone()
+        return row if row else (0, 0, 0)
+
+    def _count_after_snapshot(self, conn: sqlite3.Connection, key: StreamKey) -> int:
+        last_id, _, _ = self._read_snapshot(conn, key)
+        (count,) = conn.execute(
+            "SELECT COUNT(*) FROM events WHERE session_id = ? AND machine = ? AND id > ?",
+            (*key, last_id),
+        ).fetchone()
+        return count
+
+    def _fold(self, conn: sqlite3.Connection, key: StreamKey) -> Tuple[int, int, int, int]:
+        """スナップショット以降の差分を足し込んだ (最終イベントID, 回転数, 小役回数, 足し込んだ件数)"""
+        last_id, spins, hits = self._read_snapshot(conn, key)
+        max_id, sum_spins, sum_hits, count = conn.execute(
+            "SELECT MAX(id), SUM(delta_spins), SUM(delta_hits), COUNT(*) FROM events "
+            "WHERE session_id = ? AND machine = ? AND id > ?",
+            (*key, last_id),
+        ).fetchone()
+        if count == 0:
+            return last_id, spins, hits, 0
+        return max_id, spins + sum_spins, hits + sum_hits, count
+
+    def _snapshot(self, conn: sqlite3.Connection, key: StreamKey) -> None:
+        last_id, spins, hits, count = self._fold(conn, key)
+        if count == 0:
+            return
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshots (session_id, machine, last_event_id, num_spins, num_hits, ts) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (*key, last_id, spins, hits, time.time()),
+        )
+
+    # --- 読み出し ---
+    def replay(self, session_id: str, machine: str) -> Tuple[int, int]:
+        """記録済みの操作から (回転数, 小役回数) を復元"""
+        conn = _connect(self.path)
+        try:
+            _, spins, hits, _ = self._fold(conn, (session_id, machine))
+        finally:
+            conn.close()
+        return spins, hits
+
+    def restore_state(self, session_id: str, machine: str, priors: Optional[Dict[str, float]] = None, spec=None) -> PosteriorState:
+        """記録済みの操作から PosteriorState を作り直す（spec は機種の仕様）"""
+        spins, hits = self.replay(session_id, machine)
+        return PosteriorState(priors, spins, hits, spec)
+
+    def history(self, session_id: str, machine: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """操作の履歴（古い順）"""
+        # 新しい順に limit 件取り出してから古い順に並べ直す
+        sql = (
+            "SELECT ts, delta_spins, delta_hits FROM ("
+            "SELECT id, ts, delta_spins, delta_hits FROM events WHERE session_id = ? AND machine = ? "
+            "ORDER BY id DESC LIMIT ?) ORDER BY id"
+        )
+        params = (session_id, machine, -1 if limit is None else limit)
+        conn = _connect(self.path)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        return [{"ts": ts, "delta_spins": ds, "delta_hits": dh} for ts, ds, dh in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "pending": self._queue.qsize(),
+        }
+
+_EVENT_STORE: Optional[EventStore] = None
+_EVENT_STORE_LOCK = threading.Lock()
+
+def get_event_store() -> EventStore:
+    """全セッション共通の操作ログを取得（初回呼び出し時に開く）"""
+    global _EVENT_STORE
+    with _EVENT_STORE_LOCK:
+        if _EVENT_STORE is None:
+            config = dict(EVENT_STORE_CONFIG)
+            path = os.environ.get("EVENT_STORE_PATH") or config.pop("path")
+            config.pop("path", None)
+            if not os.path.isabs(path):
+                path = os.path.join(ROOT_DIR, path)
+            _EVENT_STORE = EventStore(path, **config)
+            atexit.register(_EVENT_STORE.close)
+        return _EVENT_STORE
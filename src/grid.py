@@ -0,0 +1,132 @@
+"""
+カウンターコンポーネントに渡す 456/56 期待度の早見表
+
+(n, k) の格子の事後確率を compute_posteriors_batch（compute_posteriors と同値）で一度だけ計算し、
+期待度を1バイトに量子化したバイナリにまとめる。コンポーネントはタップのたびにこの表を引いて
+期待度をその場で表示し、次の同期で Python の計算結果に置き換える。
+
+形式（リトルエンディアン）:
+    ヘッダー  magic b"MTPG", version u8, levels u8, rows u16
+    行        rows × (n u16, k_lo u16, width u16)   n の昇順
+    値        行ごとに 456 期待度 width バイト、続けて 56 期待度 width バイト
+
+期待度は k について単調なので、値が 0 / levels に張り付く範囲は持たず、
+k_lo より前と k_lo + width 以降は端の値を使う。行の間の n は線形補間する。
+"""
+import bisect
+import hashlib
+import struct
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .constants import SETTING_KEYS, GOAL_GROUPS, POSTERIOR_GRID_CONFIG
+from .batch import compute_posteriors_batch
+from .cache import prior_signature
+
+MAGIC = b"MTPG"
+VERSION = 1
+HEADER = struct.Struct("<4sBBH")
+ROW = struct.Struct("<HHH")
+
+GOAL_CODES = ("456", "56")
+GOAL_INDEXES = {code: [SETTING_KEYS.index(key) for key in GOAL_GROUPS[code]["goal"]] for code in GOAL_CODES}
+
+def row_spins(spin_steps: Sequence[Tuple[int, int]]) -> List[int]:
+    """(この回転数まで, 刻み) の並びから各行の n を求める（先頭は n = 0）"""
+    spins = [0]
+    for until, step in spin_steps:
+        while spins[-1] + step <= until:
+            spins.append(spins[-1] + step)
+    return spins
+
+def _quantize(prob: np.ndarray, levels: int) -> np.ndarray:
+    return np.rint(np.clip(prob, 0.0, 1.0) * levels).astype(np.uint8)
+
+def build_grid(priors: Dict[str, float], spin_steps: Iterable[Tuple[int, int]], levels: int) -> bytes:
+    """早見表のバイナリを作る（数十 KB、NumPy で 0.3 秒程度）"""
+    spins = row_spins(list(spin_steps))
+    if levels > 255 or spins[-1] > 0xFFFF or len(spins) > 0xFFFF:
+        raise ValueError("早見表の大きさが形式の上限を超えています")
+    rows = []
+    values = []
+    for n in spins:
+        k = np.arange(n + 1)
+        posteriors = compute_posteriors_batch(np.full(k.shape, n), k, priors)
+        q = {code: _quantize(posteriors[:, indexes].sum(axis=1), levels) for code, indexes in GOAL_INDEXES.items()}
+        live = np.zeros(k.shape, dtype=bool)
+        for code in GOAL_CODES:
+            live |= (q[code] > 0) & (q[code] < levels)
+        if live.any():
+            # 張り付いた値を両端に1つずつ残し、範囲外はその値で埋めればよいようにする
+            live_indexes = np.nonzero(live)[0]
+            k_lo = max(0, int(live_indexes[0]) - 1)
+            k_hi = min(n, int(live_indexes[-1]) + 1)
+        else:
+            k_lo = k_hi = 0
+        rows.append(ROW.pack(n, k_lo, k_hi - k_lo + 1))
+        for code in GOAL_CODES:
+            values.append(q[code][k_lo:k_hi + 1].tobytes())
+    return HEADER.pack(MAGIC, VERSION, levels, len(spins)) + b"".join(rows) + b"".join(values)
+
+def grid_digest(blob: bytes) -> str:
+    """早見表の識別子（コンポーネントが受け取り済みかの確認に使う）"""
+    return hashlib.blake2b(blob, digest_size=8).hexdigest()
+
+@lru_cache(maxsize=8)
+def _cached_grid(signature: Tuple[float, ...]) -> Tuple[str, bytes]:
+    blob = build_grid(dict(zip(SETTING_KEYS, signature)), **POSTERIOR_GRID_CONFIG)
+    return grid_digest(blob), blob
+
+def get_posterior_grid(priors: Optional[Dict[str, float]] = None) -> Tuple[str, bytes]:
+    """事前確率ごとの早見表 (識別子, バイナリ)。プロセス内で1度だけ作る"""
+    if priors is None:
+        priors = {key: 1.0 for key in SETTING_KEYS}
+    return _cached_grid(prior_signature(priors))
+
+class GridReader:
+    """
+    早見表の読み出し（コンポーネント側の lookupGrid と同じ手順）
+    ベンチマークで量子化・補間の誤差を確かめるのに使う。
+    """
+
+    def __init__(self, blob: bytes):
+        magic, version, self.levels, rows = HEADER.unpack_from(blob, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("早見表の形式が異なります")
+        self.blob = blob
+        self.spins: List[int] = []
+        self.ranges: List[Tuple[int, int]] = []
+        self.offsets: List[int] = []
+        offset = HEADER.size + rows * ROW.size
+        for i in range(rows):
+            n, k_lo, width = ROW.unpack_from(blob, HEADER.size + i * ROW.size)
+            self.spins.append(n)
+            self.ranges.append((k_lo, width))
+            self.offsets.append(offset)
+            offset += width * len(GOAL_CODES)
+
+    @property
+    def max_spins(self) -> int:
+        return self.spins[-1]
+
+    def _row_value(self, row: int, goal: int, k: int) -> int:
+        k_lo, width = self.ranges[row]
+        index = min(max(k - k_lo, 0), width - 1)
+        return self.blob[self.offsets[row] + goal * width + index]
+
+    def lookup(self, n: int, k: int) -> Optional[Dict[str, float]]:
+        """(n, k) の 456 / 56 期待度。表の範囲外・不正な入力は None"""
+        if n <= 0 or k < 0 or k > n or n > self.max_spins:
+            return None
+        upper = bisect.bisect_left(self.spins, n)
+        lower = upper if self.spins[upper] == n else upper - 1
+        t = 0.0 if lower == upper else (n - self.spins[lower]) / (self.spins[upper] - self.spins[lower])
+        result = {}
+        for goal, code in enumerate(GOAL_CODES):
+            value = self._row_value(lower, goal, k)
+            if t > 0:
+                value = value * (1 - t) + self._row_value(upper, goal, k) * t
+            result[code] = value / self.levels
+        return result
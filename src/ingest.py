@@ -0,0 +1,276 @@
+"""
+ホールデータ (CSV/TSV) の一括判別
+
+台番号・総回転数・5枚役回数（任意で時刻）を含むファイルを一定行数ずつ読み込み、
+compute_posteriors_batch で各行を判別して 456/56 期待度（spec を渡した場合はその機種の期待度）の順位表を作る。
+回転数が0以下・小役回数が負または回転数より多い行は判別できないので読み飛ばす。
+ファイル全体をメモリに載せないため、数百万行でも使用メモリは上位件数と台数で頭打ちになる。
+
+実行方法:
+    python -m src.ingest hall.csv --top 50 --workers 4
+"""
+import argparse
+import csv
+import datetime
+import heapq
+import io
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .constants import SETTING_KEYS, GOAL_GROUPS
+from .batch import compute_posteriors_batch
+
+# ヘッダー名の表記ゆれ（小文字・前後空白除去後に照合）
+COLUMN_ALIASES: Dict[str, List[str]] = {
+    "machine": ["machine", "machine_no", "machine_number", "台番", "台番号", "台"],
+    "spins": ["spins", "total_spins", "n", "games", "総回転数", "回転数", "g数", "総g数"],
+    "hits": ["hits", "k", "koyaku", "5枚役", "5枚役回数", "小役回数"],
+    "time": ["time", "timestamp", "hour", "datetime", "時刻", "時間", "日時"],
+}
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+GOAL_INDEXES = {
+    code: [SETTING_KEYS.index(key) for key in group["goal"]]
+    for code, group in GOAL_GROUPS.items()
+}
+
+def resolve_columns(header: List[str]) -> Dict[str, int]:
+    """ヘッダー行から各項目の列番号を求める（time は任意）"""
+    normalized = [h.strip().lower() for h in header]
+    columns: Dict[str, int] = {}
+    for name, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                columns[name] = normalized.index(alias)
+                break
+    missing = [name for name in ("machine", "spins", "hits") if name not in columns]
+    if missing:
+        raise ValueError(f"必要な列が見つかりません: {', '.join(missing)} (ヘッダー: {header})")
+    return columns
+
+def detect_delimiter(first_line: str, filename: str = "") -> str:
+    """拡張子またはヘッダー行から区切り文字を判定"""
+    if filename.lower().endswith((".tsv", ".tab")):
+        return "\t"
+    if filename.lower().endswith(".csv"):
+        return ","
+    return "\t" if first_line.count("\t") > first_line.count(",") else ","
+
+def iter_line_chunks(stream: IO[str], chunk_size: int) -> Iterator[List[str]]:
+    """テキストストリームを chunk_size 行ずつのリストとして順に返す"""
+    chunk: List[str] = []
+    for line in stream:
+        if not line.strip():
+            continue
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def parse_time(text: str) -> float:
+    """
+    時刻列を比較用の数値にする
+    数値（時）・"HH:MM[:SS]"（時に換算）・日時 (ISO 形式、"/" 区切りも可) に対応し、
+    空欄や解釈できない値は -inf（どの時刻よりも古い）とする。
+    """
+    text = text.strip()
+    if not text:
+        return -math.inf
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    parts = text.split(":")
+    if 2 <= len(parts) <= 3:
+        try:
+            return sum(float(part) / 60 ** i for i, part in enumerate(parts))
+        except ValueError:
+            pass
+    try:
+        return datetime.datetime.fromisoformat(text.replace("/", "-")).timestamp()
+    except ValueError:
+        return -math.inf
+
+def parse_lines(lines: List[str], columns: Dict[str, int], delimiter: str) -> Tuple[List[str], np.ndarray, np.ndarray, List[float]]:
+    """行を (台番号, 回転数, 小役回数, 時刻) に分解。数値にできない行・判別できない値の行は読み飛ばす"""
+    machines: List[str] = []
+    spins: List[int] = []
+    hits: List[int] = []
+    times: List[float] = []
+    i_machine, i_spins, i_hits = columns["machine"], columns["spins"], columns["hits"]
+    i_time = columns.get("time")
+    for row in csv.reader(lines, delimiter=delimiter):
+        try:
+            n = int(float(row[i_spins]))
+            k = int(float(row[i_hits]))
+        except (IndexError, ValueError):
+            continue
+        if n <= 0 or not 0 <= k <= n:
+            continue
+        machines.append(row[i_machine].strip())
+        spins.append(n)
+        hits.append(k)
+        times.append(parse_time(row[i_time]) if i_time is not None and i_time < len(row) else -math.inf)
+    return machines, np.array(spins, dtype=np.int64), np.array(hits, dtype=np.int64), times
+
+def score_rows(machines: List[str], spins: np.ndarray, hits: np.ndarray, priors: Dict[str, float], top: Optional[int] = None, sort_by: str = "456", spec=None) -> List[Dict[str, Any]]:
+    """
+    各行の事後確率と 456/56 期待度（spec を渡した場合はその機種の期待度）を算出
+    top を指定した場合は sort_by の期待度が高い top 行だけを辞書化して返す。
+    """
+    if len(machines) == 0:
+        return []
+    keys = SETTING_KEYS if spec is None else spec.keys
+    posteriors = compute_posteriors_batch(spins, hits, priors, spec)
+    probs = {code: posteriors[:, indexes].sum(axis=1) for code, indexes in (GOAL_INDEXES if spec is None else spec.goal_indexes).items()}
+
+    indexes = np.arange(len(machines))
+    if top is not None and top < len(machines):
+        indexes = np.argpartition(-probs[sort_by], top - 1)[:top]
+    return [
+        {
+            "machine": machines[i],
+            "n": int(spins[i]),
+            "k": int(hits[i]),
+            **{f"prob_{code}": float(prob[i]) for code, prob in probs.items()},
+            "posteriors": dict(zip(keys, posteriors[i].tolist())),
+        }
+        for i in indexes.tolist()
+    ]
+
+def _latest_snapshots(machines: List[str], spins: np.ndarray, hits: np.ndarray, times: List[float]) -> Dict[str, Tuple[float, int, int]]:
+    """台ごとに最新（時刻→回転数の順で最大）のスナップショットだけを残す"""
+    latest: Dict[str, Tuple[float, int, int]] = {}
+    for machine, n, k, t in zip(machines, spins.tolist(), hits.tolist(), times):
+        current = latest.get(machine)
+        if current is None or (t, n) > (current[0], current[1]):
+            latest[machine] = (t, n, k)
+    return latest
+
+def _top_rows(rows: List[Dict[str, Any]], top: int, sort_by: str) -> List[Dict[str, Any]]:
+    return heapq.nlargest(top, rows, key=lambda r: r[f"prob_{sort_by}"])
+
+def _process_chunk(lines: List[str], columns: Dict[str, int], delimiter: str, priors: Dict[str, float], top: int, sort_by: str, snapshots: bool, spec=None):
+    """1チャンク分の処理（プロセスプールからも呼ばれる）"""
+    machines, spins, hits, times = parse_lines(lines, columns, delimiter)
+    if snapshots:
+        return _latest_snapshots(machines, spins, hits, times)
+    return _top_rows(score_rows(machines, spins, hits, priors, top, sort_by, spec), top, sort_by)
+
+def _open_source(source: Union[str, IO], encoding: str) -> Tuple[IO[str], str, bool]:
+    """パス・バイナリ・テキストのいずれかをテキストストリームとして開く"""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "r", encoding=encoding, newline=""), str(source), True
+    name = getattr(source, "name", "") or ""
+    if isinstance(source, io.TextIOBase):
+        return source, name, False
+    return io.TextIOWrapper(source, encoding=encoding, newline=""), name, False
+
+def rank_hall_data(
+    source: Union[str, IO],
+    priors: Optional[Dict[str, float]] = None,
+    top: int = 100,
+    sort_by: str = "456",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 0,
+    snapshots: Optional[bool] = None,
+    encoding: str = "utf-8-sig",
+    spec=None,
+) -> List[Dict[str, Any]]:
+    """
+    ホールデータを読み込み、456 (または 56) 期待度の高い順に上位 top 件を返す
+    spec を渡した場合はその機種の設定・期待度で判別し、sort_by には spec.goal_codes のいずれかを指定する。
+    snapshots=True の場合は台ごとに最新の行だけを判別する（None なら時刻列の有無で自動判定）。
+    workers > 0 でプロセスプールを使い、チャンクの解析・判別を並列化する。
+    """
+    goal_codes = list(GOAL_INDEXES) if spec is None else spec.goal_codes
+    if sort_by not in goal_codes:
+        raise ValueError(f"sort_by は {goal_codes} のいずれかを指定してください")
+    if priors is None:
+        priors = {key: 1.0 / len(SETTING_KEYS) for key in SETTING_KEYS} if spec is None else spec.flat_priors()
+
+    stream, name, should_close = _open_source(source, encoding)
+    try:
+        header_line = stream.readline()
+        if not header_line:
+            return []
+        delimiter = detect_delimiter(header_line, name)
+        columns = resolve_columns(next(csv.reader([header_line], delimiter=delimiter)))
+        if snapshots is None:
+            snapshots = "time" in columns
+
+        args = (columns, delimiter, priors, top, sort_by, snapshots, spec)
+        chunks = iter_line_chunks(stream, chunk_size)
+        if workers > 0:
+            results = _run_parallel(chunks, args, workers)
+        else:
+            results = (_process_chunk(chunk, *args) for chunk in chunks)
+
+        if snapshots:
+            latest: Dict[str, Tuple[float, int, int]] = {}
+            for partial in results:
+                for machine, snap in partial.items():
+                    current = latest.get(machine)
+                    if current is None or (snap[0], snap[1]) > (current[0], current[1]):
+                        latest[machine] = snap
+            machines = list(latest)
+            spins = np.array([latest[m][1] for m in machines], dtype=np.int64)
+            hits = np.array([latest[m][2] for m in machines], dtype=np.int64)
+            return _top_rows(score_rows(machines, spins, hits, priors, top, sort_by, spec), top, sort_by)
+
+        best: List[Dict[str, Any]] = []
+        for partial in results:
+            best = _top_rows(best + partial, top, sort_by)
+        return best
+    finally:
+        if should_close:
+            stream.close()
+        elif stream is not source:
+            # 呼び出し元のバイナリストリームは閉じずに返す
+            stream.detach()
+
+def _run_parallel(chunks: Iterator[List[str]], args: tuple, workers: int) -> Iterator[Any]:
+    """同時に処理中のチャンク数を workers の2倍までに抑えてプールへ投入"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(_process_chunk, chunk, *args))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ホールデータを一括判別して456/56期待度の順位表を出力")
+    parser.add_argument("path", help="CSV/TSV ファイル")
+    parser.add_argument("--top", type=int, default=50, help="表示件数")
+    parser.add_argument("--sort", choices=list(GOAL_INDEXES), default="456", help="並び替えの基準")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=0, help="プロセス数 (0: 並列化しない, -1: CPU数)")
+    parser.add_argument("--encoding", default="utf-8-sig", help="文字コード (例: cp932)")
+    args = parser.parse_args(argv)
+
+    workers = (os.cpu_count() or 1) if args.workers < 0 else args.workers
+    ranking = rank_hall_data(
+        args.path,
+        top=args.top,
+        sort_by=args.sort,
+        chunk_size=args.chunk_size,
+        workers=workers,
+        encoding=args.encoding,
+    )
+    print("順位\t台番号\t回転数\t5枚役\t456期待度\t56期待度")
+    for rank, row in enumerate(ranking, start=1):
+        print(f"{rank}\t{row['machine']}\t{row['n']}\t{row['k']}\t{row['prob_456'] * 100:.1f}%\t{row['prob_56'] * 100:.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,171 @@
 import math
-from typing import Dict, List, Any
-from .constants import SETTINGS, SETTING_KEYS, GOAL_CONFIG
+import operator
+import threading
+from array import array
+from typing import Dict, List, Any, Optional
+from .constants import SETTINGS, SETTING_KEYS, GOAL_CONFIG, SAMPLE_BANDS, EARLY_BOOST_PCT
+
+class LogFactorialTable:
+    """
+    log(n!) と各設定の log p / log(1-p) を保持するテーブル
+    これまでに現れた最大の n まで拡張し、以降の呼び出しは参照のみで済ませる。
+    拡張はロックの下で行い、複数スレッドから同時に拡張しても値がずれないようにする。
+    テーブルは max_size までしか広げず、それを超える n は lgamma で直接求める
+    （極端に大きな n でメモリを使い切ったり、拡張中に他のスレッドを待たせたりしないように）。
+    """
+
+    def __init__(self, initial_size: int = 1024, max_size: int = 1 << 20):
+        self._log_fact = array("d", [0.0])
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.log_p: Dict[str, float] = {k: math.log(p) for k, p in SETTINGS.items()}
+        self.log_q: Dict[str, float] = {k: math.log1p(-p) for k, p in SETTINGS.items()}
+        self.ensure(initial_size)
+
+    @property
+    def size(self) -> int:
+        return len(self._log_fact) - 1
+
+    def ensure(self, n: int) -> None:
+        """n!（max_size を超える場合は max_size!）まで参照できるようにテーブルを拡張（倍々で確保）"""
+        n = min(n, self.max_size)
+        if n <= self.size:
+            return
+        with self._lock:
+            current = self.size
+            if n <= current:
+                return
+            target = min(max(n, current * 2), self.max_size)
+            self._log_fact.extend(math.lgamma(i + 1) for i in range(current + 1, target + 1))
+
+    def log_factorial(self, n: int) -> float:
+        if n > self.max_size:
+            return math.lgamma(n + 1)
+        self.ensure(n)
+        return self._log_fact[n]
+
+    def log_comb(self, n: int, k: int) -> float:
+        """log nCk"""
+        if n > self.max_size:
+            return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+        self.ensure(n)
+        table = self._log_fact
+        return table[n] - table[k] - table[n - k]
+
+_LOG_TABLE = LogFactorialTable()
+
+def get_log_table() -> LogFactorialTable:
+    """プロセス共通の対数テーブルを取得"""
+    return _LOG_TABLE
+
+def _log_p_pair(p: float):
+    """p に対応する (log p, log(1-p))。設定値ならテーブルから引く"""
+    for key, value in SETTINGS.items():
+        if value == p:
+            return _LOG_TABLE.log_p[key], _LOG_TABLE.log_q[key]
+    return math.log(p), math.log1p(-p)
+
+def _log_comb_real(n: float, k: float) -> float:
+    """整数でない回数（集計値など）の log nCk。整数値の float は表から引く"""
+    if float(n).is_integer() and float(k).is_integer():
+        return _LOG_TABLE.log_comb(int(n), int(k))
+    return math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+
+def calculate_log_likelihood(num_spins: int, num_hits: int, p: float) -> float:
+    """
+    二項分布の対数尤度 log P(K=k | N=n, p)。尤度0の場合は -inf
+    回数は整数（NumPy の整数を含む）なら表から、float なら lgamma で二項係数を求める。
+    """
+    if p <= 0.0 or p >= 1.0 or num_spins <= 0 or num_hits < 0 or num_hits > num_spins:
+        return -math.inf
+    log_p, log_q = _log_p_pair(p)
+    try:
+        log_comb = _LOG_TABLE.log_comb(operator.index(num_spins), operator.index(num_hits))
+    except TypeError:
+        log_comb = _log_comb_real(num_spins, num_hits)
+    return (
+        log_comb
+        + num_hits * log_p
+        + (num_spins - num_hits) * log_q
+    )
 
 def calculate_likelihood(num_spins: int, num_hits: int, p: float) -> float:
     """二項分布の尤度 P(K=k | N=n, p)"""
-    if p <= 0.0 or p >= 1.0 or num_spins <= 0 or num_hits < 0 or num_hits > num_spins:
+    log_likelihood = calculate_log_likelihood(num_spins, num_hits, p)
+    if log_likelihood == -math.inf:
         return 0.0
-    log_nCk = (
-        math.lgamma(num_spins + 1)
-        - math.lgamma(num_hits + 1)
-        - math.lgamma(num_spins - num_hits + 1)
-    )
-    log_likelihood = (
-        log_nCk
-        + num_hits * math.log(p)
-        + (num_spins - num_hits) * math.log(1.0 - p)
-    )
     return math.exp(log_likelihood)
 
-def normalize(priors: Dict[str, float]) -> Dict[str, float]:
-    """確率分布の正規化"""
-    total = sum(max(0.0, priors.get(k, 0.0)) for k in SETTING_KEYS)
+def normalize(priors: Dict[str, float], keys: Optional[List[str]] = None) -> Dict[str, float]:
+    """確率分布の正規化（keys は設定の並び。省略時は SETTING_KEYS）"""
+    keys = SETTING_KEYS if keys is None else keys
+    total = sum(max(0.0, priors.get(k, 0.0)) for k in keys)
     if total <= 0.0:
-        uniform = 1.0 / len(SETTING_KEYS)
-        return {k: uniform for k in SETTING_KEYS}
-    return {k: max(0.0, priors.get(k, 0.0)) / total for k in SETTING_KEYS}
+        uniform = 1.0 / len(keys)
+        return {k: uniform for k in keys}
+    return {k: max(0.0, priors.get(k, 0.0)) / total for k in keys}
 
-def compute_posteriors(num_spins: int, num_hits: int, priors: Dict[str, float]) -> Dict[str, float]:
-    """ベイズ更新による事後確率計算"""
+def log_sum_exp(values: List[float]) -> float:
+    """log(Σ exp(v)) をアンダーフローなしで計算"""
+    max_value = max(values)
+    if max_value == -math.inf:
+        return -math.inf
+    return max_value + math.log(sum(math.exp(v - max_value) for v in values))
+
+def compute_log_posteriors(num_spins: int, num_hits: int, priors: Dict[str, float]) -> Dict[str, float]:
+    """
+    対数空間でのベイズ更新（log-sum-exp で正規化）
+    全設定の尤度が0（不正な入力）の場合は事前確率の対数を返す。
+    """
     priors = normalize(priors)
-    posterior_numerators: Dict[str, float] = {}
-    marginal_likelihood = 0.0
-    
+    log_numerators: Dict[str, float] = {}
+
     for key in SETTING_KEYS:
-        p = SETTINGS[key]
         prior = priors.get(key, 0.0)
-        likelihood = calculate_likelihood(num_spins, num_hits, p) if prior > 0.0 else 0.0
-        numerator = likelihood * prior
-        posterior_numerators[key] = numerator
-        marginal_likelihood += numerator
-        
-    if marginal_likelihood > 0.0:
-        return {k: posterior_numerators[k] / marginal_likelihood for k in SETTING_KEYS}
-    return priors
+        if prior > 0.0:
+            log_numerators[key] = math.log(prior) + calculate_log_likelihood(num_spins, num_hits, SETTINGS[key])
+        else:
+            log_numerators[key] = -math.inf
+
+    log_marginal = log_sum_exp(list(log_numerators.values()))
+    if log_marginal == -math.inf:
+        return {k: math.log(v) if v > 0.0 else -math.inf for k, v in priors.items()}
+    return {k: log_numerators[k] - log_marginal for k in SETTING_KEYS}
+
+def compute_posteriors(num_spins: int, num_hits: int, priors: Dict[str, float]) -> Dict[str, float]:
+    """ベイズ更新による事後確率計算"""
+    log_posteriors = compute_log_posteriors(num_spins, num_hits, priors)
+    return {k: math.exp(v) for k, v in log_posteriors.items()}
+
+def calculate_ci_range_pct(num_spins: int, num_hits: int) -> float:
+    """実測確率の95%信頼区間の幅（%）"""
+    if num_spins <= 0:
+        return 0.0
+    hit_prob = num_hits / num_spins
+    se = math.sqrt(hit_prob * (1.0 - hit_prob) / num_spins) if 0.0 < hit_prob < 1.0 else 0.0
+    return (1.96 * se * 2) * 100.0
+
+def group_probability(posteriors: Dict[str, float], keys: List[str]) -> float:
+    """設定グループの合計確率"""
+    return sum(posteriors[x] for x in keys)
 
-def evaluate_goal(goal_code: str, goal_prob: float, alt_prob: float, sample_n: int, ci_range_pct: float) -> Dict[str, Any]:
+def evaluate_goal(
+    goal_code: str,
+    goal_prob: float,
+    alt_prob: float,
+    sample_n: int,
+    ci_range_pct: float,
+    config: Optional[Dict[str, Any]] = None,
+    sample_bands: Optional[Dict[str, int]] = None,
+    early_boost_pct: Optional[float] = None,
+) -> Dict[str, Any]:
     """
     設定判別の信頼度を評価し、状況に応じた詳細なコメントを生成する
+    config / sample_bands / early_boost_pct は機種ごとの値（省略時は constants の値）
     """
-    config = GOAL_CONFIG[goal_code]
+    config = GOAL_CONFIG[goal_code] if config is None else config
+    sample_bands = SAMPLE_BANDS if sample_bands is None else sample_bands
+    early_boost_pct = EARLY_BOOST_PCT if early_boost_pct is None else early_boost_pct
     
     # 確率比と差
     alt_prob_safe = max(alt_prob, 1e-9)
@@ -79,9 +196,9 @@ def evaluate_goal(goal_code: str, goal_prob: float, alt_prob: float, sample_n: i
     comment = ""
     
     # 1. サンプル数によるコンテキスト
-    is_early = sample_n < 1000
-    is_mid = 1000 <= sample_n < 3000
-    is_late = sample_n >= 3000
+    is_early = sample_n < sample_bands["early"]
+    is_mid = sample_bands["early"] <= sample_n < sample_bands["late"]
+    is_late = sample_n >= sample_bands["late"]
     
     # 2. 状況別のコメント分岐
     if is_early:
@@ -120,7 +237,7 @@ def evaluate_goal(goal_code: str, goal_prob: float, alt_prob: float, sample_n: i
     # 極端な上振れ (サンプル少なくても確率が異常に良い)
     # 例: 設定6の確率(1/22.5)を大きく上回る場合など
     # ここでは簡易的に goal_prob が極端に高い場合で判定
-    if is_early and goal_prob_pct > 90.0:
+    if is_early and goal_prob_pct > early_boost_pct:
         comment = "🔥 驚異的な引き！サンプル不足を補って余りある数値です。全ツッパの構えで！"
         star = 5 # 強制的に星5にする
         
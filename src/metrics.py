@@ -0,0 +1,436 @@
+"""
+再実行ごとの処理時間・件数の計測とプロファイル
+
+環境変数で切り替える（どちらも未設定なら span / timed / rerun は何もしない）:
+    METRICS_ENABLED=1          段階ごとの処理時間（ヒストグラム）と件数を記録する
+    PROFILE_MODE=cprofile      再実行全体を cProfile で測って累積する（METRICS_ENABLED も有効になる）
+    PROFILE_MODE=sample        別スレッドから再実行中のスタックを一定間隔で採取する（cProfile より軽い）
+    METRICS_FILE=path          Prometheus のテキスト形式で定期的に書き出す（node_exporter の textfile 用）
+
+無効なときの span() は使い回しの nullcontext を返すだけで、timed / rerun は関数をそのまま返す。
+"""
+import atexit
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .constants import METRICS_CONFIG
+
+PROFILE_MODE = os.environ.get("PROFILE_MODE", "").strip().lower()
+ENABLED = os.environ.get("METRICS_ENABLED", "") == "1" or PROFILE_MODE in ("cprofile", "sample")
+METRICS_FILE = os.environ.get("METRICS_FILE") or None
+
+LabelKey = Tuple[Tuple[str, str], ...]
+# (名前, 種類, ラベル, 値) 。種類は "counter" か "gauge"
+Sample = Tuple[str, str, Dict[str, str], float]
+
+_HELP = {
+    "mtv_stage_seconds": "処理段階ごとの所要時間",
+    "mtv_rerun_seconds": "スクリプト・フラグメントの再実行1回の所要時間",
+    "mtv_reruns_total": "スクリプト・フラグメントの再実行回数",
+    "mtv_component_rtt_seconds": "カウンターコンポーネントが送信してから ack を受け取るまでの時間",
+}
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    parts = []
+    for key, value in labels:
+        value = value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Histogram:
+    """区切りごとの件数と合計・最大値（Prometheus の histogram と同じ累積形式で出力する）"""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """区切りから求めたおおよその分位点（区切りの上端を返す）"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return self.max
+
+class MetricsRegistry:
+    """
+    件数 (counter) とヒストグラムの置き場
+    Streamlit は各セッションを別スレッドで実行するためロックで保護する。
+    """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = tuple(buckets)
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Sample]]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def register_collector(self, name: str, collect: Callable[[], Iterable[Sample]]) -> None:
+        """出力のたびに呼ぶ関数を登録する（キャッシュの統計など、他で数えている値の取り込み用）"""
+        with self._lock:
+            self._collectors[name] = collect
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _collected(self) -> List[Sample]:
+        with self._lock:
+            collectors = list(self._collectors.values())
+        samples: List[Sample] = []
+        for collect in collectors:
+            samples.extend(collect())
+        return samples
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """デバッグ欄用の一覧（時間はミリ秒）"""
+        with self._lock:
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": h.count,
+                    "mean_ms": h.sum / h.count * 1000 if h.count else 0.0,
+                    "p50_ms": h.quantile(0.5) * 1000,
+                    "p99_ms": h.quantile(0.99) * 1000,
+                    "max_ms": h.max * 1000,
+                    "total_ms": h.sum * 1000,
+                }
+                for (name, labels), h in sorted(self._histograms.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+        counters.extend(
+            {"name": name, "labels": labels, "value": value}
+            for name, _, labels, value in self._collected()
+        )
+        return {"histograms": histograms, "counters": counters}
+
+    def render_prometheus(self) -> str:
+        """Prometheus のテキスト形式 (text/plain; version=0.0.4)"""
+        lines: List[str] = []
+        typed = set()
+
+        def header(name: str, kind: str) -> None:
+            if name in typed:
+                return
+            typed.add(name)
+            if name in _HELP:
+                lines.append(f"# HELP {name} {_HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                ((key, list(h.counts), h.count, h.sum) for key, h in self._histograms.items()),
+                key=lambda item: item[0],
+            )
+        for (name, labels), value in counters:
+            header(name, "counter")
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        for (name, labels), counts, count, total in histograms:
+            header(name, "histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', f'{bound:g}'),))} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {total:.6f}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        for name, kind, labels, value in sorted(self._collected(), key=lambda s: (s[0], sorted(s[2].items()))):
+            header(name, kind)
+            lines.append(f"{name}{_format_labels(sorted(labels.items()))} {value:g}")
+        return "\n".join(lines) + "\n"
+
+# --- プロファイル ---
+class CProfileCollector:
+    """再実行ごとの cProfile の結果を累積する（同時に測るのは1スレッドだけ）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._busy = threading.Lock()
+        self._stats: Optional[pstats.Stats] = None
+        self.runs = 0
+
+    @contextlib.contextmanager
+    def profile(self):
+        # 別セッションが測定中なら測らずに実行する（cProfile はスレッドごとにしか測れない）
+        if not self._busy.acquire(blocking=False):
+            yield
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profiler)
+                else:
+                    self._stats.add(profiler)
+                self.runs += 1
+        finally:
+            self._busy.release()
+
+    def report(self, top: int) -> str:
+        with self._lock:
+            if self._stats is None:
+                return "（まだ計測していません）"
+            out = io.StringIO()
+            self._stats.stream = out
+            self._stats.sort_stats("cumulative").print_stats(top)
+        return f"cProfile: {self.runs} 回の再実行の累計\n" + out.getvalue()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = None
+            self.runs = 0
+
+class SamplingProfiler:
+    """
+    再実行中のスレッドのスタックを一定間隔で採取する
+    採取は別スレッドで行うため、測られる側の負担は登録・解除だけ。
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._active: Dict[int, int] = {}
+        self._stacks: Dict[str, int] = {}
+        self.samples = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                active = list(self._active)
+            if not active:
+                continue
+            frames = sys._current_frames()
+            for thread_id in active:
+                frame = frames.get(thread_id)
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                stack = ";".join(reversed(names))
+                with self._lock:
+                    self._stacks[stack] = self._stacks.get(stack, 0) + 1
+                    self.samples += 1
+
+    @contextlib.contextmanager
+    def profile(self):
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._ensure_thread()
+            self._active[thread_id] = self._active.get(thread_id, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active[thread_id] -= 1
+                if self._active[thread_id] <= 0:
+                    del self._active[thread_id]
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope で読める collapsed 形式"""
+        with self._lock:
+            return "\n".join(f"{stack} {count}" for stack, count in sorted(self._stacks.items()))
+
+    def report(self, top: int) -> str:
+        inclusive: Dict[str, int] = {}
+        own: Dict[str, int] = {}
+        with self._lock:
+            samples = self.samples
+            stacks = list(self._stacks.items())
+        if not samples:
+            return "（まだ採取していません）"
+        for stack, count in stacks:
+            names = stack.split(";")
+            own[names[-1]] = own.get(names[-1], 0) + count
+            for name in set(names):
+                inclusive[name] = inclusive.get(name, 0) + count
+        # 自身で時間を使っている関数の順（呼び出し元まで含めた割合も併記）
+        lines = [f"sampling: {samples} サンプル（{self.interval * 1000:.0f}ms 間隔）", f"{'自身':>7s} {'含む':>7s}  関数"]
+        for name, count in sorted(own.items(), key=lambda item: (-item[1], -inclusive[item[0]]))[:top]:
+            lines.append(f"{count / samples:7.1%} {inclusive[name] / samples:7.1%}  {name}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stacks.clear()
+            self.samples = 0
+
+# --- 全体で共有する計測器 ---
+REGISTRY = MetricsRegistry(METRICS_CONFIG["buckets"])
+
+if PROFILE_MODE == "cprofile":
+    PROFILER: Any = CProfileCollector()
+elif PROFILE_MODE == "sample":
+    PROFILER = SamplingProfiler(METRICS_CONFIG["sample_interval"])
+else:
+    PROFILER = None
+
+_NULL = contextlib.nullcontext()
+_local = threading.local()
+_file_lock = threading.Lock()
+_last_file_write = 0.0
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        REGISTRY.observe("mtv_stage_seconds", time.perf_counter() - self.start, stage=self.name)
+        return False
+
+def span(stage: str):
+    """with span("css"): ... で処理段階の時間を記録する（無効なら何もしない）"""
+    return _Span(stage) if ENABLED else _NULL
+
+def timed(stage: str) -> Callable[[Callable], Callable]:
+    """関数全体を span で囲むデコレーター。無効なら関数をそのまま返す"""
+    def decorate(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def inc(name: str, value: float = 1.0, **labels: Any) -> None:
+    if ENABLED:
+        REGISTRY.inc(name, value, **labels)
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    if ENABLED:
+        REGISTRY.observe(name, value, **labels)
+
+@contextlib.contextmanager
+def _rerun(scope: str):
+    depth = getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        if depth == 0 and PROFILER is not None:
+            with PROFILER.profile():
+                yield
+        else:
+            yield
+    finally:
+        _local.depth = depth
+        REGISTRY.inc("mtv_reruns_total", scope=scope)
+        REGISTRY.observe("mtv_rerun_seconds", time.perf_counter() - start, scope=scope)
+        if depth == 0:
+            maybe_write_file()
+
+def rerun(scope: str) -> Callable[[Callable], Callable]:
+    """
+    スクリプト全体・フラグメント1回分を計測するデコレーター（回数・時間・プロファイル）
+    入れ子になった内側（全体の再実行の中で呼ばれたフラグメント）はプロファイルしない。
+    無効なら関数をそのまま返す。
+    """
+    def decorate(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _rerun(scope):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def maybe_write_file(force: bool = False) -> None:
+    """METRICS_FILE が指定されていれば、file_interval 秒おきに書き出す（一時ファイルから置き換え）"""
+    global _last_file_write
+    if METRICS_FILE is None:
+        return
+    now = time.monotonic()
+    if not force and now - _last_file_write < METRICS_CONFIG["file_interval"]:
+        return
+    if not _file_lock.acquire(blocking=False):
+        return
+    try:
+        _last_file_write = now
+        directory = os.path.dirname(os.path.abspath(METRICS_FILE))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{METRICS_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(REGISTRY.render_prometheus())
+        os.replace(tmp_path, METRICS_FILE)
+    finally:
+        _file_lock.release()
+
+if ENABLED and METRICS_FILE is not None:
+    atexit.register(maybe_write_file, True)
+
+def profile_report() -> Optional[str]:
+    """プロファイルの上位関数（PROFILE_MODE 未設定なら None）"""
+    if PROFILER is None:
+        return None
+    return PROFILER.report(METRICS_CONFIG["profile_top"])
@@ -0,0 +1,186 @@
+"""
+複数の判別要素を組み合わせた尤度モデル
+
+5枚役のような二項分布の要素と、トロフィー・終了画面のような多項分布の要素を
+「設定 × 出目」の対数確率行列に展開して横に連結しておき、観測回数のベクトルとの
+行列積1回で全要素の対数尤度の合計を求める。要素を増やしても列が増えるだけで、
+計算は Python のループにならない。
+二項係数・多項係数は設定に依存しないため、事後確率の正規化で打ち消し合い省略できる。
+
+機種の仕様 (MachineSpec.model) は主要素（回転数 n・小役回数 k）を MAIN_INDICATOR として先頭に置き、
+仕様の indicators を後ろに足す。PosteriorState・compute_posteriors_batch はこのモデルで評価する。
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .constants import SETTINGS, SETTING_KEYS
+from .logic import normalize
+
+# 主要素（画面の回転数・小役回数）の要素名
+MAIN_INDICATOR = "main"
+
+class BinomialIndicator:
+    """
+    当選 / 非当選の2値で数える要素（例: 5枚役）。観測は {"n": 試行回数, "k": 当選回数}
+    keys は設定の並び（省略時は SETTING_KEYS。他の要素・JointModel と揃える）。
+    """
+
+    def __init__(self, name: str, label: str, probs: Dict[str, float], keys: Optional[Sequence[str]] = None):
+        self.keys = list(SETTING_KEYS if keys is None else keys)
+        for key in self.keys:
+            p = probs[key]
+            if not 0.0 <= p <= 1.0:
+                raise ValueError(f"{name}: 設定{key}の確率が範囲外です ({p})")
+        self.name = name
+        self.label = label
+        self.probs = {key: probs[key] for key in self.keys}
+        self.columns = ["hit", "miss"]
+        # 観測の項目と入力欄の表示名
+        self.fields = [("n", "試行回数"), ("k", "当選回数")]
+
+    def probability_matrix(self) -> np.ndarray:
+        p = np.array([self.probs[key] for key in self.keys])
+        return np.stack([p, 1.0 - p], axis=1)
+
+    def counts(self, observation: Dict[str, int]) -> List[float]:
+        """観測を列ごとの回数に変換。試行なし・不正な値は情報なしとして0にする"""
+        n = observation.get("n", 0)
+        k = observation.get("k", 0)
+        if n <= 0 or k < 0 or k > n:
+            return [0.0, 0.0]
+        return [float(k), float(n - k)]
+
+class MultinomialIndicator:
+    """
+    複数の出目に分かれる要素（例: トロフィーの色、終了画面の種類）
+    probs[設定] は categories と同じ順の出現確率。remainder を指定すると、
+    その名前で「どれにも当てはまらない」出目（1 − 合計）を補う。観測は {出目: 回数}。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        label: str,
+        categories: Sequence[str],
+        probs: Dict[str, Sequence[float]],
+        remainder: Optional[str] = None,
+        keys: Optional[Sequence[str]] = None,
+    ):
+        self.keys = list(SETTING_KEYS if keys is None else keys)
+        self.name = name
+        self.label = label
+        self.columns = list(categories) + ([remainder] if remainder else [])
+        self.remainder = remainder
+        self.fields = [(column, column) for column in self.columns]
+        self.probs: Dict[str, List[float]] = {}
+        for key in self.keys:
+            values = [float(v) for v in probs[key]]
+            if len(values) != len(categories) or any(v < 0.0 for v in values):
+                raise ValueError(f"{name}: 設定{key}の確率の数または値が不正です")
+            total = sum(values)
+            if remainder:
+                if total > 1.0 + 1e-9:
+                    raise ValueError(f"{name}: 設定{key}の確率の合計が1を超えています")
+                values.append(max(0.0, 1.0 - total))
+            elif abs(total - 1.0) > 1e-6:
+                raise ValueError(f"{name}: 設定{key}の確率の合計が1ではありません ({total})")
+            self.probs[key] = values
+
+    def probability_matrix(self) -> np.ndarray:
+        return np.array([self.probs[key] for key in self.keys])
+
+    def counts(self, observation: Dict[str, int]) -> List[float]:
+        return [float(max(0, observation.get(column, 0))) for column in self.columns]
+
+def five_coin_indicator(probs: Optional[Dict[str, float]] = None, label: str = "5枚役", keys: Optional[Sequence[str]] = None) -> BinomialIndicator:
+    """
+    従来の5枚役判別を1要素として表したもの（観測は {"n": 回転数, "k": 小役回数}）
+    probs・label・keys を渡すと、他の機種の主要素にも使える（省略時は SETTINGS）。
+    """
+    return BinomialIndicator(MAIN_INDICATOR, label, SETTINGS if probs is None else probs, keys)
+
+class JointModel:
+    """
+    複数の要素をまとめた判別モデル
+    生成時に全要素の対数確率を (設定 × 全列) の行列へまとめ、以降の評価は行列積だけで行う。
+    確率0の出目（その設定では出ない演出など）が観測された設定は尤度0（-inf）になる。
+    """
+
+    def __init__(self, indicators: Sequence[Any], keys: Optional[Sequence[str]] = None):
+        names = [indicator.name for indicator in indicators]
+        if len(set(names)) != len(names):
+            raise ValueError("要素名が重複しています")
+        self.keys = list(SETTING_KEYS if keys is None else keys)
+        if any(indicator.keys != self.keys for indicator in indicators):
+            raise ValueError("要素ごとの設定の並びが一致しません")
+        self.indicators = list(indicators)
+        self._slices: Dict[str, slice] = {}
+        matrices = []
+        offset = 0
+        for indicator in self.indicators:
+            matrix = indicator.probability_matrix()
+            self._slices[indicator.name] = slice(offset, offset + matrix.shape[1])
+            offset += matrix.shape[1]
+            matrices.append(matrix)
+        probs = np.concatenate(matrices, axis=1)
+        self.impossible = (probs <= 0.0).astype(np.float64)
+        self.has_impossible = bool(self.impossible.any())
+        with np.errstate(divide="ignore"):
+            self.log_probs = np.where(probs > 0.0, np.log(np.where(probs > 0.0, probs, 1.0)), 0.0)
+        self.num_columns = offset
+
+    def columns(self, name: str) -> slice:
+        """要素の列の範囲"""
+        return self._slices[name]
+
+    def count_vector(self, observations: Dict[str, Dict[str, int]]) -> np.ndarray:
+        """{要素名: 観測} を全列の回数ベクトルに変換（観測のない要素は0）"""
+        vector = np.zeros(self.num_columns)
+        for indicator in self.indicators:
+            observation = observations.get(indicator.name)
+            if observation:
+                vector[self._slices[indicator.name]] = indicator.counts(observation)
+        return vector
+
+    def log_likelihood_matrix(self, counts: np.ndarray) -> np.ndarray:
+        """回数行列 (行 × 列) から対数尤度 (行 × 設定) を求める（定数項は省略）"""
+        counts = np.atleast_2d(counts)
+        log_lik = counts @ self.log_probs.T
+        if not self.has_impossible:
+            return log_lik
+        infeasible = ((counts > 0).astype(np.float64) @ self.impossible.T) > 0
+        return np.where(infeasible, -np.inf, log_lik)
+
+    def posteriors_matrix(self, counts: np.ndarray, priors: Dict[str, float]) -> np.ndarray:
+        """回数行列の各行について事後確率 (行 × 設定) を求める"""
+        priors = normalize(priors, self.keys)
+        prior = np.array([priors[key] for key in self.keys])
+        with np.errstate(divide="ignore"):
+            log_post = self.log_likelihood_matrix(counts) + np.log(prior)
+        row_max = log_post.max(axis=1, keepdims=True)
+        # 全設定で尤度0になった行は事前確率を返す（compute_posteriors と同じ扱い）
+        impossible_rows = ~np.isfinite(row_max[:, 0])
+        row_max[impossible_rows] = 0.0
+        post = np.exp(log_post - row_max)
+        total = post.sum(axis=1, keepdims=True)
+        total[impossible_rows] = 1.0
+        post /= total
+        post[impossible_rows] = prior
+        return post
+
+    def posteriors(self, observations: Dict[str, Dict[str, int]], priors: Dict[str, float]) -> Dict[str, float]:
+        """1件の観測から事後確率を求める"""
+        row = self.posteriors_matrix(self.count_vector(observations), priors)[0]
+        return dict(zip(self.keys, row.tolist()))
+
+    def posteriors_batch(self, observations_list: Sequence[Dict[str, Dict[str, int]]], priors: Dict[str, float]) -> np.ndarray:
+        """複数台分の観測をまとめて評価"""
+        counts = np.stack([self.count_vector(obs) for obs in observations_list]) if observations_list else np.zeros((0, self.num_columns))
+        return self.posteriors_matrix(counts, priors)
+
+@lru_cache(maxsize=1)
+def default_model() -> JointModel:
+    """5枚役のみの標準モデル（共有するので変更しないこと）"""
+    return JointModel([five_coin_indicator()])
@@ -0,0 +1,246 @@
+"""
+「あと何G回せば判別できるか」の見積もり
+
+現在の (n, k) から回転を続けたとき、goal グループ (456 / 56) の事後確率が
+upper 以上に達する（判別成功）か、lower 以下に落ちる（撤退ライン）までの回転数の分布を、
+真の設定ごとに格子 (追加回転数, 追加小役回数) 上の動的計画法で求める（逐次確率比検定と同じ考え方）。
+
+設定の当選確率は大小順に並んでいるため、goal グループの事後確率は k について単調増加になる。
+そのため停止領域は各回転数 N で「k ≥ k_upper[N]」「k ≤ k_lower[N]」の形に書け、
+この境界表を求めておけば、DP は配列のずらし加算だけで済む。
+停止判定は step の倍数の回転数 N で行い、境界表は N を TABLE_CHUNK 個ずつに区切った塊ごとにキャッシュする。
+境界は (n0, k0) によらない（事前確率・goal・閾値・step だけで決まる）ため、小役を数えるたびの再計算では
+表を作り直さず、回転数が進んでも見積もる範囲 [n0, n0 + max_spins] が新しい塊に入るまで使い回せる。
+計算量は現在の回転数の大きさによらず、見積もる追加回転数 (max_spins, 上限 MAX_HORIZON) だけで決まる。
+"""
+import math
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .constants import SETTING_KEYS, GOAL_GROUPS
+from .batch import SETTING_PROBS, compute_posteriors_batch
+from .cache import prior_signature
+from .logic import evaluate_goal, calculate_ci_range_pct, group_probability
+from .state import PosteriorState
+from .specs import get_spec
+
+# 1回の見積もりで見る追加回転数の上限（DP と境界表の大きさを抑える）
+MAX_HORIZON = 20000
+
+# 境界表をキャッシュする単位（停止判定の回数）
+TABLE_CHUNK = 256
+
+# これ未満の確率の状態は打ち切る
+DEFAULT_PRUNE_EPS = 1e-9
+
+def _goal_probability(goal_code: str, n: np.ndarray, k: np.ndarray, priors: Dict[str, float], spec=None) -> np.ndarray:
+    posteriors = compute_posteriors_batch(n, k, priors, spec)
+    if spec is None:
+        goal_idx = [SETTING_KEYS.index(key) for key in GOAL_GROUPS[goal_code]["goal"]]
+    else:
+        goal_idx = spec.goal_indexes[goal_code]
+    return posteriors[:, goal_idx].sum(axis=1)
+
+def _first_k_where(
+    goal_code: str, n: np.ndarray, priors: Dict[str, float], predicate, spec=None,
+    lo: Optional[np.ndarray] = None, hi: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    各 n について predicate(確率) を満たす最小の k (lo..hi-1、省略時は 0..n)。なければ hi（全 n まとめて二分探索）
+    """
+    lo = np.zeros_like(n) if lo is None else lo.copy()
+    hi = n + 1 if hi is None else hi.copy()
+    while np.any(lo < hi):
+        active = lo < hi
+        mid = (lo + hi) // 2
+        cond = np.zeros(len(n), dtype=bool)
+        cond[active] = predicate(_goal_probability(goal_code, n[active], mid[active], priors, spec))
+        hi = np.where(active & cond, mid, hi)
+        lo = np.where(active & ~cond, mid + 1, lo)
+    return lo
+
+@lru_cache(maxsize=64)
+def _boundary_chunk(
+    goal_code: str, upper: float, lower: float, prior_key: Tuple[float, ...],
+    step: int, chunk: int, machine: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    N = step·m（m = chunk·TABLE_CHUNK + 1 .. (chunk + 1)·TABLE_CHUNK）ごとの停止境界（machine は機種 ID。None は constants の機種）
+    k_upper: 確率が upper 以上になる最小の k（なければ N + 1）/ k_lower: 確率が lower 以下になる最大の k（なければ -1）
+    """
+    spec = None if machine is None else get_spec(machine)
+    priors = dict(zip(SETTING_KEYS if spec is None else spec.keys, prior_key))
+    n = step * np.arange(chunk * TABLE_CHUNK + 1, (chunk + 1) * TABLE_CHUNK + 1)
+    k_upper = _first_k_where(goal_code, n, priors, lambda prob: prob >= upper, spec)
+    k_lower = _first_k_where(goal_code, n, priors, lambda prob: prob > lower, spec) - 1
+    return k_upper, k_lower
+
+def _boundary_table(
+    goal_code: str, upper: float, lower: float, prior_key: Tuple[float, ...],
+    step: int, first: int, blocks: int, machine: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """N = step·(first + b)（b = 0..blocks-1）の停止境界。塊ごとにキャッシュした表をつないで切り出す"""
+    chunks = range((first - 1) // TABLE_CHUNK, (first + blocks - 2) // TABLE_CHUNK + 1)
+    tables = [_boundary_chunk(goal_code, upper, lower, prior_key, step, c, machine) for c in chunks]
+    start = first - 1 - chunks[0] * TABLE_CHUNK
+    k_upper = np.concatenate([table[0] for table in tables])[start:start + blocks]
+    k_lower = np.concatenate([table[1] for table in tables])[start:start + blocks]
+    return k_upper, k_lower
+
+@lru_cache(maxsize=64)
+def _binomial_kernel(step: int, machine: Optional[str] = None) -> np.ndarray:
+    """(設定 × 0..step) の二項分布の確率"""
+    probs = SETTING_PROBS if machine is None else get_spec(machine).arrays["probs"]
+    j = np.arange(step + 1)
+    log_comb = np.array([math.lgamma(step + 1) - math.lgamma(x + 1) - math.lgamma(step - x + 1) for x in j])
+    log_pmf = log_comb + np.outer(np.log(probs), j) + np.outer(np.log1p(-probs), step - j)
+    return np.exp(log_pmf)
+
+def _quantile_spins(spins: np.ndarray, cumulative: np.ndarray, q: float) -> Optional[int]:
+    reached = np.nonzero(cumulative >= q)[0]
+    return int(spins[reached[0]]) if len(reached) else None
+
+def plan_spins(
+    num_spins: int,
+    num_hits: int,
+    priors: Optional[Dict[str, float]] = None,
+    goal_code: str = "456",
+    upper: float = 0.8,
+    lower: float = 0.2,
+    max_spins: int = 5000,
+    step: int = 10,
+    prune_eps: float = DEFAULT_PRUNE_EPS,
+    spec=None,
+) -> Dict[str, Any]:
+    """
+    追加で回したときに判別が付くまでの回転数の分布
+    総回転数が step の倍数になるごとに停止判定を行い、真の設定ごとの結果と、現在の事後確率で重み付けした結果を返す。
+    max_spins は MAX_HORIZON までに切り詰める。
+    spec（src.specs.MachineSpec）を渡すとその機種の設定・期待度・閾値で求める。
+    """
+    keys = SETTING_KEYS if spec is None else spec.keys
+    machine = None if spec is None else spec.id
+    if priors is None:
+        priors = {key: 1.0 / len(keys) for key in keys}
+    if not 0.0 <= lower < upper <= 1.0:
+        raise ValueError("0 <= lower < upper <= 1 を満たすように指定してください")
+    if step < 1:
+        raise ValueError("step は 1 以上を指定してください")
+    n0 = max(0, num_spins)
+    k0 = min(max(0, num_hits), n0)
+    blocks = max(1, math.ceil(min(max_spins, MAX_HORIZON) / step))
+
+    posteriors = PosteriorState(priors, n0, k0, spec).posteriors()
+    group = (GOAL_GROUPS if spec is None else spec.goal_groups)[goal_code]
+    current = evaluate_goal(
+        goal_code,
+        group_probability(posteriors, group["goal"]),
+        group_probability(posteriors, group["alt"]),
+        n0,
+        calculate_ci_range_pct(n0, k0),
+        **({} if spec is None else {
+            "config": spec.goal_config[goal_code],
+            "sample_bands": spec.sample_bands,
+            "early_boost_pct": spec.early_boost_pct,
+        }),
+    )
+    current_prob = group_probability(posteriors, group["goal"])
+
+    # 最初の判定は次の step の倍数の回転数（そこまでの first_step 回転）、以降は step 回転ごと
+    first_step = step - n0 % step
+    n_settings = len(keys)
+    spins = first_step + step * np.arange(blocks)
+    absorbed_high = np.zeros((n_settings, blocks))
+    absorbed_low = np.zeros((n_settings, blocks))
+    pruned = np.zeros(n_settings)
+
+    # mass[s, i] は小役回数 lo + i の状態にいる確率
+    lo = k0
+    mass = np.ones((n_settings, 1))
+    already_decided = n0 > 0 and (current_prob >= upper or current_prob <= lower)
+    last_block = 0
+    if not already_decided:
+        k_upper, k_lower = _boundary_table(
+            goal_code, upper, lower, prior_signature(priors, keys), step, n0 // step + 1, blocks, machine
+        )
+        kernels = _binomial_kernel(first_step, machine), _binomial_kernel(step, machine)
+        for b in range(blocks):
+            advance = first_step if b == 0 else step
+            kernel = kernels[b > 0]
+            width = mass.shape[1]
+            new = np.zeros((n_settings, width + advance))
+            for d in range(advance + 1):
+                new[:, d:d + width] += mass * kernel[:, d:d + 1]
+            ks = lo + np.arange(width + advance)
+            high = ks >= k_upper[b]
+            low = ks <= k_lower[b]
+            absorbed_high[:, b] = new[:, high].sum(axis=1)
+            absorbed_low[:, b] = new[:, low].sum(axis=1)
+            new[:, high | low] = 0.0
+
+            # 全設定で無視できる確率しかない両端を切り詰める
+            alive = np.nonzero(new.max(axis=0) >= prune_eps)[0]
+            last_block = b + 1
+            if len(alive) == 0:
+                pruned += new.sum(axis=1)
+                break
+            first, last = alive[0], alive[-1] + 1
+            pruned += new[:, :first].sum(axis=1) + new[:, last:].sum(axis=1)
+            mass = new[:, first:last]
+            lo += first
+
+    if already_decided:
+        # 現時点で判別済み（追加 0 回転で停止）
+        spins = np.array([0])
+        absorbed_high = np.full((n_settings, 1), 1.0 if current_prob >= upper else 0.0)
+        absorbed_low = 1.0 - absorbed_high
+    else:
+        spins = spins[:max(last_block, 1)]
+        absorbed_high = absorbed_high[:, :len(spins)]
+        absorbed_low = absorbed_low[:, :len(spins)]
+    weights = np.array([posteriors[key] for key in keys])
+
+    def summarize(high: np.ndarray, low: np.ndarray) -> Dict[str, Any]:
+        decided = np.cumsum(high + low)
+        return {
+            "p_high": float(high.sum()),
+            "p_low": float(low.sum()),
+            "p_undecided": float(max(0.0, 1.0 - high.sum() - low.sum())),
+            "median_spins": _quantile_spins(spins, decided, 0.5),
+            "p90_spins": _quantile_spins(spins, decided, 0.9),
+            "expected_spins": float((spins * (high + low)).sum() + spins[-1] * max(0.0, 1.0 - decided[-1])),
+            "spins": spins.tolist(),
+            "cumulative_high": np.cumsum(high).tolist(),
+            "cumulative_low": np.cumsum(low).tolist(),
+        }
+
+    by_setting = {key: summarize(absorbed_high[i], absorbed_low[i]) for i, key in enumerate(keys)}
+    mixture = summarize(weights @ absorbed_high, weights @ absorbed_low)
+    return {
+        "goal_code": goal_code,
+        "upper": upper,
+        "lower": lower,
+        "num_spins": n0,
+        "num_hits": k0,
+        "current_prob": current_prob,
+        "current_eval": current,
+        "already_decided": already_decided,
+        "by_setting": by_setting,
+        "mixture": mixture,
+        "pruned_mass": float(weights @ pruned),
+    }
+
+def clear_planner_cache() -> None:
+    """境界表・二項分布のキャッシュを破棄"""
+    _boundary_chunk.cache_clear()
+    _binomial_kernel.cache_clear()
+
+def spins_to_reach(plan: Dict[str, Any], probability: float = 0.5) -> Dict[str, Optional[int]]:
+    """真の設定ごとに、判別が付く確率が probability に達するまでの追加回転数"""
+    result: Dict[str, Optional[int]] = {}
+    for key, summary in plan["by_setting"].items():
+        decided = np.array(summary["cumulative_high"]) + np.array(summary["cumulative_low"])
+        result[key] = _quantile_spins(np.array(summary["spins"]), decided, probability)
+    return result
@@ -0,0 +1,433 @@
+"""
+ホール・曜日別の事前確率の学習
+
+過去のホールデータ（ホール・日付・回転数・5枚役回数）から、設定の混合比を
+「全体 → ホール → ホール×曜日（特日）」の3段階で EM 法により推定する。
+
+- 各台の (n, k) は SETTINGS の二項分布の混合から出たものとみなし、
+  E ステップで台ごとの設定の事後確率、M ステップでグループごとの混合比を求める
+- 下の段の混合比は上の段の分布を strength 台分の擬似データとして加えて推定するため、
+  台数の少ないホール・曜日は上の段の値に近くなる
+- 尤度は反復の前に1度だけ計算し、行をグループ順に並べて反復ごとの処理を行列・ベクトル積と
+  グループごとの合計 (np.add.reduceat) だけにする。
+  さらに SQUAREM で反復回数を減らす（1年分・数百万台でも数秒）
+
+推定結果は小さな JSON (data/priors.json) に保存し、アプリは起動時にそれを読むだけで再推定しない。
+
+実行方法:
+    python -m src.priors fit hall_history.csv
+    python -m src.priors show --hall A店
+"""
+import argparse
+import csv
+import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, IO, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .constants import SETTINGS, SETTING_KEYS, PRIOR_FIT_CONFIG
+from .batch import LOG_P, LOG_Q
+from .ingest import DEFAULT_CHUNK_SIZE, detect_delimiter, iter_line_chunks, _open_source
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_VERSION = 1
+
+# ヘッダー名の表記ゆれ（小文字・前後空白除去後に照合）
+COLUMN_ALIASES: Dict[str, List[str]] = {
+    "hall": ["hall", "hall_name", "store", "ホール", "ホール名", "店舗", "店舗名"],
+    "date": ["date", "day", "日付", "営業日"],
+    "spins": ["spins", "total_spins", "n", "games", "総回転数", "回転数", "g数", "総g数"],
+    "hits": ["hits", "k", "koyaku", "5枚役", "5枚役回数", "小役回数"],
+    "event": ["event", "is_event", "特日", "イベント"],
+}
+
+DAY_KINDS: Tuple[str, ...] = ("mon", "tue", "wed", "thu", "fri", "sat", "sun", "event")
+DAY_LABELS: Dict[str, str] = {
+    "mon": "月曜", "tue": "火曜", "wed": "水曜", "thu": "木曜", "fri": "金曜", "sat": "土曜", "sun": "日曜", "event": "特日",
+}
+
+TRUE_VALUES = ("1", "true", "yes", "y", "○", "◯", "有", "あり")
+
+def flat_priors() -> Dict[str, float]:
+    return {key: 1.0 / len(SETTING_KEYS) for key in SETTING_KEYS}
+
+def day_kind(date: datetime.date, event: bool = False, event_digits: Sequence[int] = ()) -> str:
+    """日付の区分（特日、それ以外は曜日）"""
+    if event or date.day % 10 in event_digits:
+        return "event"
+    return DAY_KINDS[date.weekday()]
+
+def parse_date(text: str) -> datetime.date:
+    """「2024-05-01」「2024/5/1」「20240501」（時刻付きも可）を日付にする"""
+    text = text.strip().split(" ")[0].split("T")[0].replace("/", "-")
+    if "-" not in text and len(text) == 8:
+        return datetime.date(int(text[:4]), int(text[4:6]), int(text[6:]))
+    year, month, day = (int(part) for part in text.split("-"))
+    return datetime.date(year, month, day)
+
+# --- 読み込み ---
+class HistoryRecords:
+    """過去データ（台×日ごとの1行）をグループ番号と (n, k) の配列にまとめたもの"""
+
+    def __init__(self, halls: List[str], hall_index: np.ndarray, kind_index: np.ndarray, spins: np.ndarray, hits: np.ndarray):
+        self.halls = halls
+        self.hall_index = hall_index
+        self.kind_index = kind_index
+        self.spins = spins
+        self.hits = hits
+
+    def __len__(self) -> int:
+        return len(self.spins)
+
+def resolve_columns(header: List[str]) -> Dict[str, int]:
+    """ヘッダー行から各項目の列番号を求める（event は任意）"""
+    normalized = [h.strip().lower() for h in header]
+    columns: Dict[str, int] = {}
+    for name, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                columns[name] = normalized.index(alias)
+                break
+    missing = [name for name in ("hall", "date", "spins", "hits") if name not in columns]
+    if missing:
+        raise ValueError(f"必要な列が見つかりません: {', '.join(missing)} (ヘッダー: {header})")
+    return columns
+
+def load_history(
+    source: Union[str, IO],
+    event_digits: Optional[Sequence[int]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8-sig",
+) -> HistoryRecords:
+    """
+    ホールデータを読み込む。日付は種類ごとに1度だけ解釈し、
+    回転数 0・小役回数が範囲外の行と、日付・数値を読めない行は除く。
+    """
+    if event_digits is None:
+        event_digits = PRIOR_FIT_CONFIG["event_digits"]
+    halls: Dict[str, int] = {}
+    kinds: Dict[Tuple[str, bool], int] = {}
+    hall_index: List[int] = []
+    kind_index: List[int] = []
+    spins: List[int] = []
+    hits: List[int] = []
+
+    stream, name, should_close = _open_source(source, encoding)
+    try:
+        header_line = stream.readline()
+        if not header_line:
+            raise ValueError("ファイルが空です")
+        delimiter = detect_delimiter(header_line, name)
+        columns = resolve_columns(next(csv.reader([header_line], delimiter=delimiter)))
+        i_hall, i_date, i_spins, i_hits = columns["hall"], columns["date"], columns["spins"], columns["hits"]
+        i_event = columns.get("event")
+        for chunk in iter_line_chunks(stream, chunk_size):
+            for row in csv.reader(chunk, delimiter=delimiter):
+                try:
+                    n = int(float(row[i_spins]))
+                    k = int(float(row[i_hits]))
+                    date_text = row[i_date]
+                    hall = row[i_hall].strip()
+                except (IndexError, ValueError):
+                    continue
+                if n <= 0 or k < 0 or k > n:
+                    continue
+                event = i_event is not None and i_event < len(row) and row[i_event].strip().lower() in TRUE_VALUES
+                kind = kinds.get((date_text, event))
+                if kind is None:
+                    try:
+                        kind = DAY_KINDS.index(day_kind(parse_date(date_text), event, event_digits))
+                    except ValueError:
+                        continue
+                    kinds[(date_text, event)] = kind
+                hall_index.append(halls.setdefault(hall, len(halls)))
+                kind_index.append(kind)
+                spins.append(n)
+                hits.append(k)
+    finally:
+        if should_close:
+            stream.close()
+        elif stream is not source:
+            stream.detach()
+
+    return HistoryRecords(
+        list(halls),
+        np.array(hall_index, dtype=np.int64),
+        np.array(kind_index, dtype=np.int64),
+        np.array(spins, dtype=np.float64),
+        np.array(hits, dtype=np.float64),
+    )
+
+# --- EM ---
+def scaled_likelihood(spins: np.ndarray, hits: np.ndarray) -> np.ndarray:
+    """
+    各台 × 設定の尤度（行ごとに最大値が 1 になるよう割ったもの）
+    二項係数と行ごとの倍率は事後確率の正規化で打ち消し合うため、反復の前に1度だけ求めれば済む。
+    """
+    log_like = np.outer(hits, LOG_P) + np.outer(spins - hits, LOG_Q)
+    log_like -= log_like.max(axis=1, keepdims=True)
+    return np.exp(log_like)
+
+# これより行の多いグループは行列・ベクトル積を1回ずつ、少ないグループはまとめて一度に計算する
+EM_LOOP_MIN_ROWS = 256
+
+class GroupedLikelihood:
+    """
+    グループ順に並べた尤度を、EM の反復で使う形に前もって分けたもの
+    行の多いグループは likelihood の範囲をそのまま使い（BLAS の行列・ベクトル積が最も速い）、
+    行の少ないグループは (設定数 × 行数) の連続した配列に写しておき、np.add.reduceat で一度に合計する。
+    グループ数が多くても、反復ごとの Python のループは 行数 / EM_LOOP_MIN_ROWS 回以下で済む。
+    """
+
+    def __init__(self, likelihood: np.ndarray, offsets: np.ndarray):
+        self.likelihood = likelihood
+        self.offsets = offsets
+        self.sizes = np.diff(offsets)
+        self.large = np.flatnonzero(self.sizes >= EM_LOOP_MIN_ROWS)
+        self.small = np.flatnonzero((self.sizes > 0) & (self.sizes < EM_LOOP_MIN_ROWS))
+        small_sizes = self.sizes[self.small]
+        self.small_rows = np.ascontiguousarray(likelihood[np.repeat(self.sizes < EM_LOOP_MIN_ROWS, self.sizes)].T)
+        self.small_groups = np.repeat(np.arange(len(self.small)), small_sizes)
+        self.small_starts = np.concatenate(([0], np.cumsum(small_sizes)[:-1])).astype(np.int64)
+
+def _em_step(grouped: GroupedLikelihood, mix: np.ndarray, pseudo: np.ndarray) -> np.ndarray:
+    """
+    EM の1反復
+    E ステップの事後確率 mix·L_i / (L_i·mix) を行ごとに作らず、その合計 mix × (L^T (1 / (L mix))) を直接求める。
+    行も擬似データもないグループは混合比をそのまま残す。
+    """
+    sums = np.zeros_like(mix)
+    offsets = grouped.offsets
+    for g in grouped.large.tolist():
+        rows = grouped.likelihood[offsets[g]:offsets[g + 1]]
+        sums[g] = (1.0 / (rows @ mix[g])) @ rows
+    if len(grouped.small):
+        rows = grouped.small_rows
+        scaled = np.take(mix[grouped.small].T, grouped.small_groups, axis=1)
+        scaled *= rows
+        weights = 1.0 / scaled.sum(axis=0)
+        np.multiply(rows, weights, out=scaled)
+        sums[grouped.small] = np.add.reduceat(scaled, grouped.small_starts, axis=1).T
+    totals = grouped.sizes + pseudo.sum(axis=1)
+    filled = totals > 0
+    updated = mix.copy()
+    updated[filled] = (mix[filled] * sums[filled] + pseudo[filled]) / totals[filled, None]
+    return updated
+
+def fit_mixture(
+    likelihood: np.ndarray,
+    offsets: np.ndarray,
+    base: np.ndarray,
+    strength: float,
+    max_iter: int,
+    tol: float,
+) -> Tuple[np.ndarray, int]:
+    """
+    グループごとの混合比を EM で推定する
+    likelihood の行はグループ順に並べ、グループ g の行は offsets[g]:offsets[g + 1] とする。
+    base は (グループ数 × 設定数) の上位の分布で、各グループに strength 台分の擬似データとして加える
+    （strength=0 なら加えず、行のないグループは base のまま）。
+    設定1と2のように当選確率の近い成分があると EM は収束が遅いため、SQUAREM（2反復分の変化から
+    外挿する加速法）を使う。戻り値は (グループ数 × 設定数) の混合比と EM の反復回数。
+    """
+    if strength < 0:
+        raise ValueError(f"strength は 0 以上を指定してください ({strength})")
+    grouped = GroupedLikelihood(likelihood, offsets)
+    pseudo = strength * base
+    mix = base.copy()
+    steps = 0
+    while steps < max_iter:
+        first = _em_step(grouped, mix, pseudo)
+        second = _em_step(grouped, first, pseudo)
+        steps += 2
+        r = first - mix
+        v = second - first - r
+        v_norm = float(np.sqrt((v * v).sum()))
+        if v_norm == 0.0:
+            mix = second
+            break
+        alpha = min(-float(np.sqrt((r * r).sum())) / v_norm, -1.0)
+        candidate = mix - 2.0 * alpha * r + alpha * alpha * v
+        if (candidate < 0).any():
+            # 外挿が確率の範囲を外れたら通常の2反復の結果を使う
+            candidate = second
+        candidate = _em_step(grouped, candidate, pseudo)
+        steps += 1
+        change = float(np.abs(candidate - mix).max())
+        mix = candidate
+        if change < tol:
+            break
+    return mix, steps
+
+def fit_priors(
+    records: HistoryRecords,
+    strength: Optional[float] = None,
+    max_iter: Optional[int] = None,
+    tol: Optional[float] = None,
+) -> Dict[str, Any]:
+    """全体 → ホール → ホール×曜日の順に混合比を推定し、保存用の辞書を返す"""
+    if len(records) == 0:
+        raise ValueError("推定に使える行がありません")
+    strength = PRIOR_FIT_CONFIG["strength"] if strength is None else strength
+    max_iter = PRIOR_FIT_CONFIG["max_iter"] if max_iter is None else max_iter
+    tol = PRIOR_FIT_CONFIG["tol"] if tol is None else tol
+
+    # 行を ホール×曜日 の順に並べ、各段のグループを連続した範囲にする
+    num_halls = len(records.halls)
+    num_kinds = len(DAY_KINDS)
+    cells = records.hall_index * num_kinds + records.kind_index
+    order = np.argsort(cells, kind="stable")
+    likelihood = scaled_likelihood(records.spins[order], records.hits[order])
+    cell_offsets = np.searchsorted(cells[order], np.arange(num_halls * num_kinds + 1))
+    hall_offsets = cell_offsets[::num_kinds]
+    uniform = np.full((1, len(SETTING_KEYS)), 1.0 / len(SETTING_KEYS))
+
+    overall, it_overall = fit_mixture(likelihood, np.array([0, len(records)]), uniform, 1.0, max_iter, tol)
+    by_hall, it_hall = fit_mixture(likelihood, hall_offsets, np.repeat(overall, num_halls, axis=0), strength, max_iter, tol)
+    by_day, it_day = fit_mixture(likelihood, cell_offsets, np.repeat(by_hall, num_kinds, axis=0), strength, max_iter, tol)
+
+    hall_sizes = np.bincount(records.hall_index, minlength=num_halls)
+    cell_sizes = np.bincount(cells, minlength=num_halls * num_kinds)
+    halls: Dict[str, Any] = {}
+    for h, hall in enumerate(records.halls):
+        days = {
+            kind: _rounded(by_day[h * num_kinds + d])
+            for d, kind in enumerate(DAY_KINDS)
+            if cell_sizes[h * num_kinds + d] > 0
+        }
+        halls[hall] = {"records": int(hall_sizes[h]), "all": _rounded(by_hall[h]), "days": days}
+    return {
+        "version": CACHE_VERSION,
+        "settings": _settings_signature(),
+        "records": len(records),
+        "strength": strength,
+        "iterations": [it_overall, it_hall, it_day],
+        "global": _rounded(overall[0]),
+        "halls": halls,
+    }
+
+def _rounded(values: np.ndarray) -> List[float]:
+    return [round(float(v), 6) for v in values]
+
+def _settings_signature() -> Dict[str, float]:
+    """推定に使った当選確率（変わったら保存済みの値は使わない）"""
+    return {key: SETTINGS[key] for key in SETTING_KEYS}
+
+# --- 保存と読み込み ---
+def cache_path() -> str:
+    path = os.environ.get("PRIOR_CACHE_PATH") or PRIOR_FIT_CONFIG["path"]
+    return path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+
+def save_priors(fitted: Dict[str, Any], path: Optional[str] = None) -> str:
+    """推定結果を書き出す（途中で読まれても壊れないよう一時ファイルから置き換える）"""
+    path = path or cache_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(fitted, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
+
+class PriorTable:
+    """保存済みの事前確率の参照。見つからない段は上の段（最後は一様分布）を使う"""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        self.data = data
+        self.halls: Dict[str, Any] = data["halls"] if data else {}
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "PriorTable":
+        """保存済みの値を読む。ファイルがない・形式や当選確率が異なる場合は空の表"""
+        try:
+            with open(path or cache_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if data.get("version") != CACHE_VERSION or data.get("settings") != _settings_signature():
+            return cls()
+        return cls(data)
+
+    def __bool__(self) -> bool:
+        return self.data is not None
+
+    def lookup(self, hall: Optional[str] = None, kind: Optional[str] = None) -> Tuple[Dict[str, float], str]:
+        """(事前確率, どの段の値か)。段は "hall_day" / "hall" / "global" / "flat" """
+        if self.data is None:
+            return flat_priors(), "flat"
+        entry = self.halls.get(hall) if hall else None
+        if entry is None:
+            return dict(zip(SETTING_KEYS, self.data["global"])), "global"
+        if kind in entry["days"]:
+            return dict(zip(SETTING_KEYS, entry["days"][kind])), "hall_day"
+        return dict(zip(SETTING_KEYS, entry["all"])), "hall"
+
+_PRIOR_TABLE: Optional[PriorTable] = None
+_PRIOR_TABLE_LOCK = threading.Lock()
+
+def get_prior_table() -> PriorTable:
+    """全セッション共通の事前確率の表（初回呼び出し時に1度だけ読み込む）"""
+    global _PRIOR_TABLE
+    with _PRIOR_TABLE_LOCK:
+        if _PRIOR_TABLE is None:
+            _PRIOR_TABLE = PriorTable.load()
+        return _PRIOR_TABLE
+
+def today_kind(event: bool = False, today: Optional[datetime.date] = None) -> str:
+    return day_kind(today or datetime.date.today(), event, PRIOR_FIT_CONFIG["event_digits"])
+
+# --- コマンドライン ---
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _format_priors(values: Sequence[float]) -> str:
+    return "  ".join(f"設定{key} {v * 100:5.1f}%" for key, v in zip(SETTING_KEYS, values))
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ホール・曜日別の事前確率を過去データから推定")
+    commands = parser.add_subparsers(dest="command", required=True)
+    fit = commands.add_parser("fit", help="推定して保存")
+    fit.add_argument("path", help="ホール・日付・回転数・5枚役回数の列を含む CSV/TSV")
+    fit.add_argument("--output", default=None, help="保存先（既定: data/priors.json、環境変数 PRIOR_CACHE_PATH）")
+    fit.add_argument("--strength", type=float, default=None, help="上位の分布に寄せる強さ（擬似的な台数）")
+    fit.add_argument("--encoding", default="utf-8-sig", help="文字コード (例: cp932)")
+    show = commands.add_parser("show", help="保存済みの値を表示")
+    show.add_argument("--hall", default=None)
+    show.add_argument("--path", default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "fit":
+        start = time.perf_counter()
+        records = load_history(args.path, encoding=args.encoding)
+        loaded = time.perf_counter()
+        fitted = fit_priors(records, strength=args.strength)
+        fitted["source"] = {"name": os.path.basename(args.path), "digest": _file_digest(args.path)}
+        path = save_priors(fitted, args.output)
+        done = time.perf_counter()
+        print(f"{len(records)} 行 / {len(records.halls)} ホール（読み込み {loaded - start:.1f} 秒、推定 {done - loaded:.1f} 秒、反復 {fitted['iterations']}）")
+        print(f"全体: {_format_priors(fitted['global'])}")
+        print(f"保存先: {path}")
+        return
+
+    table = PriorTable.load(args.path)
+    if not table:
+        print("保存済みの事前確率がありません（python -m src.priors fit で作成）")
+        return
+    print(f"全体: {_format_priors(table.data['global'])}")
+    for hall, entry in table.halls.items():
+        if args.hall is not None and hall != args.hall:
+            continue
+        print(f"{hall} ({entry['records']} 台): {_format_priors(entry['all'])}")
+        for kind, values in entry["days"].items():
+            print(f"  {DAY_LABELS[kind]}: {_format_priors(values)}")
+
+if __name__ == "__main__":
+    main()
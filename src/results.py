@@ -0,0 +1,79 @@
+from typing import Dict, Any
+from .logic import evaluate_goal, format_percent, format_denominator
+from .state import PosteriorState
+from .specs import get_spec
+from .metrics import span
+
+def format_stars(stars: int) -> str:
+    """シェア用の星表記"""
+    return "★" * stars + "☆" * (5 - stars)
+
+def build_result_bundle(state: PosteriorState) -> Dict[str, Any]:
+    """
+    画面表示に必要な計算結果と表示用文字列をまとめて生成する
+    (機種, n, k, 事前確率) が同じなら結果も同じなので、ResultCache でセッション間共有できる。
+    期待度は機種の goal_groups（モンキーターンVなら 456 / 56）の順に goals に入れる。
+    """
+    spec = state.spec or get_spec()
+    n = state.num_spins
+    k = state.num_hits
+    with span("compute_posteriors"):
+        posteriors = state.posteriors()
+        inputs = {code: state.goal_inputs(code) for code in spec.goal_codes}
+    hit_prob = k / n
+    with span("evaluate_goal"):
+        evaluations = {
+            code: evaluate_goal(
+                **inputs[code],
+                config=spec.goal_config[code],
+                sample_bands=spec.sample_bands,
+                early_boost_pct=spec.early_boost_pct,
+            )
+            for code in spec.goal_codes
+        }
+    goals = [
+        {
+            "code": code,
+            "prob": inputs[code]["goal_prob"],
+            "prob_text": format_percent(inputs[code]["goal_prob"]),
+            "eval": evaluations[code],
+        }
+        for code in spec.goal_codes
+    ]
+
+    # 実測値
+    top_setting = max(posteriors, key=posteriors.get)
+    expected_prob = spec.probs[top_setting]
+
+    # 確率分母での比較
+    current_denom = 1.0 / hit_prob if hit_prob > 0 else 0.0
+    expected_denom = 1.0 / expected_prob
+    diff_denom = current_denom - expected_denom
+    sign_str = "+" if diff_denom > 0 else ""
+
+    goal_lines = "\n\n".join(
+        f"[{goal['code']}期待度] {goal['prob_text']}\n{format_stars(goal['eval']['stars'])}\n{goal['eval']['comment']}"
+        for goal in goals
+    )
+    share_text = f"""【{spec.title} 設定判別】
+総回転数: {n}G
+{spec.indicator}: {format_denominator(hit_prob)} ({k}回)
+
+{goal_lines}
+
+現在の確率: 設定{top_setting}近似
+(理論値ズレ {sign_str}{diff_denom:.1f})
+"""
+
+    return {
+        "n": n,
+        "k": k,
+        "machine": spec.id,
+        "posteriors": posteriors,
+        "goals": goals,
+        "hit_prob_text": format_denominator(hit_prob),
+        "top_setting": top_setting,
+        "expected_denom": expected_denom,
+        "diff_denom_text": f"{sign_str}{diff_denom:.1f}",
+        "share_text": share_text,
+    }
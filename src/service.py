@@ -0,0 +1,373 @@
+"""
+判別結果を JSON で返す HTTP サービス（asyncio、標準ライブラリのみ）
+
+    POST /evaluate   {"n": 1000, "k": 40, "priors": {"1": 1, ...}}   → src.cli.summarize と同じ形式
+    POST /evaluate   {"rows": [{"n": 1000, "k": 40}, ...]}           → {"results": [...]}
+    GET  /health
+    GET  /metrics    Prometheus のテキスト形式（METRICS_ENABLED=1 なら一括計算の時間も含む）
+
+前のバッチを計算している間に届いた要求は1つのバッチにまとめ、compute_posteriors_batch の1回の
+行列計算で事後確率を求める（事前確率が異なる要求は事前確率ごとにまとめる）。既定 (batch_window = 0) では
+空いているときに届いた要求は待たずにすぐ計算する。--batch-window を指定すると、混雑時（後続の要求が
+すでに積まれているとき）だけその秒数待って、その間に届いた要求もまとめる。
+計算待ちの件数には上限があり、超えた分はすぐに 503 を返して呼び出し元に再試行を促す。
+HTTP/1.1 の keep-alive に対応し、同じ接続で続けて要求を受け付ける。
+
+実行方法:
+    python -m src.service [--host 127.0.0.1] [--port 8765]
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import metrics
+from .constants import SETTING_KEYS, SERVICE_CONFIG
+from .batch import compute_posteriors_batch, posteriors_to_dicts
+from .cache import prior_signature
+from .cli import summarize
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    413: "Payload Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+class MicroBatcher:
+    """
+    要求をキューに積み、batch_window 秒ぶんまとめて一括計算する
+    キューが満杯のときは待たずに QueueFull を送出する（呼び出し側で 503 にする）。
+    """
+
+    def __init__(self, batch_window: float, max_batch: int, max_queue: int):
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue: "asyncio.Queue[Tuple[int, int, Tuple[float, ...], asyncio.Future]]" = asyncio.Queue(maxsize=max_queue)
+        self._task: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.items = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def submit(self, n: int, k: int, priors: Tuple[float, ...]) -> "asyncio.Future":
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((n, k, priors, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise
+        return future
+
+    def submit_many(self, queries: List[Tuple[int, int, Tuple[float, ...]]]) -> List["asyncio.Future"]:
+        """複数件をまとめて積む。全件が入りきらないときは1件も積まずに QueueFull を送出する"""
+        if self._queue.maxsize > 0 and self._queue.maxsize - self._queue.qsize() < len(queries):
+            self.rejected += len(queries)
+            raise asyncio.QueueFull
+        return [self.submit(*query) for query in queries]
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # 後続の要求がすでに積まれている（混雑している）ときだけ batch_window 待って、
+            # その間に届いた分もまとめる。空いているときは待たずに計算して遅延を増やさない。
+            # （1件ごとに wait_for で待つよりイベントループの負荷が小さい）
+            if self.batch_window > 0 and 0 < self._queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._compute(batch)
+
+    @metrics.timed("service.batch")
+    def _compute(self, batch: List[Tuple[int, int, Tuple[float, ...], "asyncio.Future"]]) -> None:
+        groups: Dict[Tuple[float, ...], List[int]] = {}
+        for i, (_, _, priors, _) in enumerate(batch):
+            groups.setdefault(priors, []).append(i)
+        for priors, indexes in groups.items():
+            try:
+                results = self._evaluate([batch[i][:2] for i in indexes], priors)
+            except Exception:
+                # 1件の失敗で同じグループの他の要求まで失敗させないよう、1件ずつ計算し直す
+                for i in indexes:
+                    self._settle(batch[i][3], batch[i][:2], priors)
+                continue
+            for i, result in zip(indexes, results):
+                if not batch[i][3].done():
+                    batch[i][3].set_result(result)
+        self.batches += 1
+        self.items += len(batch)
+
+    @staticmethod
+    def _evaluate(queries: List[Tuple[int, int]], priors: Tuple[float, ...]) -> List[Dict[str, Any]]:
+        n = [query[0] for query in queries]
+        k = [query[1] for query in queries]
+        rows = posteriors_to_dicts(compute_posteriors_batch(n, k, dict(zip(SETTING_KEYS, priors))))
+        return [summarize(n[j], k[j], rows[j]) for j in range(len(queries))]
+
+    def _settle(self, future: "asyncio.Future", query: Tuple[int, int], priors: Tuple[float, ...]) -> None:
+        if future.done():
+            return
+        try:
+            future.set_result(self._evaluate([query], priors)[0])
+        except Exception as e:
+            future.set_exception(e)
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def _content_length(headers: Dict[str, str]) -> int:
+    """Content-Length を検証して整数にする（省略時は 0。数字以外・負の値は 400）"""
+    value = headers.get("content-length", "")
+    if not value:
+        return 0
+    if not (value.isascii() and value.isdigit()):
+        raise HttpError(400, f"Content-Length が不正です ({value})")
+    return int(value)
+
+def _parse_query(body: Dict[str, Any]) -> Tuple[int, int, Tuple[float, ...]]:
+    """1件分の入力を検証して (n, k, 事前確率) にする"""
+    try:
+        n = int(body["n"])
+        k = int(body["k"])
+    except (KeyError, TypeError, ValueError, OverflowError):
+        raise HttpError(400, "n と k を整数で指定してください")
+    if n > SERVICE_CONFIG["max_spins"]:
+        raise HttpError(400, f"回転数は {SERVICE_CONFIG['max_spins']} 以下にしてください")
+    if n <= 0 or k < 0 or k > n:
+        raise HttpError(400, f"回転数・小役回数が不正です (n={n}, k={k})")
+    priors = body.get("priors")
+    if priors is None:
+        priors = {key: 1.0 for key in SETTING_KEYS}
+    try:
+        values = {key: float(priors[key]) for key in SETTING_KEYS}
+    except (KeyError, TypeError, ValueError, OverflowError):
+        raise HttpError(400, f"priors には設定{'/'.join(SETTING_KEYS)}の値をすべて指定してください")
+    if (
+        not all(math.isfinite(v) for v in values.values())
+        or any(v < 0 for v in values.values())
+        or sum(values.values()) <= 0
+    ):
+        raise HttpError(400, "priors は有限の非負の値で、合計が正になるように指定してください")
+    return n, k, prior_signature(values)
+
+class EvaluationService:
+    """HTTP の受け付けと MicroBatcher への受け渡し"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = dict(SERVICE_CONFIG, **(config or {}))
+        self.batcher = MicroBatcher(self.config["batch_window"], self.config["max_batch"], self.config["max_queue"])
+        self.started_at = time.time()
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        metrics.REGISTRY.register_collector("service", self._collect_metrics)
+
+    def _collect_metrics(self) -> List[metrics.Sample]:
+        return [
+            ("mtv_service_requests_total", "counter", {}, self.requests),
+            ("mtv_service_batches_total", "counter", {}, self.batcher.batches),
+            ("mtv_service_batched_items_total", "counter", {}, self.batcher.items),
+            ("mtv_service_rejected_total", "counter", {}, self.batcher.rejected),
+            ("mtv_service_queue_depth", "gauge", {}, self.batcher._queue.qsize()),
+        ]
+
+    async def start(self) -> None:
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.config["host"], self.config["port"])
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        # 待ち受けを始めてから表示する（起動を待つスクリプトはこの行を目印にする）
+        print(f"listening on http://{self.config['host']}:{self.port}", flush=True)
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), self.config["keep_alive_timeout"])
+                except asyncio.TimeoutError:
+                    break
+                except ValueError:
+                    # StreamReader の上限を超える長さの行（LimitOverrunError は ValueError として届く）
+                    await self._respond(writer, 400, {"error": "リクエスト行が長すぎます"}, keep_alive=False)
+                    break
+                if not request_line:
+                    break
+                keep_alive = await self._handle_request(request_line, reader, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, request_line: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """1件の要求を処理して応答を書き込む。接続を続けるなら True"""
+        try:
+            method, path, version = request_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+        except ValueError:
+            await self._respond(writer, 400, {"error": "不正なリクエストです"}, keep_alive=False)
+            return False
+        try:
+            headers = await asyncio.wait_for(self._read_headers(reader), self.config["header_timeout"])
+        except asyncio.TimeoutError:
+            await self._respond(writer, 408, {"error": "ヘッダーの受信がタイムアウトしました"}, keep_alive=False)
+            return False
+        except HttpError as e:
+            await self._respond(writer, e.status, {"error": str(e)}, keep_alive=False)
+            return False
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        try:
+            length = _content_length(headers)
+        except HttpError as e:
+            # 本文の長さが分からないので、以降のデータは読まずに接続を閉じる
+            await self._respond(writer, e.status, {"error": str(e)}, keep_alive=False)
+            return False
+        if length > self.config["max_body"]:
+            await self._respond(writer, 413, {"error": "リクエストが大きすぎます"}, keep_alive=False)
+            return False
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length), self.config["body_timeout"]) if length else b""
+        except asyncio.TimeoutError:
+            await self._respond(writer, 408, {"error": "本文の受信がタイムアウトしました"}, keep_alive=False)
+            return False
+
+        self.requests += 1
+        try:
+            status, payload = await self._dispatch(method, path, body)
+        except HttpError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception as e:
+            # 想定外の失敗でも応答を返し、接続を黙って切らない
+            status, payload = 500, {"error": f"内部エラー ({type(e).__name__})"}
+        await self._respond(writer, status, payload, keep_alive)
+        return keep_alive
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> Dict[str, str]:
+        """空行までのヘッダーを読む（行数が max_headers を超える・1行が長すぎるときは 431）"""
+        headers: Dict[str, str] = {}
+        for _ in range(self.config["max_headers"] + 1):
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise HttpError(431, "ヘッダーが大きすぎます")
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        raise HttpError(431, f"ヘッダーは {self.config['max_headers']} 行以下にしてください")
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        path = path.split("?", 1)[0]
+        if path == "/metrics":
+            return 200, metrics.REGISTRY.render_prometheus()
+        if path == "/health":
+            return 200, {
+                "status": "ok",
+                "uptime": time.time() - self.started_at,
+                "requests": self.requests,
+                "batches": self.batcher.batches,
+                "batched_items": self.batcher.items,
+                "rejected": self.batcher.rejected,
+            }
+        if path != "/evaluate":
+            raise HttpError(404, "見つかりません")
+        if method != "POST":
+            raise HttpError(405, "POST で送信してください")
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(400, "JSON を解釈できません")
+        if not isinstance(data, dict):
+            raise HttpError(400, "JSON オブジェクトを送信してください")
+
+        if "rows" in data:
+            if not isinstance(data["rows"], list):
+                raise HttpError(400, "rows は配列で指定してください")
+            if len(data["rows"]) > self.config["max_batch"]:
+                raise HttpError(400, f"rows は {self.config['max_batch']} 件以下にしてください")
+            queries = [_parse_query(row) for row in data["rows"]]
+        else:
+            queries = [_parse_query(data)]
+        try:
+            # 一部だけ積まれて結果を受け取る相手のいない計算が残らないよう、全件まとめて積む
+            futures = self.batcher.submit_many(queries)
+        except asyncio.QueueFull:
+            raise HttpError(503, "混雑しています。しばらくしてから再試行してください")
+        results = await asyncio.gather(*futures)
+        return 200, ({"results": list(results)} if "rows" in data else results[0])
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        """辞書は JSON、文字列（/metrics）はテキストで返す"""
+        if isinstance(payload, str):
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        head = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive" if keep_alive else "Connection: close",
+        ]
+        if status == 503:
+            head.append("Retry-After: 1")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="判別結果を JSON で返す HTTP サービス")
+    parser.add_argument("--host", default=SERVICE_CONFIG["host"])
+    parser.add_argument("--port", type=int, default=SERVICE_CONFIG["port"])
+    parser.add_argument("--batch-window", type=float, default=SERVICE_CONFIG["batch_window"], help="要求をまとめる待ち時間（秒、0 でまとめない）")
+    parser.add_argument("--max-batch", type=int, default=SERVICE_CONFIG["max_batch"])
+    parser.add_argument("--max-queue", type=int, default=SERVICE_CONFIG["max_queue"])
+    args = parser.parse_args(argv)
+
+    service = EvaluationService({
+        "host": args.host,
+        "port": args.port,
+        "batch_window": args.batch_window,
+        "max_batch": args.max_batch,
+        "max_queue": args.max_queue,
+    })
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+機種ごとの判別仕様（設定の並び・小役確率・期待度のグループ・閾値）の登録簿
+
+仕様は specs/ 以下の JSON に1機種1ファイルで置き、specs/index.json（機種 ID・表示名・ファイル名だけ）から引く。
+起動時に読むのは索引だけで、機種の JSON は初めて使うときに読み込んで対数確率などを前計算した
+MachineSpec にし、プロセス内でキャッシュする。機種の数が増えても起動は遅くならず、
+同じ機種への切り替えは辞書を引くだけで済む。
+
+モンキーターンV (monkey_turn_v) は specs/monkey_turn_v.json（constants.py と同じ値）で登録している。
+索引やファイルがない環境でも動くよう、索引にない場合は constants.py の値を組み込みの仕様として使う。
+
+機種ファイルの形式:
+    {
+      "id": "machine_id", "name": "スマスロ ○○", "title": "○○",
+      "indicator": "5枚役",                         # n / k で数える主要素の名前
+      "settings": {"1": 0.0262, "2": 0.0271, ...},  # 設定ごとの主要素の当選確率（この順で表示）
+      "goal_groups": {"456": {"goal": [...], "alt": [...]}, ...},   # goal の確率はどれも alt より高いこと
+      "goal_config": {"456": {GOAL_CONFIG と同じ形式}, ...},
+      "sample_bands": {"early": 1000, "late": 3000}, "early_boost_pct": 90.0,   # 省略時は constants の値
+      "indicators": [{"type": "multinomial", "name": ..., "label": ..., "categories": [...], "probs": {...}}]   # 任意
+    }
+
+環境変数 MACHINE_SPEC_DIR で仕様の置き場所を変えられる。
+"""
+import json
+import math
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from .constants import SETTINGS, GOAL_GROUPS, GOAL_CONFIG, SAMPLE_BANDS, EARLY_BOOST_PCT, MACHINE_SPEC_CONFIG
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MACHINE = "monkey_turn_v"
+# 機種を指定していない（操作ログの machine が "default" の）セッションは組み込みの仕様を使う
+MACHINE_ALIASES = {"default": DEFAULT_MACHINE}
+
+BUILTIN_SPEC = {
+    "id": DEFAULT_MACHINE,
+    "name": "スマスロ モンキーターンV",
+    "title": "モンキーターンV",
+    "indicator": "5枚役",
+    "settings": SETTINGS,
+    "goal_groups": GOAL_GROUPS,
+    "goal_config": GOAL_CONFIG,
+}
+
+class MachineSpec:
+    """
+    1機種分の判別仕様（前計算済み）
+    設定ごとの log p / log(1-p) / log(p/(1-p)) はタプルで持ち、NumPy の配列は arrays で初めて作る
+    （コマンドライン版のように NumPy を読み込まない経路でも使えるように）。
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        try:
+            self.id: str = data["id"]
+            self.name: str = data.get("name", self.id)
+            self.title: str = data.get("title", self.name)
+            self.indicator: str = data.get("indicator", "小役")
+            self.probs: Dict[str, float] = {str(key): float(p) for key, p in data["settings"].items()}
+            self.goal_groups: Dict[str, Dict[str, List[str]]] = data["goal_groups"]
+            self.goal_config: Dict[str, Any] = data["goal_config"]
+            members = {code: group["goal"] + group["alt"] for code, group in self.goal_groups.items()}
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"機種仕様の形式が不正です ({data.get('id') if isinstance(data, dict) else data}): {e}") from e
+        self.sample_bands: Dict[str, int] = data.get("sample_bands", SAMPLE_BANDS)
+        self.early_boost_pct: float = float(data.get("early_boost_pct", EARLY_BOOST_PCT))
+        self.indicators: List[Dict[str, Any]] = data.get("indicators", [])
+        self.keys: List[str] = list(self.probs)
+
+        for key, p in self.probs.items():
+            if not 0.0 < p < 1.0:
+                raise ValueError(f"{self.id}: 設定{key}の確率が範囲外です ({p})")
+        for code, group in members.items():
+            unknown = [key for key in group if key not in self.probs]
+            if unknown:
+                raise ValueError(f"{self.id}: {code} に存在しない設定があります ({unknown})")
+            if code not in self.goal_config:
+                raise ValueError(f"{self.id}: {code} の閾値がありません")
+            # 計画・早見表・星の判定は「小役を多く引くほど期待度が上がる」ことを前提にしている
+            goal, alt = self.goal_groups[code]["goal"], self.goal_groups[code]["alt"]
+            if alt and min(self.probs[key] for key in goal) <= max(self.probs[key] for key in alt):
+                raise ValueError(f"{self.id}: {code} の goal の設定の確率は、alt のどの設定よりも高くしてください")
+
+        self.log_p: Tuple[float, ...] = tuple(math.log(self.probs[key]) for key in self.keys)
+        self.log_q: Tuple[float, ...] = tuple(math.log1p(-self.probs[key]) for key in self.keys)
+        self.log_odds: Tuple[float, ...] = tuple(p - q for p, q in zip(self.log_p, self.log_q))
+        self.goal_indexes: Dict[str, List[int]] = {
+            code: [self.keys.index(key) for key in group["goal"]] for code, group in self.goal_groups.items()
+        }
+        self._arrays: Optional[Dict[str, Any]] = None
+        self._model = None
+
+    @property
+    def goal_codes(self) -> List[str]:
+        return list(self.goal_groups)
+
+    @property
+    def arrays(self) -> Dict[str, Any]:
+        """NumPy 版の当選確率・対数確率（初回だけ作る）"""
+        if self._arrays is None:
+            import numpy as np
+            self._arrays = {
+                "probs": np.array([self.probs[key] for key in self.keys], dtype=np.float64),
+                "log_p": np.array(self.log_p, dtype=np.float64),
+                "log_q": np.array(self.log_q, dtype=np.float64),
+            }
+        return self._arrays
+
+    def flat_priors(self) -> Dict[str, float]:
+        return {key: 1.0 / len(self.keys) for key in self.keys}
+
+    def model(self):
+        """主要素と indicators をまとめた JointModel（初回だけ作る）"""
+        if self._model is None:
+            from .model import BinomialIndicator, JointModel, MultinomialIndicator, five_coin_indicator
+            indicators = [five_coin_indicator(self.probs, self.indicator, self.keys)]
+            for item in self.indicators:
+                if item["type"] == "binomial":
+                    indicators.append(BinomialIndicator(item["name"], item.get("label", item["name"]), item["probs"], keys=self.keys))
+                else:
+                    indicators.append(MultinomialIndicator(
+                        item["name"], item.get("label", item["name"]), item["categories"], item["probs"],
+                        item.get("remainder"), keys=self.keys,
+                    ))
+            self._model = JointModel(indicators, keys=self.keys)
+        return self._model
+
+def spec_dir() -> str:
+    path = os.environ.get("MACHINE_SPEC_DIR") or MACHINE_SPEC_CONFIG["dir"]
+    return path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+
+@lru_cache(maxsize=1)
+def _read_index() -> Dict[str, Dict[str, Any]]:
+    """索引（機種 ID → 表示名・ファイル名）。組み込みの機種は索引がなくても含める"""
+    machines: Dict[str, Dict[str, Any]] = {DEFAULT_MACHINE: {"name": BUILTIN_SPEC["name"], "file": None}}
+    try:
+        with open(os.path.join(spec_dir(), "index.json"), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return machines
+    for machine_id, entry in index.get("machines", {}).items():
+        machines[machine_id] = {"name": entry.get("name", machine_id), "file": entry.get("file")}
+    return machines
+
+def list_machines() -> List[Tuple[str, str]]:
+    """登録されている (機種 ID, 表示名)（機種ファイルは読まない）"""
+    return [(machine_id, entry["name"]) for machine_id, entry in _read_index().items()]
+
+def resolve_machine(machine_id: Optional[str]) -> str:
+    """エイリアス・未指定を機種 ID に直す（登録されていなければ組み込みの機種）"""
+    machine_id = MACHINE_ALIASES.get(machine_id or "default", machine_id)
+    return machine_id if machine_id in _read_index() else DEFAULT_MACHINE
+
+_SPEC_LOCK = threading.Lock()
+
+@lru_cache(maxsize=MACHINE_SPEC_CONFIG["cache_size"])
+def _load_spec(machine_id: str) -> MachineSpec:
+    entry = _read_index()[machine_id]
+    if entry["file"] is None:
+        return MachineSpec(BUILTIN_SPEC)
+    with open(os.path.join(spec_dir(), entry["file"]), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.setdefault("id", machine_id)
+    return MachineSpec(data)
+
+def get_spec(machine_id: Optional[str] = None) -> MachineSpec:
+    """機種の仕様（初回だけファイルを読んで前計算し、以降はキャッシュを返す）"""
+    machine_id = resolve_machine(machine_id)
+    with _SPEC_LOCK:
+        return _load_spec(machine_id)
+
+def clear_spec_cache() -> None:
+    """索引と読み込み済みの仕様を破棄（仕様ファイルを差し替えたとき用）"""
+    _read_index.cache_clear()
+    _load_spec.cache_clear()
@@ -0,0 +1,134 @@
+import math
+from typing import Dict, List, Optional, Tuple
+from .constants import SETTINGS, SETTING_KEYS, GOAL_GROUPS
+from .logic import normalize, log_sum_exp, calculate_ci_range_pct, group_probability
+
+class PosteriorState:
+    """
+    カウンター操作ごとに更新する事後確率の状態
+    二項分布の対数尤度は n, k について線形（二項係数は設定間で打ち消し合う）なので、
+    各設定の非正規化対数事後確率は log prior + k·(log p − log(1−p)) + n·log(1−p) で求まる。
+    整数の n, k のみを更新し、値は都度この式から求めるため、加減算を繰り返しても誤差が蓄積しない。
+    spec（src.specs.MachineSpec）を渡すとその機種の設定・前計算済みの対数確率を使う（省略時は constants の機種）。
+    この式は判別モデル (src.model) の主要素の対数尤度そのもので、仕様の indicators（他の小役・終了画面など）の
+    観測があるときは spec.model() の行列積で全要素をまとめて評価する。
+    """
+
+    def __init__(
+        self,
+        priors: Optional[Dict[str, float]] = None,
+        num_spins: int = 0,
+        num_hits: int = 0,
+        spec=None,
+        observations: Optional[Dict[str, Dict[str, int]]] = None,
+    ):
+        self.spec = spec
+        self.keys: List[str] = SETTING_KEYS if spec is None else spec.keys
+        self.goal_groups = GOAL_GROUPS if spec is None else spec.goal_groups
+        if priors is None:
+            priors = {key: 1.0 / len(self.keys) for key in self.keys}
+        self.priors = normalize(priors, self.keys)
+        self._log_prior = {k: math.log(v) if v > 0.0 else -math.inf for k, v in self.priors.items()}
+        if spec is None:
+            self._log_q = {k: math.log1p(-SETTINGS[k]) for k in SETTING_KEYS}
+            self._log_odds = {k: math.log(SETTINGS[k]) - self._log_q[k] for k in SETTING_KEYS}
+        else:
+            self._log_q = dict(zip(spec.keys, spec.log_q))
+            self._log_odds = dict(zip(spec.keys, spec.log_odds))
+        self.num_spins = num_spins
+        self.num_hits = num_hits
+        # 主要素以外の要素の観測 {要素名: 観測}
+        self.observations: Dict[str, Dict[str, int]] = {}
+        self._cache: Optional[Dict[str, float]] = None
+        for name, observation in (observations or {}).items():
+            self.set_observation(name, observation)
+
+    # --- 更新 ---
+    def apply_delta(self, delta_spins: int = 0, delta_hits: int = 0) -> None:
+        """回転数・小役回数の増減を反映（取り消し用の負の値も可）"""
+        if delta_spins == 0 and delta_hits == 0:
+            return
+        self.num_spins += delta_spins
+        self.num_hits += delta_hits
+        self._cache = None
+
+    def add_spin(self, count: int = 1) -> None:
+        self.apply_delta(delta_spins=count)
+
+    def add_hit(self, count: int = 1) -> None:
+        self.apply_delta(delta_hits=count)
+
+    def set_counts(self, num_spins: int, num_hits: int) -> None:
+        """入力欄の値に合わせる（差分として反映）"""
+        self.apply_delta(num_spins - self.num_spins, num_hits - self.num_hits)
+
+    def set_observation(self, name: str, observation: Dict[str, int]) -> None:
+        """主要素以外の要素（spec の indicators）の観測を置き換える。すべて0なら取り除く"""
+        observation = {column: int(count) for column, count in observation.items() if count}
+        if self.observations.get(name, {}) == observation:
+            return
+        if observation:
+            self.observations[name] = observation
+        else:
+            self.observations.pop(name, None)
+        self._cache = None
+
+    # --- 参照 ---
+    def observation_signature(self) -> Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], ...]:
+        """主要素以外の観測をキャッシュキー用のタプルにしたもの"""
+        return tuple(sorted((name, tuple(sorted(obs.items()))) for name, obs in self.observations.items()))
+
+    def model(self):
+        """この機種の判別モデル (src.model.JointModel)"""
+        if self.spec is None:
+            from .model import default_model
+            return default_model()
+        return self.spec.model()
+
+    @property
+    def is_valid(self) -> bool:
+        return self.num_spins > 0 and 0 <= self.num_hits <= self.num_spins
+
+    def log_posteriors(self) -> Dict[str, float]:
+        """正規化済みの対数事後確率（主要素だけなら compute_log_posteriors と同値）"""
+        if self.observations:
+            return self._model_log_posteriors()
+        if not self.is_valid:
+            return dict(self._log_prior)
+        n, k = self.num_spins, self.num_hits
+        numerators = {
+            key: self._log_prior[key] + k * self._log_odds[key] + n * self._log_q[key]
+            for key in self.keys
+        }
+        log_marginal = log_sum_exp(list(numerators.values()))
+        return {key: numerators[key] - log_marginal for key in self.keys}
+
+    def _model_log_posteriors(self) -> Dict[str, float]:
+        """主要素と indicators の観測を判別モデルでまとめて評価（全設定で尤度0なら事前確率）"""
+        from .model import MAIN_INDICATOR
+        model = self.model()
+        observations = dict(self.observations, **{MAIN_INDICATOR: {"n": self.num_spins, "k": self.num_hits}})
+        log_likelihood = model.log_likelihood_matrix(model.count_vector(observations))[0].tolist()
+        numerators = {key: self._log_prior[key] + value for key, value in zip(model.keys, log_likelihood)}
+        log_marginal = log_sum_exp(list(numerators.values()))
+        if log_marginal == -math.inf:
+            return dict(self._log_prior)
+        return {key: numerators[key] - log_marginal for key in self.keys}
+
+    def posteriors(self) -> Dict[str, float]:
+        """事後確率（compute_posteriors と同値）"""
+        if self._cache is None:
+            self._cache = {k: math.exp(v) for k, v in self.log_posteriors().items()}
+        return dict(self._cache)
+
+    def goal_inputs(self, goal_code: str) -> Dict[str, float]:
+        """evaluate_goal に渡す引数一式"""
+        posteriors = self.posteriors()
+        group = self.goal_groups[goal_code]
+        return {
+            "goal_code": goal_code,
+            "goal_prob": group_probability(posteriors, group["goal"]),
+            "alt_prob": group_probability(posteriors, group["alt"]),
+            "sample_n": self.num_spins,
+            "ci_range_pct": calculate_ci_range_pct(self.num_spins, self.num_hits),
+        }
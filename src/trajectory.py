@@ -0,0 +1,96 @@
+"""
+事後確率の推移
+
+操作ログの増減 (Δn, Δk) を累積和で (n, k) の列に直し、全時点の事後確率を
+compute_posteriors_batch の1回の行列計算で求める（時点ごとに compute_posteriors を呼ばない）。
+累積は整数で行うため、長いセッションでも誤差は溜まらない。
+グラフ用には LTTB (Largest-Triangle-Three-Buckets) で点数を間引き、形を保ったまま軽くする。
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .constants import SETTING_KEYS, GOAL_GROUPS
+from .batch import compute_posteriors_batch
+
+# グラフに描く最大点数（スマホでも重くならない程度）
+DEFAULT_MAX_POINTS = 300
+
+GOAL_INDEXES = {
+    code: [SETTING_KEYS.index(key) for key in group["goal"]]
+    for code, group in GOAL_GROUPS.items()
+}
+
+def cumulative_counts(delta_spins: Sequence[int], delta_hits: Sequence[int]):
+    """増減の列から各時点の (n, k) を求める"""
+    n = np.cumsum(np.asarray(delta_spins, dtype=np.int64))
+    k = np.cumsum(np.asarray(delta_hits, dtype=np.int64))
+    return n, k
+
+def compute_trajectory(delta_spins: Sequence[int], delta_hits: Sequence[int], priors: Dict[str, float], spec=None) -> Dict[str, np.ndarray]:
+    """
+    各時点の事後確率 (時点 × 設定) と 456 / 56 期待度（spec を渡した場合はその機種の期待度）
+    判別できない時点（n ≤ 0 や k > n の途中状態）は除く。
+    """
+    n, k = cumulative_counts(delta_spins, delta_hits)
+    valid = (n > 0) & (k >= 0) & (k <= n)
+    n, k = n[valid], k[valid]
+    posteriors = compute_posteriors_batch(n, k, priors, spec)
+    result = {"n": n, "k": k, "posteriors": posteriors}
+    for code, indexes in (GOAL_INDEXES if spec is None else spec.goal_indexes).items():
+        result[f"prob_{code}"] = posteriors[:, indexes].sum(axis=1)
+    return result
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    LTTB で残す点の添字（先頭と末尾は必ず残す）
+    各区間から、直前に選んだ点と次の区間の平均点とで作る三角形の面積が最大の点を選ぶ。
+    """
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, length - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else length
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    selected[-1] = length - 1
+    return selected
+
+def _goal_codes(trajectory: Dict[str, np.ndarray]) -> List[str]:
+    return [name[len("prob_"):] for name in trajectory if name.startswith("prob_")]
+
+def downsample(trajectory: Dict[str, np.ndarray], max_points: int = DEFAULT_MAX_POINTS) -> Dict[str, np.ndarray]:
+    """456 / 56 期待度それぞれの LTTB で選んだ点を合わせて間引く"""
+    length = len(trajectory["n"])
+    if length <= max_points:
+        return trajectory
+    codes = _goal_codes(trajectory)
+    per_series = max(3, max_points // len(codes))
+    keep = np.unique(np.concatenate([
+        lttb_indices(trajectory["n"], trajectory[f"prob_{code}"], per_series)
+        for code in codes
+    ]))
+    return {name: values[keep] for name, values in trajectory.items()}
+
+def trajectory_records(trajectory: Dict[str, np.ndarray], keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """グラフ用の縦持ちレコード（総回転数, 系列名, 確率, 種別）。keys は posteriors の列の設定名"""
+    n = trajectory["n"].tolist()
+    records: List[Dict[str, Any]] = []
+    for code in _goal_codes(trajectory):
+        for spins, prob in zip(n, trajectory[f"prob_{code}"].tolist()):
+            records.append({"n": spins, "series": f"{code}期待度", "prob": prob, "kind": "期待度"})
+    for i, key in enumerate(SETTING_KEYS if keys is None else keys):
+        for spins, prob in zip(n, trajectory["posteriors"][:, i].tolist()):
+            records.append({"n": spins, "series": f"設定{key}", "prob": prob, "kind": "設定別"})
+    return records
@@ -0,0 +1,221 @@
+"""
+「あと N G で何回引けば 456 ★4 に届くか」の逆引き
+
+機種・事前確率ごとに、総回転数 n = 0..max_spins の各行について次の2つを一度だけ求めて保持する。
+
+- 星の境界: 期待度ごと・星 s ごとに「星が s 以上になる最小の k」
+  （星は goal / alt の事後確率から決まり、k について単調なので、全 n まとめた二分探索で求まる）
+- 期待度の帯: 期待度が 0 / 1 に張り付いていない k の範囲の期待度（2バイトに量子化）
+
+問い合わせは表を引く（星）か、行の中を二分探索する（期待度）だけなので数 µs で済み、
+小役回数を変えて再計算を繰り返す必要がない。帯より前の k は期待度 0、帯以降は 1 とみなす。
+"""
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .constants import WHATIF_CONFIG
+from .batch import compute_posteriors_batch, evaluate_stars_batch
+from .cache import prior_signature
+from .specs import get_spec
+
+MAX_STARS = 5
+
+def _first_k(n: np.ndarray, predicate) -> np.ndarray:
+    """各 n について predicate(n, k) を満たす最小の k (0..n)。なければ n + 1（全 n まとめて二分探索）"""
+    lo = np.zeros_like(n)
+    hi = n + 1
+    while np.any(lo < hi):
+        active = lo < hi
+        mid = (lo + hi) // 2
+        cond = np.zeros(len(n), dtype=bool)
+        cond[active] = predicate(n[active], mid[active])
+        hi = np.where(active & cond, mid, hi)
+        lo = np.where(active & ~cond, mid + 1, lo)
+    return lo
+
+class WhatIfGrid:
+    """
+    1機種・1つの事前確率についての (n, k) の早見表
+    star_k[code][n, s - 1]: 星が s 以上になる最小の k（届かなければ n + 1）
+    band_lo[code][n] から band_offsets の範囲に期待度の帯を持つ。
+    """
+
+    def __init__(self, spec, priors: Dict[str, float], max_spins: int, levels: int):
+        self.spec = spec
+        self.max_spins = max_spins
+        self.levels = levels
+        self.goal_codes: List[str] = spec.goal_codes
+        self.star_k: Dict[str, np.ndarray] = {}
+        self.band_lo: Dict[str, np.ndarray] = {}
+        self.band_offsets: Dict[str, np.ndarray] = {}
+        self.band_values: Dict[str, np.ndarray] = {}
+
+        n = np.arange(max_spins + 1)
+        for code in self.goal_codes:
+            group = spec.goal_groups[code]
+            goal_idx = spec.goal_indexes[code]
+            alt_idx = [spec.keys.index(key) for key in group["alt"]]
+
+            def probabilities(n_rows, k_rows):
+                posteriors = compute_posteriors_batch(n_rows, k_rows, priors, spec)
+                return posteriors[:, goal_idx].sum(axis=1), posteriors[:, alt_idx].sum(axis=1)
+
+            def stars(n_rows, k_rows):
+                goal, alt = probabilities(n_rows, k_rows)
+                return evaluate_stars_batch(
+                    code, goal, alt, n_rows,
+                    config=spec.goal_config[code],
+                    early_spins=spec.sample_bands["early"],
+                    early_boost_pct=spec.early_boost_pct,
+                )
+
+            star_k = np.zeros((len(n), MAX_STARS), dtype=np.int32)
+            for s in range(2, MAX_STARS + 1):
+                star_k[:, s - 1] = _first_k(n, lambda n_rows, k_rows: stars(n_rows, k_rows) >= s)
+            self.star_k[code] = star_k
+
+            # 量子化して 0 より大きくなる最初の k から、levels に張り付く最初の k の手前までを帯とする
+            half = 0.5 / levels
+            lo = _first_k(n, lambda n_rows, k_rows: probabilities(n_rows, k_rows)[0] >= half)
+            hi = _first_k(n, lambda n_rows, k_rows: probabilities(n_rows, k_rows)[0] >= 1.0 - half)
+            hi = np.maximum(hi, lo)
+            widths = hi - lo
+            offsets = np.concatenate(([0], np.cumsum(widths)))
+            band_n = np.repeat(n, widths)
+            band_k = np.arange(offsets[-1]) - np.repeat(offsets[:-1] - lo, widths)
+            goal = probabilities(band_n, band_k)[0]
+            self.band_lo[code] = lo
+            self.band_offsets[code] = offsets
+            self.band_values[code] = np.rint(np.clip(goal, 0.0, 1.0) * levels).astype(np.uint16)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            self.star_k[code].nbytes + self.band_lo[code].nbytes + self.band_offsets[code].nbytes + self.band_values[code].nbytes
+            for code in self.goal_codes
+        )
+
+    def contains(self, n: int) -> bool:
+        return 0 < n <= self.max_spins
+
+    # --- 逆引き ---
+    def star_threshold(self, goal_code: str, n: int, stars: int) -> int:
+        """総回転数 n で星が stars 以上になる最小の総小役回数（届かなければ n + 1）"""
+        return int(self.star_k[goal_code][n, min(max(stars, 1), MAX_STARS) - 1])
+
+    def prob_threshold(self, goal_code: str, n: int, prob: float) -> int:
+        """総回転数 n で期待度が prob 以上になる最小の総小役回数（帯の中を二分探索。届かなければ n + 1）"""
+        target = min(max(math.ceil(prob * self.levels - 1e-9), 1), self.levels)
+        lo = int(self.band_lo[goal_code][n])
+        start, end = self.band_offsets[goal_code][n], self.band_offsets[goal_code][n + 1]
+        return lo + int(np.searchsorted(self.band_values[goal_code][start:end], target))
+
+    # --- 順引き ---
+    def stars_at(self, goal_code: str, n: int, k: int) -> int:
+        """(n, k) の星の数"""
+        return int(np.searchsorted(self.star_k[goal_code][n], k, side="right"))
+
+    def prob_at(self, goal_code: str, n: int, k: int) -> float:
+        """(n, k) の期待度（量子化済み）"""
+        lo = int(self.band_lo[goal_code][n])
+        start, end = self.band_offsets[goal_code][n], self.band_offsets[goal_code][n + 1]
+        if k < lo:
+            return 0.0
+        if k >= lo + (end - start):
+            return 1.0
+        return int(self.band_values[goal_code][start + k - lo]) / self.levels
+
+@lru_cache(maxsize=WHATIF_CONFIG["cache_size"])
+def _cached_grid(machine: str, signature: Tuple[float, ...]) -> WhatIfGrid:
+    spec = get_spec(machine)
+    return WhatIfGrid(spec, dict(zip(spec.keys, signature)), WHATIF_CONFIG["max_spins"], WHATIF_CONFIG["levels"])
+
+def get_whatif_grid(priors: Optional[Dict[str, float]] = None, spec=None) -> WhatIfGrid:
+    """機種・事前確率ごとの早見表。プロセス内で1度だけ作る"""
+    spec = spec or get_spec()
+    if priors is None:
+        priors = spec.flat_priors()
+    return _cached_grid(spec.id, prior_signature(priors, spec.keys))
+
+def hits_needed(
+    grid: WhatIfGrid,
+    num_spins: int,
+    num_hits: int,
+    extra_spins: int,
+    goal_code: str,
+    stars: Optional[int] = None,
+    prob: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    あと extra_spins 回したときに目標（星 stars 以上、または期待度 prob 以上）に届く追加の小役回数
+    stars と prob はどちらか一方だけを指定する（それ以外は ValueError）。
+    表の範囲外は None。more は追加で必要な回数、reachable はその回転数の中で届くかどうか。
+    """
+    if (stars is None) == (prob is None):
+        raise ValueError("stars と prob はどちらか一方だけを指定してください")
+    n = num_spins + extra_spins
+    if extra_spins < 0 or not grid.contains(n):
+        return None
+    if stars is not None:
+        k = grid.star_threshold(goal_code, n, stars)
+    else:
+        k = grid.prob_threshold(goal_code, n, prob)
+    more = max(k - num_hits, 0)
+    return {
+        "goal_code": goal_code,
+        "stars": stars,
+        "prob": prob,
+        "spins": n,
+        "hits": k,
+        "more": more,
+        "reachable": more <= extra_spins,
+        # 追加分の当選確率の目安 (1/x)
+        "denominator": extra_spins / more if more > 0 else None,
+    }
+
+def whatif_chart_records(
+    grid: WhatIfGrid,
+    num_spins: int,
+    num_hits: int,
+    extra_max: int,
+    goal_code: str,
+    columns: int = WHATIF_CONFIG["chart_columns"],
+    rows: int = WHATIF_CONFIG["chart_rows"],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    (追加回転数, 追加小役回数) ごとの星のヒートマップのマスと、星3〜5の境界線
+    追加小役回数の方向は、最大の追加回転数で星5に届く回数の少し先までを表示する。
+    """
+    extra_max = min(extra_max, grid.max_spins - num_spins)
+    if extra_max <= 0:
+        return [], []
+    spin_step = max(1, math.ceil(extra_max / columns))
+    spins = list(range(spin_step, extra_max + 1, spin_step))
+    top = grid.star_threshold(goal_code, num_spins + extra_max, MAX_STARS) - num_hits
+    hit_limit = min(max(int(top * 1.2), rows), extra_max)
+    hit_step = max(1, math.ceil(hit_limit / rows))
+
+    cells = []
+    for extra in spins:
+        n = num_spins + extra
+        for more in range(0, min(hit_limit, extra) + 1, hit_step):
+            k = num_hits + more
+            cells.append({
+                "spins": extra,
+                "hits": more,
+                # マスの範囲（この追加回転数までの1刻み × この追加小役回数からの1刻み）
+                "spins_start": extra - spin_step,
+                "hits_end": more + hit_step,
+                "stars": grid.stars_at(goal_code, n, k),
+                "prob": grid.prob_at(goal_code, n, k),
+            })
+    lines = []
+    for stars in (3, 4, MAX_STARS):
+        for extra in [0] + spins:
+            more = max(grid.star_threshold(goal_code, num_spins + extra, stars) - num_hits, 0)
+            if more <= min(extra, hit_limit):
+                lines.append({"spins": extra, "hits": more, "series": f"★{stars}以上"})
+    return cells, lines
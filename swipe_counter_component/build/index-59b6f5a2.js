@@ -0,0 +1,2 @@
+/*! For license information please see index-59b6f5a2.js.LICENSE.txt */
+var t={146:(t,e,i)=>{var n=i(363),r={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},s={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},o={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},a={};function c(t){return n.isMemo(t)?o:a[t.$$typeof]||r}a[n.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},a[n.Memo]=o;var l=Object.defineProperty,u=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,h=Object.getOwnPropertyDescriptor,p=Object.getPrototypeOf,f=Object.prototype;t.exports=function t(e,i,n){if("string"!=typeof i){if(f){var r=p(i);r&&r!==f&&t(e,r,n)}var o=u(i);d&&(o=o.concat(d(i)));for(var a=c(e),y=c(i),b=0;b<o.length;++b){var m=o[b];if(!(s[m]||n&&n[m]||y&&y[m]||a&&a[m])){var g=h(i,m);try{l(e,m,g)}catch(t){}}}}return e}},228:t=>{var e=Object.getOwnPropertySymbols,i=Object.prototype.hasOwnProperty,n=Object.prototype.propertyIsEnumerable;t.exports=function(){try{if(!Object.assign)return!1;var t=new String("abc");if(t[5]="de","5"===Object.getOwnPropertyNames(t)[0])return!1;for(var e={},i=0;i<10;i++)e["_"+String.fromCharCode(i)]=i;if("0123456789"!==Object.getOwnPropertyNames(e).map(function(t){return e[t]}).join(""))return!1;var n={};return"abcdefghijklmnopqrst".split("").forEach(function(t){n[t]=t}),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},n)).join("")}catch(t){return!1}}()?Object.assign:function(t,r){for(var s,o,a=function(t){if(null==t)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(t)}(t),c=1;c<arguments.length;c++){for(var l in s=Object(arguments[c]))i.call(s,l)&&(a[l]=s[l]);if(e){o=e(s);for(var u=0;u<o.length;u++)n.call(s,o[u])&&(a[o[u]]=s[o[u]])}}return a}},287:(t,e,i)=>{var n=i(228),r="function"==typeof Symbol&&Symbol.for;r&&Symbol.for("react.element"),r&&Symbol.for("react.portal"),r&&Symbol.for("react.fragment"),r&&Symbol.for("react.strict_mode"),r&&Symbol.for("react.profiler"),r&&Symbol.for("react.provider"),r&&Symbol.for("react.context"),r&&Symbol.for("react.forward_ref"),r&&Symbol.for("react.suspense"),r&&Symbol.for("react.memo"),r&&Symbol.for("react.lazy"),"function"==typeof Symbol&&Symbol.iterator;function s(t){for(var e="https://reactjs.org/docs/error-decoder.html?invariant="+t,i=1;i<arguments.length;i++)e+="&args[]="+encodeURIComponent(arguments[i]);return"Minified React error #"+t+"; visit "+e+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var o={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},a={};function c(t,e,i){this.props=t,this.context=e,this.refs=a,this.updater=i||o}function l(){}function u(t,e,i){this.props=t,this.context=e,this.refs=a,this.updater=i||o}c.prototype.isReactComponent={},c.prototype.setState=function(t,e){if("object"!=typeof t&&"function"!=typeof t&&null!=t)throw Error(s(85));this.updater.enqueueSetState(this,t,e,"setState")},c.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")},l.prototype=c.prototype;var d=u.prototype=new l;d.constructor=u,n(d,c.prototype),d.isPureReactComponent=!0;Object.prototype.hasOwnProperty;e.PureComponent=u},363:(t,e,i)=>{t.exports=i(799)},395:(t,e,i)=>{i(146);var n,r,s,o,a,c,l,u,d,h=i(540);!function(t){t[t.V1=0]="V1",t[t.V2=1]="V2",t[t.V3=2]="V3",t[t.V4=3]="V4",t[t.V5=4]="V5"}(n||(n={})),function(t){t[t.Sparse=0]="Sparse",t[t.Dense=1]="Dense"}(r||(r={})),function(t){t[t.HALF=0]="HALF",t[t.SINGLE=1]="SINGLE",t[t.DOUBLE=2]="DOUBLE"}(s||(s={})),function(t){t[t.DAY=0]="DAY",t[t.MILLISECOND=1]="MILLISECOND"}(o||(o={})),function(t){t[t.SECOND=0]="SECOND",t[t.MILLISECOND=1]="MILLISECOND",t[t.MICROSECOND=2]="MICROSECOND",t[t.NANOSECOND=3]="NANOSECOND"}(a||(a={})),function(t){t[t.YEAR_MONTH=0]="YEAR_MONTH",t[t.DAY_TIME=1]="DAY_TIME",t[t.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(c||(c={})),function(t){t[t.NONE=0]="NONE",t[t.Schema=1]="Schema",t[t.DictionaryBatch=2]="DictionaryBatch",t[t.RecordBatch=3]="RecordBatch",t[t.Tensor=4]="Tensor",t[t.SparseTensor=5]="SparseTensor"}(l||(l={})),function(t){t[t.NONE=0]="NONE",t[t.Null=1]="Null",t[t.Int=2]="Int",t[t.Float=3]="Float",t[t.Binary=4]="Binary",t[t.Utf8=5]="Utf8",t[t.Bool=6]="Bool",t[t.Decimal=7]="Decimal",t[t.Date=8]="Date",t[t.Time=9]="Time",t[t.Timestamp=10]="Timestamp",t[t.Interval=11]="Interval",t[t.List=12]="List",t[t.Struct=13]="Struct",t[t.Union=14]="Union",t[t.FixedSizeBinary=15]="FixedSizeBinary",t[t.FixedSizeList=16]="FixedSizeList",t[t.Map=17]="Map",t[t.Dictionary=-1]="Dictionary",t[t.Int8=-2]="Int8",t[t.Int16=-3]="Int16",t[t.Int32=-4]="Int32",t[t.Int64=-5]="Int64",t[t.Uint8=-6]="Uint8",t[t.Uint16=-7]="Uint16",t[t.Uint32=-8]="Uint32",t[t.Uint64=-9]="Uint64",t[t.Float16=-10]="Float16",t[t.Float32=-11]="Float32",t[t.Float64=-12]="Float64",t[t.DateDay=-13]="DateDay",t[t.DateMillisecond=-14]="DateMillisecond",t[t.TimestampSecond=-15]="TimestampSecond",t[t.TimestampMillisecond=-16]="TimestampMillisecond",t[t.TimestampMicrosecond=-17]="TimestampMicrosecond",t[t.TimestampNanosecond=-18]="TimestampNanosecond",t[t.TimeSecond=-19]="TimeSecond",t[t.TimeMillisecond=-20]="TimeMillisecond",t[t.TimeMicrosecond=-21]="TimeMicrosecond",t[t.TimeNanosecond=-22]="TimeNanosecond",t[t.DenseUnion=-23]="DenseUnion",t[t.SparseUnion=-24]="SparseUnion",t[t.IntervalDayTime=-25]="IntervalDayTime",t[t.IntervalYearMonth=-26]="IntervalYearMonth"}(u||(u={})),function(t){t[t.OFFSET=0]="OFFSET",t[t.DATA=1]="DATA",t[t.VALIDITY=2]="VALIDITY",t[t.TYPE=3]="TYPE"}(d||(d={}));const[p,f]=(()=>{const t=()=>{throw new Error("BigInt is not available in this environment")};function e(){throw t()}return e.asIntN=()=>{throw t()},e.asUintN=()=>{throw t()},"undefined"!=typeof BigInt?[BigInt,!0]:[e,!1]})(),[y,b]=(()=>{const t=()=>{throw new Error("BigInt64Array is not available in this environment")};return"undefined"!=typeof BigInt64Array?[BigInt64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw t()}static from(){throw t()}constructor(){throw t()}},!1]})(),[m,g]=(()=>{const t=()=>{throw new Error("BigUint64Array is not available in this environment")};return"undefined"!=typeof BigUint64Array?[BigUint64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw t()}static from(){throw t()}constructor(){throw t()}},!1]})(),v=t=>"boolean"==typeof t,_=t=>"function"==typeof t,w=t=>null!=t&&Object(t)===t,I=t=>w(t)&&_(t.then),S=t=>w(t)&&_(t[Symbol.iterator]),T=t=>w(t)&&_(t[Symbol.asyncIterator]),B=t=>w(t)&&w(t.schema),A=t=>w(t)&&"done"in t&&"value"in t,O=t=>w(t)&&_(t.stat)&&(t=>"number"==typeof t)(t.fd),D=t=>w(t)&&F(t.body),M=t=>"_getDOMStream"in t&&"_getNodeStream"in t,F=t=>w(t)&&_(t.cancel)&&_(t.getReader)&&!M(t),x=t=>w(t)&&_(t.read)&&_(t.pipe)&&v(t.readable)&&!M(t);function N(t){if(null===t)return"null";if(void 0===t)return"undefined";switch(typeof t){case"number":case"bigint":return`${t}`;case"string":return`"${t}"`}return"function"==typeof t[Symbol.toPrimitive]?t[Symbol.toPrimitive]("string"):ArrayBuffer.isView(t)?t instanceof y||t instanceof m?`[${[...t].map(t=>N(t))}]`:`[${t}]`:ArrayBuffer.isView(t)?`[${t}]`:JSON.stringify(t,(t,e)=>"bigint"==typeof e?`${e}`:e)}function L(t,e,i,n){return new(i||(i=Promise))(function(r,s){function o(t){try{c(n.next(t))}catch(t){s(t)}}function a(t){try{c(n.throw(t))}catch(t){s(t)}}function c(t){t.done?r(t.value):function(t){return t instanceof i?t:new i(function(e){e(t)})}(t.value).then(o,a)}c((n=n.apply(t,e||[])).next())})}function U(t){return this instanceof U?(this.v=t,this):new U(t)}function C(t,e,i){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var n,r=i.apply(t,e||[]),s=[];return n=Object.create(("function"==typeof AsyncIterator?AsyncIterator:Object).prototype),o("next"),o("throw"),o("return",function(t){return function(e){return Promise.resolve(e).then(t,l)}}),n[Symbol.asyncIterator]=function(){return this},n;function o(t,e){r[t]&&(n[t]=function(e){return new Promise(function(i,n){s.push([t,e,i,n])>1||a(t,e)})},e&&(n[t]=e(n[t])))}function a(t,e){try{(i=r[t](e)).value instanceof U?Promise.resolve(i.value.v).then(c,l):u(s[0][2],i)}catch(t){u(s[0][3],t)}var i}function c(t){a("next",t)}function l(t){a("throw",t)}function u(t,e){t(e),s.shift(),s.length&&a(s[0][0],s[0][1])}}function E(t){var e,i;return e={},n("next"),n("throw",function(t){throw t}),n("return"),e[Symbol.iterator]=function(){return this},e;function n(n,r){e[n]=t[n]?function(e){return(i=!i)?{value:U(t[n](e)),done:!1}:r?r(e):e}:r}}function R(t){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var e,i=t[Symbol.asyncIterator];return i?i.call(t):(t=function(t){var e="function"==typeof Symbol&&Symbol.iterator,i=e&&t[e],n=0;if(i)return i.call(t);if(t&&"number"==typeof t.length)return{next:function(){return t&&n>=t.length&&(t=void 0),{value:t&&t[n++],done:!t}}};throw new TypeError(e?"Object is not iterable.":"Symbol.iterator is not defined.")}(t),e={},n("next"),n("throw"),n("return"),e[Symbol.asyncIterator]=function(){return this},e);function n(i){e[i]=t[i]&&function(e){return new Promise(function(n,r){!function(t,e,i,n){Promise.resolve(n).then(function(e){t({value:e,done:i})},e)}(n,r,(e=t[i](e)).done,e.value)})}}}Object.create,Object.create,"function"==typeof SuppressedError&&SuppressedError;const P=new TextDecoder("utf-8"),V=t=>P.decode(t),j=new TextEncoder,z=t=>j.encode(t),k="undefined"!=typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function $(t,e,i=0,n=e.byteLength){const r=t.byteLength,s=new Uint8Array(t.buffer,t.byteOffset,r),o=new Uint8Array(e.buffer,e.byteOffset,Math.min(n,r));return s.set(o,i),t}function Y(t,e){const i=function(t){const e=t[0]?[t[0]]:[];let i,n,r,s;for(let o,a,c=0,l=0,u=t.length;++c<u;)o=e[l],a=t[c],!o||!a||o.buffer!==a.buffer||a.byteOffset<o.byteOffset?a&&(e[++l]=a):(({byteOffset:i,byteLength:r}=o),({byteOffset:n,byteLength:s}=a),i+r<n||n+s<i?a&&(e[++l]=a):e[l]=new Uint8Array(o.buffer,i,n-i+s));return e}(t),n=i.reduce((t,e)=>t+e.byteLength,0);let r,s,o,a=0,c=-1;const l=Math.min(e||Number.POSITIVE_INFINITY,n);for(const t=i.length;++c<t;){if(r=i[c],s=r.subarray(0,Math.min(r.length,l-a)),l<=a+s.length){s.length<r.length?i[c]=r.subarray(s.length):s.length===r.length&&c++,o?$(o,s,a):o=s;break}$(o||(o=new Uint8Array(l)),s,a),a+=s.length}return[o||new Uint8Array(0),i.slice(c),n-(o?o.byteLength:0)]}function W(t,e){let i=A(e)?e.value:e;return i instanceof t?t===Uint8Array?new t(i.buffer,i.byteOffset,i.byteLength):i:i?("string"==typeof i&&(i=z(i)),i instanceof ArrayBuffer||i instanceof k?new t(i):w(n=i)&&_(n.clear)&&_(n.bytes)&&_(n.position)&&_(n.setPosition)&&_(n.capacity)&&_(n.getBufferIdentifier)&&_(n.createLong)?W(t,i.bytes()):ArrayBuffer.isView(i)?i.byteLength<=0?new t(0):new t(i.buffer,i.byteOffset,i.byteLength/t.BYTES_PER_ELEMENT):t.from(i)):new t(0);var n}const H=t=>W(Int32Array,t),K=t=>W(Uint8Array,t),J=t=>(t.next(),t);function q(t,e){return C(this,arguments,function*(){if(I(e))return yield U(yield U(yield*E(R(q(t,yield U(e))))));const i=function(t){return C(this,arguments,function*(){yield yield U(yield U(t))})},n="string"==typeof e||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof k?i(e):S(e)?function(t){return C(this,arguments,function*(){yield U(yield*E(R(J(function*(t){let e=null;do{e=t.next(yield null==e?void 0:e.value)}while(!e.done)}(t[Symbol.iterator]())))))})}(e):T(e)?e:i(e);return yield U(yield*E(R(J(function(e){return C(this,arguments,function*(){let i=null;do{i=yield U(e.next(yield yield U(W(t,i))))}while(!i.done)})}(n[Symbol.asyncIterator]()))))),yield U(new t)})}function G(t,e,i){if(0!==t){i=i.slice(0,e+1);for(let n=-1;++n<=e;)i[n]+=t}return i}const Z=Symbol.for("isArrowBigNum");function Q(t,...e){return 0===e.length?Object.setPrototypeOf(W(this.TypedArray,t),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(t,...e),this.constructor.prototype)}function X(...t){return Q.apply(this,t)}function tt(...t){return Q.apply(this,t)}function et(...t){return Q.apply(this,t)}function it(t){const{buffer:e,byteOffset:i,length:n,signed:r}=t,s=new m(e,i,n),o=r&&s[s.length-1]&BigInt(1)<<BigInt(63);let a=o?BigInt(1):BigInt(0),c=BigInt(0);if(o){for(const t of s)a+=~t*(BigInt(1)<<BigInt(32)*c++);a*=BigInt(-1)}else for(const t of s)a+=t*(BigInt(1)<<BigInt(32)*c++);return a}let nt,rt;function st(t){let e="";const i=new Uint32Array(2);let n=new Uint16Array(t.buffer,t.byteOffset,t.byteLength/2);const r=new Uint32Array((n=new Uint16Array(n).reverse()).buffer);let s=-1;const o=n.length-1;do{for(i[0]=n[s=0];s<o;)n[s++]=i[1]=i[0]/10,i[0]=(i[0]-10*i[1]<<16)+n[s];n[s]=i[1]=i[0]/10,i[0]=i[0]-10*i[1],e=`${i[0]}${e}`}while(r[0]||r[1]||r[2]||r[3]);return null!=e?e:"0"}Q.prototype[Z]=!0,Q.prototype.toJSON=function(){return`"${nt(this)}"`},Q.prototype.valueOf=function(){return it(this)},Q.prototype.toString=function(){return nt(this)},Q.prototype[Symbol.toPrimitive]=function(t="default"){switch(t){case"number":return it(this);case"string":return nt(this);case"default":return rt(this)}return nt(this)},Object.setPrototypeOf(X.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(tt.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(et.prototype,Object.create(Uint32Array.prototype)),Object.assign(X.prototype,Q.prototype,{constructor:X,signed:!0,TypedArray:Int32Array,BigIntArray:y}),Object.assign(tt.prototype,Q.prototype,{constructor:tt,signed:!1,TypedArray:Uint32Array,BigIntArray:m}),Object.assign(et.prototype,Q.prototype,{constructor:et,signed:!0,TypedArray:Uint32Array,BigIntArray:m}),f?(rt=t=>8===t.byteLength?new t.BigIntArray(t.buffer,t.byteOffset,1)[0]:st(t),nt=t=>8===t.byteLength?`${new t.BigIntArray(t.buffer,t.byteOffset,1)[0]}`:st(t)):(nt=st,rt=nt);class ot{static new(t,e){switch(e){case!0:return new X(t);case!1:return new tt(t)}switch(t.constructor){case Int8Array:case Int16Array:case Int32Array:case y:return new X(t)}return 16===t.byteLength?new et(t):new tt(t)}static signed(t){return new X(t)}static unsigned(t){return new tt(t)}static decimal(t){return new et(t)}constructor(t,e){return ot.new(t,e)}}var at,ct,lt,ut,dt,ht,pt,ft,yt,bt,mt,gt,vt,_t,wt,It,St,Tt,Bt,At;class Ot{static isNull(t){return(null==t?void 0:t.typeId)===u.Null}static isInt(t){return(null==t?void 0:t.typeId)===u.Int}static isFloat(t){return(null==t?void 0:t.typeId)===u.Float}static isBinary(t){return(null==t?void 0:t.typeId)===u.Binary}static isUtf8(t){return(null==t?void 0:t.typeId)===u.Utf8}static isBool(t){return(null==t?void 0:t.typeId)===u.Bool}static isDecimal(t){return(null==t?void 0:t.typeId)===u.Decimal}static isDate(t){return(null==t?void 0:t.typeId)===u.Date}static isTime(t){return(null==t?void 0:t.typeId)===u.Time}static isTimestamp(t){return(null==t?void 0:t.typeId)===u.Timestamp}static isInterval(t){return(null==t?void 0:t.typeId)===u.Interval}static isList(t){return(null==t?void 0:t.typeId)===u.List}static isStruct(t){return(null==t?void 0:t.typeId)===u.Struct}static isUnion(t){return(null==t?void 0:t.typeId)===u.Union}static isFixedSizeBinary(t){return(null==t?void 0:t.typeId)===u.FixedSizeBinary}static isFixedSizeList(t){return(null==t?void 0:t.typeId)===u.FixedSizeList}static isMap(t){return(null==t?void 0:t.typeId)===u.Map}static isDictionary(t){return(null==t?void 0:t.typeId)===u.Dictionary}static isDenseUnion(t){return Ot.isUnion(t)&&t.mode===r.Dense}static isSparseUnion(t){return Ot.isUnion(t)&&t.mode===r.Sparse}get typeId(){return u.NONE}}at=Symbol.toStringTag,Ot[at]=((At=Ot.prototype).children=null,At.ArrayType=Array,At[Symbol.toStringTag]="DataType");class Dt extends Ot{toString(){return"Null"}get typeId(){return u.Null}}ct=Symbol.toStringTag,Dt[ct]=(t=>t[Symbol.toStringTag]="Null")(Dt.prototype);class Mt extends Ot{constructor(t,e){super(),this.isSigned=t,this.bitWidth=e}get typeId(){return u.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?y:m}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}lt=Symbol.toStringTag,Mt[lt]=(t=>(t.isSigned=null,t.bitWidth=null,t[Symbol.toStringTag]="Int"))(Mt.prototype);class Ft extends Mt{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}Object.defineProperty(class extends Mt{constructor(){super(!0,8)}get ArrayType(){return Int8Array}}.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(class extends Mt{constructor(){super(!0,16)}get ArrayType(){return Int16Array}}.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(Ft.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(class extends Mt{constructor(){super(!0,64)}get ArrayType(){return y}}.prototype,"ArrayType",{value:y}),Object.defineProperty(class extends Mt{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}}.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(class extends Mt{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends Mt{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}}.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(class extends Mt{constructor(){super(!1,64)}get ArrayType(){return m}}.prototype,"ArrayType",{value:m});class xt extends Ot{constructor(t){super(),this.precision=t}get typeId(){return u.Float}get ArrayType(){switch(this.precision){case s.HALF:return Uint16Array;case s.SINGLE:return Float32Array;case s.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}ut=Symbol.toStringTag,xt[ut]=(t=>(t.precision=null,t[Symbol.toStringTag]="Float"))(xt.prototype),Object.defineProperty(class extends xt{constructor(){super(s.HALF)}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends xt{constructor(){super(s.SINGLE)}}.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(class extends xt{constructor(){super(s.DOUBLE)}}.prototype,"ArrayType",{value:Float64Array});class Nt extends Ot{constructor(){super()}get typeId(){return u.Binary}toString(){return"Binary"}}dt=Symbol.toStringTag,Nt[dt]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Binary"))(Nt.prototype);class Lt extends Ot{constructor(){super()}get typeId(){return u.Utf8}toString(){return"Utf8"}}ht=Symbol.toStringTag,Lt[ht]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Utf8"))(Lt.prototype);class Ut extends Ot{constructor(){super()}get typeId(){return u.Bool}toString(){return"Bool"}}pt=Symbol.toStringTag,Ut[pt]=(t=>(t.ArrayType=Uint8Array,t[Symbol.toStringTag]="Bool"))(Ut.prototype);class Ct extends Ot{constructor(t,e,i=128){super(),this.scale=t,this.precision=e,this.bitWidth=i}get typeId(){return u.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}}ft=Symbol.toStringTag,Ct[ft]=(t=>(t.scale=null,t.precision=null,t.ArrayType=Uint32Array,t[Symbol.toStringTag]="Decimal"))(Ct.prototype);class Et extends Ot{constructor(t){super(),this.unit=t}get typeId(){return u.Date}toString(){return`Date${32*(this.unit+1)}<${o[this.unit]}>`}}yt=Symbol.toStringTag,Et[yt]=(t=>(t.unit=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Date"))(Et.prototype);class Rt extends Ot{constructor(t,e){super(),this.unit=t,this.bitWidth=e}get typeId(){return u.Time}toString(){return`Time${this.bitWidth}<${a[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return y}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}bt=Symbol.toStringTag,Rt[bt]=(t=>(t.unit=null,t.bitWidth=null,t[Symbol.toStringTag]="Time"))(Rt.prototype);class Pt extends Ot{constructor(t,e){super(),this.unit=t,this.timezone=e}get typeId(){return u.Timestamp}toString(){return`Timestamp<${a[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}mt=Symbol.toStringTag,Pt[mt]=(t=>(t.unit=null,t.timezone=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Timestamp"))(Pt.prototype);class Vt extends Ot{constructor(t){super(),this.unit=t}get typeId(){return u.Interval}toString(){return`Interval<${c[this.unit]}>`}}gt=Symbol.toStringTag,Vt[gt]=(t=>(t.unit=null,t.ArrayType=Int32Array,t[Symbol.toStringTag]="Interval"))(Vt.prototype);class jt extends Ot{constructor(t){super(),this.children=[t]}get typeId(){return u.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}vt=Symbol.toStringTag,jt[vt]=(t=>(t.children=null,t[Symbol.toStringTag]="List"))(jt.prototype);class zt extends Ot{constructor(t){super(),this.children=t}get typeId(){return u.Struct}toString(){return`Struct<{${this.children.map(t=>`${t.name}:${t.type}`).join(", ")}}>`}}_t=Symbol.toStringTag,zt[_t]=(t=>(t.children=null,t[Symbol.toStringTag]="Struct"))(zt.prototype);class kt extends Ot{constructor(t,e,i){super(),this.mode=t,this.children=i,this.typeIds=e=Int32Array.from(e),this.typeIdToChildIndex=e.reduce((t,e,i)=>(t[e]=i)&&t||t,Object.create(null))}get typeId(){return u.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map(t=>`${t.type}`).join(" | ")}>`}}wt=Symbol.toStringTag,kt[wt]=(t=>(t.mode=null,t.typeIds=null,t.children=null,t.typeIdToChildIndex=null,t.ArrayType=Int8Array,t[Symbol.toStringTag]="Union"))(kt.prototype);class $t extends Ot{constructor(t){super(),this.byteWidth=t}get typeId(){return u.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}}It=Symbol.toStringTag,$t[It]=(t=>(t.byteWidth=null,t.ArrayType=Uint8Array,t[Symbol.toStringTag]="FixedSizeBinary"))($t.prototype);class Yt extends Ot{constructor(t,e){super(),this.listSize=t,this.children=[e]}get typeId(){return u.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}}St=Symbol.toStringTag,Yt[St]=(t=>(t.children=null,t.listSize=null,t[Symbol.toStringTag]="FixedSizeList"))(Yt.prototype);class Wt extends Ot{constructor(t,e=!1){super(),this.children=[t],this.keysSorted=e}get typeId(){return u.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map(t=>`${t.name}:${t.type}`).join(", ")}}>`}}Tt=Symbol.toStringTag,Wt[Tt]=(t=>(t.children=null,t.keysSorted=null,t[Symbol.toStringTag]="Map_"))(Wt.prototype);const Ht=(Kt=-1,()=>++Kt);var Kt;class Jt extends Ot{constructor(t,e,i,n){super(),this.indices=e,this.dictionary=t,this.isOrdered=n||!1,this.id=null==i?Ht():"number"==typeof i?i:i.low}get typeId(){return u.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}function qt(t){const e=t;switch(t.typeId){case u.Decimal:return t.bitWidth/32;case u.Timestamp:return 2;case u.Date:case u.Interval:return 1+e.unit;case u.FixedSizeList:return e.listSize;case u.FixedSizeBinary:return e.byteWidth;default:return 1}}Bt=Symbol.toStringTag,Jt[Bt]=(t=>(t.id=null,t.indices=null,t.isOrdered=null,t.dictionary=null,t[Symbol.toStringTag]="Dictionary"))(Jt.prototype);class Gt{visitMany(t,...e){return t.map((t,i)=>this.visit(t,...e.map(t=>t[i])))}visit(...t){return this.getVisitFn(t[0],!1).apply(this,t)}getVisitFn(t,e=!0){return function(t,e,i=!0){return"number"==typeof e?Zt(t,e,i):"string"==typeof e&&e in u?Zt(t,u[e],i):e&&e instanceof Ot?Zt(t,Qt(e),i):(null==e?void 0:e.type)&&e.type instanceof Ot?Zt(t,Qt(e.type),i):Zt(t,u.NONE,i)}(this,t,e)}getVisitFnByTypeId(t,e=!0){return Zt(this,t,e)}visitNull(t,...e){return null}visitBool(t,...e){return null}visitInt(t,...e){return null}visitFloat(t,...e){return null}visitUtf8(t,...e){return null}visitBinary(t,...e){return null}visitFixedSizeBinary(t,...e){return null}visitDate(t,...e){return null}visitTimestamp(t,...e){return null}visitTime(t,...e){return null}visitDecimal(t,...e){return null}visitList(t,...e){return null}visitStruct(t,...e){return null}visitUnion(t,...e){return null}visitDictionary(t,...e){return null}visitInterval(t,...e){return null}visitFixedSizeList(t,...e){return null}visitMap(t,...e){return null}}function Zt(t,e,i=!0){let n=null;switch(e){case u.Null:n=t.visitNull;break;case u.Bool:n=t.visitBool;break;case u.Int:n=t.visitInt;break;case u.Int8:n=t.visitInt8||t.visitInt;break;case u.Int16:n=t.visitInt16||t.visitInt;break;case u.Int32:n=t.visitInt32||t.visitInt;break;case u.Int64:n=t.visitInt64||t.visitInt;break;case u.Uint8:n=t.visitUint8||t.visitInt;break;case u.Uint16:n=t.visitUint16||t.visitInt;break;case u.Uint32:n=t.visitUint32||t.visitInt;break;case u.Uint64:n=t.visitUint64||t.visitInt;break;case u.Float:n=t.visitFloat;break;case u.Float16:n=t.visitFloat16||t.visitFloat;break;case u.Float32:n=t.visitFloat32||t.visitFloat;break;case u.Float64:n=t.visitFloat64||t.visitFloat;break;case u.Utf8:n=t.visitUtf8;break;case u.Binary:n=t.visitBinary;break;case u.FixedSizeBinary:n=t.visitFixedSizeBinary;break;case u.Date:n=t.visitDate;break;case u.DateDay:n=t.visitDateDay||t.visitDate;break;case u.DateMillisecond:n=t.visitDateMillisecond||t.visitDate;break;case u.Timestamp:n=t.visitTimestamp;break;case u.TimestampSecond:n=t.visitTimestampSecond||t.visitTimestamp;break;case u.TimestampMillisecond:n=t.visitTimestampMillisecond||t.visitTimestamp;break;case u.TimestampMicrosecond:n=t.visitTimestampMicrosecond||t.visitTimestamp;break;case u.TimestampNanosecond:n=t.visitTimestampNanosecond||t.visitTimestamp;break;case u.Time:n=t.visitTime;break;case u.TimeSecond:n=t.visitTimeSecond||t.visitTime;break;case u.TimeMillisecond:n=t.visitTimeMillisecond||t.visitTime;break;case u.TimeMicrosecond:n=t.visitTimeMicrosecond||t.visitTime;break;case u.TimeNanosecond:n=t.visitTimeNanosecond||t.visitTime;break;case u.Decimal:n=t.visitDecimal;break;case u.List:n=t.visitList;break;case u.Struct:n=t.visitStruct;break;case u.Union:n=t.visitUnion;break;case u.DenseUnion:n=t.visitDenseUnion||t.visitUnion;break;case u.SparseUnion:n=t.visitSparseUnion||t.visitUnion;break;case u.Dictionary:n=t.visitDictionary;break;case u.Interval:n=t.visitInterval;break;case u.IntervalDayTime:n=t.visitIntervalDayTime||t.visitInterval;break;case u.IntervalYearMonth:n=t.visitIntervalYearMonth||t.visitInterval;break;case u.FixedSizeList:n=t.visitFixedSizeList;break;case u.Map:n=t.visitMap}if("function"==typeof n)return n;if(!i)return()=>null;throw new Error(`Unrecognized type '${u[e]}'`)}function Qt(t){switch(t.typeId){case u.Null:return u.Null;case u.Int:{const{bitWidth:e,isSigned:i}=t;switch(e){case 8:return i?u.Int8:u.Uint8;case 16:return i?u.Int16:u.Uint16;case 32:return i?u.Int32:u.Uint32;case 64:return i?u.Int64:u.Uint64}return u.Int}case u.Float:switch(t.precision){case s.HALF:return u.Float16;case s.SINGLE:return u.Float32;case s.DOUBLE:return u.Float64}return u.Float;case u.Binary:return u.Binary;case u.Utf8:return u.Utf8;case u.Bool:return u.Bool;case u.Decimal:return u.Decimal;case u.Time:switch(t.unit){case a.SECOND:return u.TimeSecond;case a.MILLISECOND:return u.TimeMillisecond;case a.MICROSECOND:return u.TimeMicrosecond;case a.NANOSECOND:return u.TimeNanosecond}return u.Time;case u.Timestamp:switch(t.unit){case a.SECOND:return u.TimestampSecond;case a.MILLISECOND:return u.TimestampMillisecond;case a.MICROSECOND:return u.TimestampMicrosecond;case a.NANOSECOND:return u.TimestampNanosecond}return u.Timestamp;case u.Date:switch(t.unit){case o.DAY:return u.DateDay;case o.MILLISECOND:return u.DateMillisecond}return u.Date;case u.Interval:switch(t.unit){case c.DAY_TIME:return u.IntervalDayTime;case c.YEAR_MONTH:return u.IntervalYearMonth}return u.Interval;case u.Map:return u.Map;case u.List:return u.List;case u.Struct:return u.Struct;case u.Union:switch(t.mode){case r.Dense:return u.DenseUnion;case r.Sparse:return u.SparseUnion}return u.Union;case u.FixedSizeBinary:return u.FixedSizeBinary;case u.FixedSizeList:return u.FixedSizeList;case u.Dictionary:return u.Dictionary}throw new Error(`Unrecognized type '${u[t.typeId]}'`)}Gt.prototype.visitInt8=null,Gt.prototype.visitInt16=null,Gt.prototype.visitInt32=null,Gt.prototype.visitInt64=null,Gt.prototype.visitUint8=null,Gt.prototype.visitUint16=null,Gt.prototype.visitUint32=null,Gt.prototype.visitUint64=null,Gt.prototype.visitFloat16=null,Gt.prototype.visitFloat32=null,Gt.prototype.visitFloat64=null,Gt.prototype.visitDateDay=null,Gt.prototype.visitDateMillisecond=null,Gt.prototype.visitTimestampSecond=null,Gt.prototype.visitTimestampMillisecond=null,Gt.prototype.visitTimestampMicrosecond=null,Gt.prototype.visitTimestampNanosecond=null,Gt.prototype.visitTimeSecond=null,Gt.prototype.visitTimeMillisecond=null,Gt.prototype.visitTimeMicrosecond=null,Gt.prototype.visitTimeNanosecond=null,Gt.prototype.visitDenseUnion=null,Gt.prototype.visitSparseUnion=null,Gt.prototype.visitIntervalDayTime=null,Gt.prototype.visitIntervalYearMonth=null;const Xt=new Float64Array(1),te=new Uint32Array(Xt.buffer);function ee(t){const e=(31744&t)>>10,i=(1023&t)/1024,n=Math.pow(-1,(32768&t)>>15);switch(e){case 31:return n*(i?Number.NaN:1/0);case 0:return n*(i?6103515625e-14*i:0)}return n*Math.pow(2,e-15)*(1+i)}class ie extends Gt{}function ne(t){return(e,i,n)=>{if(e.setValid(i,null!=n))return t(e,i,n)}}const re=(t,e,i)=>{t[e]=Math.trunc(i%4294967296),t[e+1]=Math.trunc(i/4294967296)},se=(t,e,i,n)=>{if(i+1<e.length){const{[i]:r,[i+1]:s}=e;t.set(n.subarray(0,s-r),r)}},oe=({values:t},e,i)=>{t[e]=i},ae=({values:t},e,i)=>{t[e]=i},ce=({values:t},e,i)=>{t[e]=function(t){if(t!=t)return 32256;Xt[0]=t;const e=(2147483648&te[1])>>16&65535;let i=2146435072&te[1],n=0;return i>=1089470464?te[0]>0?i=31744:(i=(2080374784&i)>>16,n=(1048575&te[1])>>10):i<=1056964608?(n=1048576+(1048575&te[1]),n=1048576+(n<<(i>>20)-998)>>21,i=0):(i=i-1056964608>>10,n=512+(1048575&te[1])>>10),e|i|65535&n}(i)},le=({values:t},e,i)=>{((t,e,i)=>{t[e]=Math.trunc(i/864e5)})(t,e,i.valueOf())},ue=({values:t},e,i)=>{re(t,2*e,i.valueOf())},de=({values:t},e,i)=>re(t,2*e,i/1e3),he=({values:t},e,i)=>re(t,2*e,i),pe=({values:t},e,i)=>((t,e,i)=>{t[e]=Math.trunc(1e3*i%4294967296),t[e+1]=Math.trunc(1e3*i/4294967296)})(t,2*e,i),fe=({values:t},e,i)=>((t,e,i)=>{t[e]=Math.trunc(1e6*i%4294967296),t[e+1]=Math.trunc(1e6*i/4294967296)})(t,2*e,i),ye=({values:t},e,i)=>{t[e]=i},be=({values:t},e,i)=>{t[e]=i},me=({values:t},e,i)=>{t[e]=i},ge=({values:t},e,i)=>{t[e]=i},ve=(t,e,i)=>{const n=t.type.typeIdToChildIndex[t.typeIds[e]],r=t.children[n];Se.visit(r,t.valueOffsets[e],i)},_e=(t,e,i)=>{const n=t.type.typeIdToChildIndex[t.typeIds[e]],r=t.children[n];Se.visit(r,e,i)},we=({values:t},e,i)=>{t.set(i.subarray(0,2),2*e)},Ie=({values:t},e,i)=>{t[e]=12*i[0]+i[1]%12};ie.prototype.visitBool=ne(({offset:t,values:e},i,n)=>{const r=t+i;n?e[r>>3]|=1<<r%8:e[r>>3]&=~(1<<r%8)}),ie.prototype.visitInt=ne(oe),ie.prototype.visitInt8=ne(oe),ie.prototype.visitInt16=ne(oe),ie.prototype.visitInt32=ne(oe),ie.prototype.visitInt64=ne(oe),ie.prototype.visitUint8=ne(oe),ie.prototype.visitUint16=ne(oe),ie.prototype.visitUint32=ne(oe),ie.prototype.visitUint64=ne(oe),ie.prototype.visitFloat=ne((t,e,i)=>{switch(t.type.precision){case s.HALF:return ce(t,e,i);case s.SINGLE:case s.DOUBLE:return ae(t,e,i)}}),ie.prototype.visitFloat16=ne(ce),ie.prototype.visitFloat32=ne(ae),ie.prototype.visitFloat64=ne(ae),ie.prototype.visitUtf8=ne(({values:t,valueOffsets:e},i,n)=>{se(t,e,i,z(n))}),ie.prototype.visitBinary=ne(({values:t,valueOffsets:e},i,n)=>se(t,e,i,n)),ie.prototype.visitFixedSizeBinary=ne(({stride:t,values:e},i,n)=>{e.set(n.subarray(0,t),t*i)}),ie.prototype.visitDate=ne((t,e,i)=>{t.type.unit===o.DAY?le(t,e,i):ue(t,e,i)}),ie.prototype.visitDateDay=ne(le),ie.prototype.visitDateMillisecond=ne(ue),ie.prototype.visitTimestamp=ne((t,e,i)=>{switch(t.type.unit){case a.SECOND:return de(t,e,i);case a.MILLISECOND:return he(t,e,i);case a.MICROSECOND:return pe(t,e,i);case a.NANOSECOND:return fe(t,e,i)}}),ie.prototype.visitTimestampSecond=ne(de),ie.prototype.visitTimestampMillisecond=ne(he),ie.prototype.visitTimestampMicrosecond=ne(pe),ie.prototype.visitTimestampNanosecond=ne(fe),ie.prototype.visitTime=ne((t,e,i)=>{switch(t.type.unit){case a.SECOND:return ye(t,e,i);case a.MILLISECOND:return be(t,e,i);case a.MICROSECOND:return me(t,e,i);case a.NANOSECOND:return ge(t,e,i)}}),ie.prototype.visitTimeSecond=ne(ye),ie.prototype.visitTimeMillisecond=ne(be),ie.prototype.visitTimeMicrosecond=ne(me),ie.prototype.visitTimeNanosecond=ne(ge),ie.prototype.visitDecimal=ne(({values:t,stride:e},i,n)=>{t.set(n.subarray(0,e),e*i)}),ie.prototype.visitList=ne((t,e,i)=>{const n=t.children[0],r=t.valueOffsets,s=Se.getVisitFn(n);if(Array.isArray(i))for(let t=-1,o=r[e],a=r[e+1];o<a;)s(n,o++,i[++t]);else for(let t=-1,o=r[e],a=r[e+1];o<a;)s(n,o++,i.get(++t))}),ie.prototype.visitStruct=ne((t,e,i)=>{const n=t.type.children.map(t=>Se.getVisitFn(t.type)),r=i instanceof Map?(s=e,o=i,(t,e,i,n)=>e&&t(e,s,o.get(i.name))):i instanceof ji?((t,e)=>(i,n,r,s)=>n&&i(n,t,e.get(s)))(e,i):Array.isArray(i)?((t,e)=>(i,n,r,s)=>n&&i(n,t,e[s]))(e,i):((t,e)=>(i,n,r,s)=>n&&i(n,t,e[r.name]))(e,i);var s,o;t.type.children.forEach((e,i)=>r(n[i],t.children[i],e,i))}),ie.prototype.visitUnion=ne((t,e,i)=>{t.type.mode===r.Dense?ve(t,e,i):_e(t,e,i)}),ie.prototype.visitDenseUnion=ne(ve),ie.prototype.visitSparseUnion=ne(_e),ie.prototype.visitDictionary=ne((t,e,i)=>{var n;null===(n=t.dictionary)||void 0===n||n.set(t.values[e],i)}),ie.prototype.visitInterval=ne((t,e,i)=>{t.type.unit===c.DAY_TIME?we(t,e,i):Ie(t,e,i)}),ie.prototype.visitIntervalDayTime=ne(we),ie.prototype.visitIntervalYearMonth=ne(Ie),ie.prototype.visitFixedSizeList=ne((t,e,i)=>{const{stride:n}=t,r=t.children[0],s=Se.getVisitFn(r);if(Array.isArray(i))for(let t=-1,o=e*n;++t<n;)s(r,o+t,i[t]);else for(let t=-1,o=e*n;++t<n;)s(r,o+t,i.get(t))}),ie.prototype.visitMap=ne((t,e,i)=>{const n=t.children[0],{valueOffsets:r}=t,s=Se.getVisitFn(n);let{[e]:o,[e+1]:a}=r;const c=i instanceof Map?i.entries():Object.entries(i);for(const t of c)if(s(n,o,t),++o>=a)break});const Se=new ie,Te=Symbol.for("parent"),Be=Symbol.for("rowIndex");class Ae{constructor(t,e){return this[Te]=t,this[Be]=e,new Proxy(this,new De)}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[Be],e=this[Te],i=e.type.children,n={};for(let r=-1,s=i.length;++r<s;)n[i[r].name]=Ge.visit(e.children[r],t);return n}toString(){return`{${[...this].map(([t,e])=>`${N(t)}: ${N(e)}`).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Oe(this[Te],this[Be])}}class Oe{constructor(t,e){this.childIndex=0,this.children=t.children,this.rowIndex=e,this.childFields=t.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const t=this.childIndex;return t<this.numChildren?(this.childIndex=t+1,{done:!1,value:[this.childFields[t].name,Ge.visit(this.children[t],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(Ae.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Te]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Be]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class De{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[Te].type.children.map(t=>t.name)}has(t,e){return-1!==t[Te].type.children.findIndex(t=>t.name===e)}getOwnPropertyDescriptor(t,e){if(-1!==t[Te].type.children.findIndex(t=>t.name===e))return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const i=t[Te].type.children.findIndex(t=>t.name===e);if(-1!==i){const n=Ge.visit(t[Te].children[i],t[Be]);return Reflect.set(t,e,n),n}}set(t,e,i){const n=t[Te].type.children.findIndex(t=>t.name===e);return-1!==n?(Se.visit(t[Te].children[n],t[Be],i),Reflect.set(t,e,i)):!(!Reflect.has(t,e)&&"symbol"!=typeof e)&&Reflect.set(t,e,i)}}class Me extends Gt{}function Fe(t){return(e,i)=>e.getValid(i)?t(e,i):null}const xe=(t,e)=>4294967296*t[e+1]+(t[e]>>>0),Ne=t=>new Date(t),Le=(t,e,i)=>{if(i+1>=e.length)return null;const n=e[i],r=e[i+1];return t.subarray(n,r)},Ue=({values:t},e)=>((t,e)=>Ne(((t,e)=>864e5*t[e])(t,e)))(t,e),Ce=({values:t},e)=>((t,e)=>Ne(xe(t,e)))(t,2*e),Ee=({stride:t,values:e},i)=>e[t*i],Re=({values:t},e)=>t[e],Pe=({values:t},e)=>1e3*xe(t,2*e),Ve=({values:t},e)=>xe(t,2*e),je=({values:t},e)=>((t,e)=>t[e+1]/1e3*4294967296+(t[e]>>>0)/1e3)(t,2*e),ze=({values:t},e)=>((t,e)=>t[e+1]/1e6*4294967296+(t[e]>>>0)/1e6)(t,2*e),ke=({values:t},e)=>t[e],$e=({values:t},e)=>t[e],Ye=({values:t},e)=>t[e],We=({values:t},e)=>t[e],He=(t,e)=>{const i=t.type.typeIdToChildIndex[t.typeIds[e]],n=t.children[i];return Ge.visit(n,t.valueOffsets[e])},Ke=(t,e)=>{const i=t.type.typeIdToChildIndex[t.typeIds[e]],n=t.children[i];return Ge.visit(n,e)},Je=({values:t},e)=>t.subarray(2*e,2*(e+1)),qe=({values:t},e)=>{const i=t[e],n=new Int32Array(2);return n[0]=Math.trunc(i/12),n[1]=Math.trunc(i%12),n};Me.prototype.visitNull=Fe((t,e)=>null),Me.prototype.visitBool=Fe(({offset:t,values:e},i)=>{const n=t+i;return!!(e[n>>3]&1<<n%8)}),Me.prototype.visitInt=Fe(({values:t},e)=>t[e]),Me.prototype.visitInt8=Fe(Ee),Me.prototype.visitInt16=Fe(Ee),Me.prototype.visitInt32=Fe(Ee),Me.prototype.visitInt64=Fe(Re),Me.prototype.visitUint8=Fe(Ee),Me.prototype.visitUint16=Fe(Ee),Me.prototype.visitUint32=Fe(Ee),Me.prototype.visitUint64=Fe(Re),Me.prototype.visitFloat=Fe(({type:t,values:e},i)=>t.precision!==s.HALF?e[i]:ee(e[i])),Me.prototype.visitFloat16=Fe(({stride:t,values:e},i)=>ee(e[t*i])),Me.prototype.visitFloat32=Fe(Ee),Me.prototype.visitFloat64=Fe(Ee),Me.prototype.visitUtf8=Fe(({values:t,valueOffsets:e},i)=>{const n=Le(t,e,i);return null!==n?V(n):null}),Me.prototype.visitBinary=Fe(({values:t,valueOffsets:e},i)=>Le(t,e,i)),Me.prototype.visitFixedSizeBinary=Fe(({stride:t,values:e},i)=>e.subarray(t*i,t*(i+1))),Me.prototype.visitDate=Fe((t,e)=>t.type.unit===o.DAY?Ue(t,e):Ce(t,e)),Me.prototype.visitDateDay=Fe(Ue),Me.prototype.visitDateMillisecond=Fe(Ce),Me.prototype.visitTimestamp=Fe((t,e)=>{switch(t.type.unit){case a.SECOND:return Pe(t,e);case a.MILLISECOND:return Ve(t,e);case a.MICROSECOND:return je(t,e);case a.NANOSECOND:return ze(t,e)}}),Me.prototype.visitTimestampSecond=Fe(Pe),Me.prototype.visitTimestampMillisecond=Fe(Ve),Me.prototype.visitTimestampMicrosecond=Fe(je),Me.prototype.visitTimestampNanosecond=Fe(ze),Me.prototype.visitTime=Fe((t,e)=>{switch(t.type.unit){case a.SECOND:return ke(t,e);case a.MILLISECOND:return $e(t,e);case a.MICROSECOND:return Ye(t,e);case a.NANOSECOND:return We(t,e)}}),Me.prototype.visitTimeSecond=Fe(ke),Me.prototype.visitTimeMillisecond=Fe($e),Me.prototype.visitTimeMicrosecond=Fe(Ye),Me.prototype.visitTimeNanosecond=Fe(We),Me.prototype.visitDecimal=Fe(({values:t,stride:e},i)=>ot.decimal(t.subarray(e*i,e*(i+1)))),Me.prototype.visitList=Fe((t,e)=>{const{valueOffsets:i,stride:n,children:r}=t,{[e*n]:s,[e*n+1]:o}=i,a=r[0].slice(s,o-s);return new ji([a])}),Me.prototype.visitStruct=Fe((t,e)=>new Ae(t,e)),Me.prototype.visitUnion=Fe((t,e)=>t.type.mode===r.Dense?He(t,e):Ke(t,e)),Me.prototype.visitDenseUnion=Fe(He),Me.prototype.visitSparseUnion=Fe(Ke),Me.prototype.visitDictionary=Fe((t,e)=>{var i;return null===(i=t.dictionary)||void 0===i?void 0:i.get(t.values[e])}),Me.prototype.visitInterval=Fe((t,e)=>t.type.unit===c.DAY_TIME?Je(t,e):qe(t,e)),Me.prototype.visitIntervalDayTime=Fe(Je),Me.prototype.visitIntervalYearMonth=Fe(qe),Me.prototype.visitFixedSizeList=Fe((t,e)=>{const{stride:i,children:n}=t,r=n[0].slice(e*i,i);return new ji([r])}),Me.prototype.visitMap=Fe((t,e)=>{const{valueOffsets:i,children:n}=t,{[e]:r,[e+1]:s}=i,o=n[0];return new Xe(o.slice(r,s-r))});const Ge=new Me,Ze=Symbol.for("keys"),Qe=Symbol.for("vals");class Xe{constructor(t){return this[Ze]=new ji([t.children[0]]).memoize(),this[Qe]=t.children[1],new Proxy(this,new ei)}[Symbol.iterator](){return new ti(this[Ze],this[Qe])}get size(){return this[Ze].length}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[Ze],e=this[Qe],i={};for(let n=-1,r=t.length;++n<r;)i[t.get(n)]=Ge.visit(e,n);return i}toString(){return`{${[...this].map(([t,e])=>`${N(t)}: ${N(e)}`).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class ti{constructor(t,e){this.keys=t,this.vals=e,this.keyIndex=0,this.numKeys=t.length}[Symbol.iterator](){return this}next(){const t=this.keyIndex;return t===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(t),Ge.visit(this.vals,t)]})}}class ei{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[Ze].toArray().map(String)}has(t,e){return t[Ze].includes(e)}getOwnPropertyDescriptor(t,e){if(-1!==t[Ze].indexOf(e))return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const i=t[Ze].indexOf(e);if(-1!==i){const n=Ge.visit(Reflect.get(t,Qe),i);return Reflect.set(t,e,n),n}}set(t,e,i){const n=t[Ze].indexOf(e);return-1!==n?(Se.visit(Reflect.get(t,Qe),n,i),Reflect.set(t,e,i)):!!Reflect.has(t,e)&&Reflect.set(t,e,i)}}let ii;function ni(t,e,i,n){const{length:r=0}=t;let s="number"!=typeof e?0:e,o="number"!=typeof i?r:i;return s<0&&(s=(s%r+r)%r),o<0&&(o=(o%r+r)%r),o<s&&(ii=s,s=o,o=ii),o>r&&(o=r),n?n(t,s,o):[s,o]}Object.defineProperties(Xe.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Ze]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Qe]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const ri=t=>t!=t;function si(t){if("object"!=typeof t||null===t)return ri(t)?ri:e=>e===t;if(t instanceof Date){const e=t.valueOf();return t=>t instanceof Date&&t.valueOf()===e}return ArrayBuffer.isView(t)?e=>!!e&&function(t,e){let i=0;const n=t.length;if(n!==e.length)return!1;if(n>0)do{if(t[i]!==e[i])return!1}while(++i<n);return!0}(t,e):t instanceof Map?function(t){let e=-1;const i=[];for(const n of t.values())i[++e]=si(n);return oi(i)}(t):Array.isArray(t)?function(t){const e=[];for(let i=-1,n=t.length;++i<n;)e[i]=si(t[i]);return oi(e)}(t):t instanceof ji?function(t){const e=[];for(let i=-1,n=t.length;++i<n;)e[i]=si(t.get(i));return oi(e)}(t):function(t,e=!1){const i=Object.keys(t);if(!e&&0===i.length)return()=>!1;const n=[];for(let e=-1,r=i.length;++e<r;)n[e]=si(t[i[e]]);return oi(n,i)}(t,!0)}function oi(t,e){return i=>{if(!i||"object"!=typeof i)return!1;switch(i.constructor){case Array:return function(t,e){const i=t.length;if(e.length!==i)return!1;for(let n=-1;++n<i;)if(!t[n](e[n]))return!1;return!0}(t,i);case Map:return ai(t,i,i.keys());case Xe:case Ae:case Object:case void 0:return ai(t,i,e||Object.keys(i))}return i instanceof ji&&function(t,e){const i=t.length;if(e.length!==i)return!1;for(let n=-1;++n<i;)if(!t[n](e.get(n)))return!1;return!0}(t,i)}}function ai(t,e,i){const n=i[Symbol.iterator](),r=e instanceof Map?e.keys():Object.keys(e)[Symbol.iterator](),s=e instanceof Map?e.values():Object.values(e)[Symbol.iterator]();let o=0;const a=t.length;let c=s.next(),l=n.next(),u=r.next();for(;o<a&&!l.done&&!u.done&&!c.done&&l.value===u.value&&t[o](c.value);++o,l=n.next(),u=r.next(),c=s.next());return!!(o===a&&l.done&&u.done&&c.done)||(n.return&&n.return(),r.return&&r.return(),s.return&&s.return(),!1)}class ci{constructor(t=0,e){this.numChunks=t,this.getChunkIterator=e,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const t=this.chunkIterator.next();if(!t.done)return t;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function li(t){return t.reduce((t,e)=>t+e.nullCount,0)}function ui(t){return t.reduce((t,e,i)=>(t[i+1]=t[i]+e.length,t),new Uint32Array(t.length+1))}function di(t,e,i,n){const r=[];for(let s=-1,o=t.length;++s<o;){const o=t[s],a=e[s],{length:c}=o;if(a>=n)break;if(i>=a+c)continue;if(a>=i&&a+c<=n){r.push(o);continue}const l=Math.max(0,i-a),u=Math.min(n-a,c);r.push(o.slice(l,u-l))}return 0===r.length&&r.push(t[0].slice(0,0)),r}function hi(t,e,i,n){let r=0,s=0,o=e.length-1;do{if(r>=o-1)return i<e[o]?n(t,r,i-e[r]):null;s=r+Math.trunc(.5*(o-r)),i<e[s]?o=s:r=s}while(r<o)}function pi(t,e){return t.getValid(e)}function fi(t){function e(e,i,n){return t(e[i],n)}return function(t){return hi(this.data,this._offsets,t,e)}}function yi(t){let e;function i(i,n,r){return t(i[n],r,e)}return function(t,n){const r=this.data;e=n;const s=hi(r,this._offsets,t,i);return e=void 0,s}}function bi(t){let e;function i(i,n,r){let s=r,o=0,a=0;for(let r=n-1,c=i.length;++r<c;){const n=i[r];if(~(o=t(n,e,s)))return a+o;s=0,a+=n.length}return-1}return function(t,n){e=t;const r=this.data,s="number"!=typeof n?i(r,0,0):hi(r,this._offsets,n,i);return e=void 0,s}}function mi(t,e,i,n){return!!(i&1<<n)}function gi(t,e,i,n){return(i&1<<n)>>n}function vi(t,e,i){const n=i.byteLength+7&-8;if(t>0||i.byteLength<n){const r=new Uint8Array(n);return r.set(t%8==0?i.subarray(t>>3):_i(new wi(i,t,e,null,mi)).subarray(0,n)),r}return i}function _i(t){const e=[];let i=0,n=0,r=0;for(const s of t)s&&(r|=1<<n),8===++n&&(e[i++]=r,r=n=0);(0===i||n>0)&&(e[i++]=r);const s=new Uint8Array(e.length+7&-8);return s.set(e),s}class wi{constructor(t,e,i,n,r){this.bytes=t,this.length=i,this.context=n,this.get=r,this.bit=e%8,this.byteIndex=e>>3,this.byte=t[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function Ii(t,e,i){if(i-e<=0)return 0;if(i-e<8){let n=0;for(const r of new wi(t,e,i-e,t,gi))n+=r;return n}const n=i>>3<<3,r=e+(e%8==0?0:8-e%8);return Ii(t,e,r)+Ii(t,n,i)+function(t,e,i){let n=0,r=Math.trunc(e);const s=new DataView(t.buffer,t.byteOffset,t.byteLength),o=void 0===i?t.byteLength:r+i;for(;o-r>=4;)n+=Si(s.getUint32(r)),r+=4;for(;o-r>=2;)n+=Si(s.getUint16(r)),r+=2;for(;o-r>=1;)n+=Si(s.getUint8(r)),r+=1;return n}(t,r>>3,n-r>>3)}function Si(t){let e=Math.trunc(t);return e-=e>>>1&1431655765,e=(858993459&e)+(e>>>2&858993459),16843009*(e+(e>>>4)&252645135)>>>24}class Ti extends Gt{}function Bi(t,e,i){if(void 0===e)return-1;if(null===e)return function(t,e){const{nullBitmap:i}=t;if(!i||t.nullCount<=0)return-1;let n=0;for(const r of new wi(i,t.offset+(e||0),t.length,i,mi)){if(!r)return n;++n}return-1}(t,i);const n=Ge.getVisitFn(t),r=si(e);for(let e=(i||0)-1,s=t.length;++e<s;)if(r(n(t,e)))return e;return-1}function Ai(t,e,i){const n=Ge.getVisitFn(t),r=si(e);for(let e=(i||0)-1,s=t.length;++e<s;)if(r(n(t,e)))return e;return-1}Ti.prototype.visitNull=function(t,e){return null===e&&t.length>0?0:-1},Ti.prototype.visitBool=Bi,Ti.prototype.visitInt=Bi,Ti.prototype.visitInt8=Bi,Ti.prototype.visitInt16=Bi,Ti.prototype.visitInt32=Bi,Ti.prototype.visitInt64=Bi,Ti.prototype.visitUint8=Bi,Ti.prototype.visitUint16=Bi,Ti.prototype.visitUint32=Bi,Ti.prototype.visitUint64=Bi,Ti.prototype.visitFloat=Bi,Ti.prototype.visitFloat16=Bi,Ti.prototype.visitFloat32=Bi,Ti.prototype.visitFloat64=Bi,Ti.prototype.visitUtf8=Bi,Ti.prototype.visitBinary=Bi,Ti.prototype.visitFixedSizeBinary=Bi,Ti.prototype.visitDate=Bi,Ti.prototype.visitDateDay=Bi,Ti.prototype.visitDateMillisecond=Bi,Ti.prototype.visitTimestamp=Bi,Ti.prototype.visitTimestampSecond=Bi,Ti.prototype.visitTimestampMillisecond=Bi,Ti.prototype.visitTimestampMicrosecond=Bi,Ti.prototype.visitTimestampNanosecond=Bi,Ti.prototype.visitTime=Bi,Ti.prototype.visitTimeSecond=Bi,Ti.prototype.visitTimeMillisecond=Bi,Ti.prototype.visitTimeMicrosecond=Bi,Ti.prototype.visitTimeNanosecond=Bi,Ti.prototype.visitDecimal=Bi,Ti.prototype.visitList=Bi,Ti.prototype.visitStruct=Bi,Ti.prototype.visitUnion=Bi,Ti.prototype.visitDenseUnion=Ai,Ti.prototype.visitSparseUnion=Ai,Ti.prototype.visitDictionary=Bi,Ti.prototype.visitInterval=Bi,Ti.prototype.visitIntervalDayTime=Bi,Ti.prototype.visitIntervalYearMonth=Bi,Ti.prototype.visitFixedSizeList=Bi,Ti.prototype.visitMap=Bi;const Oi=new Ti;class Di extends Gt{}function Mi(t){const{type:e}=t;if(0===t.nullCount&&1===t.stride&&(e.typeId===u.Timestamp||e instanceof Mt&&64!==e.bitWidth||e instanceof Rt&&64!==e.bitWidth||e instanceof xt&&e.precision!==s.HALF))return new ci(t.data.length,e=>{const i=t.data[e];return i.values.subarray(0,i.length)[Symbol.iterator]()});let i=0;return new ci(t.data.length,e=>{const n=t.data[e].length,r=t.slice(i,i+n);return i+=n,new Fi(r)})}class Fi{constructor(t){this.vector=t,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}Di.prototype.visitNull=Mi,Di.prototype.visitBool=Mi,Di.prototype.visitInt=Mi,Di.prototype.visitInt8=Mi,Di.prototype.visitInt16=Mi,Di.prototype.visitInt32=Mi,Di.prototype.visitInt64=Mi,Di.prototype.visitUint8=Mi,Di.prototype.visitUint16=Mi,Di.prototype.visitUint32=Mi,Di.prototype.visitUint64=Mi,Di.prototype.visitFloat=Mi,Di.prototype.visitFloat16=Mi,Di.prototype.visitFloat32=Mi,Di.prototype.visitFloat64=Mi,Di.prototype.visitUtf8=Mi,Di.prototype.visitBinary=Mi,Di.prototype.visitFixedSizeBinary=Mi,Di.prototype.visitDate=Mi,Di.prototype.visitDateDay=Mi,Di.prototype.visitDateMillisecond=Mi,Di.prototype.visitTimestamp=Mi,Di.prototype.visitTimestampSecond=Mi,Di.prototype.visitTimestampMillisecond=Mi,Di.prototype.visitTimestampMicrosecond=Mi,Di.prototype.visitTimestampNanosecond=Mi,Di.prototype.visitTime=Mi,Di.prototype.visitTimeSecond=Mi,Di.prototype.visitTimeMillisecond=Mi,Di.prototype.visitTimeMicrosecond=Mi,Di.prototype.visitTimeNanosecond=Mi,Di.prototype.visitDecimal=Mi,Di.prototype.visitList=Mi,Di.prototype.visitStruct=Mi,Di.prototype.visitUnion=Mi,Di.prototype.visitDenseUnion=Mi,Di.prototype.visitSparseUnion=Mi,Di.prototype.visitDictionary=Mi,Di.prototype.visitInterval=Mi,Di.prototype.visitIntervalDayTime=Mi,Di.prototype.visitIntervalYearMonth=Mi,Di.prototype.visitFixedSizeList=Mi,Di.prototype.visitMap=Mi;const xi=new Di,Ni=(t,e)=>t+e;class Li extends Gt{visitNull(t,e){return 0}visitInt(t,e){return t.type.bitWidth/8}visitFloat(t,e){return t.type.ArrayType.BYTES_PER_ELEMENT}visitBool(t,e){return 1/8}visitDecimal(t,e){return t.type.bitWidth/8}visitDate(t,e){return 4*(t.type.unit+1)}visitTime(t,e){return t.type.bitWidth/8}visitTimestamp(t,e){return t.type.unit===a.SECOND?4:8}visitInterval(t,e){return 4*(t.type.unit+1)}visitStruct(t,e){return t.children.reduce((t,i)=>t+Ei.visit(i,e),0)}visitFixedSizeBinary(t,e){return t.type.byteWidth}visitMap(t,e){return 8+t.children.reduce((t,i)=>t+Ei.visit(i,e),0)}visitDictionary(t,e){var i;return t.type.indices.bitWidth/8+((null===(i=t.dictionary)||void 0===i?void 0:i.getByteLength(t.values[e]))||0)}}const Ui=({type:t,children:e,typeIds:i,valueOffsets:n},r)=>{const s=t.typeIdToChildIndex[i[r]];return 8+Ei.visit(e[s],n[r])},Ci=({children:t},e)=>4+Ei.visitMany(t,t.map(()=>e)).reduce(Ni,0);Li.prototype.visitUtf8=({valueOffsets:t},e)=>t[e+1]-t[e]+8,Li.prototype.visitBinary=({valueOffsets:t},e)=>t[e+1]-t[e]+8,Li.prototype.visitList=({valueOffsets:t,stride:e,children:i},n)=>{const r=i[0],{[n*e]:s}=t,{[n*e+1]:o}=t,a=Ei.getVisitFn(r.type),c=r.slice(s,o-s);let l=8;for(let t=-1,e=o-s;++t<e;)l+=a(c,t);return l},Li.prototype.visitFixedSizeList=({stride:t,children:e},i)=>{const n=e[0],r=n.slice(i*t,t),s=Ei.getVisitFn(n.type);let o=0;for(let t=-1,e=r.length;++t<e;)o+=s(r,t);return o},Li.prototype.visitUnion=(t,e)=>t.type.mode===r.Dense?Ui(t,e):Ci(t,e),Li.prototype.visitDenseUnion=Ui,Li.prototype.visitSparseUnion=Ci;const Ei=new Li;var Ri;const Pi={},Vi={};class ji{constructor(t){var e,i,n;const r=t[0]instanceof ji?t.flatMap(t=>t.data):t;if(0===r.length||r.some(t=>!(t instanceof ki)))throw new TypeError("Vector constructor expects an Array of Data instances.");const s=null===(e=r[0])||void 0===e?void 0:e.type;switch(r.length){case 0:this._offsets=[0];break;case 1:{const{get:t,set:e,indexOf:i,byteLength:n}=Pi[s.typeId],o=r[0];this.isValid=t=>pi(o,t),this.get=e=>t(o,e),this.set=(t,i)=>e(o,t,i),this.indexOf=t=>i(o,t),this.getByteLength=t=>n(o,t),this._offsets=[0,o.length];break}default:Object.setPrototypeOf(this,Vi[s.typeId]),this._offsets=ui(r)}this.data=r,this.type=s,this.stride=qt(s),this.numChildren=null!==(n=null===(i=s.children)||void 0===i?void 0:i.length)&&void 0!==n?n:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return-1===this._byteLength&&(this._byteLength=this.data.reduce((t,e)=>t+e.byteLength,0)),this._byteLength}get nullCount(){return-1===this._nullCount&&(this._nullCount=li(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${u[this.type.typeId]}Vector`}isValid(t){return!1}get(t){return null}set(t,e){}indexOf(t,e){return-1}includes(t,e){return this.indexOf(t,e)>0}getByteLength(t){return 0}[Symbol.iterator](){return xi.visit(this)}concat(...t){return new ji(this.data.concat(t.flatMap(t=>t.data).flat(Number.POSITIVE_INFINITY)))}slice(t,e){return new ji(ni(this,t,e,({data:t,_offsets:e},i,n)=>di(t,e,i,n)))}toJSON(){return[...this]}toArray(){const{type:t,data:e,length:i,stride:n,ArrayType:r}=this;switch(t.typeId){case u.Int:case u.Float:case u.Decimal:case u.Time:case u.Timestamp:switch(e.length){case 0:return new r;case 1:return e[0].values.subarray(0,i*n);default:return e.reduce((t,{values:e,length:i})=>(t.array.set(e.subarray(0,i*n),t.offset),t.offset+=i*n,t),{array:new r(i*n),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(t){var e;return this.getChildAt(null===(e=this.type.children)||void 0===e?void 0:e.findIndex(e=>e.name===t))}getChildAt(t){return t>-1&&t<this.numChildren?new ji(this.data.map(({children:e})=>e[t])):null}get isMemoized(){return!!Ot.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(Ot.isDictionary(this.type)){const t=new zi(this.data[0].dictionary),e=this.data.map(e=>{const i=e.clone();return i.dictionary=t,i});return new ji(e)}return new zi(this)}unmemoize(){if(Ot.isDictionary(this.type)&&this.isMemoized){const t=this.data[0].dictionary.unmemoize(),e=this.data.map(e=>{const i=e.clone();return i.dictionary=t,i});return new ji(e)}return this}}Ri=Symbol.toStringTag,ji[Ri]=(t=>{t.type=Ot.prototype,t.data=[],t.length=0,t.stride=1,t.numChildren=0,t._nullCount=-1,t._byteLength=-1,t._offsets=new Uint32Array([0]),t[Symbol.isConcatSpreadable]=!0;const e=Object.keys(u).map(t=>u[t]).filter(t=>"number"==typeof t&&t!==u.NONE);for(const i of e){const e=Ge.getVisitFnByTypeId(i),n=Se.getVisitFnByTypeId(i),r=Oi.getVisitFnByTypeId(i),s=Ei.getVisitFnByTypeId(i);Pi[i]={get:e,set:n,indexOf:r,byteLength:s},Vi[i]=Object.create(t,{isValid:{value:fi(pi)},get:{value:fi(Ge.getVisitFnByTypeId(i))},set:{value:yi(Se.getVisitFnByTypeId(i))},indexOf:{value:bi(Oi.getVisitFnByTypeId(i))},getByteLength:{value:fi(Ei.getVisitFnByTypeId(i))}})}return"Vector"})(ji.prototype);class zi extends ji{constructor(t){super(t.data);const e=this.get,i=this.set,n=this.slice,r=new Array(this.length);Object.defineProperty(this,"get",{value(t){const i=r[t];if(void 0!==i)return i;const n=e.call(this,t);return r[t]=n,n}}),Object.defineProperty(this,"set",{value(t,e){i.call(this,t,e),r[t]=e}}),Object.defineProperty(this,"slice",{value:(t,e)=>new zi(n.call(this,t,e))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new ji(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class ki{constructor(t,e,i,n,r,s=[],o){let a;this.type=t,this.children=s,this.dictionary=o,this.offset=Math.floor(Math.max(e||0,0)),this.length=Math.floor(Math.max(i||0,0)),this._nullCount=Math.floor(Math.max(n||0,-1)),r instanceof ki?(this.stride=r.stride,this.values=r.values,this.typeIds=r.typeIds,this.nullBitmap=r.nullBitmap,this.valueOffsets=r.valueOffsets):(this.stride=qt(t),r&&((a=r[0])&&(this.valueOffsets=a),(a=r[1])&&(this.values=a),(a=r[2])&&(this.nullBitmap=a),(a=r[3])&&(this.typeIds=a))),this.nullable=0!==this._nullCount&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let t=0;const{valueOffsets:e,values:i,nullBitmap:n,typeIds:r}=this;return e&&(t+=e.byteLength),i&&(t+=i.byteLength),n&&(t+=n.byteLength),r&&(t+=r.byteLength),this.children.reduce((t,e)=>t+e.byteLength,t)}get nullCount(){let t,e=this._nullCount;return e<=-1&&(t=this.nullBitmap)&&(this._nullCount=e=this.length-Ii(t,this.offset,this.offset+this.length)),e}getValid(t){if(this.nullable&&this.nullCount>0){const e=this.offset+t;return!!(this.nullBitmap[e>>3]&1<<e%8)}return!0}setValid(t,e){if(!this.nullable)return e;if(!this.nullBitmap||this.nullBitmap.byteLength<=t>>3){const{nullBitmap:t}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:t,_nullCount:0})}const{nullBitmap:i,offset:n}=this,r=n+t>>3,s=(n+t)%8,o=i[r]>>s&1;return e?0===o&&(i[r]|=1<<s,this._nullCount=this.nullCount+1):1===o&&(i[r]&=~(1<<s),this._nullCount=this.nullCount-1),e}clone(t=this.type,e=this.offset,i=this.length,n=this._nullCount,r=this,s=this.children){return new ki(t,e,i,n,r,s,this.dictionary)}slice(t,e){const{stride:i,typeId:n,children:r}=this,s=+(0===this._nullCount)-1,o=16===n?i:1,a=this._sliceBuffers(t,e,i,n);return this.clone(this.type,this.offset+t,e,s,a,0===r.length||this.valueOffsets?r:this._sliceChildren(r,o*t,o*e))}_changeLengthAndBackfillNullBitmap(t){if(this.typeId===u.Null)return this.clone(this.type,0,t,0);const{length:e,nullCount:i}=this,n=new Uint8Array((t+63&-64)>>3).fill(255,0,e>>3);n[e>>3]=(1<<e-(-8&e))-1,i>0&&n.set(vi(this.offset,e,this.nullBitmap),0);const r=this.buffers;return r[d.VALIDITY]=n,this.clone(this.type,0,t,i+(t-e),r)}_sliceBuffers(t,e,i,n){let r;const{buffers:s}=this;return(r=s[d.TYPE])&&(s[d.TYPE]=r.subarray(t,t+e)),(r=s[d.OFFSET])&&(s[d.OFFSET]=r.subarray(t,t+e+1))||(r=s[d.DATA])&&(s[d.DATA]=6===n?r:r.subarray(i*t,i*(t+e))),s}_sliceChildren(t,e,i){return t.map(t=>t.slice(e,i))}}ki.prototype.children=Object.freeze([]);class $i extends Gt{visit(t){return this.getVisitFn(t.type).call(this,t)}visitNull(t){const{type:e,offset:i=0,length:n=0}=t;return new ki(e,i,n,0)}visitBool(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length>>3,nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitInt(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length,nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitFloat(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length,nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitUtf8(t){const{type:e,offset:i=0}=t,n=K(t.data),r=K(t.nullBitmap),s=H(t.valueOffsets),{length:o=s.length-1,nullCount:a=(t.nullBitmap?-1:0)}=t;return new ki(e,i,o,a,[s,n,r])}visitBinary(t){const{type:e,offset:i=0}=t,n=K(t.data),r=K(t.nullBitmap),s=H(t.valueOffsets),{length:o=s.length-1,nullCount:a=(t.nullBitmap?-1:0)}=t;return new ki(e,i,o,a,[s,n,r])}visitFixedSizeBinary(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length/qt(e),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitDate(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length/qt(e),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitTimestamp(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length/qt(e),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitTime(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length/qt(e),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitDecimal(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length/qt(e),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitList(t){const{type:e,offset:i=0,child:n}=t,r=K(t.nullBitmap),s=H(t.valueOffsets),{length:o=s.length-1,nullCount:a=(t.nullBitmap?-1:0)}=t;return new ki(e,i,o,a,[s,void 0,r],[n])}visitStruct(t){const{type:e,offset:i=0,children:n=[]}=t,r=K(t.nullBitmap),{length:s=n.reduce((t,{length:e})=>Math.max(t,e),0),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,void 0,r],n)}visitUnion(t){const{type:e,offset:i=0,children:n=[]}=t,r=K(t.nullBitmap),s=W(e.ArrayType,t.typeIds),{length:o=s.length,nullCount:a=(t.nullBitmap?-1:0)}=t;if(Ot.isSparseUnion(e))return new ki(e,i,o,a,[void 0,void 0,r,s],n);const c=H(t.valueOffsets);return new ki(e,i,o,a,[c,void 0,r,s],n)}visitDictionary(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.indices.ArrayType,t.data),{dictionary:s=new ji([(new $i).visit({type:e.dictionary})])}=t,{length:o=r.length,nullCount:a=(t.nullBitmap?-1:0)}=t;return new ki(e,i,o,a,[void 0,r,n],[],s)}visitInterval(t){const{type:e,offset:i=0}=t,n=K(t.nullBitmap),r=W(e.ArrayType,t.data),{length:s=r.length/qt(e),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,r,n])}visitFixedSizeList(t){const{type:e,offset:i=0,child:n=(new $i).visit({type:e.valueType})}=t,r=K(t.nullBitmap),{length:s=n.length/qt(e),nullCount:o=(t.nullBitmap?-1:0)}=t;return new ki(e,i,s,o,[void 0,void 0,r],[n])}visitMap(t){const{type:e,offset:i=0,child:n=(new $i).visit({type:e.childType})}=t,r=K(t.nullBitmap),s=H(t.valueOffsets),{length:o=s.length-1,nullCount:a=(t.nullBitmap?-1:0)}=t;return new ki(e,i,o,a,[s,void 0,r],[n])}}function Yi(t){return(new $i).visit(t)}class Wi{constructor(t=[],e,i){this.fields=t||[],this.metadata=e||new Map,i||(i=Ji(t)),this.dictionaries=i}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map(t=>t.name)}toString(){return`Schema<{ ${this.fields.map((t,e)=>`${e}: ${t}`).join(", ")} }>`}select(t){const e=new Set(t),i=this.fields.filter(t=>e.has(t.name));return new Wi(i,this.metadata)}selectAt(t){const e=t.map(t=>this.fields[t]).filter(Boolean);return new Wi(e,this.metadata)}assign(...t){const e=t[0]instanceof Wi?t[0]:Array.isArray(t[0])?new Wi(t[0]):new Wi(t),i=[...this.fields],n=Ki(Ki(new Map,this.metadata),e.metadata),r=e.fields.filter(t=>{const e=i.findIndex(e=>e.name===t.name);return!~e||(i[e]=t.clone({metadata:Ki(Ki(new Map,i[e].metadata),t.metadata)}))&&!1}),s=Ji(r,new Map);return new Wi([...i,...r],n,new Map([...this.dictionaries,...s]))}}Wi.prototype.fields=null,Wi.prototype.metadata=null,Wi.prototype.dictionaries=null;class Hi{constructor(t,e,i=!1,n){this.name=t,this.type=e,this.nullable=i,this.metadata=n||new Map}static new(...t){let[e,i,n,r]=t;return t[0]&&"object"==typeof t[0]&&(({name:e}=t[0]),void 0===i&&(i=t[0].type),void 0===n&&(n=t[0].nullable),void 0===r&&(r=t[0].metadata)),new Hi(`${e}`,i,n,r)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(...t){let[e,i,n,r]=t;return t[0]&&"object"==typeof t[0]?({name:e=this.name,type:i=this.type,nullable:n=this.nullable,metadata:r=this.metadata}=t[0]):[e=this.name,i=this.type,n=this.nullable,r=this.metadata]=t,Hi.new(e,i,n,r)}}function Ki(t,e){return new Map([...t||new Map,...e||new Map])}function Ji(t,e=new Map){for(let i=-1,n=t.length;++i<n;){const n=t[i].type;if(Ot.isDictionary(n))if(e.has(n.id)){if(e.get(n.id)!==n.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else e.set(n.id,n.dictionary);n.children&&n.children.length>0&&Ji(n.children,e)}return e}Hi.prototype.type=null,Hi.prototype.name=null,Hi.prototype.nullable=null,Hi.prototype.metadata=null;class qi extends Gt{compareSchemas(t,e){return t===e||e instanceof t.constructor&&this.compareManyFields(t.fields,e.fields)}compareManyFields(t,e){return t===e||Array.isArray(t)&&Array.isArray(e)&&t.length===e.length&&t.every((t,i)=>this.compareFields(t,e[i]))}compareFields(t,e){return t===e||e instanceof t.constructor&&t.name===e.name&&t.nullable===e.nullable&&this.visit(t.type,e.type)}}function Gi(t,e){return e instanceof t.constructor}function Zi(t,e){return t===e||Gi(t,e)}function Qi(t,e){return t===e||Gi(t,e)&&t.bitWidth===e.bitWidth&&t.isSigned===e.isSigned}function Xi(t,e){return t===e||Gi(t,e)&&t.precision===e.precision}function tn(t,e){return t===e||Gi(t,e)&&t.unit===e.unit}function en(t,e){return t===e||Gi(t,e)&&t.unit===e.unit&&t.timezone===e.timezone}function nn(t,e){return t===e||Gi(t,e)&&t.unit===e.unit&&t.bitWidth===e.bitWidth}function rn(t,e){return t===e||Gi(t,e)&&t.mode===e.mode&&t.typeIds.every((t,i)=>t===e.typeIds[i])&&on.compareManyFields(t.children,e.children)}function sn(t,e){return t===e||Gi(t,e)&&t.unit===e.unit}qi.prototype.visitNull=Zi,qi.prototype.visitBool=Zi,qi.prototype.visitInt=Qi,qi.prototype.visitInt8=Qi,qi.prototype.visitInt16=Qi,qi.prototype.visitInt32=Qi,qi.prototype.visitInt64=Qi,qi.prototype.visitUint8=Qi,qi.prototype.visitUint16=Qi,qi.prototype.visitUint32=Qi,qi.prototype.visitUint64=Qi,qi.prototype.visitFloat=Xi,qi.prototype.visitFloat16=Xi,qi.prototype.visitFloat32=Xi,qi.prototype.visitFloat64=Xi,qi.prototype.visitUtf8=Zi,qi.prototype.visitBinary=Zi,qi.prototype.visitFixedSizeBinary=function(t,e){return t===e||Gi(t,e)&&t.byteWidth===e.byteWidth},qi.prototype.visitDate=tn,qi.prototype.visitDateDay=tn,qi.prototype.visitDateMillisecond=tn,qi.prototype.visitTimestamp=en,qi.prototype.visitTimestampSecond=en,qi.prototype.visitTimestampMillisecond=en,qi.prototype.visitTimestampMicrosecond=en,qi.prototype.visitTimestampNanosecond=en,qi.prototype.visitTime=nn,qi.prototype.visitTimeSecond=nn,qi.prototype.visitTimeMillisecond=nn,qi.prototype.visitTimeMicrosecond=nn,qi.prototype.visitTimeNanosecond=nn,qi.prototype.visitDecimal=Zi,qi.prototype.visitList=function(t,e){return t===e||Gi(t,e)&&t.children.length===e.children.length&&on.compareManyFields(t.children,e.children)},qi.prototype.visitStruct=function(t,e){return t===e||Gi(t,e)&&t.children.length===e.children.length&&on.compareManyFields(t.children,e.children)},qi.prototype.visitUnion=rn,qi.prototype.visitDenseUnion=rn,qi.prototype.visitSparseUnion=rn,qi.prototype.visitDictionary=function(t,e){return t===e||Gi(t,e)&&t.id===e.id&&t.isOrdered===e.isOrdered&&on.visit(t.indices,e.indices)&&on.visit(t.dictionary,e.dictionary)},qi.prototype.visitInterval=sn,qi.prototype.visitIntervalDayTime=sn,qi.prototype.visitIntervalYearMonth=sn,qi.prototype.visitFixedSizeList=function(t,e){return t===e||Gi(t,e)&&t.listSize===e.listSize&&t.children.length===e.children.length&&on.compareManyFields(t.children,e.children)},qi.prototype.visitMap=function(t,e){return t===e||Gi(t,e)&&t.keysSorted===e.keysSorted&&t.children.length===e.children.length&&on.compareManyFields(t.children,e.children)};const on=new qi;function an(t,e){return on.compareSchemas(t,e)}var cn,ln;class un{constructor(...t){switch(t.length){case 2:if([this.schema]=t,!(this.schema instanceof Wi))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=Yi({nullCount:0,type:new zt(this.schema.fields),children:this.schema.fields.map(t=>Yi({type:t.type,nullCount:0}))})]=t,!(this.data instanceof ki))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=dn(this.schema,this.data.children);break;case 1:{const[e]=t,{fields:i,children:n,length:r}=Object.keys(e).reduce((t,i,n)=>(t.children[n]=e[i],t.length=Math.max(t.length,e[i].length),t.fields[n]=Hi.new({name:i,type:e[i].type,nullable:!0}),t),{length:0,fields:new Array,children:new Array}),s=new Wi(i),o=Yi({type:new zt(i),length:r,children:n,nullCount:0});[this.schema,this.data]=dn(s,o.children,r);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=hn(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(t){return this.data.getValid(t)}get(t){return Ge.visit(this.data,t)}set(t,e){return Se.visit(this.data,t,e)}indexOf(t,e){return Oi.visit(this.data,t,e)}getByteLength(t){return Ei.visit(this.data,t)}[Symbol.iterator](){return xi.visit(new ji([this.data]))}toArray(){return[...this]}concat(...t){return new bn(this.schema,[this,...t])}slice(t,e){const[i]=new ji([this.data]).slice(t,e).data;return new un(this.schema,i)}getChild(t){var e;return this.getChildAt(null===(e=this.schema.fields)||void 0===e?void 0:e.findIndex(e=>e.name===t))}getChildAt(t){return t>-1&&t<this.schema.fields.length?new ji([this.data.children[t]]):null}setChild(t,e){var i;return this.setChildAt(null===(i=this.schema.fields)||void 0===i?void 0:i.findIndex(e=>e.name===t),e)}setChildAt(t,e){let i=this.schema,n=this.data;if(t>-1&&t<this.numCols){e||(e=new ji([Yi({type:new Dt,length:this.numRows})]));const r=i.fields.slice(),s=n.children.slice(),o=r[t].clone({type:e.type});[r[t],s[t]]=[o,e.data[0]],i=new Wi(r,new Map(this.schema.metadata)),n=Yi({type:new zt(r),children:s})}return new un(i,n)}select(t){const e=this.schema.select(t),i=new zt(e.fields),n=[];for(const e of t){const t=this.schema.fields.findIndex(t=>t.name===e);~t&&(n[t]=this.data.children[t])}return new un(e,Yi({type:i,length:this.numRows,children:n}))}selectAt(t){const e=this.schema.selectAt(t),i=t.map(t=>this.data.children[t]).filter(Boolean),n=Yi({type:new zt(e.fields),length:this.numRows,children:i});return new un(e,n)}}function dn(t,e,i=e.reduce((t,e)=>Math.max(t,e.length),0)){var n;const r=[...t.fields],s=[...e],o=(i+63&-64)>>3;for(const[a,c]of t.fields.entries()){const t=e[a];t&&t.length===i||(r[a]=c.clone({nullable:!0}),s[a]=null!==(n=null==t?void 0:t._changeLengthAndBackfillNullBitmap(i))&&void 0!==n?n:Yi({type:c.type,length:i,nullCount:i,nullBitmap:new Uint8Array(o)}))}return[t.assign(r),Yi({type:new zt(r),length:i,children:s})]}function hn(t,e,i=new Map){for(let n=-1,r=t.length;++n<r;){const r=t[n].type,s=e[n];if(Ot.isDictionary(r))if(i.has(r.id)){if(i.get(r.id)!==s.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else s.dictionary&&i.set(r.id,s.dictionary);r.children&&r.children.length>0&&hn(r.children,s.children,i)}return i}cn=Symbol.toStringTag,un[cn]=(t=>(t._nullCount=-1,t[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(un.prototype);class pn extends un{constructor(t){const e=t.fields.map(t=>Yi({type:t.type}));super(t,Yi({type:new zt(t.fields),nullCount:0,children:e}))}}function fn(t,e){return function(t,e){const i=[...t.fields],n=[],r={numBatches:e.reduce((t,e)=>Math.max(t,e.length),0)};let s=0,o=0,a=-1;const c=e.length;let l,u=[];for(;r.numBatches-- >0;){for(o=Number.POSITIVE_INFINITY,a=-1;++a<c;)u[a]=l=e[a].shift(),o=Math.min(o,l?l.length:o);Number.isFinite(o)&&(u=yn(i,o,u,e,r),o>0&&(n[s++]=Yi({type:new zt(i),length:o,nullCount:0,children:u.slice()})))}return[t=t.assign(i),n.map(e=>new un(t,e))]}(t,e.map(t=>t.data.concat()))}function yn(t,e,i,n,r){var s;const o=(e+63&-64)>>3;for(let a=-1,c=n.length;++a<c;){const c=i[a],l=null==c?void 0:c.length;if(l>=e)l===e?i[a]=c:(i[a]=c.slice(0,e),r.numBatches=Math.max(r.numBatches,n[a].unshift(c.slice(e,l-e))));else{const n=t[a];t[a]=n.clone({nullable:!0}),i[a]=null!==(s=null==c?void 0:c._changeLengthAndBackfillNullBitmap(e))&&void 0!==s?s:Yi({type:n.type,length:e,nullCount:e,nullBitmap:new Uint8Array(o)})}}return i}class bn{constructor(...t){var e,i;if(0===t.length)return this.batches=[],this.schema=new Wi([]),this._offsets=[0],this;let n,r;t[0]instanceof Wi&&(n=t.shift()),t[t.length-1]instanceof Uint32Array&&(r=t.pop());const s=t=>{if(t){if(t instanceof un)return[t];if(t instanceof bn)return t.batches;if(t instanceof ki){if(t.type instanceof zt)return[new un(new Wi(t.type.children),t)]}else{if(Array.isArray(t))return t.flatMap(t=>s(t));if("function"==typeof t[Symbol.iterator])return[...t].flatMap(t=>s(t));if("object"==typeof t){const e=Object.keys(t),i=e.map(e=>new ji([t[e]])),n=new Wi(e.map((t,e)=>new Hi(String(t),i[e].type))),[,r]=fn(n,i);return 0===r.length?[new un(t)]:r}}}return[]},o=t.flatMap(t=>s(t));if(n=null!==(i=null!=n?n:null===(e=o[0])||void 0===e?void 0:e.schema)&&void 0!==i?i:new Wi([]),!(n instanceof Wi))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const t of o){if(!(t instanceof un))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!an(n,t.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=n,this.batches=o,this._offsets=null!=r?r:ui(this.data)}get data(){return this.batches.map(({data:t})=>t)}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce((t,e)=>t+e.length,0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=li(this.data)),this._nullCount}isValid(t){return!1}get(t){return null}set(t,e){}indexOf(t,e){return-1}getByteLength(t){return 0}[Symbol.iterator](){return this.batches.length>0?xi.visit(new ji(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[\n  ${this.toArray().join(",\n  ")}\n]`}concat(...t){const e=this.schema,i=this.data.concat(t.flatMap(({data:t})=>t));return new bn(e,i.map(t=>new un(e,t)))}slice(t,e){const i=this.schema;[t,e]=ni({length:this.numRows},t,e);const n=di(this.data,this._offsets,t,e);return new bn(i,n.map(t=>new un(i,t)))}getChild(t){return this.getChildAt(this.schema.fields.findIndex(e=>e.name===t))}getChildAt(t){if(t>-1&&t<this.schema.fields.length){const e=this.data.map(e=>e.children[t]);if(0===e.length){const{type:i}=this.schema.fields[t],n=Yi({type:i,length:0,nullCount:0});e.push(n._changeLengthAndBackfillNullBitmap(this.numRows))}return new ji(e)}return null}setChild(t,e){var i;return this.setChildAt(null===(i=this.schema.fields)||void 0===i?void 0:i.findIndex(e=>e.name===t),e)}setChildAt(t,e){let i=this.schema,n=[...this.batches];if(t>-1&&t<this.numCols){e||(e=new ji([Yi({type:new Dt,length:this.numRows})]));const r=i.fields.slice(),s=r[t].clone({type:e.type}),o=this.schema.fields.map((t,e)=>this.getChildAt(e));[r[t],o[t]]=[s,e],[i,n]=fn(i,o)}return new bn(i,n)}select(t){const e=this.schema.fields.reduce((t,e,i)=>t.set(e.name,i),new Map);return this.selectAt(t.map(t=>e.get(t)).filter(t=>t>-1))}selectAt(t){const e=this.schema.selectAt(t),i=this.batches.map(e=>e.selectAt(t));return new bn(e,i)}assign(t){const e=this.schema.fields,[i,n]=t.schema.fields.reduce((t,i,n)=>{const[r,s]=t,o=e.findIndex(t=>t.name===i.name);return~o?s[o]=n:r.push(n),t},[[],[]]),r=this.schema.assign(t.schema),s=[...e.map((t,e)=>[e,n[e]]).map(([e,i])=>void 0===i?this.getChildAt(e):t.getChildAt(i)),...i.map(e=>t.getChildAt(e))].filter(Boolean);return new bn(...fn(r,s))}}ln=Symbol.toStringTag,bn[ln]=(t=>(t.schema=null,t.batches=[],t._offsets=new Uint32Array([0]),t._nullCount=-1,t[Symbol.isConcatSpreadable]=!0,t.isValid=fi(pi),t.get=fi(Ge.getVisitFn(u.Struct)),t.set=yi(Se.getVisitFn(u.Struct)),t.indexOf=bi(Oi.getVisitFn(u.Struct)),t.getByteLength=fi(Ei.getVisitFn(u.Struct)),"Table"))(bn.prototype);class mn{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(t,e,i,n){return t.prep(8,24),t.writeInt64(n),t.pad(4),t.writeInt32(i),t.writeInt64(e),t.offset()}}const gn=new Int32Array(2),vn=new Float32Array(gn.buffer),_n=new Float64Array(gn.buffer),wn=1===new Uint16Array(new Uint8Array([1,0]).buffer)[0];class In{constructor(t,e){this.low=0|t,this.high=0|e}static create(t,e){return 0==t&&0==e?In.ZERO:new In(t,e)}toFloat64(){return(this.low>>>0)+4294967296*this.high}equals(t){return this.low==t.low&&this.high==t.high}}var Sn,Tn,Bn,An,On;In.ZERO=new In(0,0),function(t){t[t.UTF8_BYTES=1]="UTF8_BYTES",t[t.UTF16_STRING=2]="UTF16_STRING"}(Sn||(Sn={}));class Dn{constructor(t){this.bytes_=t,this.position_=0}static allocate(t){return new Dn(new Uint8Array(t))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(t){this.position_=t}capacity(){return this.bytes_.length}readInt8(t){return this.readUint8(t)<<24>>24}readUint8(t){return this.bytes_[t]}readInt16(t){return this.readUint16(t)<<16>>16}readUint16(t){return this.bytes_[t]|this.bytes_[t+1]<<8}readInt32(t){return this.bytes_[t]|this.bytes_[t+1]<<8|this.bytes_[t+2]<<16|this.bytes_[t+3]<<24}readUint32(t){return this.readInt32(t)>>>0}readInt64(t){return new In(this.readInt32(t),this.readInt32(t+4))}readUint64(t){return new In(this.readUint32(t),this.readUint32(t+4))}readFloat32(t){return gn[0]=this.readInt32(t),vn[0]}readFloat64(t){return gn[wn?0:1]=this.readInt32(t),gn[wn?1:0]=this.readInt32(t+4),_n[0]}writeInt8(t,e){this.bytes_[t]=e}writeUint8(t,e){this.bytes_[t]=e}writeInt16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeUint16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeInt32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeUint32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeInt64(t,e){this.writeInt32(t,e.low),this.writeInt32(t+4,e.high)}writeUint64(t,e){this.writeUint32(t,e.low),this.writeUint32(t+4,e.high)}writeFloat32(t,e){vn[0]=e,this.writeInt32(t,gn[0])}writeFloat64(t,e){_n[0]=e,this.writeInt32(t,gn[wn?0:1]),this.writeInt32(t+4,gn[wn?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+4+4)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let t="";for(let e=0;e<4;e++)t+=String.fromCharCode(this.readInt8(this.position_+4+e));return t}__offset(t,e){const i=t-this.readInt32(t);return e<this.readInt16(i)?this.readInt16(i+e):0}__union(t,e){return t.bb_pos=e+this.readInt32(e),t.bb=this,t}__string(t,e){t+=this.readInt32(t);const i=this.readInt32(t);let n="",r=0;if(t+=4,e===Sn.UTF8_BYTES)return this.bytes_.subarray(t,t+i);for(;r<i;){let e;const i=this.readUint8(t+r++);if(i<192)e=i;else{const n=this.readUint8(t+r++);if(i<224)e=(31&i)<<6|63&n;else{const s=this.readUint8(t+r++);e=i<240?(15&i)<<12|(63&n)<<6|63&s:(7&i)<<18|(63&n)<<12|(63&s)<<6|63&this.readUint8(t+r++)}}e<65536?n+=String.fromCharCode(e):(e-=65536,n+=String.fromCharCode(55296+(e>>10),56320+(1023&e)))}return n}__union_with_string(t,e){return"string"==typeof t?this.__string(e):this.__union(t,e)}__indirect(t){return t+this.readInt32(t)}__vector(t){return t+this.readInt32(t)+4}__vector_len(t){return this.readInt32(t+this.readInt32(t))}__has_identifier(t){if(4!=t.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let e=0;e<4;e++)if(t.charCodeAt(e)!=this.readInt8(this.position()+4+e))return!1;return!0}createLong(t,e){return In.create(t,e)}createScalarList(t,e){const i=[];for(let n=0;n<e;++n)null!==t(n)&&i.push(t(n));return i}createObjList(t,e){const i=[];for(let n=0;n<e;++n){const e=t(n);null!==e&&i.push(e.unpack())}return i}}class Mn{constructor(t){let e;this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null,e=t||1024,this.bb=Dn.allocate(e),this.space=e}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(t){this.force_defaults=t}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(t,e){t>this.minalign&&(this.minalign=t);const i=1+~(this.bb.capacity()-this.space+e)&t-1;for(;this.space<i+t+e;){const t=this.bb.capacity();this.bb=Mn.growByteBuffer(this.bb),this.space+=this.bb.capacity()-t}this.pad(i)}pad(t){for(let e=0;e<t;e++)this.bb.writeInt8(--this.space,0)}writeInt8(t){this.bb.writeInt8(this.space-=1,t)}writeInt16(t){this.bb.writeInt16(this.space-=2,t)}writeInt32(t){this.bb.writeInt32(this.space-=4,t)}writeInt64(t){this.bb.writeInt64(this.space-=8,t)}writeFloat32(t){this.bb.writeFloat32(this.space-=4,t)}writeFloat64(t){this.bb.writeFloat64(this.space-=8,t)}addInt8(t){this.prep(1,0),this.writeInt8(t)}addInt16(t){this.prep(2,0),this.writeInt16(t)}addInt32(t){this.prep(4,0),this.writeInt32(t)}addInt64(t){this.prep(8,0),this.writeInt64(t)}addFloat32(t){this.prep(4,0),this.writeFloat32(t)}addFloat64(t){this.prep(8,0),this.writeFloat64(t)}addFieldInt8(t,e,i){(this.force_defaults||e!=i)&&(this.addInt8(e),this.slot(t))}addFieldInt16(t,e,i){(this.force_defaults||e!=i)&&(this.addInt16(e),this.slot(t))}addFieldInt32(t,e,i){(this.force_defaults||e!=i)&&(this.addInt32(e),this.slot(t))}addFieldInt64(t,e,i){!this.force_defaults&&e.equals(i)||(this.addInt64(e),this.slot(t))}addFieldFloat32(t,e,i){(this.force_defaults||e!=i)&&(this.addFloat32(e),this.slot(t))}addFieldFloat64(t,e,i){(this.force_defaults||e!=i)&&(this.addFloat64(e),this.slot(t))}addFieldOffset(t,e,i){(this.force_defaults||e!=i)&&(this.addOffset(e),this.slot(t))}addFieldStruct(t,e,i){e!=i&&(this.nested(e),this.slot(t))}nested(t){if(t!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")}slot(t){null!==this.vtable&&(this.vtable[t]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(t){const e=t.capacity();if(3221225472&e)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");const i=e<<1,n=Dn.allocate(i);return n.setPosition(i-e),n.bytes().set(t.bytes(),i-e),n}addOffset(t){this.prep(4,0),this.writeInt32(this.offset()-t+4)}startObject(t){this.notNested(),null==this.vtable&&(this.vtable=[]),this.vtable_in_use=t;for(let e=0;e<t;e++)this.vtable[e]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(null==this.vtable||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);const t=this.offset();let e=this.vtable_in_use-1;for(;e>=0&&0==this.vtable[e];e--);const i=e+1;for(;e>=0;e--)this.addInt16(0!=this.vtable[e]?t-this.vtable[e]:0);this.addInt16(t-this.object_start);const n=2*(i+2);this.addInt16(n);let r=0;const s=this.space;t:for(e=0;e<this.vtables.length;e++){const t=this.bb.capacity()-this.vtables[e];if(n==this.bb.readInt16(t)){for(let e=2;e<n;e+=2)if(this.bb.readInt16(s+e)!=this.bb.readInt16(t+e))continue t;r=this.vtables[e];break}}return r?(this.space=this.bb.capacity()-t,this.bb.writeInt32(this.space,r-t)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-t,this.offset()-t)),this.isNested=!1,t}finish(t,e,i){const n=i?4:0;if(e){const t=e;if(this.prep(this.minalign,8+n),4!=t.length)throw new Error("FlatBuffers: file identifier must be length 4");for(let e=3;e>=0;e--)this.writeInt8(t.charCodeAt(e))}this.prep(this.minalign,4+n),this.addOffset(t),n&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(t,e){this.finish(t,e,!0)}requiredField(t,e){const i=this.bb.capacity()-t,n=i-this.bb.readInt32(i);if(0==this.bb.readInt16(n+e))throw new Error("FlatBuffers: field "+e+" must be set")}startVector(t,e,i){this.notNested(),this.vector_num_elems=e,this.prep(4,t*e),this.prep(i,t*e)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(t){if(!t)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(t))return this.string_maps.get(t);const e=this.createString(t);return this.string_maps.set(t,e),e}createString(t){if(!t)return 0;let e;if(t instanceof Uint8Array)e=t;else{e=[];let i=0;for(;i<t.length;){let n;const r=t.charCodeAt(i++);n=r<55296||r>=56320?r:(r<<10)+t.charCodeAt(i++)+-56613888,n<128?e.push(n):(n<2048?e.push(n>>6&31|192):(n<65536?e.push(n>>12&15|224):e.push(n>>18&7|240,n>>12&63|128),e.push(n>>6&63|128)),e.push(63&n|128))}}this.addInt8(0),this.startVector(1,e.length,1),this.bb.setPosition(this.space-=e.length);for(let t=0,i=this.space,n=this.bb.bytes();t<e.length;t++)n[i++]=e[t];return this.endVector()}createLong(t,e){return In.create(t,e)}createObjectOffset(t){return null===t?0:"string"==typeof t?this.createString(t):t.pack(this)}createObjectOffsetList(t){const e=[];for(let i=0;i<t.length;++i){const n=t[i];if(null===n)throw new Error("FlatBuffers: Argument for createObjectOffsetList cannot contain null.");e.push(this.createObjectOffset(n))}return e}createStructOffsetList(t,e){return e(this,t.length),this.createObjectOffsetList(t),this.endVector()}}class Fn{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsKeyValue(t,e){return(e||new Fn).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsKeyValue(t,e){return t.setPosition(t.position()+4),(e||new Fn).__init(t.readInt32(t.position())+t.position(),t)}key(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}value(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startKeyValue(t){t.startObject(2)}static addKey(t,e){t.addFieldOffset(0,e,0)}static addValue(t,e){t.addFieldOffset(1,e,0)}static endKeyValue(t){return t.endObject()}static createKeyValue(t,e,i){return Fn.startKeyValue(t),Fn.addKey(t,e),Fn.addValue(t,i),Fn.endKeyValue(t)}}!function(t){t[t.V1=0]="V1",t[t.V2=1]="V2",t[t.V3=2]="V3",t[t.V4=3]="V4",t[t.V5=4]="V5"}(Tn||(Tn={})),function(t){t[t.Little=0]="Little",t[t.Big=1]="Big"}(Bn||(Bn={})),function(t){t[t.DenseArray=0]="DenseArray"}(An||(An={}));class xn{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInt(t,e){return(e||new xn).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInt(t,e){return t.setPosition(t.position()+4),(e||new xn).__init(t.readInt32(t.position())+t.position(),t)}bitWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}isSigned(){const t=this.bb.__offset(this.bb_pos,6);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startInt(t){t.startObject(2)}static addBitWidth(t,e){t.addFieldInt32(0,e,0)}static addIsSigned(t,e){t.addFieldInt8(1,+e,0)}static endInt(t){return t.endObject()}static createInt(t,e,i){return xn.startInt(t),xn.addBitWidth(t,e),xn.addIsSigned(t,i),xn.endInt(t)}}class Nn{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryEncoding(t,e){return(e||new Nn).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryEncoding(t,e){return t.setPosition(t.position()+4),(e||new Nn).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}indexType(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new xn).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isOrdered(){const t=this.bb.__offset(this.bb_pos,8);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}dictionaryKind(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt16(this.bb_pos+t):An.DenseArray}static startDictionaryEncoding(t){t.startObject(4)}static addId(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addIndexType(t,e){t.addFieldOffset(1,e,0)}static addIsOrdered(t,e){t.addFieldInt8(2,+e,0)}static addDictionaryKind(t,e){t.addFieldInt16(3,e,An.DenseArray)}static endDictionaryEncoding(t){return t.endObject()}}!function(t){t[t.NONE=0]="NONE",t[t.Null=1]="Null",t[t.Int=2]="Int",t[t.FloatingPoint=3]="FloatingPoint",t[t.Binary=4]="Binary",t[t.Utf8=5]="Utf8",t[t.Bool=6]="Bool",t[t.Decimal=7]="Decimal",t[t.Date=8]="Date",t[t.Time=9]="Time",t[t.Timestamp=10]="Timestamp",t[t.Interval=11]="Interval",t[t.List=12]="List",t[t.Struct_=13]="Struct_",t[t.Union=14]="Union",t[t.FixedSizeBinary=15]="FixedSizeBinary",t[t.FixedSizeList=16]="FixedSizeList",t[t.Map=17]="Map",t[t.Duration=18]="Duration",t[t.LargeBinary=19]="LargeBinary",t[t.LargeUtf8=20]="LargeUtf8",t[t.LargeList=21]="LargeList"}(On||(On={}));class Ln{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsField(t,e){return(e||new Ln).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsField(t,e){return t.setPosition(t.position()+4),(e||new Ln).__init(t.readInt32(t.position())+t.position(),t)}name(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}nullable(){const t=this.bb.__offset(this.bb_pos,6);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}typeType(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readUint8(this.bb_pos+t):On.NONE}type(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__union(t,this.bb_pos+e):null}dictionary(t){const e=this.bb.__offset(this.bb_pos,12);return e?(t||new Nn).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}children(t,e){const i=this.bb.__offset(this.bb_pos,14);return i?(e||new Ln).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+4*t),this.bb):null}childrenLength(){const t=this.bb.__offset(this.bb_pos,14);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,16);return i?(e||new Fn).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,16);return t?this.bb.__vector_len(this.bb_pos+t):0}static startField(t){t.startObject(7)}static addName(t,e){t.addFieldOffset(0,e,0)}static addNullable(t,e){t.addFieldInt8(1,+e,0)}static addTypeType(t,e){t.addFieldInt8(2,e,On.NONE)}static addType(t,e){t.addFieldOffset(3,e,0)}static addDictionary(t,e){t.addFieldOffset(4,e,0)}static addChildren(t,e){t.addFieldOffset(5,e,0)}static createChildrenVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startChildrenVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(6,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endField(t){return t.endObject()}}class Un{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsSchema(t,e){return(e||new Un).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsSchema(t,e){return t.setPosition(t.position()+4),(e||new Un).__init(t.readInt32(t.position())+t.position(),t)}endianness(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Bn.Little}fields(t,e){const i=this.bb.__offset(this.bb_pos,6);return i?(e||new Ln).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+4*t),this.bb):null}fieldsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,8);return i?(e||new Fn).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}features(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb.__vector(this.bb_pos+e)+8*t):this.bb.createLong(0,0)}featuresLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}static startSchema(t){t.startObject(4)}static addEndianness(t,e){t.addFieldInt16(0,e,Bn.Little)}static addFields(t,e){t.addFieldOffset(1,e,0)}static createFieldsVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startFieldsVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(2,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static addFeatures(t,e){t.addFieldOffset(3,e,0)}static createFeaturesVector(t,e){t.startVector(8,e.length,8);for(let i=e.length-1;i>=0;i--)t.addInt64(e[i]);return t.endVector()}static startFeaturesVector(t,e){t.startVector(8,e,8)}static endSchema(t){return t.endObject()}static finishSchemaBuffer(t,e){t.finish(e)}static finishSizePrefixedSchemaBuffer(t,e){t.finish(e,void 0,!0)}static createSchema(t,e,i,n,r){return Un.startSchema(t),Un.addEndianness(t,e),Un.addFields(t,i),Un.addCustomMetadata(t,n),Un.addFeatures(t,r),Un.endSchema(t)}}class Cn{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFooter(t,e){return(e||new Cn).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFooter(t,e){return t.setPosition(t.position()+4),(e||new Cn).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Tn.V1}schema(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Un).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}dictionaries(t,e){const i=this.bb.__offset(this.bb_pos,8);return i?(e||new mn).__init(this.bb.__vector(this.bb_pos+i)+24*t,this.bb):null}dictionariesLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}recordBatches(t,e){const i=this.bb.__offset(this.bb_pos,10);return i?(e||new mn).__init(this.bb.__vector(this.bb_pos+i)+24*t,this.bb):null}recordBatchesLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,12);return i?(e||new Fn).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startFooter(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,Tn.V1)}static addSchema(t,e){t.addFieldOffset(1,e,0)}static addDictionaries(t,e){t.addFieldOffset(2,e,0)}static startDictionariesVector(t,e){t.startVector(24,e,8)}static addRecordBatches(t,e){t.addFieldOffset(3,e,0)}static startRecordBatchesVector(t,e){t.startVector(24,e,8)}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endFooter(t){return t.endObject()}static finishFooterBuffer(t,e){t.finish(e)}static finishSizePrefixedFooterBuffer(t,e){t.finish(e,void 0,!0)}}var En=In,Rn=Mn,Pn=Dn;class Vn{constructor(t,e=n.V4,i,r){this.schema=t,this.version=e,i&&(this._recordBatches=i),r&&(this._dictionaryBatches=r)}static decode(t){t=new Pn(K(t));const e=Cn.getRootAsFooter(t),i=Wi.decode(e.schema());return new jn(i,e)}static encode(t){const e=new Rn,i=Wi.encode(e,t.schema);Cn.startRecordBatchesVector(e,t.numRecordBatches);for(const i of[...t.recordBatches()].slice().reverse())zn.encode(e,i);const r=e.endVector();Cn.startDictionariesVector(e,t.numDictionaries);for(const i of[...t.dictionaryBatches()].slice().reverse())zn.encode(e,i);const s=e.endVector();return Cn.startFooter(e),Cn.addSchema(e,i),Cn.addVersion(e,n.V4),Cn.addRecordBatches(e,r),Cn.addDictionaries(e,s),Cn.finishFooterBuffer(e,Cn.endFooter(e)),e.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let t,e=-1,i=this.numRecordBatches;++e<i;)(t=this.getRecordBatch(e))&&(yield t)}*dictionaryBatches(){for(let t,e=-1,i=this.numDictionaries;++e<i;)(t=this.getDictionaryBatch(e))&&(yield t)}getRecordBatch(t){return t>=0&&t<this.numRecordBatches&&this._recordBatches[t]||null}getDictionaryBatch(t){return t>=0&&t<this.numDictionaries&&this._dictionaryBatches[t]||null}}class jn extends Vn{constructor(t,e){super(t,e.version()),this._footer=e}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(t){if(t>=0&&t<this.numRecordBatches){const e=this._footer.recordBatches(t);if(e)return zn.decode(e)}return null}getDictionaryBatch(t){if(t>=0&&t<this.numDictionaries){const e=this._footer.dictionaries(t);if(e)return zn.decode(e)}return null}}class zn{constructor(t,e,i){this.metaDataLength=t,this.offset="number"==typeof i?i:i.low,this.bodyLength="number"==typeof e?e:e.low}static decode(t){return new zn(t.metaDataLength(),t.bodyLength(),t.offset())}static encode(t,e){const{metaDataLength:i}=e,n=new En(e.offset,0),r=new En(e.bodyLength,0);return mn.createBlock(t,n,i,r)}}const kn={fromIterable:t=>$n(function*(t){let e,i,n,r,s=!1,o=[],a=0;function c(){return"peek"===n?Y(o,r)[0]:([i,o,a]=Y(o,r),i)}({cmd:n,size:r}=yield null);const l=(u=t,function*(t,e){const i=function*(t){yield t},n="string"==typeof e||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof k?i(e):S(e)?e:i(e);return yield*J(function*(e){let i=null;do{i=e.next(yield W(t,i))}while(!i.done)}(n[Symbol.iterator]())),new t}(Uint8Array,u))[Symbol.iterator]();var u;try{do{if(({done:e,value:i}=Number.isNaN(r-a)?l.next():l.next(r-a)),!e&&i.byteLength>0&&(o.push(i),a+=i.byteLength),e||r<=a)do{({cmd:n,size:r}=yield c())}while(r<a)}while(!e)}catch(t){(s=!0)&&"function"==typeof l.throw&&l.throw(t)}finally{!1===s&&"function"==typeof l.return&&l.return(null)}return null}(t)),fromAsyncIterable:t=>$n(function(t){return C(this,arguments,function*(){let e,i,n,r,s=!1,o=[],a=0;function c(){return"peek"===n?Y(o,r)[0]:([i,o,a]=Y(o,r),i)}({cmd:n,size:r}=yield yield U(null));const l=(u=t,q(Uint8Array,u))[Symbol.asyncIterator]();var u;try{do{if(({done:e,value:i}=Number.isNaN(r-a)?yield U(l.next()):yield U(l.next(r-a))),!e&&i.byteLength>0&&(o.push(i),a+=i.byteLength),e||r<=a)do{({cmd:n,size:r}=yield yield U(c()))}while(r<a)}while(!e)}catch(t){(s=!0)&&"function"==typeof l.throw&&(yield U(l.throw(t)))}finally{!1===s&&"function"==typeof l.return&&(yield U(l.return(new Uint8Array(0))))}return yield U(null)})}(t)),fromDOMStream:t=>$n(function(t){return C(this,arguments,function*(){let e,i,n,r=!1,s=!1,o=[],a=0;function c(){return"peek"===i?Y(o,n)[0]:([e,o,a]=Y(o,n),e)}({cmd:i,size:n}=yield yield U(null));const l=new Yn(t);try{do{if(({done:r,value:e}=Number.isNaN(n-a)?yield U(l.read()):yield U(l.read(n-a))),!r&&e.byteLength>0&&(o.push(K(e)),a+=e.byteLength),r||n<=a)do{({cmd:i,size:n}=yield yield U(c()))}while(n<a)}while(!r)}catch(t){(s=!0)&&(yield U(l.cancel(t)))}finally{!1===s?yield U(l.cancel()):t.locked&&l.releaseLock()}return yield U(null)})}(t)),fromNodeStream:t=>$n(function(t){return C(this,arguments,function*(){const e=[];let i,n,r,s="error",o=!1,a=null,c=0,l=[];function u(){return"peek"===i?Y(l,n)[0]:([r,l,c]=Y(l,n),r)}if(({cmd:i,size:n}=yield yield U(null)),t.isTTY)return yield yield U(new Uint8Array(0)),yield U(null);try{e[0]=Wn(t,"end"),e[1]=Wn(t,"error");do{if(e[2]=Wn(t,"readable"),[s,a]=yield U(Promise.race(e.map(t=>t[2]))),"error"===s)break;if((o="end"===s)||(Number.isFinite(n-c)?(r=K(t.read(n-c)),r.byteLength<n-c&&(r=K(t.read()))):r=K(t.read()),r.byteLength>0&&(l.push(r),c+=r.byteLength)),o||n<=c)do{({cmd:i,size:n}=yield yield U(u()))}while(n<c)}while(!o)}finally{yield U(function(e,i){return r=l=null,new Promise((n,r)=>{for(const[i,n]of e)t.off(i,n);try{const e=t.destroy;e&&e.call(t,i),i=void 0}catch(t){i=t||i}finally{null!=i?r(i):n()}})}(e,"error"===s?a:null))}return yield U(null)})}(t)),toDOMStream(t,e){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(t,e){throw new Error('"toNodeStream" not available in this environment')}},$n=t=>(t.next(),t);class Yn{constructor(t){this.source=t,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch(()=>{})}get closed(){return this.reader?this.reader.closed.catch(()=>{}):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(t){return L(this,void 0,void 0,function*(){const{reader:e,source:i}=this;e&&(yield e.cancel(t).catch(()=>{})),i&&i.locked&&this.releaseLock()})}read(t){return L(this,void 0,void 0,function*(){if(0===t)return{done:null==this.reader,value:new Uint8Array(0)};const e=yield this.reader.read();return!e.done&&(e.value=K(e)),e})}}const Wn=(t,e)=>{const i=t=>n([e,t]);let n;return[e,i,new Promise(r=>(n=r)&&t.once(e,i))]},Hn=Object.freeze({done:!0,value:void 0});class Kn{constructor(t){this._json=t}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class Jn{tee(){return this._getDOMStream().tee()}pipe(t,e){return this._getNodeStream().pipe(t,e)}pipeTo(t,e){return this._getDOMStream().pipeTo(t,e)}pipeThrough(t,e){return this._getDOMStream().pipeThrough(t,e)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class qn extends Jn{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise(t=>this._closedPromiseResolve=t)}get closed(){return this._closedPromise}cancel(t){return L(this,void 0,void 0,function*(){yield this.return(t)})}write(t){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(t):this.resolvers.shift().resolve({done:!1,value:t}))}abort(t){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:t}:this.resolvers.shift().reject({done:!0,value:t}))}close(){if(this._closedPromiseResolve){const{resolvers:t}=this;for(;t.length>0;)t.shift().resolve(Hn);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(t){return kn.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,t)}toNodeStream(t){return kn.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,t)}throw(t){return L(this,void 0,void 0,function*(){return yield this.abort(t),Hn})}return(t){return L(this,void 0,void 0,function*(){return yield this.close(),Hn})}read(t){return L(this,void 0,void 0,function*(){return(yield this.next(t,"read")).value})}peek(t){return L(this,void 0,void 0,function*(){return(yield this.next(t,"peek")).value})}next(...t){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise((t,e)=>{this.resolvers.push({resolve:t,reject:e})}):Promise.resolve(Hn)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}}class Gn extends qn{write(t){if((t=K(t)).byteLength>0)return super.write(t)}toString(t=!1){return t?V(this.toUint8Array(!0)):this.toUint8Array(!1).then(V)}toUint8Array(t=!1){return t?Y(this._values)[0]:(()=>L(this,void 0,void 0,function*(){var t,e;const i=[];let n=0;try{for(var r,s=R(this);!(r=yield s.next()).done;){const t=r.value;i.push(t),n+=t.byteLength}}catch(e){t={error:e}}finally{try{r&&!r.done&&(e=s.return)&&(yield e.call(s))}finally{if(t)throw t.error}}return Y(i,n)[0]}))()}}class Zn{constructor(t){t&&(this.source=new Xn(kn.fromIterable(t)))}[Symbol.iterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class Qn{constructor(t){t instanceof Qn?this.source=t.source:t instanceof Gn?this.source=new tr(kn.fromAsyncIterable(t)):x(t)?this.source=new tr(kn.fromNodeStream(t)):F(t)?this.source=new tr(kn.fromDOMStream(t)):D(t)?this.source=new tr(kn.fromDOMStream(t.body)):S(t)?this.source=new tr(kn.fromIterable(t)):(I(t)||T(t))&&(this.source=new tr(kn.fromAsyncIterable(t)))}[Symbol.asyncIterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}get closed(){return this.source.closed}cancel(t){return this.source.cancel(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class Xn{constructor(t){this.source=t}cancel(t){this.return(t)}peek(t){return this.next(t,"peek").value}read(t){return this.next(t,"read").value}next(t,e="read"){return this.source.next({cmd:e,size:t})}throw(t){return Object.create(this.source.throw&&this.source.throw(t)||Hn)}return(t){return Object.create(this.source.return&&this.source.return(t)||Hn)}}class tr{constructor(t){this.source=t,this._closedPromise=new Promise(t=>this._closedPromiseResolve=t)}cancel(t){return L(this,void 0,void 0,function*(){yield this.return(t)})}get closed(){return this._closedPromise}read(t){return L(this,void 0,void 0,function*(){return(yield this.next(t,"read")).value})}peek(t){return L(this,void 0,void 0,function*(){return(yield this.next(t,"peek")).value})}next(t,e="read"){return L(this,void 0,void 0,function*(){return yield this.source.next({cmd:e,size:t})})}throw(t){return L(this,void 0,void 0,function*(){const e=this.source.throw&&(yield this.source.throw(t))||Hn;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)})}return(t){return L(this,void 0,void 0,function*(){const e=this.source.return&&(yield this.source.return(t))||Hn;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)})}}class er extends Zn{constructor(t,e){super(),this.position=0,this.buffer=K(t),this.size=void 0===e?this.buffer.byteLength:e}readInt32(t){const{buffer:e,byteOffset:i}=this.readAt(t,4);return new DataView(e,i).getInt32(0,!0)}seek(t){return this.position=Math.min(t,this.size),t<this.size}read(t){const{buffer:e,size:i,position:n}=this;return e&&n<i?("number"!=typeof t&&(t=Number.POSITIVE_INFINITY),this.position=Math.min(i,n+Math.min(i-n,t)),e.subarray(n,this.position)):null}readAt(t,e){const i=this.buffer,n=Math.min(this.size,t+e);return i?i.subarray(t,n):new Uint8Array(e)}close(){this.buffer&&(this.buffer=null)}throw(t){return this.close(),{done:!0,value:t}}return(t){return this.close(),{done:!0,value:t}}}class ir extends Qn{constructor(t,e){super(),this.position=0,this._handle=t,"number"==typeof e?this.size=e:this._pending=(()=>L(this,void 0,void 0,function*(){this.size=(yield t.stat()).size,delete this._pending}))()}readInt32(t){return L(this,void 0,void 0,function*(){const{buffer:e,byteOffset:i}=yield this.readAt(t,4);return new DataView(e,i).getInt32(0,!0)})}seek(t){return L(this,void 0,void 0,function*(){return this._pending&&(yield this._pending),this.position=Math.min(t,this.size),t<this.size})}read(t){return L(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:e,size:i,position:n}=this;if(e&&n<i){"number"!=typeof t&&(t=Number.POSITIVE_INFINITY);let r=n,s=0,o=0;const a=Math.min(i,r+Math.min(i-r,t)),c=new Uint8Array(Math.max(0,(this.position=a)-r));for(;(r+=o)<a&&(s+=o)<c.byteLength;)({bytesRead:o}=yield e.read(c,s,c.byteLength-s,r));return c}return null})}readAt(t,e){return L(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:i,size:n}=this;if(i&&t+e<n){const r=Math.min(n,t+e),s=new Uint8Array(r-t);return(yield i.read(s,0,e,t)).buffer}return new Uint8Array(e)})}close(){return L(this,void 0,void 0,function*(){const t=this._handle;this._handle=null,t&&(yield t.close())})}throw(t){return L(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:t}})}return(t){return L(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:t}})}}function nr(t){return t<0&&(t=4294967295+t+1),`0x${t.toString(16)}`}const rr=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8];class sr{constructor(t){this.buffer=t}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(t){const e=new Uint32Array([this.buffer[1]>>>16,65535&this.buffer[1],this.buffer[0]>>>16,65535&this.buffer[0]]),i=new Uint32Array([t.buffer[1]>>>16,65535&t.buffer[1],t.buffer[0]>>>16,65535&t.buffer[0]]);let n=e[3]*i[3];this.buffer[0]=65535&n;let r=n>>>16;return n=e[2]*i[3],r+=n,n=e[3]*i[2]>>>0,r+=n,this.buffer[0]+=r<<16,this.buffer[1]=r>>>0<n?65536:0,this.buffer[1]+=r>>>16,this.buffer[1]+=e[1]*i[3]+e[2]*i[2]+e[3]*i[1],this.buffer[1]+=e[0]*i[3]+e[1]*i[2]+e[2]*i[1]+e[3]*i[0]<<16,this}_plus(t){const e=this.buffer[0]+t.buffer[0]>>>0;this.buffer[1]+=t.buffer[1],e<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=e}lessThan(t){return this.buffer[1]<t.buffer[1]||this.buffer[1]===t.buffer[1]&&this.buffer[0]<t.buffer[0]}equals(t){return this.buffer[1]===t.buffer[1]&&this.buffer[0]==t.buffer[0]}greaterThan(t){return t.lessThan(this)}hex(){return`${nr(this.buffer[1])} ${nr(this.buffer[0])}`}}class or extends sr{times(t){return this._times(t),this}plus(t){return this._plus(t),this}static from(t,e=new Uint32Array(2)){return or.fromString("string"==typeof t?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(2)){return or.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(2)){const i=t.length,n=new or(e);for(let e=0;e<i;){const r=8<i-e?8:i-e,s=new or(new Uint32Array([Number.parseInt(t.slice(e,e+r),10),0])),o=new or(new Uint32Array([rr[r],0]));n.times(o),n.plus(s),e+=r}return n}static convertArray(t){const e=new Uint32Array(2*t.length);for(let i=-1,n=t.length;++i<n;)or.from(t[i],new Uint32Array(e.buffer,e.byteOffset+2*i*4,2));return e}static multiply(t,e){return new or(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new or(new Uint32Array(t.buffer)).plus(e)}}class ar extends sr{negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],0==this.buffer[0]&&++this.buffer[1],this}times(t){return this._times(t),this}plus(t){return this._plus(t),this}lessThan(t){const e=0|this.buffer[1],i=0|t.buffer[1];return e<i||e===i&&this.buffer[0]<t.buffer[0]}static from(t,e=new Uint32Array(2)){return ar.fromString("string"==typeof t?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(2)){return ar.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(2)){const i=t.startsWith("-"),n=t.length,r=new ar(e);for(let e=i?1:0;e<n;){const i=8<n-e?8:n-e,s=new ar(new Uint32Array([Number.parseInt(t.slice(e,e+i),10),0])),o=new ar(new Uint32Array([rr[i],0]));r.times(o),r.plus(s),e+=i}return i?r.negate():r}static convertArray(t){const e=new Uint32Array(2*t.length);for(let i=-1,n=t.length;++i<n;)ar.from(t[i],new Uint32Array(e.buffer,e.byteOffset+2*i*4,2));return e}static multiply(t,e){return new ar(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new ar(new Uint32Array(t.buffer)).plus(e)}}class cr{constructor(t){this.buffer=t}high(){return new ar(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new ar(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],0==this.buffer[0]&&++this.buffer[1],0==this.buffer[1]&&++this.buffer[2],0==this.buffer[2]&&++this.buffer[3],this}times(t){const e=new or(new Uint32Array([this.buffer[3],0])),i=new or(new Uint32Array([this.buffer[2],0])),n=new or(new Uint32Array([this.buffer[1],0])),r=new or(new Uint32Array([this.buffer[0],0])),s=new or(new Uint32Array([t.buffer[3],0])),o=new or(new Uint32Array([t.buffer[2],0])),a=new or(new Uint32Array([t.buffer[1],0])),c=new or(new Uint32Array([t.buffer[0],0]));let l=or.multiply(r,c);this.buffer[0]=l.low();const u=new or(new Uint32Array([l.high(),0]));return l=or.multiply(n,c),u.plus(l),l=or.multiply(r,a),u.plus(l),this.buffer[1]=u.low(),this.buffer[3]=u.lessThan(l)?1:0,this.buffer[2]=u.high(),new or(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(or.multiply(i,c)).plus(or.multiply(n,a)).plus(or.multiply(r,o)),this.buffer[3]+=or.multiply(e,c).plus(or.multiply(i,a)).plus(or.multiply(n,o)).plus(or.multiply(r,s)).low(),this}plus(t){const e=new Uint32Array(4);return e[3]=this.buffer[3]+t.buffer[3]>>>0,e[2]=this.buffer[2]+t.buffer[2]>>>0,e[1]=this.buffer[1]+t.buffer[1]>>>0,e[0]=this.buffer[0]+t.buffer[0]>>>0,e[0]<this.buffer[0]>>>0&&++e[1],e[1]<this.buffer[1]>>>0&&++e[2],e[2]<this.buffer[2]>>>0&&++e[3],this.buffer[3]=e[3],this.buffer[2]=e[2],this.buffer[1]=e[1],this.buffer[0]=e[0],this}hex(){return`${nr(this.buffer[3])} ${nr(this.buffer[2])} ${nr(this.buffer[1])} ${nr(this.buffer[0])}`}static multiply(t,e){return new cr(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new cr(new Uint32Array(t.buffer)).plus(e)}static from(t,e=new Uint32Array(4)){return cr.fromString("string"==typeof t?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(4)){return cr.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(4)){const i=t.startsWith("-"),n=t.length,r=new cr(e);for(let e=i?1:0;e<n;){const i=8<n-e?8:n-e,s=new cr(new Uint32Array([Number.parseInt(t.slice(e,e+i),10),0,0,0])),o=new cr(new Uint32Array([rr[i],0,0,0]));r.times(o),r.plus(s),e+=i}return i?r.negate():r}static convertArray(t){const e=new Uint32Array(4*t.length);for(let i=-1,n=t.length;++i<n;)cr.from(t[i],new Uint32Array(e.buffer,e.byteOffset+16*i,4));return e}}class lr extends Gt{constructor(t,e,i,n){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=t,this.nodes=e,this.buffers=i,this.dictionaries=n}visit(t){return super.visit(t instanceof Hi?t.type:t)}visitNull(t,{length:e}=this.nextFieldNode()){return Yi({type:t,length:e})}visitBool(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitInt(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitFloat(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitUtf8(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitBinary(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitFixedSizeBinary(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitDate(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitTimestamp(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitTime(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitDecimal(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitList(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}visitStruct(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),children:this.visitMany(t.children)})}visitUnion(t){return t.mode===r.Sparse?this.visitSparseUnion(t):this.visitDenseUnion(t)}visitDenseUnion(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),typeIds:this.readTypeIds(t),valueOffsets:this.readOffsets(t),children:this.visitMany(t.children)})}visitSparseUnion(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),typeIds:this.readTypeIds(t),children:this.visitMany(t.children)})}visitDictionary(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t.indices),dictionary:this.readDictionary(t)})}visitInterval(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitFixedSizeList(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),child:this.visit(t.children[0])})}visitMap(t,{length:e,nullCount:i}=this.nextFieldNode()){return Yi({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(t,e,i=this.nextBufferRange()){return e>0&&this.readData(t,i)||new Uint8Array(0)}readOffsets(t,e){return this.readData(t,e)}readTypeIds(t,e){return this.readData(t,e)}readData(t,{length:e,offset:i}=this.nextBufferRange()){return this.bytes.subarray(i,i+e)}readDictionary(t){return this.dictionaries.get(t.id)}}class ur extends lr{constructor(t,e,i,n){super(new Uint8Array(0),e,i,n),this.sources=t}readNullBitmap(t,e,{offset:i}=this.nextBufferRange()){return e<=0?new Uint8Array(0):_i(this.sources[i])}readOffsets(t,{offset:e}=this.nextBufferRange()){return W(Uint8Array,W(Int32Array,this.sources[e]))}readTypeIds(t,{offset:e}=this.nextBufferRange()){return W(Uint8Array,W(t.ArrayType,this.sources[e]))}readData(t,{offset:e}=this.nextBufferRange()){const{sources:i}=this;return Ot.isTimestamp(t)||(Ot.isInt(t)||Ot.isTime(t))&&64===t.bitWidth||Ot.isDate(t)&&t.unit===o.MILLISECOND?W(Uint8Array,ar.convertArray(i[e])):Ot.isDecimal(t)?W(Uint8Array,cr.convertArray(i[e])):Ot.isBinary(t)||Ot.isFixedSizeBinary(t)?function(t){const e=t.join(""),i=new Uint8Array(e.length/2);for(let t=0;t<e.length;t+=2)i[t>>1]=Number.parseInt(e.slice(t,t+2),16);return i}(i[e]):Ot.isBool(t)?_i(i[e]):Ot.isUtf8(t)?z(i[e].join("")):W(Uint8Array,W(t.ArrayType,i[e].map(t=>+t)))}}var dr,hr,pr,fr,yr,br,mr,gr;!function(t){t[t.BUFFER=0]="BUFFER"}(dr||(dr={})),function(t){t[t.LZ4_FRAME=0]="LZ4_FRAME",t[t.ZSTD=1]="ZSTD"}(hr||(hr={}));class vr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBodyCompression(t,e){return(e||new vr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBodyCompression(t,e){return t.setPosition(t.position()+4),(e||new vr).__init(t.readInt32(t.position())+t.position(),t)}codec(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt8(this.bb_pos+t):hr.LZ4_FRAME}method(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt8(this.bb_pos+t):dr.BUFFER}static startBodyCompression(t){t.startObject(2)}static addCodec(t,e){t.addFieldInt8(0,e,hr.LZ4_FRAME)}static addMethod(t,e){t.addFieldInt8(1,e,dr.BUFFER)}static endBodyCompression(t){return t.endObject()}static createBodyCompression(t,e,i){return vr.startBodyCompression(t),vr.addCodec(t,e),vr.addMethod(t,i),vr.endBodyCompression(t)}}class _r{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(t,e,i){return t.prep(8,16),t.writeInt64(i),t.writeInt64(e),t.offset()}}class wr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(t,e,i){return t.prep(8,16),t.writeInt64(i),t.writeInt64(e),t.offset()}}class Ir{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsRecordBatch(t,e){return(e||new Ir).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsRecordBatch(t,e){return t.setPosition(t.position()+4),(e||new Ir).__init(t.readInt32(t.position())+t.position(),t)}length(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}nodes(t,e){const i=this.bb.__offset(this.bb_pos,6);return i?(e||new wr).__init(this.bb.__vector(this.bb_pos+i)+16*t,this.bb):null}nodesLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}buffers(t,e){const i=this.bb.__offset(this.bb_pos,8);return i?(e||new _r).__init(this.bb.__vector(this.bb_pos+i)+16*t,this.bb):null}buffersLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}compression(t){const e=this.bb.__offset(this.bb_pos,10);return e?(t||new vr).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}static startRecordBatch(t){t.startObject(4)}static addLength(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addNodes(t,e){t.addFieldOffset(1,e,0)}static startNodesVector(t,e){t.startVector(16,e,8)}static addBuffers(t,e){t.addFieldOffset(2,e,0)}static startBuffersVector(t,e){t.startVector(16,e,8)}static addCompression(t,e){t.addFieldOffset(3,e,0)}static endRecordBatch(t){return t.endObject()}}class Sr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryBatch(t,e){return(e||new Sr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryBatch(t,e){return t.setPosition(t.position()+4),(e||new Sr).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}data(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Ir).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isDelta(){const t=this.bb.__offset(this.bb_pos,8);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startDictionaryBatch(t){t.startObject(3)}static addId(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addData(t,e){t.addFieldOffset(1,e,0)}static addIsDelta(t,e){t.addFieldInt8(2,+e,0)}static endDictionaryBatch(t){return t.endObject()}}!function(t){t[t.HALF=0]="HALF",t[t.SINGLE=1]="SINGLE",t[t.DOUBLE=2]="DOUBLE"}(pr||(pr={}));class Tr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFloatingPoint(t,e){return(e||new Tr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFloatingPoint(t,e){return t.setPosition(t.position()+4),(e||new Tr).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):pr.HALF}static startFloatingPoint(t){t.startObject(1)}static addPrecision(t,e){t.addFieldInt16(0,e,pr.HALF)}static endFloatingPoint(t){return t.endObject()}static createFloatingPoint(t,e){return Tr.startFloatingPoint(t),Tr.addPrecision(t,e),Tr.endFloatingPoint(t)}}class Br{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDecimal(t,e){return(e||new Br).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDecimal(t,e){return t.setPosition(t.position()+4),(e||new Br).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}scale(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):0}bitWidth(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readInt32(this.bb_pos+t):128}static startDecimal(t){t.startObject(3)}static addPrecision(t,e){t.addFieldInt32(0,e,0)}static addScale(t,e){t.addFieldInt32(1,e,0)}static addBitWidth(t,e){t.addFieldInt32(2,e,128)}static endDecimal(t){return t.endObject()}static createDecimal(t,e,i,n){return Br.startDecimal(t),Br.addPrecision(t,e),Br.addScale(t,i),Br.addBitWidth(t,n),Br.endDecimal(t)}}!function(t){t[t.DAY=0]="DAY",t[t.MILLISECOND=1]="MILLISECOND"}(fr||(fr={}));class Ar{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDate(t,e){return(e||new Ar).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDate(t,e){return t.setPosition(t.position()+4),(e||new Ar).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):fr.MILLISECOND}static startDate(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,fr.MILLISECOND)}static endDate(t){return t.endObject()}static createDate(t,e){return Ar.startDate(t),Ar.addUnit(t,e),Ar.endDate(t)}}!function(t){t[t.SECOND=0]="SECOND",t[t.MILLISECOND=1]="MILLISECOND",t[t.MICROSECOND=2]="MICROSECOND",t[t.NANOSECOND=3]="NANOSECOND"}(yr||(yr={}));class Or{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTime(t,e){return(e||new Or).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTime(t,e){return t.setPosition(t.position()+4),(e||new Or).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):yr.MILLISECOND}bitWidth(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):32}static startTime(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,yr.MILLISECOND)}static addBitWidth(t,e){t.addFieldInt32(1,e,32)}static endTime(t){return t.endObject()}static createTime(t,e,i){return Or.startTime(t),Or.addUnit(t,e),Or.addBitWidth(t,i),Or.endTime(t)}}class Dr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTimestamp(t,e){return(e||new Dr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTimestamp(t,e){return t.setPosition(t.position()+4),(e||new Dr).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):yr.SECOND}timezone(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startTimestamp(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,yr.SECOND)}static addTimezone(t,e){t.addFieldOffset(1,e,0)}static endTimestamp(t){return t.endObject()}static createTimestamp(t,e,i){return Dr.startTimestamp(t),Dr.addUnit(t,e),Dr.addTimezone(t,i),Dr.endTimestamp(t)}}!function(t){t[t.YEAR_MONTH=0]="YEAR_MONTH",t[t.DAY_TIME=1]="DAY_TIME",t[t.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(br||(br={}));class Mr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInterval(t,e){return(e||new Mr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInterval(t,e){return t.setPosition(t.position()+4),(e||new Mr).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):br.YEAR_MONTH}static startInterval(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,br.YEAR_MONTH)}static endInterval(t){return t.endObject()}static createInterval(t,e){return Mr.startInterval(t),Mr.addUnit(t,e),Mr.endInterval(t)}}!function(t){t[t.Sparse=0]="Sparse",t[t.Dense=1]="Dense"}(mr||(mr={}));class Fr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUnion(t,e){return(e||new Fr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUnion(t,e){return t.setPosition(t.position()+4),(e||new Fr).__init(t.readInt32(t.position())+t.position(),t)}mode(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):mr.Sparse}typeIds(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb.__vector(this.bb_pos+e)+4*t):0}typeIdsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}typeIdsArray(){const t=this.bb.__offset(this.bb_pos,6);return t?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+t),this.bb.__vector_len(this.bb_pos+t)):null}static startUnion(t){t.startObject(2)}static addMode(t,e){t.addFieldInt16(0,e,mr.Sparse)}static addTypeIds(t,e){t.addFieldOffset(1,e,0)}static createTypeIdsVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addInt32(e[i]);return t.endVector()}static startTypeIdsVector(t,e){t.startVector(4,e,4)}static endUnion(t){return t.endObject()}static createUnion(t,e,i){return Fr.startUnion(t),Fr.addMode(t,e),Fr.addTypeIds(t,i),Fr.endUnion(t)}}class xr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeBinary(t,e){return(e||new xr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeBinary(t,e){return t.setPosition(t.position()+4),(e||new xr).__init(t.readInt32(t.position())+t.position(),t)}byteWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeBinary(t){t.startObject(1)}static addByteWidth(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeBinary(t){return t.endObject()}static createFixedSizeBinary(t,e){return xr.startFixedSizeBinary(t),xr.addByteWidth(t,e),xr.endFixedSizeBinary(t)}}class Nr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeList(t,e){return(e||new Nr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeList(t,e){return t.setPosition(t.position()+4),(e||new Nr).__init(t.readInt32(t.position())+t.position(),t)}listSize(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeList(t){t.startObject(1)}static addListSize(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeList(t){return t.endObject()}static createFixedSizeList(t,e){return Nr.startFixedSizeList(t),Nr.addListSize(t,e),Nr.endFixedSizeList(t)}}class Lr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMap(t,e){return(e||new Lr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMap(t,e){return t.setPosition(t.position()+4),(e||new Lr).__init(t.readInt32(t.position())+t.position(),t)}keysSorted(){const t=this.bb.__offset(this.bb_pos,4);return!!t&&!!this.bb.readInt8(this.bb_pos+t)}static startMap(t){t.startObject(1)}static addKeysSorted(t,e){t.addFieldInt8(0,+e,0)}static endMap(t){return t.endObject()}static createMap(t,e){return Lr.startMap(t),Lr.addKeysSorted(t,e),Lr.endMap(t)}}!function(t){t[t.NONE=0]="NONE",t[t.Schema=1]="Schema",t[t.DictionaryBatch=2]="DictionaryBatch",t[t.RecordBatch=3]="RecordBatch",t[t.Tensor=4]="Tensor",t[t.SparseTensor=5]="SparseTensor"}(gr||(gr={}));class Ur{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMessage(t,e){return(e||new Ur).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMessage(t,e){return t.setPosition(t.position()+4),(e||new Ur).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Tn.V1}headerType(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readUint8(this.bb_pos+t):gr.NONE}header(t){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__union(t,this.bb_pos+e):null}bodyLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,12);return i?(e||new Fn).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+4*t),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startMessage(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,Tn.V1)}static addHeaderType(t,e){t.addFieldInt8(1,e,gr.NONE)}static addHeader(t,e){t.addFieldOffset(2,e,0)}static addBodyLength(t,e){t.addFieldInt64(3,e,t.createLong(0,0))}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endMessage(t){return t.endObject()}static finishMessageBuffer(t,e){t.finish(e)}static finishSizePrefixedMessageBuffer(t,e){t.finish(e,void 0,!0)}static createMessage(t,e,i,n,r,s){return Ur.startMessage(t),Ur.addVersion(t,e),Ur.addHeaderType(t,i),Ur.addHeader(t,n),Ur.addBodyLength(t,r),Ur.addCustomMetadata(t,s),Ur.endMessage(t)}}class Cr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsNull(t,e){return(e||new Cr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsNull(t,e){return t.setPosition(t.position()+4),(e||new Cr).__init(t.readInt32(t.position())+t.position(),t)}static startNull(t){t.startObject(0)}static endNull(t){return t.endObject()}static createNull(t){return Cr.startNull(t),Cr.endNull(t)}}class Er{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBinary(t,e){return(e||new Er).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBinary(t,e){return t.setPosition(t.position()+4),(e||new Er).__init(t.readInt32(t.position())+t.position(),t)}static startBinary(t){t.startObject(0)}static endBinary(t){return t.endObject()}static createBinary(t){return Er.startBinary(t),Er.endBinary(t)}}class Rr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBool(t,e){return(e||new Rr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBool(t,e){return t.setPosition(t.position()+4),(e||new Rr).__init(t.readInt32(t.position())+t.position(),t)}static startBool(t){t.startObject(0)}static endBool(t){return t.endObject()}static createBool(t){return Rr.startBool(t),Rr.endBool(t)}}class Pr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUtf8(t,e){return(e||new Pr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUtf8(t,e){return t.setPosition(t.position()+4),(e||new Pr).__init(t.readInt32(t.position())+t.position(),t)}static startUtf8(t){t.startObject(0)}static endUtf8(t){return t.endObject()}static createUtf8(t){return Pr.startUtf8(t),Pr.endUtf8(t)}}class Vr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsList(t,e){return(e||new Vr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsList(t,e){return t.setPosition(t.position()+4),(e||new Vr).__init(t.readInt32(t.position())+t.position(),t)}static startList(t){t.startObject(0)}static endList(t){return t.endObject()}static createList(t){return Vr.startList(t),Vr.endList(t)}}class jr{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsStruct_(t,e){return(e||new jr).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsStruct_(t,e){return t.setPosition(t.position()+4),(e||new jr).__init(t.readInt32(t.position())+t.position(),t)}static startStruct_(t){t.startObject(0)}static endStruct_(t){return t.endObject()}static createStruct_(t){return jr.startStruct_(t),jr.endStruct_(t)}}var zr=In;const kr=new class extends Gt{visit(t,e){return null==t||null==e?void 0:super.visit(t,e)}visitNull(t,e){return Cr.startNull(e),Cr.endNull(e)}visitInt(t,e){return xn.startInt(e),xn.addBitWidth(e,t.bitWidth),xn.addIsSigned(e,t.isSigned),xn.endInt(e)}visitFloat(t,e){return Tr.startFloatingPoint(e),Tr.addPrecision(e,t.precision),Tr.endFloatingPoint(e)}visitBinary(t,e){return Er.startBinary(e),Er.endBinary(e)}visitBool(t,e){return Rr.startBool(e),Rr.endBool(e)}visitUtf8(t,e){return Pr.startUtf8(e),Pr.endUtf8(e)}visitDecimal(t,e){return Br.startDecimal(e),Br.addScale(e,t.scale),Br.addPrecision(e,t.precision),Br.addBitWidth(e,t.bitWidth),Br.endDecimal(e)}visitDate(t,e){return Ar.startDate(e),Ar.addUnit(e,t.unit),Ar.endDate(e)}visitTime(t,e){return Or.startTime(e),Or.addUnit(e,t.unit),Or.addBitWidth(e,t.bitWidth),Or.endTime(e)}visitTimestamp(t,e){const i=t.timezone&&e.createString(t.timezone)||void 0;return Dr.startTimestamp(e),Dr.addUnit(e,t.unit),void 0!==i&&Dr.addTimezone(e,i),Dr.endTimestamp(e)}visitInterval(t,e){return Mr.startInterval(e),Mr.addUnit(e,t.unit),Mr.endInterval(e)}visitList(t,e){return Vr.startList(e),Vr.endList(e)}visitStruct(t,e){return jr.startStruct_(e),jr.endStruct_(e)}visitUnion(t,e){Fr.startTypeIdsVector(e,t.typeIds.length);const i=Fr.createTypeIdsVector(e,t.typeIds);return Fr.startUnion(e),Fr.addMode(e,t.mode),Fr.addTypeIds(e,i),Fr.endUnion(e)}visitDictionary(t,e){const i=this.visit(t.indices,e);return Nn.startDictionaryEncoding(e),Nn.addId(e,new zr(t.id,0)),Nn.addIsOrdered(e,t.isOrdered),void 0!==i&&Nn.addIndexType(e,i),Nn.endDictionaryEncoding(e)}visitFixedSizeBinary(t,e){return xr.startFixedSizeBinary(e),xr.addByteWidth(e,t.byteWidth),xr.endFixedSizeBinary(e)}visitFixedSizeList(t,e){return Nr.startFixedSizeList(e),Nr.addListSize(e,t.listSize),Nr.endFixedSizeList(e)}visitMap(t,e){return Lr.startMap(e),Lr.addKeysSorted(e,t.keysSorted),Lr.endMap(e)}};function $r(t){return new ts(t.count,Wr(t.columns),Hr(t.columns))}function Yr(t,e){return(t.children||[]).filter(Boolean).map(t=>Hi.fromJSON(t,e))}function Wr(t){return(t||[]).reduce((t,e)=>{return[...t,new ns(e.count,(i=e.VALIDITY,(i||[]).reduce((t,e)=>t+ +(0===e),0))),...Wr(e.children)];var i},[])}function Hr(t,e=[]){for(let i=-1,n=(t||[]).length;++i<n;){const n=t[i];n.VALIDITY&&e.push(new is(e.length,n.VALIDITY.length)),n.TYPE&&e.push(new is(e.length,n.TYPE.length)),n.OFFSET&&e.push(new is(e.length,n.OFFSET.length)),n.DATA&&e.push(new is(e.length,n.DATA.length)),e=Hr(n.children,e)}return e}function Kr(t){return new Map(Object.entries(t||{}))}function Jr(t){return new Mt(t.isSigned,t.bitWidth)}function qr(t,e){const i=t.type.name;switch(i){case"NONE":case"null":return new Dt;case"binary":return new Nt;case"utf8":return new Lt;case"bool":return new Ut;case"list":return new jt((e||[])[0]);case"struct":case"struct_":return new zt(e||[])}switch(i){case"int":{const e=t.type;return new Mt(e.isSigned,e.bitWidth)}case"floatingpoint":{const e=t.type;return new xt(s[e.precision])}case"decimal":{const e=t.type;return new Ct(e.scale,e.precision,e.bitWidth)}case"date":{const e=t.type;return new Et(o[e.unit])}case"time":{const e=t.type;return new Rt(a[e.unit],e.bitWidth)}case"timestamp":{const e=t.type;return new Pt(a[e.unit],e.timezone)}case"interval":{const e=t.type;return new Vt(c[e.unit])}case"union":{const i=t.type;return new kt(r[i.mode],i.typeIds||[],e||[])}case"fixedsizebinary":{const e=t.type;return new $t(e.byteWidth)}case"fixedsizelist":{const i=t.type;return new Yt(i.listSize,(e||[])[0])}case"map":{const i=t.type;return new Wt((e||[])[0],i.keysSorted)}}throw new Error(`Unrecognized type: "${i}"`)}var Gr=In,Zr=Mn,Qr=Dn;class Xr{constructor(t,e,i,n){this._version=e,this._headerType=i,this.body=new Uint8Array(0),n&&(this._createHeader=()=>n),this._bodyLength="number"==typeof t?t:t.low}static fromJSON(t,e){const i=new Xr(0,n.V4,e);return i._createHeader=function(t,e){return()=>{switch(e){case l.Schema:return Wi.fromJSON(t);case l.RecordBatch:return ts.fromJSON(t);case l.DictionaryBatch:return es.fromJSON(t)}throw new Error(`Unrecognized Message type: { name: ${l[e]}, type: ${e} }`)}}(t,e),i}static decode(t){t=new Qr(K(t));const e=Ur.getRootAsMessage(t),i=e.bodyLength(),n=e.version(),r=e.headerType(),s=new Xr(i,n,r);return s._createHeader=function(t,e){return()=>{switch(e){case l.Schema:return Wi.decode(t.header(new Un));case l.RecordBatch:return ts.decode(t.header(new Ir),t.version());case l.DictionaryBatch:return es.decode(t.header(new Sr),t.version())}throw new Error(`Unrecognized Message type: { name: ${l[e]}, type: ${e} }`)}}(e,r),s}static encode(t){const e=new Zr;let i=-1;return t.isSchema()?i=Wi.encode(e,t.header()):t.isRecordBatch()?i=ts.encode(e,t.header()):t.isDictionaryBatch()&&(i=es.encode(e,t.header())),Ur.startMessage(e),Ur.addVersion(e,n.V4),Ur.addHeader(e,i),Ur.addHeaderType(e,t.headerType),Ur.addBodyLength(e,new Gr(t.bodyLength,0)),Ur.finishMessageBuffer(e,Ur.endMessage(e)),e.asUint8Array()}static from(t,e=0){if(t instanceof Wi)return new Xr(0,n.V4,l.Schema,t);if(t instanceof ts)return new Xr(e,n.V4,l.RecordBatch,t);if(t instanceof es)return new Xr(e,n.V4,l.DictionaryBatch,t);throw new Error(`Unrecognized Message header: ${t}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===l.Schema}isRecordBatch(){return this.headerType===l.RecordBatch}isDictionaryBatch(){return this.headerType===l.DictionaryBatch}}class ts{constructor(t,e,i){this._nodes=e,this._buffers=i,this._length="number"==typeof t?t:t.low}get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}}class es{constructor(t,e,i=!1){this._data=t,this._isDelta=i,this._id="number"==typeof e?e:e.low}get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}}class is{constructor(t,e){this.offset="number"==typeof t?t:t.low,this.length="number"==typeof e?e:e.low}}class ns{constructor(t,e){this.length="number"==typeof t?t:t.low,this.nullCount="number"==typeof e?e:e.low}}function rs(t,e){const i=[];for(let n,r=-1,s=-1,o=t.childrenLength();++r<o;)(n=t.children(r))&&(i[++s]=Hi.decode(n,e));return i}function ss(t){const e=new Map;if(t)for(let i,n,r=-1,s=Math.trunc(t.customMetadataLength());++r<s;)(i=t.customMetadata(r))&&null!=(n=i.key())&&e.set(n,i.value());return e}function os(t){return new Mt(t.isSigned(),t.bitWidth())}function as(t,e){const i=t.typeType();switch(i){case On.NONE:case On.Null:return new Dt;case On.Binary:return new Nt;case On.Utf8:return new Lt;case On.Bool:return new Ut;case On.List:return new jt((e||[])[0]);case On.Struct_:return new zt(e||[])}switch(i){case On.Int:{const e=t.type(new xn);return new Mt(e.isSigned(),e.bitWidth())}case On.FloatingPoint:{const e=t.type(new Tr);return new xt(e.precision())}case On.Decimal:{const e=t.type(new Br);return new Ct(e.scale(),e.precision(),e.bitWidth())}case On.Date:{const e=t.type(new Ar);return new Et(e.unit())}case On.Time:{const e=t.type(new Or);return new Rt(e.unit(),e.bitWidth())}case On.Timestamp:{const e=t.type(new Dr);return new Pt(e.unit(),e.timezone())}case On.Interval:{const e=t.type(new Mr);return new Vt(e.unit())}case On.Union:{const i=t.type(new Fr);return new kt(i.mode(),i.typeIdsArray()||[],e||[])}case On.FixedSizeBinary:{const e=t.type(new xr);return new $t(e.byteWidth())}case On.FixedSizeList:{const i=t.type(new Nr);return new Yt(i.listSize(),(e||[])[0])}case On.Map:{const i=t.type(new Lr);return new Wt((e||[])[0],i.keysSorted())}}throw new Error(`Unrecognized type: "${On[i]}" (${i})`)}Hi.encode=function(t,e){let i=-1,n=-1,r=-1;const s=e.type;let o=e.typeId;Ot.isDictionary(s)?(o=s.dictionary.typeId,r=kr.visit(s,t),n=kr.visit(s.dictionary,t)):n=kr.visit(s,t);const a=(s.children||[]).map(e=>Hi.encode(t,e)),c=Ln.createChildrenVector(t,a),l=e.metadata&&e.metadata.size>0?Ln.createCustomMetadataVector(t,[...e.metadata].map(([e,i])=>{const n=t.createString(`${e}`),r=t.createString(`${i}`);return Fn.startKeyValue(t),Fn.addKey(t,n),Fn.addValue(t,r),Fn.endKeyValue(t)})):-1;return e.name&&(i=t.createString(e.name)),Ln.startField(t),Ln.addType(t,n),Ln.addTypeType(t,o),Ln.addChildren(t,c),Ln.addNullable(t,!!e.nullable),-1!==i&&Ln.addName(t,i),-1!==r&&Ln.addDictionary(t,r),-1!==l&&Ln.addCustomMetadata(t,l),Ln.endField(t)},Hi.decode=function(t,e){let i,n,r,s,o,a;return e&&(a=t.dictionary())?e.has(i=a.id().low)?(s=(s=a.indexType())?os(s):new Ft,o=new Jt(e.get(i),s,i,a.isOrdered()),n=new Hi(t.name(),o,t.nullable(),ss(t))):(s=(s=a.indexType())?os(s):new Ft,e.set(i,r=as(t,rs(t,e))),o=new Jt(r,s,i,a.isOrdered()),n=new Hi(t.name(),o,t.nullable(),ss(t))):(r=as(t,rs(t,e)),n=new Hi(t.name(),r,t.nullable(),ss(t))),n||null},Hi.fromJSON=function(t,e){let i,n,r,s,o,a;return e&&(s=t.dictionary)?e.has(i=s.id)?(n=(n=s.indexType)?Jr(n):new Ft,a=new Jt(e.get(i),n,i,s.isOrdered),r=new Hi(t.name,a,t.nullable,Kr(t.customMetadata))):(n=(n=s.indexType)?Jr(n):new Ft,e.set(i,o=qr(t,Yr(t,e))),a=new Jt(o,n,i,s.isOrdered),r=new Hi(t.name,a,t.nullable,Kr(t.customMetadata))):(o=qr(t,Yr(t,e)),r=new Hi(t.name,o,t.nullable,Kr(t.customMetadata))),r||null},Wi.encode=function(t,e){const i=e.fields.map(e=>Hi.encode(t,e));Un.startFieldsVector(t,i.length);const n=Un.createFieldsVector(t,i),r=e.metadata&&e.metadata.size>0?Un.createCustomMetadataVector(t,[...e.metadata].map(([e,i])=>{const n=t.createString(`${e}`),r=t.createString(`${i}`);return Fn.startKeyValue(t),Fn.addKey(t,n),Fn.addValue(t,r),Fn.endKeyValue(t)})):-1;return Un.startSchema(t),Un.addFields(t,n),Un.addEndianness(t,cs?Bn.Little:Bn.Big),-1!==r&&Un.addCustomMetadata(t,r),Un.endSchema(t)},Wi.decode=function(t,e=new Map){const i=function(t,e){const i=[];for(let n,r=-1,s=-1,o=t.fieldsLength();++r<o;)(n=t.fields(r))&&(i[++s]=Hi.decode(n,e));return i}(t,e);return new Wi(i,ss(t),e)},Wi.fromJSON=function(t,e=new Map){return new Wi(function(t,e){return(t.fields||[]).filter(Boolean).map(t=>Hi.fromJSON(t,e))}(t,e),Kr(t.customMetadata),e)},ts.encode=function(t,e){const i=e.nodes||[],n=e.buffers||[];Ir.startNodesVector(t,i.length);for(const e of i.slice().reverse())ns.encode(t,e);const r=t.endVector();Ir.startBuffersVector(t,n.length);for(const e of n.slice().reverse())is.encode(t,e);const s=t.endVector();return Ir.startRecordBatch(t),Ir.addLength(t,new Gr(e.length,0)),Ir.addNodes(t,r),Ir.addBuffers(t,s),Ir.endRecordBatch(t)},ts.decode=function(t,e=n.V4){if(null!==t.compression())throw new Error("Record batch compression not implemented");return new ts(t.length(),function(t){const e=[];for(let i,n=-1,r=-1,s=t.nodesLength();++n<s;)(i=t.nodes(n))&&(e[++r]=ns.decode(i));return e}(t),function(t,e){const i=[];for(let r,s=-1,o=-1,a=t.buffersLength();++s<a;)(r=t.buffers(s))&&(e<n.V4&&(r.bb_pos+=8*(s+1)),i[++o]=is.decode(r));return i}(t,e))},ts.fromJSON=$r,es.encode=function(t,e){const i=ts.encode(t,e.data);return Sr.startDictionaryBatch(t),Sr.addId(t,new Gr(e.id,0)),Sr.addIsDelta(t,e.isDelta),Sr.addData(t,i),Sr.endDictionaryBatch(t)},es.decode=function(t,e=n.V4){return new es(ts.decode(t.data(),e),t.id(),t.isDelta())},es.fromJSON=function(t){return new es($r(t.data),t.id,t.isDelta)},ns.encode=function(t,e){return wr.createFieldNode(t,new Gr(e.length,0),new Gr(e.nullCount,0))},ns.decode=function(t){return new ns(t.length(),t.nullCount())},is.encode=function(t,e){return _r.createBuffer(t,new Gr(e.offset,0),new Gr(e.length,0))},is.decode=function(t){return new is(t.offset(),t.length())};const cs=(()=>{const t=new ArrayBuffer(2);return new DataView(t).setInt16(0,256,!0),256===new Int16Array(t)[0]})(),ls=t=>`Expected ${l[t]} Message in stream, but was null or length 0.`,us=t=>`Header pointer of flatbuffer-encoded ${l[t]} Message is null or length 0.`,ds=(t,e)=>`Expected to read ${t} metadata bytes, but only read ${e}.`,hs=(t,e)=>`Expected to read ${t} bytes for message body, but only read ${e}.`;class ps{constructor(t){this.source=t instanceof Zn?t:new Zn(t)}[Symbol.iterator](){return this}next(){let t;return(t=this.readMetadataLength()).done||-1===t.value&&(t=this.readMetadataLength()).done||(t=this.readMetadata(t.value)).done?Hn:t}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}readMessage(t){let e;if((e=this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(ls(t));return e.value}readMessageBody(t){if(t<=0)return new Uint8Array(0);const e=K(this.source.read(t));if(e.byteLength<t)throw new Error(hs(t,e.byteLength));return e.byteOffset%8==0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()}readSchema(t=!1){const e=l.Schema,i=this.readMessage(e),n=null==i?void 0:i.header();if(t&&!n)throw new Error(us(e));return n}readMetadataLength(){const t=this.source.read(bs),e=t&&new Dn(t),i=(null==e?void 0:e.readInt32(0))||0;return{done:0===i,value:i}}readMetadata(t){const e=this.source.read(t);if(!e)return Hn;if(e.byteLength<t)throw new Error(ds(t,e.byteLength));return{done:!1,value:Xr.decode(e)}}}class fs{constructor(t,e){this.source=t instanceof Qn?t:O(t)?new ir(t,e):new Qn(t)}[Symbol.asyncIterator](){return this}next(){return L(this,void 0,void 0,function*(){let t;return(t=yield this.readMetadataLength()).done||-1===t.value&&(t=yield this.readMetadataLength()).done||(t=yield this.readMetadata(t.value)).done?Hn:t})}throw(t){return L(this,void 0,void 0,function*(){return yield this.source.throw(t)})}return(t){return L(this,void 0,void 0,function*(){return yield this.source.return(t)})}readMessage(t){return L(this,void 0,void 0,function*(){let e;if((e=yield this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(ls(t));return e.value})}readMessageBody(t){return L(this,void 0,void 0,function*(){if(t<=0)return new Uint8Array(0);const e=K(yield this.source.read(t));if(e.byteLength<t)throw new Error(hs(t,e.byteLength));return e.byteOffset%8==0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()})}readSchema(t=!1){return L(this,void 0,void 0,function*(){const e=l.Schema,i=yield this.readMessage(e),n=null==i?void 0:i.header();if(t&&!n)throw new Error(us(e));return n})}readMetadataLength(){return L(this,void 0,void 0,function*(){const t=yield this.source.read(bs),e=t&&new Dn(t),i=(null==e?void 0:e.readInt32(0))||0;return{done:0===i,value:i}})}readMetadata(t){return L(this,void 0,void 0,function*(){const e=yield this.source.read(t);if(!e)return Hn;if(e.byteLength<t)throw new Error(ds(t,e.byteLength));return{done:!1,value:Xr.decode(e)}})}}class ys extends ps{constructor(t){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=t instanceof Kn?t:new Kn(t)}next(){const{_json:t}=this;if(!this._schema)return this._schema=!0,{done:!1,value:Xr.fromJSON(t.schema,l.Schema)};if(this._dictionaryIndex<t.dictionaries.length){const e=t.dictionaries[this._dictionaryIndex++];return this._body=e.data.columns,{done:!1,value:Xr.fromJSON(e,l.DictionaryBatch)}}if(this._batchIndex<t.batches.length){const e=t.batches[this._batchIndex++];return this._body=e.columns,{done:!1,value:Xr.fromJSON(e,l.RecordBatch)}}return this._body=[],Hn}readMessageBody(t){return function t(e){return(e||[]).reduce((e,i)=>[...e,...i.VALIDITY&&[i.VALIDITY]||[],...i.TYPE&&[i.TYPE]||[],...i.OFFSET&&[i.OFFSET]||[],...i.DATA&&[i.DATA]||[],...t(i.children)],[])}(this._body)}readMessage(t){let e;if((e=this.next()).done)return null;if(null!=t&&e.value.headerType!==t)throw new Error(ls(t));return e.value}readSchema(){const t=l.Schema,e=this.readMessage(t),i=null==e?void 0:e.header();if(!e||!i)throw new Error(us(t));return i}}const bs=4,ms=new Uint8Array(6);for(let t=0;t<6;t+=1)ms[t]="ARROW1".codePointAt(t);function gs(t,e=0){for(let i=-1,n=ms.length;++i<n;)if(ms[i]!==t[e+i])return!1;return!0}const vs=ms.length,_s=vs+bs,ws=2*vs+bs;class Is extends Jn{constructor(t){super(),this._impl=t}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(t){return this._impl.throw(t)}return(t){return this._impl.return(t)}cancel(){return this._impl.cancel()}reset(t){return this._impl.reset(t),this._DOMStream=void 0,this._nodeStream=void 0,this}open(t){const e=this._impl.open(t);return I(e)?e.then(()=>this):this}readRecordBatch(t){return this._impl.isFile()?this._impl.readRecordBatch(t):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return kn.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return kn.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}static from(t){return t instanceof Is?t:B(t)?function(t){return new Ss(new Ns(t))}(t):O(t)?function(t){return L(this,void 0,void 0,function*(){const{size:e}=yield t.stat(),i=new ir(t,e);return e>=ws&&gs(yield i.readAt(0,vs+7&-8))?new As(new xs(i)):new Ts(new Ms(i))})}(t):I(t)?(()=>L(this,void 0,void 0,function*(){return yield Is.from(yield t)}))():D(t)||F(t)||x(t)||T(t)?function(t){return L(this,void 0,void 0,function*(){const e=yield t.peek(vs+7&-8);return e&&e.byteLength>=4?gs(e)?new Bs(new Fs(yield t.read())):new Ts(new Ms(t)):new Ts(new Ms(function(){return C(this,arguments,function*(){})}()))})}(new Qn(t)):function(t){const e=t.peek(vs+7&-8);return e&&e.byteLength>=4?gs(e)?new Bs(new Fs(t.read())):new Ss(new Ds(t)):new Ss(new Ds(function*(){}()))}(new Zn(t))}static readAll(t){return t instanceof Is?t.isSync()?Us(t):Cs(t):B(t)||ArrayBuffer.isView(t)||S(t)||A(t)?Us(t):Cs(t)}}class Ss extends Is{constructor(t){super(t),this._impl=t}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return C(this,arguments,function*(){yield U(yield*E(R(this[Symbol.iterator]())))})}}class Ts extends Is{constructor(t){super(t),this._impl=t}readAll(){var t,e;return L(this,void 0,void 0,function*(){const i=new Array;try{for(var n,r=R(this);!(n=yield r.next()).done;){const t=n.value;i.push(t)}}catch(e){t={error:e}}finally{try{n&&!n.done&&(e=r.return)&&(yield e.call(r))}finally{if(t)throw t.error}}return i})}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class Bs extends Ss{constructor(t){super(t),this._impl=t}}class As extends Ts{constructor(t){super(t),this._impl=t}}class Os{constructor(t=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=t}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(t){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=t,this.dictionaries=new Map,this}_loadRecordBatch(t,e){const i=this._loadVectors(t,e,this.schema.fields),n=Yi({type:new zt(this.schema.fields),length:t.length,children:i});return new un(this.schema,n)}_loadDictionaryBatch(t,e){const{id:i,isDelta:n}=t,{dictionaries:r,schema:s}=this,o=r.get(i);if(n||!o){const r=s.dictionaries.get(i),a=this._loadVectors(t.data,e,[r]);return(o&&n?o.concat(new ji(a)):new ji(a)).memoize()}return o.memoize()}_loadVectors(t,e,i){return new lr(e,t.nodes,t.buffers,this.dictionaries).visitMany(i)}}class Ds extends Os{constructor(t,e){super(e),this._reader=B(t)?new ys(this._handle=t):new ps(this._handle=t)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(t){return this.closed||(this.autoDestroy=Ls(this,t),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(t):Hn}return(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(t):Hn}next(){if(this.closed)return Hn;let t;const{_reader:e}=this;for(;t=this._readNextMessageAndValidate();)if(t.isSchema())this.reset(t.header());else{if(t.isRecordBatch()){this._recordBatchIndex++;const i=t.header(),n=e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(i,n)}}if(t.isDictionaryBatch()){this._dictionaryIndex++;const i=t.header(),n=e.readMessageBody(t.bodyLength),r=this._loadDictionaryBatch(i,n);this.dictionaries.set(i.id,r)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new pn(this.schema)}):this.return()}_readNextMessageAndValidate(t){return this._reader.readMessage(t)}}class Ms extends Os{constructor(t,e){super(e),this._reader=new fs(this._handle=t)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return L(this,void 0,void 0,function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)})}open(t){return L(this,void 0,void 0,function*(){return this.closed||(this.autoDestroy=Ls(this,t),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this})}throw(t){return L(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(t):Hn})}return(t){return L(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(t):Hn})}next(){return L(this,void 0,void 0,function*(){if(this.closed)return Hn;let t;const{_reader:e}=this;for(;t=yield this._readNextMessageAndValidate();)if(t.isSchema())yield this.reset(t.header());else{if(t.isRecordBatch()){this._recordBatchIndex++;const i=t.header(),n=yield e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(i,n)}}if(t.isDictionaryBatch()){this._dictionaryIndex++;const i=t.header(),n=yield e.readMessageBody(t.bodyLength),r=this._loadDictionaryBatch(i,n);this.dictionaries.set(i.id,r)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new pn(this.schema)}):yield this.return()})}_readNextMessageAndValidate(t){return L(this,void 0,void 0,function*(){return yield this._reader.readMessage(t)})}}class Fs extends Ds{constructor(t,e){super(t instanceof er?t:new er(t),e)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(t){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(const t of this._footer.dictionaryBatches())t&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(t)}readRecordBatch(t){var e;if(this.closed)return null;this._footer||this.open();const i=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(t);if(i&&this._handle.seek(i.offset)){const t=this._reader.readMessage(l.RecordBatch);if(null==t?void 0:t.isRecordBatch()){const e=t.header(),i=this._reader.readMessageBody(t.bodyLength);return this._loadRecordBatch(e,i)}}return null}_readDictionaryBatch(t){var e;const i=null===(e=this._footer)||void 0===e?void 0:e.getDictionaryBatch(t);if(i&&this._handle.seek(i.offset)){const t=this._reader.readMessage(l.DictionaryBatch);if(null==t?void 0:t.isDictionaryBatch()){const e=t.header(),i=this._reader.readMessageBody(t.bodyLength),n=this._loadDictionaryBatch(e,i);this.dictionaries.set(e.id,n)}}}_readFooter(){const{_handle:t}=this,e=t.size-_s,i=t.readInt32(e),n=t.readAt(e-i,i);return Vn.decode(n)}_readNextMessageAndValidate(t){var e;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){const i=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(this._recordBatchIndex);if(i&&this._handle.seek(i.offset))return this._reader.readMessage(t)}return null}}class xs extends Ms{constructor(t,...e){const i="number"!=typeof e[0]?e.shift():void 0,n=e[0]instanceof Map?e.shift():void 0;super(t instanceof ir?t:new ir(t,i),n)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}open(t){const e=Object.create(null,{open:{get:()=>super.open}});return L(this,void 0,void 0,function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(const t of this._footer.dictionaryBatches())t&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield e.open.call(this,t)})}readRecordBatch(t){var e;return L(this,void 0,void 0,function*(){if(this.closed)return null;this._footer||(yield this.open());const i=null===(e=this._footer)||void 0===e?void 0:e.getRecordBatch(t);if(i&&(yield this._handle.seek(i.offset))){const t=yield this._reader.readMessage(l.RecordBatch);if(null==t?void 0:t.isRecordBatch()){const e=t.header(),i=yield this._reader.readMessageBody(t.bodyLength);return this._loadRecordBatch(e,i)}}return null})}_readDictionaryBatch(t){var e;return L(this,void 0,void 0,function*(){const i=null===(e=this._footer)||void 0===e?void 0:e.getDictionaryBatch(t);if(i&&(yield this._handle.seek(i.offset))){const t=yield this._reader.readMessage(l.DictionaryBatch);if(null==t?void 0:t.isDictionaryBatch()){const e=t.header(),i=yield this._reader.readMessageBody(t.bodyLength),n=this._loadDictionaryBatch(e,i);this.dictionaries.set(e.id,n)}}})}_readFooter(){return L(this,void 0,void 0,function*(){const{_handle:t}=this;t._pending&&(yield t._pending);const e=t.size-_s,i=yield t.readInt32(e),n=yield t.readAt(e-i,i);return Vn.decode(n)})}_readNextMessageAndValidate(t){return L(this,void 0,void 0,function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){const e=this._footer.getRecordBatch(this._recordBatchIndex);if(e&&(yield this._handle.seek(e.offset)))return yield this._reader.readMessage(t)}return null})}}class Ns extends Ds{constructor(t,e){super(t,e)}_loadVectors(t,e,i){return new ur(e,t.nodes,t.buffers,this.dictionaries).visitMany(i)}}function Ls(t,e){return e&&"boolean"==typeof e.autoDestroy?e.autoDestroy:t.autoDestroy}function*Us(t){const e=Is.from(t);try{if(!e.open({autoDestroy:!1}).closed)do{yield e}while(!e.reset().open().closed)}finally{e.cancel()}}function Cs(t){return C(this,arguments,function*(){const e=yield U(Is.from(t));try{if(!(yield U(e.open({autoDestroy:!1}))).closed)do{yield yield U(e)}while(!(yield U(e.reset().open())).closed)}finally{yield U(e.cancel())}})}class Es extends Gt{constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(...t){const e=t=>t.flatMap(t=>Array.isArray(t)?e(t):t instanceof un?t.data.children:t.data),i=new Es;return i.visitMany(e(t)),i}visit(t){if(t instanceof ji)return this.visitMany(t.data),this;const{type:e}=t;if(!Ot.isDictionary(e)){const{length:i,nullCount:n}=t;if(i>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");Ot.isNull(e)||Rs.call(this,n<=0?new Uint8Array(0):vi(t.offset,i,t.nullBitmap)),this.nodes.push(new ns(i,n))}return super.visit(t)}visitNull(t){return this}visitDictionary(t){return this.visit(t.clone(t.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function Rs(t){const e=t.byteLength+7&-8;return this.buffers.push(t),this.bufferRegions.push(new is(this._byteLength,e)),this._byteLength+=e,this}function Ps(t){return Rs.call(this,t.values.subarray(0,t.length*t.stride))}function Vs(t){const{length:e,values:i,valueOffsets:n}=t,r=n[0],s=n[e],o=Math.min(s-r,i.byteLength-r);return Rs.call(this,G(-n[0],e,n)),Rs.call(this,i.subarray(r,r+o)),this}function js(t){const{length:e,valueOffsets:i}=t;return i&&Rs.call(this,G(i[0],e,i)),this.visit(t.children[0])}function zs(t){return this.visitMany(t.type.children.map((e,i)=>t.children[i]).filter(Boolean))[0]}Es.prototype.visitBool=function(t){let e;return t.nullCount>=t.length?Rs.call(this,new Uint8Array(0)):(e=t.values)instanceof Uint8Array?Rs.call(this,vi(t.offset,t.length,e)):Rs.call(this,_i(t.values))},Es.prototype.visitInt=Ps,Es.prototype.visitFloat=Ps,Es.prototype.visitUtf8=Vs,Es.prototype.visitBinary=Vs,Es.prototype.visitFixedSizeBinary=Ps,Es.prototype.visitDate=Ps,Es.prototype.visitTimestamp=Ps,Es.prototype.visitTime=Ps,Es.prototype.visitDecimal=Ps,Es.prototype.visitList=js,Es.prototype.visitStruct=zs,Es.prototype.visitUnion=function(t){const{type:e,length:i,typeIds:n,valueOffsets:s}=t;if(Rs.call(this,n),e.mode===r.Sparse)return zs.call(this,t);if(e.mode===r.Dense){if(t.offset<=0)return Rs.call(this,s),zs.call(this,t);{const r=n.reduce((t,e)=>Math.max(t,e),n[0]),o=new Int32Array(r+1),a=new Int32Array(r+1).fill(-1),c=new Int32Array(i),l=G(-s[0],i,s);for(let t,e,r=-1;++r<i;)-1===(e=a[t=n[r]])&&(e=a[t]=l[t]),c[r]=l[r]-e,++o[t];Rs.call(this,c);for(let n,r=-1,s=e.children.length;++r<s;)if(n=t.children[r]){const t=e.typeIds[r],s=Math.min(i,o[t]);this.visit(n.slice(a[t],s))}}}return this},Es.prototype.visitInterval=Ps,Es.prototype.visitFixedSizeList=js,Es.prototype.visitMap=js;class ks extends Jn{constructor(t){super(),this._position=0,this._started=!1,this._sink=new Gn,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,w(t)||(t={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy="boolean"!=typeof t.autoDestroy||t.autoDestroy,this._writeLegacyIpcFormat="boolean"==typeof t.writeLegacyIpcFormat&&t.writeLegacyIpcFormat}static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}toString(t=!1){return this._sink.toString(t)}toUint8Array(t=!1){return this._sink.toUint8Array(t)}writeAll(t){return I(t)?t.then(t=>this.writeAll(t)):T(t)?Hs(this,t):Ws(this,t)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(t){return this._sink.toDOMStream(t)}toNodeStream(t){return this._sink.toNodeStream(t)}close(){return this.reset()._sink.close()}abort(t){return this.reset()._sink.abort(t)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(t=this._sink,e=null){var i;return t===this._sink||t instanceof Gn?this._sink=t:(this._sink=new Gn,t&&w(i=t)&&_(i.abort)&&_(i.getWriter)&&!M(i)?this.toDOMStream({type:"bytes"}).pipeTo(t):t&&(t=>w(t)&&_(t.end)&&_(t.write)&&v(t.writable)&&!M(t))(t)&&this.toNodeStream({objectMode:!1}).pipe(t)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,e&&an(e,this._schema)||(null==e?(this._position=0,this._schema=null):(this._started=!0,this._schema=e,this._writeSchema(e))),this}write(t){let e=null;if(!this._sink)throw new Error("RecordBatchWriter is closed");if(null==t)return this.finish()&&void 0;if(t instanceof bn&&!(e=t.schema))return this.finish()&&void 0;if(t instanceof un&&!(e=t.schema))return this.finish()&&void 0;if(e&&!an(e,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,e)}t instanceof un?t instanceof pn||this._writeRecordBatch(t):t instanceof bn?this.writeAll(t.batches):S(t)&&this.writeAll(t)}_writeMessage(t,e=8){const i=e-1,n=Xr.encode(t),r=n.byteLength,s=this._writeLegacyIpcFormat?4:8,o=r+s+i&~i,a=o-r-s;return t.headerType===l.RecordBatch?this._recordBatchBlocks.push(new zn(o,t.bodyLength,this._position)):t.headerType===l.DictionaryBatch&&this._dictionaryBlocks.push(new zn(o,t.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(o-s)),r>0&&this._write(n),this._writePadding(a)}_write(t){if(this._started){const e=K(t);e&&e.byteLength>0&&(this._sink.write(e),this._position+=e.byteLength)}return this}_writeSchema(t){return this._writeMessage(Xr.from(t))}_writeFooter(t){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(ms)}_writePadding(t){return t>0?this._write(new Uint8Array(t)):this}_writeRecordBatch(t){const{byteLength:e,nodes:i,bufferRegions:n,buffers:r}=Es.assemble(t),s=new ts(t.numRows,i,n),o=Xr.from(s,e);return this._writeDictionaries(t)._writeMessage(o)._writeBodyBuffers(r)}_writeDictionaryBatch(t,e,i=!1){this._dictionaryDeltaOffsets.set(e,t.length+(this._dictionaryDeltaOffsets.get(e)||0));const{byteLength:n,nodes:r,bufferRegions:s,buffers:o}=Es.assemble(new ji([t])),a=new ts(t.length,r,s),c=new es(a,e,i),l=Xr.from(c,n);return this._writeMessage(l)._writeBodyBuffers(o)}_writeBodyBuffers(t){let e,i,n;for(let r=-1,s=t.length;++r<s;)(e=t[r])&&(i=e.byteLength)>0&&(this._write(e),(n=(i+7&-8)-i)>0&&this._writePadding(n));return this}_writeDictionaries(t){for(let[e,i]of t.dictionaries){let t=this._dictionaryDeltaOffsets.get(e)||0;if(0===t||(i=null==i?void 0:i.slice(t)).length>0)for(const n of i.data)this._writeDictionaryBatch(n,e,t>0),t+=n.length}return this}}class $s extends ks{static writeAll(t,e){const i=new $s(e);return I(t)?t.then(t=>i.writeAll(t)):T(t)?Hs(i,t):Ws(i,t)}}class Ys extends ks{static writeAll(t){const e=new Ys;return I(t)?t.then(t=>e.writeAll(t)):T(t)?Hs(e,t):Ws(e,t)}constructor(){super(),this._autoDestroy=!0}_writeSchema(t){return this._writeMagic()._writePadding(2)}_writeFooter(t){const e=Vn.encode(new Vn(t,n.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(t)._write(e)._write(Int32Array.of(e.byteLength))._writeMagic()}}function Ws(t,e){let i=e;e instanceof bn&&(i=e.batches,t.reset(void 0,e.schema));for(const e of i)t.write(e);return t.finish()}function Hs(t,e){var i,n,r,s;return L(this,void 0,void 0,function*(){try{for(i=R(e);!(n=yield i.next()).done;){const e=n.value;t.write(e)}}catch(t){r={error:t}}finally{try{n&&!n.done&&(s=i.return)&&(yield s.call(i))}finally{if(r)throw r.error}}return t.finish()})}function Ks(t){const e=Is.from(t);return I(e)?e.then(t=>Ks(t)):e.isAsync()?e.readAll().then(t=>new bn(t)):new bn(e.readAll())}function Js(t,e="stream"){return("stream"===e?$s:Ys).writeAll(t).toUint8Array(!0)}var qs,Gs=function(){function t(t,e,i,n){var r=this;this.getCell=function(t,e){var i=t<r.headerRows&&e<r.headerColumns,n=t>=r.headerRows&&e<r.headerColumns,s=t<r.headerRows&&e>=r.headerColumns;if(i){var o=["blank"];return e>0&&o.push("level"+t),{type:"blank",classNames:o.join(" "),content:""}}if(s)return{type:"columns",classNames:(o=["col_heading","level"+t,"col"+(c=e-r.headerColumns)]).join(" "),content:r.getContent(r.columnsTable,c,t)};if(n)return o=["row_heading","level"+e,"row"+(a=t-r.headerRows)],{type:"index",id:"T_".concat(r.uuid,"level").concat(e,"_row").concat(a),classNames:o.join(" "),content:r.getContent(r.indexTable,a,e)};o=["data","row"+(a=t-r.headerRows),"col"+(c=e-r.headerColumns)];var a,c,l=r.styler?r.getContent(r.styler.displayValuesTable,a,c):r.getContent(r.dataTable,a,c);return{type:"data",id:"T_".concat(r.uuid,"row").concat(a,"_col").concat(c),classNames:o.join(" "),content:l}},this.getContent=function(t,e,i){var n=t.getChildAt(i);return null===n?"":r.getColumnTypeId(t,i)===u.Timestamp?r.nanosToDate(n.get(e)):n.get(e)},this.dataTable=Ks(t),this.indexTable=Ks(e),this.columnsTable=Ks(i),this.styler=n?{caption:n.caption,displayValuesTable:Ks(n.displayValues),styles:n.styles,uuid:n.uuid}:void 0}return Object.defineProperty(t.prototype,"rows",{get:function(){return this.indexTable.numRows+this.columnsTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"dataRows",{get:function(){return this.dataTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"table",{get:function(){return this.dataTable},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"index",{get:function(){return this.indexTable},enumerable:!1,configurable:!0}),Object.defineProperty(t.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!1,configurable:!0}),t.prototype.serialize=function(){return{data:Js(this.dataTable),index:Js(this.indexTable),columns:Js(this.columnsTable)}},t.prototype.getColumnTypeId=function(t,e){return t.schema.fields[e].type.typeId},t.prototype.nanosToDate=function(t){return new Date(t/1e6)},t}(),Zs=function(){return Zs=Object.assign||function(t){for(var e,i=1,n=arguments.length;i<n;i++)for(var r in e=arguments[i])Object.prototype.hasOwnProperty.call(e,r)&&(t[r]=e[r]);return t},Zs.apply(this,arguments)};!function(t){t.COMPONENT_READY="streamlit:componentReady",t.SET_COMPONENT_VALUE="streamlit:setComponentValue",t.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(qs||(qs={}));var Qs,Xs=function(){function t(){}return t.API_VERSION=1,t.RENDER_EVENT="streamlit:render",t.events=new EventTarget,t.registeredMessageListener=!1,t.setComponentReady=function(){t.registeredMessageListener||(window.addEventListener("message",t.onMessageEvent),t.registeredMessageListener=!0),t.sendBackMsg(qs.COMPONENT_READY,{apiVersion:t.API_VERSION})},t.setFrameHeight=function(e){void 0===e&&(e=document.body.scrollHeight),e!==t.lastFrameHeight&&(t.lastFrameHeight=e,t.sendBackMsg(qs.SET_FRAME_HEIGHT,{height:e}))},t.setComponentValue=function(e){var i;e instanceof Gs?(i="dataframe",e=e.serialize()):function(t){var e=!1;try{e=t instanceof BigInt64Array||t instanceof BigUint64Array}catch(t){}return t instanceof Int8Array||t instanceof Uint8Array||t instanceof Uint8ClampedArray||t instanceof Int16Array||t instanceof Uint16Array||t instanceof Int32Array||t instanceof Uint32Array||t instanceof Float32Array||t instanceof Float64Array||e}(e)?(i="bytes",e=new Uint8Array(e.buffer)):e instanceof ArrayBuffer?(i="bytes",e=new Uint8Array(e)):i="json",t.sendBackMsg(qs.SET_COMPONENT_VALUE,{value:e,dataType:i})},t.onMessageEvent=function(e){e.data.type===t.RENDER_EVENT&&t.onRenderMessage(e.data)},t.onRenderMessage=function(e){var i=e.args;null==i&&(console.error("Got null args in onRenderMessage. This should never happen"),i={});var n=e.dfs&&e.dfs.length>0?t.argsDataframeToObject(e.dfs):{};i=Zs(Zs({},i),n);var r=Boolean(e.disabled),s=e.theme;s&&to(s);var o={disabled:r,args:i,theme:s},a=new CustomEvent(t.RENDER_EVENT,{detail:o});t.events.dispatchEvent(a)},t.argsDataframeToObject=function(e){var i=e.map(function(e){var i=e.key,n=e.value;return[i,t.toArrowTable(n)]});return Object.fromEntries(i)},t.toArrowTable=function(t){var e,i=(e=t.data).data,n=e.index,r=e.columns,s=e.styler;return new Gs(i,n,r,s)},t.sendBackMsg=function(t,e){window.parent.postMessage(Zs({isStreamlitMessage:!0,type:t},e),"*")},t}(),to=function(t){var e=document.createElement("style");document.head.appendChild(e),e.innerHTML="\n    :root {\n      --primary-color: ".concat(t.primaryColor,";\n      --background-color: ").concat(t.backgroundColor,";\n      --secondary-background-color: ").concat(t.secondaryBackgroundColor,";\n      --text-color: ").concat(t.textColor,";\n      --font: ").concat(t.font,";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  ")},eo=(Qs=function(t,e){return Qs=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(t,e){t.__proto__=e}||function(t,e){for(var i in e)Object.prototype.hasOwnProperty.call(e,i)&&(t[i]=e[i])},Qs(t,e)},function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Class extends value "+String(e)+" is not a constructor or null");function i(){this.constructor=t}Qs(t,e),t.prototype=null===e?Object.create(e):(i.prototype=e.prototype,new i)});!function(t){function e(){return null!==t&&t.apply(this,arguments)||this}eo(e,t),e.prototype.componentDidMount=function(){Xs.setFrameHeight()},e.prototype.componentDidUpdate=function(){Xs.setFrameHeight()}}(h.PureComponent),console.log("SwipeCounter build:","0.1.0",navigator.userAgent);const io=document.getElementById("app");if(!io)throw new Error("Swipe counter root not found");io.innerHTML='\n  <div class="counter-root">\n    <div class="counter-header">\n      <span class="counter-label" id="counter-label">小役回数</span>\n      <span class="counter-value" id="counter-value">0</span>\n    </div>\n    <p class="counter-estimate" id="counter-estimate" hidden></p>\n    <div class="counter-gesture" id="counter-gesture">\n      上にスワイプで +1 ／ 下にスワイプで -1\n    </div>\n    <div class="counter-controls">\n      <button type="button" data-delta="-1">-1</button>\n      <input type="number" id="counter-input" min="0" step="1" inputmode="numeric" />\n      <button type="button" data-delta="1">+1</button>\n      <button type="button" data-action="reset" class="reset-btn">リセット</button>\n    </div>\n    <p class="counter-caption" id="counter-caption"></p>\n  </div>\n';const no=document.getElementById("counter-value"),ro=document.getElementById("counter-gesture"),so=document.getElementById("counter-input"),oo=document.getElementById("counter-label"),ao=document.getElementById("counter-caption"),co=document.getElementById("counter-estimate"),lo=Array.from(document.querySelectorAll("[data-delta]")),uo=document.querySelector("[data-action=reset]");let ho="swipe_counter_storage",po=0,fo=null,yo=!1,bo=!1;const mo=(()=>{try{return window.crypto.randomUUID()}catch(t){return`${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`}})();let go=250,vo=0,_o=0,wo=[],Io=null;const So=new Map;let To=null,Bo=null,Ao=null,Oo=null,Do=null;const Mo=(t,e,i)=>{const n=Bo.widths[t],r=Math.min(Math.max(i-Bo.kLo[t],0),n-1);return Bo.bytes[Bo.offsets[t]+e*n+r]},Fo=()=>Xs.setFrameHeight(document.body.scrollHeight),xo=t=>Number.isFinite(t)?Math.max(0,Math.round(t)):0,No=t=>{const e=xo(t);no.textContent=e.toString(),so.value=e,(t=>{if(null===Oo)return void(co.hidden=!0);const e=Do&&Do.n===Oo&&Do.k===t,i=e?Do:((t,e)=>{if(!Bo||t<=0||e<0||e>t||t>Bo.rowSpins[Bo.rows-1])return null;let i=0,n=Bo.rows-1;for(;i<n;){const e=i+n>>1;Bo.rowSpins[e]<t?i=e+1:n=e}const r=i,s=Bo.rowSpins[r]===t?r:r-1,o=s===r?0:(t-Bo.rowSpins[s])/(Bo.rowSpins[r]-Bo.rowSpins[s]),a=t=>{const i=Mo(s,t,e);return(o>0?i*(1-o)+Mo(r,t,e)*o:i)/Bo.levels};return{456:a(0),56:a(1)}})(Oo,t);if(!i)return void(co.hidden=!0);const n=t=>`${(100*t).toFixed(e?1:0)}%`;co.innerHTML=`<span>456期待度 ${n(i[456])}</span><span>56期待度 ${n(i[56])}</span>`,co.classList.toggle("provisional",!e),co.title=e?"":"速報値（次の同期で確定）",co.hidden=!1})(e),Fo()},Lo=t=>{const e=performance.now();wo.forEach(t=>{So.has(t.seq)||So.set(t.seq,e)}),Xs.setComponentValue({protocol:1,client:mo,ops:wo,value:po,grid:Ao,rtt_ms:To,origin:t}),To=null},Uo=()=>(null!==Io&&(window.clearTimeout(Io),Io=null),0!==_o&&(vo+=1,wo=[...wo,{seq:vo,delta:_o}],_o=0,!0)),Co=(t="adjust")=>{Uo()&&Lo(t)},Eo=t=>{bo||(Uo(),vo+=1,wo=[...wo,{seq:vo,set:po}],Lo(t))},Ro=(t,e={})=>{const i={notify:!0,persist:!0,origin:"user",...e};po=xo(t),No(po),i.persist&&(t=>{const e={value:t,updatedAt:Date.now()};try{window.localStorage.setItem(ho,JSON.stringify(e))}catch(t){console.warn("swipe-counter: localStorage write failed",t)}})(po),i.notify&&Eo(i.origin)},Po=t=>{if(!t)return;const e=po;Ro(po+t,{notify:!1}),_o+=po-e,go<=0?Co():null===Io&&(Io=window.setTimeout(()=>{Io=null,Co()},go))};ro.addEventListener("pointerdown",t=>{fo=t.clientY,ro.setPointerCapture(t.pointerId),ro.classList.add("active")}),ro.addEventListener("pointerup",t=>{if(null===fo)return;const e=t.clientY-fo;e<=-28?Po(1):e>=28&&Po(-1),fo=null,ro.classList.remove("active");try{ro.releasePointerCapture(t.pointerId)}catch(t){}}),ro.addEventListener("pointercancel",()=>{fo=null,ro.classList.remove("active")}),ro.addEventListener("touchmove",t=>{null!==fo&&t.preventDefault()},{passive:!1}),lo.forEach(t=>{t.addEventListener("click",()=>{const e=Number(t.dataset.delta);Po(e)})}),uo&&uo.addEventListener("click",()=>{Ro(0,{origin:"reset"})}),so.addEventListener("change",()=>{const t=xo(Number(so.value));Ro(t,{origin:"input"})}),window.addEventListener("pagehide",()=>Co()),document.addEventListener("visibilitychange",()=>{"hidden"===document.visibilityState&&Co()}),Xs.events.addEventListener(Xs.RENDER_EVENT,t=>{const e=(t.detail||{}).args||{},i=xo(Number(e.value??po));ho="string"==typeof e.storage_key&&e.storage_key.trim()?e.storage_key.trim():ho;const n=Number(e.batch_ms);go=Number.isFinite(n)&&n>=0?n:250,(t=>{if(!t||t.client!==mo)return;const e=Number(t.seq);Number.isFinite(e)&&(wo=wo.filter(t=>t.seq>e),So.has(e)&&(To=Math.round(performance.now()-So.get(e))),So.forEach((t,i)=>{i<=e&&So.delete(i)}))})(e.ack),e.grid instanceof Uint8Array&&e.grid_id!==Ao?(Bo=(t=>{if(!(t instanceof Uint8Array)||t.byteLength<8)return null;const e=new DataView(t.buffer,t.byteOffset,t.byteLength);if("MTPG"!==String.fromCharCode(t[0],t[1],t[2],t[3])||1!==e.getUint8(4))return null;const i=e.getUint8(5),n=e.getUint16(6,!0),r=new Uint16Array(n),s=new Uint16Array(n),o=new Uint16Array(n),a=new Uint32Array(n);let c=8+6*n;for(let t=0;t<n;t+=1)r[t]=e.getUint16(8+6*t,!0),s[t]=e.getUint16(10+6*t,!0),o[t]=e.getUint16(12+6*t,!0),a[t]=c,c+=2*o[t];return{bytes:t,levels:i,rows:n,rowSpins:r,kLo:s,widths:o,offsets:a}})(e.grid),Ao=Bo?e.grid_id:null):"string"==typeof e.grid_id&&e.grid_id!==Ao?(Bo=null,Ao=null,Lo("grid")):"string"!=typeof e.grid_id&&(Bo=null,Ao=null),Oo="number"==typeof e.spins?e.spins:null,Do=e.estimate&&"object"==typeof e.estimate?e.estimate:null,oo.textContent=e.label||"小役回数",ao.textContent=e.description||"上スワイプで+1 / 下スワイプで-1。非対応の環境では入力欄をご利用ください。";const r=(()=>{if(yo)return!1;yo=!0;try{const t=window.localStorage.getItem(ho);if(!t)return!1;const e=JSON.parse(t);if(e&&"number"==typeof e.value)return po=xo(e.value),No(po),Eo("storage"),!0}catch(t){console.warn("swipe-counter: localStorage read failed",t)}return!1})();0!==_o||wo.length>0?No(po):r?i!==po&&(bo=!0,Ro(i,{notify:!1,origin:"python"}),bo=!1):i!==po?(bo=!0,Ro(i,{notify:!1,origin:"python"}),bo=!1):No(po),Fo()}),Xs.setComponentReady(),Fo()},540:(t,e,i)=>{t.exports=i(287)},799:(t,e)=>{var i="function"==typeof Symbol&&Symbol.for,n=i?Symbol.for("react.element"):60103,r=i?Symbol.for("react.portal"):60106,s=i?Symbol.for("react.fragment"):60107,o=i?Symbol.for("react.strict_mode"):60108,a=i?Symbol.for("react.profiler"):60114,c=i?Symbol.for("react.provider"):60109,l=i?Symbol.for("react.context"):60110,u=i?Symbol.for("react.async_mode"):60111,d=i?Symbol.for("react.concurrent_mode"):60111,h=i?Symbol.for("react.forward_ref"):60112,p=i?Symbol.for("react.suspense"):60113,f=i?Symbol.for("react.suspense_list"):60120,y=i?Symbol.for("react.memo"):60115,b=i?Symbol.for("react.lazy"):60116,m=i?Symbol.for("react.block"):60121,g=i?Symbol.for("react.fundamental"):60117,v=i?Symbol.for("react.responder"):60118,_=i?Symbol.for("react.scope"):60119;function w(t){if("object"==typeof t&&null!==t){var e=t.$$typeof;switch(e){case n:switch(t=t.type){case u:case d:case s:case a:case o:case p:return t;default:switch(t=t&&t.$$typeof){case l:case h:case b:case y:case c:return t;default:return e}}case r:return e}}}function I(t){return w(t)===d}e.AsyncMode=u,e.ConcurrentMode=d,e.ContextConsumer=l,e.ContextProvider=c,e.Element=n,e.ForwardRef=h,e.Fragment=s,e.Lazy=b,e.Memo=y,e.Portal=r,e.Profiler=a,e.StrictMode=o,e.Suspense=p,e.isAsyncMode=function(t){return I(t)||w(t)===u},e.isConcurrentMode=I,e.isContextConsumer=function(t){return w(t)===l},e.isContextProvider=function(t){return w(t)===c},e.isElement=function(t){return"object"==typeof t&&null!==t&&t.$$typeof===n},e.isForwardRef=function(t){return w(t)===h},e.isFragment=function(t){return w(t)===s},e.isLazy=function(t){return w(t)===b},e.isMemo=function(t){return w(t)===y},e.isPortal=function(t){return w(t)===r},e.isProfiler=function(t){return w(t)===a},e.isStrictMode=function(t){return w(t)===o},e.isSuspense=function(t){return w(t)===p},e.isValidElementType=function(t){return"string"==typeof t||"function"==typeof t||t===s||t===d||t===a||t===o||t===p||t===f||"object"==typeof t&&null!==t&&(t.$$typeof===b||t.$$typeof===y||t.$$typeof===c||t.$$typeof===l||t.$$typeof===h||t.$$typeof===g||t.$$typeof===v||t.$$typeof===_||t.$$typeof===m)},e.typeOf=w}},e={};function i(n){var r=e[n];if(void 0!==r)return r.exports;var s=e[n]={exports:{}};return t[n](s,s.exports,i),s.exports}i.r=t=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},i(395);
\ No newline at end of file
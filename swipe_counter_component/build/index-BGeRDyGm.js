@@ -1,52 +0,0 @@
-(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const r of document.querySelectorAll('link[rel="modulepreload"]'))i(r);new MutationObserver(r=>{for(const s of r)if(s.type==="childList")for(const o of s.addedNodes)o.tagName==="LINK"&&o.rel==="modulepreload"&&i(o)}).observe(document,{childList:!0,subtree:!0});function e(r){const s={};return r.integrity&&(s.integrity=r.integrity),r.referrerPolicy&&(s.referrerPolicy=r.referrerPolicy),r.crossOrigin==="use-credentials"?s.credentials="include":r.crossOrigin==="anonymous"?s.credentials="omit":s.credentials="same-origin",s}function i(r){if(r.ep)return;r.ep=!0;const s=e(r);fetch(r.href,s)}})();function la(n){return n&&n.__esModule&&Object.prototype.hasOwnProperty.call(n,"default")?n.default:n}var ns={exports:{}},R={};/** @license React v16.13.1
- * react-is.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var J=typeof Symbol=="function"&&Symbol.for,Yi=J?Symbol.for("react.element"):60103,Wi=J?Symbol.for("react.portal"):60106,ei=J?Symbol.for("react.fragment"):60107,ni=J?Symbol.for("react.strict_mode"):60108,ii=J?Symbol.for("react.profiler"):60114,ri=J?Symbol.for("react.provider"):60109,si=J?Symbol.for("react.context"):60110,Hi=J?Symbol.for("react.async_mode"):60111,oi=J?Symbol.for("react.concurrent_mode"):60111,ai=J?Symbol.for("react.forward_ref"):60112,ci=J?Symbol.for("react.suspense"):60113,ua=J?Symbol.for("react.suspense_list"):60120,li=J?Symbol.for("react.memo"):60115,ui=J?Symbol.for("react.lazy"):60116,da=J?Symbol.for("react.block"):60121,ha=J?Symbol.for("react.fundamental"):60117,fa=J?Symbol.for("react.responder"):60118,pa=J?Symbol.for("react.scope"):60119;function ut(n){if(typeof n=="object"&&n!==null){var t=n.$$typeof;switch(t){case Yi:switch(n=n.type,n){case Hi:case oi:case ei:case ii:case ni:case ci:return n;default:switch(n=n&&n.$$typeof,n){case si:case ai:case ui:case li:case ri:return n;default:return t}}case Wi:return t}}}function is(n){return ut(n)===oi}R.AsyncMode=Hi;R.ConcurrentMode=oi;R.ContextConsumer=si;R.ContextProvider=ri;R.Element=Yi;R.ForwardRef=ai;R.Fragment=ei;R.Lazy=ui;R.Memo=li;R.Portal=Wi;R.Profiler=ii;R.StrictMode=ni;R.Suspense=ci;R.isAsyncMode=function(n){return is(n)||ut(n)===Hi};R.isConcurrentMode=is;R.isContextConsumer=function(n){return ut(n)===si};R.isContextProvider=function(n){return ut(n)===ri};R.isElement=function(n){return typeof n=="object"&&n!==null&&n.$$typeof===Yi};R.isForwardRef=function(n){return ut(n)===ai};R.isFragment=function(n){return ut(n)===ei};R.isLazy=function(n){return ut(n)===ui};R.isMemo=function(n){return ut(n)===li};R.isPortal=function(n){return ut(n)===Wi};R.isProfiler=function(n){return ut(n)===ii};R.isStrictMode=function(n){return ut(n)===ni};R.isSuspense=function(n){return ut(n)===ci};R.isValidElementType=function(n){return typeof n=="string"||typeof n=="function"||n===ei||n===oi||n===ii||n===ni||n===ci||n===ua||typeof n=="object"&&n!==null&&(n.$$typeof===ui||n.$$typeof===li||n.$$typeof===ri||n.$$typeof===si||n.$$typeof===ai||n.$$typeof===ha||n.$$typeof===fa||n.$$typeof===pa||n.$$typeof===da)};R.typeOf=ut;ns.exports=R;var ya=ns.exports,rs=ya,ma={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},ba={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},ss={};ss[rs.ForwardRef]=ma;ss[rs.Memo]=ba;var os={exports:{}},x={};/*
-object-assign
-(c) Sindre Sorhus
-@license MIT
-*/var Mr=Object.getOwnPropertySymbols,ga=Object.prototype.hasOwnProperty,_a=Object.prototype.propertyIsEnumerable;function va(n){if(n==null)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(n)}function wa(){try{if(!Object.assign)return!1;var n=new String("abc");if(n[5]="de",Object.getOwnPropertyNames(n)[0]==="5")return!1;for(var t={},e=0;e<10;e++)t["_"+String.fromCharCode(e)]=e;var i=Object.getOwnPropertyNames(t).map(function(s){return t[s]});if(i.join("")!=="0123456789")return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach(function(s){r[s]=s}),Object.keys(Object.assign({},r)).join("")==="abcdefghijklmnopqrst"}catch{return!1}}var Sa=wa()?Object.assign:function(n,t){for(var e,i=va(n),r,s=1;s<arguments.length;s++){e=Object(arguments[s]);for(var o in e)ga.call(e,o)&&(i[o]=e[o]);if(Mr){r=Mr(e);for(var a=0;a<r.length;a++)_a.call(e,r[a])&&(i[r[a]]=e[r[a]])}}return i};/** @license React v16.14.0
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Ji=Sa,_t=typeof Symbol=="function"&&Symbol.for,rn=_t?Symbol.for("react.element"):60103,Ia=_t?Symbol.for("react.portal"):60106,Ba=_t?Symbol.for("react.fragment"):60107,Aa=_t?Symbol.for("react.strict_mode"):60108,Oa=_t?Symbol.for("react.profiler"):60114,Fa=_t?Symbol.for("react.provider"):60109,Da=_t?Symbol.for("react.context"):60110,Ta=_t?Symbol.for("react.forward_ref"):60112,Ma=_t?Symbol.for("react.suspense"):60113,Na=_t?Symbol.for("react.memo"):60115,La=_t?Symbol.for("react.lazy"):60116,Nr=typeof Symbol=="function"&&Symbol.iterator;function sn(n){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+n,e=1;e<arguments.length;e++)t+="&args[]="+encodeURIComponent(arguments[e]);return"Minified React error #"+n+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var as={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},cs={};function Pe(n,t,e){this.props=n,this.context=t,this.refs=cs,this.updater=e||as}Pe.prototype.isReactComponent={};Pe.prototype.setState=function(n,t){if(typeof n!="object"&&typeof n!="function"&&n!=null)throw Error(sn(85));this.updater.enqueueSetState(this,n,t,"setState")};Pe.prototype.forceUpdate=function(n){this.updater.enqueueForceUpdate(this,n,"forceUpdate")};function ls(){}ls.prototype=Pe.prototype;function Ki(n,t,e){this.props=n,this.context=t,this.refs=cs,this.updater=e||as}var Gi=Ki.prototype=new ls;Gi.constructor=Ki;Ji(Gi,Pe.prototype);Gi.isPureReactComponent=!0;var qi={current:null},us=Object.prototype.hasOwnProperty,ds={key:!0,ref:!0,__self:!0,__source:!0};function hs(n,t,e){var i,r={},s=null,o=null;if(t!=null)for(i in t.ref!==void 0&&(o=t.ref),t.key!==void 0&&(s=""+t.key),t)us.call(t,i)&&!ds.hasOwnProperty(i)&&(r[i]=t[i]);var a=arguments.length-2;if(a===1)r.children=e;else if(1<a){for(var c=Array(a),u=0;u<a;u++)c[u]=arguments[u+2];r.children=c}if(n&&n.defaultProps)for(i in a=n.defaultProps,a)r[i]===void 0&&(r[i]=a[i]);return{$$typeof:rn,type:n,key:s,ref:o,props:r,_owner:qi.current}}function Ea(n,t){return{$$typeof:rn,type:n.type,key:t,ref:n.ref,props:n.props,_owner:n._owner}}function Zi(n){return typeof n=="object"&&n!==null&&n.$$typeof===rn}function Ua(n){var t={"=":"=0",":":"=2"};return"$"+(""+n).replace(/[=:]/g,function(e){return t[e]})}var fs=/\/+/g,Bn=[];function ps(n,t,e,i){if(Bn.length){var r=Bn.pop();return r.result=n,r.keyPrefix=t,r.func=e,r.context=i,r.count=0,r}return{result:n,keyPrefix:t,func:e,context:i,count:0}}function ys(n){n.result=null,n.keyPrefix=null,n.func=null,n.context=null,n.count=0,10>Bn.length&&Bn.push(n)}function Bi(n,t,e,i){var r=typeof n;(r==="undefined"||r==="boolean")&&(n=null);var s=!1;if(n===null)s=!0;else switch(r){case"string":case"number":s=!0;break;case"object":switch(n.$$typeof){case rn:case Ia:s=!0}}if(s)return e(i,n,t===""?"."+mi(n,0):t),1;if(s=0,t=t===""?".":t+":",Array.isArray(n))for(var o=0;o<n.length;o++){r=n[o];var a=t+mi(r,o);s+=Bi(r,a,e,i)}else if(n===null||typeof n!="object"?a=null:(a=Nr&&n[Nr]||n["@@iterator"],a=typeof a=="function"?a:null),typeof a=="function")for(n=a.call(n),o=0;!(r=n.next()).done;)r=r.value,a=t+mi(r,o++),s+=Bi(r,a,e,i);else if(r==="object")throw e=""+n,Error(sn(31,e==="[object Object]"?"object with keys {"+Object.keys(n).join(", ")+"}":e,""));return s}function Ai(n,t,e){return n==null?0:Bi(n,"",t,e)}function mi(n,t){return typeof n=="object"&&n!==null&&n.key!=null?Ua(n.key):t.toString(36)}function Ra(n,t){n.func.call(n.context,t,n.count++)}function xa(n,t,e){var i=n.result,r=n.keyPrefix;n=n.func.call(n.context,t,n.count++),Array.isArray(n)?Oi(n,i,e,function(s){return s}):n!=null&&(Zi(n)&&(n=Ea(n,r+(!n.key||t&&t.key===n.key?"":(""+n.key).replace(fs,"$&/")+"/")+e)),i.push(n))}function Oi(n,t,e,i,r){var s="";e!=null&&(s=(""+e).replace(fs,"$&/")+"/"),t=ps(t,s,i,r),Ai(n,xa,t),ys(t)}var ms={current:null};function Wt(){var n=ms.current;if(n===null)throw Error(sn(321));return n}var Ca={ReactCurrentDispatcher:ms,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:qi,IsSomeRendererActing:{current:!1},assign:Ji};x.Children={map:function(n,t,e){if(n==null)return n;var i=[];return Oi(n,i,null,t,e),i},forEach:function(n,t,e){if(n==null)return n;t=ps(null,null,t,e),Ai(n,Ra,t),ys(t)},count:function(n){return Ai(n,function(){return null},null)},toArray:function(n){var t=[];return Oi(n,t,null,function(e){return e}),t},only:function(n){if(!Zi(n))throw Error(sn(143));return n}};x.Component=Pe;x.Fragment=Ba;x.Profiler=Oa;x.PureComponent=Ki;x.StrictMode=Aa;x.Suspense=Ma;x.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Ca;x.cloneElement=function(n,t,e){if(n==null)throw Error(sn(267,n));var i=Ji({},n.props),r=n.key,s=n.ref,o=n._owner;if(t!=null){if(t.ref!==void 0&&(s=t.ref,o=qi.current),t.key!==void 0&&(r=""+t.key),n.type&&n.type.defaultProps)var a=n.type.defaultProps;for(c in t)us.call(t,c)&&!ds.hasOwnProperty(c)&&(i[c]=t[c]===void 0&&a!==void 0?a[c]:t[c])}var c=arguments.length-2;if(c===1)i.children=e;else if(1<c){a=Array(c);for(var u=0;u<c;u++)a[u]=arguments[u+2];i.children=a}return{$$typeof:rn,type:n.type,key:r,ref:s,props:i,_owner:o}};x.createContext=function(n,t){return t===void 0&&(t=null),n={$$typeof:Da,_calculateChangedBits:t,_currentValue:n,_currentValue2:n,_threadCount:0,Provider:null,Consumer:null},n.Provider={$$typeof:Fa,_context:n},n.Consumer=n};x.createElement=hs;x.createFactory=function(n){var t=hs.bind(null,n);return t.type=n,t};x.createRef=function(){return{current:null}};x.forwardRef=function(n){return{$$typeof:Ta,render:n}};x.isValidElement=Zi;x.lazy=function(n){return{$$typeof:La,_ctor:n,_status:-1,_result:null}};x.memo=function(n,t){return{$$typeof:Na,type:n,compare:t===void 0?null:t}};x.useCallback=function(n,t){return Wt().useCallback(n,t)};x.useContext=function(n,t){return Wt().useContext(n,t)};x.useDebugValue=function(){};x.useEffect=function(n,t){return Wt().useEffect(n,t)};x.useImperativeHandle=function(n,t,e){return Wt().useImperativeHandle(n,t,e)};x.useLayoutEffect=function(n,t){return Wt().useLayoutEffect(n,t)};x.useMemo=function(n,t){return Wt().useMemo(n,t)};x.useReducer=function(n,t,e){return Wt().useReducer(n,t,e)};x.useRef=function(n){return Wt().useRef(n)};x.useState=function(n){return Wt().useState(n)};x.version="16.14.0";os.exports=x;var Va=os.exports;const Pa=la(Va);function p(n,t,e,i){function r(s){return s instanceof e?s:new e(function(o){o(s)})}return new(e||(e=Promise))(function(s,o){function a(d){try{u(i.next(d))}catch(h){o(h)}}function c(d){try{u(i.throw(d))}catch(h){o(h)}}function u(d){d.done?s(d.value):r(d.value).then(a,c)}u((i=i.apply(n,t||[])).next())})}function Lr(n){var t=typeof Symbol=="function"&&Symbol.iterator,e=t&&n[t],i=0;if(e)return e.call(n);if(n&&typeof n.length=="number")return{next:function(){return n&&i>=n.length&&(n=void 0),{value:n&&n[i++],done:!n}}};throw new TypeError(t?"Object is not iterable.":"Symbol.iterator is not defined.")}function B(n){return this instanceof B?(this.v=n,this):new B(n)}function Mt(n,t,e){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var i=e.apply(n,t||[]),r,s=[];return r=Object.create((typeof AsyncIterator=="function"?AsyncIterator:Object).prototype),a("next"),a("throw"),a("return",o),r[Symbol.asyncIterator]=function(){return this},r;function o(f){return function($){return Promise.resolve($).then(f,h)}}function a(f,$){i[f]&&(r[f]=function(_e){return new Promise(function(yi,Kt){s.push([f,_e,yi,Kt])>1||c(f,_e)})},$&&(r[f]=$(r[f])))}function c(f,$){try{u(i[f]($))}catch(_e){A(s[0][3],_e)}}function u(f){f.value instanceof B?Promise.resolve(f.value.v).then(d,h):A(s[0][2],f)}function d(f){c("next",f)}function h(f){c("throw",f)}function A(f,$){f($),s.shift(),s.length&&c(s[0][0],s[0][1])}}function bn(n){var t,e;return t={},i("next"),i("throw",function(r){throw r}),i("return"),t[Symbol.iterator]=function(){return this},t;function i(r,s){t[r]=n[r]?function(o){return(e=!e)?{value:B(n[r](o)),done:!1}:s?s(o):o}:s}}function pe(n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var t=n[Symbol.asyncIterator],e;return t?t.call(n):(n=typeof Lr=="function"?Lr(n):n[Symbol.iterator](),e={},i("next"),i("throw"),i("return"),e[Symbol.asyncIterator]=function(){return this},e);function i(s){e[s]=n[s]&&function(o){return new Promise(function(a,c){o=n[s](o),r(a,c,o.done,o.value)})}}function r(s,o,a,c){Promise.resolve(c).then(function(u){s({value:u,done:a})},o)}}const ka=new TextDecoder("utf-8"),Fi=n=>ka.decode(n),ja=new TextEncoder,Qi=n=>ja.encode(n),[Uu,za]=(()=>{const n=()=>{throw new Error("BigInt is not available in this environment")};function t(){throw n()}return t.asIntN=()=>{throw n()},t.asUintN=()=>{throw n()},typeof BigInt<"u"?[BigInt,!0]:[t,!1]})(),[on]=(()=>{const n=()=>{throw new Error("BigInt64Array is not available in this environment")};class t{static get BYTES_PER_ELEMENT(){return 8}static of(){throw n()}static from(){throw n()}constructor(){throw n()}}return typeof BigInt64Array<"u"?[BigInt64Array,!0]:[t,!1]})(),[an]=(()=>{const n=()=>{throw new Error("BigUint64Array is not available in this environment")};class t{static get BYTES_PER_ELEMENT(){return 8}static of(){throw n()}static from(){throw n()}constructor(){throw n()}}return typeof BigUint64Array<"u"?[BigUint64Array,!0]:[t,!1]})(),$a=n=>typeof n=="number",bs=n=>typeof n=="boolean",W=n=>typeof n=="function",nt=n=>n!=null&&Object(n)===n,Qt=n=>nt(n)&&W(n.then),cn=n=>nt(n)&&W(n[Symbol.iterator]),ke=n=>nt(n)&&W(n[Symbol.asyncIterator]),Di=n=>nt(n)&&nt(n.schema),gs=n=>nt(n)&&"done"in n&&"value"in n,_s=n=>nt(n)&&W(n.stat)&&$a(n.fd),vs=n=>nt(n)&&Xi(n.body),di=n=>"_getDOMStream"in n&&"_getNodeStream"in n,Ya=n=>nt(n)&&W(n.abort)&&W(n.getWriter)&&!di(n),Xi=n=>nt(n)&&W(n.cancel)&&W(n.getReader)&&!di(n),Wa=n=>nt(n)&&W(n.end)&&W(n.write)&&bs(n.writable)&&!di(n),ws=n=>nt(n)&&W(n.read)&&W(n.pipe)&&bs(n.readable)&&!di(n),Ha=n=>nt(n)&&W(n.clear)&&W(n.bytes)&&W(n.position)&&W(n.setPosition)&&W(n.capacity)&&W(n.getBufferIdentifier)&&W(n.createLong),tr=typeof SharedArrayBuffer<"u"?SharedArrayBuffer:ArrayBuffer;function Ja(n){const t=n[0]?[n[0]]:[];let e,i,r,s;for(let o,a,c=0,u=0,d=n.length;++c<d;){if(o=t[u],a=n[c],!o||!a||o.buffer!==a.buffer||a.byteOffset<o.byteOffset){a&&(t[++u]=a);continue}if({byteOffset:e,byteLength:r}=o,{byteOffset:i,byteLength:s}=a,e+r<i||i+s<e){a&&(t[++u]=a);continue}t[u]=new Uint8Array(o.buffer,e,i-e+s)}return t}function Er(n,t,e=0,i=t.byteLength){const r=n.byteLength,s=new Uint8Array(n.buffer,n.byteOffset,r),o=new Uint8Array(t.buffer,t.byteOffset,Math.min(i,r));return s.set(o,e),n}function Lt(n,t){const e=Ja(n),i=e.reduce((d,h)=>d+h.byteLength,0);let r,s,o,a=0,c=-1;const u=Math.min(t||Number.POSITIVE_INFINITY,i);for(const d=e.length;++c<d;){if(r=e[c],s=r.subarray(0,Math.min(r.length,u-a)),u<=a+s.length){s.length<r.length?e[c]=r.subarray(s.length):s.length===r.length&&c++,o?Er(o,s,a):o=s;break}Er(o||(o=new Uint8Array(u)),s,a),a+=s.length}return[o||new Uint8Array(0),e.slice(c),i-(o?o.byteLength:0)]}function C(n,t){let e=gs(t)?t.value:t;return e instanceof n?n===Uint8Array?new n(e.buffer,e.byteOffset,e.byteLength):e:e?(typeof e=="string"&&(e=Qi(e)),e instanceof ArrayBuffer?new n(e):e instanceof tr?new n(e):Ha(e)?C(n,e.bytes()):ArrayBuffer.isView(e)?e.byteLength<=0?new n(0):new n(e.buffer,e.byteOffset,e.byteLength/n.BYTES_PER_ELEMENT):n.from(e)):new n(0)}const ze=n=>C(Int32Array,n),T=n=>C(Uint8Array,n),Ti=n=>(n.next(),n);function*Ka(n,t){const e=function*(r){yield r},i=typeof t=="string"||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof tr?e(t):cn(t)?t:e(t);return yield*Ti(function*(r){let s=null;do s=r.next(yield C(n,s));while(!s.done)}(i[Symbol.iterator]())),new n}const Ga=n=>Ka(Uint8Array,n);function Ss(n,t){return Mt(this,arguments,function*(){if(Qt(t))return yield B(yield B(yield*bn(pe(Ss(n,yield B(t))))));const i=function(o){return Mt(this,arguments,function*(){yield yield B(yield B(o))})},r=function(o){return Mt(this,arguments,function*(){yield B(yield*bn(pe(Ti(function*(a){let c=null;do c=a.next(yield c==null?void 0:c.value);while(!c.done)}(o[Symbol.iterator]())))))})},s=typeof t=="string"||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof tr?i(t):cn(t)?r(t):ke(t)?t:i(t);return yield B(yield*bn(pe(Ti(function(o){return Mt(this,arguments,function*(){let a=null;do a=yield B(o.next(yield yield B(C(n,a))));while(!a.done)})}(s[Symbol.asyncIterator]()))))),yield B(new n)})}const qa=n=>Ss(Uint8Array,n);function er(n,t,e){if(n!==0){e=e.slice(0,t+1);for(let i=-1;++i<=t;)e[i]+=n}return e}function Za(n,t){let e=0;const i=n.length;if(i!==t.length)return!1;if(i>0)do if(n[e]!==t[e])return!1;while(++e<i);return!0}const ht={fromIterable(n){return pn(Qa(n))},fromAsyncIterable(n){return pn(Xa(n))},fromDOMStream(n){return pn(tc(n))},fromNodeStream(n){return pn(nc(n))},toDOMStream(n,t){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(n,t){throw new Error('"toNodeStream" not available in this environment')}},pn=n=>(n.next(),n);function*Qa(n){let t,e=!1,i=[],r,s,o,a=0;function c(){return s==="peek"?Lt(i,o)[0]:([r,i,a]=Lt(i,o),r)}({cmd:s,size:o}=yield null);const u=Ga(n)[Symbol.iterator]();try{do if({done:t,value:r}=Number.isNaN(o-a)?u.next():u.next(o-a),!t&&r.byteLength>0&&(i.push(r),a+=r.byteLength),t||o<=a)do({cmd:s,size:o}=yield c());while(o<a);while(!t)}catch(d){(e=!0)&&typeof u.throw=="function"&&u.throw(d)}finally{e===!1&&typeof u.return=="function"&&u.return(null)}return null}function Xa(n){return Mt(this,arguments,function*(){let e,i=!1,r=[],s,o,a,c=0;function u(){return o==="peek"?Lt(r,a)[0]:([s,r,c]=Lt(r,a),s)}({cmd:o,size:a}=yield yield B(null));const d=qa(n)[Symbol.asyncIterator]();try{do if({done:e,value:s}=Number.isNaN(a-c)?yield B(d.next()):yield B(d.next(a-c)),!e&&s.byteLength>0&&(r.push(s),c+=s.byteLength),e||a<=c)do({cmd:o,size:a}=yield yield B(u()));while(a<c);while(!e)}catch(h){(i=!0)&&typeof d.throw=="function"&&(yield B(d.throw(h)))}finally{i===!1&&typeof d.return=="function"&&(yield B(d.return(new Uint8Array(0))))}return yield B(null)})}function tc(n){return Mt(this,arguments,function*(){let e=!1,i=!1,r=[],s,o,a,c=0;function u(){return o==="peek"?Lt(r,a)[0]:([s,r,c]=Lt(r,a),s)}({cmd:o,size:a}=yield yield B(null));const d=new ec(n);try{do if({done:e,value:s}=Number.isNaN(a-c)?yield B(d.read()):yield B(d.read(a-c)),!e&&s.byteLength>0&&(r.push(T(s)),c+=s.byteLength),e||a<=c)do({cmd:o,size:a}=yield yield B(u()));while(a<c);while(!e)}catch(h){(i=!0)&&(yield B(d.cancel(h)))}finally{i===!1?yield B(d.cancel()):n.locked&&d.releaseLock()}return yield B(null)})}class ec{constructor(t){this.source=t,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch(()=>{})}get closed(){return this.reader?this.reader.closed.catch(()=>{}):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(t){return p(this,void 0,void 0,function*(){const{reader:e,source:i}=this;e&&(yield e.cancel(t).catch(()=>{})),i&&i.locked&&this.releaseLock()})}read(t){return p(this,void 0,void 0,function*(){if(t===0)return{done:this.reader==null,value:new Uint8Array(0)};const e=yield this.reader.read();return!e.done&&(e.value=T(e)),e})}}const bi=(n,t)=>{const e=r=>i([t,r]);let i;return[t,e,new Promise(r=>(i=r)&&n.once(t,e))]};function nc(n){return Mt(this,arguments,function*(){const e=[];let i="error",r=!1,s=null,o,a,c=0,u=[],d;function h(){return o==="peek"?Lt(u,a)[0]:([d,u,c]=Lt(u,a),d)}if({cmd:o,size:a}=yield yield B(null),n.isTTY)return yield yield B(new Uint8Array(0)),yield B(null);try{e[0]=bi(n,"end"),e[1]=bi(n,"error");do{if(e[2]=bi(n,"readable"),[i,s]=yield B(Promise.race(e.map(f=>f[2]))),i==="error")break;if((r=i==="end")||(Number.isFinite(a-c)?(d=T(n.read(a-c)),d.byteLength<a-c&&(d=T(n.read()))):d=T(n.read()),d.byteLength>0&&(u.push(d),c+=d.byteLength)),r||a<=c)do({cmd:o,size:a}=yield yield B(h()));while(a<c)}while(!r)}finally{yield B(A(e,i==="error"?s:null))}return yield B(null);function A(f,$){return d=u=null,new Promise((_e,yi)=>{for(const[Kt,ca]of f)n.off(Kt,ca);try{const Kt=n.destroy;Kt&&Kt.call(n,$),$=void 0}catch(Kt){$=Kt||$}finally{$!=null?yi($):_e()}})}})}var at;(function(n){n[n.V1=0]="V1",n[n.V2=1]="V2",n[n.V3=2]="V3",n[n.V4=3]="V4",n[n.V5=4]="V5"})(at||(at={}));var ct;(function(n){n[n.Sparse=0]="Sparse",n[n.Dense=1]="Dense"})(ct||(ct={}));var et;(function(n){n[n.HALF=0]="HALF",n[n.SINGLE=1]="SINGLE",n[n.DOUBLE=2]="DOUBLE"})(et||(et={}));var Yt;(function(n){n[n.DAY=0]="DAY",n[n.MILLISECOND=1]="MILLISECOND"})(Yt||(Yt={}));var M;(function(n){n[n.SECOND=0]="SECOND",n[n.MILLISECOND=1]="MILLISECOND",n[n.MICROSECOND=2]="MICROSECOND",n[n.NANOSECOND=3]="NANOSECOND"})(M||(M={}));var Xt;(function(n){n[n.YEAR_MONTH=0]="YEAR_MONTH",n[n.DAY_TIME=1]="DAY_TIME",n[n.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"})(Xt||(Xt={}));var N;(function(n){n[n.NONE=0]="NONE",n[n.Schema=1]="Schema",n[n.DictionaryBatch=2]="DictionaryBatch",n[n.RecordBatch=3]="RecordBatch",n[n.Tensor=4]="Tensor",n[n.SparseTensor=5]="SparseTensor"})(N||(N={}));var l;(function(n){n[n.NONE=0]="NONE",n[n.Null=1]="Null",n[n.Int=2]="Int",n[n.Float=3]="Float",n[n.Binary=4]="Binary",n[n.Utf8=5]="Utf8",n[n.Bool=6]="Bool",n[n.Decimal=7]="Decimal",n[n.Date=8]="Date",n[n.Time=9]="Time",n[n.Timestamp=10]="Timestamp",n[n.Interval=11]="Interval",n[n.List=12]="List",n[n.Struct=13]="Struct",n[n.Union=14]="Union",n[n.FixedSizeBinary=15]="FixedSizeBinary",n[n.FixedSizeList=16]="FixedSizeList",n[n.Map=17]="Map",n[n.Dictionary=-1]="Dictionary",n[n.Int8=-2]="Int8",n[n.Int16=-3]="Int16",n[n.Int32=-4]="Int32",n[n.Int64=-5]="Int64",n[n.Uint8=-6]="Uint8",n[n.Uint16=-7]="Uint16",n[n.Uint32=-8]="Uint32",n[n.Uint64=-9]="Uint64",n[n.Float16=-10]="Float16",n[n.Float32=-11]="Float32",n[n.Float64=-12]="Float64",n[n.DateDay=-13]="DateDay",n[n.DateMillisecond=-14]="DateMillisecond",n[n.TimestampSecond=-15]="TimestampSecond",n[n.TimestampMillisecond=-16]="TimestampMillisecond",n[n.TimestampMicrosecond=-17]="TimestampMicrosecond",n[n.TimestampNanosecond=-18]="TimestampNanosecond",n[n.TimeSecond=-19]="TimeSecond",n[n.TimeMillisecond=-20]="TimeMillisecond",n[n.TimeMicrosecond=-21]="TimeMicrosecond",n[n.TimeNanosecond=-22]="TimeNanosecond",n[n.DenseUnion=-23]="DenseUnion",n[n.SparseUnion=-24]="SparseUnion",n[n.IntervalDayTime=-25]="IntervalDayTime",n[n.IntervalYearMonth=-26]="IntervalYearMonth"})(l||(l={}));var xt;(function(n){n[n.OFFSET=0]="OFFSET",n[n.DATA=1]="DATA",n[n.VALIDITY=2]="VALIDITY",n[n.TYPE=3]="TYPE"})(xt||(xt={}));const ic=void 0;function Ge(n){if(n===null)return"null";if(n===ic)return"undefined";switch(typeof n){case"number":return`${n}`;case"bigint":return`${n}`;case"string":return`"${n}"`}return typeof n[Symbol.toPrimitive]=="function"?n[Symbol.toPrimitive]("string"):ArrayBuffer.isView(n)?n instanceof on||n instanceof an?`[${[...n].map(t=>Ge(t))}]`:`[${n}]`:ArrayBuffer.isView(n)?`[${n}]`:JSON.stringify(n,(t,e)=>typeof e=="bigint"?`${e}`:e)}const rc=Symbol.for("isArrowBigNum");function vt(n,...t){return t.length===0?Object.setPrototypeOf(C(this.TypedArray,n),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(n,...t),this.constructor.prototype)}vt.prototype[rc]=!0;vt.prototype.toJSON=function(){return`"${ye(this)}"`};vt.prototype.valueOf=function(){return Is(this)};vt.prototype.toString=function(){return ye(this)};vt.prototype[Symbol.toPrimitive]=function(n="default"){switch(n){case"number":return Is(this);case"string":return ye(this);case"default":return Mi(this)}return ye(this)};function Oe(...n){return vt.apply(this,n)}function Fe(...n){return vt.apply(this,n)}function qe(...n){return vt.apply(this,n)}Object.setPrototypeOf(Oe.prototype,Object.create(Int32Array.prototype));Object.setPrototypeOf(Fe.prototype,Object.create(Uint32Array.prototype));Object.setPrototypeOf(qe.prototype,Object.create(Uint32Array.prototype));Object.assign(Oe.prototype,vt.prototype,{constructor:Oe,signed:!0,TypedArray:Int32Array,BigIntArray:on});Object.assign(Fe.prototype,vt.prototype,{constructor:Fe,signed:!1,TypedArray:Uint32Array,BigIntArray:an});Object.assign(qe.prototype,vt.prototype,{constructor:qe,signed:!0,TypedArray:Uint32Array,BigIntArray:an});function Is(n){const{buffer:t,byteOffset:e,length:i,signed:r}=n,s=new an(t,e,i),o=r&&s[s.length-1]&BigInt(1)<<BigInt(63);let a=BigInt(o?1:0),c=BigInt(0);if(o){for(const u of s)a+=~u*(BigInt(1)<<BigInt(32)*c++);a*=BigInt(-1)}else for(const u of s)a+=u*(BigInt(1)<<BigInt(32)*c++);return a}let ye,Mi;za?(Mi=n=>n.byteLength===8?new n.BigIntArray(n.buffer,n.byteOffset,1)[0]:gi(n),ye=n=>n.byteLength===8?`${new n.BigIntArray(n.buffer,n.byteOffset,1)[0]}`:gi(n)):(ye=gi,Mi=ye);function gi(n){let t="";const e=new Uint32Array(2);let i=new Uint16Array(n.buffer,n.byteOffset,n.byteLength/2);const r=new Uint32Array((i=new Uint16Array(i).reverse()).buffer);let s=-1;const o=i.length-1;do{for(e[0]=i[s=0];s<o;)i[s++]=e[1]=e[0]/10,e[0]=(e[0]-e[1]*10<<16)+i[s];i[s]=e[1]=e[0]/10,e[0]=e[0]-e[1]*10,t=`${e[0]}${t}`}while(r[0]||r[1]||r[2]||r[3]);return t??"0"}class nr{static new(t,e){switch(e){case!0:return new Oe(t);case!1:return new Fe(t)}switch(t.constructor){case Int8Array:case Int16Array:case Int32Array:case on:return new Oe(t)}return t.byteLength===16?new qe(t):new Fe(t)}static signed(t){return new Oe(t)}static unsigned(t){return new Fe(t)}static decimal(t){return new qe(t)}constructor(t,e){return nr.new(t,e)}}var Bs,As,Os,Fs,Ds,Ts,Ms,Ns,Ls,Es,Us,Rs,xs,Cs,Vs,Ps,ks,js,zs;class y{static isNull(t){return(t==null?void 0:t.typeId)===l.Null}static isInt(t){return(t==null?void 0:t.typeId)===l.Int}static isFloat(t){return(t==null?void 0:t.typeId)===l.Float}static isBinary(t){return(t==null?void 0:t.typeId)===l.Binary}static isUtf8(t){return(t==null?void 0:t.typeId)===l.Utf8}static isBool(t){return(t==null?void 0:t.typeId)===l.Bool}static isDecimal(t){return(t==null?void 0:t.typeId)===l.Decimal}static isDate(t){return(t==null?void 0:t.typeId)===l.Date}static isTime(t){return(t==null?void 0:t.typeId)===l.Time}static isTimestamp(t){return(t==null?void 0:t.typeId)===l.Timestamp}static isInterval(t){return(t==null?void 0:t.typeId)===l.Interval}static isList(t){return(t==null?void 0:t.typeId)===l.List}static isStruct(t){return(t==null?void 0:t.typeId)===l.Struct}static isUnion(t){return(t==null?void 0:t.typeId)===l.Union}static isFixedSizeBinary(t){return(t==null?void 0:t.typeId)===l.FixedSizeBinary}static isFixedSizeList(t){return(t==null?void 0:t.typeId)===l.FixedSizeList}static isMap(t){return(t==null?void 0:t.typeId)===l.Map}static isDictionary(t){return(t==null?void 0:t.typeId)===l.Dictionary}static isDenseUnion(t){return y.isUnion(t)&&t.mode===ct.Dense}static isSparseUnion(t){return y.isUnion(t)&&t.mode===ct.Sparse}get typeId(){return l.NONE}}Bs=Symbol.toStringTag;y[Bs]=(n=>(n.children=null,n.ArrayType=Array,n[Symbol.toStringTag]="DataType"))(y.prototype);let te=class extends y{toString(){return"Null"}get typeId(){return l.Null}};As=Symbol.toStringTag;te[As]=(n=>n[Symbol.toStringTag]="Null")(te.prototype);class ee extends y{constructor(t,e){super(),this.isSigned=t,this.bitWidth=e}get typeId(){return l.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?on:an}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}Os=Symbol.toStringTag;ee[Os]=(n=>(n.isSigned=null,n.bitWidth=null,n[Symbol.toStringTag]="Int"))(ee.prototype);class Ze extends ee{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}Object.defineProperty(Ze.prototype,"ArrayType",{value:Int32Array});class Qe extends y{constructor(t){super(),this.precision=t}get typeId(){return l.Float}get ArrayType(){switch(this.precision){case et.HALF:return Uint16Array;case et.SINGLE:return Float32Array;case et.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}Fs=Symbol.toStringTag;Qe[Fs]=(n=>(n.precision=null,n[Symbol.toStringTag]="Float"))(Qe.prototype);let An=class extends y{constructor(){super()}get typeId(){return l.Binary}toString(){return"Binary"}};Ds=Symbol.toStringTag;An[Ds]=(n=>(n.ArrayType=Uint8Array,n[Symbol.toStringTag]="Binary"))(An.prototype);let On=class extends y{constructor(){super()}get typeId(){return l.Utf8}toString(){return"Utf8"}};Ts=Symbol.toStringTag;On[Ts]=(n=>(n.ArrayType=Uint8Array,n[Symbol.toStringTag]="Utf8"))(On.prototype);let Fn=class extends y{constructor(){super()}get typeId(){return l.Bool}toString(){return"Bool"}};Ms=Symbol.toStringTag;Fn[Ms]=(n=>(n.ArrayType=Uint8Array,n[Symbol.toStringTag]="Bool"))(Fn.prototype);let Dn=class extends y{constructor(t,e,i=128){super(),this.scale=t,this.precision=e,this.bitWidth=i}get typeId(){return l.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}};Ns=Symbol.toStringTag;Dn[Ns]=(n=>(n.scale=null,n.precision=null,n.ArrayType=Uint32Array,n[Symbol.toStringTag]="Decimal"))(Dn.prototype);class Tn extends y{constructor(t){super(),this.unit=t}get typeId(){return l.Date}toString(){return`Date${(this.unit+1)*32}<${Yt[this.unit]}>`}}Ls=Symbol.toStringTag;Tn[Ls]=(n=>(n.unit=null,n.ArrayType=Int32Array,n[Symbol.toStringTag]="Date"))(Tn.prototype);class Xe extends y{constructor(t,e){super(),this.unit=t,this.bitWidth=e}get typeId(){return l.Time}toString(){return`Time${this.bitWidth}<${M[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return on}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}Es=Symbol.toStringTag;Xe[Es]=(n=>(n.unit=null,n.bitWidth=null,n[Symbol.toStringTag]="Time"))(Xe.prototype);class Mn extends y{constructor(t,e){super(),this.unit=t,this.timezone=e}get typeId(){return l.Timestamp}toString(){return`Timestamp<${M[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}Us=Symbol.toStringTag;Mn[Us]=(n=>(n.unit=null,n.timezone=null,n.ArrayType=Int32Array,n[Symbol.toStringTag]="Timestamp"))(Mn.prototype);class Nn extends y{constructor(t){super(),this.unit=t}get typeId(){return l.Interval}toString(){return`Interval<${Xt[this.unit]}>`}}Rs=Symbol.toStringTag;Nn[Rs]=(n=>(n.unit=null,n.ArrayType=Int32Array,n[Symbol.toStringTag]="Interval"))(Nn.prototype);let Ln=class extends y{constructor(t){super(),this.children=[t]}get typeId(){return l.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}};xs=Symbol.toStringTag;Ln[xs]=(n=>(n.children=null,n[Symbol.toStringTag]="List"))(Ln.prototype);class G extends y{constructor(t){super(),this.children=t}get typeId(){return l.Struct}toString(){return`Struct<{${this.children.map(t=>`${t.name}:${t.type}`).join(", ")}}>`}}Cs=Symbol.toStringTag;G[Cs]=(n=>(n.children=null,n[Symbol.toStringTag]="Struct"))(G.prototype);class En extends y{constructor(t,e,i){super(),this.mode=t,this.children=i,this.typeIds=e=Int32Array.from(e),this.typeIdToChildIndex=e.reduce((r,s,o)=>(r[s]=o)&&r||r,Object.create(null))}get typeId(){return l.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map(t=>`${t.type}`).join(" | ")}>`}}Vs=Symbol.toStringTag;En[Vs]=(n=>(n.mode=null,n.typeIds=null,n.children=null,n.typeIdToChildIndex=null,n.ArrayType=Int8Array,n[Symbol.toStringTag]="Union"))(En.prototype);let Un=class extends y{constructor(t){super(),this.byteWidth=t}get typeId(){return l.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}};Ps=Symbol.toStringTag;Un[Ps]=(n=>(n.byteWidth=null,n.ArrayType=Uint8Array,n[Symbol.toStringTag]="FixedSizeBinary"))(Un.prototype);let Rn=class extends y{constructor(t,e){super(),this.listSize=t,this.children=[e]}get typeId(){return l.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}};ks=Symbol.toStringTag;Rn[ks]=(n=>(n.children=null,n.listSize=null,n[Symbol.toStringTag]="FixedSizeList"))(Rn.prototype);class xn extends y{constructor(t,e=!1){super(),this.children=[t],this.keysSorted=e}get typeId(){return l.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map(t=>`${t.name}:${t.type}`).join(", ")}}>`}}js=Symbol.toStringTag;xn[js]=(n=>(n.children=null,n.keysSorted=null,n[Symbol.toStringTag]="Map_"))(xn.prototype);const sc=(n=>()=>++n)(-1);class Le extends y{constructor(t,e,i,r){super(),this.indices=e,this.dictionary=t,this.isOrdered=r||!1,this.id=i==null?sc():typeof i=="number"?i:i.low}get typeId(){return l.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}zs=Symbol.toStringTag;Le[zs]=(n=>(n.id=null,n.indices=null,n.isOrdered=null,n.dictionary=null,n[Symbol.toStringTag]="Dictionary"))(Le.prototype);function Ct(n){const t=n;switch(n.typeId){case l.Decimal:return n.bitWidth/32;case l.Timestamp:return 2;case l.Date:return 1+t.unit;case l.Interval:return 1+t.unit;case l.FixedSizeList:return t.listSize;case l.FixedSizeBinary:return t.byteWidth;default:return 1}}class D{visitMany(t,...e){return t.map((i,r)=>this.visit(i,...e.map(s=>s[r])))}visit(...t){return this.getVisitFn(t[0],!1).apply(this,t)}getVisitFn(t,e=!0){return oc(this,t,e)}getVisitFnByTypeId(t,e=!0){return we(this,t,e)}visitNull(t,...e){return null}visitBool(t,...e){return null}visitInt(t,...e){return null}visitFloat(t,...e){return null}visitUtf8(t,...e){return null}visitBinary(t,...e){return null}visitFixedSizeBinary(t,...e){return null}visitDate(t,...e){return null}visitTimestamp(t,...e){return null}visitTime(t,...e){return null}visitDecimal(t,...e){return null}visitList(t,...e){return null}visitStruct(t,...e){return null}visitUnion(t,...e){return null}visitDictionary(t,...e){return null}visitInterval(t,...e){return null}visitFixedSizeList(t,...e){return null}visitMap(t,...e){return null}}function oc(n,t,e=!0){return typeof t=="number"?we(n,t,e):typeof t=="string"&&t in l?we(n,l[t],e):t&&t instanceof y?we(n,Ur(t),e):t!=null&&t.type&&t.type instanceof y?we(n,Ur(t.type),e):we(n,l.NONE,e)}function we(n,t,e=!0){let i=null;switch(t){case l.Null:i=n.visitNull;break;case l.Bool:i=n.visitBool;break;case l.Int:i=n.visitInt;break;case l.Int8:i=n.visitInt8||n.visitInt;break;case l.Int16:i=n.visitInt16||n.visitInt;break;case l.Int32:i=n.visitInt32||n.visitInt;break;case l.Int64:i=n.visitInt64||n.visitInt;break;case l.Uint8:i=n.visitUint8||n.visitInt;break;case l.Uint16:i=n.visitUint16||n.visitInt;break;case l.Uint32:i=n.visitUint32||n.visitInt;break;case l.Uint64:i=n.visitUint64||n.visitInt;break;case l.Float:i=n.visitFloat;break;case l.Float16:i=n.visitFloat16||n.visitFloat;break;case l.Float32:i=n.visitFloat32||n.visitFloat;break;case l.Float64:i=n.visitFloat64||n.visitFloat;break;case l.Utf8:i=n.visitUtf8;break;case l.Binary:i=n.visitBinary;break;case l.FixedSizeBinary:i=n.visitFixedSizeBinary;break;case l.Date:i=n.visitDate;break;case l.DateDay:i=n.visitDateDay||n.visitDate;break;case l.DateMillisecond:i=n.visitDateMillisecond||n.visitDate;break;case l.Timestamp:i=n.visitTimestamp;break;case l.TimestampSecond:i=n.visitTimestampSecond||n.visitTimestamp;break;case l.TimestampMillisecond:i=n.visitTimestampMillisecond||n.visitTimestamp;break;case l.TimestampMicrosecond:i=n.visitTimestampMicrosecond||n.visitTimestamp;break;case l.TimestampNanosecond:i=n.visitTimestampNanosecond||n.visitTimestamp;break;case l.Time:i=n.visitTime;break;case l.TimeSecond:i=n.visitTimeSecond||n.visitTime;break;case l.TimeMillisecond:i=n.visitTimeMillisecond||n.visitTime;break;case l.TimeMicrosecond:i=n.visitTimeMicrosecond||n.visitTime;break;case l.TimeNanosecond:i=n.visitTimeNanosecond||n.visitTime;break;case l.Decimal:i=n.visitDecimal;break;case l.List:i=n.visitList;break;case l.Struct:i=n.visitStruct;break;case l.Union:i=n.visitUnion;break;case l.DenseUnion:i=n.visitDenseUnion||n.visitUnion;break;case l.SparseUnion:i=n.visitSparseUnion||n.visitUnion;break;case l.Dictionary:i=n.visitDictionary;break;case l.Interval:i=n.visitInterval;break;case l.IntervalDayTime:i=n.visitIntervalDayTime||n.visitInterval;break;case l.IntervalYearMonth:i=n.visitIntervalYearMonth||n.visitInterval;break;case l.FixedSizeList:i=n.visitFixedSizeList;break;case l.Map:i=n.visitMap;break}if(typeof i=="function")return i;if(!e)return()=>null;throw new Error(`Unrecognized type '${l[t]}'`)}function Ur(n){switch(n.typeId){case l.Null:return l.Null;case l.Int:{const{bitWidth:t,isSigned:e}=n;switch(t){case 8:return e?l.Int8:l.Uint8;case 16:return e?l.Int16:l.Uint16;case 32:return e?l.Int32:l.Uint32;case 64:return e?l.Int64:l.Uint64}return l.Int}case l.Float:switch(n.precision){case et.HALF:return l.Float16;case et.SINGLE:return l.Float32;case et.DOUBLE:return l.Float64}return l.Float;case l.Binary:return l.Binary;case l.Utf8:return l.Utf8;case l.Bool:return l.Bool;case l.Decimal:return l.Decimal;case l.Time:switch(n.unit){case M.SECOND:return l.TimeSecond;case M.MILLISECOND:return l.TimeMillisecond;case M.MICROSECOND:return l.TimeMicrosecond;case M.NANOSECOND:return l.TimeNanosecond}return l.Time;case l.Timestamp:switch(n.unit){case M.SECOND:return l.TimestampSecond;case M.MILLISECOND:return l.TimestampMillisecond;case M.MICROSECOND:return l.TimestampMicrosecond;case M.NANOSECOND:return l.TimestampNanosecond}return l.Timestamp;case l.Date:switch(n.unit){case Yt.DAY:return l.DateDay;case Yt.MILLISECOND:return l.DateMillisecond}return l.Date;case l.Interval:switch(n.unit){case Xt.DAY_TIME:return l.IntervalDayTime;case Xt.YEAR_MONTH:return l.IntervalYearMonth}return l.Interval;case l.Map:return l.Map;case l.List:return l.List;case l.Struct:return l.Struct;case l.Union:switch(n.mode){case ct.Dense:return l.DenseUnion;case ct.Sparse:return l.SparseUnion}return l.Union;case l.FixedSizeBinary:return l.FixedSizeBinary;case l.FixedSizeList:return l.FixedSizeList;case l.Dictionary:return l.Dictionary}throw new Error(`Unrecognized type '${l[n.typeId]}'`)}D.prototype.visitInt8=null;D.prototype.visitInt16=null;D.prototype.visitInt32=null;D.prototype.visitInt64=null;D.prototype.visitUint8=null;D.prototype.visitUint16=null;D.prototype.visitUint32=null;D.prototype.visitUint64=null;D.prototype.visitFloat16=null;D.prototype.visitFloat32=null;D.prototype.visitFloat64=null;D.prototype.visitDateDay=null;D.prototype.visitDateMillisecond=null;D.prototype.visitTimestampSecond=null;D.prototype.visitTimestampMillisecond=null;D.prototype.visitTimestampMicrosecond=null;D.prototype.visitTimestampNanosecond=null;D.prototype.visitTimeSecond=null;D.prototype.visitTimeMillisecond=null;D.prototype.visitTimeMicrosecond=null;D.prototype.visitTimeNanosecond=null;D.prototype.visitDenseUnion=null;D.prototype.visitSparseUnion=null;D.prototype.visitIntervalDayTime=null;D.prototype.visitIntervalYearMonth=null;const $s=new Float64Array(1),ve=new Uint32Array($s.buffer);function Ys(n){const t=(n&31744)>>10,e=(n&1023)/1024,i=Math.pow(-1,(n&32768)>>15);switch(t){case 31:return i*(e?Number.NaN:1/0);case 0:return i*(e?6103515625e-14*e:0)}return i*Math.pow(2,t-15)*(1+e)}function ac(n){if(n!==n)return 32256;$s[0]=n;const t=(ve[1]&2147483648)>>16&65535;let e=ve[1]&2146435072,i=0;return e>=1089470464?ve[0]>0?e=31744:(e=(e&2080374784)>>16,i=(ve[1]&1048575)>>10):e<=1056964608?(i=1048576+(ve[1]&1048575),i=1048576+(i<<(e>>20)-998)>>21,e=0):(e=e-1056964608>>10,i=(ve[1]&1048575)+512>>10),t|e|i&65535}class v extends D{}function I(n){return(t,e,i)=>{if(t.setValid(e,i!=null))return n(t,e,i)}}const cc=(n,t,e)=>{n[t]=Math.trunc(e/864e5)},ir=(n,t,e)=>{n[t]=Math.trunc(e%4294967296),n[t+1]=Math.trunc(e/4294967296)},lc=(n,t,e)=>{n[t]=Math.trunc(e*1e3%4294967296),n[t+1]=Math.trunc(e*1e3/4294967296)},uc=(n,t,e)=>{n[t]=Math.trunc(e*1e6%4294967296),n[t+1]=Math.trunc(e*1e6/4294967296)},Ws=(n,t,e,i)=>{if(e+1<t.length){const{[e]:r,[e+1]:s}=t;n.set(i.subarray(0,s-r),r)}},dc=({offset:n,values:t},e,i)=>{const r=n+e;i?t[r>>3]|=1<<r%8:t[r>>3]&=~(1<<r%8)},Ht=({values:n},t,e)=>{n[t]=e},rr=({values:n},t,e)=>{n[t]=e},Hs=({values:n},t,e)=>{n[t]=ac(e)},hc=(n,t,e)=>{switch(n.type.precision){case et.HALF:return Hs(n,t,e);case et.SINGLE:case et.DOUBLE:return rr(n,t,e)}},Js=({values:n},t,e)=>{cc(n,t,e.valueOf())},Ks=({values:n},t,e)=>{ir(n,t*2,e.valueOf())},fc=({stride:n,values:t},e,i)=>{t.set(i.subarray(0,n),n*e)},pc=({values:n,valueOffsets:t},e,i)=>Ws(n,t,e,i),yc=({values:n,valueOffsets:t},e,i)=>{Ws(n,t,e,Qi(i))},mc=(n,t,e)=>{n.type.unit===Yt.DAY?Js(n,t,e):Ks(n,t,e)},Gs=({values:n},t,e)=>ir(n,t*2,e/1e3),qs=({values:n},t,e)=>ir(n,t*2,e),Zs=({values:n},t,e)=>lc(n,t*2,e),Qs=({values:n},t,e)=>uc(n,t*2,e),bc=(n,t,e)=>{switch(n.type.unit){case M.SECOND:return Gs(n,t,e);case M.MILLISECOND:return qs(n,t,e);case M.MICROSECOND:return Zs(n,t,e);case M.NANOSECOND:return Qs(n,t,e)}},Xs=({values:n},t,e)=>{n[t]=e},to=({values:n},t,e)=>{n[t]=e},eo=({values:n},t,e)=>{n[t]=e},no=({values:n},t,e)=>{n[t]=e},gc=(n,t,e)=>{switch(n.type.unit){case M.SECOND:return Xs(n,t,e);case M.MILLISECOND:return to(n,t,e);case M.MICROSECOND:return eo(n,t,e);case M.NANOSECOND:return no(n,t,e)}},_c=({values:n,stride:t},e,i)=>{n.set(i.subarray(0,t),t*e)},vc=(n,t,e)=>{const i=n.children[0],r=n.valueOffsets,s=yt.getVisitFn(i);if(Array.isArray(e))for(let o=-1,a=r[t],c=r[t+1];a<c;)s(i,a++,e[++o]);else for(let o=-1,a=r[t],c=r[t+1];a<c;)s(i,a++,e.get(++o))},wc=(n,t,e)=>{const i=n.children[0],{valueOffsets:r}=n,s=yt.getVisitFn(i);let{[t]:o,[t+1]:a}=r;const c=e instanceof Map?e.entries():Object.entries(e);for(const u of c)if(s(i,o,u),++o>=a)break},Sc=(n,t)=>(e,i,r,s)=>i&&e(i,n,t[s]),Ic=(n,t)=>(e,i,r,s)=>i&&e(i,n,t.get(s)),Bc=(n,t)=>(e,i,r,s)=>i&&e(i,n,t.get(r.name)),Ac=(n,t)=>(e,i,r,s)=>i&&e(i,n,t[r.name]),Oc=(n,t,e)=>{const i=n.type.children.map(s=>yt.getVisitFn(s.type)),r=e instanceof Map?Bc(t,e):e instanceof L?Ic(t,e):Array.isArray(e)?Sc(t,e):Ac(t,e);n.type.children.forEach((s,o)=>r(i[o],n.children[o],s,o))},Fc=(n,t,e)=>{n.type.mode===ct.Dense?io(n,t,e):ro(n,t,e)},io=(n,t,e)=>{const i=n.type.typeIdToChildIndex[n.typeIds[t]],r=n.children[i];yt.visit(r,n.valueOffsets[t],e)},ro=(n,t,e)=>{const i=n.type.typeIdToChildIndex[n.typeIds[t]],r=n.children[i];yt.visit(r,t,e)},Dc=(n,t,e)=>{var i;(i=n.dictionary)===null||i===void 0||i.set(n.values[t],e)},Tc=(n,t,e)=>{n.type.unit===Xt.DAY_TIME?so(n,t,e):oo(n,t,e)},so=({values:n},t,e)=>{n.set(e.subarray(0,2),2*t)},oo=({values:n},t,e)=>{n[t]=e[0]*12+e[1]%12},Mc=(n,t,e)=>{const{stride:i}=n,r=n.children[0],s=yt.getVisitFn(r);if(Array.isArray(e))for(let o=-1,a=t*i;++o<i;)s(r,a+o,e[o]);else for(let o=-1,a=t*i;++o<i;)s(r,a+o,e.get(o))};v.prototype.visitBool=I(dc);v.prototype.visitInt=I(Ht);v.prototype.visitInt8=I(Ht);v.prototype.visitInt16=I(Ht);v.prototype.visitInt32=I(Ht);v.prototype.visitInt64=I(Ht);v.prototype.visitUint8=I(Ht);v.prototype.visitUint16=I(Ht);v.prototype.visitUint32=I(Ht);v.prototype.visitUint64=I(Ht);v.prototype.visitFloat=I(hc);v.prototype.visitFloat16=I(Hs);v.prototype.visitFloat32=I(rr);v.prototype.visitFloat64=I(rr);v.prototype.visitUtf8=I(yc);v.prototype.visitBinary=I(pc);v.prototype.visitFixedSizeBinary=I(fc);v.prototype.visitDate=I(mc);v.prototype.visitDateDay=I(Js);v.prototype.visitDateMillisecond=I(Ks);v.prototype.visitTimestamp=I(bc);v.prototype.visitTimestampSecond=I(Gs);v.prototype.visitTimestampMillisecond=I(qs);v.prototype.visitTimestampMicrosecond=I(Zs);v.prototype.visitTimestampNanosecond=I(Qs);v.prototype.visitTime=I(gc);v.prototype.visitTimeSecond=I(Xs);v.prototype.visitTimeMillisecond=I(to);v.prototype.visitTimeMicrosecond=I(eo);v.prototype.visitTimeNanosecond=I(no);v.prototype.visitDecimal=I(_c);v.prototype.visitList=I(vc);v.prototype.visitStruct=I(Oc);v.prototype.visitUnion=I(Fc);v.prototype.visitDenseUnion=I(io);v.prototype.visitSparseUnion=I(ro);v.prototype.visitDictionary=I(Dc);v.prototype.visitInterval=I(Tc);v.prototype.visitIntervalDayTime=I(so);v.prototype.visitIntervalYearMonth=I(oo);v.prototype.visitFixedSizeList=I(Mc);v.prototype.visitMap=I(wc);const yt=new v,mt=Symbol.for("parent"),De=Symbol.for("rowIndex");class sr{constructor(t,e){return this[mt]=t,this[De]=e,new Proxy(this,new Lc)}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[De],e=this[mt],i=e.type.children,r={};for(let s=-1,o=i.length;++s<o;)r[i[s].name]=it.visit(e.children[s],t);return r}toString(){return`{${[...this].map(([t,e])=>`${Ge(t)}: ${Ge(e)}`).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Nc(this[mt],this[De])}}class Nc{constructor(t,e){this.childIndex=0,this.children=t.children,this.rowIndex=e,this.childFields=t.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const t=this.childIndex;return t<this.numChildren?(this.childIndex=t+1,{done:!1,value:[this.childFields[t].name,it.visit(this.children[t],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(sr.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[mt]:{writable:!0,enumerable:!1,configurable:!1,value:null},[De]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class Lc{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[mt].type.children.map(e=>e.name)}has(t,e){return t[mt].type.children.findIndex(i=>i.name===e)!==-1}getOwnPropertyDescriptor(t,e){if(t[mt].type.children.findIndex(i=>i.name===e)!==-1)return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const i=t[mt].type.children.findIndex(r=>r.name===e);if(i!==-1){const r=it.visit(t[mt].children[i],t[De]);return Reflect.set(t,e,r),r}}set(t,e,i){const r=t[mt].type.children.findIndex(s=>s.name===e);return r!==-1?(yt.visit(t[mt].children[r],t[De],i),Reflect.set(t,e,i)):Reflect.has(t,e)||typeof e=="symbol"?Reflect.set(t,e,i):!1}}class m extends D{}function w(n){return(t,e)=>t.getValid(e)?n(t,e):null}const Ec=(n,t)=>864e5*n[t],or=(n,t)=>4294967296*n[t+1]+(n[t]>>>0),Uc=(n,t)=>4294967296*(n[t+1]/1e3)+(n[t]>>>0)/1e3,Rc=(n,t)=>4294967296*(n[t+1]/1e6)+(n[t]>>>0)/1e6,ao=n=>new Date(n),xc=(n,t)=>ao(Ec(n,t)),Cc=(n,t)=>ao(or(n,t)),Vc=(n,t)=>null,co=(n,t,e)=>{if(e+1>=t.length)return null;const i=t[e],r=t[e+1];return n.subarray(i,r)},Pc=({offset:n,values:t},e)=>{const i=n+e;return(t[i>>3]&1<<i%8)!==0},lo=({values:n},t)=>xc(n,t),uo=({values:n},t)=>Cc(n,t*2),re=({stride:n,values:t},e)=>t[n*e],kc=({stride:n,values:t},e)=>Ys(t[n*e]),ho=({values:n},t)=>n[t],jc=({stride:n,values:t},e)=>t.subarray(n*e,n*(e+1)),zc=({values:n,valueOffsets:t},e)=>co(n,t,e),$c=({values:n,valueOffsets:t},e)=>{const i=co(n,t,e);return i!==null?Fi(i):null},Yc=({values:n},t)=>n[t],Wc=({type:n,values:t},e)=>n.precision!==et.HALF?t[e]:Ys(t[e]),Hc=(n,t)=>n.type.unit===Yt.DAY?lo(n,t):uo(n,t),fo=({values:n},t)=>1e3*or(n,t*2),po=({values:n},t)=>or(n,t*2),yo=({values:n},t)=>Uc(n,t*2),mo=({values:n},t)=>Rc(n,t*2),Jc=(n,t)=>{switch(n.type.unit){case M.SECOND:return fo(n,t);case M.MILLISECOND:return po(n,t);case M.MICROSECOND:return yo(n,t);case M.NANOSECOND:return mo(n,t)}},bo=({values:n},t)=>n[t],go=({values:n},t)=>n[t],_o=({values:n},t)=>n[t],vo=({values:n},t)=>n[t],Kc=(n,t)=>{switch(n.type.unit){case M.SECOND:return bo(n,t);case M.MILLISECOND:return go(n,t);case M.MICROSECOND:return _o(n,t);case M.NANOSECOND:return vo(n,t)}},Gc=({values:n,stride:t},e)=>nr.decimal(n.subarray(t*e,t*(e+1))),qc=(n,t)=>{const{valueOffsets:e,stride:i,children:r}=n,{[t*i]:s,[t*i+1]:o}=e,c=r[0].slice(s,o-s);return new L([c])},Zc=(n,t)=>{const{valueOffsets:e,children:i}=n,{[t]:r,[t+1]:s}=e,o=i[0];return new ar(o.slice(r,s-r))},Qc=(n,t)=>new sr(n,t),Xc=(n,t)=>n.type.mode===ct.Dense?wo(n,t):So(n,t),wo=(n,t)=>{const e=n.type.typeIdToChildIndex[n.typeIds[t]],i=n.children[e];return it.visit(i,n.valueOffsets[t])},So=(n,t)=>{const e=n.type.typeIdToChildIndex[n.typeIds[t]],i=n.children[e];return it.visit(i,t)},tl=(n,t)=>{var e;return(e=n.dictionary)===null||e===void 0?void 0:e.get(n.values[t])},el=(n,t)=>n.type.unit===Xt.DAY_TIME?Io(n,t):Bo(n,t),Io=({values:n},t)=>n.subarray(2*t,2*(t+1)),Bo=({values:n},t)=>{const e=n[t],i=new Int32Array(2);return i[0]=Math.trunc(e/12),i[1]=Math.trunc(e%12),i},nl=(n,t)=>{const{stride:e,children:i}=n,s=i[0].slice(t*e,e);return new L([s])};m.prototype.visitNull=w(Vc);m.prototype.visitBool=w(Pc);m.prototype.visitInt=w(Yc);m.prototype.visitInt8=w(re);m.prototype.visitInt16=w(re);m.prototype.visitInt32=w(re);m.prototype.visitInt64=w(ho);m.prototype.visitUint8=w(re);m.prototype.visitUint16=w(re);m.prototype.visitUint32=w(re);m.prototype.visitUint64=w(ho);m.prototype.visitFloat=w(Wc);m.prototype.visitFloat16=w(kc);m.prototype.visitFloat32=w(re);m.prototype.visitFloat64=w(re);m.prototype.visitUtf8=w($c);m.prototype.visitBinary=w(zc);m.prototype.visitFixedSizeBinary=w(jc);m.prototype.visitDate=w(Hc);m.prototype.visitDateDay=w(lo);m.prototype.visitDateMillisecond=w(uo);m.prototype.visitTimestamp=w(Jc);m.prototype.visitTimestampSecond=w(fo);m.prototype.visitTimestampMillisecond=w(po);m.prototype.visitTimestampMicrosecond=w(yo);m.prototype.visitTimestampNanosecond=w(mo);m.prototype.visitTime=w(Kc);m.prototype.visitTimeSecond=w(bo);m.prototype.visitTimeMillisecond=w(go);m.prototype.visitTimeMicrosecond=w(_o);m.prototype.visitTimeNanosecond=w(vo);m.prototype.visitDecimal=w(Gc);m.prototype.visitList=w(qc);m.prototype.visitStruct=w(Qc);m.prototype.visitUnion=w(Xc);m.prototype.visitDenseUnion=w(wo);m.prototype.visitSparseUnion=w(So);m.prototype.visitDictionary=w(tl);m.prototype.visitInterval=w(el);m.prototype.visitIntervalDayTime=w(Io);m.prototype.visitIntervalYearMonth=w(Bo);m.prototype.visitFixedSizeList=w(nl);m.prototype.visitMap=w(Zc);const it=new m,Bt=Symbol.for("keys"),Te=Symbol.for("vals");class ar{constructor(t){return this[Bt]=new L([t.children[0]]).memoize(),this[Te]=t.children[1],new Proxy(this,new rl)}[Symbol.iterator](){return new il(this[Bt],this[Te])}get size(){return this[Bt].length}toArray(){return Object.values(this.toJSON())}toJSON(){const t=this[Bt],e=this[Te],i={};for(let r=-1,s=t.length;++r<s;)i[t.get(r)]=it.visit(e,r);return i}toString(){return`{${[...this].map(([t,e])=>`${Ge(t)}: ${Ge(e)}`).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class il{constructor(t,e){this.keys=t,this.vals=e,this.keyIndex=0,this.numKeys=t.length}[Symbol.iterator](){return this}next(){const t=this.keyIndex;return t===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(t),it.visit(this.vals,t)]})}}class rl{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(t){return t[Bt].toArray().map(String)}has(t,e){return t[Bt].includes(e)}getOwnPropertyDescriptor(t,e){if(t[Bt].indexOf(e)!==-1)return{writable:!0,enumerable:!0,configurable:!0}}get(t,e){if(Reflect.has(t,e))return t[e];const i=t[Bt].indexOf(e);if(i!==-1){const r=it.visit(Reflect.get(t,Te),i);return Reflect.set(t,e,r),r}}set(t,e,i){const r=t[Bt].indexOf(e);return r!==-1?(yt.visit(Reflect.get(t,Te),r,i),Reflect.set(t,e,i)):Reflect.has(t,e)?Reflect.set(t,e,i):!1}}Object.defineProperties(ar.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Bt]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Te]:{writable:!0,enumerable:!1,configurable:!1,value:null}});let Rr;function Ao(n,t,e,i){const{length:r=0}=n;let s=typeof t!="number"?0:t,o=typeof e!="number"?r:e;return s<0&&(s=(s%r+r)%r),o<0&&(o=(o%r+r)%r),o<s&&(Rr=s,s=o,o=Rr),o>r&&(o=r),i?i(n,s,o):[s,o]}const xr=n=>n!==n;function je(n){if(typeof n!=="object"||n===null)return xr(n)?xr:e=>e===n;if(n instanceof Date){const e=n.valueOf();return i=>i instanceof Date?i.valueOf()===e:!1}return ArrayBuffer.isView(n)?e=>e?Za(n,e):!1:n instanceof Map?ol(n):Array.isArray(n)?sl(n):n instanceof L?al(n):cl(n,!0)}function sl(n){const t=[];for(let e=-1,i=n.length;++e<i;)t[e]=je(n[e]);return hi(t)}function ol(n){let t=-1;const e=[];for(const i of n.values())e[++t]=je(i);return hi(e)}function al(n){const t=[];for(let e=-1,i=n.length;++e<i;)t[e]=je(n.get(e));return hi(t)}function cl(n,t=!1){const e=Object.keys(n);if(!t&&e.length===0)return()=>!1;const i=[];for(let r=-1,s=e.length;++r<s;)i[r]=je(n[e[r]]);return hi(i,e)}function hi(n,t){return e=>{if(!e||typeof e!="object")return!1;switch(e.constructor){case Array:return ll(n,e);case Map:return Cr(n,e,e.keys());case ar:case sr:case Object:case void 0:return Cr(n,e,t||Object.keys(e))}return e instanceof L?ul(n,e):!1}}function ll(n,t){const e=n.length;if(t.length!==e)return!1;for(let i=-1;++i<e;)if(!n[i](t[i]))return!1;return!0}function ul(n,t){const e=n.length;if(t.length!==e)return!1;for(let i=-1;++i<e;)if(!n[i](t.get(i)))return!1;return!0}function Cr(n,t,e){const i=e[Symbol.iterator](),r=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),s=t instanceof Map?t.values():Object.values(t)[Symbol.iterator]();let o=0;const a=n.length;let c=s.next(),u=i.next(),d=r.next();for(;o<a&&!u.done&&!d.done&&!c.done&&!(u.value!==d.value||!n[o](c.value));++o,u=i.next(),d=r.next(),c=s.next());return o===a&&u.done&&d.done&&c.done?!0:(i.return&&i.return(),r.return&&r.return(),s.return&&s.return(),!1)}function Oo(n,t,e,i){return(e&1<<i)!==0}function dl(n,t,e,i){return(e&1<<i)>>i}function cr(n,t,e){const i=e.byteLength+7&-8;if(n>0||e.byteLength<i){const r=new Uint8Array(i);return r.set(n%8===0?e.subarray(n>>3):Cn(new lr(e,n,t,null,Oo)).subarray(0,i)),r}return e}function Cn(n){const t=[];let e=0,i=0,r=0;for(const o of n)o&&(r|=1<<i),++i===8&&(t[e++]=r,r=i=0);(e===0||i>0)&&(t[e++]=r);const s=new Uint8Array(t.length+7&-8);return s.set(t),s}class lr{constructor(t,e,i,r,s){this.bytes=t,this.length=i,this.context=r,this.get=s,this.bit=e%8,this.byteIndex=e>>3,this.byte=t[this.byteIndex++],this.index=0}next(){return this.index<this.length?(this.bit===8&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function Ni(n,t,e){if(e-t<=0)return 0;if(e-t<8){let s=0;for(const o of new lr(n,t,e-t,n,dl))s+=o;return s}const i=e>>3<<3,r=t+(t%8===0?0:8-t%8);return Ni(n,t,r)+Ni(n,i,e)+hl(n,r>>3,i-r>>3)}function hl(n,t,e){let i=0,r=Math.trunc(t);const s=new DataView(n.buffer,n.byteOffset,n.byteLength),o=e===void 0?n.byteLength:r+e;for(;o-r>=4;)i+=_i(s.getUint32(r)),r+=4;for(;o-r>=2;)i+=_i(s.getUint16(r)),r+=2;for(;o-r>=1;)i+=_i(s.getUint8(r)),r+=1;return i}function _i(n){let t=Math.trunc(n);return t=t-(t>>>1&1431655765),t=(t&858993459)+(t>>>2&858993459),(t+(t>>>4)&252645135)*16843009>>>24}const fl=-1;class P{constructor(t,e,i,r,s,o=[],a){this.type=t,this.children=o,this.dictionary=a,this.offset=Math.floor(Math.max(e||0,0)),this.length=Math.floor(Math.max(i||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1));let c;s instanceof P?(this.stride=s.stride,this.values=s.values,this.typeIds=s.typeIds,this.nullBitmap=s.nullBitmap,this.valueOffsets=s.valueOffsets):(this.stride=Ct(t),s&&((c=s[0])&&(this.valueOffsets=c),(c=s[1])&&(this.values=c),(c=s[2])&&(this.nullBitmap=c),(c=s[3])&&(this.typeIds=c))),this.nullable=this._nullCount!==0&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let t=0;const{valueOffsets:e,values:i,nullBitmap:r,typeIds:s}=this;return e&&(t+=e.byteLength),i&&(t+=i.byteLength),r&&(t+=r.byteLength),s&&(t+=s.byteLength),this.children.reduce((o,a)=>o+a.byteLength,t)}get nullCount(){let t=this._nullCount,e;return t<=fl&&(e=this.nullBitmap)&&(this._nullCount=t=this.length-Ni(e,this.offset,this.offset+this.length)),t}getValid(t){if(this.nullable&&this.nullCount>0){const e=this.offset+t;return(this.nullBitmap[e>>3]&1<<e%8)!==0}return!0}setValid(t,e){if(!this.nullable)return e;if(!this.nullBitmap||this.nullBitmap.byteLength<=t>>3){const{nullBitmap:c}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:c,_nullCount:0})}const{nullBitmap:i,offset:r}=this,s=r+t>>3,o=(r+t)%8,a=i[s]>>o&1;return e?a===0&&(i[s]|=1<<o,this._nullCount=this.nullCount+1):a===1&&(i[s]&=~(1<<o),this._nullCount=this.nullCount-1),e}clone(t=this.type,e=this.offset,i=this.length,r=this._nullCount,s=this,o=this.children){return new P(t,e,i,r,s,o,this.dictionary)}slice(t,e){const{stride:i,typeId:r,children:s}=this,o=+(this._nullCount===0)-1,a=r===16?i:1,c=this._sliceBuffers(t,e,i,r);return this.clone(this.type,this.offset+t,e,o,c,s.length===0||this.valueOffsets?s:this._sliceChildren(s,a*t,a*e))}_changeLengthAndBackfillNullBitmap(t){if(this.typeId===l.Null)return this.clone(this.type,0,t,0);const{length:e,nullCount:i}=this,r=new Uint8Array((t+63&-64)>>3).fill(255,0,e>>3);r[e>>3]=(1<<e-(e&-8))-1,i>0&&r.set(cr(this.offset,e,this.nullBitmap),0);const s=this.buffers;return s[xt.VALIDITY]=r,this.clone(this.type,0,t,i+(t-e),s)}_sliceBuffers(t,e,i,r){let s;const{buffers:o}=this;return(s=o[xt.TYPE])&&(o[xt.TYPE]=s.subarray(t,t+e)),(s=o[xt.OFFSET])&&(o[xt.OFFSET]=s.subarray(t,t+e+1))||(s=o[xt.DATA])&&(o[xt.DATA]=r===6?s:s.subarray(i*t,i*(t+e))),o}_sliceChildren(t,e,i){return t.map(r=>r.slice(e,i))}}P.prototype.children=Object.freeze([]);class He extends D{visit(t){return this.getVisitFn(t.type).call(this,t)}visitNull(t){const{["type"]:e,["offset"]:i=0,["length"]:r=0}=t;return new P(e,i,r,0)}visitBool(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length>>3,["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitInt(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length,["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitFloat(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length,["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitUtf8(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.data),s=T(t.nullBitmap),o=ze(t.valueOffsets),{["length"]:a=o.length-1,["nullCount"]:c=t.nullBitmap?-1:0}=t;return new P(e,i,a,c,[o,r,s])}visitBinary(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.data),s=T(t.nullBitmap),o=ze(t.valueOffsets),{["length"]:a=o.length-1,["nullCount"]:c=t.nullBitmap?-1:0}=t;return new P(e,i,a,c,[o,r,s])}visitFixedSizeBinary(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length/Ct(e),["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitDate(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length/Ct(e),["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitTimestamp(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length/Ct(e),["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitTime(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length/Ct(e),["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitDecimal(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length/Ct(e),["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitList(t){const{["type"]:e,["offset"]:i=0,["child"]:r}=t,s=T(t.nullBitmap),o=ze(t.valueOffsets),{["length"]:a=o.length-1,["nullCount"]:c=t.nullBitmap?-1:0}=t;return new P(e,i,a,c,[o,void 0,s],[r])}visitStruct(t){const{["type"]:e,["offset"]:i=0,["children"]:r=[]}=t,s=T(t.nullBitmap),{length:o=r.reduce((c,{length:u})=>Math.max(c,u),0),nullCount:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,void 0,s],r)}visitUnion(t){const{["type"]:e,["offset"]:i=0,["children"]:r=[]}=t,s=T(t.nullBitmap),o=C(e.ArrayType,t.typeIds),{["length"]:a=o.length,["nullCount"]:c=t.nullBitmap?-1:0}=t;if(y.isSparseUnion(e))return new P(e,i,a,c,[void 0,void 0,s,o],r);const u=ze(t.valueOffsets);return new P(e,i,a,c,[u,void 0,s,o],r)}visitDictionary(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.indices.ArrayType,t.data),{["dictionary"]:o=new L([new He().visit({type:e.dictionary})])}=t,{["length"]:a=s.length,["nullCount"]:c=t.nullBitmap?-1:0}=t;return new P(e,i,a,c,[void 0,s,r],[],o)}visitInterval(t){const{["type"]:e,["offset"]:i=0}=t,r=T(t.nullBitmap),s=C(e.ArrayType,t.data),{["length"]:o=s.length/Ct(e),["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,s,r])}visitFixedSizeList(t){const{["type"]:e,["offset"]:i=0,["child"]:r=new He().visit({type:e.valueType})}=t,s=T(t.nullBitmap),{["length"]:o=r.length/Ct(e),["nullCount"]:a=t.nullBitmap?-1:0}=t;return new P(e,i,o,a,[void 0,void 0,s],[r])}visitMap(t){const{["type"]:e,["offset"]:i=0,["child"]:r=new He().visit({type:e.childType})}=t,s=T(t.nullBitmap),o=ze(t.valueOffsets),{["length"]:a=o.length-1,["nullCount"]:c=t.nullBitmap?-1:0}=t;return new P(e,i,a,c,[o,void 0,s],[r])}}function F(n){return new He().visit(n)}class Vr{constructor(t=0,e){this.numChunks=t,this.getChunkIterator=e,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const t=this.chunkIterator.next();if(!t.done)return t;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function Fo(n){return n.reduce((t,e)=>t+e.nullCount,0)}function Do(n){return n.reduce((t,e,i)=>(t[i+1]=t[i]+e.length,t),new Uint32Array(n.length+1))}function To(n,t,e,i){const r=[];for(let s=-1,o=n.length;++s<o;){const a=n[s],c=t[s],{length:u}=a;if(c>=i)break;if(e>=c+u)continue;if(c>=e&&c+u<=i){r.push(a);continue}const d=Math.max(0,e-c),h=Math.min(i-c,u);r.push(a.slice(d,h-d))}return r.length===0&&r.push(n[0].slice(0,0)),r}function ur(n,t,e,i){let r=0,s=0,o=t.length-1;do{if(r>=o-1)return e<t[o]?i(n,r,e-t[r]):null;s=r+Math.trunc((o-r)*.5),e<t[s]?o=s:r=s}while(r<o)}function dr(n,t){return n.getValid(t)}function Me(n){function t(e,i,r){return n(e[i],r)}return function(e){const i=this.data;return ur(i,this._offsets,e,t)}}function Mo(n){let t;function e(i,r,s){return n(i[r],s,t)}return function(i,r){const s=this.data;t=r;const o=ur(s,this._offsets,i,e);return t=void 0,o}}function No(n){let t;function e(i,r,s){let o=s,a=0,c=0;for(let u=r-1,d=i.length;++u<d;){const h=i[u];if(~(a=n(h,t,o)))return c+a;o=0,c+=h.length}return-1}return function(i,r){t=i;const s=this.data,o=typeof r!="number"?e(s,0,0):ur(s,this._offsets,r,e);return t=void 0,o}}class b extends D{}function pl(n,t){return t===null&&n.length>0?0:-1}function yl(n,t){const{nullBitmap:e}=n;if(!e||n.nullCount<=0)return-1;let i=0;for(const r of new lr(e,n.offset+(t||0),n.length,e,Oo)){if(!r)return i;++i}return-1}function O(n,t,e){if(t===void 0)return-1;if(t===null)return yl(n,e);const i=it.getVisitFn(n),r=je(t);for(let s=(e||0)-1,o=n.length;++s<o;)if(r(i(n,s)))return s;return-1}function Lo(n,t,e){const i=it.getVisitFn(n),r=je(t);for(let s=(e||0)-1,o=n.length;++s<o;)if(r(i(n,s)))return s;return-1}b.prototype.visitNull=pl;b.prototype.visitBool=O;b.prototype.visitInt=O;b.prototype.visitInt8=O;b.prototype.visitInt16=O;b.prototype.visitInt32=O;b.prototype.visitInt64=O;b.prototype.visitUint8=O;b.prototype.visitUint16=O;b.prototype.visitUint32=O;b.prototype.visitUint64=O;b.prototype.visitFloat=O;b.prototype.visitFloat16=O;b.prototype.visitFloat32=O;b.prototype.visitFloat64=O;b.prototype.visitUtf8=O;b.prototype.visitBinary=O;b.prototype.visitFixedSizeBinary=O;b.prototype.visitDate=O;b.prototype.visitDateDay=O;b.prototype.visitDateMillisecond=O;b.prototype.visitTimestamp=O;b.prototype.visitTimestampSecond=O;b.prototype.visitTimestampMillisecond=O;b.prototype.visitTimestampMicrosecond=O;b.prototype.visitTimestampNanosecond=O;b.prototype.visitTime=O;b.prototype.visitTimeSecond=O;b.prototype.visitTimeMillisecond=O;b.prototype.visitTimeMicrosecond=O;b.prototype.visitTimeNanosecond=O;b.prototype.visitDecimal=O;b.prototype.visitList=O;b.prototype.visitStruct=O;b.prototype.visitUnion=O;b.prototype.visitDenseUnion=Lo;b.prototype.visitSparseUnion=Lo;b.prototype.visitDictionary=O;b.prototype.visitInterval=O;b.prototype.visitIntervalDayTime=O;b.prototype.visitIntervalYearMonth=O;b.prototype.visitFixedSizeList=O;b.prototype.visitMap=O;const Vn=new b;class g extends D{}function S(n){const{type:t}=n;if(n.nullCount===0&&n.stride===1&&(t.typeId===l.Timestamp||t instanceof ee&&t.bitWidth!==64||t instanceof Xe&&t.bitWidth!==64||t instanceof Qe&&t.precision!==et.HALF))return new Vr(n.data.length,i=>{const r=n.data[i];return r.values.subarray(0,r.length)[Symbol.iterator]()});let e=0;return new Vr(n.data.length,i=>{const s=n.data[i].length,o=n.slice(e,e+s);return e+=s,new ml(o)})}class ml{constructor(t){this.vector=t,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}g.prototype.visitNull=S;g.prototype.visitBool=S;g.prototype.visitInt=S;g.prototype.visitInt8=S;g.prototype.visitInt16=S;g.prototype.visitInt32=S;g.prototype.visitInt64=S;g.prototype.visitUint8=S;g.prototype.visitUint16=S;g.prototype.visitUint32=S;g.prototype.visitUint64=S;g.prototype.visitFloat=S;g.prototype.visitFloat16=S;g.prototype.visitFloat32=S;g.prototype.visitFloat64=S;g.prototype.visitUtf8=S;g.prototype.visitBinary=S;g.prototype.visitFixedSizeBinary=S;g.prototype.visitDate=S;g.prototype.visitDateDay=S;g.prototype.visitDateMillisecond=S;g.prototype.visitTimestamp=S;g.prototype.visitTimestampSecond=S;g.prototype.visitTimestampMillisecond=S;g.prototype.visitTimestampMicrosecond=S;g.prototype.visitTimestampNanosecond=S;g.prototype.visitTime=S;g.prototype.visitTimeSecond=S;g.prototype.visitTimeMillisecond=S;g.prototype.visitTimeMicrosecond=S;g.prototype.visitTimeNanosecond=S;g.prototype.visitDecimal=S;g.prototype.visitList=S;g.prototype.visitStruct=S;g.prototype.visitUnion=S;g.prototype.visitDenseUnion=S;g.prototype.visitSparseUnion=S;g.prototype.visitDictionary=S;g.prototype.visitInterval=S;g.prototype.visitIntervalDayTime=S;g.prototype.visitIntervalYearMonth=S;g.prototype.visitFixedSizeList=S;g.prototype.visitMap=S;const hr=new g,bl=(n,t)=>n+t;class se extends D{visitNull(t,e){return 0}visitInt(t,e){return t.type.bitWidth/8}visitFloat(t,e){return t.type.ArrayType.BYTES_PER_ELEMENT}visitBool(t,e){return 1/8}visitDecimal(t,e){return t.type.bitWidth/8}visitDate(t,e){return(t.type.unit+1)*4}visitTime(t,e){return t.type.bitWidth/8}visitTimestamp(t,e){return t.type.unit===M.SECOND?4:8}visitInterval(t,e){return(t.type.unit+1)*4}visitStruct(t,e){return t.children.reduce((i,r)=>i+Et.visit(r,e),0)}visitFixedSizeBinary(t,e){return t.type.byteWidth}visitMap(t,e){return 8+t.children.reduce((i,r)=>i+Et.visit(r,e),0)}visitDictionary(t,e){var i;return t.type.indices.bitWidth/8+(((i=t.dictionary)===null||i===void 0?void 0:i.getByteLength(t.values[e]))||0)}}const gl=({valueOffsets:n},t)=>8+(n[t+1]-n[t]),_l=({valueOffsets:n},t)=>8+(n[t+1]-n[t]),vl=({valueOffsets:n,stride:t,children:e},i)=>{const r=e[0],{[i*t]:s}=n,{[i*t+1]:o}=n,a=Et.getVisitFn(r.type),c=r.slice(s,o-s);let u=8;for(let d=-1,h=o-s;++d<h;)u+=a(c,d);return u},wl=({stride:n,children:t},e)=>{const i=t[0],r=i.slice(e*n,n),s=Et.getVisitFn(i.type);let o=0;for(let a=-1,c=r.length;++a<c;)o+=s(r,a);return o},Sl=(n,t)=>n.type.mode===ct.Dense?Eo(n,t):Uo(n,t),Eo=({type:n,children:t,typeIds:e,valueOffsets:i},r)=>{const s=n.typeIdToChildIndex[e[r]];return 8+Et.visit(t[s],i[r])},Uo=({children:n},t)=>4+Et.visitMany(n,n.map(()=>t)).reduce(bl,0);se.prototype.visitUtf8=gl;se.prototype.visitBinary=_l;se.prototype.visitList=vl;se.prototype.visitFixedSizeList=wl;se.prototype.visitUnion=Sl;se.prototype.visitDenseUnion=Eo;se.prototype.visitSparseUnion=Uo;const Et=new se;var Ro;const xo={},Co={};class L{constructor(t){var e,i,r;const s=t[0]instanceof L?t.flatMap(a=>a.data):t;if(s.length===0||s.some(a=>!(a instanceof P)))throw new TypeError("Vector constructor expects an Array of Data instances.");const o=(e=s[0])===null||e===void 0?void 0:e.type;switch(s.length){case 0:this._offsets=[0];break;case 1:{const{get:a,set:c,indexOf:u,byteLength:d}=xo[o.typeId],h=s[0];this.isValid=A=>dr(h,A),this.get=A=>a(h,A),this.set=(A,f)=>c(h,A,f),this.indexOf=A=>u(h,A),this.getByteLength=A=>d(h,A),this._offsets=[0,h.length];break}default:Object.setPrototypeOf(this,Co[o.typeId]),this._offsets=Do(s);break}this.data=s,this.type=o,this.stride=Ct(o),this.numChildren=(r=(i=o.children)===null||i===void 0?void 0:i.length)!==null&&r!==void 0?r:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return this._byteLength===-1&&(this._byteLength=this.data.reduce((t,e)=>t+e.byteLength,0)),this._byteLength}get nullCount(){return this._nullCount===-1&&(this._nullCount=Fo(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${l[this.type.typeId]}Vector`}isValid(t){return!1}get(t){return null}set(t,e){}indexOf(t,e){return-1}includes(t,e){return this.indexOf(t,e)>0}getByteLength(t){return 0}[Symbol.iterator](){return hr.visit(this)}concat(...t){return new L(this.data.concat(t.flatMap(e=>e.data).flat(Number.POSITIVE_INFINITY)))}slice(t,e){return new L(Ao(this,t,e,({data:i,_offsets:r},s,o)=>To(i,r,s,o)))}toJSON(){return[...this]}toArray(){const{type:t,data:e,length:i,stride:r,ArrayType:s}=this;switch(t.typeId){case l.Int:case l.Float:case l.Decimal:case l.Time:case l.Timestamp:switch(e.length){case 0:return new s;case 1:return e[0].values.subarray(0,i*r);default:return e.reduce((o,{values:a,length:c})=>(o.array.set(a.subarray(0,c*r),o.offset),o.offset+=c*r,o),{array:new s(i*r),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(t){var e;return this.getChildAt((e=this.type.children)===null||e===void 0?void 0:e.findIndex(i=>i.name===t))}getChildAt(t){return t>-1&&t<this.numChildren?new L(this.data.map(({children:e})=>e[t])):null}get isMemoized(){return y.isDictionary(this.type)?this.data[0].dictionary.isMemoized:!1}memoize(){if(y.isDictionary(this.type)){const t=new Pn(this.data[0].dictionary),e=this.data.map(i=>{const r=i.clone();return r.dictionary=t,r});return new L(e)}return new Pn(this)}unmemoize(){if(y.isDictionary(this.type)&&this.isMemoized){const t=this.data[0].dictionary.unmemoize(),e=this.data.map(i=>{const r=i.clone();return r.dictionary=t,r});return new L(e)}return this}}Ro=Symbol.toStringTag;L[Ro]=(n=>{n.type=y.prototype,n.data=[],n.length=0,n.stride=1,n.numChildren=0,n._nullCount=-1,n._byteLength=-1,n._offsets=new Uint32Array([0]),n[Symbol.isConcatSpreadable]=!0;const t=Object.keys(l).map(e=>l[e]).filter(e=>typeof e=="number"&&e!==l.NONE);for(const e of t){const i=it.getVisitFnByTypeId(e),r=yt.getVisitFnByTypeId(e),s=Vn.getVisitFnByTypeId(e),o=Et.getVisitFnByTypeId(e);xo[e]={get:i,set:r,indexOf:s,byteLength:o},Co[e]=Object.create(n,{isValid:{value:Me(dr)},get:{value:Me(it.getVisitFnByTypeId(e))},set:{value:Mo(yt.getVisitFnByTypeId(e))},indexOf:{value:No(Vn.getVisitFnByTypeId(e))},getByteLength:{value:Me(Et.getVisitFnByTypeId(e))}})}return"Vector"})(L.prototype);class Pn extends L{constructor(t){super(t.data);const e=this.get,i=this.set,r=this.slice,s=new Array(this.length);Object.defineProperty(this,"get",{value(o){const a=s[o];if(a!==void 0)return a;const c=e.call(this,o);return s[o]=c,c}}),Object.defineProperty(this,"set",{value(o,a){i.call(this,o,a),s[o]=a}}),Object.defineProperty(this,"slice",{value:(o,a)=>new Pn(r.call(this,o,a))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new L(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class Li{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(t,e,i,r){return t.prep(8,24),t.writeInt64(r),t.pad(4),t.writeInt32(i),t.writeInt64(e),t.offset()}}const vi=2,At=4,Pt=4,V=4,qt=new Int32Array(2),Pr=new Float32Array(qt.buffer),kr=new Float64Array(qt.buffer),yn=new Uint16Array(new Uint8Array([1,0]).buffer)[0]===1;let jt=class Ei{constructor(t,e){this.low=t|0,this.high=e|0}static create(t,e){return t==0&&e==0?Ei.ZERO:new Ei(t,e)}toFloat64(){return(this.low>>>0)+this.high*4294967296}equals(t){return this.low==t.low&&this.high==t.high}};jt.ZERO=new jt(0,0);var Ui;(function(n){n[n.UTF8_BYTES=1]="UTF8_BYTES",n[n.UTF16_STRING=2]="UTF16_STRING"})(Ui||(Ui={}));let Ee=class Vo{constructor(t){this.bytes_=t,this.position_=0}static allocate(t){return new Vo(new Uint8Array(t))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(t){this.position_=t}capacity(){return this.bytes_.length}readInt8(t){return this.readUint8(t)<<24>>24}readUint8(t){return this.bytes_[t]}readInt16(t){return this.readUint16(t)<<16>>16}readUint16(t){return this.bytes_[t]|this.bytes_[t+1]<<8}readInt32(t){return this.bytes_[t]|this.bytes_[t+1]<<8|this.bytes_[t+2]<<16|this.bytes_[t+3]<<24}readUint32(t){return this.readInt32(t)>>>0}readInt64(t){return new jt(this.readInt32(t),this.readInt32(t+4))}readUint64(t){return new jt(this.readUint32(t),this.readUint32(t+4))}readFloat32(t){return qt[0]=this.readInt32(t),Pr[0]}readFloat64(t){return qt[yn?0:1]=this.readInt32(t),qt[yn?1:0]=this.readInt32(t+4),kr[0]}writeInt8(t,e){this.bytes_[t]=e}writeUint8(t,e){this.bytes_[t]=e}writeInt16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeUint16(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8}writeInt32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeUint32(t,e){this.bytes_[t]=e,this.bytes_[t+1]=e>>8,this.bytes_[t+2]=e>>16,this.bytes_[t+3]=e>>24}writeInt64(t,e){this.writeInt32(t,e.low),this.writeInt32(t+4,e.high)}writeUint64(t,e){this.writeUint32(t,e.low),this.writeUint32(t+4,e.high)}writeFloat32(t,e){Pr[0]=e,this.writeInt32(t,qt[0])}writeFloat64(t,e){kr[0]=e,this.writeInt32(t,qt[yn?0:1]),this.writeInt32(t+4,qt[yn?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+At+Pt)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let t="";for(let e=0;e<Pt;e++)t+=String.fromCharCode(this.readInt8(this.position_+At+e));return t}__offset(t,e){const i=t-this.readInt32(t);return e<this.readInt16(i)?this.readInt16(i+e):0}__union(t,e){return t.bb_pos=e+this.readInt32(e),t.bb=this,t}__string(t,e){t+=this.readInt32(t);const i=this.readInt32(t);let r="",s=0;if(t+=At,e===Ui.UTF8_BYTES)return this.bytes_.subarray(t,t+i);for(;s<i;){let o;const a=this.readUint8(t+s++);if(a<192)o=a;else{const c=this.readUint8(t+s++);if(a<224)o=(a&31)<<6|c&63;else{const u=this.readUint8(t+s++);if(a<240)o=(a&15)<<12|(c&63)<<6|u&63;else{const d=this.readUint8(t+s++);o=(a&7)<<18|(c&63)<<12|(u&63)<<6|d&63}}}o<65536?r+=String.fromCharCode(o):(o-=65536,r+=String.fromCharCode((o>>10)+55296,(o&1023)+56320))}return r}__union_with_string(t,e){return typeof t=="string"?this.__string(e):this.__union(t,e)}__indirect(t){return t+this.readInt32(t)}__vector(t){return t+this.readInt32(t)+At}__vector_len(t){return this.readInt32(t+this.readInt32(t))}__has_identifier(t){if(t.length!=Pt)throw new Error("FlatBuffers: file identifier must be length "+Pt);for(let e=0;e<Pt;e++)if(t.charCodeAt(e)!=this.readInt8(this.position()+At+e))return!1;return!0}createLong(t,e){return jt.create(t,e)}createScalarList(t,e){const i=[];for(let r=0;r<e;++r)t(r)!==null&&i.push(t(r));return i}createObjList(t,e){const i=[];for(let r=0;r<e;++r){const s=t(r);s!==null&&i.push(s.unpack())}return i}},Po=class ko{constructor(t){this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null;let e;t?e=t:e=1024,this.bb=Ee.allocate(e),this.space=e}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(t){this.force_defaults=t}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(t,e){t>this.minalign&&(this.minalign=t);const i=~(this.bb.capacity()-this.space+e)+1&t-1;for(;this.space<i+t+e;){const r=this.bb.capacity();this.bb=ko.growByteBuffer(this.bb),this.space+=this.bb.capacity()-r}this.pad(i)}pad(t){for(let e=0;e<t;e++)this.bb.writeInt8(--this.space,0)}writeInt8(t){this.bb.writeInt8(this.space-=1,t)}writeInt16(t){this.bb.writeInt16(this.space-=2,t)}writeInt32(t){this.bb.writeInt32(this.space-=4,t)}writeInt64(t){this.bb.writeInt64(this.space-=8,t)}writeFloat32(t){this.bb.writeFloat32(this.space-=4,t)}writeFloat64(t){this.bb.writeFloat64(this.space-=8,t)}addInt8(t){this.prep(1,0),this.writeInt8(t)}addInt16(t){this.prep(2,0),this.writeInt16(t)}addInt32(t){this.prep(4,0),this.writeInt32(t)}addInt64(t){this.prep(8,0),this.writeInt64(t)}addFloat32(t){this.prep(4,0),this.writeFloat32(t)}addFloat64(t){this.prep(8,0),this.writeFloat64(t)}addFieldInt8(t,e,i){(this.force_defaults||e!=i)&&(this.addInt8(e),this.slot(t))}addFieldInt16(t,e,i){(this.force_defaults||e!=i)&&(this.addInt16(e),this.slot(t))}addFieldInt32(t,e,i){(this.force_defaults||e!=i)&&(this.addInt32(e),this.slot(t))}addFieldInt64(t,e,i){(this.force_defaults||!e.equals(i))&&(this.addInt64(e),this.slot(t))}addFieldFloat32(t,e,i){(this.force_defaults||e!=i)&&(this.addFloat32(e),this.slot(t))}addFieldFloat64(t,e,i){(this.force_defaults||e!=i)&&(this.addFloat64(e),this.slot(t))}addFieldOffset(t,e,i){(this.force_defaults||e!=i)&&(this.addOffset(e),this.slot(t))}addFieldStruct(t,e,i){e!=i&&(this.nested(e),this.slot(t))}nested(t){if(t!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")}slot(t){this.vtable!==null&&(this.vtable[t]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(t){const e=t.capacity();if(e&3221225472)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");const i=e<<1,r=Ee.allocate(i);return r.setPosition(i-e),r.bytes().set(t.bytes(),i-e),r}addOffset(t){this.prep(At,0),this.writeInt32(this.offset()-t+At)}startObject(t){this.notNested(),this.vtable==null&&(this.vtable=[]),this.vtable_in_use=t;for(let e=0;e<t;e++)this.vtable[e]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(this.vtable==null||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);const t=this.offset();let e=this.vtable_in_use-1;for(;e>=0&&this.vtable[e]==0;e--);const i=e+1;for(;e>=0;e--)this.addInt16(this.vtable[e]!=0?t-this.vtable[e]:0);const r=2;this.addInt16(t-this.object_start);const s=(i+r)*vi;this.addInt16(s);let o=0;const a=this.space;t:for(e=0;e<this.vtables.length;e++){const c=this.bb.capacity()-this.vtables[e];if(s==this.bb.readInt16(c)){for(let u=vi;u<s;u+=vi)if(this.bb.readInt16(a+u)!=this.bb.readInt16(c+u))continue t;o=this.vtables[e];break}}return o?(this.space=this.bb.capacity()-t,this.bb.writeInt32(this.space,o-t)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-t,this.offset()-t)),this.isNested=!1,t}finish(t,e,i){const r=i?V:0;if(e){const s=e;if(this.prep(this.minalign,At+Pt+r),s.length!=Pt)throw new Error("FlatBuffers: file identifier must be length "+Pt);for(let o=Pt-1;o>=0;o--)this.writeInt8(s.charCodeAt(o))}this.prep(this.minalign,At+r),this.addOffset(t),r&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(t,e){this.finish(t,e,!0)}requiredField(t,e){const i=this.bb.capacity()-t,r=i-this.bb.readInt32(i);if(!(this.bb.readInt16(r+e)!=0))throw new Error("FlatBuffers: field "+e+" must be set")}startVector(t,e,i){this.notNested(),this.vector_num_elems=e,this.prep(At,t*e),this.prep(i,t*e)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(t){if(!t)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(t))return this.string_maps.get(t);const e=this.createString(t);return this.string_maps.set(t,e),e}createString(t){if(!t)return 0;let e;if(t instanceof Uint8Array)e=t;else{e=[];let i=0;for(;i<t.length;){let r;const s=t.charCodeAt(i++);if(s<55296||s>=56320)r=s;else{const o=t.charCodeAt(i++);r=(s<<10)+o+-56613888}r<128?e.push(r):(r<2048?e.push(r>>6&31|192):(r<65536?e.push(r>>12&15|224):e.push(r>>18&7|240,r>>12&63|128),e.push(r>>6&63|128)),e.push(r&63|128))}}this.addInt8(0),this.startVector(1,e.length,1),this.bb.setPosition(this.space-=e.length);for(let i=0,r=this.space,s=this.bb.bytes();i<e.length;i++)s[r++]=e[i];return this.endVector()}createLong(t,e){return jt.create(t,e)}createObjectOffset(t){return t===null?0:typeof t=="string"?this.createString(t):t.pack(this)}createObjectOffsetList(t){const e=[];for(let i=0;i<t.length;++i){const r=t[i];if(r!==null)e.push(this.createObjectOffset(r));else throw new Error("FlatBuffers: Argument for createObjectOffsetList cannot contain null.")}return e}createStructOffsetList(t,e){return e(this,t.length),this.createObjectOffsetList(t),this.endVector()}};class H{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsKeyValue(t,e){return(e||new H).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsKeyValue(t,e){return t.setPosition(t.position()+V),(e||new H).__init(t.readInt32(t.position())+t.position(),t)}key(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}value(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startKeyValue(t){t.startObject(2)}static addKey(t,e){t.addFieldOffset(0,e,0)}static addValue(t,e){t.addFieldOffset(1,e,0)}static endKeyValue(t){return t.endObject()}static createKeyValue(t,e,i){return H.startKeyValue(t),H.addKey(t,e),H.addValue(t,i),H.endKeyValue(t)}}var Ue;(function(n){n[n.V1=0]="V1",n[n.V2=1]="V2",n[n.V3=2]="V3",n[n.V4=3]="V4",n[n.V5=4]="V5"})(Ue||(Ue={}));var Re;(function(n){n[n.Little=0]="Little",n[n.Big=1]="Big"})(Re||(Re={}));var kn;(function(n){n[n.DenseArray=0]="DenseArray"})(kn||(kn={}));class ot{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInt(t,e){return(e||new ot).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInt(t,e){return t.setPosition(t.position()+V),(e||new ot).__init(t.readInt32(t.position())+t.position(),t)}bitWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}isSigned(){const t=this.bb.__offset(this.bb_pos,6);return t?!!this.bb.readInt8(this.bb_pos+t):!1}static startInt(t){t.startObject(2)}static addBitWidth(t,e){t.addFieldInt32(0,e,0)}static addIsSigned(t,e){t.addFieldInt8(1,+e,0)}static endInt(t){return t.endObject()}static createInt(t,e,i){return ot.startInt(t),ot.addBitWidth(t,e),ot.addIsSigned(t,i),ot.endInt(t)}}class kt{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryEncoding(t,e){return(e||new kt).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryEncoding(t,e){return t.setPosition(t.position()+V),(e||new kt).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}indexType(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new ot).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isOrdered(){const t=this.bb.__offset(this.bb_pos,8);return t?!!this.bb.readInt8(this.bb_pos+t):!1}dictionaryKind(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt16(this.bb_pos+t):kn.DenseArray}static startDictionaryEncoding(t){t.startObject(4)}static addId(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addIndexType(t,e){t.addFieldOffset(1,e,0)}static addIsOrdered(t,e){t.addFieldInt8(2,+e,0)}static addDictionaryKind(t,e){t.addFieldInt16(3,e,kn.DenseArray)}static endDictionaryEncoding(t){return t.endObject()}}class ce{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBinary(t,e){return(e||new ce).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBinary(t,e){return t.setPosition(t.position()+V),(e||new ce).__init(t.readInt32(t.position())+t.position(),t)}static startBinary(t){t.startObject(0)}static endBinary(t){return t.endObject()}static createBinary(t){return ce.startBinary(t),ce.endBinary(t)}}class le{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBool(t,e){return(e||new le).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBool(t,e){return t.setPosition(t.position()+V),(e||new le).__init(t.readInt32(t.position())+t.position(),t)}static startBool(t){t.startObject(0)}static endBool(t){return t.endObject()}static createBool(t){return le.startBool(t),le.endBool(t)}}var jn;(function(n){n[n.DAY=0]="DAY",n[n.MILLISECOND=1]="MILLISECOND"})(jn||(jn={}));let gn=class Se{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDate(t,e){return(e||new Se).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDate(t,e){return t.setPosition(t.position()+V),(e||new Se).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):jn.MILLISECOND}static startDate(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,jn.MILLISECOND)}static endDate(t){return t.endObject()}static createDate(t,e){return Se.startDate(t),Se.addUnit(t,e),Se.endDate(t)}};class Q{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDecimal(t,e){return(e||new Q).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDecimal(t,e){return t.setPosition(t.position()+V),(e||new Q).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}scale(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):0}bitWidth(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readInt32(this.bb_pos+t):128}static startDecimal(t){t.startObject(3)}static addPrecision(t,e){t.addFieldInt32(0,e,0)}static addScale(t,e){t.addFieldInt32(1,e,0)}static addBitWidth(t,e){t.addFieldInt32(2,e,128)}static endDecimal(t){return t.endObject()}static createDecimal(t,e,i,r){return Q.startDecimal(t),Q.addPrecision(t,e),Q.addScale(t,i),Q.addBitWidth(t,r),Q.endDecimal(t)}}var xe;(function(n){n[n.SECOND=0]="SECOND",n[n.MILLISECOND=1]="MILLISECOND",n[n.MICROSECOND=2]="MICROSECOND",n[n.NANOSECOND=3]="NANOSECOND"})(xe||(xe={}));class Ot{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeBinary(t,e){return(e||new Ot).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeBinary(t,e){return t.setPosition(t.position()+V),(e||new Ot).__init(t.readInt32(t.position())+t.position(),t)}byteWidth(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeBinary(t){t.startObject(1)}static addByteWidth(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeBinary(t){return t.endObject()}static createFixedSizeBinary(t,e){return Ot.startFixedSizeBinary(t),Ot.addByteWidth(t,e),Ot.endFixedSizeBinary(t)}}class Ft{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFixedSizeList(t,e){return(e||new Ft).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFixedSizeList(t,e){return t.setPosition(t.position()+V),(e||new Ft).__init(t.readInt32(t.position())+t.position(),t)}listSize(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt32(this.bb_pos+t):0}static startFixedSizeList(t){t.startObject(1)}static addListSize(t,e){t.addFieldInt32(0,e,0)}static endFixedSizeList(t){return t.endObject()}static createFixedSizeList(t,e){return Ft.startFixedSizeList(t),Ft.addListSize(t,e),Ft.endFixedSizeList(t)}}var zn;(function(n){n[n.HALF=0]="HALF",n[n.SINGLE=1]="SINGLE",n[n.DOUBLE=2]="DOUBLE"})(zn||(zn={}));class Dt{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFloatingPoint(t,e){return(e||new Dt).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFloatingPoint(t,e){return t.setPosition(t.position()+V),(e||new Dt).__init(t.readInt32(t.position())+t.position(),t)}precision(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):zn.HALF}static startFloatingPoint(t){t.startObject(1)}static addPrecision(t,e){t.addFieldInt16(0,e,zn.HALF)}static endFloatingPoint(t){return t.endObject()}static createFloatingPoint(t,e){return Dt.startFloatingPoint(t),Dt.addPrecision(t,e),Dt.endFloatingPoint(t)}}var $n;(function(n){n[n.YEAR_MONTH=0]="YEAR_MONTH",n[n.DAY_TIME=1]="DAY_TIME",n[n.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"})($n||($n={}));class Tt{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsInterval(t,e){return(e||new Tt).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsInterval(t,e){return t.setPosition(t.position()+V),(e||new Tt).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):$n.YEAR_MONTH}static startInterval(t){t.startObject(1)}static addUnit(t,e){t.addFieldInt16(0,e,$n.YEAR_MONTH)}static endInterval(t){return t.endObject()}static createInterval(t,e){return Tt.startInterval(t),Tt.addUnit(t,e),Tt.endInterval(t)}}class ue{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsList(t,e){return(e||new ue).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsList(t,e){return t.setPosition(t.position()+V),(e||new ue).__init(t.readInt32(t.position())+t.position(),t)}static startList(t){t.startObject(0)}static endList(t){return t.endObject()}static createList(t){return ue.startList(t),ue.endList(t)}}let _n=class Ie{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMap(t,e){return(e||new Ie).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMap(t,e){return t.setPosition(t.position()+V),(e||new Ie).__init(t.readInt32(t.position())+t.position(),t)}keysSorted(){const t=this.bb.__offset(this.bb_pos,4);return t?!!this.bb.readInt8(this.bb_pos+t):!1}static startMap(t){t.startObject(1)}static addKeysSorted(t,e){t.addFieldInt8(0,+e,0)}static endMap(t){return t.endObject()}static createMap(t,e){return Ie.startMap(t),Ie.addKeysSorted(t,e),Ie.endMap(t)}};class de{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsNull(t,e){return(e||new de).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsNull(t,e){return t.setPosition(t.position()+V),(e||new de).__init(t.readInt32(t.position())+t.position(),t)}static startNull(t){t.startObject(0)}static endNull(t){return t.endObject()}static createNull(t){return de.startNull(t),de.endNull(t)}}class he{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsStruct_(t,e){return(e||new he).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsStruct_(t,e){return t.setPosition(t.position()+V),(e||new he).__init(t.readInt32(t.position())+t.position(),t)}static startStruct_(t){t.startObject(0)}static endStruct_(t){return t.endObject()}static createStruct_(t){return he.startStruct_(t),he.endStruct_(t)}}class ft{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTime(t,e){return(e||new ft).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTime(t,e){return t.setPosition(t.position()+V),(e||new ft).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):xe.MILLISECOND}bitWidth(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb_pos+t):32}static startTime(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,xe.MILLISECOND)}static addBitWidth(t,e){t.addFieldInt32(1,e,32)}static endTime(t){return t.endObject()}static createTime(t,e,i){return ft.startTime(t),ft.addUnit(t,e),ft.addBitWidth(t,i),ft.endTime(t)}}class pt{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsTimestamp(t,e){return(e||new pt).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsTimestamp(t,e){return t.setPosition(t.position()+V),(e||new pt).__init(t.readInt32(t.position())+t.position(),t)}unit(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):xe.SECOND}timezone(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__string(this.bb_pos+e,t):null}static startTimestamp(t){t.startObject(2)}static addUnit(t,e){t.addFieldInt16(0,e,xe.SECOND)}static addTimezone(t,e){t.addFieldOffset(1,e,0)}static endTimestamp(t){return t.endObject()}static createTimestamp(t,e,i){return pt.startTimestamp(t),pt.addUnit(t,e),pt.addTimezone(t,i),pt.endTimestamp(t)}}var Yn;(function(n){n[n.Sparse=0]="Sparse",n[n.Dense=1]="Dense"})(Yn||(Yn={}));class X{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUnion(t,e){return(e||new X).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUnion(t,e){return t.setPosition(t.position()+V),(e||new X).__init(t.readInt32(t.position())+t.position(),t)}mode(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Yn.Sparse}typeIds(t){const e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb.__vector(this.bb_pos+e)+t*4):0}typeIdsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}typeIdsArray(){const t=this.bb.__offset(this.bb_pos,6);return t?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+t),this.bb.__vector_len(this.bb_pos+t)):null}static startUnion(t){t.startObject(2)}static addMode(t,e){t.addFieldInt16(0,e,Yn.Sparse)}static addTypeIds(t,e){t.addFieldOffset(1,e,0)}static createTypeIdsVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addInt32(e[i]);return t.endVector()}static startTypeIdsVector(t,e){t.startVector(4,e,4)}static endUnion(t){return t.endObject()}static createUnion(t,e,i){return X.startUnion(t),X.addMode(t,e),X.addTypeIds(t,i),X.endUnion(t)}}class fe{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsUtf8(t,e){return(e||new fe).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsUtf8(t,e){return t.setPosition(t.position()+V),(e||new fe).__init(t.readInt32(t.position())+t.position(),t)}static startUtf8(t){t.startObject(0)}static endUtf8(t){return t.endObject()}static createUtf8(t){return fe.startUtf8(t),fe.endUtf8(t)}}var j;(function(n){n[n.NONE=0]="NONE",n[n.Null=1]="Null",n[n.Int=2]="Int",n[n.FloatingPoint=3]="FloatingPoint",n[n.Binary=4]="Binary",n[n.Utf8=5]="Utf8",n[n.Bool=6]="Bool",n[n.Decimal=7]="Decimal",n[n.Date=8]="Date",n[n.Time=9]="Time",n[n.Timestamp=10]="Timestamp",n[n.Interval=11]="Interval",n[n.List=12]="List",n[n.Struct_=13]="Struct_",n[n.Union=14]="Union",n[n.FixedSizeBinary=15]="FixedSizeBinary",n[n.FixedSizeList=16]="FixedSizeList",n[n.Map=17]="Map",n[n.Duration=18]="Duration",n[n.LargeBinary=19]="LargeBinary",n[n.LargeUtf8=20]="LargeUtf8",n[n.LargeList=21]="LargeList"})(j||(j={}));let dt=class vn{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsField(t,e){return(e||new vn).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsField(t,e){return t.setPosition(t.position()+V),(e||new vn).__init(t.readInt32(t.position())+t.position(),t)}name(t){const e=this.bb.__offset(this.bb_pos,4);return e?this.bb.__string(this.bb_pos+e,t):null}nullable(){const t=this.bb.__offset(this.bb_pos,6);return t?!!this.bb.readInt8(this.bb_pos+t):!1}typeType(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readUint8(this.bb_pos+t):j.NONE}type(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__union(t,this.bb_pos+e):null}dictionary(t){const e=this.bb.__offset(this.bb_pos,12);return e?(t||new kt).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}children(t,e){const i=this.bb.__offset(this.bb_pos,14);return i?(e||new vn).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+t*4),this.bb):null}childrenLength(){const t=this.bb.__offset(this.bb_pos,14);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,16);return i?(e||new H).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+t*4),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,16);return t?this.bb.__vector_len(this.bb_pos+t):0}static startField(t){t.startObject(7)}static addName(t,e){t.addFieldOffset(0,e,0)}static addNullable(t,e){t.addFieldInt8(1,+e,0)}static addTypeType(t,e){t.addFieldInt8(2,e,j.NONE)}static addType(t,e){t.addFieldOffset(3,e,0)}static addDictionary(t,e){t.addFieldOffset(4,e,0)}static addChildren(t,e){t.addFieldOffset(5,e,0)}static createChildrenVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startChildrenVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(6,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endField(t){return t.endObject()}},St=class Rt{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsSchema(t,e){return(e||new Rt).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsSchema(t,e){return t.setPosition(t.position()+V),(e||new Rt).__init(t.readInt32(t.position())+t.position(),t)}endianness(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Re.Little}fields(t,e){const i=this.bb.__offset(this.bb_pos,6);return i?(e||new dt).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+t*4),this.bb):null}fieldsLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,8);return i?(e||new H).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+t*4),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}features(t){const e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb.__vector(this.bb_pos+e)+t*8):this.bb.createLong(0,0)}featuresLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}static startSchema(t){t.startObject(4)}static addEndianness(t,e){t.addFieldInt16(0,e,Re.Little)}static addFields(t,e){t.addFieldOffset(1,e,0)}static createFieldsVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startFieldsVector(t,e){t.startVector(4,e,4)}static addCustomMetadata(t,e){t.addFieldOffset(2,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static addFeatures(t,e){t.addFieldOffset(3,e,0)}static createFeaturesVector(t,e){t.startVector(8,e.length,8);for(let i=e.length-1;i>=0;i--)t.addInt64(e[i]);return t.endVector()}static startFeaturesVector(t,e){t.startVector(8,e,8)}static endSchema(t){return t.endObject()}static finishSchemaBuffer(t,e){t.finish(e)}static finishSizePrefixedSchemaBuffer(t,e){t.finish(e,void 0,!0)}static createSchema(t,e,i,r,s){return Rt.startSchema(t),Rt.addEndianness(t,e),Rt.addFields(t,i),Rt.addCustomMetadata(t,r),Rt.addFeatures(t,s),Rt.endSchema(t)}};class st{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsFooter(t,e){return(e||new st).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsFooter(t,e){return t.setPosition(t.position()+V),(e||new st).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Ue.V1}schema(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new St).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}dictionaries(t,e){const i=this.bb.__offset(this.bb_pos,8);return i?(e||new Li).__init(this.bb.__vector(this.bb_pos+i)+t*24,this.bb):null}dictionariesLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}recordBatches(t,e){const i=this.bb.__offset(this.bb_pos,10);return i?(e||new Li).__init(this.bb.__vector(this.bb_pos+i)+t*24,this.bb):null}recordBatchesLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__vector_len(this.bb_pos+t):0}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,12);return i?(e||new H).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+t*4),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startFooter(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,Ue.V1)}static addSchema(t,e){t.addFieldOffset(1,e,0)}static addDictionaries(t,e){t.addFieldOffset(2,e,0)}static startDictionariesVector(t,e){t.startVector(24,e,8)}static addRecordBatches(t,e){t.addFieldOffset(3,e,0)}static startRecordBatchesVector(t,e){t.startVector(24,e,8)}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endFooter(t){return t.endObject()}static finishFooterBuffer(t,e){t.finish(e)}static finishSizePrefixedFooterBuffer(t,e){t.finish(e,void 0,!0)}}class E{constructor(t=[],e,i){this.fields=t||[],this.metadata=e||new Map,i||(i=Ri(t)),this.dictionaries=i}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map(t=>t.name)}toString(){return`Schema<{ ${this.fields.map((t,e)=>`${e}: ${t}`).join(", ")} }>`}select(t){const e=new Set(t),i=this.fields.filter(r=>e.has(r.name));return new E(i,this.metadata)}selectAt(t){const e=t.map(i=>this.fields[i]).filter(Boolean);return new E(e,this.metadata)}assign(...t){const e=t[0]instanceof E?t[0]:Array.isArray(t[0])?new E(t[0]):new E(t),i=[...this.fields],r=mn(mn(new Map,this.metadata),e.metadata),s=e.fields.filter(a=>{const c=i.findIndex(u=>u.name===a.name);return~c?(i[c]=a.clone({metadata:mn(mn(new Map,i[c].metadata),a.metadata)}))&&!1:!0}),o=Ri(s,new Map);return new E([...i,...s],r,new Map([...this.dictionaries,...o]))}}E.prototype.fields=null;E.prototype.metadata=null;E.prototype.dictionaries=null;class k{constructor(t,e,i=!1,r){this.name=t,this.type=e,this.nullable=i,this.metadata=r||new Map}static new(...t){let[e,i,r,s]=t;return t[0]&&typeof t[0]=="object"&&({name:e}=t[0],i===void 0&&(i=t[0].type),r===void 0&&(r=t[0].nullable),s===void 0&&(s=t[0].metadata)),new k(`${e}`,i,r,s)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(...t){let[e,i,r,s]=t;return!t[0]||typeof t[0]!="object"?[e=this.name,i=this.type,r=this.nullable,s=this.metadata]=t:{name:e=this.name,type:i=this.type,nullable:r=this.nullable,metadata:s=this.metadata}=t[0],k.new(e,i,r,s)}}k.prototype.type=null;k.prototype.name=null;k.prototype.nullable=null;k.prototype.metadata=null;function mn(n,t){return new Map([...n||new Map,...t||new Map])}function Ri(n,t=new Map){for(let e=-1,i=n.length;++e<i;){const s=n[e].type;if(y.isDictionary(s)){if(!t.has(s.id))t.set(s.id,s.dictionary);else if(t.get(s.id)!==s.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}s.children&&s.children.length>0&&Ri(s.children,t)}return t}var jr=jt,Il=Po,Bl=Ee;class tn{constructor(t,e=at.V4,i,r){this.schema=t,this.version=e,i&&(this._recordBatches=i),r&&(this._dictionaryBatches=r)}static decode(t){t=new Bl(T(t));const e=st.getRootAsFooter(t),i=E.decode(e.schema());return new Al(i,e)}static encode(t){const e=new Il,i=E.encode(e,t.schema);st.startRecordBatchesVector(e,t.numRecordBatches);for(const o of[...t.recordBatches()].slice().reverse())ne.encode(e,o);const r=e.endVector();st.startDictionariesVector(e,t.numDictionaries);for(const o of[...t.dictionaryBatches()].slice().reverse())ne.encode(e,o);const s=e.endVector();return st.startFooter(e),st.addSchema(e,i),st.addVersion(e,at.V4),st.addRecordBatches(e,r),st.addDictionaries(e,s),st.finishFooterBuffer(e,st.endFooter(e)),e.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}*recordBatches(){for(let t,e=-1,i=this.numRecordBatches;++e<i;)(t=this.getRecordBatch(e))&&(yield t)}*dictionaryBatches(){for(let t,e=-1,i=this.numDictionaries;++e<i;)(t=this.getDictionaryBatch(e))&&(yield t)}getRecordBatch(t){return t>=0&&t<this.numRecordBatches&&this._recordBatches[t]||null}getDictionaryBatch(t){return t>=0&&t<this.numDictionaries&&this._dictionaryBatches[t]||null}}class Al extends tn{constructor(t,e){super(t,e.version()),this._footer=e}get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}getRecordBatch(t){if(t>=0&&t<this.numRecordBatches){const e=this._footer.recordBatches(t);if(e)return ne.decode(e)}return null}getDictionaryBatch(t){if(t>=0&&t<this.numDictionaries){const e=this._footer.dictionaries(t);if(e)return ne.decode(e)}return null}}class ne{constructor(t,e,i){this.metaDataLength=t,this.offset=typeof i=="number"?i:i.low,this.bodyLength=typeof e=="number"?e:e.low}static decode(t){return new ne(t.metaDataLength(),t.bodyLength(),t.offset())}static encode(t,e){const{metaDataLength:i}=e,r=new jr(e.offset,0),s=new jr(e.bodyLength,0);return Li.createBlock(t,r,i,s)}}const z=Object.freeze({done:!0,value:void 0});class zr{constructor(t){this._json=t}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}}class fr{tee(){return this._getDOMStream().tee()}pipe(t,e){return this._getNodeStream().pipe(t,e)}pipeTo(t,e){return this._getDOMStream().pipeTo(t,e)}pipeThrough(t,e){return this._getDOMStream().pipeThrough(t,e)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}class Ol extends fr{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise(t=>this._closedPromiseResolve=t)}get closed(){return this._closedPromise}cancel(t){return p(this,void 0,void 0,function*(){yield this.return(t)})}write(t){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(t):this.resolvers.shift().resolve({done:!1,value:t}))}abort(t){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:t}:this.resolvers.shift().reject({done:!0,value:t}))}close(){if(this._closedPromiseResolve){const{resolvers:t}=this;for(;t.length>0;)t.shift().resolve(z);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(t){return ht.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,t)}toNodeStream(t){return ht.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,t)}throw(t){return p(this,void 0,void 0,function*(){return yield this.abort(t),z})}return(t){return p(this,void 0,void 0,function*(){return yield this.close(),z})}read(t){return p(this,void 0,void 0,function*(){return(yield this.next(t,"read")).value})}peek(t){return p(this,void 0,void 0,function*(){return(yield this.next(t,"peek")).value})}next(...t){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise((e,i)=>{this.resolvers.push({resolve:e,reject:i})}):Promise.resolve(z)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}}class wn extends Ol{write(t){if((t=T(t)).byteLength>0)return super.write(t)}toString(t=!1){return t?Fi(this.toUint8Array(!0)):this.toUint8Array(!1).then(Fi)}toUint8Array(t=!1){return t?Lt(this._values)[0]:p(this,void 0,void 0,function*(){var e,i;const r=[];let s=0;try{for(var o=pe(this),a;a=yield o.next(),!a.done;){const c=a.value;r.push(c),s+=c.byteLength}}catch(c){e={error:c}}finally{try{a&&!a.done&&(i=o.return)&&(yield i.call(o))}finally{if(e)throw e.error}}return Lt(r,s)[0]})}}class Wn{constructor(t){t&&(this.source=new Fl(ht.fromIterable(t)))}[Symbol.iterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class Ce{constructor(t){t instanceof Ce?this.source=t.source:t instanceof wn?this.source=new ae(ht.fromAsyncIterable(t)):ws(t)?this.source=new ae(ht.fromNodeStream(t)):Xi(t)?this.source=new ae(ht.fromDOMStream(t)):vs(t)?this.source=new ae(ht.fromDOMStream(t.body)):cn(t)?this.source=new ae(ht.fromIterable(t)):Qt(t)?this.source=new ae(ht.fromAsyncIterable(t)):ke(t)&&(this.source=new ae(ht.fromAsyncIterable(t)))}[Symbol.asyncIterator](){return this}next(t){return this.source.next(t)}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}get closed(){return this.source.closed}cancel(t){return this.source.cancel(t)}peek(t){return this.source.peek(t)}read(t){return this.source.read(t)}}class Fl{constructor(t){this.source=t}cancel(t){this.return(t)}peek(t){return this.next(t,"peek").value}read(t){return this.next(t,"read").value}next(t,e="read"){return this.source.next({cmd:e,size:t})}throw(t){return Object.create(this.source.throw&&this.source.throw(t)||z)}return(t){return Object.create(this.source.return&&this.source.return(t)||z)}}class ae{constructor(t){this.source=t,this._closedPromise=new Promise(e=>this._closedPromiseResolve=e)}cancel(t){return p(this,void 0,void 0,function*(){yield this.return(t)})}get closed(){return this._closedPromise}read(t){return p(this,void 0,void 0,function*(){return(yield this.next(t,"read")).value})}peek(t){return p(this,void 0,void 0,function*(){return(yield this.next(t,"peek")).value})}next(t,e="read"){return p(this,void 0,void 0,function*(){return yield this.source.next({cmd:e,size:t})})}throw(t){return p(this,void 0,void 0,function*(){const e=this.source.throw&&(yield this.source.throw(t))||z;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)})}return(t){return p(this,void 0,void 0,function*(){const e=this.source.return&&(yield this.source.return(t))||z;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(e)})}}class $r extends Wn{constructor(t,e){super(),this.position=0,this.buffer=T(t),this.size=typeof e>"u"?this.buffer.byteLength:e}readInt32(t){const{buffer:e,byteOffset:i}=this.readAt(t,4);return new DataView(e,i).getInt32(0,!0)}seek(t){return this.position=Math.min(t,this.size),t<this.size}read(t){const{buffer:e,size:i,position:r}=this;return e&&r<i?(typeof t!="number"&&(t=Number.POSITIVE_INFINITY),this.position=Math.min(i,r+Math.min(i-r,t)),e.subarray(r,this.position)):null}readAt(t,e){const i=this.buffer,r=Math.min(this.size,t+e);return i?i.subarray(t,r):new Uint8Array(e)}close(){this.buffer&&(this.buffer=null)}throw(t){return this.close(),{done:!0,value:t}}return(t){return this.close(),{done:!0,value:t}}}class Hn extends Ce{constructor(t,e){super(),this.position=0,this._handle=t,typeof e=="number"?this.size=e:this._pending=p(this,void 0,void 0,function*(){this.size=(yield t.stat()).size,delete this._pending})}readInt32(t){return p(this,void 0,void 0,function*(){const{buffer:e,byteOffset:i}=yield this.readAt(t,4);return new DataView(e,i).getInt32(0,!0)})}seek(t){return p(this,void 0,void 0,function*(){return this._pending&&(yield this._pending),this.position=Math.min(t,this.size),t<this.size})}read(t){return p(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:e,size:i,position:r}=this;if(e&&r<i){typeof t!="number"&&(t=Number.POSITIVE_INFINITY);let s=r,o=0,a=0;const c=Math.min(i,s+Math.min(i-s,t)),u=new Uint8Array(Math.max(0,(this.position=c)-s));for(;(s+=a)<c&&(o+=a)<u.byteLength;)({bytesRead:a}=yield e.read(u,o,u.byteLength-o,s));return u}return null})}readAt(t,e){return p(this,void 0,void 0,function*(){this._pending&&(yield this._pending);const{_handle:i,size:r}=this;if(i&&t+e<r){const s=Math.min(r,t+e),o=new Uint8Array(s-t);return(yield i.read(o,0,e,t)).buffer}return new Uint8Array(e)})}close(){return p(this,void 0,void 0,function*(){const t=this._handle;this._handle=null,t&&(yield t.close())})}throw(t){return p(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:t}})}return(t){return p(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:t}})}}const Dl=65536;function Ae(n){return n<0&&(n=4294967295+n+1),`0x${n.toString(16)}`}const Ve=8,pr=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8];class jo{constructor(t){this.buffer=t}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(t){const e=new Uint32Array([this.buffer[1]>>>16,this.buffer[1]&65535,this.buffer[0]>>>16,this.buffer[0]&65535]),i=new Uint32Array([t.buffer[1]>>>16,t.buffer[1]&65535,t.buffer[0]>>>16,t.buffer[0]&65535]);let r=e[3]*i[3];this.buffer[0]=r&65535;let s=r>>>16;return r=e[2]*i[3],s+=r,r=e[3]*i[2]>>>0,s+=r,this.buffer[0]+=s<<16,this.buffer[1]=s>>>0<r?Dl:0,this.buffer[1]+=s>>>16,this.buffer[1]+=e[1]*i[3]+e[2]*i[2]+e[3]*i[1],this.buffer[1]+=e[0]*i[3]+e[1]*i[2]+e[2]*i[1]+e[3]*i[0]<<16,this}_plus(t){const e=this.buffer[0]+t.buffer[0]>>>0;this.buffer[1]+=t.buffer[1],e<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=e}lessThan(t){return this.buffer[1]<t.buffer[1]||this.buffer[1]===t.buffer[1]&&this.buffer[0]<t.buffer[0]}equals(t){return this.buffer[1]===t.buffer[1]&&this.buffer[0]==t.buffer[0]}greaterThan(t){return t.lessThan(this)}hex(){return`${Ae(this.buffer[1])} ${Ae(this.buffer[0])}`}}class U extends jo{times(t){return this._times(t),this}plus(t){return this._plus(t),this}static from(t,e=new Uint32Array(2)){return U.fromString(typeof t=="string"?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(2)){return U.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(2)){const i=t.length,r=new U(e);for(let s=0;s<i;){const o=Ve<i-s?Ve:i-s,a=new U(new Uint32Array([Number.parseInt(t.slice(s,s+o),10),0])),c=new U(new Uint32Array([pr[o],0]));r.times(c),r.plus(a),s+=o}return r}static convertArray(t){const e=new Uint32Array(t.length*2);for(let i=-1,r=t.length;++i<r;)U.from(t[i],new Uint32Array(e.buffer,e.byteOffset+2*i*4,2));return e}static multiply(t,e){return new U(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new U(new Uint32Array(t.buffer)).plus(e)}}class Z extends jo{negate(){return this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[0]==0&&++this.buffer[1],this}times(t){return this._times(t),this}plus(t){return this._plus(t),this}lessThan(t){const e=this.buffer[1]<<0,i=t.buffer[1]<<0;return e<i||e===i&&this.buffer[0]<t.buffer[0]}static from(t,e=new Uint32Array(2)){return Z.fromString(typeof t=="string"?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(2)){return Z.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(2)){const i=t.startsWith("-"),r=t.length,s=new Z(e);for(let o=i?1:0;o<r;){const a=Ve<r-o?Ve:r-o,c=new Z(new Uint32Array([Number.parseInt(t.slice(o,o+a),10),0])),u=new Z(new Uint32Array([pr[a],0]));s.times(u),s.plus(c),o+=a}return i?s.negate():s}static convertArray(t){const e=new Uint32Array(t.length*2);for(let i=-1,r=t.length;++i<r;)Z.from(t[i],new Uint32Array(e.buffer,e.byteOffset+2*i*4,2));return e}static multiply(t,e){return new Z(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new Z(new Uint32Array(t.buffer)).plus(e)}}class It{constructor(t){this.buffer=t}high(){return new Z(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new Z(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],this.buffer[0]==0&&++this.buffer[1],this.buffer[1]==0&&++this.buffer[2],this.buffer[2]==0&&++this.buffer[3],this}times(t){const e=new U(new Uint32Array([this.buffer[3],0])),i=new U(new Uint32Array([this.buffer[2],0])),r=new U(new Uint32Array([this.buffer[1],0])),s=new U(new Uint32Array([this.buffer[0],0])),o=new U(new Uint32Array([t.buffer[3],0])),a=new U(new Uint32Array([t.buffer[2],0])),c=new U(new Uint32Array([t.buffer[1],0])),u=new U(new Uint32Array([t.buffer[0],0]));let d=U.multiply(s,u);this.buffer[0]=d.low();const h=new U(new Uint32Array([d.high(),0]));return d=U.multiply(r,u),h.plus(d),d=U.multiply(s,c),h.plus(d),this.buffer[1]=h.low(),this.buffer[3]=h.lessThan(d)?1:0,this.buffer[2]=h.high(),new U(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(U.multiply(i,u)).plus(U.multiply(r,c)).plus(U.multiply(s,a)),this.buffer[3]+=U.multiply(e,u).plus(U.multiply(i,c)).plus(U.multiply(r,a)).plus(U.multiply(s,o)).low(),this}plus(t){const e=new Uint32Array(4);return e[3]=this.buffer[3]+t.buffer[3]>>>0,e[2]=this.buffer[2]+t.buffer[2]>>>0,e[1]=this.buffer[1]+t.buffer[1]>>>0,e[0]=this.buffer[0]+t.buffer[0]>>>0,e[0]<this.buffer[0]>>>0&&++e[1],e[1]<this.buffer[1]>>>0&&++e[2],e[2]<this.buffer[2]>>>0&&++e[3],this.buffer[3]=e[3],this.buffer[2]=e[2],this.buffer[1]=e[1],this.buffer[0]=e[0],this}hex(){return`${Ae(this.buffer[3])} ${Ae(this.buffer[2])} ${Ae(this.buffer[1])} ${Ae(this.buffer[0])}`}static multiply(t,e){return new It(new Uint32Array(t.buffer)).times(e)}static add(t,e){return new It(new Uint32Array(t.buffer)).plus(e)}static from(t,e=new Uint32Array(4)){return It.fromString(typeof t=="string"?t:t.toString(),e)}static fromNumber(t,e=new Uint32Array(4)){return It.fromString(t.toString(),e)}static fromString(t,e=new Uint32Array(4)){const i=t.startsWith("-"),r=t.length,s=new It(e);for(let o=i?1:0;o<r;){const a=Ve<r-o?Ve:r-o,c=new It(new Uint32Array([Number.parseInt(t.slice(o,o+a),10),0,0,0])),u=new It(new Uint32Array([pr[a],0,0,0]));s.times(u),s.plus(c),o+=a}return i?s.negate():s}static convertArray(t){const e=new Uint32Array(t.length*4);for(let i=-1,r=t.length;++i<r;)It.from(t[i],new Uint32Array(e.buffer,e.byteOffset+4*4*i,4));return e}}class zo extends D{constructor(t,e,i,r){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=t,this.nodes=e,this.buffers=i,this.dictionaries=r}visit(t){return super.visit(t instanceof k?t.type:t)}visitNull(t,{length:e}=this.nextFieldNode()){return F({type:t,length:e})}visitBool(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitInt(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitFloat(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitUtf8(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitBinary(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),data:this.readData(t)})}visitFixedSizeBinary(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitDate(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitTimestamp(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitTime(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitDecimal(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitList(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}visitStruct(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),children:this.visitMany(t.children)})}visitUnion(t){return t.mode===ct.Sparse?this.visitSparseUnion(t):this.visitDenseUnion(t)}visitDenseUnion(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),typeIds:this.readTypeIds(t),valueOffsets:this.readOffsets(t),children:this.visitMany(t.children)})}visitSparseUnion(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),typeIds:this.readTypeIds(t),children:this.visitMany(t.children)})}visitDictionary(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t.indices),dictionary:this.readDictionary(t)})}visitInterval(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),data:this.readData(t)})}visitFixedSizeList(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),child:this.visit(t.children[0])})}visitMap(t,{length:e,nullCount:i}=this.nextFieldNode()){return F({type:t,length:e,nullCount:i,nullBitmap:this.readNullBitmap(t,i),valueOffsets:this.readOffsets(t),child:this.visit(t.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(t,e,i=this.nextBufferRange()){return e>0&&this.readData(t,i)||new Uint8Array(0)}readOffsets(t,e){return this.readData(t,e)}readTypeIds(t,e){return this.readData(t,e)}readData(t,{length:e,offset:i}=this.nextBufferRange()){return this.bytes.subarray(i,i+e)}readDictionary(t){return this.dictionaries.get(t.id)}}class Tl extends zo{constructor(t,e,i,r){super(new Uint8Array(0),e,i,r),this.sources=t}readNullBitmap(t,e,{offset:i}=this.nextBufferRange()){return e<=0?new Uint8Array(0):Cn(this.sources[i])}readOffsets(t,{offset:e}=this.nextBufferRange()){return C(Uint8Array,C(Int32Array,this.sources[e]))}readTypeIds(t,{offset:e}=this.nextBufferRange()){return C(Uint8Array,C(t.ArrayType,this.sources[e]))}readData(t,{offset:e}=this.nextBufferRange()){const{sources:i}=this;return y.isTimestamp(t)||(y.isInt(t)||y.isTime(t))&&t.bitWidth===64||y.isDate(t)&&t.unit===Yt.MILLISECOND?C(Uint8Array,Z.convertArray(i[e])):y.isDecimal(t)?C(Uint8Array,It.convertArray(i[e])):y.isBinary(t)||y.isFixedSizeBinary(t)?Ml(i[e]):y.isBool(t)?Cn(i[e]):y.isUtf8(t)?Qi(i[e].join("")):C(Uint8Array,C(t.ArrayType,i[e].map(r=>+r)))}}function Ml(n){const t=n.join(""),e=new Uint8Array(t.length/2);for(let i=0;i<t.length;i+=2)e[i>>1]=Number.parseInt(t.slice(i,i+2),16);return e}class _ extends D{compareSchemas(t,e){return t===e||e instanceof t.constructor&&this.compareManyFields(t.fields,e.fields)}compareManyFields(t,e){return t===e||Array.isArray(t)&&Array.isArray(e)&&t.length===e.length&&t.every((i,r)=>this.compareFields(i,e[r]))}compareFields(t,e){return t===e||e instanceof t.constructor&&t.name===e.name&&t.nullable===e.nullable&&this.visit(t.type,e.type)}}function rt(n,t){return t instanceof n.constructor}function ln(n,t){return n===t||rt(n,t)}function Jt(n,t){return n===t||rt(n,t)&&n.bitWidth===t.bitWidth&&n.isSigned===t.isSigned}function fi(n,t){return n===t||rt(n,t)&&n.precision===t.precision}function Nl(n,t){return n===t||rt(n,t)&&n.byteWidth===t.byteWidth}function yr(n,t){return n===t||rt(n,t)&&n.unit===t.unit}function un(n,t){return n===t||rt(n,t)&&n.unit===t.unit&&n.timezone===t.timezone}function dn(n,t){return n===t||rt(n,t)&&n.unit===t.unit&&n.bitWidth===t.bitWidth}function Ll(n,t){return n===t||rt(n,t)&&n.children.length===t.children.length&&ie.compareManyFields(n.children,t.children)}function El(n,t){return n===t||rt(n,t)&&n.children.length===t.children.length&&ie.compareManyFields(n.children,t.children)}function mr(n,t){return n===t||rt(n,t)&&n.mode===t.mode&&n.typeIds.every((e,i)=>e===t.typeIds[i])&&ie.compareManyFields(n.children,t.children)}function Ul(n,t){return n===t||rt(n,t)&&n.id===t.id&&n.isOrdered===t.isOrdered&&ie.visit(n.indices,t.indices)&&ie.visit(n.dictionary,t.dictionary)}function br(n,t){return n===t||rt(n,t)&&n.unit===t.unit}function Rl(n,t){return n===t||rt(n,t)&&n.listSize===t.listSize&&n.children.length===t.children.length&&ie.compareManyFields(n.children,t.children)}function xl(n,t){return n===t||rt(n,t)&&n.keysSorted===t.keysSorted&&n.children.length===t.children.length&&ie.compareManyFields(n.children,t.children)}_.prototype.visitNull=ln;_.prototype.visitBool=ln;_.prototype.visitInt=Jt;_.prototype.visitInt8=Jt;_.prototype.visitInt16=Jt;_.prototype.visitInt32=Jt;_.prototype.visitInt64=Jt;_.prototype.visitUint8=Jt;_.prototype.visitUint16=Jt;_.prototype.visitUint32=Jt;_.prototype.visitUint64=Jt;_.prototype.visitFloat=fi;_.prototype.visitFloat16=fi;_.prototype.visitFloat32=fi;_.prototype.visitFloat64=fi;_.prototype.visitUtf8=ln;_.prototype.visitBinary=ln;_.prototype.visitFixedSizeBinary=Nl;_.prototype.visitDate=yr;_.prototype.visitDateDay=yr;_.prototype.visitDateMillisecond=yr;_.prototype.visitTimestamp=un;_.prototype.visitTimestampSecond=un;_.prototype.visitTimestampMillisecond=un;_.prototype.visitTimestampMicrosecond=un;_.prototype.visitTimestampNanosecond=un;_.prototype.visitTime=dn;_.prototype.visitTimeSecond=dn;_.prototype.visitTimeMillisecond=dn;_.prototype.visitTimeMicrosecond=dn;_.prototype.visitTimeNanosecond=dn;_.prototype.visitDecimal=ln;_.prototype.visitList=Ll;_.prototype.visitStruct=El;_.prototype.visitUnion=mr;_.prototype.visitDenseUnion=mr;_.prototype.visitSparseUnion=mr;_.prototype.visitDictionary=Ul;_.prototype.visitInterval=br;_.prototype.visitIntervalDayTime=br;_.prototype.visitIntervalYearMonth=br;_.prototype.visitFixedSizeList=Rl;_.prototype.visitMap=xl;const ie=new _;function xi(n,t){return ie.compareSchemas(n,t)}function wi(n,t){return Cl(n,t.map(e=>e.data.concat()))}function Cl(n,t){const e=[...n.fields],i=[],r={numBatches:t.reduce((h,A)=>Math.max(h,A.length),0)};let s=0,o=0,a=-1;const c=t.length;let u,d=[];for(;r.numBatches-- >0;){for(o=Number.POSITIVE_INFINITY,a=-1;++a<c;)d[a]=u=t[a].shift(),o=Math.min(o,u?u.length:o);Number.isFinite(o)&&(d=Vl(e,o,d,t,r),o>0&&(i[s++]=F({type:new G(e),length:o,nullCount:0,children:d.slice()})))}return[n=n.assign(e),i.map(h=>new tt(n,h))]}function Vl(n,t,e,i,r){var s;const o=(t+63&-64)>>3;for(let a=-1,c=i.length;++a<c;){const u=e[a],d=u==null?void 0:u.length;if(d>=t)d===t?e[a]=u:(e[a]=u.slice(0,t),r.numBatches=Math.max(r.numBatches,i[a].unshift(u.slice(t,d-t))));else{const h=n[a];n[a]=h.clone({nullable:!0}),e[a]=(s=u==null?void 0:u._changeLengthAndBackfillNullBitmap(t))!==null&&s!==void 0?s:F({type:h.type,length:t,nullCount:t,nullBitmap:new Uint8Array(o)})}}return e}var $o;class K{constructor(...t){var e,i;if(t.length===0)return this.batches=[],this.schema=new E([]),this._offsets=[0],this;let r,s;t[0]instanceof E&&(r=t.shift()),t[t.length-1]instanceof Uint32Array&&(s=t.pop());const o=c=>{if(c){if(c instanceof tt)return[c];if(c instanceof K)return c.batches;if(c instanceof P){if(c.type instanceof G)return[new tt(new E(c.type.children),c)]}else{if(Array.isArray(c))return c.flatMap(u=>o(u));if(typeof c[Symbol.iterator]=="function")return[...c].flatMap(u=>o(u));if(typeof c=="object"){const u=Object.keys(c),d=u.map(f=>new L([c[f]])),h=new E(u.map((f,$)=>new k(String(f),d[$].type))),[,A]=wi(h,d);return A.length===0?[new tt(c)]:A}}}return[]},a=t.flatMap(c=>o(c));if(r=(i=r??((e=a[0])===null||e===void 0?void 0:e.schema))!==null&&i!==void 0?i:new E([]),!(r instanceof E))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const c of a){if(!(c instanceof tt))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!xi(r,c.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=r,this.batches=a,this._offsets=s??Do(this.data)}get data(){return this.batches.map(({data:t})=>t)}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce((t,e)=>t+e.length,0)}get nullCount(){return this._nullCount===-1&&(this._nullCount=Fo(this.data)),this._nullCount}isValid(t){return!1}get(t){return null}set(t,e){}indexOf(t,e){return-1}getByteLength(t){return 0}[Symbol.iterator](){return this.batches.length>0?hr.visit(new L(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[
-  ${this.toArray().join(`,
-  `)}
-]`}concat(...t){const e=this.schema,i=this.data.concat(t.flatMap(({data:r})=>r));return new K(e,i.map(r=>new tt(e,r)))}slice(t,e){const i=this.schema;[t,e]=Ao({length:this.numRows},t,e);const r=To(this.data,this._offsets,t,e);return new K(i,r.map(s=>new tt(i,s)))}getChild(t){return this.getChildAt(this.schema.fields.findIndex(e=>e.name===t))}getChildAt(t){if(t>-1&&t<this.schema.fields.length){const e=this.data.map(i=>i.children[t]);if(e.length===0){const{type:i}=this.schema.fields[t],r=F({type:i,length:0,nullCount:0});e.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new L(e)}return null}setChild(t,e){var i;return this.setChildAt((i=this.schema.fields)===null||i===void 0?void 0:i.findIndex(r=>r.name===t),e)}setChildAt(t,e){let i=this.schema,r=[...this.batches];if(t>-1&&t<this.numCols){e||(e=new L([F({type:new te,length:this.numRows})]));const s=i.fields.slice(),o=s[t].clone({type:e.type}),a=this.schema.fields.map((c,u)=>this.getChildAt(u));[s[t],a[t]]=[o,e],[i,r]=wi(i,a)}return new K(i,r)}select(t){const e=this.schema.fields.reduce((i,r,s)=>i.set(r.name,s),new Map);return this.selectAt(t.map(i=>e.get(i)).filter(i=>i>-1))}selectAt(t){const e=this.schema.selectAt(t),i=this.batches.map(r=>r.selectAt(t));return new K(e,i)}assign(t){const e=this.schema.fields,[i,r]=t.schema.fields.reduce((a,c,u)=>{const[d,h]=a,A=e.findIndex(f=>f.name===c.name);return~A?h[A]=u:d.push(u),a},[[],[]]),s=this.schema.assign(t.schema),o=[...e.map((a,c)=>[c,r[c]]).map(([a,c])=>c===void 0?this.getChildAt(a):t.getChildAt(c)),...i.map(a=>t.getChildAt(a))].filter(Boolean);return new K(...wi(s,o))}}$o=Symbol.toStringTag;K[$o]=(n=>(n.schema=null,n.batches=[],n._offsets=new Uint32Array([0]),n._nullCount=-1,n[Symbol.isConcatSpreadable]=!0,n.isValid=Me(dr),n.get=Me(it.getVisitFn(l.Struct)),n.set=Mo(yt.getVisitFn(l.Struct)),n.indexOf=No(Vn.getVisitFn(l.Struct)),n.getByteLength=Me(Et.getVisitFn(l.Struct)),"Table"))(K.prototype);var Yo;let tt=class $e{constructor(...t){switch(t.length){case 2:{if([this.schema]=t,!(this.schema instanceof E))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=F({nullCount:0,type:new G(this.schema.fields),children:this.schema.fields.map(e=>F({type:e.type,nullCount:0}))})]=t,!(this.data instanceof P))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=Yr(this.schema,this.data.children);break}case 1:{const[e]=t,{fields:i,children:r,length:s}=Object.keys(e).reduce((c,u,d)=>(c.children[d]=e[u],c.length=Math.max(c.length,e[u].length),c.fields[d]=k.new({name:u,type:e[u].type,nullable:!0}),c),{length:0,fields:new Array,children:new Array}),o=new E(i),a=F({type:new G(i),length:s,children:r,nullCount:0});[this.schema,this.data]=Yr(o,a.children,s);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=Wo(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(t){return this.data.getValid(t)}get(t){return it.visit(this.data,t)}set(t,e){return yt.visit(this.data,t,e)}indexOf(t,e){return Vn.visit(this.data,t,e)}getByteLength(t){return Et.visit(this.data,t)}[Symbol.iterator](){return hr.visit(new L([this.data]))}toArray(){return[...this]}concat(...t){return new K(this.schema,[this,...t])}slice(t,e){const[i]=new L([this.data]).slice(t,e).data;return new $e(this.schema,i)}getChild(t){var e;return this.getChildAt((e=this.schema.fields)===null||e===void 0?void 0:e.findIndex(i=>i.name===t))}getChildAt(t){return t>-1&&t<this.schema.fields.length?new L([this.data.children[t]]):null}setChild(t,e){var i;return this.setChildAt((i=this.schema.fields)===null||i===void 0?void 0:i.findIndex(r=>r.name===t),e)}setChildAt(t,e){let i=this.schema,r=this.data;if(t>-1&&t<this.numCols){e||(e=new L([F({type:new te,length:this.numRows})]));const s=i.fields.slice(),o=r.children.slice(),a=s[t].clone({type:e.type});[s[t],o[t]]=[a,e.data[0]],i=new E(s,new Map(this.schema.metadata)),r=F({type:new G(s),children:o})}return new $e(i,r)}select(t){const e=this.schema.select(t),i=new G(e.fields),r=[];for(const s of t){const o=this.schema.fields.findIndex(a=>a.name===s);~o&&(r[o]=this.data.children[o])}return new $e(e,F({type:i,length:this.numRows,children:r}))}selectAt(t){const e=this.schema.selectAt(t),i=t.map(s=>this.data.children[s]).filter(Boolean),r=F({type:new G(e.fields),length:this.numRows,children:i});return new $e(e,r)}};Yo=Symbol.toStringTag;tt[Yo]=(n=>(n._nullCount=-1,n[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(tt.prototype);function Yr(n,t,e=t.reduce((i,r)=>Math.max(i,r.length),0)){var i;const r=[...n.fields],s=[...t],o=(e+63&-64)>>3;for(const[a,c]of n.fields.entries()){const u=t[a];(!u||u.length!==e)&&(r[a]=c.clone({nullable:!0}),s[a]=(i=u==null?void 0:u._changeLengthAndBackfillNullBitmap(e))!==null&&i!==void 0?i:F({type:c.type,length:e,nullCount:e,nullBitmap:new Uint8Array(o)}))}return[n.assign(r),F({type:new G(r),length:e,children:s})]}function Wo(n,t,e=new Map){for(let i=-1,r=n.length;++i<r;){const o=n[i].type,a=t[i];if(y.isDictionary(o)){if(!e.has(o.id))a.dictionary&&e.set(o.id,a.dictionary);else if(e.get(o.id)!==a.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}o.children&&o.children.length>0&&Wo(o.children,a.children,e)}return e}class gr extends tt{constructor(t){const e=t.fields.map(r=>F({type:r.type})),i=F({type:new G(t.fields),nullCount:0,children:e});super(t,i)}}var Jn;(function(n){n[n.BUFFER=0]="BUFFER"})(Jn||(Jn={}));var Kn;(function(n){n[n.LZ4_FRAME=0]="LZ4_FRAME",n[n.ZSTD=1]="ZSTD"})(Kn||(Kn={}));class Zt{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsBodyCompression(t,e){return(e||new Zt).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsBodyCompression(t,e){return t.setPosition(t.position()+V),(e||new Zt).__init(t.readInt32(t.position())+t.position(),t)}codec(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt8(this.bb_pos+t):Kn.LZ4_FRAME}method(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt8(this.bb_pos+t):Jn.BUFFER}static startBodyCompression(t){t.startObject(2)}static addCodec(t,e){t.addFieldInt8(0,e,Kn.LZ4_FRAME)}static addMethod(t,e){t.addFieldInt8(1,e,Jn.BUFFER)}static endBodyCompression(t){return t.endObject()}static createBodyCompression(t,e,i){return Zt.startBodyCompression(t),Zt.addCodec(t,e),Zt.addMethod(t,i),Zt.endBodyCompression(t)}}class Ho{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(t,e,i){return t.prep(8,16),t.writeInt64(i),t.writeInt64(e),t.offset()}}let Jo=class{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(t,e,i){return t.prep(8,16),t.writeInt64(i),t.writeInt64(e),t.offset()}},Vt=class Ci{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsRecordBatch(t,e){return(e||new Ci).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsRecordBatch(t,e){return t.setPosition(t.position()+V),(e||new Ci).__init(t.readInt32(t.position())+t.position(),t)}length(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}nodes(t,e){const i=this.bb.__offset(this.bb_pos,6);return i?(e||new Jo).__init(this.bb.__vector(this.bb_pos+i)+t*16,this.bb):null}nodesLength(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__vector_len(this.bb_pos+t):0}buffers(t,e){const i=this.bb.__offset(this.bb_pos,8);return i?(e||new Ho).__init(this.bb.__vector(this.bb_pos+i)+t*16,this.bb):null}buffersLength(){const t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__vector_len(this.bb_pos+t):0}compression(t){const e=this.bb.__offset(this.bb_pos,10);return e?(t||new Zt).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}static startRecordBatch(t){t.startObject(4)}static addLength(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addNodes(t,e){t.addFieldOffset(1,e,0)}static startNodesVector(t,e){t.startVector(16,e,8)}static addBuffers(t,e){t.addFieldOffset(2,e,0)}static startBuffersVector(t,e){t.startVector(16,e,8)}static addCompression(t,e){t.addFieldOffset(3,e,0)}static endRecordBatch(t){return t.endObject()}},Be=class Vi{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsDictionaryBatch(t,e){return(e||new Vi).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsDictionaryBatch(t,e){return t.setPosition(t.position()+V),(e||new Vi).__init(t.readInt32(t.position())+t.position(),t)}id(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}data(t){const e=this.bb.__offset(this.bb_pos,6);return e?(t||new Vt).__init(this.bb.__indirect(this.bb_pos+e),this.bb):null}isDelta(){const t=this.bb.__offset(this.bb_pos,8);return t?!!this.bb.readInt8(this.bb_pos+t):!1}static startDictionaryBatch(t){t.startObject(3)}static addId(t,e){t.addFieldInt64(0,e,t.createLong(0,0))}static addData(t,e){t.addFieldOffset(1,e,0)}static addIsDelta(t,e){t.addFieldInt8(2,+e,0)}static endDictionaryBatch(t){return t.endObject()}};var Gn;(function(n){n[n.NONE=0]="NONE",n[n.Schema=1]="Schema",n[n.DictionaryBatch=2]="DictionaryBatch",n[n.RecordBatch=3]="RecordBatch",n[n.Tensor=4]="Tensor",n[n.SparseTensor=5]="SparseTensor"})(Gn||(Gn={}));let Gt=class wt{constructor(){this.bb=null,this.bb_pos=0}__init(t,e){return this.bb_pos=t,this.bb=e,this}static getRootAsMessage(t,e){return(e||new wt).__init(t.readInt32(t.position())+t.position(),t)}static getSizePrefixedRootAsMessage(t,e){return t.setPosition(t.position()+V),(e||new wt).__init(t.readInt32(t.position())+t.position(),t)}version(){const t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):Ue.V1}headerType(){const t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readUint8(this.bb_pos+t):Gn.NONE}header(t){const e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__union(t,this.bb_pos+e):null}bodyLength(){const t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb_pos+t):this.bb.createLong(0,0)}customMetadata(t,e){const i=this.bb.__offset(this.bb_pos,12);return i?(e||new H).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+i)+t*4),this.bb):null}customMetadataLength(){const t=this.bb.__offset(this.bb_pos,12);return t?this.bb.__vector_len(this.bb_pos+t):0}static startMessage(t){t.startObject(5)}static addVersion(t,e){t.addFieldInt16(0,e,Ue.V1)}static addHeaderType(t,e){t.addFieldInt8(1,e,Gn.NONE)}static addHeader(t,e){t.addFieldOffset(2,e,0)}static addBodyLength(t,e){t.addFieldInt64(3,e,t.createLong(0,0))}static addCustomMetadata(t,e){t.addFieldOffset(4,e,0)}static createCustomMetadataVector(t,e){t.startVector(4,e.length,4);for(let i=e.length-1;i>=0;i--)t.addOffset(e[i]);return t.endVector()}static startCustomMetadataVector(t,e){t.startVector(4,e,4)}static endMessage(t){return t.endObject()}static finishMessageBuffer(t,e){t.finish(e)}static finishSizePrefixedMessageBuffer(t,e){t.finish(e,void 0,!0)}static createMessage(t,e,i,r,s,o){return wt.startMessage(t),wt.addVersion(t,e),wt.addHeaderType(t,i),wt.addHeader(t,r),wt.addBodyLength(t,s),wt.addCustomMetadata(t,o),wt.endMessage(t)}};var Pl=jt;class kl extends D{visit(t,e){return t==null||e==null?void 0:super.visit(t,e)}visitNull(t,e){return de.startNull(e),de.endNull(e)}visitInt(t,e){return ot.startInt(e),ot.addBitWidth(e,t.bitWidth),ot.addIsSigned(e,t.isSigned),ot.endInt(e)}visitFloat(t,e){return Dt.startFloatingPoint(e),Dt.addPrecision(e,t.precision),Dt.endFloatingPoint(e)}visitBinary(t,e){return ce.startBinary(e),ce.endBinary(e)}visitBool(t,e){return le.startBool(e),le.endBool(e)}visitUtf8(t,e){return fe.startUtf8(e),fe.endUtf8(e)}visitDecimal(t,e){return Q.startDecimal(e),Q.addScale(e,t.scale),Q.addPrecision(e,t.precision),Q.addBitWidth(e,t.bitWidth),Q.endDecimal(e)}visitDate(t,e){return gn.startDate(e),gn.addUnit(e,t.unit),gn.endDate(e)}visitTime(t,e){return ft.startTime(e),ft.addUnit(e,t.unit),ft.addBitWidth(e,t.bitWidth),ft.endTime(e)}visitTimestamp(t,e){const i=t.timezone&&e.createString(t.timezone)||void 0;return pt.startTimestamp(e),pt.addUnit(e,t.unit),i!==void 0&&pt.addTimezone(e,i),pt.endTimestamp(e)}visitInterval(t,e){return Tt.startInterval(e),Tt.addUnit(e,t.unit),Tt.endInterval(e)}visitList(t,e){return ue.startList(e),ue.endList(e)}visitStruct(t,e){return he.startStruct_(e),he.endStruct_(e)}visitUnion(t,e){X.startTypeIdsVector(e,t.typeIds.length);const i=X.createTypeIdsVector(e,t.typeIds);return X.startUnion(e),X.addMode(e,t.mode),X.addTypeIds(e,i),X.endUnion(e)}visitDictionary(t,e){const i=this.visit(t.indices,e);return kt.startDictionaryEncoding(e),kt.addId(e,new Pl(t.id,0)),kt.addIsOrdered(e,t.isOrdered),i!==void 0&&kt.addIndexType(e,i),kt.endDictionaryEncoding(e)}visitFixedSizeBinary(t,e){return Ot.startFixedSizeBinary(e),Ot.addByteWidth(e,t.byteWidth),Ot.endFixedSizeBinary(e)}visitFixedSizeList(t,e){return Ft.startFixedSizeList(e),Ft.addListSize(e,t.listSize),Ft.endFixedSizeList(e)}visitMap(t,e){return _n.startMap(e),_n.addKeysSorted(e,t.keysSorted),_n.endMap(e)}}const Si=new kl;function jl(n,t=new Map){return new E($l(n,t),Sn(n.customMetadata),t)}function Ko(n){return new lt(n.count,Go(n.columns),qo(n.columns))}function zl(n){return new Ut(Ko(n.data),n.id,n.isDelta)}function $l(n,t){return(n.fields||[]).filter(Boolean).map(e=>k.fromJSON(e,t))}function Wr(n,t){return(n.children||[]).filter(Boolean).map(e=>k.fromJSON(e,t))}function Go(n){return(n||[]).reduce((t,e)=>[...t,new ge(e.count,Yl(e.VALIDITY)),...Go(e.children)],[])}function qo(n,t=[]){for(let e=-1,i=(n||[]).length;++e<i;){const r=n[e];r.VALIDITY&&t.push(new Nt(t.length,r.VALIDITY.length)),r.TYPE&&t.push(new Nt(t.length,r.TYPE.length)),r.OFFSET&&t.push(new Nt(t.length,r.OFFSET.length)),r.DATA&&t.push(new Nt(t.length,r.DATA.length)),t=qo(r.children,t)}return t}function Yl(n){return(n||[]).reduce((t,e)=>t+ +(e===0),0)}function Wl(n,t){let e,i,r,s,o,a;return!t||!(s=n.dictionary)?(o=Jr(n,Wr(n,t)),r=new k(n.name,o,n.nullable,Sn(n.customMetadata))):t.has(e=s.id)?(i=(i=s.indexType)?Hr(i):new Ze,a=new Le(t.get(e),i,e,s.isOrdered),r=new k(n.name,a,n.nullable,Sn(n.customMetadata))):(i=(i=s.indexType)?Hr(i):new Ze,t.set(e,o=Jr(n,Wr(n,t))),a=new Le(o,i,e,s.isOrdered),r=new k(n.name,a,n.nullable,Sn(n.customMetadata))),r||null}function Sn(n){return new Map(Object.entries(n||{}))}function Hr(n){return new ee(n.isSigned,n.bitWidth)}function Jr(n,t){const e=n.type.name;switch(e){case"NONE":return new te;case"null":return new te;case"binary":return new An;case"utf8":return new On;case"bool":return new Fn;case"list":return new Ln((t||[])[0]);case"struct":return new G(t||[]);case"struct_":return new G(t||[])}switch(e){case"int":{const i=n.type;return new ee(i.isSigned,i.bitWidth)}case"floatingpoint":{const i=n.type;return new Qe(et[i.precision])}case"decimal":{const i=n.type;return new Dn(i.scale,i.precision,i.bitWidth)}case"date":{const i=n.type;return new Tn(Yt[i.unit])}case"time":{const i=n.type;return new Xe(M[i.unit],i.bitWidth)}case"timestamp":{const i=n.type;return new Mn(M[i.unit],i.timezone)}case"interval":{const i=n.type;return new Nn(Xt[i.unit])}case"union":{const i=n.type;return new En(ct[i.mode],i.typeIds||[],t||[])}case"fixedsizebinary":{const i=n.type;return new Un(i.byteWidth)}case"fixedsizelist":{const i=n.type;return new Rn(i.listSize,(t||[])[0])}case"map":{const i=n.type;return new xn((t||[])[0],i.keysSorted)}}throw new Error(`Unrecognized type: "${e}"`)}var me=jt,Hl=Po,Jl=Ee;class q{constructor(t,e,i,r){this._version=e,this._headerType=i,this.body=new Uint8Array(0),r&&(this._createHeader=()=>r),this._bodyLength=typeof t=="number"?t:t.low}static fromJSON(t,e){const i=new q(0,at.V4,e);return i._createHeader=Kl(t,e),i}static decode(t){t=new Jl(T(t));const e=Gt.getRootAsMessage(t),i=e.bodyLength(),r=e.version(),s=e.headerType(),o=new q(i,r,s);return o._createHeader=Gl(e,s),o}static encode(t){const e=new Hl;let i=-1;return t.isSchema()?i=E.encode(e,t.header()):t.isRecordBatch()?i=lt.encode(e,t.header()):t.isDictionaryBatch()&&(i=Ut.encode(e,t.header())),Gt.startMessage(e),Gt.addVersion(e,at.V4),Gt.addHeader(e,i),Gt.addHeaderType(e,t.headerType),Gt.addBodyLength(e,new me(t.bodyLength,0)),Gt.finishMessageBuffer(e,Gt.endMessage(e)),e.asUint8Array()}static from(t,e=0){if(t instanceof E)return new q(0,at.V4,N.Schema,t);if(t instanceof lt)return new q(e,at.V4,N.RecordBatch,t);if(t instanceof Ut)return new q(e,at.V4,N.DictionaryBatch,t);throw new Error(`Unrecognized Message header: ${t}`)}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===N.Schema}isRecordBatch(){return this.headerType===N.RecordBatch}isDictionaryBatch(){return this.headerType===N.DictionaryBatch}}class lt{constructor(t,e,i){this._nodes=e,this._buffers=i,this._length=typeof t=="number"?t:t.low}get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}}class Ut{constructor(t,e,i=!1){this._data=t,this._isDelta=i,this._id=typeof e=="number"?e:e.low}get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}}class Nt{constructor(t,e){this.offset=typeof t=="number"?t:t.low,this.length=typeof e=="number"?e:e.low}}class ge{constructor(t,e){this.length=typeof t=="number"?t:t.low,this.nullCount=typeof e=="number"?e:e.low}}function Kl(n,t){return()=>{switch(t){case N.Schema:return E.fromJSON(n);case N.RecordBatch:return lt.fromJSON(n);case N.DictionaryBatch:return Ut.fromJSON(n)}throw new Error(`Unrecognized Message type: { name: ${N[t]}, type: ${t} }`)}}function Gl(n,t){return()=>{switch(t){case N.Schema:return E.decode(n.header(new St));case N.RecordBatch:return lt.decode(n.header(new Vt),n.version());case N.DictionaryBatch:return Ut.decode(n.header(new Be),n.version())}throw new Error(`Unrecognized Message type: { name: ${N[t]}, type: ${t} }`)}}k.encode=ou;k.decode=ru;k.fromJSON=Wl;E.encode=su;E.decode=ql;E.fromJSON=jl;lt.encode=au;lt.decode=Zl;lt.fromJSON=Ko;Ut.encode=cu;Ut.decode=Ql;Ut.fromJSON=zl;ge.encode=lu;ge.decode=tu;Nt.encode=uu;Nt.decode=Xl;function ql(n,t=new Map){const e=iu(n,t);return new E(e,In(n),t)}function Zl(n,t=at.V4){if(n.compression()!==null)throw new Error("Record batch compression not implemented");return new lt(n.length(),eu(n),nu(n,t))}function Ql(n,t=at.V4){return new Ut(lt.decode(n.data(),t),n.id(),n.isDelta())}function Xl(n){return new Nt(n.offset(),n.length())}function tu(n){return new ge(n.length(),n.nullCount())}function eu(n){const t=[];for(let e,i=-1,r=-1,s=n.nodesLength();++i<s;)(e=n.nodes(i))&&(t[++r]=ge.decode(e));return t}function nu(n,t){const e=[];for(let i,r=-1,s=-1,o=n.buffersLength();++r<o;)(i=n.buffers(r))&&(t<at.V4&&(i.bb_pos+=8*(r+1)),e[++s]=Nt.decode(i));return e}function iu(n,t){const e=[];for(let i,r=-1,s=-1,o=n.fieldsLength();++r<o;)(i=n.fields(r))&&(e[++s]=k.decode(i,t));return e}function Kr(n,t){const e=[];for(let i,r=-1,s=-1,o=n.childrenLength();++r<o;)(i=n.children(r))&&(e[++s]=k.decode(i,t));return e}function ru(n,t){let e,i,r,s,o,a;return!t||!(a=n.dictionary())?(r=qr(n,Kr(n,t)),i=new k(n.name(),r,n.nullable(),In(n))):t.has(e=a.id().low)?(s=(s=a.indexType())?Gr(s):new Ze,o=new Le(t.get(e),s,e,a.isOrdered()),i=new k(n.name(),o,n.nullable(),In(n))):(s=(s=a.indexType())?Gr(s):new Ze,t.set(e,r=qr(n,Kr(n,t))),o=new Le(r,s,e,a.isOrdered()),i=new k(n.name(),o,n.nullable(),In(n))),i||null}function In(n){const t=new Map;if(n)for(let e,i,r=-1,s=Math.trunc(n.customMetadataLength());++r<s;)(e=n.customMetadata(r))&&(i=e.key())!=null&&t.set(i,e.value());return t}function Gr(n){return new ee(n.isSigned(),n.bitWidth())}function qr(n,t){const e=n.typeType();switch(e){case j.NONE:return new te;case j.Null:return new te;case j.Binary:return new An;case j.Utf8:return new On;case j.Bool:return new Fn;case j.List:return new Ln((t||[])[0]);case j.Struct_:return new G(t||[])}switch(e){case j.Int:{const i=n.type(new ot);return new ee(i.isSigned(),i.bitWidth())}case j.FloatingPoint:{const i=n.type(new Dt);return new Qe(i.precision())}case j.Decimal:{const i=n.type(new Q);return new Dn(i.scale(),i.precision(),i.bitWidth())}case j.Date:{const i=n.type(new gn);return new Tn(i.unit())}case j.Time:{const i=n.type(new ft);return new Xe(i.unit(),i.bitWidth())}case j.Timestamp:{const i=n.type(new pt);return new Mn(i.unit(),i.timezone())}case j.Interval:{const i=n.type(new Tt);return new Nn(i.unit())}case j.Union:{const i=n.type(new X);return new En(i.mode(),i.typeIdsArray()||[],t||[])}case j.FixedSizeBinary:{const i=n.type(new Ot);return new Un(i.byteWidth())}case j.FixedSizeList:{const i=n.type(new Ft);return new Rn(i.listSize(),(t||[])[0])}case j.Map:{const i=n.type(new _n);return new xn((t||[])[0],i.keysSorted())}}throw new Error(`Unrecognized type: "${j[e]}" (${e})`)}function su(n,t){const e=t.fields.map(s=>k.encode(n,s));St.startFieldsVector(n,e.length);const i=St.createFieldsVector(n,e),r=t.metadata&&t.metadata.size>0?St.createCustomMetadataVector(n,[...t.metadata].map(([s,o])=>{const a=n.createString(`${s}`),c=n.createString(`${o}`);return H.startKeyValue(n),H.addKey(n,a),H.addValue(n,c),H.endKeyValue(n)})):-1;return St.startSchema(n),St.addFields(n,i),St.addEndianness(n,du?Re.Little:Re.Big),r!==-1&&St.addCustomMetadata(n,r),St.endSchema(n)}function ou(n,t){let e=-1,i=-1,r=-1;const s=t.type;let o=t.typeId;y.isDictionary(s)?(o=s.dictionary.typeId,r=Si.visit(s,n),i=Si.visit(s.dictionary,n)):i=Si.visit(s,n);const a=(s.children||[]).map(d=>k.encode(n,d)),c=dt.createChildrenVector(n,a),u=t.metadata&&t.metadata.size>0?dt.createCustomMetadataVector(n,[...t.metadata].map(([d,h])=>{const A=n.createString(`${d}`),f=n.createString(`${h}`);return H.startKeyValue(n),H.addKey(n,A),H.addValue(n,f),H.endKeyValue(n)})):-1;return t.name&&(e=n.createString(t.name)),dt.startField(n),dt.addType(n,i),dt.addTypeType(n,o),dt.addChildren(n,c),dt.addNullable(n,!!t.nullable),e!==-1&&dt.addName(n,e),r!==-1&&dt.addDictionary(n,r),u!==-1&&dt.addCustomMetadata(n,u),dt.endField(n)}function au(n,t){const e=t.nodes||[],i=t.buffers||[];Vt.startNodesVector(n,e.length);for(const o of e.slice().reverse())ge.encode(n,o);const r=n.endVector();Vt.startBuffersVector(n,i.length);for(const o of i.slice().reverse())Nt.encode(n,o);const s=n.endVector();return Vt.startRecordBatch(n),Vt.addLength(n,new me(t.length,0)),Vt.addNodes(n,r),Vt.addBuffers(n,s),Vt.endRecordBatch(n)}function cu(n,t){const e=lt.encode(n,t.data);return Be.startDictionaryBatch(n),Be.addId(n,new me(t.id,0)),Be.addIsDelta(n,t.isDelta),Be.addData(n,e),Be.endDictionaryBatch(n)}function lu(n,t){return Jo.createFieldNode(n,new me(t.length,0),new me(t.nullCount,0))}function uu(n,t){return Ho.createBuffer(n,new me(t.offset,0),new me(t.length,0))}const du=(()=>{const n=new ArrayBuffer(2);return new DataView(n).setInt16(0,256,!0),new Int16Array(n)[0]===256})(),_r=n=>`Expected ${N[n]} Message in stream, but was null or length 0.`,vr=n=>`Header pointer of flatbuffer-encoded ${N[n]} Message is null or length 0.`,Zo=(n,t)=>`Expected to read ${n} metadata bytes, but only read ${t}.`,Qo=(n,t)=>`Expected to read ${n} bytes for message body, but only read ${t}.`;class Xo{constructor(t){this.source=t instanceof Wn?t:new Wn(t)}[Symbol.iterator](){return this}next(){let t;return(t=this.readMetadataLength()).done||t.value===-1&&(t=this.readMetadataLength()).done||(t=this.readMetadata(t.value)).done?z:t}throw(t){return this.source.throw(t)}return(t){return this.source.return(t)}readMessage(t){let e;if((e=this.next()).done)return null;if(t!=null&&e.value.headerType!==t)throw new Error(_r(t));return e.value}readMessageBody(t){if(t<=0)return new Uint8Array(0);const e=T(this.source.read(t));if(e.byteLength<t)throw new Error(Qo(t,e.byteLength));return e.byteOffset%8===0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()}readSchema(t=!1){const e=N.Schema,i=this.readMessage(e),r=i==null?void 0:i.header();if(t&&!r)throw new Error(vr(e));return r}readMetadataLength(){const t=this.source.read(pi),e=t&&new Ee(t),i=(e==null?void 0:e.readInt32(0))||0;return{done:i===0,value:i}}readMetadata(t){const e=this.source.read(t);if(!e)return z;if(e.byteLength<t)throw new Error(Zo(t,e.byteLength));return{done:!1,value:q.decode(e)}}}class hu{constructor(t,e){this.source=t instanceof Ce?t:_s(t)?new Hn(t,e):new Ce(t)}[Symbol.asyncIterator](){return this}next(){return p(this,void 0,void 0,function*(){let t;return(t=yield this.readMetadataLength()).done||t.value===-1&&(t=yield this.readMetadataLength()).done||(t=yield this.readMetadata(t.value)).done?z:t})}throw(t){return p(this,void 0,void 0,function*(){return yield this.source.throw(t)})}return(t){return p(this,void 0,void 0,function*(){return yield this.source.return(t)})}readMessage(t){return p(this,void 0,void 0,function*(){let e;if((e=yield this.next()).done)return null;if(t!=null&&e.value.headerType!==t)throw new Error(_r(t));return e.value})}readMessageBody(t){return p(this,void 0,void 0,function*(){if(t<=0)return new Uint8Array(0);const e=T(yield this.source.read(t));if(e.byteLength<t)throw new Error(Qo(t,e.byteLength));return e.byteOffset%8===0&&e.byteOffset+e.byteLength<=e.buffer.byteLength?e:e.slice()})}readSchema(t=!1){return p(this,void 0,void 0,function*(){const e=N.Schema,i=yield this.readMessage(e),r=i==null?void 0:i.header();if(t&&!r)throw new Error(vr(e));return r})}readMetadataLength(){return p(this,void 0,void 0,function*(){const t=yield this.source.read(pi),e=t&&new Ee(t),i=(e==null?void 0:e.readInt32(0))||0;return{done:i===0,value:i}})}readMetadata(t){return p(this,void 0,void 0,function*(){const e=yield this.source.read(t);if(!e)return z;if(e.byteLength<t)throw new Error(Zo(t,e.byteLength));return{done:!1,value:q.decode(e)}})}}class fu extends Xo{constructor(t){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=t instanceof zr?t:new zr(t)}next(){const{_json:t}=this;if(!this._schema)return this._schema=!0,{done:!1,value:q.fromJSON(t.schema,N.Schema)};if(this._dictionaryIndex<t.dictionaries.length){const e=t.dictionaries[this._dictionaryIndex++];return this._body=e.data.columns,{done:!1,value:q.fromJSON(e,N.DictionaryBatch)}}if(this._batchIndex<t.batches.length){const e=t.batches[this._batchIndex++];return this._body=e.columns,{done:!1,value:q.fromJSON(e,N.RecordBatch)}}return this._body=[],z}readMessageBody(t){return e(this._body);function e(i){return(i||[]).reduce((r,s)=>[...r,...s.VALIDITY&&[s.VALIDITY]||[],...s.TYPE&&[s.TYPE]||[],...s.OFFSET&&[s.OFFSET]||[],...s.DATA&&[s.DATA]||[],...e(s.children)],[])}}readMessage(t){let e;if((e=this.next()).done)return null;if(t!=null&&e.value.headerType!==t)throw new Error(_r(t));return e.value}readSchema(){const t=N.Schema,e=this.readMessage(t),i=e==null?void 0:e.header();if(!e||!i)throw new Error(vr(t));return i}}const pi=4,Pi="ARROW1",en=new Uint8Array(Pi.length);for(let n=0;n<Pi.length;n+=1)en[n]=Pi.codePointAt(n);function wr(n,t=0){for(let e=-1,i=en.length;++e<i;)if(en[e]!==n[t+e])return!1;return!0}const hn=en.length,ta=hn+pi,pu=hn*2+pi;class zt extends fr{constructor(t){super(),this._impl=t}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(t){return this._impl.throw(t)}return(t){return this._impl.return(t)}cancel(){return this._impl.cancel()}reset(t){return this._impl.reset(t),this._DOMStream=void 0,this._nodeStream=void 0,this}open(t){const e=this._impl.open(t);return Qt(e)?e.then(()=>this):this}readRecordBatch(t){return this._impl.isFile()?this._impl.readRecordBatch(t):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return ht.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return ht.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}static from(t){return t instanceof zt?t:Di(t)?gu(t):_s(t)?wu(t):Qt(t)?p(this,void 0,void 0,function*(){return yield zt.from(yield t)}):vs(t)||Xi(t)||ws(t)||ke(t)?vu(new Ce(t)):_u(new Wn(t))}static readAll(t){return t instanceof zt?t.isSync()?Zr(t):Qr(t):Di(t)||ArrayBuffer.isView(t)||cn(t)||gs(t)?Zr(t):Qr(t)}}class qn extends zt{constructor(t){super(t),this._impl=t}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return Mt(this,arguments,function*(){yield B(yield*bn(pe(this[Symbol.iterator]())))})}}class Zn extends zt{constructor(t){super(t),this._impl=t}readAll(){var t,e;return p(this,void 0,void 0,function*(){const i=new Array;try{for(var r=pe(this),s;s=yield r.next(),!s.done;){const o=s.value;i.push(o)}}catch(o){t={error:o}}finally{try{s&&!s.done&&(e=r.return)&&(yield e.call(r))}finally{if(t)throw t.error}}return i})}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}}class ea extends qn{constructor(t){super(t),this._impl=t}}class yu extends Zn{constructor(t){super(t),this._impl=t}}class na{constructor(t=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=t}get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(t){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=t,this.dictionaries=new Map,this}_loadRecordBatch(t,e){const i=this._loadVectors(t,e,this.schema.fields),r=F({type:new G(this.schema.fields),length:t.length,children:i});return new tt(this.schema,r)}_loadDictionaryBatch(t,e){const{id:i,isDelta:r}=t,{dictionaries:s,schema:o}=this,a=s.get(i);if(r||!a){const c=o.dictionaries.get(i),u=this._loadVectors(t.data,e,[c]);return(a&&r?a.concat(new L(u)):new L(u)).memoize()}return a.memoize()}_loadVectors(t,e,i){return new zo(e,t.nodes,t.buffers,this.dictionaries).visitMany(i)}}class Qn extends na{constructor(t,e){super(e),this._reader=Di(t)?new fu(this._handle=t):new Xo(this._handle=t)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(t){return this.closed||(this.autoDestroy=ra(this,t),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(t):z}return(t){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(t):z}next(){if(this.closed)return z;let t;const{_reader:e}=this;for(;t=this._readNextMessageAndValidate();)if(t.isSchema())this.reset(t.header());else if(t.isRecordBatch()){this._recordBatchIndex++;const i=t.header(),r=e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(i,r)}}else if(t.isDictionaryBatch()){this._dictionaryIndex++;const i=t.header(),r=e.readMessageBody(t.bodyLength),s=this._loadDictionaryBatch(i,r);this.dictionaries.set(i.id,s)}return this.schema&&this._recordBatchIndex===0?(this._recordBatchIndex++,{done:!1,value:new gr(this.schema)}):this.return()}_readNextMessageAndValidate(t){return this._reader.readMessage(t)}}class Xn extends na{constructor(t,e){super(e),this._reader=new hu(this._handle=t)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return p(this,void 0,void 0,function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)})}open(t){return p(this,void 0,void 0,function*(){return this.closed||(this.autoDestroy=ra(this,t),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this})}throw(t){return p(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(t):z})}return(t){return p(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(t):z})}next(){return p(this,void 0,void 0,function*(){if(this.closed)return z;let t;const{_reader:e}=this;for(;t=yield this._readNextMessageAndValidate();)if(t.isSchema())yield this.reset(t.header());else if(t.isRecordBatch()){this._recordBatchIndex++;const i=t.header(),r=yield e.readMessageBody(t.bodyLength);return{done:!1,value:this._loadRecordBatch(i,r)}}else if(t.isDictionaryBatch()){this._dictionaryIndex++;const i=t.header(),r=yield e.readMessageBody(t.bodyLength),s=this._loadDictionaryBatch(i,r);this.dictionaries.set(i.id,s)}return this.schema&&this._recordBatchIndex===0?(this._recordBatchIndex++,{done:!1,value:new gr(this.schema)}):yield this.return()})}_readNextMessageAndValidate(t){return p(this,void 0,void 0,function*(){return yield this._reader.readMessage(t)})}}class ia extends Qn{constructor(t,e){super(t instanceof $r?t:new $r(t),e)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isSync(){return!0}isFile(){return!0}open(t){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(const e of this._footer.dictionaryBatches())e&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(t)}readRecordBatch(t){var e;if(this.closed)return null;this._footer||this.open();const i=(e=this._footer)===null||e===void 0?void 0:e.getRecordBatch(t);if(i&&this._handle.seek(i.offset)){const r=this._reader.readMessage(N.RecordBatch);if(r!=null&&r.isRecordBatch()){const s=r.header(),o=this._reader.readMessageBody(r.bodyLength);return this._loadRecordBatch(s,o)}}return null}_readDictionaryBatch(t){var e;const i=(e=this._footer)===null||e===void 0?void 0:e.getDictionaryBatch(t);if(i&&this._handle.seek(i.offset)){const r=this._reader.readMessage(N.DictionaryBatch);if(r!=null&&r.isDictionaryBatch()){const s=r.header(),o=this._reader.readMessageBody(r.bodyLength),a=this._loadDictionaryBatch(s,o);this.dictionaries.set(s.id,a)}}}_readFooter(){const{_handle:t}=this,e=t.size-ta,i=t.readInt32(e),r=t.readAt(e-i,i);return tn.decode(r)}_readNextMessageAndValidate(t){var e;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){const i=(e=this._footer)===null||e===void 0?void 0:e.getRecordBatch(this._recordBatchIndex);if(i&&this._handle.seek(i.offset))return this._reader.readMessage(t)}return null}}class mu extends Xn{constructor(t,...e){const i=typeof e[0]!="number"?e.shift():void 0,r=e[0]instanceof Map?e.shift():void 0;super(t instanceof Hn?t:new Hn(t,i),r)}get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}isFile(){return!0}isAsync(){return!0}open(t){const e=Object.create(null,{open:{get:()=>super.open}});return p(this,void 0,void 0,function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(const i of this._footer.dictionaryBatches())i&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield e.open.call(this,t)})}readRecordBatch(t){var e;return p(this,void 0,void 0,function*(){if(this.closed)return null;this._footer||(yield this.open());const i=(e=this._footer)===null||e===void 0?void 0:e.getRecordBatch(t);if(i&&(yield this._handle.seek(i.offset))){const r=yield this._reader.readMessage(N.RecordBatch);if(r!=null&&r.isRecordBatch()){const s=r.header(),o=yield this._reader.readMessageBody(r.bodyLength);return this._loadRecordBatch(s,o)}}return null})}_readDictionaryBatch(t){var e;return p(this,void 0,void 0,function*(){const i=(e=this._footer)===null||e===void 0?void 0:e.getDictionaryBatch(t);if(i&&(yield this._handle.seek(i.offset))){const r=yield this._reader.readMessage(N.DictionaryBatch);if(r!=null&&r.isDictionaryBatch()){const s=r.header(),o=yield this._reader.readMessageBody(r.bodyLength),a=this._loadDictionaryBatch(s,o);this.dictionaries.set(s.id,a)}}})}_readFooter(){return p(this,void 0,void 0,function*(){const{_handle:t}=this;t._pending&&(yield t._pending);const e=t.size-ta,i=yield t.readInt32(e),r=yield t.readAt(e-i,i);return tn.decode(r)})}_readNextMessageAndValidate(t){return p(this,void 0,void 0,function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){const e=this._footer.getRecordBatch(this._recordBatchIndex);if(e&&(yield this._handle.seek(e.offset)))return yield this._reader.readMessage(t)}return null})}}class bu extends Qn{constructor(t,e){super(t,e)}_loadVectors(t,e,i){return new Tl(e,t.nodes,t.buffers,this.dictionaries).visitMany(i)}}function ra(n,t){return t&&typeof t.autoDestroy=="boolean"?t.autoDestroy:n.autoDestroy}function*Zr(n){const t=zt.from(n);try{if(!t.open({autoDestroy:!1}).closed)do yield t;while(!t.reset().open().closed)}finally{t.cancel()}}function Qr(n){return Mt(this,arguments,function*(){const e=yield B(zt.from(n));try{if(!(yield B(e.open({autoDestroy:!1}))).closed)do yield yield B(e);while(!(yield B(e.reset().open())).closed)}finally{yield B(e.cancel())}})}function gu(n){return new qn(new bu(n))}function _u(n){const t=n.peek(hn+7&-8);return t&&t.byteLength>=4?wr(t)?new ea(new ia(n.read())):new qn(new Qn(n)):new qn(new Qn(function*(){}()))}function vu(n){return p(this,void 0,void 0,function*(){const t=yield n.peek(hn+7&-8);return t&&t.byteLength>=4?wr(t)?new ea(new ia(yield n.read())):new Zn(new Xn(n)):new Zn(new Xn(function(){return Mt(this,arguments,function*(){})}()))})}function wu(n){return p(this,void 0,void 0,function*(){const{size:t}=yield n.stat(),e=new Hn(n,t);return t>=pu&&wr(yield e.readAt(0,hn+7&-8))?new yu(new mu(e)):new Zn(new Xn(e))})}class Y extends D{constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}static assemble(...t){const e=r=>r.flatMap(s=>Array.isArray(s)?e(s):s instanceof tt?s.data.children:s.data),i=new Y;return i.visitMany(e(t)),i}visit(t){if(t instanceof L)return this.visitMany(t.data),this;const{type:e}=t;if(!y.isDictionary(e)){const{length:i,nullCount:r}=t;if(i>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");y.isNull(e)||gt.call(this,r<=0?new Uint8Array(0):cr(t.offset,i,t.nullBitmap)),this.nodes.push(new ge(i,r))}return super.visit(t)}visitNull(t){return this}visitDictionary(t){return this.visit(t.clone(t.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}}function gt(n){const t=n.byteLength+7&-8;return this.buffers.push(n),this.bufferRegions.push(new Nt(this._byteLength,t)),this._byteLength+=t,this}function Su(n){const{type:t,length:e,typeIds:i,valueOffsets:r}=n;if(gt.call(this,i),t.mode===ct.Sparse)return ki.call(this,n);if(t.mode===ct.Dense){if(n.offset<=0)return gt.call(this,r),ki.call(this,n);{const s=i.reduce((d,h)=>Math.max(d,h),i[0]),o=new Int32Array(s+1),a=new Int32Array(s+1).fill(-1),c=new Int32Array(e),u=er(-r[0],e,r);for(let d,h,A=-1;++A<e;)(h=a[d=i[A]])===-1&&(h=a[d]=u[d]),c[A]=u[A]-h,++o[d];gt.call(this,c);for(let d,h=-1,A=t.children.length;++h<A;)if(d=n.children[h]){const f=t.typeIds[h],$=Math.min(e,o[f]);this.visit(d.slice(a[f],$))}}}return this}function Iu(n){let t;return n.nullCount>=n.length?gt.call(this,new Uint8Array(0)):(t=n.values)instanceof Uint8Array?gt.call(this,cr(n.offset,n.length,t)):gt.call(this,Cn(n.values))}function oe(n){return gt.call(this,n.values.subarray(0,n.length*n.stride))}function sa(n){const{length:t,values:e,valueOffsets:i}=n,r=i[0],s=i[t],o=Math.min(s-r,e.byteLength-r);return gt.call(this,er(-i[0],t,i)),gt.call(this,e.subarray(r,r+o)),this}function Sr(n){const{length:t,valueOffsets:e}=n;return e&&gt.call(this,er(e[0],t,e)),this.visit(n.children[0])}function ki(n){return this.visitMany(n.type.children.map((t,e)=>n.children[e]).filter(Boolean))[0]}Y.prototype.visitBool=Iu;Y.prototype.visitInt=oe;Y.prototype.visitFloat=oe;Y.prototype.visitUtf8=sa;Y.prototype.visitBinary=sa;Y.prototype.visitFixedSizeBinary=oe;Y.prototype.visitDate=oe;Y.prototype.visitTimestamp=oe;Y.prototype.visitTime=oe;Y.prototype.visitDecimal=oe;Y.prototype.visitList=Sr;Y.prototype.visitStruct=ki;Y.prototype.visitUnion=Su;Y.prototype.visitInterval=oe;Y.prototype.visitFixedSizeList=Sr;Y.prototype.visitMap=Sr;class oa extends fr{constructor(t){super(),this._position=0,this._started=!1,this._sink=new wn,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,nt(t)||(t={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy=typeof t.autoDestroy=="boolean"?t.autoDestroy:!0,this._writeLegacyIpcFormat=typeof t.writeLegacyIpcFormat=="boolean"?t.writeLegacyIpcFormat:!1}static throughNode(t){throw new Error('"throughNode" not available in this environment')}static throughDOM(t,e){throw new Error('"throughDOM" not available in this environment')}toString(t=!1){return this._sink.toString(t)}toUint8Array(t=!1){return this._sink.toUint8Array(t)}writeAll(t){return Qt(t)?t.then(e=>this.writeAll(e)):ke(t)?Or(this,t):Ar(this,t)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(t){return this._sink.toDOMStream(t)}toNodeStream(t){return this._sink.toNodeStream(t)}close(){return this.reset()._sink.close()}abort(t){return this.reset()._sink.abort(t)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(t=this._sink,e=null){return t===this._sink||t instanceof wn?this._sink=t:(this._sink=new wn,t&&Ya(t)?this.toDOMStream({type:"bytes"}).pipeTo(t):t&&Wa(t)&&this.toNodeStream({objectMode:!1}).pipe(t)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,(!e||!xi(e,this._schema))&&(e==null?(this._position=0,this._schema=null):(this._started=!0,this._schema=e,this._writeSchema(e))),this}write(t){let e=null;if(this._sink){if(t==null)return this.finish()&&void 0;if(t instanceof K&&!(e=t.schema))return this.finish()&&void 0;if(t instanceof tt&&!(e=t.schema))return this.finish()&&void 0}else throw new Error("RecordBatchWriter is closed");if(e&&!xi(e,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,e)}t instanceof tt?t instanceof gr||this._writeRecordBatch(t):t instanceof K?this.writeAll(t.batches):cn(t)&&this.writeAll(t)}_writeMessage(t,e=8){const i=e-1,r=q.encode(t),s=r.byteLength,o=this._writeLegacyIpcFormat?4:8,a=s+o+i&~i,c=a-s-o;return t.headerType===N.RecordBatch?this._recordBatchBlocks.push(new ne(a,t.bodyLength,this._position)):t.headerType===N.DictionaryBatch&&this._dictionaryBlocks.push(new ne(a,t.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(a-o)),s>0&&this._write(r),this._writePadding(c)}_write(t){if(this._started){const e=T(t);e&&e.byteLength>0&&(this._sink.write(e),this._position+=e.byteLength)}return this}_writeSchema(t){return this._writeMessage(q.from(t))}_writeFooter(t){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(en)}_writePadding(t){return t>0?this._write(new Uint8Array(t)):this}_writeRecordBatch(t){const{byteLength:e,nodes:i,bufferRegions:r,buffers:s}=Y.assemble(t),o=new lt(t.numRows,i,r),a=q.from(o,e);return this._writeDictionaries(t)._writeMessage(a)._writeBodyBuffers(s)}_writeDictionaryBatch(t,e,i=!1){this._dictionaryDeltaOffsets.set(e,t.length+(this._dictionaryDeltaOffsets.get(e)||0));const{byteLength:r,nodes:s,bufferRegions:o,buffers:a}=Y.assemble(new L([t])),c=new lt(t.length,s,o),u=new Ut(c,e,i),d=q.from(u,r);return this._writeMessage(d)._writeBodyBuffers(a)}_writeBodyBuffers(t){let e,i,r;for(let s=-1,o=t.length;++s<o;)(e=t[s])&&(i=e.byteLength)>0&&(this._write(e),(r=(i+7&-8)-i)>0&&this._writePadding(r));return this}_writeDictionaries(t){for(let[e,i]of t.dictionaries){let r=this._dictionaryDeltaOffsets.get(e)||0;if(r===0||(i=i==null?void 0:i.slice(r)).length>0)for(const s of i.data)this._writeDictionaryBatch(s,e,r>0),r+=s.length}return this}}class Ir extends oa{static writeAll(t,e){const i=new Ir(e);return Qt(t)?t.then(r=>i.writeAll(r)):ke(t)?Or(i,t):Ar(i,t)}}class Br extends oa{static writeAll(t){const e=new Br;return Qt(t)?t.then(i=>e.writeAll(i)):ke(t)?Or(e,t):Ar(e,t)}constructor(){super(),this._autoDestroy=!0}_writeSchema(t){return this._writeMagic()._writePadding(2)}_writeFooter(t){const e=tn.encode(new tn(t,at.V4,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(t)._write(e)._write(Int32Array.of(e.byteLength))._writeMagic()}}function Ar(n,t){let e=t;t instanceof K&&(e=t.batches,n.reset(void 0,t.schema));for(const i of e)n.write(i);return n.finish()}function Or(n,t){var e,i,r,s;return p(this,void 0,void 0,function*(){try{for(e=pe(t);i=yield e.next(),!i.done;){const o=i.value;n.write(o)}}catch(o){r={error:o}}finally{try{i&&!i.done&&(s=e.return)&&(yield s.call(e))}finally{if(r)throw r.error}}return n.finish()})}function Ye(n){const t=zt.from(n);return Qt(t)?t.then(e=>Ye(e)):t.isAsync()?t.readAll().then(e=>new K(e)):new K(t.readAll())}function Ii(n,t="stream"){return(t==="stream"?Ir:Br).writeAll(n).toUint8Array(!0)}var Xr=function(){function n(t,e,i,r){var s=this;this.getCell=function(o,a){var c=o<s.headerRows&&a<s.headerColumns,u=o>=s.headerRows&&a<s.headerColumns,d=o<s.headerRows&&a>=s.headerColumns;if(c){var h=["blank"];return a>0&&h.push("level"+o),{type:"blank",classNames:h.join(" "),content:""}}else if(d){var A=a-s.headerColumns,h=["col_heading","level"+o,"col"+A];return{type:"columns",classNames:h.join(" "),content:s.getContent(s.columnsTable,A,o)}}else if(u){var f=o-s.headerRows,h=["row_heading","level"+a,"row"+f];return{type:"index",id:"T_".concat(s.uuid,"level").concat(a,"_row").concat(f),classNames:h.join(" "),content:s.getContent(s.indexTable,f,a)}}else{var f=o-s.headerRows,A=a-s.headerColumns,h=["data","row"+f,"col"+A],$=s.styler?s.getContent(s.styler.displayValuesTable,f,A):s.getContent(s.dataTable,f,A);return{type:"data",id:"T_".concat(s.uuid,"row").concat(f,"_col").concat(A),classNames:h.join(" "),content:$}}},this.getContent=function(o,a,c){var u=o.getChildAt(c);if(u===null)return"";var d=s.getColumnTypeId(o,c);switch(d){case l.Timestamp:return s.nanosToDate(u.get(a));default:return u.get(a)}},this.dataTable=Ye(t),this.indexTable=Ye(e),this.columnsTable=Ye(i),this.styler=r?{caption:r.caption,displayValuesTable:Ye(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(n.prototype,"rows",{get:function(){return this.indexTable.numRows+this.columnsTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"dataRows",{get:function(){return this.dataTable.numRows},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"table",{get:function(){return this.dataTable},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"index",{get:function(){return this.indexTable},enumerable:!1,configurable:!0}),Object.defineProperty(n.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!1,configurable:!0}),n.prototype.serialize=function(){return{data:Ii(this.dataTable),index:Ii(this.indexTable),columns:Ii(this.columnsTable)}},n.prototype.getColumnTypeId=function(t,e){return t.schema.fields[e].type.typeId},n.prototype.nanosToDate=function(t){return new Date(t/1e6)},n}(),Je=function(){return Je=Object.assign||function(n){for(var t,e=1,i=arguments.length;e<i;e++){t=arguments[e];for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(n[r]=t[r])}return n},Je.apply(this,arguments)},Ke;(function(n){n.COMPONENT_READY="streamlit:componentReady",n.SET_COMPONENT_VALUE="streamlit:setComponentValue",n.SET_FRAME_HEIGHT="streamlit:setFrameHeight"})(Ke||(Ke={}));var be=function(){function n(){}return n.API_VERSION=1,n.RENDER_EVENT="streamlit:render",n.events=new EventTarget,n.registeredMessageListener=!1,n.setComponentReady=function(){n.registeredMessageListener||(window.addEventListener("message",n.onMessageEvent),n.registeredMessageListener=!0),n.sendBackMsg(Ke.COMPONENT_READY,{apiVersion:n.API_VERSION})},n.setFrameHeight=function(t){t===void 0&&(t=document.body.scrollHeight),t!==n.lastFrameHeight&&(n.lastFrameHeight=t,n.sendBackMsg(Ke.SET_FRAME_HEIGHT,{height:t}))},n.setComponentValue=function(t){var e;t instanceof Xr?(e="dataframe",t=t.serialize()):Au(t)?(e="bytes",t=new Uint8Array(t.buffer)):t instanceof ArrayBuffer?(e="bytes",t=new Uint8Array(t)):e="json",n.sendBackMsg(Ke.SET_COMPONENT_VALUE,{value:t,dataType:e})},n.onMessageEvent=function(t){var e=t.data.type;switch(e){case n.RENDER_EVENT:n.onRenderMessage(t.data);break}},n.onRenderMessage=function(t){var e=t.args;e==null&&(console.error("Got null args in onRenderMessage. This should never happen"),e={});var i=t.dfs&&t.dfs.length>0?n.argsDataframeToObject(t.dfs):{};e=Je(Je({},e),i);var r=!!t.disabled,s=t.theme;s&&Bu(s);var o={disabled:r,args:e,theme:s},a=new CustomEvent(n.RENDER_EVENT,{detail:o});n.events.dispatchEvent(a)},n.argsDataframeToObject=function(t){var e=t.map(function(i){var r=i.key,s=i.value;return[r,n.toArrowTable(s)]});return Object.fromEntries(e)},n.toArrowTable=function(t){var e,i=(e=t.data,e.data),r=e.index,s=e.columns,o=e.styler;return new Xr(i,r,s,o)},n.sendBackMsg=function(t,e){window.parent.postMessage(Je({isStreamlitMessage:!0,type:t},e),"*")},n}(),Bu=function(n){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML=`
-    :root {
-      --primary-color: `.concat(n.primaryColor,`;
-      --background-color: `).concat(n.backgroundColor,`;
-      --secondary-background-color: `).concat(n.secondaryBackgroundColor,`;
-      --text-color: `).concat(n.textColor,`;
-      --font: `).concat(n.font,`;
-    }
-
-    body {
-      background-color: var(--background-color);
-      color: var(--text-color);
-    }
-  `)};function Au(n){var t=!1;try{t=n instanceof BigInt64Array||n instanceof BigUint64Array}catch{}return n instanceof Int8Array||n instanceof Uint8Array||n instanceof Uint8ClampedArray||n instanceof Int16Array||n instanceof Uint16Array||n instanceof Int32Array||n instanceof Uint32Array||n instanceof Float32Array||n instanceof Float64Array||t}var Ou=function(){var n=function(t,e){return n=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(i,r){i.__proto__=r}||function(i,r){for(var s in r)Object.prototype.hasOwnProperty.call(r,s)&&(i[s]=r[s])},n(t,e)};return function(t,e){if(typeof e!="function"&&e!==null)throw new TypeError("Class extends value "+String(e)+" is not a constructor or null");n(t,e);function i(){this.constructor=t}t.prototype=e===null?Object.create(e):(i.prototype=e.prototype,new i)}}();(function(n){Ou(t,n);function t(){return n!==null&&n.apply(this,arguments)||this}return t.prototype.componentDidMount=function(){be.setFrameHeight()},t.prototype.componentDidUpdate=function(){be.setFrameHeight()},t})(Pa.PureComponent);console.log("SwipeCounter build:","2025-10-13T10:02:26.774Z",navigator.userAgent);const aa=document.getElementById("app");if(!aa)throw new Error("Swipe counter root not found");aa.innerHTML=`
-  <div class="counter-root">
-    <div class="counter-header">
-      <span class="counter-label" id="counter-label">小役回数</span>
-      <span class="counter-value" id="counter-value">0</span>
-    </div>
-    <div class="counter-gesture" id="counter-gesture">
-      上にスワイプで +1 ／ 下にスワイプで -1
-    </div>
-    <div class="counter-controls">
-      <button type="button" data-delta="-1">-1</button>
-      <input type="number" id="counter-input" min="0" step="1" inputmode="numeric" />
-      <button type="button" data-delta="1">+1</button>
-      <button type="button" data-action="reset" class="reset-btn">リセット</button>
-    </div>
-    <p class="counter-caption" id="counter-caption"></p>
-  </div>
-`;const Fu=document.getElementById("counter-value"),$t=document.getElementById("counter-gesture"),ji=document.getElementById("counter-input"),Du=document.getElementById("counter-label"),Tu=document.getElementById("counter-caption"),Mu=Array.from(document.querySelectorAll("[data-delta]")),ts=document.querySelector("[data-action=reset]"),zi=0;let ti="swipe_counter_storage",bt=0,Ne=null,es=!1,We=!1;const Fr=()=>be.setFrameHeight(document.body.scrollHeight),fn=n=>Number.isFinite(n)?Math.max(zi,Math.round(n)):zi,Dr=n=>{const t=fn(n);Fu.textContent=t.toString(),ji.value=t,Fr()},Nu=n=>{const t={value:n,updatedAt:Date.now()};try{window.localStorage.setItem(ti,JSON.stringify(t))}catch(e){console.warn("swipe-counter: localStorage write failed",e)}},Tr=n=>{We||be.setComponentValue({value:bt,origin:n})},nn=(n,t={})=>{const e={notify:!0,persist:!0,origin:"user",...t};bt=fn(n),Dr(bt),e.persist&&Nu(bt),e.notify&&Tr(e.origin)},$i=n=>{n&&nn(bt+n,{origin:"adjust"})},Lu=()=>{if(es)return!1;es=!0;try{const n=window.localStorage.getItem(ti);if(!n)return!1;const t=JSON.parse(n);if(t&&typeof t.value=="number")return bt=fn(t.value),Dr(bt),Tr("storage"),!0}catch(n){console.warn("swipe-counter: localStorage read failed",n)}return!1},Eu=n=>{const e=(n.detail||{}).args||{},i=fn(Number(e.value??bt));ti=typeof e.storage_key=="string"&&e.storage_key.trim()?e.storage_key.trim():ti,Du.textContent=e.label||"小役回数",Tu.textContent=e.description||"上スワイプで+1 / 下スワイプで-1。非対応の環境では入力欄をご利用ください。",Lu()?i!==bt&&(We=!0,nn(i,{notify:!1,origin:"python"}),We=!1):(i!==bt?(We=!0,nn(i,{notify:!1,origin:"python"}),We=!1):Dr(bt),Tr("init")),Fr()};$t.addEventListener("pointerdown",n=>{Ne=n.clientY,$t.setPointerCapture(n.pointerId),$t.classList.add("active")});$t.addEventListener("pointerup",n=>{if(Ne===null)return;const t=n.clientY-Ne,e=28;t<=-e?$i(1):t>=e&&$i(-1),Ne=null,$t.classList.remove("active");try{$t.releasePointerCapture(n.pointerId)}catch{}});$t.addEventListener("pointercancel",()=>{Ne=null,$t.classList.remove("active")});$t.addEventListener("touchmove",n=>{Ne!==null&&n.preventDefault()},{passive:!1});Mu.forEach(n=>{n.addEventListener("click",()=>{const t=Number(n.dataset.delta);$i(t)})});ts&&ts.addEventListener("click",()=>{nn(zi,{origin:"reset"})});ji.addEventListener("change",()=>{const n=fn(Number(ji.value));nn(n,{origin:"input"})});be.events.addEventListener(be.RENDER_EVENT,Eu);be.setComponentReady();Fr();
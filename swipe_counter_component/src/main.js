@@ -15,6 +15,7 @@ appRoot.innerHTML = `
       <span class="counter-label" id="counter-label">小役回数</span>
       <span class="counter-value" id="counter-value">0</span>
     </div>
+    <p class="counter-estimate" id="counter-estimate" hidden></p>
     <div class="counter-gesture" id="counter-gesture">
       上にスワイプで +1 ／ 下にスワイプで -1
     </div>
@@ -33,16 +34,124 @@ const gestureEl = document.getElementById("counter-gesture");
 const inputEl = document.getElementById("counter-input");
 const labelEl = document.getElementById("counter-label");
 const captionEl = document.getElementById("counter-caption");
+const estimateEl = document.getElementById("counter-estimate");
 const buttons = Array.from(document.querySelectorAll("[data-delta]"));
 const resetBtn = document.querySelector("[data-action=reset]");
 
 const MIN_VALUE = 0;
+const DEFAULT_BATCH_MS = 250;
+const PROTOCOL_VERSION = 1;
 let storageKey = "swipe_counter_storage";
 let value = 0;
 let pointerStartY = null;
 let hasHydrated = false;
 let updatingFromPython = false;
 
+// --- Streamlit への送信（差分のまとめ送り） ---
+// 連打のたびに setComponentValue するとその回数だけ Python 側が再実行されるため、
+// batchMs の間の増減を1つの操作 { seq, delta } にまとめて送る。
+// 絶対値の変更（リセット・直接入力・localStorage からの復元）は { seq, set } として送る。
+// Streamlit は最後に送った値しか保持しないので、Python から ack が返るまでの操作は
+// 毎回すべて送り直す（途中の送信が上書きされてもカウントが失われない）。
+const clientId = (() => {
+  try {
+    return window.crypto.randomUUID();
+  } catch (error) {
+    return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+  }
+})();
+let batchMs = DEFAULT_BATCH_MS;
+let seq = 0;
+let openDelta = 0;
+let unackedOps = [];
+let flushTimer = null;
+// 操作を初めて送った時刻。ack が届いたら往復時間を求め、次の送信で rtt_ms として知らせる
+const sentAt = new Map();
+let pendingRttMs = null;
+
+// --- 期待度の早見表（src/grid.py の形式） ---
+// タップのたびに表を引いて期待度をその場で表示し、同期後は Python の値 (estimate) に置き換える。
+const GRID_MAGIC = "MTPG";
+const GRID_VERSION = 1;
+let grid = null;
+let gridId = null;
+let spins = null;
+let serverEstimate = null;
+
+const parseGrid = (bytes) => {
+  if (!(bytes instanceof Uint8Array) || bytes.byteLength < 8) {
+    return null;
+  }
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const magic = String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]);
+  if (magic !== GRID_MAGIC || view.getUint8(4) !== GRID_VERSION) {
+    return null;
+  }
+  const levels = view.getUint8(5);
+  const rows = view.getUint16(6, true);
+  const rowSpins = new Uint16Array(rows);
+  const kLo = new Uint16Array(rows);
+  const widths = new Uint16Array(rows);
+  const offsets = new Uint32Array(rows);
+  let offset = 8 + rows * 6;
+  for (let i = 0; i < rows; i += 1) {
+    rowSpins[i] = view.getUint16(8 + i * 6, true);
+    kLo[i] = view.getUint16(10 + i * 6, true);
+    widths[i] = view.getUint16(12 + i * 6, true);
+    offsets[i] = offset;
+    offset += widths[i] * 2;
+  }
+  return { bytes, levels, rows, rowSpins, kLo, widths, offsets };
+};
+
+const gridValue = (row, goal, k) => {
+  const width = grid.widths[row];
+  const index = Math.min(Math.max(k - grid.kLo[row], 0), width - 1);
+  return grid.bytes[grid.offsets[row] + goal * width + index];
+};
+
+const lookupGrid = (n, k) => {
+  if (!grid || n <= 0 || k < 0 || k > n || n > grid.rowSpins[grid.rows - 1]) {
+    return null;
+  }
+  let lo = 0;
+  let hi = grid.rows - 1;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (grid.rowSpins[mid] < n) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  const upper = lo;
+  const lower = grid.rowSpins[upper] === n ? upper : upper - 1;
+  const t = lower === upper ? 0 : (n - grid.rowSpins[lower]) / (grid.rowSpins[upper] - grid.rowSpins[lower]);
+  const value = (goal) => {
+    const base = gridValue(lower, goal, k);
+    return (t > 0 ? base * (1 - t) + gridValue(upper, goal, k) * t : base) / grid.levels;
+  };
+  return { "456": value(0), "56": value(1) };
+};
+
+const renderEstimate = (k) => {
+  if (spins === null) {
+    estimateEl.hidden = true;
+    return;
+  }
+  const exact = serverEstimate && serverEstimate.n === spins && serverEstimate.k === k;
+  const estimate = exact ? serverEstimate : lookupGrid(spins, k);
+  if (!estimate) {
+    estimateEl.hidden = true;
+    return;
+  }
+  const pct = (prob) => `${(prob * 100).toFixed(exact ? 1 : 0)}%`;
+  estimateEl.innerHTML = `<span>456期待度 ${pct(estimate["456"])}</span><span>56期待度 ${pct(estimate["56"])}</span>`;
+  estimateEl.classList.toggle("provisional", !exact);
+  estimateEl.title = exact ? "" : "速報値（次の同期で確定）";
+  estimateEl.hidden = false;
+};
+
 const frameResize = () => Streamlit.setFrameHeight(document.body.scrollHeight);
 
 const clamp = (num) => {
@@ -56,6 +165,7 @@ const render = (newValue) => {
   const displayValue = clamp(newValue);
   valueEl.textContent = displayValue.toString();
   inputEl.value = displayValue;
+  renderEstimate(displayValue);
   frameResize();
 };
 
@@ -68,13 +178,76 @@ const persist = (newValue) => {
   }
 };
 
+const sendOps = (origin) => {
+  const now = performance.now();
+  unackedOps.forEach((op) => {
+    if (!sentAt.has(op.seq)) {
+      sentAt.set(op.seq, now);
+    }
+  });
+  Streamlit.setComponentValue({
+    protocol: PROTOCOL_VERSION,
+    client: clientId,
+    ops: unackedOps,
+    value,
+    grid: gridId,
+    rtt_ms: pendingRttMs,
+    origin,
+  });
+  pendingRttMs = null;
+};
+
+const closeOpenDelta = () => {
+  if (flushTimer !== null) {
+    window.clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  if (openDelta !== 0) {
+    seq += 1;
+    unackedOps = [...unackedOps, { seq, delta: openDelta }];
+    openDelta = 0;
+    return true;
+  }
+  return false;
+};
+
+const flush = (origin = "adjust") => {
+  if (closeOpenDelta()) {
+    sendOps(origin);
+  }
+};
+
 const syncToStreamlit = (origin) => {
   if (updatingFromPython) {
     return;
   }
-  Streamlit.setComponentValue({ value, origin });
+  // 絶対値はまとめずにすぐ送る（それまでの差分を先に確定させて順序を保つ）
+  closeOpenDelta();
+  seq += 1;
+  unackedOps = [...unackedOps, { seq, set: value }];
+  sendOps(origin);
 };
 
+const acknowledge = (ack) => {
+  if (!ack || ack.client !== clientId) {
+    return;
+  }
+  const ackSeq = Number(ack.seq);
+  if (Number.isFinite(ackSeq)) {
+    unackedOps = unackedOps.filter((op) => op.seq > ackSeq);
+    if (sentAt.has(ackSeq)) {
+      pendingRttMs = Math.round(performance.now() - sentAt.get(ackSeq));
+    }
+    sentAt.forEach((_time, sentSeq) => {
+      if (sentSeq <= ackSeq) {
+        sentAt.delete(sentSeq);
+      }
+    });
+  }
+};
+
+const hasPendingOps = () => openDelta !== 0 || unackedOps.length > 0;
+
 const apply = (newValue, options = {}) => {
   const opts = {
     notify: true,
@@ -96,7 +269,18 @@ const adjust = (delta) => {
   if (!delta) {
     return;
   }
-  apply(value + delta, { origin: "adjust" });
+  const previous = value;
+  apply(value + delta, { notify: false });
+  // 0 で止まった分は送らない（Python 側の値と食い違わないように実際の増減を積む）
+  openDelta += value - previous;
+  if (batchMs <= 0) {
+    flush();
+  } else if (flushTimer === null) {
+    flushTimer = window.setTimeout(() => {
+      flushTimer = null;
+      flush();
+    }, batchMs);
+  }
 };
 
 const hydrateFromStorage = () => {
@@ -130,6 +314,25 @@ const onRender = (event) => {
   storageKey = typeof args.storage_key === "string" && args.storage_key.trim()
     ? args.storage_key.trim()
     : storageKey;
+  const requestedBatchMs = Number(args.batch_ms);
+  batchMs = Number.isFinite(requestedBatchMs) && requestedBatchMs >= 0 ? requestedBatchMs : DEFAULT_BATCH_MS;
+  acknowledge(args.ack);
+
+  if (args.grid instanceof Uint8Array && args.grid_id !== gridId) {
+    grid = parseGrid(args.grid);
+    gridId = grid ? args.grid_id : null;
+  } else if (typeof args.grid_id === "string" && args.grid_id !== gridId) {
+    // 識別子だけが届いた（受け取り済みと判断されたが、読み込み直して表がない）ときは
+    // 持っていないことを伝えて送り直してもらう
+    grid = null;
+    gridId = null;
+    sendOps("grid");
+  } else if (typeof args.grid_id !== "string") {
+    grid = null;
+    gridId = null;
+  }
+  spins = typeof args.spins === "number" ? args.spins : null;
+  serverEstimate = args.estimate && typeof args.estimate === "object" ? args.estimate : null;
 
   labelEl.textContent = args.label || "小役回数";
   captionEl.textContent =
@@ -137,7 +340,10 @@ const onRender = (event) => {
 
   const hydrated = hydrateFromStorage();
 
-  if (!hydrated) {
+  // 未確認の操作がある間は Python 側の値が古いので上書きしない
+  if (hasPendingOps()) {
+    render(value);
+  } else if (!hydrated) {
     if (incomingValue !== value) {
       updatingFromPython = true;
       apply(incomingValue, { notify: false, origin: "python" });
@@ -145,7 +351,6 @@ const onRender = (event) => {
     } else {
       render(value);
     }
-    syncToStreamlit("init");
   } else if (incomingValue !== value) {
     updatingFromPython = true;
     apply(incomingValue, { notify: false, origin: "python" });
@@ -215,6 +420,14 @@ inputEl.addEventListener("change", () => {
   apply(parsed, { origin: "input" });
 });
 
+// まとめ待ちの差分はタブを閉じる・切り替える前に送っておく
+window.addEventListener("pagehide", () => flush());
+document.addEventListener("visibilitychange", () => {
+  if (document.visibilityState === "hidden") {
+    flush();
+  }
+});
+
 Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, onRender);
 Streamlit.setComponentReady();
 frameResize();
\ No newline at end of file
@@ -1,16 +1,22 @@
 import { defineConfig } from "vite";
 
-const buildId = new Date().toISOString();
+// ビルドごとに変わる値を埋め込むと、内容が同じでもハッシュが変わって長期キャッシュが効かなくなる
+const buildId = process.env.BUILD_ID || process.env.npm_package_version || "dev";
 
 export default defineConfig({
   define: {
     __BUILD_ID__: JSON.stringify(buildId)
   },
   root: ".",
+  // コンポーネントは /component/<名前>/ の下で配信されるため、相対パスで参照する
+  base: "./",
   build: {
     outDir: "build",
     assetsDir: ".",
     emptyOutDir: true,
+    sourcemap: false,
+    // 対象ブラウザはすべて modulepreload に対応しているため、ポリフィルを含めない
+    modulePreload: { polyfill: false },
     rollupOptions: {
       input: "index.html",
     },
@@ -0,0 +1,95 @@
+// ビルド済みのスワイプカウンターを node で動かし、+1 ボタンを押したときに
+// Streamlit へ送られた値 (setComponentValue) と、表示された期待度を JSON で出力する。
+//
+//     node tests/js/drive_swipe_counter.mjs <バンドル> '{"clicks": 3, "batch_ms": 0, "value": 0, "spins": 3000, "grid": "<早見表のファイル>"}'
+//
+// DOM はバンドルが使う分だけの最小限のものを用意する。
+import { readFileSync } from "node:fs";
+
+const bundle = process.argv[2];
+const options = JSON.parse(process.argv[3] || "{}");
+const batchMs = options.batch_ms ?? 0;
+
+const sent = [];
+const windowListeners = {};
+
+const element = () => ({
+  hidden: false,
+  textContent: "",
+  innerHTML: "",
+  value: "",
+  dataset: {},
+  style: {},
+  classList: { add() {}, remove() {}, toggle() {} },
+  handlers: {},
+  addEventListener(type, handler) {
+    (this.handlers[type] ||= []).push(handler);
+  },
+  setAttribute() {},
+  removeAttribute() {},
+  focus() {},
+  blur() {},
+});
+
+const elements = {};
+const minus = element();
+const plus = element();
+const reset = element();
+minus.dataset.delta = "-1";
+plus.dataset.delta = "1";
+reset.dataset.action = "reset";
+
+globalThis.window = globalThis;
+globalThis.document = {
+  getElementById: (id) => (elements[id] ||= element()),
+  querySelectorAll: () => [minus, plus],
+  querySelector: () => reset,
+  body: element(),
+  documentElement: element(),
+  addEventListener() {},
+};
+window.parent = {
+  postMessage(message) {
+    if (message.type === "streamlit:setComponentValue") {
+      sent.push(message.value);
+    }
+  },
+};
+window.addEventListener = (type, handler) => {
+  (windowListeners[type] ||= []).push(handler);
+};
+window.removeEventListener = () => {};
+const storage = {};
+window.localStorage = {
+  getItem: (key) => storage[key] ?? null,
+  setItem: (key, value) => {
+    storage[key] = value;
+  },
+  removeItem: (key) => {
+    delete storage[key];
+  },
+};
+Object.defineProperty(globalThis, "navigator", { value: { userAgent: "node" }, configurable: true });
+
+await import(bundle);
+
+const render = (args) =>
+  (windowListeners.message || []).forEach((handler) =>
+    handler({ data: { isStreamlitMessage: true, type: "streamlit:render", args, dfs: [] } }),
+  );
+const args = { value: options.value ?? 0, batch_ms: batchMs, storage_key: "test" };
+if (options.grid) {
+  // Streamlit は bytes の引数を Uint8Array で渡す
+  args.grid = new Uint8Array(readFileSync(options.grid));
+  args.grid_id = "test-grid";
+  args.spins = options.spins;
+}
+render(args);
+
+const event = { preventDefault() {}, currentTarget: plus, target: plus };
+for (let i = 0; i < (options.clicks ?? 0); i += 1) {
+  (plus.handlers.click || []).forEach((handler) => handler(event));
+}
+// まとめ送りの待ち時間を過ぎてから出力する
+const estimate = elements["counter-estimate"];
+setTimeout(() => console.log(JSON.stringify({ sent, estimate: estimate.hidden ? null : estimate.innerHTML })), batchMs + 50);
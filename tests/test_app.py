@@ -0,0 +1,70 @@
+"""
+入力操作でフラグメントだけが再実行されること (main.py)
+"""
+import os
+
+import pytest
+
+from src import metrics
+from src.metrics import MetricsRegistry
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def reruns(registry: MetricsRegistry):
+    return {
+        c["labels"]["scope"]: c["value"]
+        for c in registry.snapshot()["counters"]
+        if c["name"] == "mtv_reruns_total"
+    }
+
+def stages(registry: MetricsRegistry):
+    return {
+        h["labels"]["stage"]: h["count"]
+        for h in registry.snapshot()["histograms"]
+        if h["name"] == "mtv_stage_seconds"
+    }
+
+@pytest.fixture
+def registry(monkeypatch, tmp_path):
+    monkeypatch.setenv("EVENT_STORE_PATH", str(tmp_path / "events.db"))
+    registry = MetricsRegistry(metrics.METRICS_CONFIG["buckets"])
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    monkeypatch.setattr(metrics, "PROFILER", None)
+    monkeypatch.setattr(metrics, "METRICS_FILE", None)
+    return registry
+
+def test_input_change_reruns_only_the_calculator(registry, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+    from benchmarks.bench_rerun import _Recorder, _find_fragment_id
+
+    # AppTest は常にスクリプト全体を再実行するので、ブラウザと同じくフラグメントだけを再実行させる
+    monkeypatch.setattr(LocalScriptRunner, "run", LocalScriptRunner.run)
+    recorder = _Recorder()
+    recorder.install()
+
+    at = AppTest.from_file(os.path.join(ROOT_DIR, "main.py"), default_timeout=60).run()
+    assert not at.exception, at.exception
+    recorder.fragment_id = _find_fragment_id(recorder.last_messages, "num_n")
+    assert recorder.fragment_id is not None
+    before_reruns, before_stages = reruns(registry), stages(registry)
+    assert before_reruns["script"] == 1 and before_reruns["calculator"] == 1
+
+    at.number_input(key="num_n").set_value(3000)
+    at.number_input(key="num_k").set_value(95).run()
+    assert not at.exception, at.exception
+
+    after_reruns, after_stages = reruns(registry), stages(registry)
+    assert after_reruns["calculator"] == before_reruns["calculator"] + 1
+    # フラグメントの外（スクリプト全体・ホールデータ欄・CSS など）は再実行されない
+    assert {scope: count for scope, count in after_reruns.items() if scope != "calculator"} == {
+        scope: count for scope, count in before_reruns.items() if scope != "calculator"
+    }
+    outside = set(before_stages) - {"inputs", "event_log", "result_bundle"}
+    assert {stage: after_stages.get(stage) for stage in outside} == {stage: before_stages[stage] for stage in outside}
+    assert after_stages["result_bundle"] == before_stages.get("result_bundle", 0) + 1
+
+    # 結果欄は新しい入力で描き直されている
+    assert at.session_state["posterior_state"].num_spins == 3000
+    assert any("64.5%" in str(element.value) for element in at.markdown)
@@ -0,0 +1,107 @@
+"""
+カウンターコンポーネントの成果物の整理と配信 (src/assets.py)
+"""
+import gzip
+import http.client
+import os
+
+import pytest
+
+from src import assets
+
+BUNDLE = "index.0123abcd4567.js"
+
+@pytest.fixture
+def build_dir(tmp_path, monkeypatch):
+    """index.html とハッシュ付きのバンドル、参照されていない古いファイルを置いたビルド出力"""
+    (tmp_path / "index.html").write_text(
+        f'<html><link href="./style.css"><script src="./{BUNDLE}"></script></html>', encoding="utf-8"
+    )
+    (tmp_path / BUNDLE).write_text("console.log('counter');" * 200, encoding="utf-8")
+    (tmp_path / f"{BUNDLE}.LICENSE.txt").write_text("MIT", encoding="utf-8")
+    (tmp_path / "style.css").write_text("body{margin:0}" * 100, encoding="utf-8")
+    (tmp_path / "index.0ld0ld0ld0.js").write_text("old", encoding="utf-8")
+    (tmp_path / "index.0ld0ld0ld0.js.gz").write_bytes(gzip.compress(b"old"))
+    (tmp_path / f"{BUNDLE}.map").write_text("{}", encoding="utf-8")
+    monkeypatch.setitem(assets.COMPONENT_DIRS, "test_counter", str(tmp_path))
+    return tmp_path
+
+def build(build_dir):
+    assets.prune_build(str(build_dir))
+    immutable = assets.write_manifest(str(build_dir))
+    assets.precompress(str(build_dir))
+    return immutable
+
+def test_prune_build_keeps_referenced_files(build_dir):
+    removed = assets.prune_build(str(build_dir))
+    assert sorted(name for name, _ in removed) == sorted(["index.0ld0ld0ld0.js", "index.0ld0ld0ld0.js.gz", f"{BUNDLE}.map"])
+    assert sorted(os.listdir(build_dir)) == sorted(["index.html", BUNDLE, f"{BUNDLE}.LICENSE.txt", "style.css"])
+
+def test_immutable_only_for_manifest_files_with_matching_digest(build_dir):
+    immutable = build(build_dir)
+    # ハッシュの付いていない style.css と index.html は載せない
+    assert list(immutable) == [BUNDLE]
+    assert assets.is_immutable(str(build_dir), BUNDLE)
+    assert not assets.is_immutable(str(build_dir), "style.css")
+    assert not assets.is_immutable(str(build_dir), "index.html")
+
+    # 名前を変えずに中身を差し替えたファイルは immutable にしない
+    path = build_dir / BUNDLE
+    path.write_text("console.log('patched');", encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert not assets.is_immutable(str(build_dir), BUNDLE)
+
+    # manifest がなければどれも immutable にしない
+    build(build_dir)
+    assert assets.is_immutable(str(build_dir), BUNDLE)
+    os.remove(build_dir / assets.MANIFEST)
+    assert not assets.is_immutable(str(build_dir), BUNDLE)
+
+def test_resolve_negotiates_encoding(build_dir):
+    build(build_dir)
+    path = str(build_dir / BUNDLE)
+    if assets.brotli is not None:
+        assert assets.resolve("test_counter", BUNDLE, "gzip, deflate, br") == (path + ".br", "br")
+    assert assets.resolve("test_counter", BUNDLE, "gzip, br;q=0") == (path + ".gz", "gzip")
+    assert assets.resolve("test_counter", BUNDLE, "deflate") == (path, None)
+    assert assets.resolve("test_counter", BUNDLE, None) == (path, None)
+    assert assets.resolve("test_counter", "", None) == (str(build_dir / "index.html"), None)
+
+def test_resolve_rejects_traversal(build_dir):
+    build(build_dir)
+    assert assets.resolve("test_counter", "../../etc/passwd", None) is None
+    assert assets.resolve("test_counter", "/etc/passwd", None) is None
+    assert assets.resolve("test_counter", "missing.js", None) is None
+    assert assets.resolve("unknown", BUNDLE, None) is None
+
+@pytest.fixture
+def server(build_dir):
+    build(build_dir)
+    server = assets.AssetServer("127.0.0.1", 0).start()
+    yield server
+    server.stop()
+
+def get(server, path, headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+    conn.request("GET", path, headers=headers or {})
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+
+def test_server_cache_headers_and_etag(server, build_dir):
+    status, headers, body = get(server, f"/test_counter/{BUNDLE}", {"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == (build_dir / BUNDLE).read_bytes()
+    assert "immutable" in headers["cache-control"]
+
+    status, headers, _ = get(server, "/test_counter/index.html")
+    assert status == 200 and headers["cache-control"] == "no-cache"
+    status, _, body = get(server, "/test_counter/index.html", {"If-None-Match": headers["etag"]})
+    assert status == 304 and body == b""
+
+def test_server_traversal_is_404(server):
+    for path in ("/test_counter/../../../etc/passwd", "/test_counter/%2e%2e/%2e%2e/etc/passwd", "/test_counter/missing.js", "/unknown/"):
+        assert get(server, path)[0] == 404
@@ -0,0 +1,37 @@
+"""
+複数台の事後確率の一括計算 (src/batch.py)
+"""
+import numpy as np
+import pytest
+
+from src.batch import compute_posteriors_batch, posteriors_to_dicts
+from src.constants import SETTING_KEYS
+from src.logic import compute_posteriors, normalize
+
+PRIORS = {"1": 0.3, "2": 0.3, "4": 0.2, "5": 0.1, "6": 0.1}
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(0)
+    n = np.concatenate([np.arange(1, 200), rng.integers(200, 100_000, 300), [1_000_000]])
+    k = np.array([rng.binomial(spins, rng.uniform(0.02, 0.05)) for spins in n])
+    # 端の値（0回・全回当選）も含める
+    n = np.concatenate([n, [50, 50, 8000]])
+    k = np.concatenate([k, [0, 50, 0]])
+    matrix = compute_posteriors_batch(n, k, PRIORS)
+    assert matrix.shape == (len(n), len(SETTING_KEYS))
+    for spins, hits, row in zip(n.tolist(), k.tolist(), posteriors_to_dicts(matrix)):
+        expected = compute_posteriors(spins, hits, PRIORS)
+        assert row == pytest.approx(expected, rel=1e-9, abs=1e-12), (spins, hits)
+
+@pytest.mark.parametrize("n, k", [(0, 0), (-10, 0), (100, -1), (100, 101)])
+def test_invalid_rows_fall_back_to_prior(n, k):
+    matrix = compute_posteriors_batch([n, 3000], [k, 95], PRIORS)
+    expected = normalize(PRIORS)
+    assert posteriors_to_dicts(matrix)[0] == pytest.approx(expected)
+    assert posteriors_to_dicts(matrix)[0] == pytest.approx(compute_posteriors(n, k, PRIORS))
+    # 不正な行があっても他の行は影響を受けない
+    assert posteriors_to_dicts(matrix)[1] == pytest.approx(compute_posteriors(3000, 95, PRIORS), rel=1e-9)
+
+def test_shape_mismatch():
+    with pytest.raises(ValueError):
+        compute_posteriors_batch([100, 200], [3], PRIORS)
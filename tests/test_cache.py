@@ -0,0 +1,64 @@
+"""
+全セッション共有の結果キャッシュ (src/cache.py)
+"""
+from src.cache import ResultCache, estimate_size, prior_signature
+from src.results import build_result_bundle
+from src.state import PosteriorState
+
+def test_lru_eviction_by_bytes():
+    value = "x" * 100
+    size = estimate_size(value)
+    cache = ResultCache(max_entries=100, max_bytes=size * 3)
+    for key in "abc":
+        cache.put(key, value)
+    cache.get("a")  # a を最近使ったものにする
+    cache.put("d", value)
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in "acd"] == [True, True, True]
+    assert cache.bytes == size * 3
+    assert cache.stats()["evictions"] == 1
+
+    # 上限より大きい値は登録しない
+    cache.put("huge", "x" * (size * 4))
+    assert cache.get("huge") is None
+
+def test_lru_eviction_by_entries():
+    cache = ResultCache(max_entries=2, max_bytes=1 << 20)
+    for key in range(3):
+        cache.put(key, {"v": key})
+    assert cache.get(0) is None and cache.get(2) == {"v": 2}
+
+def cache_key(state: PosteriorState):
+    return (state.num_spins, state.num_hits, prior_signature(state.priors), state.observation_signature())
+
+def test_keys_separate_priors_and_observations():
+    cache = ResultCache(max_entries=16, max_bytes=1 << 20)
+    flat = PosteriorState(None, 3000, 95)
+    high = PosteriorState({"1": 1, "2": 1, "4": 2, "5": 2, "6": 2}, 3000, 95)
+    scaled = PosteriorState({"1": 2, "2": 2, "4": 2, "5": 2, "6": 2}, 3000, 95)
+    # 事前確率は正規化してから比べる
+    assert cache_key(flat) == cache_key(scaled)
+    assert cache_key(flat) != cache_key(high)
+
+    with_trophy = PosteriorState(None, 3000, 95, observations={"trophy": {"gold": 1}})
+    assert cache_key(flat) != cache_key(with_trophy)
+
+    for state in (flat, high):
+        cache.get_or_compute(cache_key(state), lambda state=state: build_result_bundle(state))
+    assert cache.get(cache_key(scaled)) == build_result_bundle(flat)
+    assert cache.get(cache_key(high)) == build_result_bundle(high)
+    assert cache.get(cache_key(with_trophy)) is None
+
+def test_stats_and_clear():
+    cache = ResultCache(max_entries=1, max_bytes=1 << 20)
+    assert cache.get_or_compute("a", lambda: [1]) == [1]
+    assert cache.get_or_compute("a", lambda: [2]) == [1]
+    cache.put("b", [3])
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"]) == (1, 1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+    cache.clear()
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["entries"], stats["bytes"]) == (0, 0, 0, 0, 0)
+    assert stats["hit_rate"] == 0.0
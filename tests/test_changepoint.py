@@ -0,0 +1,69 @@
+"""
+途中の設定変更の検出 (src/changepoint.py)
+"""
+import numpy as np
+import pytest
+
+from src.batch import SETTING_PROBS
+from src.changepoint import ChangePointDetector, detect_changepoints, net_events
+
+def stream(probs, spins=200, seed=0):
+    """1分ごとに spins 回転ずつ入力した操作履歴"""
+    rng = np.random.default_rng(seed)
+    return [
+        {"delta_spins": spins, "delta_hits": int(rng.binomial(spins, p)), "ts": float(i * 60)}
+        for i, p in enumerate(probs)
+    ]
+
+def assert_same_summary(actual, expected):
+    for key in ("observations", "total_spins", "total_hits", "runs", "change_at"):
+        assert actual[key] == expected[key]
+    assert actual["change_prob"] == pytest.approx(expected["change_prob"])
+    assert actual["current"] == pytest.approx(expected["current"])
+
+def test_hits_only_entry_merges_into_spins_entry():
+    detector = ChangePointDetector()
+    assert detector.update(100, 0)
+    assert detector.update(0, 3)
+    expected = ChangePointDetector()
+    expected.update(100, 3)
+    summary = detector.summary()
+    assert summary["observations"] == 1
+    assert summary["total_hits"] == 3
+    assert_same_summary(summary, expected.summary())
+
+def test_unappliable_correction_rebuilds_from_history():
+    history = [
+        {"delta_spins": 100, "delta_hits": 3},
+        {"delta_spins": 50, "delta_hits": 1},
+        {"delta_spins": -100, "delta_hits": 0},
+    ]
+    detector = ChangePointDetector()
+    results = [detector.update(event["delta_spins"], event["delta_hits"]) for event in history]
+    # 最初の操作は観測として確定済みなので、その分まで減らす取り消しは反映できない
+    assert results == [True, True, False]
+
+    rebuilt = detect_changepoints(history)
+    expected = ChangePointDetector()
+    expected.update(50, 4)
+    assert_same_summary(rebuilt.summary(), expected.summary())
+
+def test_net_events_folds_negative_deltas_newest_first():
+    history = [
+        {"delta_spins": 10, "delta_hits": 1, "ts": 1.0},
+        {"delta_spins": 20, "delta_hits": 2, "ts": 2.0},
+        {"delta_spins": -25, "delta_hits": -2, "ts": 3.0},
+    ]
+    assert net_events(history) == [(5, 1, 1.0)]
+    assert net_events(history[:2]) == [(10, 1, 1.0), (20, 2, 2.0)]
+
+def test_no_change_on_stationary_stream():
+    summary = detect_changepoints(stream([SETTING_PROBS[0]] * 60)).summary()
+    assert summary["change_prob"] < 0.5
+    assert summary["change_at"] is None
+    assert summary["segment"]["n"] == 60 * 200
+
+def test_detects_setting_change():
+    summary = detect_changepoints(stream([SETTING_PROBS[0]] * 30 + [SETTING_PROBS[-1]] * 30)).summary()
+    assert summary["change_prob"] > 0.5
+    assert 20 <= summary["change_at"]["observation"] <= 40
@@ -0,0 +1,52 @@
+"""
+コマンドライン版 (src/cli.py)
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.logic import compute_posteriors
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PRIORS = {"1": 0.2, "2": 0.2, "4": 0.2, "5": 0.2, "6": 0.2}
+
+def run_cli(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-m", "src.cli", *args], cwd=ROOT_DIR, capture_output=True, text=True, timeout=60,
+    )
+
+def test_text_output():
+    result = run_cli("3000", "95")
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0] == "3000G / 95回 (1/31.6)"
+    assert lines[1].startswith("  456期待度  64.5% ★★★☆☆")
+    assert lines[2].startswith("  56期待度   2.3% ★★☆☆☆")
+    assert lines[3] == "  設定1:13.2% 設定2:22.4% 設定4:62.2% 設定5:2.1% 設定6:0.1%"
+    assert lines[4] == "  最も近い設定: 設定4 (1/30.27)"
+
+def test_json_output():
+    result = run_cli("3000", "95", "--json")
+    assert result.returncode == 0, result.stderr
+    data = json.loads(result.stdout)
+    assert (data["n"], data["k"], data["top_setting"]) == (3000, 95, "4")
+    expected = compute_posteriors(3000, 95, PRIORS)
+    assert data["posteriors"] == pytest.approx(expected)
+    assert data["456"]["prob"] == pytest.approx(expected["4"] + expected["5"] + expected["6"])
+    assert (data["456"]["stars"], data["56"]["stars"]) == (3, 2)
+
+def test_invalid_input_exits_with_2():
+    result = run_cli("3000", "4000")
+    assert result.returncode == 2
+    assert result.stdout == ""
+    assert "不正" in result.stderr
+
+def test_import_does_not_load_streamlit_or_numpy():
+    # 起動を速くするため、src.cli の読み込みでは重いライブラリを読まない
+    code = "import sys, src.cli; print(sorted(m for m in ('streamlit', 'numpy', 'pandas') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,93 @@
+"""
+CounterSync.apply が、ビルド済みのコンポーネントが実際に送ってくる値を反映できること
+"""
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from src.assets import COMPONENT_DIRS, referenced_files
+from src.counters import CounterSync
+from src.grid import GridReader, get_posterior_grid
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def bundle_path(name: str) -> str:
+    build_dir = COMPONENT_DIRS[name]
+    scripts = [f for f in referenced_files(build_dir) if f.endswith(".js")]
+    assert len(scripts) == 1, scripts
+    return os.path.join(build_dir, scripts[0])
+
+def drive_swipe_counter(**options):
+    """ビルド済みのスワイプカウンターで +1 を clicks 回押し、送られた値の並びと表示された期待度を返す"""
+    result = subprocess.run(
+        ["node", os.path.join(HERE, "js", "drive_swipe_counter.mjs"), bundle_path("swipe_counter"), json.dumps(options)],
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node がない")
+def test_swipe_bundle_taps_are_counted_once():
+    messages = drive_swipe_counter(clicks=3)["sent"]
+    assert messages and all(message["protocol"] == 1 for message in messages)
+
+    sync = CounterSync(1)
+    for message in messages:
+        sync.apply(message)
+    assert sync.values == [3]
+    assert sync.ack() == {"client": messages[-1]["client"], "seq": 3}
+
+    # 同じ値で再実行されても二重に数えない
+    assert not sync.apply(messages[-1])
+    assert sync.values == [3]
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node がない")
+def test_swipe_bundle_coalesces_taps():
+    messages = drive_swipe_counter(clicks=5, batch_ms=100)["sent"]
+    assert len(messages) == 1
+    assert messages[0]["ops"] == [{"seq": 1, "delta": 5}]
+
+    sync = CounterSync(1, [10])
+    assert sync.apply(messages[0])
+    assert sync.values == [15]
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node がない")
+def test_swipe_bundle_reads_posterior_grid(tmp_path):
+    _, blob = get_posterior_grid()
+    path = tmp_path / "grid.bin"
+    path.write_bytes(blob)
+    result = drive_swipe_counter(clicks=3, value=90, spins=3000, grid=str(path))
+
+    # タップ直後の表示はバンドルが早見表を引いた値で、Python 側の読み出しと一致する
+    expected = GridReader(blob).lookup(3000, 93)
+    assert result["estimate"] == "".join(
+        f"<span>{code}期待度 {expected[code] * 100:.0f}%</span>" for code in ("456", "56")
+    )
+    # 早見表を受け取った後の送信には識別子が載る（以降 Python は表を送り直さない）
+    sync = CounterSync(1, [90])
+    sync.apply(result["sent"][-1])
+    assert sync.values == [93]
+    assert sync.client_grid == "test-grid"
+
+def test_koyaku_bundle_payload():
+    # 小役カウンター (src/index.tsx の sendOps) が送る形。接続直後に保存済みの値を set で送り、以降は差分を送る
+    with open(bundle_path("koyaku_counter"), "r", encoding="utf-8") as f:
+        source = f.read()
+    for field in ("protocol:", "ops:", "primaryCount:", "rtt_ms:"):
+        assert field in source
+
+    client = "5c1e0b6a-test"
+    init = {"protocol": 1, "client": client, "ops": [{"seq": 1, "set": [4, 1, 0, 0, 0, 2, 0, 0, 0, 0]}],
+            "primaryCount": 4, "counts": [4, 1, 0, 0, 0, 2, 0, 0, 0, 0], "grid": None, "rtt_ms": None, "origin": "init"}
+    taps = dict(init, ops=init["ops"] + [{"seq": 2, "delta": [2, 0, 1, 0, 0, 0, 0, 0, 0, 0]}],
+                primaryCount=6, counts=[6, 1, 1, 0, 0, 2, 0, 0, 0, 0], rtt_ms=38, origin="adjust")
+
+    sync = CounterSync(10)
+    assert sync.apply(init)
+    assert sync.apply(taps)
+    assert sync.values == [6, 1, 1, 0, 0, 2, 0, 0, 0, 0]
+    assert sync.ack() == {"client": client, "seq": 2}
+    assert sync.stale_ops == 1
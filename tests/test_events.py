@@ -0,0 +1,86 @@
+"""
+カウンター操作の永続ログ (src/events.py)
+"""
+import random
+import sqlite3
+
+import pytest
+
+from src.events import EventStore
+from src.state import PosteriorState
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "events.sqlite3")
+
+def test_append_flush_replay(store_path):
+    store = EventStore(store_path)
+    try:
+        store.append("s1", "m", delta_spins=100)
+        store.append("s1", "m", delta_hits=3)
+        store.append("s1", "other", delta_spins=7)
+        store.append("s2", "m", delta_spins=50, delta_hits=1)
+        store.append("s1", "m", 0, 0)  # 変化なしは記録しない
+        assert store.flush(timeout=5)
+        assert store.replay("s1", "m") == (100, 3)
+        assert store.replay("s1", "other") == (7, 0)
+        assert store.replay("s2", "m") == (50, 1)
+        assert store.replay("unknown", "m") == (0, 0)
+        assert [(e["delta_spins"], e["delta_hits"]) for e in store.history("s1", "m")] == [(100, 0), (0, 3)]
+        assert store.stats()["written"] == 4
+    finally:
+        store.close()
+
+def test_snapshot_plus_tail_equals_full_replay(store_path):
+    rng = random.Random(0)
+    deltas = [(rng.randint(1, 20), rng.randint(-1, 2)) for _ in range(137)]
+    store = EventStore(store_path, batch_size=16, snapshot_interval=10)
+    try:
+        for spins, hits in deltas:
+            store.append("s", "m", spins, hits)
+        assert store.flush(timeout=5)
+        expected = (sum(d[0] for d in deltas), sum(d[1] for d in deltas))
+        assert store.replay("s", "m") == expected
+        history = store.history("s", "m")
+        assert (sum(e["delta_spins"] for e in history), sum(e["delta_hits"] for e in history)) == expected
+    finally:
+        store.close()
+
+    # スナップショットが取られていて、その後ろに差分が残っている
+    conn = sqlite3.connect(store_path)
+    last_id, spins, hits = conn.execute("SELECT last_event_id, num_spins, num_hits FROM snapshots").fetchone()
+    (total,) = conn.execute("SELECT COUNT(*) FROM events").fetchone()
+    conn.close()
+    assert 0 < last_id < total
+    assert (spins, hits) == (sum(d[0] for d in deltas[:last_id]), sum(d[1] for d in deltas[:last_id]))
+
+def test_reopen_after_close(store_path):
+    store = EventStore(store_path, snapshot_interval=3)
+    for _ in range(5):
+        store.append("s", "m", 10, 1)
+    store.close()
+
+    store = EventStore(store_path, snapshot_interval=3)
+    try:
+        assert store.replay("s", "m") == (50, 5)
+        store.append("s", "m", 10, 0)
+        assert store.flush(timeout=5)
+        assert store.replay("s", "m") == (60, 5)
+        assert len(store.history("s", "m")) == 6
+    finally:
+        store.close()
+
+def test_undo_with_negative_deltas(store_path):
+    store = EventStore(store_path, snapshot_interval=2)
+    try:
+        store.append("s", "m", 30, 2)
+        store.append("s", "m", delta_hits=-1)
+        store.append("s", "m", delta_spins=-10)
+        store.append("s", "m", delta_hits=-1)
+        assert store.flush(timeout=5)
+        assert store.replay("s", "m") == (20, 0)
+        state = store.restore_state("s", "m")
+        assert isinstance(state, PosteriorState)
+        assert (state.num_spins, state.num_hits) == (20, 0)
+    finally:
+        store.close()
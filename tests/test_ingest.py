@@ -0,0 +1,62 @@
+"""
+ホールデータの一括判別 (src/ingest.py)
+"""
+import io
+
+import pytest
+
+from src.batch import compute_posteriors_batch
+from src.ingest import parse_time, rank_hall_data
+from src.specs import MachineSpec
+
+def rank(text: str, **kwargs):
+    return rank_hall_data(io.StringIO(text), **kwargs)
+
+def test_invalid_rows_are_skipped():
+    ranking = rank("machine,spins,hits\n1,0,0\n2,3000,95\n3,100,150\n4,-5,0\n5,100,-1\n")
+    assert [row["machine"] for row in ranking] == ["2"]
+
+def test_latest_snapshot_compares_times_numerically():
+    # 文字列の比較では "9" > "10" になり、古い 9時の行が残ってしまう
+    ranking = rank("machine,spins,hits,time\n1,3000,95,10\n1,1000,20,9\n")
+    assert [(row["n"], row["k"]) for row in ranking] == [(3000, 95)]
+
+    ranking = rank("machine,spins,hits,time\n1,3000,95,10:05\n1,1000,20,9:30\n")
+    assert [(row["n"], row["k"]) for row in ranking] == [(3000, 95)]
+
+def test_latest_snapshot_merges_chunks_by_time():
+    text = "machine,spins,hits,time\n1,3000,95,2024/01/01 10:00\n2,500,10,9\n1,1000,20,2024-01-01 09:00\n"
+    ranking = rank(text, chunk_size=1)
+    assert sorted((row["machine"], row["n"]) for row in ranking) == [("1", 3000), ("2", 500)]
+
+def test_parse_time():
+    assert parse_time("9") < parse_time("10")
+    assert parse_time("9:59") < parse_time("10:00")
+    assert parse_time("2024-01-01 09:00") < parse_time("2024/01/01 10:00")
+    assert parse_time("") == parse_time("?") == float("-inf")
+
+def six_setting_spec() -> MachineSpec:
+    config = {
+        "min_sample_warn": 100, "min_sample_good": 200,
+        "goal_thresholds": {"high": 75.0, "mid": 65.0, "low": 48.0},
+        "diff_thresholds": {"high": 15.0, "mid": 7.0},
+    }
+    return MachineSpec({
+        "id": "six_settings",
+        "settings": {"1": 0.02, "2": 0.022, "3": 0.025, "4": 0.03, "5": 0.035, "6": 0.04},
+        "goal_groups": {"6": {"goal": ["6"], "alt": ["1", "2", "3", "4", "5"]}},
+        "goal_config": {"6": config},
+    })
+
+def test_ranking_uses_the_given_spec():
+    spec = six_setting_spec()
+    priors = {key: 1.0 for key in spec.keys}
+    ranking = rank("machine,spins,hits\n1,3000,60\n2,3000,120\n", priors=priors, sort_by="6", spec=spec)
+    assert [row["machine"] for row in ranking] == ["2", "1"]
+    assert list(ranking[0]["posteriors"]) == spec.keys
+    expected = compute_posteriors_batch([3000], [120], priors, spec)[0]
+    assert ranking[0]["prob_6"] == pytest.approx(expected[-1])
+    assert "prob_456" not in ranking[0]
+
+    with pytest.raises(ValueError):
+        rank("machine,spins,hits\n1,3000,60\n", sort_by="456", spec=spec)
@@ -0,0 +1,55 @@
+"""
+src/logic.py の対数テーブルと尤度
+"""
+import math
+import threading
+
+import numpy as np
+import pytest
+
+from src.logic import LogFactorialTable, calculate_likelihood, calculate_log_likelihood, compute_posteriors
+
+PRIORS = {"1": 0.2, "2": 0.2, "4": 0.2, "5": 0.2, "6": 0.2}
+
+def test_log_table_concurrent_ensure():
+    table = LogFactorialTable(initial_size=1)
+    barrier = threading.Barrier(8)
+
+    def grow(n):
+        barrier.wait()
+        table.ensure(n)
+
+    threads = [threading.Thread(target=grow, args=(50_000 + i * 1000,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert table.size >= 57_000
+    for n in (1, 2, 1000, 33_333, 57_000, table.size):
+        assert table.log_factorial(n) == math.lgamma(n + 1)
+
+def test_log_table_is_capped():
+    # 上限を超える n はテーブルを広げずに lgamma で求める
+    table = LogFactorialTable(initial_size=1, max_size=1000)
+    assert table.log_comb(10 ** 9, 10 ** 7) == pytest.approx(
+        math.lgamma(10 ** 9 + 1) - math.lgamma(10 ** 7 + 1) - math.lgamma(10 ** 9 - 10 ** 7 + 1)
+    )
+    assert table.log_factorial(5000) == math.lgamma(5001)
+    table.ensure(10 ** 9)
+    assert table.size == 1000
+    assert table.log_factorial(1000) == math.lgamma(1001)
+
+    log_likelihood = calculate_log_likelihood(10 ** 9, 3 * 10 ** 7, 0.03)
+    assert math.isfinite(log_likelihood) and log_likelihood < 0.0
+
+def test_float_counts():
+    # 集計値などの float の回数も受け付ける（整数値なら整数と同じ結果）
+    assert calculate_likelihood(100.0, 3, 0.03) == calculate_likelihood(100, 3, 0.03)
+    assert compute_posteriors(100.0, 3.0, PRIORS) == compute_posteriors(100, 3, PRIORS)
+    assert compute_posteriors(np.int64(100), np.int64(3), PRIORS) == compute_posteriors(100, 3, PRIORS)
+
+    expected = math.lgamma(101.5) - math.lgamma(4.5) - math.lgamma(98.0) + 3.5 * math.log(0.03) + 97.0 * math.log1p(-0.03)
+    assert calculate_log_likelihood(100.5, 3.5, 0.03) == pytest.approx(expected)
+    posteriors = compute_posteriors(100.5, 3.5, PRIORS)
+    assert sum(posteriors.values()) == pytest.approx(1.0)
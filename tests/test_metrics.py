@@ -0,0 +1,111 @@
+"""
+処理時間・件数の計測 (src/metrics.py)
+"""
+import re
+
+import pytest
+
+from src import metrics
+from src.metrics import MetricsRegistry
+
+BUCKETS = (0.001, 0.01, 0.1)
+
+def test_counter_and_histogram_accumulate():
+    registry = MetricsRegistry(BUCKETS)
+    registry.inc("requests_total", path="/a")
+    registry.inc("requests_total", 2, path="/a")
+    registry.inc("requests_total", path="/b")
+    for value in (0.0005, 0.005, 0.005, 0.05, 2.0):
+        registry.observe("latency_seconds", value, stage="x")
+
+    snapshot = registry.snapshot()
+    counters = {c["labels"]["path"]: c["value"] for c in snapshot["counters"]}
+    assert counters == {"/a": 3.0, "/b": 1.0}
+    (histogram,) = snapshot["histograms"]
+    assert histogram["count"] == 5
+    assert histogram["total_ms"] == pytest.approx(2060.5)
+    assert histogram["max_ms"] == pytest.approx(2000.0)
+    assert histogram["p50_ms"] == pytest.approx(10.0)
+
+    registry.clear()
+    assert registry.snapshot() == {"histograms": [], "counters": []}
+
+def test_render_prometheus_format():
+    registry = MetricsRegistry(BUCKETS)
+    registry.inc("mtv_reruns_total", scope="script")
+    registry.inc("mtv_reruns_total", scope='a"b')
+    for value in (0.0005, 0.005, 0.05, 2.0):
+        registry.observe("mtv_stage_seconds", value, stage="css")
+    registry.register_collector("cache", lambda: [("cache_entries", "gauge", {"kind": "result"}, 7)])
+    text = registry.render_prometheus()
+    lines = text.splitlines()
+
+    assert text.endswith("\n")
+    assert "# HELP mtv_reruns_total スクリプト・フラグメントの再実行回数" in lines
+    assert lines.count("# TYPE mtv_reruns_total counter") == 1
+    assert 'mtv_reruns_total{scope="script"} 1' in lines
+    assert 'mtv_reruns_total{scope="a\\"b"} 1' in lines
+
+    assert "# TYPE mtv_stage_seconds histogram" in lines
+    # バケットは累積で、+Inf は総数に等しい
+    assert [line for line in lines if line.startswith("mtv_stage_seconds_bucket")] == [
+        'mtv_stage_seconds_bucket{stage="css",le="0.001"} 1',
+        'mtv_stage_seconds_bucket{stage="css",le="0.01"} 2',
+        'mtv_stage_seconds_bucket{stage="css",le="0.1"} 3',
+        'mtv_stage_seconds_bucket{stage="css",le="+Inf"} 4',
+    ]
+    assert 'mtv_stage_seconds_sum{stage="css"} 2.055500' in lines
+    assert 'mtv_stage_seconds_count{stage="css"} 4' in lines
+
+    assert "# TYPE cache_entries gauge" in lines
+    assert 'cache_entries{kind="result"} 7' in lines
+
+    sample = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{[^}]*\})? [-+0-9.e]+$')
+    assert all(line.startswith("# ") or sample.match(line) for line in lines)
+
+@pytest.fixture
+def enabled(monkeypatch):
+    registry = MetricsRegistry(BUCKETS)
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    monkeypatch.setattr(metrics, "PROFILER", None)
+    monkeypatch.setattr(metrics, "METRICS_FILE", None)
+    return registry
+
+def histogram_counts(registry):
+    return {
+        (h["name"], tuple(sorted(h["labels"].items()))): h["count"]
+        for h in registry.snapshot()["histograms"]
+    }
+
+def test_span_timed_and_rerun(enabled):
+    @metrics.timed("work")
+    def work():
+        with metrics.span("inner"):
+            return 42
+
+    @metrics.rerun("fragment")
+    def fragment():
+        return work()
+
+    @metrics.rerun("script")
+    def script():
+        return fragment() + work()
+
+    assert script() == 84
+    counts = histogram_counts(enabled)
+    assert counts[("mtv_stage_seconds", (("stage", "work"),))] == 2
+    assert counts[("mtv_stage_seconds", (("stage", "inner"),))] == 2
+    assert counts[("mtv_rerun_seconds", (("scope", "script"),))] == 1
+    assert counts[("mtv_rerun_seconds", (("scope", "fragment"),))] == 1
+    reruns = {c["labels"]["scope"]: c["value"] for c in enabled.snapshot()["counters"]}
+    assert reruns == {"script": 1.0, "fragment": 1.0}
+
+def test_disabled_is_a_no_op(monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", False)
+
+    def func():
+        return 1
+    assert metrics.timed("x")(func) is func
+    assert metrics.rerun("x")(func) is func
+    assert metrics.span("x") is metrics.span("y")
@@ -0,0 +1,121 @@
+"""
+複数の判別要素を組み合わせた尤度モデル (src/model.py) と、その評価経路
+"""
+import json
+import math
+import os
+
+import numpy as np
+import pytest
+
+from src import specs
+from src.batch import compute_posteriors_batch
+from src.logic import compute_posteriors
+from src.model import MAIN_INDICATOR, JointModel, MultinomialIndicator, default_model, five_coin_indicator
+from src.state import PosteriorState
+
+PRIORS = {"1": 0.4, "2": 0.3, "4": 0.1, "5": 0.1, "6": 0.1}
+
+# 設定1・2では出ない「金」を含む終了画面（設定ごとの確率はテスト用の値）
+TROPHY = {
+    "type": "multinomial",
+    "name": "trophy",
+    "label": "トロフィー",
+    "categories": ["銅", "金"],
+    "probs": {"1": [0.2, 0.0], "2": [0.2, 0.0], "4": [0.25, 0.01], "5": [0.3, 0.02], "6": [0.3, 0.04]},
+    "remainder": "なし",
+}
+
+def trophy_indicator():
+    return MultinomialIndicator(TROPHY["name"], TROPHY["label"], TROPHY["categories"], TROPHY["probs"], TROPHY["remainder"])
+
+def test_default_model_matches_compute_posteriors():
+    model = default_model()
+    for n, k in ((1, 0), (100, 3), (3000, 95), (100_000, 3500)):
+        expected = compute_posteriors(n, k, PRIORS)
+        actual = model.posteriors({MAIN_INDICATOR: {"n": n, "k": k}}, PRIORS)
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+def test_impossible_outcome():
+    model = JointModel([five_coin_indicator(), trophy_indicator()])
+    observations = {MAIN_INDICATOR: {"n": 3000, "k": 95}, "trophy": {"金": 1}}
+    log_likelihood = model.log_likelihood_matrix(model.count_vector(observations))[0]
+    assert log_likelihood[0] == log_likelihood[1] == -math.inf
+    assert np.isfinite(log_likelihood[2:]).all()
+    posteriors = model.posteriors(observations, PRIORS)
+    assert posteriors["1"] == posteriors["2"] == 0.0
+    assert sum(posteriors.values()) == pytest.approx(1.0)
+
+    # 全設定で出ない出目しかない場合は事前確率を返す
+    never = MultinomialIndicator("never", "出ない演出", ["出た"], {key: [0.0] for key in PRIORS}, "なし")
+    model = JointModel([five_coin_indicator(), never])
+    posteriors = model.posteriors({"never": {"出た": 1}}, PRIORS)
+    assert posteriors == pytest.approx({key: value / sum(PRIORS.values()) for key, value in PRIORS.items()})
+
+def test_posteriors_batch_shape_and_parity():
+    model = JointModel([five_coin_indicator(), trophy_indicator()])
+    observations = [
+        {MAIN_INDICATOR: {"n": 3000, "k": 95}},
+        {MAIN_INDICATOR: {"n": 500, "k": 10}, "trophy": {"銅": 2, "なし": 3}},
+        {"trophy": {"金": 1}},
+        {},
+    ]
+    matrix = model.posteriors_batch(observations, PRIORS)
+    assert matrix.shape == (len(observations), len(model.keys))
+    for row, observation in zip(matrix, observations):
+        assert dict(zip(model.keys, row.tolist())) == pytest.approx(model.posteriors(observation, PRIORS))
+    assert model.posteriors_batch([], PRIORS).shape == (0, len(model.keys))
+
+    # 主要素だけなら compute_posteriors_batch と同じ
+    n = np.array([3000, 500, 0, 10])
+    k = np.array([95, 10, 0, 11])
+    rows = [{MAIN_INDICATOR: {"n": int(a), "k": int(b)}} for a, b in zip(n, k)]
+    assert np.allclose(default_model().posteriors_batch(rows, PRIORS), compute_posteriors_batch(n, k, PRIORS))
+
+@pytest.fixture
+def trophy_spec(tmp_path, monkeypatch):
+    """同梱のモンキーターンVに TROPHY を足した仕様を一時ディレクトリに置く"""
+    with open(os.path.join(specs.ROOT_DIR, "specs", "monkey_turn_v.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    data["indicators"] = [TROPHY]
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    (directory / "monkey_turn_v.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    (directory / "index.json").write_text(
+        json.dumps({"machines": {"monkey_turn_v": {"name": data["name"], "file": "monkey_turn_v.json"}}}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("MACHINE_SPEC_DIR", str(directory))
+    specs.clear_spec_cache()
+    yield specs.get_spec()
+    monkeypatch.delenv("MACHINE_SPEC_DIR")
+    specs.clear_spec_cache()
+
+def test_state_uses_spec_model(trophy_spec):
+    state = PosteriorState(PRIORS, 3000, 95, trophy_spec)
+    assert state.posteriors() == pytest.approx(compute_posteriors(3000, 95, PRIORS))
+
+    state.set_observation("trophy", {"銅": 2, "金": 1, "なし": 0})
+    expected = trophy_spec.model().posteriors({MAIN_INDICATOR: {"n": 3000, "k": 95}, "trophy": {"銅": 2, "金": 1}}, PRIORS)
+    assert state.posteriors() == pytest.approx(expected)
+    assert state.posteriors()["1"] == 0.0
+    assert state.observation_signature() == (("trophy", (("金", 1), ("銅", 2))),)
+
+    state.set_observation("trophy", {"金": 0})
+    assert state.observations == {}
+    assert state.posteriors() == pytest.approx(compute_posteriors(3000, 95, PRIORS))
+
+def test_app_accepts_indicator_counts(trophy_spec, tmp_path, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    monkeypatch.setenv("EVENT_STORE_PATH", str(tmp_path / "events.db"))
+    at = AppTest.from_file(os.path.join(specs.ROOT_DIR, "main.py"), default_timeout=60).run()
+    at.number_input(key="num_n").set_value(3000).run()
+    at.number_input(key="num_k").set_value(95).run()
+    before = at.session_state["posterior_state"].posteriors()
+
+    at.number_input(key="obs_monkey_turn_v_trophy_金").set_value(1).run()
+    assert not at.exception, at.exception
+    state = at.session_state["posterior_state"]
+    assert state.observations == {"trophy": {"金": 1}}
+    assert state.posteriors()["1"] == 0.0 and before["1"] > 0.0
@@ -0,0 +1,34 @@
+"""
+判別までの回転数の見積もり (src/planner.py)
+"""
+import numpy as np
+
+from src import planner
+
+def test_boundary_table_matches_goal_probability():
+    planner.clear_planner_cache()
+    k_upper, k_lower = planner._boundary_table("456", 0.8, 0.2, (0.2,) * 5, 10, 3, 40)
+    priors = {key: 0.2 for key in planner.SETTING_KEYS}
+    n = 10 * np.arange(3, 43)
+    prob_upper = planner._goal_probability("456", n, np.minimum(k_upper, n), priors)
+    prob_below = planner._goal_probability("456", n, np.maximum(k_upper - 1, 0), priors)
+    reached = k_upper <= n
+    assert np.all(prob_upper[reached] >= 0.8)
+    assert np.all(prob_below[reached & (k_upper > 0)] < 0.8)
+    assert np.all(planner._goal_probability("456", n, np.maximum(k_lower, 0), priors)[k_lower >= 0] <= 0.2)
+
+def test_boundary_table_reused_across_counts():
+    planner.clear_planner_cache()
+    first = planner.plan_spins(3000, 98)
+    misses = planner._boundary_chunk.cache_info().misses
+    # 小役を数えた・少し回しただけの再計算では境界表を作り直さない
+    planner.plan_spins(3000, 97)
+    planner.plan_spins(3007, 97)
+    assert planner._boundary_chunk.cache_info().misses == misses
+    planner.clear_planner_cache()
+    assert planner.plan_spins(3000, 98)["mixture"]["p_high"] == first["mixture"]["p_high"]
+
+def test_first_check_on_step_multiple():
+    result = planner.plan_spins(3007, 97, max_spins=200)
+    assert not result["already_decided"]
+    assert result["mixture"]["spins"][:3] == [3, 13, 23]
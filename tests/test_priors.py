@@ -0,0 +1,46 @@
+"""
+ホール・曜日別の事前確率の学習 (src/priors.py)
+"""
+import numpy as np
+import pytest
+
+from src import priors
+from src.priors import DAY_KINDS, HistoryRecords, fit_priors
+
+def make_records(halls: int = 3, rows: int = 400, seed: int = 0) -> HistoryRecords:
+    rng = np.random.default_rng(seed)
+    # ホール0は行が多く、それ以外は少ない。特日 (event) の行はないので空のグループができる
+    hall_index = np.concatenate([np.zeros(rows, dtype=np.int64), rng.integers(1, halls, size=rows // 10)])
+    kind_index = rng.integers(0, len(DAY_KINDS) - 1, size=len(hall_index))
+    spins = rng.integers(500, 8000, size=len(hall_index)).astype(np.float64)
+    hits = rng.binomial(spins.astype(np.int64), 1 / 30.0).astype(np.float64)
+    return HistoryRecords([f"hall{h}" for h in range(halls)], hall_index, kind_index, spins, hits)
+
+@pytest.mark.parametrize("min_rows", [1, 10 ** 9])
+def test_grouped_em_matches_either_path(monkeypatch, min_rows):
+    # 行の多いグループと少ないグループで計算の仕方を分けても、結果は変わらない
+    records = make_records()
+    expected = fit_priors(records)
+    monkeypatch.setattr(priors, "EM_LOOP_MIN_ROWS", min_rows)
+    fitted = fit_priors(records)
+    assert fitted["iterations"] == expected["iterations"]
+    for hall, entry in expected["halls"].items():
+        assert np.allclose(fitted["halls"][hall]["all"], entry["all"], atol=1e-9)
+
+def test_zero_strength_keeps_empty_groups_finite():
+    fitted = fit_priors(make_records(), strength=0.0)
+    for entry in fitted["halls"].values():
+        assert np.isfinite(entry["all"]).all()
+        assert all(np.isfinite(values).all() for values in entry["days"].values())
+
+def test_zero_strength_leaves_empty_group_at_base():
+    likelihood = np.random.default_rng(0).random((10, 5))
+    base = np.full((2, 5), 0.2)
+    mix, _ = priors.fit_mixture(likelihood, np.array([0, 10, 10]), base, 0.0, 50, 1e-6)
+    assert np.isfinite(mix).all()
+    assert np.allclose(mix.sum(axis=1), 1.0)
+    assert (mix[1] == base[1]).all()
+
+def test_negative_strength_is_rejected():
+    with pytest.raises(ValueError):
+        fit_priors(make_records(), strength=-1.0)
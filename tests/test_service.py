@@ -0,0 +1,140 @@
+"""
+判別 API (src/service.py) の要求の検証
+"""
+import asyncio
+import json
+
+import pytest
+
+from src.service import EvaluationService
+
+async def exchange(request: bytes, **config) -> bytes:
+    service = EvaluationService({"host": "127.0.0.1", "port": 0, **config})
+    await service.start()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 10)
+        writer.close()
+        return response
+    finally:
+        await service.stop()
+
+def post(body: bytes, length: str) -> bytes:
+    request = f"POST /evaluate HTTP/1.1\r\nHost: test\r\nContent-Length: {length}\r\nConnection: close\r\n\r\n".encode() + body
+    return asyncio.run(exchange(request))
+
+@pytest.mark.parametrize("length", ["abc", "-5", "+5", "1.5", "5, 5"])
+def test_invalid_content_length_is_rejected(length):
+    status_line, _, rest = post(b'{"n": 3000, "k": 95}', length).partition(b"\r\n")
+    assert status_line.split()[1] == b"400"
+    assert "Content-Length" in json.loads(rest.split(b"\r\n\r\n", 1)[1])["error"]
+
+def test_valid_request():
+    body = b'{"n": 3000, "k": 95}'
+    status_line, _, rest = post(body, str(len(body))).partition(b"\r\n")
+    assert status_line.split()[1] == b"200"
+    result = json.loads(rest.split(b"\r\n\r\n", 1)[1])
+    assert (result["n"], result["k"]) == (3000, 95)
+    assert 0.0 < result["456"]["prob"] < 1.0
+
+def status_of(response: bytes) -> int:
+    return int(response.split(b"\r\n", 1)[0].split()[1])
+
+def test_too_many_headers():
+    headers = "".join(f"X-Test-{i}: {i}\r\n" for i in range(5))
+    request = f"GET /health HTTP/1.0\r\n{headers}\r\n".encode()
+    assert status_of(asyncio.run(exchange(request, max_headers=5))) == 200
+    assert status_of(asyncio.run(exchange(request, max_headers=4))) == 431
+
+def test_oversized_lines():
+    # StreamReader の上限（64 KiB）を超える行は例外で接続を落とさずに応答する
+    long_header = b"GET /health HTTP/1.1\r\nX-Long: " + b"a" * (70 * 1024) + b"\r\n\r\n"
+    assert status_of(asyncio.run(exchange(long_header))) == 431
+    long_path = b"GET /" + b"a" * (70 * 1024) + b" HTTP/1.1\r\n\r\n"
+    assert status_of(asyncio.run(exchange(long_path))) == 400
+
+def test_header_timeout():
+    # ヘッダーの途中で止まった接続は header_timeout で打ち切る
+    request = b"GET /health HTTP/1.1\r\nHost: test\r\n"
+    assert status_of(asyncio.run(exchange(request, header_timeout=0.2))) == 408
+
+def test_body_timeout():
+    # 本文の途中で止まった接続も body_timeout で打ち切る
+    request = b"POST /evaluate HTTP/1.1\r\nHost: test\r\nContent-Length: 65536\r\n\r\n" + b'{"n": 3000, '
+    response = asyncio.run(exchange(request, body_timeout=0.2))
+    assert status_of(response) == 408
+    assert b"Connection: close" in response
+
+def response_json(response: bytes):
+    return json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+def post_json(payload: str) -> bytes:
+    return post(payload.encode(), str(len(payload.encode())))
+
+@pytest.mark.parametrize("payload", [
+    '{"n": 1e400, "k": 1}',
+    '{"n": 3000, "k": 1e400}',
+    '{"n": %d, "k": 1}' % 10 ** 300,
+    '{"n": 3000, "k": 95, "priors": {"1": "nan", "2": 1, "4": 1, "5": 1, "6": 1}}',
+    '{"n": 3000, "k": 95, "priors": {"1": "inf", "2": 1, "4": 1, "5": 1, "6": 1}}',
+    '{"n": 3000, "k": 95, "priors": {"1": %d, "2": 1, "4": 1, "5": 1, "6": 1}}' % 10 ** 400,
+])
+def test_out_of_range_values_are_rejected(payload):
+    response = post_json(payload)
+    assert status_of(response) == 400
+    assert "error" in response_json(response)
+
+def test_failing_row_does_not_fail_its_batch(monkeypatch):
+    # 一括計算が失敗したら1件ずつ計算し直し、失敗した要求だけをエラーにする
+    import src.service as service
+
+    def summarize(n, k, posteriors):
+        if n == 666:
+            raise RuntimeError("boom")
+        return {"n": n, "k": k}
+    monkeypatch.setattr(service, "summarize", summarize)
+
+    async def run():
+        batcher = service.MicroBatcher(0.0, 16, 16)
+        priors = (1.0,) * 5
+        futures = [batcher.submit(n, 10, priors) for n in (1000, 666, 2000)]
+        batcher._compute([await batcher._queue.get() for _ in futures])
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    ok1, failed, ok2 = asyncio.run(run())
+    assert ok1 == {"n": 1000, "k": 10} and ok2 == {"n": 2000, "k": 10}
+    assert isinstance(failed, RuntimeError)
+
+def test_unexpected_error_returns_500(monkeypatch):
+    import src.service as service
+
+    def summarize(n, k, posteriors):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(service, "summarize", summarize)
+    response = post_json('{"n": 3000, "k": 95}')
+    assert status_of(response) == 500
+    assert "error" in response_json(response)
+
+@pytest.mark.parametrize("rows", ["1", '{"n": 3000, "k": 95}', '"rows"'])
+def test_rows_must_be_a_list(rows):
+    response = post_json('{"n": 3000, "k": 95, "rows": %s}' % rows)
+    assert status_of(response) == 400
+    assert "rows" in response_json(response)["error"]
+
+def test_rows_that_do_not_fit_are_not_queued():
+    # 入りきらない rows は1件も積まずに 503 を返す
+    import src.service as service
+
+    async def run():
+        batcher = service.MicroBatcher(0.0, 16, 3)
+        priors = (1.0,) * 5
+        batcher.submit(1000, 10, priors)
+        with pytest.raises(asyncio.QueueFull):
+            batcher.submit_many([(1000, 10, priors)] * 3)
+        queued = batcher._queue.qsize()
+        futures = batcher.submit_many([(1000, 10, priors)] * 2)
+        return queued, len(futures), batcher._queue.qsize(), batcher.rejected
+
+    assert asyncio.run(run()) == (1, 2, 3, 3)
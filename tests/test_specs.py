@@ -0,0 +1,126 @@
+"""
+機種仕様の登録簿 (src/specs.py)
+"""
+import json
+import os
+import shutil
+
+import pytest
+
+from src import specs
+from src.constants import GOAL_CONFIG, GOAL_GROUPS, SETTINGS
+
+SHIPPED_DIR = os.path.join(specs.ROOT_DIR, "specs")
+
+@pytest.fixture
+def spec_dir(monkeypatch):
+    def use(directory):
+        monkeypatch.setenv("MACHINE_SPEC_DIR", str(directory))
+        specs.clear_spec_cache()
+
+    yield use
+    monkeypatch.delenv("MACHINE_SPEC_DIR", raising=False)
+    specs.clear_spec_cache()
+
+def add_test_machine(directory):
+    """同梱のモンキーターンVを写して、ID と名前だけ違う機種を索引に足す"""
+    shutil.copytree(SHIPPED_DIR, directory, dirs_exist_ok=True)
+    with open(os.path.join(directory, "monkey_turn_v.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    data.update(id="test_machine", name="テスト機種", title="テスト機種")
+    with open(os.path.join(directory, "test_machine.json"), "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    index["machines"]["test_machine"] = {"name": "テスト機種", "file": "test_machine.json"}
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+
+def test_shipped_monkey_turn_v_matches_constants(spec_dir):
+    spec_dir(SHIPPED_DIR)
+    assert specs._read_index()["monkey_turn_v"]["file"] == "monkey_turn_v.json"
+
+    spec = specs.get_spec("monkey_turn_v")
+    assert spec.probs == SETTINGS
+    assert spec.keys == list(SETTINGS)
+    assert spec.goal_groups == GOAL_GROUPS
+    assert spec.goal_config == GOAL_CONFIG
+    assert (spec.name, spec.title, spec.indicator) == ("スマスロ モンキーターンV", "モンキーターンV", "5枚役")
+    assert specs.get_spec("default") is spec
+
+@pytest.mark.parametrize("groups", [
+    {"456": {"goal": ["4", "5", "6"]}},
+    {"456": ["4", "5", "6"]},
+    ["456"],
+])
+def test_malformed_goal_groups(groups):
+    with open(os.path.join(SHIPPED_DIR, "monkey_turn_v.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    data["goal_groups"] = groups
+    with pytest.raises(ValueError, match="機種仕様の形式が不正です"):
+        specs.MachineSpec(data)
+
+@pytest.mark.parametrize("goal, alt", [
+    (["1", "5", "6"], ["2", "4"]),
+    (["4", "5", "6"], ["1", "2", "6"]),
+])
+def test_goal_settings_must_be_more_likely_than_alt(goal, alt):
+    with open(os.path.join(SHIPPED_DIR, "monkey_turn_v.json"), encoding="utf-8") as f:
+        data = json.load(f)
+    data["goal_groups"]["456"] = {"goal": goal, "alt": alt}
+    with pytest.raises(ValueError, match="goal の設定の確率"):
+        specs.MachineSpec(data)
+
+def test_builtin_is_used_without_index(spec_dir, tmp_path):
+    spec_dir(tmp_path)
+    assert specs.list_machines() == [("monkey_turn_v", "スマスロ モンキーターンV")]
+    assert specs.get_spec().probs == SETTINGS
+
+def test_machines_from_index(spec_dir, tmp_path):
+    add_test_machine(tmp_path)
+    spec_dir(tmp_path)
+    assert specs.list_machines() == [("monkey_turn_v", "スマスロ モンキーターンV"), ("test_machine", "テスト機種")]
+    assert specs.get_spec("test_machine").title == "テスト機種"
+    assert specs.resolve_machine("unknown") == specs.DEFAULT_MACHINE
+
+def test_machine_select_switches_machine(spec_dir, tmp_path, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    add_test_machine(tmp_path / "specs")
+    spec_dir(tmp_path / "specs")
+    monkeypatch.setenv("EVENT_STORE_PATH", str(tmp_path / "events.db"))
+
+    at = AppTest.from_file(os.path.join(specs.ROOT_DIR, "main.py"), default_timeout=60).run()
+    assert not at.exception, at.exception
+    select = at.selectbox(key="machine_select")
+    assert select.options == ["スマスロ モンキーターンV", "テスト機種"]
+
+    select.set_value("test_machine").run()
+    assert not at.exception, at.exception
+    assert at.session_state["machine"] == "test_machine"
+
+def test_cli_evaluates_registered_machine(spec_dir, tmp_path, capsys):
+    from src import cli
+
+    add_test_machine(tmp_path)
+    with open(tmp_path / "test_machine.json", encoding="utf-8") as f:
+        data = json.load(f)
+    data["settings"] = {"1": 0.02, "3": 0.025, "6": 0.04}
+    data["goal_groups"] = {"6": {"goal": ["6"], "alt": ["1", "3"]}}
+    data["goal_config"] = {"6": GOAL_CONFIG["456"]}
+    with open(tmp_path / "test_machine.json", "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    spec_dir(tmp_path)
+
+    assert cli.main(["3000", "120", "--machine", "test_machine", "--json"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert list(result["posteriors"]) == ["1", "3", "6"]
+    assert "6" in result and "456" not in result
+    assert result["6"]["prob"] == pytest.approx(result["posteriors"]["6"])
+
+    assert cli.main(["3000", "120", "--machine", "test_machine"]) == 0
+    assert "6期待度" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit) as e:
+        cli.main(["3000", "120", "--machine", "unknown"])
+    assert e.value.code == 2
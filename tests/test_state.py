@@ -0,0 +1,58 @@
+"""
+カウンター操作ごとの事後確率の更新 (src/state.py)
+"""
+import math
+import random
+
+import pytest
+
+from src.logic import compute_posteriors, normalize
+from src.state import PosteriorState
+
+PRIORS = {"1": 0.3, "2": 0.3, "4": 0.2, "5": 0.1, "6": 0.1}
+
+def assert_close(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        assert actual[key] == pytest.approx(expected[key], rel=1e-12, abs=1e-14)
+
+def test_incremental_updates_match_compute_posteriors():
+    rng = random.Random(0)
+    state = PosteriorState(PRIORS)
+    n = k = 0
+    for _ in range(2000):
+        if rng.random() < 1 / 30:
+            state.add_hit()
+            k += 1
+        state.add_spin()
+        n += 1
+        if n % 97 == 0:
+            assert_close(state.posteriors(), compute_posteriors(n, k, PRIORS))
+    state.apply_delta(500, 20)
+    assert (state.num_spins, state.num_hits) == (n + 500, k + 20)
+    assert_close(state.posteriors(), compute_posteriors(n + 500, k + 20, PRIORS))
+
+def test_negative_deltas_undo():
+    state = PosteriorState(PRIORS, 1000, 40)
+    before = state.posteriors()
+    state.apply_delta(300, 12)
+    state.apply_delta(-300, -12)
+    assert (state.num_spins, state.num_hits) == (1000, 40)
+    assert_close(state.posteriors(), before)
+
+    state.add_hit(-1)
+    assert_close(state.posteriors(), compute_posteriors(1000, 39, PRIORS))
+    state.set_counts(800, 30)
+    assert_close(state.posteriors(), compute_posteriors(800, 30, PRIORS))
+
+@pytest.mark.parametrize("n, k", [(0, 0), (100, -1), (100, 101), (-5, 0)])
+def test_invalid_counts_fall_back_to_prior(n, k):
+    state = PosteriorState(PRIORS, n, k)
+    assert not state.is_valid
+    assert_close(state.posteriors(), normalize(PRIORS))
+    assert_close(state.posteriors(), compute_posteriors(n, k, PRIORS))
+    # 途中で不正になっても、戻せば元の値に戻る
+    state.set_counts(100, 4)
+    assert state.is_valid
+    assert_close(state.posteriors(), compute_posteriors(100, 4, PRIORS))
+    assert math.isclose(sum(state.posteriors().values()), 1.0)
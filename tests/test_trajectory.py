@@ -0,0 +1,55 @@
+"""
+期待度の推移 (src/trajectory.py)
+"""
+import numpy as np
+import pytest
+
+from src.logic import compute_posteriors
+from src.trajectory import compute_trajectory, cumulative_counts, downsample, lttb_indices
+
+PRIORS = {"1": 0.2, "2": 0.2, "4": 0.2, "5": 0.2, "6": 0.2}
+
+def session_deltas(steps: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    spins = rng.integers(1, 30, steps)
+    hits = rng.binomial(spins, 1 / 30)
+    return spins.tolist(), hits.tolist()
+
+def test_cumulative_pass_matches_compute_posteriors():
+    delta_spins, delta_hits = session_deltas(200)
+    trajectory = compute_trajectory(delta_spins, delta_hits, PRIORS)
+    n, k = np.cumsum(delta_spins), np.cumsum(delta_hits)
+    assert np.array_equal(trajectory["n"], n) and np.array_equal(trajectory["k"], k)
+    for i in range(0, 200, 7):
+        expected = compute_posteriors(int(n[i]), int(k[i]), PRIORS)
+        assert trajectory["posteriors"][i] == pytest.approx([expected[key] for key in PRIORS], abs=1e-12)
+        assert trajectory["prob_456"][i] == pytest.approx(expected["4"] + expected["5"] + expected["6"], abs=1e-12)
+        assert trajectory["prob_56"][i] == pytest.approx(expected["5"] + expected["6"], abs=1e-12)
+
+def test_undo_deltas():
+    # 取り消し（負の増減）は累積に反映され、途中で不正になった時点は除く
+    n, k = cumulative_counts([10, 0, -10, 20, 0], [0, 1, 0, 0, -1])
+    assert n.tolist() == [10, 10, 0, 20, 20]
+    assert k.tolist() == [0, 1, 1, 1, 0]
+    trajectory = compute_trajectory([10, 0, -10, 20, 0], [0, 1, 0, 0, -1], PRIORS)
+    assert list(zip(trajectory["n"].tolist(), trajectory["k"].tolist())) == [(10, 0), (10, 1), (20, 1), (20, 0)]
+    expected = compute_posteriors(20, 0, PRIORS)
+    assert trajectory["posteriors"][-1] == pytest.approx([expected[key] for key in PRIORS], abs=1e-12)
+
+def test_lttb_keeps_endpoints():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 50.0)
+    indices = lttb_indices(x, y, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+    assert len(lttb_indices(x[:50], y[:50], 100)) == 50
+
+def test_downsample():
+    delta_spins, delta_hits = session_deltas(2000)
+    trajectory = compute_trajectory(delta_spins, delta_hits, PRIORS)
+    small = downsample(trajectory, max_points=120)
+    assert 60 <= len(small["n"]) <= 120
+    assert small["n"][0] == trajectory["n"][0] and small["n"][-1] == trajectory["n"][-1]
+    assert all(len(values) == len(small["n"]) for values in small.values())
+    assert downsample(trajectory, max_points=5000) is trajectory
@@ -0,0 +1,83 @@
+"""
+「あと何回引けば目標に届くか」の早見表 (src/whatif.py)
+"""
+import numpy as np
+import pytest
+
+from src.batch import compute_posteriors_batch, evaluate_stars_batch
+from src.specs import get_spec
+from src.whatif import MAX_STARS, WhatIfGrid, hits_needed
+
+MAX_SPINS = 1200  # SAMPLE_BANDS["early"] をまたぐ（序盤の星の底上げの前後を両方見る）
+LEVELS = 65535
+
+@pytest.fixture(scope="module")
+def spec():
+    return get_spec()
+
+@pytest.fixture(scope="module")
+def grid(spec):
+    return WhatIfGrid(spec, spec.flat_priors(), MAX_SPINS, LEVELS)
+
+def all_cells():
+    n = np.repeat(np.arange(1, MAX_SPINS + 1), np.arange(2, MAX_SPINS + 2))
+    k = np.concatenate([np.arange(i + 1) for i in range(1, MAX_SPINS + 1)])
+    return n, k
+
+def goal_probabilities(spec, code, n, k):
+    posteriors = compute_posteriors_batch(n, k, spec.flat_priors(), spec)
+    alt_idx = [spec.keys.index(key) for key in spec.goal_groups[code]["alt"]]
+    return posteriors[:, spec.goal_indexes[code]].sum(axis=1), posteriors[:, alt_idx].sum(axis=1)
+
+@pytest.mark.parametrize("code", ["456", "56"])
+def test_stars_match_evaluate_stars_batch(spec, grid, code):
+    n, k = all_cells()
+    goal, alt = goal_probabilities(spec, code, n, k)
+    expected = evaluate_stars_batch(code, goal, alt, n)
+    # 表の星の境界は、星の判定を直接呼んだ結果とすべての (n, k) で一致する
+    star_k = grid.star_k[code][n]
+    actual = 1 + (star_k[:, 1:] <= k[:, None]).sum(axis=1)
+    assert np.array_equal(actual, expected)
+    for i in range(0, len(n), 9973):
+        assert grid.stars_at(code, int(n[i]), int(k[i])) == expected[i]
+
+@pytest.mark.parametrize("code", ["456", "56"])
+def test_prob_threshold_matches_prob_at(spec, grid, code):
+    rng = np.random.default_rng(0)
+    for n in rng.integers(1, MAX_SPINS + 1, 50).tolist():
+        for prob in (0.3, 0.5, 0.75, 0.9):
+            k = grid.prob_threshold(code, n, prob)
+            if k <= n:
+                assert grid.prob_at(code, n, k) >= prob
+            if 0 < k <= n + 1:
+                assert grid.prob_at(code, n, k - 1) < prob
+        # 量子化した期待度は、直接計算した期待度と量子化の刻み以内で一致する
+        k = np.arange(n + 1)
+        goal, _ = goal_probabilities(spec, code, np.full(n + 1, n), k)
+        at = np.array([grid.prob_at(code, n, i) for i in k.tolist()])
+        assert np.abs(at - goal).max() <= 1.0 / LEVELS
+
+def test_hits_needed(grid):
+    assert hits_needed(grid, 500, 20, -1, "456", stars=4) is None
+    assert hits_needed(grid, MAX_SPINS - 100, 20, 101, "456", stars=4) is None
+
+    plan = hits_needed(grid, 500, 20, 300, "456", stars=4)
+    assert plan["spins"] == 800
+    assert plan["hits"] == grid.star_threshold("456", 800, 4)
+    assert plan["more"] == plan["hits"] - 20
+    assert grid.stars_at("456", 800, 20 + plan["more"]) >= 4
+    assert grid.stars_at("456", 800, 20 + plan["more"] - 1) < 4
+
+    # すでに目標を超えていれば追加は不要
+    reached = hits_needed(grid, 500, 40, 300, "456", stars=MAX_STARS)
+    assert reached["hits"] <= 40
+    assert reached["more"] == 0 and reached["reachable"] and reached["denominator"] is None
+
+    plan = hits_needed(grid, 500, 20, 300, "56", prob=0.5)
+    assert plan["hits"] == grid.prob_threshold("56", 800, 0.5)
+
+def test_hits_needed_requires_one_target(grid):
+    with pytest.raises(ValueError):
+        hits_needed(grid, 500, 20, 300, "456")
+    with pytest.raises(ValueError):
+        hits_needed(grid, 500, 20, 300, "456", stars=4, prob=0.5)